@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+서비스 간 공유 사본 동일성 검사
+
+서비스마다 Docker 빌드 컨텍스트가 따로이므로 여러 서비스가 쓰는 모듈은 각
+서비스에 사본으로 둔다. 이 스크립트는 사본이 서로 달라지지 않았는지 검사한다.
+
+- SHARED_COPIES 의 각 그룹은 같은 내용이어야 하는 파일 목록
+- 파일에 SHARED_END_MARKER 줄이 있으면 그 앞까지만 비교 (아래는 서비스별 구성)
+- 다르면 unified diff 를 출력하고 종료 코드 1
+
+사용법: python scripts/check_shared_copies.py
+"""
+
+import difflib
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SHARED_END_MARKER = "# ---- 공유 사본 끝: 이 아래는 서비스별 구성 ----"
+
+SHARED_COPIES: List[Tuple[str, ...]] = [
+    (
+        "services/fds/src/utils/rate_limiter.py",
+        "services/ecommerce/backend/src/utils/rate_limiter.py",
+    ),
+    (
+        "services/ecommerce/backend/src/utils/pagination.py",
+        "services/admin-dashboard/backend/src/pagination.py",
+    ),
+]
+
+
+def shared_lines(path: Path) -> List[str]:
+    """비교 대상 줄 (공유 사본 끝 표시 앞까지)"""
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        if line.strip() == SHARED_END_MARKER:
+            return lines[:index]
+    return lines
+
+
+def check_group(paths: Tuple[str, ...]) -> bool:
+    """그룹의 모든 사본이 첫 번째 파일과 같은지 검사"""
+    reference, *copies = paths
+    expected = shared_lines(PROJECT_ROOT / reference)
+    ok = True
+    for copy in copies:
+        actual = shared_lines(PROJECT_ROOT / copy)
+        if actual != expected:
+            ok = False
+            print(f"[FAIL] {copy} differs from {reference}")
+            sys.stdout.writelines(
+                difflib.unified_diff(expected, actual, reference, copy)
+            )
+    return ok
+
+
+def main() -> int:
+    failed = [paths for paths in SHARED_COPIES if not check_group(paths)]
+    if failed:
+        print(f"[FAIL] {len(failed)} shared copy group(s) out of sync")
+        return 1
+    print(f"[OK] {len(SHARED_COPIES)} shared copy groups in sync")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
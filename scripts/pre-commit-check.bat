@@ -52,6 +52,12 @@ for %%S in (%SERVICES%) do (
   )
 )
 
+REM 서비스 간 공유 사본 (rate_limiter, pagination) 동일성
+echo.
+echo ^>^>^> Checking shared module copies
+python scripts\check_shared_copies.py
+if errorlevel 1 set ALL_PASSED=0
+
 echo.
 echo ========================================
 if %ALL_PASSED%==1 (
@@ -59,6 +59,13 @@ for SERVICE in "${SERVICES[@]}"; do
   cd - > /dev/null
 done
 
+# 서비스 간 공유 사본 (rate_limiter, pagination) 동일성
+echo ""
+echo ">>> Checking shared module copies"
+if ! python scripts/check_shared_copies.py; then
+  ALL_PASSED=false
+fi
+
 echo ""
 echo "========================================"
 if [ "$ALL_PASSED" = true ]; then
@@ -4,48 +4,110 @@
 실시간 거래 통계 및 대시보드 데이터를 제공합니다.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from datetime import datetime, timedelta
+from typing import Optional
 
-# FDS 모델 정의 (로컬 복사)
-from enum import Enum
-from sqlalchemy.ext.declarative import declarative_base
+import src.fds_path  # noqa: F401
+from services.fds.src.models.transaction import (
+    Transaction,
+    RiskLevel,
+    EvaluationStatus,
+)
+from services.fds.src.models.review_queue import ReviewQueue, ReviewStatus
+from services.fds.src.services.transaction_partitions import created_within
 
-Base = declarative_base()
+from src.database import AsyncSessionLocal, get_db
+from src.live import format_sse, get_dashboard_hub
+from src.rollups import get_dashboard_rollup
 
+router = APIRouter(prefix="/v1/dashboard", tags=["Dashboard"])
 
-class RiskLevel(str, Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-
-
-class EvaluationStatus(str, Enum):
-    APPROVED = "approved"
-    DECLINED = "declined"
-    REVIEW_REQUIRED = "review_required"
-
+# 통계 기간
+TIME_RANGES = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
 
-class ReviewStatus(str, Enum):
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
+# 실시간 푸시 토픽
+LIVE_TOPICS = ("stats", "review_queue")
 
 
-# 실제 모델은 별도 테이블에서 조회
-class Transaction:
-    __tablename__ = "transactions"
+@router.get("/stream")
+async def stream_dashboard(
+    request: Request,
+    time_range: str = Query(
+        "24h",
+        description="통계 시간 범위 (1h, 24h, 7d, 30d)",
+        regex="^(1h|24h|7d|30d)$",
+    ),
+    topics: str = Query("stats", description="구독 토픽 (쉼표 구분: stats, review_queue)"),
+    review_status: Optional[ReviewStatus] = Query(
+        None, description="review_queue 토픽의 검토 상태 필터 (None이면 전체)"
+    ),
+    review_limit: int = Query(50, ge=1, le=100, description="review_queue 토픽 항목 수"),
+):
+    """
+    대시보드 실시간 푸시 (Server-Sent Events)
 
+    /stats 와 검토 큐 목록을 주기적으로 폴링하는 대신 연결을 유지하고 변경된
+    스냅샷을 받습니다. 서버는 interval 마다 (토픽, 필터) 조합당 한 번만 계산하므로
+    DB/Redis 부하는 접속한 분석가 수와 무관합니다.
 
-class ReviewQueue:
-    __tablename__ = "review_queue"
+    이벤트:
+        - stats: get_dashboard_stats 와 같은 형태 (generated_at 제외)
+        - review_queue: 검토 큐 첫 페이지 (get_review_queue 와 같은 형태)
 
+    Args:
+        request: 요청 (연결 종료 감지)
+        time_range: stats 토픽 기간
+        topics: 구독 토픽
+        review_status: review_queue 토픽 상태 필터
+        review_limit: review_queue 토픽 항목 수
 
-from src.database import get_db
+    Returns:
+        StreamingResponse: text/event-stream
+    """
+    names = {name.strip() for name in topics.split(",") if name.strip()}
+    unknown = names - set(LIVE_TOPICS)
+    if not names or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 토픽입니다: {', '.join(sorted(unknown)) or '(없음)'}",
+        )
 
-router = APIRouter(prefix="/v1/dashboard", tags=["Dashboard"])
+    hub = get_dashboard_hub()
+    if hub.is_full:
+        raise HTTPException(status_code=503, detail="실시간 연결 수가 한도에 도달했습니다.")
+
+    topic_keys = set()
+    if "stats" in names:
+        topic_keys.add(f"stats:{time_range}")
+    if "review_queue" in names:
+        status_value = review_status.value if review_status else ""
+        topic_keys.add(f"review_queue:{status_value}:{review_limit}")
+
+    async def event_stream():
+        yield format_sse(None, retry_ms=5000)
+        async for message in hub.subscribe(topic_keys):
+            if await request.is_disconnected():
+                break
+            if message is None:
+                yield format_sse(None)
+                continue
+            topic, payload = message
+            yield format_sse(topic.split(":", 1)[0], payload)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/stats")
@@ -61,6 +123,8 @@ async def get_dashboard_stats(
     실시간 거래 통계 조회
 
     보안팀 대시보드에 표시할 주요 지표를 반환합니다.
+    요약 지표는 FDS 가 기록 시 갱신하는 분/시/일 롤업 버킷을 합산하며,
+    롤업이 윈도우 전체를 덮지 못하면 DB 집계로 대체합니다.
 
     Args:
         time_range: 통계 기간 (1h, 24h, 7d, 30d)
@@ -68,21 +132,98 @@ async def get_dashboard_stats(
 
     Returns:
         dict: 대시보드 통계 데이터
+            - stats_source: 요약 지표 출처 (rollup/database)
             - transaction_summary: 거래 요약 (총 거래 수, 승인/차단/검토 수)
             - risk_distribution: 위험도별 분포 (low/medium/high 비율)
             - review_queue_summary: 검토 큐 요약 (대기/진행중/완료 수)
             - avg_evaluation_time_ms: 평균 FDS 평가 시간 (ms)
+            - evaluation_time_histogram: 평가 시간 분포 (롤업 사용 시)
             - recent_alerts: 최근 고위험 거래 알림
     """
 
+    return await build_dashboard_stats(db, time_range)
+
+
+async def build_dashboard_stats(db: AsyncSession, time_range: str) -> dict:
+    """
+    대시보드 통계 계산 (GET /stats 및 실시간 푸시 공용)
+
+    Args:
+        db: 데이터베이스 세션
+        time_range: 통계 기간 (1h, 24h, 7d, 30d)
+
+    Returns:
+        dict: 대시보드 통계 데이터 (get_dashboard_stats 참고)
+    """
+
     # 시간 범위에 따른 시작 시간 계산
-    time_ranges = {
-        "1h": timedelta(hours=1),
-        "24h": timedelta(hours=24),
-        "7d": timedelta(days=7),
-        "30d": timedelta(days=30),
+    start_time = datetime.utcnow() - TIME_RANGES[time_range]
+
+    # 1~4. 요약 통계: 롤업 버킷 합산 (롤업이 윈도우를 덮지 못하면 DB 집계)
+    stats = await get_dashboard_rollup().summarize(start_time)
+    stats_source = "rollup"
+    if stats is None:
+        stats = await _aggregate_stats_from_db(db, start_time)
+        stats_source = "database"
+    avg_evaluation_time_ms = stats["avg_evaluation_time_ms"]
+
+    # 5. 최근 고위험 거래 알림 (최근 10건)
+    recent_alerts_query = (
+        select(Transaction)
+        .where(
+            and_(
+                Transaction.risk_level == RiskLevel.HIGH,
+                created_within(start_time),
+            )
+        )
+        .order_by(Transaction.created_at.desc())
+        .limit(10)
+    )
+
+    recent_alerts_result = await db.execute(recent_alerts_query)
+    recent_alerts_rows = recent_alerts_result.scalars().all()
+
+    recent_alerts = [
+        {
+            "transaction_id": str(alert.id),
+            "user_id": str(alert.user_id),
+            "order_id": str(alert.order_id),
+            "amount": float(alert.amount),
+            "risk_score": alert.risk_score,
+            "ip_address": alert.ip_address,
+            "created_at": alert.created_at.isoformat(),
+            "evaluation_status": alert.evaluation_status.value,
+        }
+        for alert in recent_alerts_rows
+    ]
+
+    # 응답 반환
+    return {
+        "time_range": time_range,
+        "generated_at": datetime.utcnow().isoformat(),
+        "stats_source": stats_source,
+        "transaction_summary": stats["transaction_summary"],
+        "risk_distribution": stats["risk_distribution"],
+        "review_queue_summary": stats["review_queue_summary"],
+        "avg_evaluation_time_ms": avg_evaluation_time_ms,
+        "evaluation_time_histogram": stats.get("evaluation_time_histogram"),
+        "performance_status": ("good" if avg_evaluation_time_ms <= 100 else "degraded"),
+        "recent_alerts": recent_alerts,
     }
-    start_time = datetime.utcnow() - time_ranges[time_range]
+
+
+async def _aggregate_stats_from_db(db: AsyncSession, start_time: datetime) -> dict:
+    """
+    윈도우 전체를 스캔하는 DB 집계 (롤업이 윈도우를 덮지 못할 때)
+
+    Args:
+        db: 데이터베이스 세션
+        start_time: 윈도우 시작
+
+    Returns:
+        dict: transaction_summary, risk_distribution, review_queue_summary,
+            avg_evaluation_time_ms
+    """
 
     # 1. 거래 요약 통계
     transaction_summary_query = select(
@@ -96,7 +237,7 @@ async def get_dashboard_stats(
         func.count(Transaction.id)
         .filter(Transaction.evaluation_status == EvaluationStatus.MANUAL_REVIEW)
         .label("manual_review"),
-    ).where(Transaction.created_at >= start_time)
+    ).where(created_within(start_time))
 
     transaction_summary_result = await db.execute(transaction_summary_query)
     transaction_summary_row = transaction_summary_result.fetchone()
@@ -114,7 +255,7 @@ async def get_dashboard_stats(
             Transaction.risk_level,
             func.count(Transaction.id).label("count"),
         )
-        .where(Transaction.created_at >= start_time)
+        .where(created_within(start_time))
         .group_by(Transaction.risk_level)
     )
 
@@ -156,50 +297,45 @@ async def get_dashboard_stats(
     # 4. 평균 FDS 평가 시간
     avg_evaluation_time_query = select(
         func.avg(Transaction.evaluation_time_ms).label("avg_time")
-    ).where(Transaction.created_at >= start_time)
+    ).where(created_within(start_time))
 
     avg_evaluation_time_result = await db.execute(avg_evaluation_time_query)
     avg_evaluation_time_row = avg_evaluation_time_result.fetchone()
     avg_evaluation_time_ms = int(avg_evaluation_time_row.avg_time or 0)
 
-    # 5. 최근 고위험 거래 알림 (최근 10건)
-    recent_alerts_query = (
-        select(Transaction)
-        .where(
-            and_(
-                Transaction.risk_level == RiskLevel.HIGH,
-                Transaction.created_at >= start_time,
-            )
-        )
-        .order_by(Transaction.created_at.desc())
-        .limit(10)
-    )
-
-    recent_alerts_result = await db.execute(recent_alerts_query)
-    recent_alerts_rows = recent_alerts_result.scalars().all()
-
-    recent_alerts = [
-        {
-            "transaction_id": str(alert.id),
-            "user_id": str(alert.user_id),
-            "order_id": str(alert.order_id),
-            "amount": float(alert.amount),
-            "risk_score": alert.risk_score,
-            "ip_address": alert.ip_address,
-            "created_at": alert.created_at.isoformat(),
-            "evaluation_status": alert.evaluation_status.value,
-        }
-        for alert in recent_alerts_rows
-    ]
-
-    # 응답 반환
     return {
-        "time_range": time_range,
-        "generated_at": datetime.utcnow().isoformat(),
         "transaction_summary": transaction_summary,
         "risk_distribution": risk_distribution,
         "review_queue_summary": review_queue_summary,
         "avg_evaluation_time_ms": avg_evaluation_time_ms,
-        "performance_status": ("good" if avg_evaluation_time_ms <= 100 else "degraded"),
-        "recent_alerts": recent_alerts,
     }
+
+
+async def compute_live_topic(topic: str) -> dict:
+    """
+    실시간 푸시 토픽 스냅샷 계산 (허브가 interval 마다 토픽당 1회 호출)
+
+    Args:
+        topic: "stats:{time_range}" 또는 "review_queue:{status}:{limit}"
+
+    Returns:
+        dict: 스냅샷 (변경 감지를 위해 매번 바뀌는 generated_at 제외)
+    """
+    from src.api.review import get_review_queue
+
+    name, *args = topic.split(":")
+    async with AsyncSessionLocal() as db:
+        if name == "stats":
+            stats = await build_dashboard_stats(db, args[0])
+            stats.pop("generated_at", None)
+            return stats
+        if name == "review_queue":
+            status_value, limit = args
+            return await get_review_queue(
+                status=ReviewStatus(status_value) if status_value else None,
+                limit=int(limit),
+                offset=0,
+                cursor=None,
+                db=db,
+            )
+    raise ValueError(f"알 수 없는 토픽: {topic}")
@@ -10,11 +10,8 @@ from sqlalchemy import select, func
 from uuid import UUID
 from typing import Optional
 from pydantic import BaseModel, Field
-import sys
-import os
 
-# FDS 모델 import를 위한 경로 추가
-sys.path.append(os.path.join(os.path.dirname(__file__), "../../../.."))
+import src.fds_path  # noqa: F401
 from services.fds.src.models.transaction import (
     Transaction,
     EvaluationStatus,
@@ -24,12 +21,24 @@ from services.fds.src.models.review_queue import (
     ReviewStatus,
     ReviewDecision,
 )
-from services.fds.src.models.risk_factor import RiskFactor
+from services.fds.src.services.dashboard_rollup import SCOPE_REVIEW, SCOPE_TRANSACTION
 
 from src.database import get_db
+from src.pagination import (
+    InvalidCursorError,
+    Keyset,
+    count_key,
+    get_count_cache,
+    paginate,
+)
+from src.queries import get_user_history_cache, load_risk_factors
+from src.rollups import get_dashboard_rollup, get_review_queue_engine
 
 router = APIRouter(prefix="/v1/review-queue", tags=["Review Queue"])
 
+# 완료 항목이 대기열에 남아 있을 때 다음 항목 할당 재시도 횟수
+CLAIM_ATTEMPTS = 5
+
 
 # Pydantic 스키마
 class ReviewDecisionRequest(BaseModel):
@@ -40,6 +49,12 @@ class ReviewDecisionRequest(BaseModel):
     reviewer_id: UUID = Field(..., description="검토 담당자 ID")
 
 
+class ReviewerRequest(BaseModel):
+    """검토 할당/리스 요청"""
+
+    reviewer_id: UUID = Field(..., description="검토 담당자 ID")
+
+
 class ReviewQueueItem(BaseModel):
     """검토 큐 항목 응답"""
 
@@ -60,7 +75,8 @@ async def get_review_queue(
         None, description="검토 상태 필터 (pending/in_review/completed)"
     ),
     limit: int = Query(50, ge=1, le=100, description="최대 결과 수"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    offset: int = Query(0, ge=0, description="오프셋 (cursor 가 없을 때만 사용)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -73,81 +89,294 @@ async def get_review_queue(
         status: 검토 상태 필터 (None이면 전체)
         limit: 최대 결과 수 (기본 50, 최대 100)
         offset: 페이지네이션 오프셋
+        cursor: 이전 응답의 next_cursor ((added_at, id) Keyset)
         db: 데이터베이스 세션
 
     Returns:
         dict: 검토 큐 목록
             - items: 검토 큐 항목 리스트
-            - total: 전체 항목 수
+            - total: 전체 항목 수 (캐시된 근사값)
             - limit: 요청한 limit
             - offset: 요청한 offset
+            - next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
     """
 
-    # 기본 쿼리
-    base_query = select(ReviewQueue).join(
-        Transaction, ReviewQueue.transaction_id == Transaction.id
-    )
-
     # 상태 필터 적용
+    filters = []
     if status:
-        base_query = base_query.where(ReviewQueue.status == status)
+        filters.append(ReviewQueue.status == status)
 
-    # 최신순 정렬
-    base_query = base_query.order_by(ReviewQueue.added_at.desc())
+    key = count_key("review_queue", status=status)
 
-    # 전체 개수 조회
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # 전체 개수 조회 (캐시, 만료 시 백그라운드 갱신)
+    count_query = (
+        select(func.count(ReviewQueue.id))
+        .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+        .where(*filters)
+    )
+    total = await get_count_cache().get(key, count_query, db=db)
 
-    # 페이지네이션 적용
-    items_query = base_query.limit(limit).offset(offset)
-    items_result = await db.execute(items_query)
-    review_queue_items = items_result.scalars().all()
+    # 최신순 Keyset 페이지네이션
+    try:
+        # 거래를 조인해 함께 로드 (항목별 거래 조회 없이 페이지당 쿼리 1회)
+        page = await paginate(
+            db,
+            select(ReviewQueue, Transaction)
+            .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+            .where(*filters),
+            Keyset((ReviewQueue.added_at, True), (ReviewQueue.id, True), scope=key),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            rows=True,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # 응답 데이터 구성
-    items = []
-    for item in review_queue_items:
-        # Transaction 정보 조회
-        transaction_query = select(Transaction).where(
-            Transaction.id == item.transaction_id
+    items = [_review_queue_item(item, transaction) for item, transaction in page.items]
+
+    return {
+        "items": items,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": page.next_cursor,
+    }
+
+
+def _review_queue_item(item: ReviewQueue, transaction: Transaction) -> dict:
+    """검토 큐 목록/할당 응답 항목"""
+    return {
+        "id": str(item.id),
+        "transaction_id": str(item.transaction_id),
+        "status": item.status.value,
+        "decision": item.decision.value if item.decision else None,
+        "assigned_to": str(item.assigned_to) if item.assigned_to else None,
+        "review_notes": item.review_notes,
+        "added_at": item.added_at.isoformat(),
+        "reviewed_at": item.reviewed_at.isoformat() if item.reviewed_at else None,
+        "transaction": {
+            "order_id": str(transaction.order_id),
+            "user_id": str(transaction.user_id),
+            "amount": float(transaction.amount),
+            "risk_score": transaction.risk_score,
+            "risk_level": transaction.risk_level.value,
+            "ip_address": transaction.ip_address,
+            "device_type": transaction.device_type.value,
+            "created_at": transaction.created_at.isoformat(),
+        },
+    }
+
+
+@router.post("/claim")
+async def claim_next_review(
+    request: ReviewerRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    다음 검토 항목 할당
+
+    위험 점수와 대기 시간 순으로 우선순위가 가장 높은 대기 항목을 원자적으로
+    할당합니다. 여러 분석가가 동시에 요청해도 같은 항목을 받지 않으며,
+    할당은 리스 만료 전에 /lease/renew 로 연장하지 않으면 대기열로 돌아갑니다.
+
+    Args:
+        request: 할당 요청 (reviewer_id)
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: 할당 결과
+            - review_queue_id: 할당된 검토 큐 ID (대기 항목이 없으면 None)
+            - item: 할당된 검토 큐 항목
+            - lease_expires_at: 리스 만료 시간
+    """
+    engine = get_review_queue_engine()
+
+    for _ in range(CLAIM_ATTEMPTS):
+        try:
+            lease = await engine.claim_next(request.reviewer_id)
+        except Exception as e:
+            raise HTTPException(
+                status_code=503, detail=f"검토 큐 할당을 사용할 수 없습니다: {str(e)}"
+            )
+
+        if lease is None:
+            return {"review_queue_id": None, "item": None, "lease_expires_at": None}
+
+        result = await db.execute(
+            select(ReviewQueue, Transaction)
+            .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+            .where(ReviewQueue.id == lease.queue_id)
         )
-        transaction_result = await db.execute(transaction_query)
-        transaction = transaction_result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not transaction:
+        # 대기열에 남아 있던 완료 항목 (제거 실패 등) 은 버리고 다음 항목 할당
+        if row is not None and row[0].status == ReviewStatus.COMPLETED:
+            await engine.remove(lease.queue_id)
             continue
 
-        items.append(
-            {
-                "id": str(item.id),
-                "transaction_id": str(item.transaction_id),
-                "status": item.status.value,
-                "decision": item.decision.value if item.decision else None,
-                "assigned_to": str(item.assigned_to) if item.assigned_to else None,
-                "review_notes": item.review_notes,
-                "added_at": item.added_at.isoformat(),
-                "reviewed_at": item.reviewed_at.isoformat()
-                if item.reviewed_at
-                else None,
-                "transaction": {
-                    "order_id": str(transaction.order_id),
-                    "user_id": str(transaction.user_id),
-                    "amount": float(transaction.amount),
-                    "risk_score": transaction.risk_score,
-                    "risk_level": transaction.risk_level.value,
-                    "ip_address": transaction.ip_address,
-                    "device_type": transaction.device_type.value,
-                    "created_at": transaction.created_at.isoformat(),
-                },
-            }
+        item = None
+        if row is not None:
+            # DB 상태는 엔진이 비동기로 반영하므로 응답에는 할당 결과를 바로 반영
+            item = _review_queue_item(*row)
+            item["status"] = ReviewStatus.IN_REVIEW.value
+            item["assigned_to"] = str(request.reviewer_id)
+
+        return {
+            "review_queue_id": str(lease.queue_id),
+            "item": item,
+            "lease_expires_at": lease.expires_at.isoformat(),
+        }
+
+    return {"review_queue_id": None, "item": None, "lease_expires_at": None}
+
+
+@router.post("/{review_queue_id}/lease/renew")
+async def renew_review_lease(review_queue_id: UUID, request: ReviewerRequest):
+    """
+    검토 할당 리스 연장
+
+    Returns:
+        dict: review_queue_id, lease_expires_at
+
+    Raises:
+        HTTPException: 리스가 만료되어 대기열로 돌아갔거나 다른 담당자가 할당받은 경우 (409)
+    """
+    lease = await get_review_queue_engine().renew(review_queue_id, request.reviewer_id)
+    if lease is None:
+        raise HTTPException(status_code=409, detail="할당이 만료되었거나 다른 담당자가 검토 중입니다.")
+
+    return {
+        "review_queue_id": str(review_queue_id),
+        "lease_expires_at": lease.expires_at.isoformat(),
+    }
+
+
+@router.post("/{review_queue_id}/release")
+async def release_review(review_queue_id: UUID, request: ReviewerRequest):
+    """
+    검토 할당 반환 (검토하지 않고 대기열로 되돌림)
+
+    Returns:
+        dict: review_queue_id, status
+
+    Raises:
+        HTTPException: 요청한 담당자가 할당받은 항목이 아닌 경우 (409)
+    """
+    released = await get_review_queue_engine().release(
+        review_queue_id, request.reviewer_id
+    )
+    if not released:
+        raise HTTPException(status_code=409, detail="할당받은 항목이 아닙니다.")
+
+    return {
+        "review_queue_id": str(review_queue_id),
+        "status": ReviewStatus.PENDING.value,
+    }
+
+
+async def _get_review_queue_with_transaction(
+    db: AsyncSession, review_queue_id: UUID, for_update: bool = False
+):
+    """
+    검토 큐 항목과 거래를 한 번의 쿼리로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        review_queue_id: 검토 큐 ID
+        for_update: 두 행을 트랜잭션 종료(커밋/롤백) 까지 잠금 (SELECT ... FOR UPDATE)
+
+    Raises:
+        HTTPException: 검토 큐 항목 또는 거래가 없는 경우 (404)
+    """
+    query = select(ReviewQueue, Transaction).where(ReviewQueue.id == review_queue_id)
+    if for_update:
+        # 외부 조인의 nullable 쪽은 잠글 수 없으므로 내부 조인
+        query = query.join(
+            Transaction, ReviewQueue.transaction_id == Transaction.id
+        ).with_for_update(of=(ReviewQueue, Transaction))
+    else:
+        query = query.outerjoin(
+            Transaction, ReviewQueue.transaction_id == Transaction.id
+        )
+    result = await db.execute(query)
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=404, detail=f"검토 큐 항목을 찾을 수 없습니다: {review_queue_id}"
+        )
+
+    review_queue, transaction = row
+    if not transaction:
+        raise HTTPException(
+            status_code=404,
+            detail=f"거래를 찾을 수 없습니다: {review_queue.transaction_id}",
+        )
+
+    return review_queue, transaction
+
+
+@router.post("/{review_queue_id}/claim")
+async def claim_review(
+    review_queue_id: UUID,
+    request: ReviewerRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    특정 검토 항목 할당 (목록/상세 화면에서 직접 연 항목)
+
+    다른 담당자가 유효한 리스를 보유 중이면 실패합니다. 이미 할당받은 담당자가
+    다시 요청하면 리스를 연장합니다.
+
+    Returns:
+        dict: review_queue_id, lease_expires_at
+
+    Raises:
+        HTTPException: 이미 완료된 항목 (400), 다른 담당자가 검토 중인 경우 (409)
+    """
+    review_queue, transaction = await _get_review_queue_with_transaction(
+        db, review_queue_id, for_update=True
+    )
+    if review_queue.status == ReviewStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="이미 검토가 완료된 항목입니다.")
+
+    try:
+        lease = await get_review_queue_engine().claim(
+            review_queue_id,
+            request.reviewer_id,
+            transaction.risk_score,
+            review_queue.added_at,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"검토 큐 할당을 사용할 수 없습니다: {str(e)}")
+    if lease is None:
+        raise HTTPException(status_code=409, detail="다른 담당자가 검토 중인 항목입니다.")
+
+    previous_status = review_queue.status
+    review_queue.assign_to_reviewer(request.reviewer_id)
+    try:
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"할당 저장 실패: {str(e)}")
+
+    if previous_status != review_queue.status:
+        await get_dashboard_rollup().record_status_changes(
+            [
+                (
+                    SCOPE_REVIEW,
+                    review_queue.added_at,
+                    previous_status,
+                    review_queue.status,
+                )
+            ]
         )
 
     return {
-        "items": items,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
+        "review_queue_id": str(review_queue_id),
+        "lease_expires_at": lease.expires_at.isoformat(),
     }
 
 
@@ -165,6 +394,8 @@ async def approve_or_block_transaction(
     - block: 정탐으로 판단, 차단 유지
     - escalate: 추가 조사 필요, 상위 에스컬레이션
 
+    결정은 /claim 으로 항목을 할당받아 리스를 보유 중인 담당자만 내릴 수 있습니다.
+
     Args:
         review_queue_id: 검토 큐 ID
         request: 검토 결정 요청 (decision, notes, reviewer_id)
@@ -177,36 +408,35 @@ async def approve_or_block_transaction(
             - decision: 최종 결정
             - status: 검토 상태
             - reviewed_at: 검토 완료 시간
-    """
 
-    # 검토 큐 항목 조회
-    review_queue_query = select(ReviewQueue).where(ReviewQueue.id == review_queue_id)
-    review_queue_result = await db.execute(review_queue_query)
-    review_queue = review_queue_result.scalar_one_or_none()
+    Raises:
+        HTTPException: 요청한 담당자가 유효한 리스를 보유하지 않은 경우 (409)
+    """
+    engine = get_review_queue_engine()
 
-    if not review_queue:
-        raise HTTPException(
-            status_code=404, detail=f"검토 큐 항목을 찾을 수 없습니다: {review_queue_id}"
-        )
+    # 요청한 담당자가 할당(리스)을 보유 중인지 확인 (담당자 확인 스크립트, 저장까지
+    # 만료되지 않도록 연장). 리스가 만료되어 다른 담당자가 가져간 항목은 거절
+    try:
+        lease = await engine.renew(review_queue_id, request.reviewer_id)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"검토 할당을 확인할 수 없습니다: {str(e)}")
+    if lease is None:
+        raise HTTPException(status_code=409, detail="할당이 만료되었거나 다른 담당자가 검토 중입니다.")
+
+    # 검토 큐 항목 + 거래 정보 조회 (쿼리 1회)
+    # 동시 결정 요청은 행 잠금으로 직렬화되어, 나중 요청은 커밋된 완료 상태를 보고
+    # 거절되므로 롤업 상태 변경은 이긴 요청만 한 번 기록
+    review_queue, transaction = await _get_review_queue_with_transaction(
+        db, review_queue_id, for_update=True
+    )
 
     # 이미 완료된 검토인지 확인
     if review_queue.status == ReviewStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="이미 검토가 완료된 항목입니다.")
 
-    # 거래 정보 조회
-    transaction_query = select(Transaction).where(
-        Transaction.id == review_queue.transaction_id
-    )
-    transaction_result = await db.execute(transaction_query)
-    transaction = transaction_result.scalar_one_or_none()
-
-    if not transaction:
-        raise HTTPException(
-            status_code=404,
-            detail=f"거래를 찾을 수 없습니다: {review_queue.transaction_id}",
-        )
-
     # 검토 완료 처리
+    previous_review_status = review_queue.status
+    previous_transaction_status = transaction.evaluation_status
     review_queue.complete_review(decision=request.decision, notes=request.notes)
     review_queue.assigned_to = request.reviewer_id
 
@@ -227,6 +457,30 @@ async def approve_or_block_transaction(
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"검토 결과 저장 실패: {str(e)}")
 
+    # 차단 건수가 바뀌었을 수 있으므로 사용자 이력 집계 캐시 삭제
+    get_user_history_cache().invalidate(transaction.user_id)
+
+    # 대시보드 롤업에 상태 변경 반영
+    await get_dashboard_rollup().record_status_changes(
+        [
+            (
+                SCOPE_REVIEW,
+                review_queue.added_at,
+                previous_review_status,
+                review_queue.status,
+            ),
+            (
+                SCOPE_TRANSACTION,
+                transaction.created_at,
+                previous_transaction_status,
+                transaction.evaluation_status,
+            ),
+        ]
+    )
+
+    # 할당 대기열/리스에서 제거
+    await engine.remove(review_queue.id)
+
     return {
         "review_queue_id": str(review_queue.id),
         "transaction_id": str(review_queue.transaction_id),
@@ -254,35 +508,13 @@ async def get_review_queue_detail(
         dict: 검토 큐 항목 상세 정보
     """
 
-    # 검토 큐 항목 조회
-    review_queue_query = select(ReviewQueue).where(ReviewQueue.id == review_queue_id)
-    review_queue_result = await db.execute(review_queue_query)
-    review_queue = review_queue_result.scalar_one_or_none()
-
-    if not review_queue:
-        raise HTTPException(
-            status_code=404, detail=f"검토 큐 항목을 찾을 수 없습니다: {review_queue_id}"
-        )
-
-    # 거래 정보 조회
-    transaction_query = select(Transaction).where(
-        Transaction.id == review_queue.transaction_id
+    # 검토 큐 항목 + 거래 정보 조회 (쿼리 1회)
+    review_queue, transaction = await _get_review_queue_with_transaction(
+        db, review_queue_id
     )
-    transaction_result = await db.execute(transaction_query)
-    transaction = transaction_result.scalar_one_or_none()
-
-    if not transaction:
-        raise HTTPException(
-            status_code=404,
-            detail=f"거래를 찾을 수 없습니다: {review_queue.transaction_id}",
-        )
 
     # 위험 요인 조회
-    risk_factors_query = select(RiskFactor).where(
-        RiskFactor.transaction_id == transaction.id
-    )
-    risk_factors_result = await db.execute(risk_factors_query)
-    risk_factors = risk_factors_result.scalars().all()
+    risk_factors = await load_risk_factors(transaction.id)
 
     return {
         "id": str(review_queue.id),
@@ -315,14 +547,5 @@ async def get_review_queue_detail(
             if transaction.evaluated_at
             else None,
         },
-        "risk_factors": [
-            {
-                "id": str(factor.id),
-                "factor_type": factor.factor_type,
-                "factor_score": factor.factor_score,
-                "description": factor.description,
-                "metadata": factor.metadata,
-            }
-            for factor in risk_factors
-        ],
+        "risk_factors": risk_factors,
     }
@@ -4,25 +4,31 @@
 거래 상세 정보 조회 및 분석 API입니다.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 from uuid import UUID
 from typing import Optional
-import sys
-import os
 
-# FDS 모델 import를 위한 경로 추가
-sys.path.append(os.path.join(os.path.dirname(__file__), "../../../.."))
+import src.fds_path  # noqa: F401
 from services.fds.src.models.transaction import (
     Transaction,
     RiskLevel,
     EvaluationStatus,
 )
-from services.fds.src.models.risk_factor import RiskFactor
 from services.fds.src.models.review_queue import ReviewQueue
 
 from src.database import get_db
+from src.pagination import (
+    InvalidCursorError,
+    Keyset,
+    count_key,
+    get_count_cache,
+    paginate,
+)
+from src.queries import get_user_history_cache, load_risk_factors
 
 router = APIRouter(prefix="/v1/transactions", tags=["Transactions"])
 
@@ -50,42 +56,24 @@ async def get_transaction_detail(
             - user_history: 사용자 거래 이력 요약
     """
 
-    # 거래 정보 조회
-    transaction_query = select(Transaction).where(Transaction.id == transaction_id)
-    transaction_result = await db.execute(transaction_query)
-    transaction = transaction_result.scalar_one_or_none()
+    # 거래 + 검토 큐 정보 조회 (쿼리 1회, 검토 큐는 존재하는 경우)
+    result = await db.execute(
+        select(Transaction, ReviewQueue)
+        .outerjoin(ReviewQueue, ReviewQueue.transaction_id == Transaction.id)
+        .where(Transaction.id == transaction_id)
+    )
+    row = result.first()
 
-    if not transaction:
+    if not row:
         raise HTTPException(status_code=404, detail=f"거래를 찾을 수 없습니다: {transaction_id}")
 
-    # 위험 요인 조회
-    risk_factors_query = select(RiskFactor).where(
-        RiskFactor.transaction_id == transaction.id
-    )
-    risk_factors_result = await db.execute(risk_factors_query)
-    risk_factors = risk_factors_result.scalars().all()
+    transaction, review_queue = row
 
-    # 검토 큐 정보 조회 (존재하는 경우)
-    review_queue_query = select(ReviewQueue).where(
-        ReviewQueue.transaction_id == transaction.id
+    # 위험 요인 / 사용자 거래 이력 요약 동시 조회 (각각 별도 세션, 이력은 캐시)
+    risk_factors, user_history = await asyncio.gather(
+        load_risk_factors(transaction.id),
+        get_user_history_cache().get(transaction.user_id),
     )
-    review_queue_result = await db.execute(review_queue_query)
-    review_queue = review_queue_result.scalar_one_or_none()
-
-    # 사용자 거래 이력 요약
-    user_history_query = select(
-        func.count(Transaction.id).label("total_transactions"),
-        func.count(Transaction.id)
-        .filter(Transaction.risk_level == RiskLevel.HIGH)
-        .label("high_risk_count"),
-        func.count(Transaction.id)
-        .filter(Transaction.evaluation_status == EvaluationStatus.BLOCKED)
-        .label("blocked_count"),
-        func.avg(Transaction.risk_score).label("avg_risk_score"),
-    ).where(Transaction.user_id == transaction.user_id)
-
-    user_history_result = await db.execute(user_history_query)
-    user_history_row = user_history_result.fetchone()
 
     # 응답 데이터 구성
     response = {
@@ -107,16 +95,7 @@ async def get_transaction_detail(
             if transaction.evaluated_at
             else None,
         },
-        "risk_factors": [
-            {
-                "id": str(factor.id),
-                "factor_type": factor.factor_type,
-                "factor_score": factor.factor_score,
-                "description": factor.description,
-                "metadata": factor.metadata,
-            }
-            for factor in risk_factors
-        ],
+        "risk_factors": risk_factors,
         "review_queue": (
             {
                 "id": str(review_queue.id),
@@ -136,16 +115,7 @@ async def get_transaction_detail(
             if review_queue
             else None
         ),
-        "user_history": {
-            "total_transactions": user_history_row.total_transactions or 0,
-            "high_risk_count": user_history_row.high_risk_count or 0,
-            "blocked_count": user_history_row.blocked_count or 0,
-            "avg_risk_score": (
-                round(user_history_row.avg_risk_score, 2)
-                if user_history_row.avg_risk_score
-                else 0
-            ),
-        },
+        "user_history": user_history,
     }
 
     return response
@@ -157,13 +127,16 @@ async def list_transactions(
     risk_level: Optional[RiskLevel] = Query(None, description="위험 수준 필터"),
     evaluation_status: Optional[EvaluationStatus] = Query(None, description="평가 상태 필터"),
     limit: int = Query(50, ge=1, le=100, description="최대 결과 수"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    offset: int = Query(0, ge=0, description="오프셋 (cursor 가 없을 때만 사용)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     거래 목록 조회
 
     필터 조건에 맞는 거래 목록을 조회합니다.
+    cursor 를 사용하면 (created_at, id) Keyset 조건으로 조회하므로 깊은 페이지도
+    첫 페이지와 비용이 같습니다.
 
     Args:
         user_id: 사용자 ID 필터
@@ -171,19 +144,18 @@ async def list_transactions(
         evaluation_status: 평가 상태 필터
         limit: 최대 결과 수 (기본 50, 최대 100)
         offset: 페이지네이션 오프셋
+        cursor: 이전 응답의 next_cursor
         db: 데이터베이스 세션
 
     Returns:
         dict: 거래 목록
             - items: 거래 리스트
-            - total: 전체 거래 수
+            - total: 전체 거래 수 (캐시된 근사값)
             - limit: 요청한 limit
             - offset: 요청한 offset
+            - next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
     """
 
-    # 기본 쿼리
-    base_query = select(Transaction)
-
     # 필터 적용
     filters = []
     if user_id:
@@ -193,21 +165,30 @@ async def list_transactions(
     if evaluation_status:
         filters.append(Transaction.evaluation_status == evaluation_status)
 
-    if filters:
-        base_query = base_query.where(and_(*filters))
-
-    # 최신순 정렬
-    base_query = base_query.order_by(Transaction.created_at.desc())
-
-    # 전체 개수 조회
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    key = count_key(
+        "transactions",
+        user_id=user_id,
+        risk_level=risk_level,
+        evaluation_status=evaluation_status,
+    )
 
-    # 페이지네이션 적용
-    items_query = base_query.limit(limit).offset(offset)
-    items_result = await db.execute(items_query)
-    transactions = items_result.scalars().all()
+    # 전체 개수 조회 (캐시, 만료 시 백그라운드 갱신)
+    count_query = select(func.count(Transaction.id)).where(and_(*filters))
+    total = await get_count_cache().get(key, count_query, db=db)
+
+    # 최신순 Keyset 페이지네이션
+    try:
+        page = await paginate(
+            db,
+            select(Transaction).where(and_(*filters)),
+            Keyset((Transaction.created_at, True), (Transaction.id, True), scope=key),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    transactions = page.items
 
     # 응답 데이터 구성
     items = [
@@ -232,6 +213,7 @@ async def list_transactions(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
         "filters": {
             "user_id": str(user_id) if user_id else None,
             "risk_level": risk_level.value if risk_level else None,
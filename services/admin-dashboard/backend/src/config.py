@@ -57,6 +57,7 @@ class Settings(BaseSettings):
     # FDS 서비스 연동
     FDS_SERVICE_URL: str = "http://localhost:8001"
     FDS_SERVICE_TOKEN: str = "dev-service-token-12345"
+    FDS_REDIS_URL: str = "redis://localhost:6379/1"  # 대시보드 롤업 버킷, 검토 큐 (FDS Redis)
 
     # 이커머스 서비스 연동
     ECOMMERCE_SERVICE_URL: str = "http://localhost:8000"
@@ -70,6 +71,13 @@ class Settings(BaseSettings):
     STATS_CACHE_TTL_SECONDS: int = 30  # 통계 데이터 캐시 TTL
     REVIEW_QUEUE_CACHE_TTL_SECONDS: int = 10  # 검토 큐 캐시 TTL
 
+    # 검토 큐 할당
+    REVIEW_LEASE_SECONDS: int = 900  # 할당 리스 유효 시간 (연장하지 않으면 대기열 복귀)
+
+    # 대시보드 실시간 푸시 (SSE)
+    DASHBOARD_PUSH_INTERVAL_SECONDS: float = 5.0  # 토픽 재계산 주기
+    DASHBOARD_PUSH_MAX_CLIENTS: int = 500  # 프로세스당 최대 동시 연결
+
     # Sentry 설정 (에러 트래킹)
     SENTRY_DSN: str | None = None
     SENTRY_ENVIRONMENT: str | None = None
@@ -0,0 +1,22 @@
+"""
+FDS 모듈 import 경로 설정
+
+관리자 대시보드는 FDS 서비스의 모델/서비스 모듈 (services.fds.src...) 을 공유합니다.
+이 모듈을 import 하면 저장소 루트가 sys.path 에 한 번만 추가되므로, 각 모듈은
+파일 상단 import 목록 안에서 경로를 설정할 수 있습니다.
+
+Example:
+    ```python
+    import src.fds_path  # noqa: F401
+    from services.fds.src.models.transaction import Transaction
+    ```
+"""
+
+import os
+import sys
+
+# backend/src → 저장소 루트
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
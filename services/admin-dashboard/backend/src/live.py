@@ -0,0 +1,254 @@
+"""
+대시보드 실시간 푸시 허브
+
+대시보드/검토 큐 화면이 브라우저마다 주기적으로 전체 쿼리를 다시 실행하지 않도록,
+프로세스당 하나의 루프가 interval 마다 구독 중인 토픽을 한 번씩 계산하고 변경된
+스냅샷만 연결된 모든 분석가에게 전달합니다 (Server-Sent Events).
+
+- 토픽: "stats:{time_range}", "review_queue:{status}:{limit}" 처럼 클라이언트 필터가
+  토픽 키에 포함되므로, 같은 필터를 보는 클라이언트 수와 무관하게 계산은 1회
+- 변경 감지: 직전 스냅샷과 같으면 전송하지 않음
+- 백프레셔: 클라이언트별로 토픽당 최신 스냅샷 하나만 보관 (느린 클라이언트는 중간
+  스냅샷을 건너뜀), 메모리 사용량은 클라이언트 수 × 토픽 수로 제한
+- 구독자가 없으면 루프 종료, 다음 구독 시 재시작
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+)
+
+logger = logging.getLogger(__name__)
+
+TopicComputer = Callable[[str], Awaitable[Any]]
+
+
+class _Subscriber:
+    """구독자 (토픽별 최신 스냅샷만 보관)"""
+
+    def __init__(self, topics: Set[str]):
+        self.topics = topics
+        self.pending: Dict[str, Any] = {}
+        self.ready = asyncio.Event()
+
+
+class DashboardHub:
+    """
+    토픽 스냅샷을 주기적으로 계산해 구독자에게 팬아웃하는 허브
+
+    Example:
+        ```python
+        hub = DashboardHub(compute_topic)
+        async for topic, payload in hub.subscribe({"stats:24h"}):
+            ...  # payload 가 None 이면 하트비트
+        ```
+    """
+
+    def __init__(
+        self,
+        compute: TopicComputer,
+        interval_seconds: float = 5.0,
+        heartbeat_seconds: float = 20.0,
+        max_subscribers: int = 500,
+    ):
+        """
+        Args:
+            compute: 토픽 키 → 스냅샷 (JSON 직렬화 가능) 계산 함수
+            interval_seconds: 토픽 재계산 주기
+            heartbeat_seconds: 변경이 없을 때 하트비트 주기
+            max_subscribers: 최대 동시 구독자 수
+        """
+        self.compute = compute
+        self.interval_seconds = interval_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_subscribers = max_subscribers
+
+        self._subscribers: Set[_Subscriber] = set()
+        self._latest: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+        self.stats = {
+            "computations": 0,
+            "published": 0,
+            "unchanged": 0,
+            "conflated": 0,
+            "errors": 0,
+        }
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def is_full(self) -> bool:
+        """최대 구독자 수 도달 여부 (연결 수락 전에 확인)"""
+        return len(self._subscribers) >= self.max_subscribers
+
+    async def subscribe(self, topics: Iterable[str]) -> AsyncIterator[Any]:
+        """
+        토픽 구독 (연결이 끊기면 제너레이터 종료와 함께 해제)
+
+        Args:
+            topics: 토픽 키
+
+        Yields:
+            tuple: (토픽, 스냅샷), 하트비트는 None
+        """
+        subscriber = _Subscriber(set(topics))
+        self._subscribers.add(subscriber)
+
+        # 이미 계산된 토픽은 즉시 전달, 없는 토픽은 루프를 깨워 바로 계산
+        for topic in subscriber.topics:
+            if topic in self._latest:
+                self._offer(subscriber, topic, self._latest[topic])
+            else:
+                self._wake.set()
+        self._ensure_running()
+
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        subscriber.ready.wait(), self.heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                subscriber.ready.clear()
+                pending, subscriber.pending = subscriber.pending, {}
+                for topic, payload in pending.items():
+                    yield topic, payload
+        finally:
+            self._subscribers.discard(subscriber)
+            if not self._subscribers:
+                # 마지막 구독자가 나가면 다음 주기를 기다리지 않고 루프 종료
+                self._wake.set()
+
+    def _offer(self, subscriber: _Subscriber, topic: str, payload: Any) -> None:
+        if topic in subscriber.pending:
+            # 아직 전송하지 못한 이전 스냅샷은 최신 것으로 대체
+            self.stats["conflated"] += 1
+        subscriber.pending[topic] = payload
+        subscriber.ready.set()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            # 계산 중에 들어온 깨우기 (새 토픽 구독) 가 유실되지 않도록 먼저 초기화
+            self._wake.clear()
+            await self.publish_once()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        # 구독자가 없으면 오래된 스냅샷을 보내지 않도록 비움
+        self._latest.clear()
+
+    async def publish_once(self) -> None:
+        """구독 중인 토픽을 한 번씩 계산해 변경분을 전달"""
+        topics = set()
+        for subscriber in self._subscribers:
+            topics |= subscriber.topics
+
+        for topic in sorted(topics):
+            try:
+                payload = await self.compute(topic)
+            except Exception as e:
+                logger.warning(f"[LIVE] 토픽 계산 실패: {topic}, {e}")
+                self.stats["errors"] += 1
+                continue
+            self.stats["computations"] += 1
+
+            if topic in self._latest and self._latest[topic] == payload:
+                self.stats["unchanged"] += 1
+                continue
+            self._latest[topic] = payload
+            self.stats["published"] += 1
+
+            for subscriber in list(self._subscribers):
+                if topic in subscriber.topics:
+                    self._offer(subscriber, topic, payload)
+
+        # 더 이상 구독자가 없는 토픽 스냅샷 정리
+        for topic in set(self._latest) - topics:
+            del self._latest[topic]
+
+    async def close(self) -> None:
+        """루프 종료 (애플리케이션 종료 시)"""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def format_sse(
+    event: Optional[str], data: Any = None, retry_ms: Optional[int] = None
+) -> str:
+    """
+    Server-Sent Events 메시지 포맷
+
+    Args:
+        event: 이벤트 이름 (None 이면 하트비트 주석)
+        data: JSON 직렬화할 데이터
+        retry_ms: 클라이언트 재연결 대기 시간
+
+    Returns:
+        str: SSE 메시지
+    """
+    lines = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event is None:
+        lines.append(": ping")
+    else:
+        lines.append(f"event: {event}")
+        payload = {"data": data, "sent_at": datetime.utcnow().isoformat()}
+        lines.append(f"data: {json.dumps(payload, default=str, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+# 전역 허브 인스턴스
+_dashboard_hub: Optional[DashboardHub] = None
+
+
+def get_dashboard_hub() -> DashboardHub:
+    """
+    대시보드 푸시 허브 가져오기 (싱글톤, 프로세스 로컬)
+
+    Returns:
+        DashboardHub: 허브 인스턴스
+    """
+    global _dashboard_hub
+
+    if _dashboard_hub is None:
+        from src.api.dashboard import compute_live_topic
+        from src.config import settings
+
+        _dashboard_hub = DashboardHub(
+            compute_live_topic,
+            interval_seconds=settings.DASHBOARD_PUSH_INTERVAL_SECONDS,
+            heartbeat_seconds=settings.WEBSOCKET_PING_INTERVAL,
+            max_subscribers=settings.DASHBOARD_PUSH_MAX_CLIENTS,
+        )
+
+    return _dashboard_hub
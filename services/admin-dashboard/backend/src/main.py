@@ -11,6 +11,8 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 from src.database import close_db
+from src.live import get_dashboard_hub
+from src.rollups import get_review_queue_engine
 from src.config import settings
 
 # 로깅 설정 (이커머스 백엔드와 동일한 구조)
@@ -37,6 +39,8 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("관리자 대시보드 서버 종료 중...")
+    await get_dashboard_hub().close()  # 실시간 푸시 루프 종료
+    await get_review_queue_engine().stop()  # 진행 중인 할당 상태 DB 반영
     await close_db()
     logger.info("서버 종료 완료")
 
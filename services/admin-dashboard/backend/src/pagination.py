@@ -0,0 +1,374 @@
+"""
+Keyset 페이지네이션 및 전체 개수 캐시
+
+OFFSET/LIMIT 는 페이지가 깊어질수록 건너뛸 행을 모두 읽어야 하고, 페이지마다
+count() 서브쿼리를 다시 실행합니다. 이 모듈은 다음을 제공합니다.
+
+- Keyset: (정렬 키..., id) 기준 "마지막 행 이후" 조건으로 다음 페이지 조회.
+  N 페이지도 1 페이지와 같은 비용 (인덱스 범위 스캔 + LIMIT)
+- 불투명 커서: 마지막 행의 정렬 키 값을 base64url(JSON) 로 인코딩. 정렬/필터
+  범위(scope)가 다른 커서는 거부
+- CountCache: 전체 개수를 TTL 동안 캐싱하고, 만료 후에는 이전 값을 반환하면서
+  백그라운드에서 갱신 (stale-while-revalidate). 목록 응답의 total 은 근사값
+
+Keyset/CountCache 부분은 services/ecommerce/backend 와
+services/admin-dashboard/backend 에 동일하게 유지한다 (공유 사본 끝 표시까지,
+CI 에서 scripts/check_shared_copies.py 로 검사).
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, bindparam, or_, tuple_
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursorError(ValueError):
+    """커서 형식이 잘못되었거나 다른 정렬/필터의 커서인 경우"""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        tag, raw = next(iter(value.items()))
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "n":
+            return Decimal(raw)
+        if tag == "u":
+            return UUID(raw)
+    return value
+
+
+class Keyset:
+    """
+    Keyset 정렬 정의
+
+    마지막 키는 고유해야 합니다 (보통 id). 모든 키는 NOT NULL 이어야 합니다.
+
+    Example:
+        ```python
+        keyset = Keyset((Product.created_at, True), (Product.id, True), scope="products")
+        page = await paginate(db, select(Product).where(...), keyset, limit=20, cursor=cursor)
+        ```
+    """
+
+    def __init__(self, *keys: Tuple[Any, bool], scope: str = ""):
+        """
+        Args:
+            *keys: (컬럼, 내림차순 여부) 목록
+            scope: 커서 범위 (정렬 방식/필터). 다른 범위의 커서는 거부
+        """
+        if not keys:
+            raise ValueError("Keyset 에 정렬 키가 필요합니다")
+        self.keys = keys
+        self.scope = scope
+
+    def order_by(self) -> List[Any]:
+        """ORDER BY 절"""
+        return [column.desc() if desc else column.asc() for column, desc in self.keys]
+
+    def after(self, values: Sequence[Any]) -> Any:
+        """values 이후의 행 조건"""
+        columns = [column for column, _ in self.keys]
+        values = [
+            bindparam(None, value, type_=column.type)
+            for column, value in zip(columns, values)
+        ]
+        directions = {desc for _, desc in self.keys}
+
+        # 정렬 방향이 같으면 행 값 비교 (복합 인덱스 범위 스캔)
+        if len(directions) == 1:
+            if directions == {True}:
+                return tuple_(*columns) < tuple_(*values)
+            return tuple_(*columns) > tuple_(*values)
+
+        clauses = []
+        for i, (column, desc) in enumerate(self.keys):
+            prefix = [columns[j] == values[j] for j in range(i)]
+            clauses.append(
+                and_(*prefix, column < values[i] if desc else column > values[i])
+            )
+        return or_(*clauses)
+
+    def encode(self, item: Any) -> str:
+        """item(마지막 행) 이후를 가리키는 커서"""
+        payload = {
+            "s": self.scope,
+            "k": [_encode_value(getattr(item, column.key)) for column, _ in self.keys],
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        """커서 → 정렬 키 값"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = [_decode_value(v) for v in payload["k"]]
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError(f"잘못된 커서입니다: {e}")
+
+        if payload.get("s") != self.scope or len(values) != len(self.keys):
+            raise InvalidCursorError("현재 정렬/필터 조건의 커서가 아닙니다")
+        return values
+
+
+@dataclass
+class Page:
+    """페이지 조회 결과"""
+
+    items: List[Any]
+    next_cursor: Optional[str]
+    has_more: bool
+
+
+async def paginate(
+    db: Any,
+    stmt: Select,
+    keyset: Keyset,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    rows: bool = False,
+) -> Page:
+    """
+    Keyset 페이지 조회
+
+    cursor 가 있으면 Keyset 조건으로, 없으면 offset 으로 조회합니다 (하위 호환).
+    어느 경우든 다음 페이지 커서를 반환하므로 클라이언트가 커서를 따라가면
+    모든 페이지가 같은 비용입니다.
+
+    Args:
+        db: 비동기 세션
+        stmt: ORM 엔티티 SELECT (정렬은 keyset 으로 대체)
+        keyset: 정렬 정의
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor
+        offset: 커서가 없을 때의 오프셋 (레거시 page/offset 파라미터)
+        rows: True 면 Row(엔티티, 조인 엔티티, ...) 반환 (커서는 첫 번째 엔티티 기준)
+
+    Returns:
+        Page: 항목, 다음 커서, 다음 페이지 존재 여부
+
+    Raises:
+        InvalidCursorError: 커서가 잘못된 경우
+    """
+    stmt = stmt.order_by(None).order_by(*keyset.order_by())
+    if cursor:
+        stmt = stmt.where(keyset.after(keyset.decode(cursor)))
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    result = await db.execute(stmt.limit(limit + 1))
+    items = list(result.all() if rows else result.scalars().all())
+
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more and items:
+        next_cursor = keyset.encode(items[-1][0] if rows else items[-1])
+    return Page(items=items, next_cursor=next_cursor, has_more=has_more)
+
+
+def count_key(scope: str, **filters: Any) -> str:
+    """필터 조합별 개수 캐시 키"""
+    digest = hashlib.sha1(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    return f"{scope}:{digest}"
+
+
+class CountCache:
+    """
+    전체 개수 캐시 (stale-while-revalidate)
+
+    - TTL 이내: 캐시 값
+    - TTL ~ max_stale: 이전 값 반환 + 백그라운드 갱신 (키당 동시 1회)
+    - 그 이상/없음: 즉시 계산
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        redis: Optional[Any] = None,
+        ttl_seconds: float = 60,
+        max_stale_seconds: float = 900,
+        prefix: str = "count",
+        local_max_entries: int = 1000,
+    ):
+        """
+        Args:
+            session_factory: 백그라운드 갱신용 세션 팩토리 (async context manager)
+            redis: 비동기 Redis 클라이언트 (None 이면 로컬 캐시만 사용)
+            ttl_seconds: 갱신 없이 사용하는 시간 (초)
+            max_stale_seconds: 이전 값을 반환할 수 있는 최대 시간 (초)
+            prefix: Redis 키 접두사
+            local_max_entries: 로컬 캐시 최대 항목 수 (LRU)
+        """
+        self.session_factory = session_factory
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.prefix = prefix
+        self.local_max_entries = local_max_entries
+
+        # key -> (개수, 계산 시각)
+        self._local: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "errors": 0,
+        }
+
+    async def get(self, key: str, count_stmt: Select, db: Optional[Any] = None) -> int:
+        """
+        개수 조회
+
+        Args:
+            key: 캐시 키 (count_key() 로 생성)
+            count_stmt: SELECT count(...) 문
+            db: 캐시 미스 시 사용할 세션 (None 이면 session_factory)
+
+        Returns:
+            int: 전체 개수 (근사값일 수 있음)
+        """
+        entry = self._local.get(key) or await self._load_shared(key)
+        if entry is not None:
+            value, computed_at = entry
+            age = time.time() - computed_at
+            if age < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return value
+            if age < self.max_stale_seconds:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, count_stmt)
+                return value
+
+        self.stats["misses"] += 1
+        if db is not None:
+            value = await self._execute(db, count_stmt)
+        else:
+            async with self.session_factory() as session:
+                value = await self._execute(session, count_stmt)
+        await self._store(key, value)
+        return value
+
+    def invalidate_local(self, key: Optional[str] = None) -> None:
+        """로컬 캐시 비우기 (key 가 없으면 전체)"""
+        if key is None:
+            self._local.clear()
+        else:
+            self._local.pop(key, None)
+
+    async def _execute(self, session: Any, count_stmt: Select) -> int:
+        return int((await session.execute(count_stmt)).scalar() or 0)
+
+    def _schedule_refresh(self, key: str, count_stmt: Select) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, count_stmt))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, count_stmt: Select) -> None:
+        try:
+            async with self.session_factory() as session:
+                value = await self._execute(session, count_stmt)
+            await self._store(key, value)
+            self.stats["refreshes"] += 1
+        except Exception as e:
+            logger.warning(f"개수 캐시 갱신 실패: {key}, {e}")
+            self.stats["errors"] += 1
+
+    async def _load_shared(self, key: str) -> Optional[Tuple[int, float]]:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(f"{self.prefix}:{key}")
+        except Exception as e:
+            logger.warning(f"개수 캐시 조회 실패: {key}, {e}")
+            self.stats["errors"] += 1
+            return None
+        if raw is None:
+            return None
+        value, computed_at = json.loads(raw)
+        self._remember(key, (int(value), float(computed_at)))
+        return self._local[key]
+
+    async def _store(self, key: str, value: int) -> None:
+        entry = (value, time.time())
+        self._remember(key, entry)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                f"{self.prefix}:{key}",
+                json.dumps(entry),
+                ex=int(self.max_stale_seconds),
+            )
+        except Exception as e:
+            logger.warning(f"개수 캐시 저장 실패: {key}, {e}")
+            self.stats["errors"] += 1
+
+    def _remember(self, key: str, entry: Tuple[int, float]) -> None:
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+
+# ---- 공유 사본 끝: 이 아래는 서비스별 구성 ----
+
+# 전역 개수 캐시 인스턴스
+_count_cache: Optional[CountCache] = None
+
+
+def get_count_cache() -> CountCache:
+    """
+    개수 캐시 인스턴스 가져오기 (싱글톤, 프로세스 로컬)
+
+    Returns:
+        CountCache: 캐시 인스턴스
+    """
+    global _count_cache
+
+    if _count_cache is None:
+        from src.database import AsyncSessionLocal
+
+        _count_cache = CountCache(AsyncSessionLocal)
+
+    return _count_cache
@@ -0,0 +1,184 @@
+"""
+상세 화면 보조 조회
+
+거래/검토 상세 API 가 본 조회와 동시에 (asyncio.gather) 실행하는 독립 쿼리입니다.
+AsyncSession 은 동시 쿼리를 지원하지 않으므로 각 조회는 세션 팩토리에서 자체
+세션(별도 커넥션)을 열어 실행합니다.
+
+- load_risk_factors: 거래의 위험 요인 목록
+- UserHistoryCache: 사용자 거래 이력 집계 (짧은 TTL 캐시 + 동일 사용자 동시 요청 병합)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+import src.fds_path  # noqa: F401
+from services.fds.src.models.transaction import (
+    Transaction,
+    RiskLevel,
+    EvaluationStatus,
+)
+from services.fds.src.models.risk_factor import RiskFactor
+
+
+def _default_session_factory() -> Callable:
+    from src.database import AsyncSessionLocal
+
+    return AsyncSessionLocal
+
+
+async def load_risk_factors(
+    transaction_id: UUID, session_factory: Optional[Callable] = None
+) -> List[Dict[str, Any]]:
+    """
+    거래 위험 요인 조회 (자체 세션)
+
+    Args:
+        transaction_id: 거래 ID
+        session_factory: 세션 팩토리 (기본: AsyncSessionLocal)
+
+    Returns:
+        list: 위험 요인 응답 리스트
+    """
+    session_factory = session_factory or _default_session_factory()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(RiskFactor).where(RiskFactor.transaction_id == transaction_id)
+        )
+        return [
+            {
+                "id": str(factor.id),
+                "factor_type": factor.factor_type,
+                "factor_score": factor.factor_score,
+                "description": factor.description,
+                "metadata": factor.risk_metadata,
+            }
+            for factor in result.scalars().all()
+        ]
+
+
+class UserHistoryCache:
+    """
+    사용자 거래 이력 집계 캐시
+
+    사용자 전체 거래를 스캔하는 집계(건수, 고위험/차단 건수, 평균 위험 점수)를
+    사용자별로 ttl_seconds 동안 재사용합니다. 사기 급증 시 여러 분석가가 같은
+    사용자의 거래를 동시에 열면 집계 쿼리는 한 번만 실행됩니다.
+
+    상세 화면의 참고 지표이므로 TTL 만큼 오래된 값을 허용합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10000,
+    ):
+        """
+        Args:
+            session_factory: 집계에 사용할 세션 팩토리 (기본: AsyncSessionLocal)
+            ttl_seconds: 캐시 유효 시간
+            max_entries: 최대 캐시 사용자 수 (LRU)
+        """
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # user_id -> (집계, 계산 시각)
+        self._local: "OrderedDict[UUID, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        # user_id -> 진행 중인 집계 태스크
+        self._inflight: Dict[UUID, asyncio.Task] = {}
+
+        self.stats = {"hits": 0, "misses": 0, "joined": 0, "errors": 0}
+
+    async def get(self, user_id: UUID) -> Dict[str, Any]:
+        """
+        사용자 거래 이력 집계 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            dict: total_transactions, high_risk_count, blocked_count, avg_risk_score
+        """
+        entry = self._local.get(user_id)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            self._local.move_to_end(user_id)
+            self.stats["hits"] += 1
+            return dict(entry[0])
+
+        task = self._inflight.get(user_id)
+        if task is None:
+            self.stats["misses"] += 1
+            task = asyncio.create_task(self._load(user_id))
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(user_id, None))
+        else:
+            self.stats["joined"] += 1
+
+        # 요청 취소가 다른 대기자의 집계까지 취소하지 않도록 shield
+        return dict(await asyncio.shield(task))
+
+    def invalidate(self, user_id: UUID) -> None:
+        """사용자 집계 캐시 삭제 (검토 결정 등으로 차단 건수가 바뀐 경우)"""
+        self._local.pop(user_id, None)
+
+    async def _load(self, user_id: UUID) -> Dict[str, Any]:
+        session_factory = self.session_factory or _default_session_factory()
+        query = select(
+            func.count(Transaction.id).label("total_transactions"),
+            func.count(Transaction.id)
+            .filter(Transaction.risk_level == RiskLevel.HIGH)
+            .label("high_risk_count"),
+            func.count(Transaction.id)
+            .filter(Transaction.evaluation_status == EvaluationStatus.BLOCKED)
+            .label("blocked_count"),
+            func.avg(Transaction.risk_score).label("avg_risk_score"),
+        ).where(Transaction.user_id == user_id)
+
+        try:
+            async with session_factory() as session:
+                row = (await session.execute(query)).fetchone()
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+
+        history = {
+            "total_transactions": row.total_transactions or 0,
+            "high_risk_count": row.high_risk_count or 0,
+            "blocked_count": row.blocked_count or 0,
+            "avg_risk_score": (
+                round(float(row.avg_risk_score), 2) if row.avg_risk_score else 0
+            ),
+        }
+
+        self._local[user_id] = (history, time.monotonic())
+        self._local.move_to_end(user_id)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+        return history
+
+
+# 전역 이력 캐시 인스턴스
+_user_history_cache: Optional[UserHistoryCache] = None
+
+
+def get_user_history_cache() -> UserHistoryCache:
+    """
+    사용자 거래 이력 캐시 가져오기 (싱글톤, 프로세스 로컬)
+
+    Returns:
+        UserHistoryCache: 캐시 인스턴스
+    """
+    global _user_history_cache
+
+    if _user_history_cache is None:
+        _user_history_cache = UserHistoryCache()
+
+    return _user_history_cache
@@ -0,0 +1,81 @@
+"""
+대시보드 롤업 / 검토 큐 엔진 연동
+
+FDS 서비스와 공유하는 Redis 구조를 관리자 대시보드에서 사용합니다.
+
+- 대시보드 롤업 (services.fds.src.services.dashboard_rollup): 윈도우를 버킷
+  합산으로 응답하고, 검토 결정 시 거래/검토 상태 변경을 반영
+- 검토 큐 엔진 (services.fds.src.services.review_queue_engine): 분석가에게
+  우선순위가 가장 높은 대기 항목을 원자적으로 할당 (리스)
+"""
+
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+import src.fds_path  # noqa: F401
+from services.fds.src.services.dashboard_rollup import DashboardRollup
+from services.fds.src.services.review_queue_engine import ReviewQueueEngine
+
+from src.config import settings
+
+# 전역 인스턴스 (FDS Redis 클라이언트 공유)
+_fds_redis: Optional[aioredis.Redis] = None
+_dashboard_rollup: Optional[DashboardRollup] = None
+_review_queue_engine: Optional[ReviewQueueEngine] = None
+
+
+def _get_fds_redis() -> aioredis.Redis:
+    global _fds_redis
+
+    if _fds_redis is None:
+        _fds_redis = aioredis.from_url(
+            settings.FDS_REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            decode_responses=True,
+        )
+
+    return _fds_redis
+
+
+def get_dashboard_rollup() -> DashboardRollup:
+    """
+    대시보드 롤업 가져오기 (싱글톤)
+
+    Redis 오류는 롤업 내부에서 처리되며, 조회 시 None 을 반환하므로
+    호출 측은 DB 집계로 대체합니다.
+
+    Returns:
+        DashboardRollup: 롤업 인스턴스
+    """
+    global _dashboard_rollup
+
+    if _dashboard_rollup is None:
+        _dashboard_rollup = DashboardRollup(_get_fds_redis())
+
+    return _dashboard_rollup
+
+
+def get_review_queue_engine() -> ReviewQueueEngine:
+    """
+    검토 큐 엔진 가져오기 (싱글톤)
+
+    만료 리스 회수 루프는 FDS 서비스에서 실행되며, 여기서는 할당 시점에도
+    만료 리스가 대기열로 돌아갑니다. 할당 결과는 관리자 DB 세션으로 반영합니다.
+
+    Returns:
+        ReviewQueueEngine: 엔진 인스턴스
+    """
+    global _review_queue_engine
+
+    if _review_queue_engine is None:
+        from src.database import AsyncSessionLocal
+
+        _review_queue_engine = ReviewQueueEngine(
+            _get_fds_redis(),
+            session_factory=AsyncSessionLocal,
+            lease_seconds=settings.REVIEW_LEASE_SECONDS,
+        )
+
+    return _review_queue_engine
@@ -0,0 +1 @@
+# Admin Dashboard Backend Unit Tests
@@ -0,0 +1,160 @@
+"""
+대시보드 실시간 푸시 허브 유닛 테스트
+
+- 느린 구독자는 토픽당 최신 스냅샷만 받음 (conflation)
+- 직전과 같은 스냅샷은 전송하지 않음
+- 계산 중에 구독한 새 토픽도 다음 주기를 기다리지 않고 계산
+- 마지막 구독자가 나가면 루프 종료
+- 최대 구독자 수에 도달하면 /stream 은 503
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.live import DashboardHub
+
+
+class _Topics:
+    """토픽별 스냅샷을 바꿀 수 있는 계산 함수"""
+
+    def __init__(self, **values):
+        self.values = values
+        self.calls = []
+        self.gates = {}
+
+    async def __call__(self, topic):
+        self.calls.append(topic)
+        gate = self.gates.get(topic)
+        if gate is not None:
+            await gate.wait()
+        return self.values[topic]
+
+
+def _hub(topics, **kwargs):
+    kwargs.setdefault("interval_seconds", 3600)
+    kwargs.setdefault("heartbeat_seconds", 3600)
+    return DashboardHub(topics, **kwargs)
+
+
+async def _next(stream, timeout=1.0):
+    return await asyncio.wait_for(stream.__anext__(), timeout)
+
+
+@pytest.mark.unit
+async def test_slow_subscriber_receives_latest_snapshot_only():
+    topics = _Topics(a=1)
+    hub = _hub(topics)
+    stream = hub.subscribe({"a"})
+
+    assert await _next(stream) == ("a", 1)
+
+    # 구독자가 읽기 전에 두 번 갱신
+    topics.values["a"] = 2
+    await hub.publish_once()
+    topics.values["a"] = 3
+    await hub.publish_once()
+
+    assert await _next(stream) == ("a", 3)
+    assert hub.stats["conflated"] == 1
+    assert hub.stats["published"] == 3
+
+    await stream.aclose()
+    await hub.close()
+
+
+@pytest.mark.unit
+async def test_unchanged_snapshot_is_not_sent():
+    topics = _Topics(a={"pending": 4})
+    hub = _hub(topics, heartbeat_seconds=0.05)
+    stream = hub.subscribe({"a"})
+
+    assert await _next(stream) == ("a", {"pending": 4})
+
+    await hub.publish_once()
+
+    # 변경이 없으므로 다음 메시지는 하트비트
+    assert await _next(stream) is None
+    assert hub.stats["unchanged"] == 1
+    assert hub.stats["published"] == 1
+
+    await stream.aclose()
+    await hub.close()
+
+
+@pytest.mark.unit
+async def test_topic_subscribed_during_publish_is_computed_immediately():
+    topics = _Topics(a=1, b=2)
+    topics.gates["a"] = asyncio.Event()
+    hub = _hub(topics)
+    first = hub.subscribe({"a"})
+    first_message = asyncio.ensure_future(_next(first))
+
+    # "a" 계산 중에 "b" 구독
+    while topics.calls != ["a"]:
+        await asyncio.sleep(0)
+    second = hub.subscribe({"b"})
+    second_message = asyncio.ensure_future(_next(second))
+    await asyncio.sleep(0)
+    topics.gates["a"].set()
+
+    assert await first_message == ("a", 1)
+    assert await second_message == ("b", 2)
+
+    await first.aclose()
+    await second.aclose()
+    await hub.close()
+
+
+@pytest.mark.unit
+async def test_loop_stops_after_last_subscriber_leaves():
+    topics = _Topics(a=1, b=2)
+    hub = _hub(topics)
+    first, second = hub.subscribe({"a"}), hub.subscribe({"b"})
+    await _next(first)
+    await _next(second)
+    task = hub._task
+
+    await first.aclose()
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert hub.subscriber_count == 1
+
+    await second.aclose()
+    await asyncio.wait_for(task, 1.0)
+    assert hub.subscriber_count == 0
+    assert hub._latest == {}
+
+    # 다시 구독하면 루프 재시작
+    third = hub.subscribe({"a"})
+    assert await _next(third) == ("a", 1)
+    assert hub._task is not task
+
+    await third.aclose()
+    await hub.close()
+
+
+@pytest.mark.unit
+async def test_stream_rejects_connections_over_limit(monkeypatch):
+    dashboard_api = pytest.importorskip("src.api.dashboard")
+
+    hub = _hub(_Topics(**{"stats:24h": {}}), max_subscribers=1)
+    monkeypatch.setattr(dashboard_api, "get_dashboard_hub", lambda: hub)
+    stream = hub.subscribe({"stats:24h"})
+    await _next(stream)
+    assert hub.is_full
+
+    with pytest.raises(HTTPException) as exc:
+        await dashboard_api.stream_dashboard(
+            request=None,
+            time_range="24h",
+            topics="stats",
+            review_status=None,
+            review_limit=50,
+        )
+    assert exc.value.status_code == 503
+
+    await stream.aclose()
+    assert not hub.is_full
+    await hub.close()
@@ -0,0 +1,128 @@
+"""
+상세 화면 보조 조회 유닛 테스트
+
+- 위험 요인 조회: 거래당 쿼리 1회, 응답 형식 (metadata = risk_metadata)
+- 사용자 이력 집계: 같은 사용자 동시 요청은 쿼리 1회로 병합, TTL 동안 재사용
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import src.fds_path  # noqa: F401
+from src.queries import UserHistoryCache, load_risk_factors
+from services.fds.src.models.risk_factor import FactorType, RiskFactor
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+
+class _FakeSessionFactory:
+    """세션마다 실행한 문장을 기록하고 미리 정한 결과를 돌려주는 가짜 세션 팩토리"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        # 다른 요청이 끼어들 수 있게 양보
+        await asyncio.sleep(0)
+        return _Result(self.rows)
+
+
+@pytest.mark.unit
+async def test_risk_factors_use_single_query_and_response_shape():
+    transaction_id = uuid.uuid4()
+    factors = [
+        RiskFactor(
+            id=uuid.uuid4(),
+            transaction_id=transaction_id,
+            factor_type=FactorType.VELOCITY_CHECK,
+            factor_score=40,
+            description="단시간 다수 거래",
+            risk_metadata={"count": 7},
+        ),
+        RiskFactor(
+            id=uuid.uuid4(),
+            transaction_id=transaction_id,
+            factor_type=FactorType.AMOUNT_THRESHOLD,
+            factor_score=30,
+            description="고액 거래",
+            risk_metadata=None,
+        ),
+    ]
+    factory = _FakeSessionFactory(factors)
+
+    result = await load_risk_factors(transaction_id, session_factory=factory)
+
+    assert len(factory.statements) == 1
+    assert result == [
+        {
+            "id": str(factors[0].id),
+            "factor_type": FactorType.VELOCITY_CHECK,
+            "factor_score": 40,
+            "description": "단시간 다수 거래",
+            "metadata": {"count": 7},
+        },
+        {
+            "id": str(factors[1].id),
+            "factor_type": FactorType.AMOUNT_THRESHOLD,
+            "factor_score": 30,
+            "description": "고액 거래",
+            "metadata": None,
+        },
+    ]
+
+
+@pytest.mark.unit
+async def test_user_history_concurrent_requests_share_one_query():
+    row = SimpleNamespace(
+        total_transactions=12,
+        high_risk_count=3,
+        blocked_count=2,
+        avg_risk_score=41.256,
+    )
+    factory = _FakeSessionFactory([row])
+    cache = UserHistoryCache(session_factory=factory, ttl_seconds=60)
+    user_id = uuid.uuid4()
+
+    results = await asyncio.gather(*(cache.get(user_id) for _ in range(5)))
+    assert await cache.get(user_id) == results[0]
+
+    assert len(factory.statements) == 1
+    assert results[0] == {
+        "total_transactions": 12,
+        "high_risk_count": 3,
+        "blocked_count": 2,
+        "avg_risk_score": 41.26,
+    }
+    assert all(result == results[0] for result in results)
+    assert cache.stats == {"hits": 1, "misses": 1, "joined": 4, "errors": 0}
+
+    # 무효화 후에는 다시 조회
+    cache.invalidate(user_id)
+    await cache.get(user_id)
+    assert len(factory.statements) == 2
@@ -0,0 +1,218 @@
+"""
+검토 결정 API 유닛 테스트
+
+- 리스를 보유하지 않은 담당자의 결정은 409
+- 특정 항목 할당은 다른 담당자가 검토 중이면 409
+- 결정 요청은 검토 큐/거래 행을 잠그고 (SELECT ... FOR UPDATE) 상태를 전이
+- 동시 결정 중 진 요청은 거절되고 롤업 상태 변경은 이긴 요청만 기록
+"""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+import src.api.review as review_api
+import src.fds_path  # noqa: F401
+from services.fds.src.models.review_queue import (
+    ReviewDecision,
+    ReviewQueue,
+    ReviewStatus,
+)
+from services.fds.src.models.transaction import EvaluationStatus, Transaction
+
+
+class _Result:
+    def __init__(self, row):
+        self.row = row
+
+    def one_or_none(self):
+        return self.row
+
+
+class _FakeSession:
+    """실행한 문장을 기록하고 같은 행을 돌려주는 가짜 세션"""
+
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self.row)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, instance):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class _FakeRollup:
+    def __init__(self):
+        self.changes = []
+
+    async def record_status_changes(self, changes):
+        self.changes.extend(changes)
+
+
+class _FakeEngine:
+    """항목별 리스 보유자를 기록하는 가짜 검토 큐 엔진"""
+
+    def __init__(self):
+        self.owners = {}
+        self.removed = []
+
+    async def renew(self, queue_id, reviewer_id):
+        if self.owners.get(queue_id) != reviewer_id:
+            return None
+        return object()
+
+    async def claim(self, queue_id, reviewer_id, risk_score=0, added_at=None):
+        if self.owners.setdefault(queue_id, reviewer_id) != reviewer_id:
+            return None
+        return SimpleNamespace(expires_at=datetime.utcnow())
+
+    async def remove(self, queue_id):
+        self.removed.append(queue_id)
+        self.owners.pop(queue_id, None)
+
+
+class _FakeHistoryCache:
+    def invalidate(self, user_id):
+        pass
+
+
+@pytest.fixture
+def services(monkeypatch):
+    rollup, engine = _FakeRollup(), _FakeEngine()
+    monkeypatch.setattr(review_api, "get_dashboard_rollup", lambda: rollup)
+    monkeypatch.setattr(review_api, "get_review_queue_engine", lambda: engine)
+    monkeypatch.setattr(
+        review_api, "get_user_history_cache", lambda: _FakeHistoryCache()
+    )
+    return rollup, engine
+
+
+def _row():
+    transaction = Transaction(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        evaluation_status=EvaluationStatus.BLOCKED,
+        created_at=datetime.utcnow(),
+    )
+    review_queue = ReviewQueue(
+        id=uuid.uuid4(),
+        transaction_id=transaction.id,
+        status=ReviewStatus.IN_REVIEW,
+        added_at=datetime.utcnow(),
+    )
+    return review_queue, transaction
+
+
+def _request(engine, queue_id, decision=ReviewDecision.APPROVE):
+    """리스를 보유한 담당자의 결정 요청"""
+    reviewer_id = uuid.uuid4()
+    engine.owners[queue_id] = reviewer_id
+    return review_api.ReviewDecisionRequest(decision=decision, reviewer_id=reviewer_id)
+
+
+@pytest.mark.unit
+async def test_decision_requires_reviewer_to_hold_lease(services):
+    _, engine = services
+    row = _row()
+    db = _FakeSession(row)
+    _request(engine, row[0].id)
+
+    # 다른 담당자 (리스 만료 후 재할당 등) 의 결정
+    other = review_api.ReviewDecisionRequest(
+        decision=ReviewDecision.APPROVE, reviewer_id=uuid.uuid4()
+    )
+    with pytest.raises(HTTPException) as exc:
+        await review_api.approve_or_block_transaction(row[0].id, other, db)
+
+    assert exc.value.status_code == 409
+    assert db.statements == []
+    assert row[0].status == ReviewStatus.IN_REVIEW
+
+
+@pytest.mark.unit
+async def test_decision_locks_review_and_transaction_rows(services):
+    _, engine = services
+    row = _row()
+    db = _FakeSession(row)
+
+    result = await review_api.approve_or_block_transaction(
+        row[0].id, _request(engine, row[0].id), db
+    )
+
+    assert result["status"] == ReviewStatus.COMPLETED.value
+    assert result["transaction_status"] == EvaluationStatus.APPROVED.value
+    assert len(db.statements) == 1
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE OF review_queue, transactions" in sql
+
+
+@pytest.mark.unit
+async def test_losing_concurrent_decision_does_not_touch_rollup(services):
+    rollup, engine = services
+    row = _row()
+
+    # 리스 확인을 함께 통과한 두 요청이 행 잠금으로 직렬화: 나중 요청은 커밋된
+    # 완료 상태를 읽음
+    winner = _request(engine, row[0].id, ReviewDecision.APPROVE)
+    late = review_api.ReviewDecisionRequest(
+        decision=ReviewDecision.BLOCK, reviewer_id=winner.reviewer_id
+    )
+    await review_api.approve_or_block_transaction(row[0].id, winner, _FakeSession(row))
+    engine.owners[row[0].id] = winner.reviewer_id
+    loser = _FakeSession(row)
+    with pytest.raises(HTTPException) as exc:
+        await review_api.approve_or_block_transaction(row[0].id, late, loser)
+
+    assert exc.value.status_code == 400
+    assert loser.commits == 0
+    assert row[1].evaluation_status == EvaluationStatus.APPROVED
+    assert [change[2:] for change in rollup.changes] == [
+        (ReviewStatus.IN_REVIEW, ReviewStatus.COMPLETED),
+        (EvaluationStatus.BLOCKED, EvaluationStatus.APPROVED),
+    ]
+    assert engine.removed == [row[0].id]
+
+
+@pytest.mark.unit
+async def test_claim_item_rejects_other_reviewer(services):
+    rollup, engine = services
+    row = _row()
+    row[0].status = ReviewStatus.PENDING
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    await review_api.claim_review(
+        row[0].id, review_api.ReviewerRequest(reviewer_id=first), _FakeSession(row)
+    )
+    assert row[0].status == ReviewStatus.IN_REVIEW
+    assert row[0].assigned_to == first
+
+    db = _FakeSession(row)
+    with pytest.raises(HTTPException) as exc:
+        await review_api.claim_review(
+            row[0].id, review_api.ReviewerRequest(reviewer_id=second), db
+        )
+    assert exc.value.status_code == 409
+    assert db.commits == 0
+    assert row[0].assigned_to == first
+
+    # 보유 중인 담당자의 재요청은 연장만 (상태 변경 없음)
+    await review_api.claim_review(
+        row[0].id, review_api.ReviewerRequest(reviewer_id=first), _FakeSession(row)
+    )
+    assert [change[2:] for change in rollup.changes] == [
+        (ReviewStatus.PENDING, ReviewStatus.IN_REVIEW)
+    ]
@@ -4,36 +4,128 @@
  * React Query를 사용한 대시보드 데이터 fetching hooks입니다.
  */
 
+import { useEffect, useRef, useState } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { dashboardApi, reviewQueueApi, transactionApi } from "../services/api";
-import type { ReviewDecisionRequest, ReviewStatus } from "../types/dashboard";
+import type {
+  DashboardStats,
+  DashboardStreamMessage,
+  ReviewDecisionRequest,
+  ReviewQueueListResponse,
+  ReviewStatus,
+} from "../types/dashboard";
+
+type StreamHandlers = Record<
+  string,
+  (message: DashboardStreamMessage<unknown>) => void
+>;
+
+/**
+ * 대시보드 실시간 푸시(SSE) 구독
+ *
+ * 서버는 변경된 스냅샷만 보냅니다. 연결이 끊기면 EventSource가 자동으로
+ * 재연결하며, 그동안 호출 측은 폴링으로 대체합니다.
+ *
+ * @param url 구독 URL (null이면 구독하지 않음)
+ * @param handlers 이벤트 이름별 핸들러
+ * @returns 연결 여부
+ */
+const useDashboardStream = (
+  url: string | null,
+  handlers: StreamHandlers
+): boolean => {
+  const [connected, setConnected] = useState(false);
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    if (!url || typeof EventSource === "undefined") {
+      return;
+    }
+
+    const source = new EventSource(url);
+    source.onopen = () => setConnected(true);
+    source.onerror = () => setConnected(false);
+
+    for (const event of Object.keys(handlersRef.current)) {
+      source.addEventListener(event, (e) => {
+        const message = JSON.parse((e as MessageEvent<string>).data);
+        handlersRef.current[event]?.(message);
+      });
+    }
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [url]);
+
+  return connected;
+};
 
 /**
  * 대시보드 통계 조회
+ *
+ * 실시간 푸시가 연결된 동안에는 폴링하지 않습니다.
  */
 export const useDashboardStats = (
   timeRange: "1h" | "24h" | "7d" | "30d" = "24h"
 ) => {
+  const queryClient = useQueryClient();
+  const live = useDashboardStream(
+    dashboardApi.getStreamUrl({ topics: ["stats"], timeRange }),
+    {
+      stats: ({ data, sent_at }) =>
+        queryClient.setQueryData<DashboardStats>(
+          ["dashboardStats", timeRange],
+          {
+            ...(data as Omit<DashboardStats, "generated_at">),
+            generated_at: sent_at,
+          }
+        ),
+    }
+  );
+
   return useQuery({
     queryKey: ["dashboardStats", timeRange],
     queryFn: () => dashboardApi.getStats(timeRange),
-    refetchInterval: 30000, // 30초마다 자동 갱신
+    refetchInterval: live ? false : 30000, // 푸시 미연결 시 30초마다 자동 갱신
     staleTime: 20000, // 20초 동안은 fresh 상태 유지
   });
 };
 
 /**
  * 검토 큐 목록 조회
+ *
+ * 첫 페이지는 실시간 푸시로 갱신되며, 연결된 동안에는 폴링하지 않습니다.
  */
 export const useReviewQueueList = (
   status?: ReviewStatus,
   limit: number = 50,
   offset: number = 0
 ) => {
+  const queryClient = useQueryClient();
+  const live = useDashboardStream(
+    offset === 0
+      ? dashboardApi.getStreamUrl({
+          topics: ["review_queue"],
+          reviewStatus: status,
+          reviewLimit: limit,
+        })
+      : null,
+    {
+      review_queue: ({ data }) =>
+        queryClient.setQueryData<ReviewQueueListResponse>(
+          ["reviewQueue", status, limit, offset],
+          data as ReviewQueueListResponse
+        ),
+    }
+  );
+
   return useQuery({
     queryKey: ["reviewQueue", status, limit, offset],
     queryFn: () => reviewQueueApi.getList(status, limit, offset),
-    refetchInterval: 60000, // 1분마다 자동 갱신
+    refetchInterval: live ? false : 60000, // 푸시 미연결 시 1분마다 자동 갱신
     staleTime: 30000, // 30초 동안은 fresh 상태 유지
   });
 };
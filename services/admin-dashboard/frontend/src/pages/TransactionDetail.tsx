@@ -10,6 +10,7 @@ import {
   useTransactionDetail,
   useSubmitReviewDecision,
 } from "../hooks/useDashboardData";
+import { reviewQueueApi } from "../services/api";
 import {
   BarChart,
   Bar,
@@ -39,13 +40,17 @@ const TransactionDetail = () => {
       return;
     }
 
+    const reviewerId = "00000000-0000-0000-0000-000000000001"; // TODO: 실제 사용자 ID 사용
+
     try {
+      // 결정은 리스를 보유한 담당자만 가능 (이미 보유 중이면 연장)
+      await reviewQueueApi.claim(data.review_queue.id, reviewerId);
       await submitDecision.mutateAsync({
         reviewQueueId: data.review_queue.id,
         request: {
           decision,
           notes,
-          reviewer_id: "00000000-0000-0000-0000-000000000001", // TODO: 실제 사용자 ID 사용
+          reviewer_id: reviewerId,
         },
       });
       alert("검토가 완료되었습니다.");
@@ -12,7 +12,10 @@ import type {
   TransactionDetail,
   ReviewDecisionRequest,
   ReviewDecisionResponse,
+  ReviewClaimResponse,
+  ReviewLeaseResponse,
   ReviewStatus,
+  DashboardStreamTopic,
 } from "../types/dashboard";
 
 // API 기본 URL (환경 변수에서 가져오거나 기본값 사용)
@@ -80,6 +83,35 @@ export const dashboardApi = {
     );
     return response.data;
   },
+
+  /**
+   * 실시간 푸시(SSE) 구독 URL
+   * @param topics 구독 토픽 (stats, review_queue)
+   * @param timeRange stats 토픽 시간 범위
+   * @param reviewStatus review_queue 토픽 상태 필터
+   * @param reviewLimit review_queue 토픽 항목 수
+   */
+  getStreamUrl: ({
+    topics,
+    timeRange = "24h",
+    reviewStatus,
+    reviewLimit = 50,
+  }: {
+    topics: DashboardStreamTopic[];
+    timeRange?: "1h" | "24h" | "7d" | "30d";
+    reviewStatus?: ReviewStatus;
+    reviewLimit?: number;
+  }): string => {
+    const params = new URLSearchParams({
+      topics: topics.join(","),
+      time_range: timeRange,
+      review_limit: String(reviewLimit),
+    });
+    if (reviewStatus) {
+      params.set("review_status", reviewStatus);
+    }
+    return `${API_BASE_URL}/v1/dashboard/stream?${params.toString()}`;
+  },
 };
 
 /**
@@ -132,6 +164,61 @@ export const reviewQueueApi = {
     );
     return response.data;
   },
+
+  /**
+   * 다음 검토 항목 할당 (위험 점수 + 대기 시간 우선순위)
+   * @param reviewerId 검토 담당자 ID
+   */
+  claimNext: async (reviewerId: string): Promise<ReviewClaimResponse> => {
+    const response = await apiClient.post<ReviewClaimResponse>(
+      `/v1/review-queue/claim`,
+      { reviewer_id: reviewerId }
+    );
+    return response.data;
+  },
+
+  /**
+   * 특정 검토 항목 할당 (다른 담당자가 검토 중이면 409)
+   * @param reviewQueueId 검토 큐 ID
+   * @param reviewerId 검토 담당자 ID
+   */
+  claim: async (
+    reviewQueueId: string,
+    reviewerId: string
+  ): Promise<ReviewLeaseResponse> => {
+    const response = await apiClient.post<ReviewLeaseResponse>(
+      `/v1/review-queue/${reviewQueueId}/claim`,
+      { reviewer_id: reviewerId }
+    );
+    return response.data;
+  },
+
+  /**
+   * 검토 할당 리스 연장 (만료 전에 주기적으로 호출)
+   * @param reviewQueueId 검토 큐 ID
+   * @param reviewerId 검토 담당자 ID
+   */
+  renewLease: async (
+    reviewQueueId: string,
+    reviewerId: string
+  ): Promise<ReviewLeaseResponse> => {
+    const response = await apiClient.post<ReviewLeaseResponse>(
+      `/v1/review-queue/${reviewQueueId}/lease/renew`,
+      { reviewer_id: reviewerId }
+    );
+    return response.data;
+  },
+
+  /**
+   * 검토 할당 반환 (대기열로 되돌림)
+   * @param reviewQueueId 검토 큐 ID
+   * @param reviewerId 검토 담당자 ID
+   */
+  release: async (reviewQueueId: string, reviewerId: string): Promise<void> => {
+    await apiClient.post(`/v1/review-queue/${reviewQueueId}/release`, {
+      reviewer_id: reviewerId,
+    });
+  },
 };
 
 /**
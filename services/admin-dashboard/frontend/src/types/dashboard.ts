@@ -58,14 +58,25 @@ export interface RecentAlert {
 export interface DashboardStats {
   time_range: string;
   generated_at: string;
+  stats_source?: "rollup" | "database";
   transaction_summary: TransactionSummary;
   risk_distribution: RiskDistribution;
   review_queue_summary: ReviewQueueSummary;
   avg_evaluation_time_ms: number;
+  evaluation_time_histogram?: Record<string, number> | null;
   performance_status: "good" | "degraded";
   recent_alerts: RecentAlert[];
 }
 
+// 실시간 푸시(SSE) 토픽
+export type DashboardStreamTopic = "stats" | "review_queue";
+
+// 실시간 푸시 이벤트 데이터
+export interface DashboardStreamMessage<T> {
+  data: T;
+  sent_at: string;
+}
+
 // 거래 정보
 export interface Transaction {
   id: string;
@@ -121,6 +132,7 @@ export interface ReviewQueueListResponse {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
 
 // 사용자 이력 요약
@@ -178,3 +190,16 @@ export interface ReviewDecisionResponse {
   transaction_status: EvaluationStatus;
   message: string;
 }
+
+// 다음 검토 항목 할당 응답 (대기 항목이 없으면 모두 null)
+export interface ReviewClaimResponse {
+  review_queue_id: string | null;
+  item: ReviewQueueItem | null;
+  lease_expires_at: string | null;
+}
+
+// 검토 할당 리스 연장 응답
+export interface ReviewLeaseResponse {
+  review_queue_id: string;
+  lease_expires_at: string;
+}
@@ -0,0 +1,29 @@
+"""add users token_version
+
+Revision ID: c4a8e2f1d7b3
+Revises: 9b7e4d91c68c
+Create Date: 2026-10-18 09:30:12.418203+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e2f1d7b3'
+down_revision: Union[str, None] = '9b7e4d91c68c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    # Users 테이블에 token_version 컬럼 추가 (JWT "tv" 클레임과 비교)
+    op.add_column('users', sa.Column('token_version', sa.Integer, nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """마이그레이션 되돌리기 (다운그레이드)"""
+    op.drop_column('users', 'token_version')
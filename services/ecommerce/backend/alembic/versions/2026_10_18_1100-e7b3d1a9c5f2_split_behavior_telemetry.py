@@ -0,0 +1,100 @@
+"""split behavior telemetry from behavior_patterns
+
+Revision ID: e7b3d1a9c5f2
+Revises: c4a8e2f1d7b3
+Create Date: 2026-10-18 11:00:27.904113+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d1a9c5f2'
+down_revision: Union[str, None] = 'c4a8e2f1d7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_array_length(column: str) -> str:
+    return (
+        f"CASE WHEN jsonb_typeof({column}) = 'array' "
+        f"THEN jsonb_array_length({column}) ELSE 0 END"
+    )
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    # 1. behavior_patterns: 세션 요약 통계 컬럼 추가 (hot 테이블)
+    op.add_column('behavior_patterns', sa.Column('mouse_event_count', sa.Integer(), nullable=False, server_default='0', comment='마우스 이벤트 수'))
+    op.add_column('behavior_patterns', sa.Column('keyboard_event_count', sa.Integer(), nullable=False, server_default='0', comment='키보드 이벤트 수'))
+    op.add_column('behavior_patterns', sa.Column('clickstream_event_count', sa.Integer(), nullable=False, server_default='0', comment='클릭스트림 이벤트 수'))
+    op.add_column('behavior_patterns', sa.Column('analysis_summary', postgresql.JSON(astext_type=sa.Text()), nullable=True, comment='분석 요약 {mouse_analysis, keyboard_analysis, clickstream_analysis, risk_factors}'))
+
+    op.execute(
+        "UPDATE behavior_patterns SET "
+        f"mouse_event_count = {_json_array_length('mouse_movements')}, "
+        f"keyboard_event_count = {_json_array_length('keyboard_events')}, "
+        f"clickstream_event_count = {_json_array_length('clickstream')}"
+    )
+
+    # 비로그인 세션도 저장
+    op.alter_column('behavior_patterns', 'user_id', existing_type=postgresql.UUID(as_uuid=True), nullable=True, comment='사용자 ID (로그인 시)')
+
+    # 2. behavior_telemetry: 원본 이벤트 압축 blob (cold 테이블, FDS telemetry_codec 형식)
+    op.create_table(
+        'behavior_telemetry',
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='세션 ID'),
+        sa.Column('codec_version', sa.SmallInteger(), nullable=False, server_default='1', comment='코덱 버전'),
+        sa.Column('mouse_blob', sa.LargeBinary(), nullable=True, comment='마우스 움직임 [{timestamp, x, y, speed, acceleration, curvature}]'),
+        sa.Column('keyboard_blob', sa.LargeBinary(), nullable=True, comment='키보드 이벤트 [{timestamp, key, duration}]'),
+        sa.Column('clickstream_blob', sa.LargeBinary(), nullable=True, comment='클릭스트림 [{page, timestamp, duration}]'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now(), comment='생성 일시'),
+        sa.ForeignKeyConstraint(['session_id'], ['behavior_patterns.session_id'], name='fk_behavior_telemetry_session', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('session_id', name='pk_behavior_telemetry')
+    )
+    op.create_index('idx_behavior_telemetry_created_at', 'behavior_telemetry', ['created_at'])
+
+    # 3. 기존 JSON 원본 이벤트는 코덱으로 변환하지 않고 보관 테이블로 이동 후 컬럼 삭제
+    op.execute(
+        "CREATE TABLE behavior_patterns_legacy_events AS "
+        "SELECT session_id, mouse_movements, keyboard_events, clickstream, created_at "
+        "FROM behavior_patterns "
+        "WHERE mouse_movements IS NOT NULL OR keyboard_events IS NOT NULL OR clickstream IS NOT NULL"
+    )
+    op.drop_column('behavior_patterns', 'mouse_movements')
+    op.drop_column('behavior_patterns', 'keyboard_events')
+    op.drop_column('behavior_patterns', 'clickstream')
+
+
+def downgrade() -> None:
+    """마이그레이션 되돌리기 (다운그레이드)"""
+    op.add_column('behavior_patterns', sa.Column('mouse_movements', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='마우스 움직임 데이터'))
+    op.add_column('behavior_patterns', sa.Column('keyboard_events', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='키보드 이벤트'))
+    op.add_column('behavior_patterns', sa.Column('clickstream', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='클릭스트림'))
+
+    # 보관해 둔 기존 원본 이벤트 복원 (업그레이드 이후 세션은 압축 blob 만 있음)
+    op.execute(
+        "UPDATE behavior_patterns bp SET "
+        "mouse_movements = legacy.mouse_movements, "
+        "keyboard_events = legacy.keyboard_events, "
+        "clickstream = legacy.clickstream "
+        "FROM behavior_patterns_legacy_events legacy "
+        "WHERE legacy.session_id = bp.session_id"
+    )
+    op.drop_table('behavior_patterns_legacy_events')
+
+    op.drop_index('idx_behavior_telemetry_created_at', 'behavior_telemetry')
+    op.drop_table('behavior_telemetry')
+
+    # 사용자 ID 없는 세션은 이전 스키마(NOT NULL)에 넣을 수 없음
+    op.execute("DELETE FROM behavior_patterns WHERE user_id IS NULL")
+    op.alter_column('behavior_patterns', 'user_id', existing_type=postgresql.UUID(as_uuid=True), nullable=False, comment='사용자 ID')
+
+    op.drop_column('behavior_patterns', 'analysis_summary')
+    op.drop_column('behavior_patterns', 'clickstream_event_count')
+    op.drop_column('behavior_patterns', 'keyboard_event_count')
+    op.drop_column('behavior_patterns', 'mouse_event_count')
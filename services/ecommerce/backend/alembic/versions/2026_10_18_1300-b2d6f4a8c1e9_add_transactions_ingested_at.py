@@ -0,0 +1,38 @@
+"""add transactions ingested_at
+
+Revision ID: b2d6f4a8c1e9
+Revises: e7b3d1a9c5f2
+Create Date: 2026-10-18 13:00:41.527309+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6f4a8c1e9'
+down_revision: Union[str, None] = 'e7b3d1a9c5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    # Transactions 테이블에 DB 기록 시각 추가 (ML 스트리밍 드리프트 수집 워터마크)
+    # 파티션 전환 (scripts/partition_transactions.py) 전에 적용해야 기존 테이블과
+    # 새 부모 테이블의 컬럼이 일치함
+    op.add_column('transactions', sa.Column('ingested_at', sa.DateTime(), nullable=True, comment='DB 기록 일시 (증분 수집 워터마크)'))
+
+    # 기존 행은 created_at 으로 채움 (기존 워터마크가 created_at 기준이었으므로 이어서 수집)
+    op.execute("UPDATE transactions SET ingested_at = created_at")
+    op.alter_column('transactions', 'ingested_at', nullable=False, server_default=sa.text('now()'))
+
+    op.create_index('ix_transactions_ingested_at_id', 'transactions', ['ingested_at', 'id'])
+
+
+def downgrade() -> None:
+    """마이그레이션 되돌리기 (다운그레이드)"""
+    op.drop_index('ix_transactions_ingested_at_id', table_name='transactions')
+    op.drop_column('transactions', 'ingested_at')
@@ -15,6 +15,7 @@ from src.models.user import User, UserRole, UserStatus
 from src.models.base import get_db
 from src.middleware.authorization import require_permission, Permission
 from src.utils.exceptions import ResourceNotFoundError, ValidationError
+from src.utils.principal_cache import get_principal_cache
 
 
 router = APIRouter(prefix="/v1/admin/users", tags=["Admin - Users"])
@@ -349,6 +350,10 @@ async def update_user_status(
     await db.commit()
     await db.refresh(user)
 
+    # 인증 캐시 무효화 (정지/삭제된 계정의 기존 토큰 즉시 차단)
+    principal_cache = await get_principal_cache()
+    await principal_cache.invalidate(user.id)
+
     return UserStatusUpdateResponse(
         id=str(user.id),
         email=user.email,
@@ -5,7 +5,7 @@
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -162,9 +162,11 @@ async def create_order(
 
 @router.get("", response_model=List[OrderResponse])
 async def get_orders(
+    response: Response,
     status_filter: Optional[str] = Query(None, description="주문 상태 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (X-Next-Cursor)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),  # JWT 인증
 ):
@@ -172,6 +174,7 @@ async def get_orders(
     주문 목록 조회
 
     현재 사용자의 주문 목록을 조회합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
     user_id = str(current_user.id)
 
@@ -190,9 +193,16 @@ async def get_orders(
                 )
 
         offset = (page - 1) * page_size
-        orders = await order_service.get_user_orders(
-            user_id=user_id, status=status_enum, limit=page_size, offset=offset
+        result_page = await order_service.get_user_orders(
+            user_id=user_id,
+            status=status_enum,
+            limit=page_size,
+            offset=offset,
+            cursor=cursor,
         )
+        orders = result_page.items
+        if result_page.next_cursor:
+            response.headers["X-Next-Cursor"] = result_page.next_cursor
 
         return [
             OrderResponse(
@@ -209,6 +219,8 @@ async def get_orders(
             for order in orders
         ]
 
+    except (HTTPException, ValidationError):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
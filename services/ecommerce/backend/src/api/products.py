@@ -12,7 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.base import get_db
 from src.models.product import ProductStatus
 from src.services.product_service import ProductService
+from src.services.product_service_cached import CachedProductService
 from src.utils.exceptions import ResourceNotFoundError
+from src.utils.pagination import InvalidCursorError
 
 
 router = APIRouter(prefix="/v1/products", tags=["상품"])
@@ -60,6 +62,7 @@ class ProductListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 # API 엔드포인트
@@ -71,21 +74,26 @@ async def get_products(
     search: Optional[str] = Query(None, description="검색어 (상품명 또는 설명)"),
     min_price: Optional[float] = Query(None, ge=0, description="최소 가격"),
     max_price: Optional[float] = Query(None, ge=0, description="최대 가격"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor 가 없을 때만 사용)"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     상품 목록 조회
 
     필터링 및 페이지네이션을 지원하는 상품 목록 API입니다.
+    next_cursor 로 다음 페이지를 요청하면 Keyset(created_at, id) 조건으로
+    조회하므로 깊은 페이지도 첫 페이지와 비용이 같습니다.
+    total_count 는 공유 CountCache 값(근사값)입니다.
     """
     try:
-        product_service = ProductService(db)
+        # 재고/가격이 자주 바뀌므로 목록 결과 자체는 캐싱하지 않음 (Redis 없이 생성)
+        product_service = CachedProductService(db)
 
         offset = (page - 1) * page_size
 
-        products, total_count = await product_service.get_product_list(
+        products, total_count, next_cursor = await product_service.get_product_list(
             category=category,
             search_query=search,
             min_price=min_price,
@@ -93,6 +101,7 @@ async def get_products(
             status=ProductStatus.AVAILABLE,
             limit=page_size,
             offset=offset,
+            cursor=cursor,
         )
 
         return ProductListResponse(
@@ -100,8 +109,11 @@ async def get_products(
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
         )
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
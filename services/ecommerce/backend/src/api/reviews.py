@@ -36,13 +36,14 @@ async def get_product_reviews(
     ),
     rating: Optional[int] = Query(None, ge=1, le=5, description="별점 필터 (1-5)"),
     has_images: Optional[bool] = Query(None, description="사진 리뷰만 보기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor)"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user),
 ):
     """
     상품 리뷰 목록 조회
 
-    정렬, 필터링, 페이지네이션 지원
+    정렬, 필터링, 페이지네이션 지원 (cursor 사용 시 깊은 페이지도 일정한 비용)
     """
     service = ReviewService(db)
 
@@ -53,6 +54,7 @@ async def get_product_reviews(
         sort=sort,
         rating_filter=rating,
         has_images=has_images,
+        cursor=cursor,
     )
 
     # 현재 사용자가 각 리뷰에 투표했는지 확인
@@ -78,6 +78,7 @@ class ReviewListResponse(BaseModel):
     total_count: int
     page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     average_rating: float
     rating_distribution: Dict[str, int]
 
@@ -13,6 +13,7 @@ from src.models.base import get_db
 from src.services.search_service import SearchService, get_search_service
 from src.models.user import User
 from src.middleware.auth import get_current_user
+from src.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/v1/search", tags=["search"])
 
@@ -31,6 +32,7 @@ class ProductSearchResponse(BaseModel):
     total_count: int
     page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     filters_applied: dict
 
 
@@ -82,6 +84,9 @@ async def search_products(
     ),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page (next_cursor)"
+    ),
     search_service: SearchService = Depends(get_search_service),
 ):
     """
@@ -97,14 +102,16 @@ async def search_products(
     - max_price: Maximum price filter (optional)
     - in_stock: Show only in-stock products (optional)
     - sort: Sort option (popular, price_asc, price_desc, newest, rating)
-    - page: Page number (default: 1)
+    - page: Page number (default: 1, deprecated: use cursor)
     - limit: Items per page (default: 20, max: 100)
+    - cursor: Opaque cursor for the next page (optional)
 
     Returns:
     - products: List of matching products
-    - total_count: Total number of matching products
+    - total_count: Total number of matching products (cached, approximate)
     - page: Current page number
     - total_pages: Total number of pages
+    - next_cursor: Cursor for the next page (null on the last page)
     - filters_applied: Applied filters
     """
     # Validate price range
@@ -115,17 +122,21 @@ async def search_products(
                 detail="min_price cannot be greater than max_price",
             )
 
-    result = await search_service.search_products(
-        query=q,
-        category=category,
-        brand=brand,
-        min_price=min_price,
-        max_price=max_price,
-        in_stock=in_stock,
-        sort=sort,
-        page=page,
-        limit=limit,
-    )
+    try:
+        result = await search_service.search_products(
+            query=q,
+            category=category,
+            brand=brand,
+            min_price=min_price,
+            max_price=max_price,
+            in_stock=in_stock,
+            sort=sort,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return result
 
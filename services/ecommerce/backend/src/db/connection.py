@@ -125,6 +125,16 @@ _ReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
 _use_replica = MASTER_DATABASE_URL != REPLICA_DATABASE_URL
 
 
+def is_replica_configured() -> bool:
+    """
+    Whether a separate read replica is configured and usable
+
+    Returns:
+        bool: False if reads fall back to master
+    """
+    return _use_replica
+
+
 def get_read_engine() -> AsyncEngine:
     """
     Get or create read (replica) database engine
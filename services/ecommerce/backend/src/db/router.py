@@ -0,0 +1,282 @@
+"""
+Read Replica Session Router
+Feature: 002-production-infra
+
+Routes request-scoped sessions from get_db() to the read replica or the master:
+
+- Only safe methods (GET/HEAD) on read-only route prefixes may use the replica
+- Read-your-writes: a user is pinned to the master for a short window after
+  their own successful write (local + Redis, shared across instances)
+- Lag-aware: replica is used only while the last replication lag sample is
+  below the threshold and not stale (unknown lag -> master)
+- Every decision is exported as a Prometheus counter (target, reason)
+
+The decision is made once per request by ReadReplicaRoutingMiddleware and
+carried to get_db() through a context variable.
+"""
+
+import asyncio
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.connection import get_read_session_maker, is_replica_configured
+from src.utils.logging import get_logger
+from src.utils.prometheus_metrics import record_db_routing, record_replica_lag
+
+logger = get_logger(__name__)
+
+DB_TARGET_PRIMARY = "primary"
+DB_TARGET_REPLICA = "replica"
+
+# Read-only API prefixes eligible for replica reads (GET/HEAD only)
+READ_ROUTE_PREFIXES: Tuple[str, ...] = (
+    "/v1/products",  # product list/detail/search, product reviews
+    "/v1/search",
+    "/v1/recommendations",
+    "/v1/admin/dashboard",
+)
+
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+PIN_KEY_PREFIX = "db:pin"
+
+_db_target: ContextVar[str] = ContextVar("db_target", default=DB_TARGET_PRIMARY)
+
+
+def current_db_target() -> str:
+    """Database target chosen for the current request"""
+    return _db_target.get()
+
+
+def set_db_target(target: str):
+    """Set database target for the current context (returns reset token)"""
+    return _db_target.set(target)
+
+
+def reset_db_target(token) -> None:
+    """Restore previous database target"""
+    _db_target.reset(token)
+
+
+def get_replica_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Session factory for replica reads"""
+    return get_read_session_maker()
+
+
+class ReplicaRouter:
+    """
+    Decides master vs replica per request
+
+    Example:
+        ```python
+        router = await get_replica_router()
+        target, reason = await router.choose("GET", "/v1/products", user_id)
+        ```
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        max_lag_seconds: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "1.0")),
+        sticky_seconds: float = float(os.getenv("REPLICA_STICKY_SECONDS", "5.0")),
+        lag_stale_seconds: float = float(
+            os.getenv("REPLICA_LAG_STALE_SECONDS", "30.0")
+        ),
+        replica_enabled: Optional[bool] = None,
+    ):
+        """
+        Args:
+            redis: Async Redis client for cross-instance pins (None: local only)
+            max_lag_seconds: Use master when replica lag exceeds this
+            sticky_seconds: Master pin duration after a user's write
+            lag_stale_seconds: Lag samples older than this count as unknown
+            replica_enabled: Override replica detection (default: from READ_REPLICA_URL)
+        """
+        self.redis = redis
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self.lag_stale_seconds = lag_stale_seconds
+        self.replica_enabled = (
+            is_replica_configured() if replica_enabled is None else replica_enabled
+        )
+
+        self.replica_lag_seconds: Optional[float] = None
+        self._lag_checked_at: Optional[float] = None
+
+        # user_id -> pinned until (monotonic)
+        self._pins: Dict[str, float] = {}
+
+        self.stats: Dict[str, int] = {}
+
+    # --- Replication lag ---
+
+    def update_lag(self, lag_seconds: Optional[float]) -> None:
+        """
+        Record latest replication lag sample
+
+        Args:
+            lag_seconds: Max replay lag in seconds (None: unknown / no replicas)
+        """
+        self.replica_lag_seconds = lag_seconds
+        self._lag_checked_at = time.monotonic()
+        record_replica_lag(lag_seconds)
+
+    def replica_healthy(self) -> Tuple[bool, str]:
+        """Whether replica lag allows reads (healthy, reason)"""
+        if self.replica_lag_seconds is None or self._lag_checked_at is None:
+            return False, "lag_unknown"
+        if time.monotonic() - self._lag_checked_at > self.lag_stale_seconds:
+            return False, "lag_unknown"
+        if self.replica_lag_seconds > self.max_lag_seconds:
+            return False, "replica_lag"
+        return True, "read_only"
+
+    # --- Read-your-writes pins ---
+
+    async def record_write(self, user_id: str) -> None:
+        """
+        Pin user to master after a successful write
+
+        Args:
+            user_id: User ID
+        """
+        self._pins[user_id] = time.monotonic() + self.sticky_seconds
+        self._prune_pins()
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    f"{PIN_KEY_PREFIX}:{user_id}",
+                    "1",
+                    px=int(self.sticky_seconds * 1000),
+                )
+            except Exception as e:
+                logger.warning(f"[ROUTER] Failed to store master pin: {e}")
+
+    async def is_pinned(self, user_id: str) -> bool:
+        """
+        Whether user wrote recently (on any instance)
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            bool: True if reads must go to master
+        """
+        until = self._pins.get(user_id)
+        if until is not None:
+            if time.monotonic() < until:
+                return True
+            del self._pins[user_id]
+
+        if self.redis is not None:
+            try:
+                return bool(await self.redis.exists(f"{PIN_KEY_PREFIX}:{user_id}"))
+            except Exception as e:
+                logger.warning(f"[ROUTER] Failed to read master pin: {e}")
+                # Unknown pin state: stay on master to keep read-your-writes
+                return True
+
+        return False
+
+    # --- Decision ---
+
+    async def choose(
+        self, method: str, path: str, user_id: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Choose database target for a request
+
+        Args:
+            method: HTTP method
+            path: Request path
+            user_id: Authenticated user ID (if any)
+
+        Returns:
+            tuple: (target, reason)
+        """
+        if not self.replica_enabled:
+            return self._decide(DB_TARGET_PRIMARY, "no_replica")
+        if method not in SAFE_METHODS:
+            return self._decide(DB_TARGET_PRIMARY, "write")
+        if not path.startswith(READ_ROUTE_PREFIXES):
+            return self._decide(DB_TARGET_PRIMARY, "not_read_route")
+
+        healthy, reason = self.replica_healthy()
+        if not healthy:
+            return self._decide(DB_TARGET_PRIMARY, reason)
+
+        if user_id is not None and await self.is_pinned(user_id):
+            return self._decide(DB_TARGET_PRIMARY, "read_your_writes")
+
+        return self._decide(DB_TARGET_REPLICA, "read_only")
+
+    def _decide(self, target: str, reason: str) -> Tuple[str, str]:
+        key = f"{target}:{reason}"
+        self.stats[key] = self.stats.get(key, 0) + 1
+        record_db_routing(target, reason)
+        return target, reason
+
+    def _prune_pins(self, max_entries: int = 10000) -> None:
+        if len(self._pins) <= max_entries:
+            return
+        now = time.monotonic()
+        for user_id in [u for u, until in self._pins.items() if until <= now]:
+            del self._pins[user_id]
+
+
+async def run_lag_monitor(router: ReplicaRouter, interval_seconds: float = 5.0) -> None:
+    """
+    Periodically sample replication lag into the router
+
+    Runs until cancelled. Errors mark lag as unknown (reads go to master).
+
+    Args:
+        router: Router to update
+        interval_seconds: Sampling interval
+    """
+    from src.utils.replication_monitor import check_replication_lag
+
+    while True:
+        try:
+            status = await check_replication_lag()
+            router.update_lag(status.get("max_lag_seconds"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[ROUTER] Replication lag check failed: {e}")
+            router.update_lag(None)
+        await asyncio.sleep(interval_seconds)
+
+
+# Global router instance
+_replica_router: Optional[ReplicaRouter] = None
+
+
+async def get_replica_router() -> ReplicaRouter:
+    """
+    Get replica router (singleton)
+
+    Uses Redis for cross-instance pins when available.
+
+    Returns:
+        ReplicaRouter: Router instance
+    """
+    global _replica_router
+
+    if _replica_router is None:
+        redis = None
+        if is_replica_configured():
+            from src.utils.redis_client import get_redis
+
+            try:
+                redis = await get_redis()
+            except Exception as e:
+                logger.warning(f"[ROUTER] Redis unavailable, pins are local only: {e}")
+        _replica_router = ReplicaRouter(redis)
+
+    return _replica_router
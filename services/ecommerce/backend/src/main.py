@@ -4,6 +4,7 @@
 FDS 통합 이커머스 플랫폼의 백엔드 API 서버입니다.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,6 +13,9 @@ import uvicorn
 import os
 
 from src.models.base import close_db
+from src.db.connection import is_replica_configured
+from src.db.router import get_replica_router, run_lag_monitor
+from src.middleware.db_routing import ReadReplicaRoutingMiddleware
 from src.utils.logging import setup_logging, get_logger
 from src.utils.exceptions import (
     AppException,
@@ -58,10 +62,19 @@ async def lifespan(app: FastAPI):
         logger.info("데이터베이스 테이블 초기화...")
         # await init_db()  # 주석 처리: Alembic 사용 권장
 
+    # Read Replica 복제 지연 측정 (Replica 미구성 시 모든 세션은 Master)
+    lag_monitor_task = None
+    if is_replica_configured():
+        lag_monitor_task = asyncio.create_task(
+            run_lag_monitor(await get_replica_router())
+        )
+
     logger.info("✅ 서버 시작 완료")
     yield
 
     logger.info("🛑 이커머스 플랫폼 서버 종료 중...")
+    if lag_monitor_task is not None:
+        lag_monitor_task.cancel()
     await close_db()
     logger.info("✅ 서버 종료 완료")
 
@@ -137,6 +150,10 @@ app.add_middleware(
 )
 
 
+# Read Replica 라우팅 (읽기 전용 엔드포인트 → Replica, 쓰기 직후 사용자는 Master)
+app.add_middleware(ReadReplicaRoutingMiddleware)
+
+
 # 전역 예외 핸들러
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
@@ -5,12 +5,14 @@ FastAPI 의존성 주입을 활용한 JWT 인증 시스템을 제공합니다.
 """
 
 from typing import Optional
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.security import JWTManager
 from src.models.base import get_db
 from src.utils.redis_client import get_rate_limiter
+from src.utils.principal_cache import Principal, get_principal_cache
 
 
 # HTTP Bearer 토큰 스킴 (Authorization: Bearer <token>)
@@ -38,29 +40,22 @@ class AuthorizationError(HTTPException):
         )
 
 
-async def get_current_user_id(
+async def get_access_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> str:
+) -> dict:
     """
-    현재 요청의 사용자 ID 추출
+    Access Token 검증 및 페이로드 반환
 
-    JWT 토큰을 검증하고 사용자 ID를 반환합니다.
+    요청당 한 번만 디코딩되도록 get_current_user_id / get_current_user 가 공유합니다.
 
     Args:
         credentials: HTTP Bearer 토큰
 
     Returns:
-        str: 사용자 ID
+        dict: 토큰 페이로드
 
     Raises:
         AuthenticationError: 토큰이 유효하지 않은 경우
-
-    Example:
-        ```python
-        @app.get("/profile")
-        async def get_profile(user_id: str = Depends(get_current_user_id)):
-            return {"user_id": user_id}
-        ```
     """
     token = credentials.credentials
 
@@ -73,60 +68,86 @@ async def get_current_user_id(
     if not JWTManager.verify_token_type(payload, "access"):
         raise AuthenticationError(detail="잘못된 토큰 타입입니다.")
 
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise AuthenticationError(detail="토큰에서 사용자 정보를 찾을 수 없습니다.")
 
-    return user_id
+    return payload
+
+
+async def get_current_user_id(
+    payload: dict = Depends(get_access_token_payload),
+) -> str:
+    """
+    현재 요청의 사용자 ID 추출
+
+    JWT 토큰을 검증하고 사용자 ID를 반환합니다.
+
+    Args:
+        payload: 검증된 토큰 페이로드
+
+    Returns:
+        str: 사용자 ID
+
+    Raises:
+        AuthenticationError: 토큰이 유효하지 않은 경우
+
+    Example:
+        ```python
+        @app.get("/profile")
+        async def get_profile(user_id: str = Depends(get_current_user_id)):
+            return {"user_id": user_id}
+        ```
+    """
+    return payload["sub"]
 
 
 async def get_current_user(
-    user_id: str = Depends(get_current_user_id),
+    payload: dict = Depends(get_access_token_payload),
     db: AsyncSession = Depends(get_db),
-):
+) -> Principal:
     """
-    현재 요청의 사용자 객체 조회
+    현재 요청의 사용자(Principal) 조회
 
-    JWT 토큰에서 사용자 ID를 추출하고 데이터베이스에서 사용자 정보를 조회합니다.
+    User 전체 행 대신 권한 판정에 필요한 정보(id, role, status, token_version)를
+    PrincipalCache(로컬 TTL + Redis)에서 조회합니다. 캐시 미스일 때만 DB 를 조회합니다.
 
     Args:
-        user_id: 사용자 ID
+        payload: 검증된 토큰 페이로드
         db: 데이터베이스 세션
 
     Returns:
-        User: 사용자 객체
+        Principal: 인증된 사용자
 
     Raises:
-        AuthenticationError: 사용자를 찾을 수 없거나 비활성화된 경우
+        AuthenticationError: 사용자를 찾을 수 없거나 비활성화되었거나 토큰이 폐기된 경우
 
     Example:
         ```python
         @app.get("/profile")
-        async def get_profile(current_user: User = Depends(get_current_user)):
-            return {"email": current_user.email}
+        async def get_profile(current_user: Principal = Depends(get_current_user)):
+            return {"user_id": str(current_user.id), "role": current_user.role}
         ```
     """
-    from sqlalchemy import select
-    from src.models.user import User
-
-    from uuid import UUID
-
     # Convert user_id string to UUID
     try:
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
+        user_uuid = UUID(str(payload["sub"]))
     except ValueError:
         raise AuthenticationError(detail="잘못된 사용자 ID 형식입니다.")
 
-    result = await db.execute(select(User).where(User.id == user_uuid))
-    user = result.scalar_one_or_none()
+    principal_cache = await get_principal_cache()
+    principal = await principal_cache.get(user_uuid, db)
 
-    if user is None:
+    if principal is None:
         raise AuthenticationError(detail="사용자를 찾을 수 없습니다.")
 
-    if user.status != "active":
+    if not principal.is_active:
         raise AuthenticationError(detail="비활성화된 계정입니다.")
 
-    return user
+    # 비밀번호 변경 등으로 token_version 이 올라가면 이전 토큰은 거부
+    if int(payload.get("tv", 0)) < principal.token_version:
+        raise AuthenticationError(detail="만료된 토큰입니다. 다시 로그인해주세요.")
+
+    return principal
 
 
 async def get_current_active_user(
@@ -288,35 +309,36 @@ async def get_current_user_optional(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    선택적 인증 - User 객체 반환
+    선택적 인증 - Principal 반환
 
-    토큰이 있으면 사용자 객체 반환, 없으면 None 반환
+    토큰이 있으면 인증된 사용자 반환, 없으면 None 반환
 
     Args:
         credentials: HTTP Bearer 토큰 (선택)
         db: 데이터베이스 세션
 
     Returns:
-        Optional[User]: 사용자 객체 또는 None
+        Optional[Principal]: 인증된 사용자 또는 None
     """
     if credentials is None:
         return None
 
     try:
-        from sqlalchemy import select
-        from src.models.user import User
-
         payload = JWTManager.decode_token(credentials.credentials)
         user_id = payload.get("sub")
         if user_id is None:
             return None
 
-        # 데이터베이스에서 사용자 조회
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        # Principal 캐시 조회 (캐시 미스 시에만 DB 조회)
+        principal_cache = await get_principal_cache()
+        principal = await principal_cache.get(UUID(str(user_id)), db)
 
-        if user and user.status == "active":
-            return user
+        if (
+            principal
+            and principal.is_active
+            and int(payload.get("tv", 0)) >= principal.token_version
+        ):
+            return principal
 
         return None
 
@@ -0,0 +1,62 @@
+"""
+DB 라우팅 미들웨어
+
+요청마다 한 번 ReplicaRouter 로 Master/Replica 를 결정하고, get_db() 가 읽는
+컨텍스트 변수에 기록합니다. 쓰기 요청이 성공하면 해당 사용자를 짧은 시간 동안
+Master 에 고정합니다 (read-your-writes).
+"""
+
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.db.router import (
+    SAFE_METHODS,
+    get_replica_router,
+    reset_db_target,
+    set_db_target,
+)
+from src.utils.security import JWTManager
+
+
+def _get_user_id(request: Request) -> Optional[str]:
+    """Bearer 토큰의 사용자 ID (검증 실패 시 None)"""
+    authorization = request.headers.get("authorization", "")
+    if not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        return JWTManager.decode_token(authorization[7:]).get("sub")
+    except Exception:
+        return None
+
+
+class ReadReplicaRoutingMiddleware(BaseHTTPMiddleware):
+    """
+    읽기 전용 엔드포인트를 Read Replica 로 라우팅하는 미들웨어
+
+    - GET/HEAD + READ_ROUTE_PREFIXES: 복제 지연이 임계값 이내이고 사용자가
+      최근 쓰기를 하지 않았으면 Replica
+    - 그 외: Master
+    - 쓰기 요청 성공 (상태 코드 < 400): 사용자 Master 고정
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        router = await get_replica_router()
+        user_id = _get_user_id(request) if router.replica_enabled else None
+
+        target, _ = await router.choose(request.method, request.url.path, user_id)
+        token = set_db_target(target)
+        try:
+            response = await call_next(request)
+        finally:
+            reset_db_target(token)
+
+        if (
+            request.method not in SAFE_METHODS
+            and user_id is not None
+            and response.status_code < 400
+        ):
+            await router.record_write(user_id)
+
+        return response
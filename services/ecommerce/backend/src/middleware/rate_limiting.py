@@ -6,8 +6,10 @@ Rate Limiting 미들웨어 (FastAPI 레벨)
 - IP 기반 제한: 동일 IP에서 일정 시간 내 요청 횟수 제한
 - 사용자 기반 제한: 인증된 사용자별 요청 제한
 - 엔드포인트별 제한: 민감한 API는 더 엄격한 제한 적용
+- 미들웨어/데코레이터는 GCRA (src.utils.rate_limiter, 키당 O(1) 메모리) 사용
 """
 
+import math
 import time
 import logging
 from typing import Dict, Callable
@@ -18,11 +20,47 @@ from starlette.middleware.base import RequestResponseEndpoint
 from collections import defaultdict
 from datetime import datetime
 
+from src.utils.rate_limiter import GCRARateLimiter, RateLimitPolicy
+
 logger = logging.getLogger(__name__)
 
 
+class RateLimitConfig:
+    """Rate Limiting 설정"""
+
+    # 기본 Rate Limit 설정 (IP 기반)
+    DEFAULT_LIMIT = RateLimitPolicy(limit=100, window_seconds=60)  # 100회/1분
+
+    # 엔드포인트별 Rate Limit 설정
+    # 인증 엔드포인트는 burst 를 작게 두어 한도를 한 번에 소진하는 대입 공격 차단
+    ENDPOINT_LIMITS = {
+        "/v1/auth/register": RateLimitPolicy(
+            limit=5, window_seconds=3600, burst=2
+        ),  # 5회/1시간, 연속 2회
+        "/v1/auth/login": RateLimitPolicy(
+            limit=10, window_seconds=900, burst=3
+        ),  # 10회/15분, 연속 3회
+        "/v1/auth/request-otp": RateLimitPolicy(
+            limit=3, window_seconds=300, burst=1
+        ),  # 3회/5분, 연속 1회
+        "/v1/orders": RateLimitPolicy(limit=30, window_seconds=60),  # 30회/1분
+    }
+
+    # Rate Limit 제외 경로 (Health Check 등)
+    EXCLUDED_PATHS = ["/health", "/metrics", "/docs", "/openapi.json"]
+
+    @classmethod
+    def policy_for(cls, path: str) -> RateLimitPolicy:
+        """경로에 적용할 정책"""
+        return cls.ENDPOINT_LIMITS.get(path, cls.DEFAULT_LIMIT)
+
+
 class RateLimiter:
-    """Rate Limiting 로직 (Redis 또는 인메모리)"""
+    """
+    Rate Limiting 로직 (Redis 또는 인메모리, 동기 Sliding Window)
+
+    비동기 경로(미들웨어, 데코레이터)는 GCRARateLimiter 를 사용합니다.
+    """
 
     def __init__(self, redis_client=None):
         """
@@ -134,79 +172,53 @@ class RateLimiter:
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI Rate Limiting 미들웨어"""
-
-    # 기본 Rate Limit 설정 (IP 기반)
-    DEFAULT_RATE_LIMIT = {
-        "max_requests": 100,  # 100 요청
-        "window_seconds": 60,  # 1분
-    }
-
-    # 엔드포인트별 Rate Limit 설정
-    ENDPOINT_RATE_LIMITS = {
-        "/v1/auth/register": {"max_requests": 5, "window_seconds": 3600},  # 5회/1시간
-        "/v1/auth/login": {"max_requests": 10, "window_seconds": 900},  # 10회/15분
-        "/v1/auth/request-otp": {"max_requests": 3, "window_seconds": 300},  # 3회/5분
-        "/v1/orders": {"max_requests": 30, "window_seconds": 60},  # 30회/1분
-    }
+    """FastAPI Rate Limiting 미들웨어 (GCRA)"""
 
     def __init__(self, app, redis_client=None):
         super().__init__(app)
-        self.limiter = RateLimiter(redis_client)
+        self.limiter = GCRARateLimiter(redis_client)
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
         """모든 요청에 대해 Rate Limiting 적용"""
-        # Rate Limit 제외 경로 (Health Check 등)
-        excluded_paths = ["/health", "/metrics", "/docs", "/openapi.json"]
-        if request.url.path in excluded_paths:
+        if request.url.path in RateLimitConfig.EXCLUDED_PATHS:
             return await call_next(request)
 
         # 클라이언트 IP 추출
-        client_ip = request.client.host
-
-        # X-Forwarded-For 헤더 확인 (프록시 뒤에 있을 경우)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
+        client_ip = _get_client_ip(request)
 
         # 엔드포인트별 Rate Limit 설정 가져오기
         path = request.url.path
-        rate_limit_config = self.ENDPOINT_RATE_LIMITS.get(path, self.DEFAULT_RATE_LIMIT)
-
-        # Rate Limit 키 생성
-        rate_limit_key = f"ip:{client_ip}:{path}"
+        policy = RateLimitConfig.policy_for(path)
 
         # Rate Limit 확인
-        result = self.limiter.check_rate_limit(
-            key=rate_limit_key,
-            max_requests=rate_limit_config["max_requests"],
-            window_seconds=rate_limit_config["window_seconds"],
-        )
+        result = await self.limiter.check(f"ip:{client_ip}:{path}", policy)
+        retry_after = math.ceil(result.retry_after)
+        reset_at = datetime.fromtimestamp(time.time() + result.reset_after)
 
         # 응답 헤더 추가
         headers = {
-            "X-RateLimit-Limit": str(rate_limit_config["max_requests"]),
-            "X-RateLimit-Remaining": str(result["requests_remaining"]),
-            "X-RateLimit-Reset": result["reset_at"].isoformat(),
+            "X-RateLimit-Limit": str(policy.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": reset_at.isoformat(),
         }
 
         # Rate Limit 초과 시
-        if not result["allowed"]:
+        if not result.allowed:
             logger.warning(
                 f"Rate limit exceeded for IP {client_ip} on {path}. "
-                f"Requests: {result['requests_made']}/{rate_limit_config['max_requests']}"
+                f"Limit: {policy.limit}/{policy.window_seconds}s"
             )
 
-            headers["Retry-After"] = str(result["retry_after"])
+            headers["Retry-After"] = str(retry_after)
 
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Too Many Requests",
                     "message": f"Rate limit exceeded. "
-                    f"Max {rate_limit_config['max_requests']} requests "
-                    f"per {rate_limit_config['window_seconds']} seconds.",
-                    "retry_after": result["retry_after"],
+                    f"Max {policy.limit} requests "
+                    f"per {policy.window_seconds} seconds.",
+                    "retry_after": retry_after,
                 },
                 headers=headers,
             )
@@ -221,6 +233,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def _get_client_ip(request: Request) -> str:
+    """클라이언트 IP (프록시 뒤에 있으면 X-Forwarded-For 의 첫 번째 IP)"""
+    forwarded_for = request.headers.get("X-Forwarded-For")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    return request.client.host
+
+
 # 데코레이터 방식 Rate Limiting (특정 엔드포인트에만 적용)
 def rate_limit(max_requests: int, window_seconds: int, redis_client=None):
     """
@@ -232,36 +252,27 @@ def rate_limit(max_requests: int, window_seconds: int, redis_client=None):
         async def get_data(request: Request):
             return {"data": "..."}
     """
-    limiter = RateLimiter(redis_client)
+    limiter = GCRARateLimiter(redis_client)
+    policy = RateLimitPolicy(limit=max_requests, window_seconds=window_seconds)
 
     def decorator(func: Callable):
         async def wrapper(request: Request, *args, **kwargs):
-            client_ip = request.client.host
-
-            # X-Forwarded-For 헤더 확인
-            forwarded_for = request.headers.get("X-Forwarded-For")
-            if forwarded_for:
-                client_ip = forwarded_for.split(",")[0].strip()
-
             # Rate Limit 키 생성
-            rate_limit_key = f"ip:{client_ip}:{request.url.path}"
+            rate_limit_key = f"ip:{_get_client_ip(request)}:{request.url.path}"
 
             # Rate Limit 확인
-            result = limiter.check_rate_limit(
-                key=rate_limit_key,
-                max_requests=max_requests,
-                window_seconds=window_seconds,
-            )
+            result = await limiter.check(rate_limit_key, policy)
 
             # Rate Limit 초과 시
-            if not result["allowed"]:
+            if not result.allowed:
+                retry_after = math.ceil(result.retry_after)
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail={
                         "error": "Too Many Requests",
-                        "retry_after": result["retry_after"],
+                        "retry_after": retry_after,
                     },
-                    headers={"Retry-After": str(result["retry_after"])},
+                    headers={"Retry-After": str(retry_after)},
                 )
 
             # 정상 요청 처리
@@ -4,16 +4,34 @@ Feature: 002-production-infra
 Task: T032
 
 Provides session management using Redis Cluster for high availability.
+
+Sessions are stored as Redis hashes (one field per data key) so updates only
+write the fields that changed. Decoded sessions are cached in-process for a
+short TTL and expiry is refreshed lazily (throttled sliding expiration), so a
+typical request costs zero Redis round trips. Per-user sorted-set indexes
+(member: session ID, score: expiry timestamp) back session counting and
+cleanup instead of keyspace scans.
 """
 
 import json
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
-from redis.cluster import RedisCluster
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from redis import asyncio as aioredis
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 
+# Hash field layout: fixed metadata fields + one "d:<key>" field per data key
+DATA_FIELD_PREFIX = "d:"
+META_FIELDS = ("user_id", "created_at", "last_accessed_at")
+
+
+def _text(value: Any) -> str:
+    """Decode bytes returned by clients without decode_responses"""
+    return value.decode() if isinstance(value, bytes) else value
+
 
 class SessionStore:
     """
@@ -25,23 +43,111 @@ class SessionStore:
     - Redis Cluster \ud328\uc77c\uc624\ubc84 \uc9c0\uc6d0
     """
 
-    def __init__(self, redis_client: RedisCluster, ttl_minutes: int = 30):
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        ttl_minutes: int = 30,
+        local_ttl_seconds: float = 5.0,
+        touch_interval_seconds: int = 60,
+        local_max_entries: int = 10000,
+    ):
         """
         Initialize SessionStore
 
         Args:
-            redis_client: Redis Cluster client
+            redis_client: Async Redis (or Redis Cluster) client
             ttl_minutes: Session TTL in minutes (default: 30)
+            local_ttl_seconds: How long decoded sessions are served from the
+                in-process cache. Deletes made by other instances become
+                visible here after at most this long. 0 disables the cache.
+            touch_interval_seconds: Minimum time between expiry refreshes of
+                the same session (sliding expiration throttle)
+            local_max_entries: Maximum number of locally cached sessions (LRU)
         """
         self.redis = redis_client
         self.ttl_seconds = ttl_minutes * 60
         self.prefix = "session"
+        self.local_ttl_seconds = local_ttl_seconds
+        self.touch_interval_seconds = touch_interval_seconds
+        self.local_max_entries = local_max_entries
+
+        # session_id -> (local cache expiry (monotonic), session)
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        self.stats = {"local_hits": 0, "redis_reads": 0, "touches": 0}
 
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for session"""
         return f"{self.prefix}:{session_id}"
 
-    def create_session(
+    def _get_user_index_key(self, user_id: str) -> str:
+        """Generate Redis key for a user's session index (sorted set)"""
+        return f"{self.prefix}:user:{user_id}"
+
+    def _get_users_key(self) -> str:
+        """Generate Redis key for the set of users that have sessions"""
+        return f"{self.prefix}:users"
+
+    # --- Encoding ---
+
+    @staticmethod
+    def _encode(session: Dict[str, Any]) -> Dict[str, str]:
+        mapping = {field: session[field] for field in META_FIELDS}
+        for key, value in session["data"].items():
+            mapping[f"{DATA_FIELD_PREFIX}{key}"] = json.dumps(value)
+        return mapping
+
+    @staticmethod
+    def _decode(session_id: str, raw: Dict[Any, Any]) -> Optional[Dict[str, Any]]:
+        fields = {_text(k): _text(v) for k, v in raw.items()}
+        if "user_id" not in fields:
+            return None
+
+        data = {
+            key[len(DATA_FIELD_PREFIX) :]: json.loads(value)
+            for key, value in fields.items()
+            if key.startswith(DATA_FIELD_PREFIX)
+        }
+        return {
+            "session_id": session_id,
+            "user_id": fields["user_id"],
+            "created_at": fields.get("created_at"),
+            "last_accessed_at": fields.get("last_accessed_at"),
+            "data": data,
+        }
+
+    @staticmethod
+    def _copy(session: Dict[str, Any]) -> Dict[str, Any]:
+        """Callers get their own copy so local cache entries stay unchanged"""
+        return {**session, "data": dict(session["data"])}
+
+    # --- Local cache ---
+
+    def _cache_get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._local.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._local[session_id]
+            return None
+        self._local.move_to_end(session_id)
+        return entry[1]
+
+    def _cache_put(self, session: Dict[str, Any]) -> None:
+        if self.local_ttl_seconds <= 0:
+            return
+        session_id = session["session_id"]
+        self._local[session_id] = (time.monotonic() + self.local_ttl_seconds, session)
+        self._local.move_to_end(session_id)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+    def _cache_drop(self, session_id: str) -> None:
+        self._local.pop(session_id, None)
+
+    # --- Session API ---
+
+    async def create_session(
         self, user_id: str, data: Optional[Dict[str, Any]] = None
     ) -> str:
         """
@@ -55,47 +161,81 @@ class SessionStore:
             str: Session ID
         """
         session_id = str(uuid.uuid4())
-        session_data = {
+        now = datetime.utcnow().isoformat()
+        session = {
             "session_id": session_id,
-            "user_id": user_id,
-            "created_at": datetime.utcnow().isoformat(),
-            "last_accessed_at": datetime.utcnow().isoformat(),
-            "data": data or {},
+            "user_id": str(user_id),
+            "created_at": now,
+            "last_accessed_at": now,
+            "data": dict(data or {}),
         }
 
         key = self._get_key(session_id)
-        self.redis.setex(key, self.ttl_seconds, json.dumps(session_data))
-
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=self._encode(session))
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(
+                self._get_user_index_key(session["user_id"]),
+                {session_id: time.time() + self.ttl_seconds},
+            )
+            pipe.sadd(self._get_users_key(), session["user_id"])
+            await pipe.execute()
+
+        self._cache_put(session)
         return session_id
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get session data
 
+        Served from the local cache when possible. The Redis expiry is only
+        refreshed once per touch interval rather than on every access.
+
         Args:
             session_id: Session ID
 
         Returns:
             dict: Session data or None if not found
         """
-        key = self._get_key(session_id)
-        data = self.redis.get(key)
-
-        if not data:
-            return None
-
-        session = json.loads(data)
-
-        # Update last accessed time
-        session["last_accessed_at"] = datetime.utcnow().isoformat()
-        self.redis.setex(key, self.ttl_seconds, json.dumps(session))
-
-        return session
-
-    def update_session(self, session_id: str, data: Dict[str, Any]) -> bool:
+        session = self._cache_get(session_id)
+        if session is not None:
+            self.stats["local_hits"] += 1
+        else:
+            self.stats["redis_reads"] += 1
+            raw = await self.redis.hgetall(self._get_key(session_id))
+            session = self._decode(session_id, raw) if raw else None
+            if session is None:
+                return None
+            self._cache_put(session)
+
+        await self._touch(session)
+        return self._copy(session)
+
+    async def _touch(self, session: Dict[str, Any]) -> None:
+        """Throttled sliding expiration"""
+        now = datetime.utcnow()
+        last_accessed = datetime.fromisoformat(session["last_accessed_at"])
+        if (now - last_accessed).total_seconds() < self.touch_interval_seconds:
+            return
+
+        session["last_accessed_at"] = now.isoformat()
+        key = self._get_key(session["session_id"])
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, "last_accessed_at", session["last_accessed_at"])
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(
+                self._get_user_index_key(session["user_id"]),
+                {session["session_id"]: time.time() + self.ttl_seconds},
+            )
+            await pipe.execute()
+        self.stats["touches"] += 1
+
+    async def update_session(self, session_id: str, data: Dict[str, Any]) -> bool:
         """
         Update session data
 
+        Only data fields whose value changed are written.
+
         Args:
             session_id: Session ID
             data: Data to update
@@ -103,21 +243,42 @@ class SessionStore:
         Returns:
             bool: True if updated, False if not found
         """
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
 
         if not session:
             return False
 
-        # Merge new data
-        session["data"].update(data)
+        changed = {
+            key: value
+            for key, value in data.items()
+            if key not in session["data"] or session["data"][key] != value
+        }
+        if not changed:
+            return True
+
+        session["data"].update(changed)
         session["last_accessed_at"] = datetime.utcnow().isoformat()
 
-        key = self._get_key(session_id)
-        self.redis.setex(key, self.ttl_seconds, json.dumps(session))
+        mapping = {
+            f"{DATA_FIELD_PREFIX}{key}": json.dumps(value)
+            for key, value in changed.items()
+        }
+        mapping["last_accessed_at"] = session["last_accessed_at"]
 
+        key = self._get_key(session_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(
+                self._get_user_index_key(session["user_id"]),
+                {session_id: time.time() + self.ttl_seconds},
+            )
+            await pipe.execute()
+
+        self._cache_put(session)
         return True
 
-    def delete_session(self, session_id: str) -> bool:
+    async def delete_session(self, session_id: str) -> bool:
         """
         Delete session
 
@@ -128,10 +289,24 @@ class SessionStore:
             bool: True if deleted, False if not found
         """
         key = self._get_key(session_id)
-        result = self.redis.delete(key)
-        return result > 0
+        cached = self._cache_get(session_id)
+        user_id = (
+            cached["user_id"]
+            if cached
+            else _text(await self.redis.hget(key, "user_id"))
+        )
+        self._cache_drop(session_id)
+
+        if not user_id:
+            return False
 
-    def extend_session(
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.zrem(self._get_user_index_key(user_id), session_id)
+            deleted, _ = await pipe.execute()
+        return deleted > 0
+
+    async def extend_session(
         self, session_id: str, ttl_minutes: Optional[int] = None
     ) -> bool:
         """
@@ -145,16 +320,27 @@ class SessionStore:
             bool: True if extended, False if not found
         """
         key = self._get_key(session_id)
+        ttl_seconds = (ttl_minutes * 60) if ttl_minutes else self.ttl_seconds
 
-        if not self.redis.exists(key):
+        if not await self.redis.expire(key, ttl_seconds):
+            self._cache_drop(session_id)
             return False
 
-        ttl_seconds = (ttl_minutes * 60) if ttl_minutes else self.ttl_seconds
-        self.redis.expire(key, ttl_seconds)
+        session = self._cache_get(session_id)
+        user_id = (
+            session["user_id"]
+            if session
+            else _text(await self.redis.hget(key, "user_id"))
+        )
+        if user_id:
+            await self.redis.zadd(
+                self._get_user_index_key(user_id),
+                {session_id: time.time() + ttl_seconds},
+            )
 
         return True
 
-    def get_active_sessions_count(self, user_id: Optional[str] = None) -> int:
+    async def get_active_sessions_count(self, user_id: Optional[str] = None) -> int:
         """
         Get count of active sessions
 
@@ -164,35 +350,54 @@ class SessionStore:
         Returns:
             int: Number of active sessions
         """
-        # Note: This is an expensive operation in Redis Cluster
-        # For production, consider maintaining a separate index
+        now = time.time()
         if user_id:
-            # Scan all sessions and filter by user_id
-            # This is inefficient but works for now
-            count = 0
-            for key in self.redis.scan_iter(match=f"{self.prefix}:*"):
-                data = self.redis.get(key)
-                if data:
-                    session = json.loads(data)
-                    if session.get("user_id") == user_id:
-                        count += 1
-            return count
-        else:
-            # Count all sessions
-            return sum(1 for _ in self.redis.scan_iter(match=f"{self.prefix}:*"))
-
-    def cleanup_expired_sessions(self) -> int:
+            return await self.redis.zcount(
+                self._get_user_index_key(str(user_id)), now, "+inf"
+            )
+
+        user_ids = await self._get_indexed_users()
+        if not user_ids:
+            return 0
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for uid in user_ids:
+                pipe.zcount(self._get_user_index_key(uid), now, "+inf")
+            counts = await pipe.execute()
+        return sum(counts)
+
+    async def cleanup_expired_sessions(self) -> int:
         """
         Cleanup expired sessions (manual cleanup)
 
-        Returns:
-            int: Number of sessions cleaned up
+        Redis TTL expires the session hashes themselves; this prunes expired
+        entries from the per-user indexes and drops users without sessions.
 
-        Note: Redis TTL handles this automatically, this is for manual cleanup
+        Returns:
+            int: Number of index entries cleaned up
         """
-        # Redis TTL handles expiration automatically
-        # This method is kept for compatibility
-        return 0
+        now = time.time()
+        user_ids = await self._get_indexed_users()
+        if not user_ids:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for uid in user_ids:
+                index_key = self._get_user_index_key(uid)
+                pipe.zremrangebyscore(index_key, "-inf", now)
+                pipe.zcard(index_key)
+            results = await pipe.execute()
+
+        removed = sum(results[0::2])
+        empty_users = [
+            uid for uid, remaining in zip(user_ids, results[1::2]) if not remaining
+        ]
+        if empty_users:
+            await self.redis.srem(self._get_users_key(), *empty_users)
+
+        return removed
+
+    async def _get_indexed_users(self) -> List[str]:
+        return [_text(uid) for uid in await self.redis.smembers(self._get_users_key())]
 
 
 # --- FastAPI Middleware Integration ---
@@ -205,17 +410,31 @@ class SessionMiddleware(BaseHTTPMiddleware):
     Automatically manages user sessions using Redis Cluster.
     """
 
-    def __init__(self, app, redis_client: RedisCluster, ttl_minutes: int = 30):
+    def __init__(
+        self,
+        app,
+        redis_client: aioredis.Redis,
+        ttl_minutes: int = 30,
+        local_ttl_seconds: float = 5.0,
+        touch_interval_seconds: int = 60,
+    ):
         """
         Initialize SessionMiddleware
 
         Args:
             app: FastAPI application
-            redis_client: Redis Cluster client
+            redis_client: Async Redis (or Redis Cluster) client
             ttl_minutes: Session TTL in minutes
+            local_ttl_seconds: In-process session cache TTL
+            touch_interval_seconds: Minimum interval between expiry refreshes
         """
         super().__init__(app)
-        self.session_store = SessionStore(redis_client, ttl_minutes)
+        self.session_store = SessionStore(
+            redis_client,
+            ttl_minutes,
+            local_ttl_seconds=local_ttl_seconds,
+            touch_interval_seconds=touch_interval_seconds,
+        )
 
     async def dispatch(self, request: Request, call_next: Callable):
         """Process request with session management"""
@@ -226,7 +445,7 @@ class SessionMiddleware(BaseHTTPMiddleware):
 
         if session_id:
             # Get session data
-            session = self.session_store.get_session(session_id)
+            session = await self.session_store.get_session(session_id)
             if session:
                 # Attach session to request state
                 request.state.session = session
@@ -101,9 +101,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         return result.scalars().all()
     ```
 
+    ReadReplicaRoutingMiddleware 가 Replica 로 라우팅한 요청이면 Replica 세션을
+    반환합니다 (session.info["replica"] = True, 커밋하지 않음).
+
     Yields:
         AsyncSession: 비동기 데이터베이스 세션
     """
+    from src.db.router import (
+        DB_TARGET_REPLICA,
+        current_db_target,
+        get_replica_session_maker,
+    )
+
+    if current_db_target() == DB_TARGET_REPLICA:
+        async with get_replica_session_maker()() as session:
+            session.info["replica"] = True
+            try:
+                yield session
+            finally:
+                await session.rollback()
+        return
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -52,6 +52,8 @@ class User(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     last_login_at = Column(DateTime, nullable=True)
     failed_login_attempts = Column(Integer, nullable=False, default=0)
+    # 비밀번호 변경 등으로 기존 토큰을 무효화할 때 증가 (JWT "tv" 클레임과 비교)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     __table_args__ = (
         CheckConstraint(
@@ -117,7 +117,9 @@ class OAuthService:
         )
 
         # 4. JWT 토큰 생성
-        jwt_access_token = create_access_token({"sub": str(user.id)})
+        jwt_access_token = create_access_token(
+            {"sub": str(user.id), "tv": user.token_version or 0}
+        )
         jwt_refresh_token = create_refresh_token({"sub": str(user.id)})
 
         return {
@@ -203,7 +205,9 @@ class OAuthService:
         )
 
         # 4. JWT 토큰 생성
-        jwt_access_token = create_access_token({"sub": str(user.id)})
+        jwt_access_token = create_access_token(
+            {"sub": str(user.id), "tv": user.token_version or 0}
+        )
         jwt_refresh_token = create_refresh_token({"sub": str(user.id)})
 
         return {
@@ -289,7 +293,9 @@ class OAuthService:
         )
 
         # 4. JWT 토큰 생성
-        jwt_access_token = create_access_token({"sub": str(user.id)})
+        jwt_access_token = create_access_token(
+            {"sub": str(user.id), "tv": user.token_version or 0}
+        )
         jwt_refresh_token = create_refresh_token({"sub": str(user.id)})
 
         return {
@@ -4,7 +4,7 @@
 주문 생성, 주문 상태 관리 등 주문 관련 비즈니스 로직
 """
 
-from typing import List, Optional, Dict
+from typing import Optional, Dict
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
@@ -21,6 +21,7 @@ from src.utils.exceptions import (
     BusinessLogicError,
 )
 from src.utils.otp import get_otp_service
+from src.utils.pagination import InvalidCursorError, Keyset, Page, paginate
 from src.utils.redis_client import get_redis
 from src.config import get_settings
 from src.tasks.email import send_order_confirmation_email
@@ -325,30 +326,40 @@ class OrderService:
         status: Optional[OrderStatus] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Order]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """
-        사용자의 주문 목록 조회
+        사용자의 주문 목록 조회 (최신순, 커서 페이지네이션)
 
         Args:
             user_id: 사용자 ID
             status: 주문 상태 필터 (선택)
             limit: 조회 개수
-            offset: 오프셋
+            offset: 오프셋 (커서가 없을 때만 사용)
+            cursor: 이전 페이지의 next_cursor
 
         Returns:
-            List[Order]: 주문 목록
+            Page: 주문 목록(items) 및 다음 페이지 커서(next_cursor)
+
+        Raises:
+            ValidationError: 커서가 잘못된 경우
         """
         query = select(Order).where(Order.user_id == user_id)
 
         if status:
             query = query.where(Order.status == status)
 
-        query = query.order_by(Order.created_at.desc()).limit(limit).offset(offset)
-
-        result = await self.db.execute(query)
-        orders = result.scalars().all()
-
-        return list(orders)
+        keyset = Keyset(
+            (Order.created_at, True),
+            (Order.id, True),
+            scope=f"orders:{status.value if status else ''}",
+        )
+        try:
+            return await paginate(
+                self.db, query, keyset, limit=limit, cursor=cursor, offset=offset
+            )
+        except InvalidCursorError as e:
+            raise ValidationError(str(e))
 
     async def cancel_order(self, user_id: str, order_id: str) -> Order:
         """
@@ -15,6 +15,7 @@ from src.models.product import Product, ProductStatus
 from src.utils.exceptions import ResourceNotFoundError, ValidationError
 from src.utils.cache_manager import CacheManager, CacheKeyBuilder
 from src.utils.query_optimizer import monitor_query
+from src.utils.pagination import Keyset, count_key, get_count_cache, paginate
 
 
 class CachedProductService:
@@ -49,10 +50,14 @@ class CachedProductService:
         limit: int = 20,
         offset: int = 0,
         use_cache: bool = True,
-    ) -> tuple[List[Product], int]:
+        cursor: Optional[str] = None,
+    ) -> tuple[List[Product], int, Optional[str]]:
         """
         상품 목록 조회 (캐싱 지원)
 
+        커서가 있으면 Keyset(created_at, id) 조건으로 조회하므로 깊은 페이지도
+        첫 페이지와 비용이 같습니다. 전체 개수는 CountCache 값(근사값)입니다.
+
         Args:
             category: 카테고리 필터
             search_query: 검색어
@@ -60,11 +65,15 @@ class CachedProductService:
             max_price: 최대 가격
             status: 상품 상태 필터
             limit: 조회 개수
-            offset: 오프셋
+            offset: 오프셋 (커서가 없을 때만 사용)
             use_cache: 캐시 사용 여부
+            cursor: 이전 페이지의 next_cursor
 
         Returns:
-            (products, total_count): 상품 목록 및 전체 개수
+            (products, total_count, next_cursor): 상품 목록, 전체 개수, 다음 페이지 커서
+
+        Raises:
+            InvalidCursorError: 커서가 잘못된 경우
         """
         # 캐시 확인 (검색어가 없고 캐시가 활성화된 경우)
         if use_cache and self.cache_manager and not search_query:
@@ -74,16 +83,20 @@ class CachedProductService:
                 max_price=max_price,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
             )
 
             cached_data = await self.cache_manager.get(cache_key)
             if cached_data:
                 # 캐시된 데이터를 Product 객체로 변환
                 products = [self._dict_to_product(p) for p in cached_data["products"]]
-                return products, cached_data["total_count"]
+                return (
+                    products,
+                    cached_data["total_count"],
+                    cached_data.get("next_cursor"),
+                )
 
         # 데이터베이스 조회
-        query = select(Product)
         filters = []
 
         if category:
@@ -109,35 +122,43 @@ class CachedProductService:
         else:
             filters.append(Product.status != ProductStatus.DISCONTINUED)
 
-        if filters:
-            query = query.where(and_(*filters))
-
-        # 전체 개수 조회
-        count_query = select(func.count()).select_from(Product)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-
-        total_count_result = await self.db.execute(count_query)
-        total_count = total_count_result.scalar()
-
-        # 정렬 및 페이지네이션
-        query = query.order_by(Product.created_at.desc()).limit(limit).offset(offset)
+        key = count_key(
+            "product:list",
+            category=category,
+            search_query=search_query,
+            min_price=min_price,
+            max_price=max_price,
+            status=status,
+        )
 
-        # 실행
-        result = await self.db.execute(query)
-        products = list(result.scalars().all())
+        # 전체 개수 조회 (캐시, 만료 시 백그라운드 갱신)
+        count_query = select(func.count()).select_from(Product).where(and_(*filters))
+        count_cache = await get_count_cache()
+        total_count = await count_cache.get(key, count_query, db=self.db)
+
+        # 정렬 및 페이지네이션 (created_at, id 내림차순)
+        page = await paginate(
+            self.db,
+            select(Product).where(and_(*filters)),
+            Keyset((Product.created_at, True), (Product.id, True), scope=key),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+        products = page.items
 
         # 캐시 저장 (검색어가 없는 경우만)
         if use_cache and self.cache_manager and not search_query and products:
             cache_data = {
                 "products": [self._product_to_dict(p) for p in products],
                 "total_count": total_count,
+                "next_cursor": page.next_cursor,
             }
             await self.cache_manager.set(
                 cache_key, cache_data, ttl=CacheManager.MEDIUM_TTL  # 10분 캐시
             )
 
-        return products, total_count
+        return products, total_count, page.next_cursor
 
     @monitor_query("get_product_by_id")
     async def get_product_by_id(
@@ -15,6 +15,13 @@ from src.models.review_vote import ReviewVote
 from src.models.product import Product
 from src.models.order import Order, OrderStatus
 from src.utils.exceptions import ValidationException, NotFoundException
+from src.utils.pagination import (
+    InvalidCursorError,
+    Keyset,
+    count_key,
+    get_count_cache,
+    paginate,
+)
 
 
 class ReviewService:
@@ -155,56 +162,74 @@ class ReviewService:
         sort: str = "recent",
         rating_filter: Optional[int] = None,
         has_images: Optional[bool] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         상품 리뷰 목록 조회
 
         Args:
             product_id: 상품 ID
-            page: 페이지 번호 (1부터 시작)
+            page: 페이지 번호 (1부터 시작, 커서가 있으면 무시)
             limit: 페이지당 개수
             sort: 정렬 방식 (recent, helpful, rating_desc, rating_asc)
             rating_filter: 별점 필터 (1-5)
             has_images: 사진 리뷰만 보기
+            cursor: 이전 페이지의 next_cursor
 
         Returns:
             리뷰 목록 및 통계 정보
+
+        Raises:
+            ValidationException: 커서가 잘못된 경우
         """
-        # 기본 쿼리
-        query = select(Review).where(Review.product_id == product_id)
+        # 필터 조건
+        conditions = [Review.product_id == product_id]
 
-        # 필터 적용
         if rating_filter:
-            query = query.where(Review.rating == rating_filter)
+            conditions.append(Review.rating == rating_filter)
 
         if has_images:
             # JSONB 배열 길이 확인 (PostgreSQL)
-            query = query.where(func.jsonb_array_length(Review.images) > 0)
+            conditions.append(func.jsonb_array_length(Review.images) > 0)
 
-        # 정렬
+        # 정렬 (정렬 키, id)
         if sort == "helpful":
-            query = query.order_by(Review.helpful_count.desc())
+            keys = ((Review.helpful_count, True), (Review.id, True))
         elif sort == "rating_desc":
-            query = query.order_by(Review.rating.desc())
+            keys = ((Review.rating, True), (Review.id, True))
         elif sort == "rating_asc":
-            query = query.order_by(Review.rating.asc())
+            keys = ((Review.rating, False), (Review.id, False))
         else:  # recent (default)
-            query = query.order_by(Review.created_at.desc())
+            keys = ((Review.created_at, True), (Review.id, True))
 
-        # 총 개수 조회
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count_result = await self.db.execute(count_query)
-        total_count = total_count_result.scalar()
-
-        # 페이지네이션
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        key = count_key(
+            "reviews",
+            product_id=product_id,
+            rating_filter=rating_filter,
+            has_images=has_images,
+        )
 
-        # 리뷰 조회 (사용자 정보 포함)
-        query = query.options(selectinload(Review.user))
+        # 총 개수 조회 (캐시, 만료 시 백그라운드 갱신)
+        count_query = select(func.count(Review.id)).where(and_(*conditions))
+        count_cache = await get_count_cache()
+        total_count = await count_cache.get(key, count_query, db=self.db)
 
-        result = await self.db.execute(query)
-        reviews = result.scalars().all()
+        # 리뷰 조회 (사용자 정보 포함, 커서 페이지네이션)
+        query = (
+            select(Review).where(and_(*conditions)).options(selectinload(Review.user))
+        )
+        try:
+            result_page = await paginate(
+                self.db,
+                query,
+                Keyset(*keys, scope=f"{sort}:{key}"),
+                limit=limit,
+                cursor=cursor,
+                offset=(page - 1) * limit,
+            )
+        except InvalidCursorError as e:
+            raise ValidationException(str(e), field="cursor")
+        reviews = result_page.items
 
         # 평균 별점 및 별점 분포 계산
         stats_query = select(
@@ -224,6 +249,7 @@ class ReviewService:
             "total_count": total_count,
             "page": page,
             "total_pages": (total_count + limit - 1) // limit,
+            "next_cursor": result_page.next_cursor,
             "average_rating": float(stats.average_rating)
             if stats.average_rating
             else 0.0,
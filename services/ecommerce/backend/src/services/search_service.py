@@ -6,12 +6,13 @@ Uses PostgreSQL pg_trgm extension for fuzzy text matching.
 """
 
 from typing import List, Dict, Any, Optional
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, func, or_, and_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
 from src.models.product import Product
 from src.models.base import get_db
+from src.utils.pagination import Keyset, count_key, get_count_cache, paginate
 
 
 class SearchService:
@@ -119,6 +120,7 @@ class SearchService:
         sort: str = "popular",
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Search products with filters and sorting.
@@ -131,11 +133,16 @@ class SearchService:
             max_price: Maximum price filter
             in_stock: Show only in-stock products
             sort: Sort option (popular, price_asc, price_desc, newest, rating)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when cursor is given)
             limit: Items per page
+            cursor: Opaque cursor from the previous page (next_cursor)
 
         Returns:
-            Dict with products, total_count, page, total_pages, filters_applied
+            Dict with products, total_count, page, total_pages, next_cursor,
+            filters_applied
+
+        Raises:
+            InvalidCursorError: Cursor is malformed or from another sort/filter
         """
         # Build WHERE conditions
         conditions = []
@@ -167,35 +174,42 @@ class SearchService:
         if in_stock:
             conditions.append(Product.stock_quantity > 0)
 
-        # Count total matching products
-        count_stmt = select(func.count(Product.id)).where(and_(*conditions))
-        total_count_result = await self.db.execute(count_stmt)
-        total_count = total_count_result.scalar() or 0
+        filters_applied = {
+            "query": query,
+            "category": category,
+            "brand": brand,
+            "min_price": min_price,
+            "max_price": max_price,
+            "in_stock": in_stock,
+        }
+        key = count_key("search:products", **filters_applied)
 
-        # Build main query with sorting
-        stmt = select(Product).where(and_(*conditions))
+        # Count total matching products (cached, refreshed in background)
+        count_stmt = select(func.count(Product.id)).where(and_(*conditions))
+        count_cache = await get_count_cache()
+        total_count = await count_cache.get(key, count_stmt, db=self.db)
 
-        # Apply sorting
+        # Keyset sorting: (sort key, id)
         if sort == "price_asc":
-            stmt = stmt.order_by(asc(Product.price))
+            keys = ((Product.price, False), (Product.id, False))
         elif sort == "price_desc":
-            stmt = stmt.order_by(desc(Product.price))
-        elif sort == "newest":
-            stmt = stmt.order_by(desc(Product.created_at))
-        elif sort == "rating":
-            # TODO: Add average rating from reviews (Phase 4)
-            stmt = stmt.order_by(desc(Product.created_at))
-        else:  # "popular" - default
-            # TODO: Add popularity metric (view count, order count)
-            stmt = stmt.order_by(desc(Product.created_at))
-
-        # Pagination
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
-
-        # Execute query
-        result = await self.db.execute(stmt)
-        products = result.scalars().all()
+            keys = ((Product.price, True), (Product.id, True))
+        else:
+            # newest / rating / popular
+            # TODO: Add average rating and popularity metric (Phase 4)
+            keys = ((Product.created_at, True), (Product.id, True))
+        keyset = Keyset(*keys, scope=f"{sort}:{key}")
+
+        # Cursor pagination (page is kept for backward compatibility)
+        result_page = await paginate(
+            self.db,
+            select(Product).where(and_(*conditions)),
+            keyset,
+            limit=limit,
+            cursor=cursor,
+            offset=(page - 1) * limit,
+        )
+        products = result_page.items
 
         # Calculate total pages
         total_pages = (total_count + limit - 1) // limit  # Ceiling division
@@ -205,14 +219,8 @@ class SearchService:
             "total_count": total_count,
             "page": page,
             "total_pages": total_pages,
-            "filters_applied": {
-                "query": query,
-                "category": category,
-                "brand": brand,
-                "min_price": min_price,
-                "max_price": max_price,
-                "in_stock": in_stock,
-            },
+            "next_cursor": result_page.next_cursor,
+            "filters_applied": filters_applied,
         }
 
     def _product_to_dict(self, product: Product) -> Dict[str, Any]:
@@ -18,6 +18,7 @@ from src.utils.security import (
     create_access_token,
     create_refresh_token,
 )
+from src.utils.principal_cache import get_principal_cache
 from src.utils.exceptions import (
     AuthenticationError,
     ResourceNotFoundError,
@@ -87,7 +88,12 @@ class UserService:
         # JWT 토큰 생성
         tokens = {
             "access_token": create_access_token(
-                {"sub": str(user.id), "email": user.email, "role": user.role}
+                {
+                    "sub": str(user.id),
+                    "email": user.email,
+                    "role": user.role,
+                    "tv": user.token_version or 0,
+                }
             ),
             "refresh_token": create_refresh_token({"sub": str(user.id)}),
             "token_type": "bearer",
@@ -143,7 +149,12 @@ class UserService:
         # JWT 토큰 생성
         tokens = {
             "access_token": create_access_token(
-                {"sub": str(user.id), "email": user.email, "role": user.role}
+                {
+                    "sub": str(user.id),
+                    "email": user.email,
+                    "role": user.role,
+                    "tv": user.token_version or 0,
+                }
             ),
             "refresh_token": create_refresh_token({"sub": str(user.id)}),
             "token_type": "bearer",
@@ -223,8 +234,13 @@ class UserService:
 
         # 비밀번호 해싱 및 업데이트
         user.password_hash = hash_password(new_password)
+        # 기존에 발급된 Access Token 폐기
+        user.token_version = (user.token_version or 0) + 1
         await self.db.commit()
 
+        principal_cache = await get_principal_cache()
+        await principal_cache.invalidate(user.id)
+
         return True
 
     async def _get_user_by_email(self, email: str) -> Optional[User]:
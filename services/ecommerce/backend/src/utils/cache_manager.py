@@ -32,6 +32,7 @@ class CacheKeyBuilder:
         max_price: Optional[float] = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> str:
         """
         상품 목록 캐시 키 생성
@@ -43,6 +44,7 @@ class CacheKeyBuilder:
             max_price: 최대 가격
             limit: 조회 개수
             offset: 오프셋
+            cursor: 페이지 커서
 
         Returns:
             캐시 키 (예: "product:list:category=electronics:limit=20:offset=0")
@@ -62,6 +64,9 @@ class CacheKeyBuilder:
 
         parts.append(f"limit={limit}")
         parts.append(f"offset={offset}")
+        if cursor:
+            cursor_hash = hashlib.md5(cursor.encode()).hexdigest()[:12]
+            parts.append(f"cursor={cursor_hash}")
 
         return ":".join(parts)
 
@@ -0,0 +1,248 @@
+"""
+인증 주체(Principal) 캐시
+
+get_current_user 가 요청마다 User 전체 행을 조회하지 않도록 권한 판정에 필요한
+최소 정보(id, role, status, token_version)만 2단계로 캐싱합니다.
+
+- 1단계: 프로세스 로컬 TTL 캐시 (짧은 TTL, Redis 왕복 없음)
+- 2단계: Redis `auth:principal:{user_id}` (인스턴스 간 공유, 변경 시 무효화)
+- 캐시 미스 시 필요한 컬럼만 조회 (SELECT id, role, status, token_version)
+
+상태/역할/비밀번호 변경 시 invalidate() 를 호출해야 합니다. 다른 인스턴스의
+로컬 캐시는 local_ttl_seconds 이내에 만료되므로 그 시간이 최대 반영 지연입니다.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.user import User
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "auth:principal"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증된 사용자 (권한 판정용 최소 정보)
+
+    엔드포인트는 current_user.id / current_user.role 만 사용합니다.
+    """
+
+    id: UUID
+    role: str
+    status: str
+    token_version: int = 0
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == "active"
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["id"] = str(self.id)
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Principal":
+        data = json.loads(raw)
+        return cls(
+            id=UUID(data["id"]),
+            role=data["role"],
+            status=data["status"],
+            token_version=int(data.get("token_version", 0)),
+        )
+
+
+def _value(column_value: Any) -> str:
+    """Enum 컬럼 값을 문자열로 정규화"""
+    return getattr(column_value, "value", column_value)
+
+
+class PrincipalCache:
+    """
+    Principal 2단계 캐시 (로컬 TTL + Redis)
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        local_ttl_seconds: float = 15,
+        redis_ttl_seconds: int = 300,
+        local_max_entries: int = 10000,
+    ):
+        """
+        Args:
+            redis: 비동기 Redis 클라이언트 (None 이면 로컬 캐시만 사용)
+            local_ttl_seconds: 로컬 캐시 TTL (초)
+            redis_ttl_seconds: Redis 캐시 TTL (초)
+            local_max_entries: 로컬 캐시 최대 항목 수 (LRU)
+        """
+        self.redis = redis
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.local_max_entries = local_max_entries
+
+        # user_id -> (만료 시각, Principal)
+        self._local: "OrderedDict[UUID, Tuple[float, Principal]]" = OrderedDict()
+
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "db_loads": 0,
+            "invalidations": 0,
+            "redis_errors": 0,
+        }
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"{PRINCIPAL_KEY_PREFIX}:{user_id}"
+
+    async def get(self, user_id: UUID, db: AsyncSession) -> Optional[Principal]:
+        """
+        Principal 조회 (로컬 → Redis → DB)
+
+        Args:
+            user_id: 사용자 ID
+            db: 데이터베이스 세션 (캐시 미스 시 사용)
+
+        Returns:
+            Optional[Principal]: 사용자가 없으면 None
+        """
+        entry = self._local.get(user_id)
+        if entry is not None:
+            expires_at, principal = entry
+            if time.monotonic() < expires_at:
+                self._local.move_to_end(user_id)
+                self.stats["local_hits"] += 1
+                return principal
+            del self._local[user_id]
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(self._key(user_id))
+            except Exception as e:
+                logger.warning(f"Principal 캐시 조회 실패 (DB 조회로 대체): {e}")
+                self.stats["redis_errors"] += 1
+                raw = None
+            if raw is not None:
+                self.stats["redis_hits"] += 1
+                principal = Principal.from_json(raw)
+                self._remember(principal)
+                return principal
+
+        principal = await load_principal(db, user_id)
+        self.stats["db_loads"] += 1
+        if principal is None:
+            return None
+
+        # Replica 조회 결과는 복제 지연만큼 오래되었을 수 있으므로 캐싱하지 않음
+        if db.info.get("replica"):
+            return principal
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    self._key(user_id), principal.to_json(), ex=self.redis_ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Principal 캐시 저장 실패: {e}")
+                self.stats["redis_errors"] += 1
+        self._remember(principal)
+        return principal
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """
+        Principal 무효화 (상태/역할/비밀번호 변경 후 커밋 직후 호출)
+
+        Args:
+            user_id: 사용자 ID
+        """
+        user_id = UUID(str(user_id))
+        self._local.pop(user_id, None)
+        self.stats["invalidations"] += 1
+
+        if self.redis is not None:
+            try:
+                await self.redis.delete(self._key(user_id))
+            except Exception as e:
+                logger.error(f"Principal 캐시 무효화 실패: {user_id}, {e}")
+                self.stats["redis_errors"] += 1
+
+    def clear_local(self) -> None:
+        """로컬 캐시 비우기"""
+        self._local.clear()
+
+    def _remember(self, principal: Principal) -> None:
+        self._local[principal.id] = (
+            time.monotonic() + self.local_ttl_seconds,
+            principal,
+        )
+        self._local.move_to_end(principal.id)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+
+async def load_principal(db: AsyncSession, user_id: UUID) -> Optional[Principal]:
+    """
+    DB 에서 Principal 조회 (필요한 컬럼만)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+
+    Returns:
+        Optional[Principal]: 사용자가 없으면 None
+    """
+    result = await db.execute(
+        select(User.id, User.role, User.status, User.token_version).where(
+            User.id == user_id
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    return Principal(
+        id=row.id,
+        role=_value(row.role),
+        status=_value(row.status),
+        token_version=row.token_version or 0,
+    )
+
+
+# 전역 Principal 캐시 인스턴스
+_principal_cache: Optional[PrincipalCache] = None
+
+
+async def get_principal_cache() -> PrincipalCache:
+    """
+    Principal 캐시 인스턴스 가져오기 (싱글톤)
+
+    Redis 연결에 실패하면 로컬 캐시만 사용합니다.
+
+    Returns:
+        PrincipalCache: 캐시 인스턴스
+    """
+    global _principal_cache
+
+    if _principal_cache is None:
+        from src.utils.redis_client import get_redis
+
+        try:
+            redis = await get_redis()
+        except Exception as e:
+            logger.warning(f"Principal 캐시: Redis 사용 불가, 로컬 캐시만 사용: {e}")
+            redis = None
+        _principal_cache = PrincipalCache(redis)
+
+    return _principal_cache
@@ -191,6 +191,22 @@ database_errors_total = Counter(
     registry=registry,
 )
 
+db_routing_total = Counter(
+    "ecommerce_db_routing_total",
+    "DB 세션 라우팅 결정 수",
+    [
+        "target",
+        "reason",
+    ],  # primary/replica, read_only/write/replica_lag/read_your_writes/...
+    registry=registry,
+)
+
+db_replica_lag_seconds = Gauge(
+    "ecommerce_db_replica_lag_seconds",
+    "Read Replica 복제 지연 (초, 측정 불가 시 -1)",
+    registry=registry,
+)
+
 # ===========================
 # Redis 캐시 메트릭
 # ===========================
@@ -383,6 +399,16 @@ def record_cache_operation(operation: str, hit: bool = None, success: bool = Tru
     cache_operations_total.labels(operation=operation, result=result).inc()
 
 
+def record_db_routing(target: str, reason: str):
+    """DB 세션 라우팅 결정 기록"""
+    db_routing_total.labels(target=target, reason=reason).inc()
+
+
+def record_replica_lag(lag_seconds: float = None):
+    """Read Replica 복제 지연 기록"""
+    db_replica_lag_seconds.set(-1 if lag_seconds is None else lag_seconds)
+
+
 def record_fds_evaluation(result: str, duration: float):
     """FDS 평가 기록"""
     fds_evaluations_total.labels(result=result).inc()
@@ -0,0 +1,241 @@
+"""
+GCRA(Generic Cell Rate Algorithm) Rate Limiter
+
+토큰 버킷과 같은 의미의 GCRA 를 Redis 서버 측 Lua 스크립트 한 번으로 판정한다.
+키마다 TAT(Theoretical Arrival Time) 값 하나만 저장하므로 요청 수와 무관하게
+키당 메모리가 O(1) 이다 (요청마다 Sorted Set 멤버를 쌓지 않음).
+
+- 거부된 요청은 TAT 를 바꾸지 않으므로 retry_after 가 지나기 전까지는 로컬에서
+  바로 거부해도 Redis 판정과 같다 (로컬 사전 차단, Redis 왕복 없음)
+- Redis 가 없으면 같은 알고리즘의 인메모리 구현 사용 (개발 환경)
+- Redis 오류 시 허용 (Fail-Open)
+- 시각은 호출 측 시계(ms)를 사용하므로 서버 간 NTP 동기화를 전제로 한다
+
+이 모듈은 services/fds 와 services/ecommerce/backend 에 동일하게 유지한다
+(CI 에서 scripts/check_shared_copies.py 로 검사).
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: TAT 키
+# ARGV: now_ms, emission_interval_ms, tolerance_ms, cost
+# 반환: {허용 여부(0/1), retry_after_ms, reset_after_ms}
+# 마지막 요청의 이론 도착 시각(new_tat - interval) 이 now + tolerance 이내면 허용
+# (tolerance = interval * (burst - 1) 이면 연속 burst 건 허용)
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local tolerance = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval * cost
+local allow_at = new_tat - interval - tolerance
+if now < allow_at then
+    return {0, allow_at - now, tat - now}
+end
+
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, 0, new_tat - now}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    Rate Limit 정책
+
+    window_seconds 동안 limit 회, 최대 burst 회까지 연속 허용 (기본: limit)
+    """
+
+    limit: int
+    window_seconds: int
+    burst: Optional[int] = None
+
+    @property
+    def emission_interval_ms(self) -> int:
+        """요청 1건이 차지하는 시간 (ms)"""
+        return max(1, round(self.window_seconds * 1000 / max(self.limit, 1)))
+
+    @property
+    def tolerance_ms(self) -> int:
+        """연속 허용량 (ms, 첫 요청 이후 burst - 1 건)"""
+        return self.emission_interval_ms * (max(self.burst or self.limit, 1) - 1)
+
+
+@dataclass
+class RateLimitResult:
+    """Rate Limit 판정 결과 (시간 단위: 초)"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+
+def gcra(
+    tat: Optional[float],
+    now_ms: float,
+    interval_ms: int,
+    tolerance_ms: int,
+    cost: int = 1,
+) -> Tuple[bool, float, float, float]:
+    """
+    GCRA 판정 (GCRA_SCRIPT 와 동일한 계산)
+
+    Returns:
+        tuple: (허용 여부, 새 TAT, retry_after_ms, reset_after_ms)
+    """
+    if tat is None or tat < now_ms:
+        tat = now_ms
+
+    new_tat = tat + interval_ms * cost
+    allow_at = new_tat - interval_ms - tolerance_ms
+    if now_ms < allow_at:
+        return False, tat, allow_at - now_ms, tat - now_ms
+    return True, new_tat, 0.0, new_tat - now_ms
+
+
+class GCRARateLimiter:
+    """
+    GCRA Rate Limiter (Redis 스크립트 또는 인메모리)
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        prefix: str = "rate_limit",
+        local_max_keys: int = 10000,
+    ):
+        """
+        Args:
+            redis: 비동기 Redis 클라이언트 (None 이면 인메모리)
+            prefix: Redis 키 접두사
+            local_max_keys: 로컬 차단/인메모리 TAT 테이블 최대 키 수
+        """
+        self.redis = redis
+        self.prefix = prefix
+        self.local_max_keys = local_max_keys
+        self._script = redis.register_script(GCRA_SCRIPT) if redis is not None else None
+
+        # 인메모리 TAT (Redis 없을 때), 로컬 차단 만료 시각 (ms)
+        self._tat: Dict[str, float] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+        self.stats = {
+            "allowed": 0,
+            "rejected": 0,
+            "local_rejects": 0,
+            "redis_errors": 0,
+        }
+
+    async def check(
+        self, key: str, policy: RateLimitPolicy, cost: int = 1
+    ) -> RateLimitResult:
+        """
+        요청 1건(cost) 허용 여부 판정
+
+        Args:
+            key: 고유 키 (예: "ip:1.2.3.4:/v1/orders")
+            policy: 적용할 정책
+            cost: 소비량 (기본 1)
+
+        Returns:
+            RateLimitResult: 판정 결과
+        """
+        now_ms = time.time() * 1000
+
+        if policy.limit <= 0:
+            self.stats["rejected"] += 1
+            return RateLimitResult(
+                False, policy.limit, 0, policy.window_seconds, policy.window_seconds
+            )
+
+        # 로컬 사전 차단: 직전 거부의 retry_after 가 지나지 않았으면 Redis 생략
+        blocked_until = self._blocked_until.get(key)
+        if blocked_until is not None:
+            if now_ms < blocked_until:
+                self.stats["rejected"] += 1
+                self.stats["local_rejects"] += 1
+                retry_after_ms = blocked_until - now_ms
+                return RateLimitResult(
+                    False,
+                    policy.limit,
+                    0,
+                    retry_after_ms / 1000,
+                    (retry_after_ms + policy.tolerance_ms) / 1000,
+                )
+            del self._blocked_until[key]
+
+        if self._script is not None:
+            try:
+                allowed, retry_after_ms, reset_after_ms = await self._script(
+                    keys=[f"{self.prefix}:{key}"],
+                    args=[
+                        int(now_ms),
+                        policy.emission_interval_ms,
+                        policy.tolerance_ms,
+                        cost,
+                    ],
+                )
+                allowed = bool(int(allowed))
+                retry_after_ms = float(retry_after_ms)
+                reset_after_ms = float(reset_after_ms)
+            except Exception as e:
+                logger.error(f"Redis Rate Limiting 실패: {e}")
+                self.stats["redis_errors"] += 1
+                # Redis 실패 시 제한 없이 통과 (Fail-Open)
+                return RateLimitResult(True, policy.limit, policy.limit, 0, 0)
+        else:
+            allowed, new_tat, retry_after_ms, reset_after_ms = gcra(
+                self._tat.get(key),
+                now_ms,
+                policy.emission_interval_ms,
+                policy.tolerance_ms,
+                cost,
+            )
+            if allowed:
+                self._tat[key] = new_tat
+                self._prune(self._tat, now_ms)
+
+        if not allowed:
+            self.stats["rejected"] += 1
+            self._blocked_until[key] = now_ms + retry_after_ms
+            self._prune(self._blocked_until, now_ms)
+            return RateLimitResult(
+                False, policy.limit, 0, retry_after_ms / 1000, reset_after_ms / 1000
+            )
+
+        self.stats["allowed"] += 1
+        remaining = math.floor(
+            (policy.tolerance_ms + policy.emission_interval_ms - reset_after_ms)
+            / policy.emission_interval_ms
+        )
+        return RateLimitResult(
+            True, policy.limit, max(0, remaining), 0, reset_after_ms / 1000
+        )
+
+    def reset(self, key: str) -> None:
+        """로컬 상태 초기화 (인메모리 TAT, 로컬 차단)"""
+        self._tat.pop(key, None)
+        self._blocked_until.pop(key, None)
+
+    def _prune(self, table: Dict[str, float], now_ms: float) -> None:
+        """지난 시각 항목 제거 (테이블이 최대 크기를 넘을 때만)"""
+        if len(table) <= self.local_max_keys:
+            return
+        for key in [k for k, until in table.items() if until <= now_ms]:
+            del table[key]
+        while len(table) > self.local_max_keys:
+            table.pop(next(iter(table)))
@@ -0,0 +1,117 @@
+"""
+Read Replica 라우팅 유닛 테스트
+
+- 읽기 전용 경로의 GET 만 Replica, 복제 지연 초과/미측정 시 Master
+- 쓰기 성공 후 사용자 Master 고정 (read-your-writes, 인스턴스 간 공유)
+- 미들웨어 결정이 get_db() 컨텍스트로 전달
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.db import router as router_module
+from src.db.router import (
+    DB_TARGET_PRIMARY,
+    DB_TARGET_REPLICA,
+    ReplicaRouter,
+    current_db_target,
+)
+from src.middleware.db_routing import ReadReplicaRoutingMiddleware
+from src.utils.security import create_access_token
+
+
+class FakeRedis:
+    """ReplicaRouter 가 사용하는 명령만 지원하는 인메모리 async Redis"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, px=None):
+        self.values[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+
+@pytest.mark.unit
+async def test_choose_routes_by_method_path_and_lag():
+    router = ReplicaRouter(replica_enabled=True, max_lag_seconds=1.0)
+
+    # 복제 지연 미측정 → Master
+    assert await router.choose("GET", "/v1/products") == (
+        DB_TARGET_PRIMARY,
+        "lag_unknown",
+    )
+
+    router.update_lag(0.2)
+    assert await router.choose("GET", "/v1/products/abc/reviews") == (
+        DB_TARGET_REPLICA,
+        "read_only",
+    )
+    assert await router.choose("GET", "/v1/orders") == (
+        DB_TARGET_PRIMARY,
+        "not_read_route",
+    )
+    assert await router.choose("POST", "/v1/search/history") == (
+        DB_TARGET_PRIMARY,
+        "write",
+    )
+
+    router.update_lag(3.0)
+    assert await router.choose("GET", "/v1/products") == (
+        DB_TARGET_PRIMARY,
+        "replica_lag",
+    )
+
+    assert await ReplicaRouter(replica_enabled=False).choose("GET", "/v1/products") == (
+        DB_TARGET_PRIMARY,
+        "no_replica",
+    )
+
+
+@pytest.mark.unit
+async def test_user_pinned_to_primary_after_write_across_instances():
+    redis = FakeRedis()
+    writer = ReplicaRouter(redis, replica_enabled=True)
+    reader = ReplicaRouter(redis, replica_enabled=True)
+    reader.update_lag(0.0)
+
+    await writer.record_write("user-1")
+
+    assert await reader.choose("GET", "/v1/products", "user-1") == (
+        DB_TARGET_PRIMARY,
+        "read_your_writes",
+    )
+    assert await reader.choose("GET", "/v1/products", "user-2") == (
+        DB_TARGET_REPLICA,
+        "read_only",
+    )
+
+
+@pytest.mark.unit
+def test_middleware_sets_db_target_and_pins_writers(monkeypatch):
+    router = ReplicaRouter(replica_enabled=True)
+    router.update_lag(0.0)
+    monkeypatch.setattr(router_module, "_replica_router", router)
+
+    app = FastAPI()
+    app.add_middleware(ReadReplicaRoutingMiddleware)
+
+    @app.get("/v1/products")
+    async def list_products():
+        return {"target": current_db_target()}
+
+    @app.post("/v1/reviews")
+    async def create_review():
+        return {"target": current_db_target()}
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'user-1'})}"}
+
+    assert client.get("/v1/products", headers=headers).json() == {"target": "replica"}
+    assert client.post("/v1/reviews", headers=headers).json() == {"target": "primary"}
+    assert client.get("/v1/products", headers=headers).json() == {"target": "primary"}
+    assert client.get("/v1/products").json() == {"target": "replica"}
+    assert current_db_target() == DB_TARGET_PRIMARY
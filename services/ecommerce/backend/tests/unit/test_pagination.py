@@ -0,0 +1,198 @@
+"""
+Keyset 페이지네이션 / CountCache 유닛 테스트
+
+- 커서를 따라간 결과가 OFFSET 결과와 동일 (동률 정렬 키, 혼합 정렬 방향 포함)
+- 다른 정렬/필터의 커서는 거부
+- 공개 상품 목록 API 가 커서를 전달하고 next_cursor 를 반환 (잘못된 커서는 400)
+- 개수 캐시: TTL 이내 캐시, 만료 후 이전 값 반환 + 백그라운드 갱신
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import DateTime, Integer, Uuid, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
+
+import src.api.products as products_api
+from src.utils.pagination import (
+    CountCache,
+    InvalidCursorError,
+    Keyset,
+    count_key,
+    paginate,
+)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Item(_Base):
+    __tablename__ = "pagination_items"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    score: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    base = datetime(2025, 1, 1)
+    async with factory() as session:
+        session.add_all(
+            Item(
+                id=uuid.uuid4(),
+                score=i % 4,  # 동률 정렬 키
+                created_at=base + timedelta(minutes=i // 3),
+            )
+            for i in range(23)
+        )
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+async def _walk(db, keyset, limit):
+    ids, cursor = [], None
+    while True:
+        page = await paginate(db, select(Item), keyset, limit=limit, cursor=cursor)
+        ids.extend(item.id for item in page.items)
+        if not page.has_more:
+            return ids
+        cursor = page.next_cursor
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "keys",
+    [
+        ((Item.created_at, True), (Item.id, True)),
+        ((Item.score, False), (Item.id, False)),
+        ((Item.score, True), (Item.created_at, False), (Item.id, True)),
+    ],
+)
+async def test_cursor_walk_matches_offset_order(session_factory, keys):
+    keyset = Keyset(*keys, scope="items")
+    async with session_factory() as db:
+        expected = (
+            (await db.execute(select(Item.id).order_by(*keyset.order_by())))
+            .scalars()
+            .all()
+        )
+
+        assert await _walk(db, keyset, limit=5) == list(expected)
+
+        # 커서 없이 offset 으로 요청해도 다음 커서 반환 (하위 호환)
+        page = await paginate(db, select(Item), keyset, limit=5, offset=10)
+        assert [item.id for item in page.items] == list(expected[10:15])
+        assert page.next_cursor is not None
+
+
+@pytest.mark.unit
+async def test_rows_mode_returns_joined_rows_with_cursor(session_factory):
+    keyset = Keyset((Item.created_at, True), (Item.id, True), scope="rows")
+    async with session_factory() as db:
+        expected = await _walk(db, keyset, limit=23)
+
+        page = await paginate(db, select(Item, Item.score), keyset, limit=5, rows=True)
+        assert [item.id for item, _ in page.items] == expected[:5]
+        assert all(item.score == score for item, score in page.items)
+
+        page = await paginate(
+            db,
+            select(Item, Item.score),
+            keyset,
+            limit=5,
+            cursor=page.next_cursor,
+            rows=True,
+        )
+        assert [item.id for item, _ in page.items] == expected[5:10]
+
+
+@pytest.mark.unit
+async def test_cursor_from_other_scope_is_rejected(session_factory):
+    newest = Keyset((Item.created_at, True), (Item.id, True), scope="newest")
+    async with session_factory() as db:
+        page = await paginate(db, select(Item), newest, limit=5)
+
+        other = Keyset((Item.created_at, True), (Item.id, True), scope="oldest")
+        with pytest.raises(InvalidCursorError):
+            await paginate(db, select(Item), other, limit=5, cursor=page.next_cursor)
+        with pytest.raises(InvalidCursorError):
+            await paginate(db, select(Item), newest, limit=5, cursor="not-a-cursor")
+
+
+@pytest.mark.unit
+async def test_product_list_endpoint_uses_cursor(monkeypatch):
+    calls = []
+
+    async def get_product_list(self, **kwargs):
+        calls.append(kwargs)
+        if kwargs["cursor"] == "bad":
+            raise InvalidCursorError("잘못된 커서입니다")
+        return [], 42, "next-page"
+
+    monkeypatch.setattr(
+        products_api.CachedProductService, "get_product_list", get_product_list
+    )
+    query = dict(category=None, search=None, min_price=None, max_price=None)
+
+    response = await products_api.get_products(
+        **query, page=1, page_size=20, cursor="page-2", db=None
+    )
+    assert (response.next_cursor, response.total_count) == ("next-page", 42)
+    assert calls[0]["cursor"] == "page-2"
+
+    with pytest.raises(HTTPException) as exc:
+        await products_api.get_products(
+            **query, page=1, page_size=20, cursor="bad", db=None
+        )
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.unit
+async def test_count_cache_serves_stale_value_and_refreshes_in_background(
+    session_factory,
+):
+    cache = CountCache(session_factory, ttl_seconds=60, max_stale_seconds=600)
+    key = count_key("items", score=None)
+    stmt = select(func.count(Item.id))
+
+    assert await cache.get(key, stmt) == 23
+    async with session_factory() as session:
+        session.add(Item(id=uuid.uuid4(), score=0, created_at=datetime(2025, 2, 1)))
+        await session.commit()
+
+    assert await cache.get(key, stmt) == 23
+    assert cache.stats["hits"] == 1
+
+    # TTL 경과 → 이전 값 반환 후 백그라운드 갱신
+    value, computed_at = cache._local[key]
+    cache._local[key] = (value, computed_at - 120)
+    assert await cache.get(key, stmt) == 23
+    await asyncio.gather(*cache._refreshing.values())
+
+    assert await cache.get(key, stmt) == 24
+    assert cache.stats == {
+        "hits": 2,
+        "stale_hits": 1,
+        "misses": 1,
+        "refreshes": 1,
+        "errors": 0,
+    }
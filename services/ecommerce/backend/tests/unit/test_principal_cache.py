@@ -0,0 +1,141 @@
+"""
+PrincipalCache / get_current_user 유닛 테스트
+
+- 캐시 적중 시 DB 조회 없음 (로컬 → Redis → DB 순서)
+- 상태 변경 후 invalidate() 로 즉시 반영
+- token_version 이 올라가면 이전 토큰("tv" 클레임) 거부
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import MetaData, event, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.middleware.auth import AuthenticationError, get_current_user
+from src.models.user import User
+from src.utils import principal_cache as principal_cache_module
+from src.utils.principal_cache import PrincipalCache
+
+
+class FakeRedis:
+    """PrincipalCache 가 사용하는 명령만 지원하는 인메모리 async Redis"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.values.pop(key, None) is not None)
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    users = User.__table__.to_metadata(MetaData())
+    async with engine.begin() as conn:
+        await conn.run_sync(users.metadata.create_all)
+
+    queries = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: queries.append(statement),
+    )
+
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        session.info["queries"] = queries
+        yield session
+
+    await engine.dispose()
+
+
+async def _create_user(db: AsyncSession) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email=f"{uuid.uuid4().hex}@example.com",
+        password_hash="x",
+        name="tester",
+        role="customer",
+        status="active",
+    )
+    db.add(user)
+    await db.commit()
+    db.info["queries"].clear()
+    return user
+
+
+@pytest.mark.unit
+async def test_cache_layers_avoid_db_and_invalidate_reflects_status(db):
+    user = await _create_user(db)
+    redis = FakeRedis()
+    cache = PrincipalCache(redis)
+
+    principal = await cache.get(user.id, db)
+    assert (principal.id, principal.role, principal.status) == (
+        user.id,
+        "customer",
+        "active",
+    )
+    assert len(db.info["queries"]) == 1
+    assert "password_hash" not in db.info["queries"][0]
+
+    for _ in range(5):
+        await cache.get(user.id, db)
+    assert cache.stats["local_hits"] == 5
+
+    # 다른 인스턴스(로컬 캐시 없음)는 Redis 에서 조회
+    other = PrincipalCache(redis)
+    assert await other.get(user.id, db) == principal
+    assert other.stats["redis_hits"] == 1
+    assert len(db.info["queries"]) == 1
+
+    await db.execute(update(User).where(User.id == user.id).values(status="suspended"))
+    await db.commit()
+    await cache.invalidate(user.id)
+
+    # 무효화한 인스턴스와 Redis 는 즉시 반영, 다른 인스턴스 로컬 캐시는 TTL 까지 유지
+    assert (await cache.get(user.id, db)).status == "suspended"
+    assert (await PrincipalCache(redis).get(user.id, db)).status == "suspended"
+    assert (await other.get(user.id, db)).status == "active"
+    other.clear_local()
+    assert (await other.get(user.id, db)).status == "suspended"
+    assert len(db.info["queries"]) == 3
+
+
+@pytest.mark.unit
+async def test_get_current_user_rejects_inactive_and_stale_tokens(db, monkeypatch):
+    user = await _create_user(db)
+    cache = PrincipalCache()
+    monkeypatch.setattr(principal_cache_module, "_principal_cache", cache)
+
+    principal = await get_current_user({"sub": str(user.id)}, db)
+    assert principal.id == user.id and principal.role == "customer"
+
+    # 비밀번호 변경 → token_version 증가
+    await db.execute(update(User).where(User.id == user.id).values(token_version=1))
+    await db.commit()
+    await cache.invalidate(user.id)
+
+    with pytest.raises(AuthenticationError):
+        await get_current_user({"sub": str(user.id)}, db)
+    assert (
+        await get_current_user({"sub": str(user.id), "tv": 1}, db)
+    ).token_version == 1
+
+    with pytest.raises(AuthenticationError):
+        await get_current_user({"sub": str(uuid.uuid4()), "tv": 1}, db)
@@ -4,10 +4,34 @@ Rate Limiting 미들웨어 유닛 테스트
 
 import pytest
 import time
-from unittest.mock import AsyncMock, Mock
-from fastapi import Request, HTTPException
+from unittest.mock import Mock
+from fastapi import Request
 from starlette.datastructures import Headers
 from src.middleware.rate_limiting import RateLimiter, RateLimitMiddleware
+from src.utils.rate_limiter import GCRARateLimiter, RateLimitPolicy, gcra
+
+
+class FakeScriptRedis:
+    """GCRA 스크립트를 같은 계산(gcra)으로 흉내 내는 Redis"""
+
+    def __init__(self, fail=False):
+        self.store = {}
+        self.calls = 0
+        self.fail = fail
+
+    def register_script(self, script):
+        async def run(keys, args):
+            self.calls += 1
+            if self.fail:
+                raise ConnectionError("redis down")
+            allowed, new_tat, retry_after, reset_after = gcra(
+                self.store.get(keys[0]), *args
+            )
+            if allowed:
+                self.store[keys[0]] = new_tat
+            return [int(allowed), int(retry_after), int(reset_after)]
+
+        return run
 
 
 class TestRateLimiter:
@@ -232,15 +256,15 @@ class TestRateLimitMiddleware:
             response.headers = {}
             return response
 
-        # 제한(5회) 초과 시도
-        for i in range(6):
+        # 시간당 5회지만 연속 허용은 burst(2회)까지
+        for i in range(3):
             response = await middleware.dispatch(request, call_next)
 
-            if i < 5:
-                # 처음 5회는 허용
+            if i < 2:
+                # 처음 2회는 허용
                 assert response.status_code != 429
             else:
-                # 6번째는 차단
+                # 3번째는 차단
                 assert response.status_code == 429
                 assert "retry_after" in response.body.decode()
 
@@ -343,5 +367,68 @@ class TestRateLimitEdgeCases:
         assert allowed_count == 5
 
 
+class TestGCRARateLimiter:
+    """GCRA Rate Limiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced_by_emission_interval(self):
+        """limit 만큼 연속 허용 후 요청 간격(window/limit)마다 1건 허용"""
+        limiter = GCRARateLimiter()
+        policy = RateLimitPolicy(limit=5, window_seconds=10)
+
+        results = [await limiter.check("gcra_burst", policy) for _ in range(6)]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+        assert results[5].retry_after == pytest.approx(2.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_redis_state_is_one_key_and_rejects_are_shed_locally(self):
+        """키당 TAT 값 하나만 저장, 거부 후 retry_after 동안 Redis 호출 없음"""
+        redis = FakeScriptRedis()
+        limiter = GCRARateLimiter(redis)
+        policy = RateLimitPolicy(limit=3, window_seconds=60)
+
+        results = [await limiter.check("ip:1.2.3.4:/v1/orders", policy) for _ in range(10)]
+
+        assert sum(r.allowed for r in results) == 3
+        assert list(redis.store) == ["rate_limit:ip:1.2.3.4:/v1/orders"]
+        assert redis.calls == 4  # 허용 3 + 첫 거부 1
+        assert limiter.stats["local_rejects"] == 6
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open(self):
+        """Redis 오류 시 허용 (Fail-Open)"""
+        limiter = GCRARateLimiter(FakeScriptRedis(fail=True))
+        policy = RateLimitPolicy(limit=1, window_seconds=60)
+
+        results = [await limiter.check("gcra_fail_open", policy) for _ in range(3)]
+
+        assert all(r.allowed for r in results)
+        assert limiter.stats["redis_errors"] == 3
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_exactly_burst_requests(self):
+        """연속 허용은 정확히 burst 건, remaining 은 burst 기준"""
+        limiter = GCRARateLimiter(FakeScriptRedis())
+        policy = RateLimitPolicy(limit=10, window_seconds=900, burst=3)
+
+        results = [await limiter.check("gcra_burst", policy) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+
+    def test_gcra_matches_token_bucket_refill(self):
+        """burst 소진 후 간격만큼 시간이 지나면 1건 다시 허용"""
+        interval, tolerance = 1000, 2000  # burst 3
+        tat = None
+        for _ in range(3):
+            allowed, tat, _, _ = gcra(tat, 0, interval, tolerance)
+            assert allowed
+
+        assert gcra(tat, 999, interval, tolerance)[0] is False
+        assert gcra(tat, 1000, interval, tolerance)[0] is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
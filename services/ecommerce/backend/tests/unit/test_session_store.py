@@ -0,0 +1,206 @@
+"""
+SessionStore 유닛 테스트
+
+- 로컬 캐시 TTL 내 조회는 Redis 왕복 없음
+- 만료 갱신은 touch 간격마다 한 번만 (throttled sliding expiration)
+- 세션 업데이트 시 변경된 필드만 기록
+- 세션 수/정리는 사용자별 인덱스 사용 (키스페이스 스캔 없음)
+"""
+
+import time
+
+import pytest
+
+from src.middleware.session import SessionStore
+
+
+class FakeRedis:
+    """SessionStore 가 사용하는 명령만 지원하는 인메모리 async Redis"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.sets = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.hset_fields = []
+        self.in_pipeline = False
+
+    def _round_trip(self):
+        if not self.in_pipeline:
+            self.round_trips += 1
+
+    # --- hash ---
+    async def hset(self, key, field=None, value=None, mapping=None):
+        self._round_trip()
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        self.hset_fields.append(sorted(fields))
+        self.hashes.setdefault(key, {}).update(fields)
+        return len(fields)
+
+    async def hget(self, key, field):
+        self._round_trip()
+        return self.hashes.get(key, {}).get(field)
+
+    async def hgetall(self, key):
+        self._round_trip()
+        return dict(self.hashes.get(key, {}))
+
+    async def expire(self, key, seconds):
+        self._round_trip()
+        if key not in self.hashes:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, *keys):
+        self._round_trip()
+        return sum(1 for key in keys if self.hashes.pop(key, None) is not None)
+
+    # --- sorted set ---
+    async def zadd(self, key, mapping):
+        self._round_trip()
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, key, *members):
+        self._round_trip()
+        zset = self.zsets.get(key, {})
+        return sum(1 for m in members if zset.pop(m, None) is not None)
+
+    async def zcount(self, key, low, high):
+        self._round_trip()
+        return sum(1 for score in self.zsets.get(key, {}).values() if score >= low)
+
+    async def zremrangebyscore(self, key, low, high):
+        self._round_trip()
+        zset = self.zsets.get(key, {})
+        expired = [m for m, score in zset.items() if score <= high]
+        for member in expired:
+            del zset[member]
+        return len(expired)
+
+    async def zcard(self, key):
+        self._round_trip()
+        return len(self.zsets.get(key, {}))
+
+    # --- set ---
+    async def sadd(self, key, *members):
+        self._round_trip()
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def srem(self, key, *members):
+        self._round_trip()
+        self.sets.get(key, set()).difference_update(members)
+        return len(members)
+
+    async def smembers(self, key):
+        self._round_trip()
+        return set(self.sets.get(key, set()))
+
+    async def scan_iter(self, *args, **kwargs):
+        raise AssertionError("keyspace scan")
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        self.redis.in_pipeline = True
+        try:
+            return [
+                await getattr(self.redis, name)(*args, **kwargs)
+                for name, args, kwargs in self.commands
+            ]
+        finally:
+            self.redis.in_pipeline = False
+
+
+@pytest.mark.unit
+async def test_cached_reads_skip_redis_and_touch_is_throttled():
+    redis = FakeRedis()
+    store = SessionStore(redis, local_ttl_seconds=60, touch_interval_seconds=60)
+    session_id = await store.create_session("user-1", {"cart_id": "c-1"})
+    redis.round_trips = 0
+
+    for _ in range(10):
+        session = await store.get_session(session_id)
+
+    assert session["user_id"] == "user-1"
+    assert session["data"] == {"cart_id": "c-1"}
+    assert redis.round_trips == 0
+    assert store.stats["local_hits"] == 10
+
+    # touch 간격이 지나면 한 번의 파이프라인으로 만료 갱신
+    store._local[session_id][1]["last_accessed_at"] = "2000-01-01T00:00:00"
+    await store.get_session(session_id)
+    await store.get_session(session_id)
+    assert redis.round_trips == 1
+    assert store.stats["touches"] == 1
+
+
+@pytest.mark.unit
+async def test_session_shared_across_instances_and_updates_write_changed_fields():
+    redis = FakeRedis()
+    writer = SessionStore(redis)
+    reader = SessionStore(redis, local_ttl_seconds=0)
+    session_id = await writer.create_session(
+        "user-1", {"cart_id": "c-1", "locale": "ko"}
+    )
+
+    assert await writer.update_session(session_id, {"cart_id": "c-1", "locale": "en"})
+    assert redis.hset_fields[-1] == ["d:locale", "last_accessed_at"]
+
+    redis.hset_fields.clear()
+    assert await writer.update_session(session_id, {"cart_id": "c-1"})
+    assert redis.hset_fields == []
+
+    session = await reader.get_session(session_id)
+    assert session["data"] == {"cart_id": "c-1", "locale": "en"}
+    assert await reader.get_session("missing") is None
+
+
+@pytest.mark.unit
+async def test_counts_and_cleanup_use_user_indexes():
+    redis = FakeRedis()
+    store = SessionStore(redis)
+    first = await store.create_session("user-1")
+    await store.create_session("user-1")
+    await store.create_session("user-2")
+
+    assert await store.get_active_sessions_count("user-1") == 2
+    assert await store.get_active_sessions_count() == 3
+
+    assert await store.delete_session(first)
+    assert await store.get_session(first) is None
+    assert await store.get_active_sessions_count("user-1") == 1
+
+    # user-2 세션 만료 → 인덱스 정리
+    redis.zsets["session:user:user-2"] = {
+        member: time.time() - 1 for member in redis.zsets["session:user:user-2"]
+    }
+    assert await store.get_active_sessions_count() == 1
+    assert await store.cleanup_expired_sessions() == 1
+    assert redis.sets["session:users"] == {"user-1"}
@@ -57,6 +57,11 @@ task_routes = {
         "queue": "fds_realtime",
         "priority": 9,
     },
+    # 거래 파티션 관리 (낮은 우선순위)
+    "src.tasks.partition_maintenance.maintain_transaction_partitions": {
+        "queue": "fds_batch",
+        "priority": 3,
+    },
 }
 
 # =======================
@@ -69,6 +74,11 @@ beat_schedule = {
         "task": "src.tasks.batch_evaluation.batch_evaluate_transactions",
         "schedule": crontab(hour=0, minute=0),
     },
+    # 매일 새벽 3시 거래 파티션 미리 생성 + 보존 기간 지난 파티션 아카이브
+    "maintain-transaction-partitions": {
+        "task": "src.tasks.partition_maintenance.maintain_transaction_partitions",
+        "schedule": crontab(hour=3, minute=0),
+    },
 }
 
 # =======================
@@ -0,0 +1,65 @@
+"""
+거래 테이블 파티션 전환/관리 스크립트
+
+기존 비파티션 transactions 테이블을 created_at 범위 파티션 테이블로 전환하고
+(기존 행은 transactions_legacy 파티션으로 편입, 행 복사 없음),
+현재 기간부터 미리 만들어 둘 파티션을 생성합니다.
+
+**실행 방법**:
+    cd services/fds
+    python scripts/partition_transactions.py            # 전환 + 파티션 생성
+    python scripts/partition_transactions.py --archive  # + 보존 기간 지난 파티션 아카이브
+
+**주의**:
+    전환 중 기존 테이블 범위 검증 스캔 동안 거래 기록이 잠기므로 점검 시간에
+    실행하세요. 이미 파티션 테이블이면 전환은 건너뜁니다.
+    설정: FDS_TRANSACTION_PARTITION_INTERVAL (day/month), FDS_TRANSACTION_PARTITION_PREMAKE,
+    FDS_TRANSACTION_RETENTION_DAYS, FDS_TRANSACTION_ARCHIVE_SCHEMA/TABLESPACE
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# ruff: noqa: E402
+from src.models import close_db, init_db
+from src.services.transaction_partitions import get_transaction_partition_manager
+
+
+async def partition_transactions(archive: bool = False):
+    """파티션 전환 및 관리 실행"""
+    manager = get_transaction_partition_manager()
+
+    try:
+        if await manager.migrate_legacy_table():
+            print(
+                "[OK] Converted transactions to a partitioned table (transactions_legacy)"
+            )
+        else:
+            print("[SKIP] transactions is already partitioned (or does not exist)")
+
+        # 테이블이 없으면 파티션 테이블로 생성
+        await init_db()
+
+        created = await manager.ensure_partitions()
+        print(f"[OK] Created partitions: {created or 'none'}")
+
+        if archive:
+            archived = await manager.archive_expired()
+            print(f"[OK] Archived partitions: {archived or 'none'}")
+
+        print("\n[PARTITIONS]")
+        for name, bound in sorted((await manager.list_partitions()).items()):
+            print(f"  {name}: {bound or 'DEFAULT'}")
+    finally:
+        await close_db()
+
+    print("\n[DONE] Partition script completed successfully!")
+
+
+if __name__ == "__main__":
+    asyncio.run(partition_transactions(archive="--archive" in sys.argv))
@@ -5,44 +5,70 @@ Behavior Pattern API
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from redis.exceptions import WatchError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 import uuid
 
-from src.models.behavior_pattern import BehaviorPattern
-from src.engines.behavior_analysis_engine import BehaviorAnalysisEngine
-from src.database import get_db
+from src.models.behavior_pattern import BehaviorPattern, BehaviorTelemetry
+from src.engines.behavior_analysis_engine import (
+    BehaviorAnalysisEngine,
+    BehaviorSessionState,
+)
+from src.models import get_db
+from src.services.write_behind import get_write_behind_queue
+from src.utils.cache_utils import CacheKeys, CacheTTL, get_cache
+from src.utils.telemetry_codec import (
+    CLICKSTREAM_SCHEMA,
+    KEYBOARD_SCHEMA,
+    MOUSE_SCHEMA,
+    encode_events,
+)
 
 
 router = APIRouter(prefix="/v1/fds/behavior-pattern", tags=["Behavior Pattern"])
 
+# UUID 가 아닌 클라이언트 세션 ID → uuid5 (같은 ID 는 항상 같은 세션 UUID)
+SESSION_ID_NAMESPACE = uuid.UUID("5f0c2b7e-9d3a-4c1e-8f6b-2a7d4e9c1b30")
+
+# 이벤트 값 범위 (분석 배열 int64/int32 필드에 들어가는 값만 허용)
+MAX_TIMESTAMP_MS = 253_402_300_799_999  # 9999-12-31T23:59:59.999Z
+MAX_COORDINATE = 2**31 - 1
+
 
 # Pydantic 모델
 class MouseMovementInput(BaseModel):
-    timestamp: int = Field(..., description="타임스탬프 (milliseconds)")
-    x: int = Field(..., description="X 좌표")
-    y: int = Field(..., description="Y 좌표")
+    timestamp: int = Field(
+        ..., ge=0, le=MAX_TIMESTAMP_MS, description="타임스탬프 (milliseconds)"
+    )
+    x: int = Field(..., ge=-MAX_COORDINATE, le=MAX_COORDINATE, description="X 좌표")
+    y: int = Field(..., ge=-MAX_COORDINATE, le=MAX_COORDINATE, description="Y 좌표")
     speed: float = Field(..., description="속도 (pixels/sec)")
     acceleration: float = Field(..., description="가속도 (pixels/sec^2)")
     curvature: float = Field(..., description="곡률 (0-1)")
 
 
 class KeyboardEventInput(BaseModel):
-    timestamp: int = Field(..., description="타임스탬프 (milliseconds)")
+    timestamp: int = Field(
+        ..., ge=0, le=MAX_TIMESTAMP_MS, description="타임스탬프 (milliseconds)"
+    )
     key: str = Field(..., description="키 (마스킹됨)")
-    duration: int = Field(..., description="키 누름 시간 (milliseconds)")
+    duration: float = Field(..., ge=0, description="키 누름 시간 (milliseconds)")
 
 
 class ClickstreamEventInput(BaseModel):
     page: str = Field(..., description="페이지 경로")
-    timestamp: int = Field(..., description="타임스탬프 (milliseconds)")
-    duration: int = Field(..., description="체류 시간 (milliseconds)")
+    timestamp: int = Field(
+        ..., ge=0, le=MAX_TIMESTAMP_MS, description="타임스탬프 (milliseconds)"
+    )
+    duration: float = Field(..., ge=0, description="체류 시간 (milliseconds)")
 
 
 class BehaviorPatternRequest(BaseModel):
-    session_id: str = Field(..., description="세션 ID (클라이언트 생성)")
+    session_id: str = Field(..., description="세션 ID (클라이언트 생성, UUID 가 아니면 uuid5 로 변환)")
     user_id: Optional[UUID] = Field(None, description="사용자 ID (로그인 시)")
     mouse_movements: List[MouseMovementInput] = Field(
         default_factory=list, description="마우스 움직임 데이터"
@@ -55,6 +81,18 @@ class BehaviorPatternRequest(BaseModel):
     )
 
 
+class BehaviorChunkRequest(BaseModel):
+    mouse_movements: List[MouseMovementInput] = Field(
+        default_factory=list, description="새 마우스 움직임 데이터"
+    )
+    keyboard_events: List[KeyboardEventInput] = Field(
+        default_factory=list, description="새 키보드 이벤트 데이터"
+    )
+    clickstream: List[ClickstreamEventInput] = Field(
+        default_factory=list, description="새 클릭스트림 데이터"
+    )
+
+
 class BehaviorAnalysisResponse(BaseModel):
     session_id: str
     bot_score: int = Field(..., description="봇 점수 (0-100)")
@@ -66,12 +104,34 @@ class BehaviorAnalysisResponse(BaseModel):
     risk_factors: List[str]
 
 
+class BehaviorEventsResponse(BaseModel):
+    session_id: str
+    mouse_movements: List[Dict[str, Any]]
+    keyboard_events: List[Dict[str, Any]]
+    clickstream: List[Dict[str, Any]]
+
+
+def session_uuid(session_id: str) -> UUID:
+    """클라이언트 세션 ID → 저장용 세션 UUID (UUID 형식이 아니면 uuid5 로 유도)"""
+    try:
+        return uuid.UUID(session_id)
+    except ValueError:
+        return uuid.uuid5(SESSION_ID_NAMESPACE, session_id)
+
+
+def _risk_level(bot_score: int) -> str:
+    """봇 점수 → 위험 수준"""
+    if bot_score <= 30:
+        return "low"
+    elif bot_score <= 70:
+        return "medium"
+    return "high"
+
+
 @router.post(
     "/", response_model=BehaviorAnalysisResponse, status_code=status.HTTP_201_CREATED
 )
-async def collect_behavior_pattern(
-    request: BehaviorPatternRequest, db: AsyncSession = Depends(get_db)
-):
+async def collect_behavior_pattern(request: BehaviorPatternRequest):
     """
     행동 패턴 데이터 수집 및 분석
 
@@ -103,31 +163,39 @@ async def collect_behavior_pattern(
     bot_score = analysis_result["bot_score"]
 
     # 위험 수준 판별
-    if bot_score <= 30:
-        risk_level = "low"
-    elif bot_score <= 70:
-        risk_level = "medium"
-    else:
-        risk_level = "high"
+    risk_level = _risk_level(bot_score)
 
     # 추가 인증 필요 여부 (봇 점수 > 70)
     requires_additional_auth = bot_score > 70
 
-    # 데이터베이스에 저장
+    # 요약 통계(hot)와 원본 이벤트 압축 blob(cold)을 분리 저장 (write-behind)
+    # 같은 세션을 다시 전송하면 최신 분석 결과로 갱신 (upsert)
+    session_key = session_uuid(request.session_id)
     behavior_pattern = BehaviorPattern(
-        session_id=uuid.UUID(request.session_id)
-        if request.user_id
-        else None,  # UUID 변환
+        session_id=session_key,
         user_id=request.user_id,
-        mouse_movements=mouse_data,
-        keyboard_events=keyboard_data,
-        clickstream=clickstream_data,
+        mouse_event_count=len(mouse_data),
+        keyboard_event_count=len(keyboard_data),
+        clickstream_event_count=len(clickstream_data),
+        analysis_summary={
+            "mouse_analysis": analysis_result["mouse_analysis"],
+            "keyboard_analysis": analysis_result["keyboard_analysis"],
+            "clickstream_analysis": analysis_result["clickstream_analysis"],
+            "risk_factors": analysis_result["risk_factors"],
+        },
         bot_score=bot_score,
     )
-
-    db.add(behavior_pattern)
-    await db.commit()
-    await db.refresh(behavior_pattern)
+    telemetry = BehaviorTelemetry(
+        session_id=session_key,
+        mouse_blob=encode_events(mouse_data, MOUSE_SCHEMA) if mouse_data else None,
+        keyboard_blob=encode_events(keyboard_data, KEYBOARD_SCHEMA)
+        if keyboard_data
+        else None,
+        clickstream_blob=encode_events(clickstream_data, CLICKSTREAM_SCHEMA)
+        if clickstream_data
+        else None,
+    )
+    await get_write_behind_queue().enqueue_many([behavior_pattern, telemetry])
 
     return BehaviorAnalysisResponse(
         session_id=request.session_id,
@@ -141,6 +209,55 @@ async def collect_behavior_pattern(
     )
 
 
+@router.post("/{session_id}/chunks", response_model=BehaviorAnalysisResponse)
+async def score_behavior_chunk(session_id: str, request: BehaviorChunkRequest):
+    """
+    행동 패턴 청크 증분 채점
+
+    긴 세션의 이벤트를 도착하는 대로 전송하면, 세션 누적 통계(Redis)에
+    새 청크만 반영해 세션 전체 기준 봇 점수를 반환합니다.
+    이전 청크는 다시 분석하지 않습니다. 같은 세션의 청크가 동시에 도착해도
+    누적 통계 갱신은 원자적으로 반영됩니다 (충돌이 계속되면 409).
+    """
+    engine = BehaviorAnalysisEngine()
+    mouse_data = [m.model_dump() for m in request.mouse_movements]
+    keyboard_data = [k.model_dump() for k in request.keyboard_events]
+    clickstream_data = [c.model_dump() for c in request.clickstream]
+
+    def apply_chunk(cached_state):
+        state = (
+            BehaviorSessionState.from_dict(cached_state)
+            if cached_state
+            else BehaviorSessionState()
+        )
+        result = engine.score_chunk(state, mouse_data, keyboard_data, clickstream_data)
+        return state.to_dict(), result
+
+    try:
+        analysis_result = await get_cache().update_json(
+            CacheKeys.behavior_session_state(session_id),
+            apply_chunk,
+            CacheTTL.BEHAVIOR_SESSION_STATE,
+        )
+    except WatchError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Concurrent chunk updates for session {session_id}, retry",
+        )
+
+    bot_score = analysis_result["bot_score"]
+    return BehaviorAnalysisResponse(
+        session_id=session_id,
+        bot_score=bot_score,
+        risk_level=_risk_level(bot_score),
+        requires_additional_auth=bot_score > 70,
+        mouse_analysis=analysis_result["mouse_analysis"],
+        keyboard_analysis=analysis_result["keyboard_analysis"],
+        clickstream_analysis=analysis_result["clickstream_analysis"],
+        risk_factors=analysis_result["risk_factors"],
+    )
+
+
 @router.get("/{session_id}", response_model=BehaviorAnalysisResponse)
 async def get_behavior_pattern(session_id: str, db: AsyncSession = Depends(get_db)):
     """
@@ -152,21 +269,13 @@ async def get_behavior_pattern(session_id: str, db: AsyncSession = Depends(get_d
     Returns:
         저장된 행동 패턴 분석 결과
     """
-    # UUID로 변환 시도
-    try:
-        session_uuid = uuid.UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid session ID format. Must be UUID.",
-        )
+    session_key = session_uuid(session_id)
 
-    # 데이터베이스 조회
+    # 요약 통계만 조회 (원본 이벤트 디코딩/재분석 없음)
     result = await db.execute(
-        "SELECT * FROM behavior_patterns WHERE session_id = :session_id",
-        {"session_id": session_uuid},
+        select(BehaviorPattern).where(BehaviorPattern.session_id == session_key)
     )
-    behavior_pattern = result.fetchone()
+    behavior_pattern = result.scalar_one_or_none()
 
     if not behavior_pattern:
         raise HTTPException(
@@ -174,23 +283,11 @@ async def get_behavior_pattern(session_id: str, db: AsyncSession = Depends(get_d
             detail=f"Behavior pattern not found for session ID: {session_id}",
         )
 
-    # 재분석 (저장된 데이터로)
-    engine = BehaviorAnalysisEngine()
-    analysis_result = engine.analyze(
-        behavior_pattern.mouse_movements or [],
-        behavior_pattern.keyboard_events or [],
-        behavior_pattern.clickstream or [],
-    )
-
+    summary = behavior_pattern.analysis_summary or {}
     bot_score = behavior_pattern.bot_score
 
     # 위험 수준 판별
-    if bot_score <= 30:
-        risk_level = "low"
-    elif bot_score <= 70:
-        risk_level = "medium"
-    else:
-        risk_level = "high"
+    risk_level = _risk_level(bot_score)
 
     requires_additional_auth = bot_score > 70
 
@@ -199,8 +296,33 @@ async def get_behavior_pattern(session_id: str, db: AsyncSession = Depends(get_d
         bot_score=bot_score,
         risk_level=risk_level,
         requires_additional_auth=requires_additional_auth,
-        mouse_analysis=analysis_result["mouse_analysis"],
-        keyboard_analysis=analysis_result["keyboard_analysis"],
-        clickstream_analysis=analysis_result["clickstream_analysis"],
-        risk_factors=analysis_result["risk_factors"],
+        mouse_analysis=summary.get("mouse_analysis", {}),
+        keyboard_analysis=summary.get("keyboard_analysis", {}),
+        clickstream_analysis=summary.get("clickstream_analysis", {}),
+        risk_factors=summary.get("risk_factors", []),
+    )
+
+
+@router.get("/{session_id}/events", response_model=BehaviorEventsResponse)
+async def get_behavior_events(session_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    세션 ID로 저장된 원본 행동 이벤트 조회
+
+    압축 저장된 텔레메트리를 디코딩해 수집 당시 형식으로 반환합니다.
+    조사/재학습 용도이며, 일반 조회는 GET /{session_id} 를 사용합니다.
+    """
+    session_key = session_uuid(session_id)
+
+    telemetry = await db.get(BehaviorTelemetry, session_key)
+    if not telemetry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Behavior telemetry not found for session ID: {session_id}",
+        )
+
+    return BehaviorEventsResponse(
+        session_id=session_id,
+        mouse_movements=telemetry.mouse_movements,
+        keyboard_events=telemetry.keyboard_events,
+        clickstream=telemetry.clickstream,
     )
@@ -11,9 +11,9 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from src.database import get_db
+from src.models import get_db
 from src.models.device_fingerprint import DeviceFingerprint
-from src.utils.cache_utils import get_cache, CacheKeys
+from src.utils.cache_utils import get_cache, CacheKeys, cache_device_blacklist_status
 
 
 router = APIRouter(prefix="/v1/fds/blacklist", tags=["Blacklist"])
@@ -152,7 +152,10 @@ async def add_to_blacklist(
     await db.commit()
     await db.refresh(device)
 
-    # Redis 캐시 무효화 (블랙리스트 상태 변경)
+    # 블랙리스트 상태 키 갱신 + 핑거프린트 캐시 무효화
+    await cache_device_blacklist_status(
+        device.device_id, device.blacklisted, device.blacklist_reason
+    )
     cache = get_cache()
     cache_key = CacheKeys.device_fingerprint(request.device_id)
     await cache.delete(cache_key)
@@ -203,7 +206,10 @@ async def remove_from_blacklist(device_id: str, db: AsyncSession = Depends(get_d
     await db.commit()
     await db.refresh(device)
 
-    # Redis 캐시 무효화 (블랙리스트 상태 변경)
+    # 블랙리스트 상태 키 갱신 + 핑거프린트 캐시 무효화
+    await cache_device_blacklist_status(
+        device.device_id, device.blacklisted, device.blacklist_reason
+    )
     cache = get_cache()
     cache_key = CacheKeys.device_fingerprint(device_id)
     await cache.delete(cache_key)
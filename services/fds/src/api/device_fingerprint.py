@@ -10,8 +10,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.models import get_db
+from src.engines.fingerprint_engine import compute_device_id
 from src.models.device_fingerprint import DeviceFingerprint
+from src.services.device_fingerprint_service import (
+    device_to_cache_data,
+    get_device_fingerprint_service,
+)
 from src.utils.cache_utils import (
     get_cached_device_fingerprint,
     cache_device_fingerprint,
@@ -76,95 +81,37 @@ class DeviceInfoResponse(BaseModel):
     summary="디바이스 핑거프린트 수집",
     description="클라이언트에서 수집한 디바이스 핑거프린트를 저장하고 디바이스 ID를 생성합니다.",
 )
-async def collect_device_fingerprint(
-    request: DeviceFingerprintRequest, db: AsyncSession = Depends(get_db)
-):
+async def collect_device_fingerprint(request: DeviceFingerprintRequest):
     """
     디바이스 핑거프린트 수집
 
     1. 디바이스 ID 생성 (SHA-256 해시)
-    2. 기존 디바이스 조회
-    3. 신규 디바이스면 생성, 기존 디바이스면 last_seen_at 업데이트
+    2. 캐시 히트: 캐시로 응답, last_seen_at 은 배치 갱신 예약
+    3. 캐시 미스: INSERT ... ON CONFLICT DO UPDATE 로 생성/갱신 후 캐싱
     4. 블랙리스트 여부 반환
     """
-    import hashlib
-
     # 디바이스 ID 생성 (클라이언트와 동일한 알고리즘)
-    components = [
-        request.canvas_hash,
-        request.webgl_hash,
-        request.audio_hash,
-        str(request.cpu_cores),
-        request.screen_resolution,
-        request.timezone,
-        request.language,
-    ]
-    combined = "|".join(components)
-    device_id = hashlib.sha256(combined.encode()).hexdigest()
-
-    # 기존 디바이스 조회
-    result = await db.execute(
-        select(DeviceFingerprint).where(DeviceFingerprint.device_id == device_id)
+    device_id = compute_device_id(
+        canvas_hash=request.canvas_hash,
+        webgl_hash=request.webgl_hash,
+        audio_hash=request.audio_hash,
+        cpu_cores=request.cpu_cores,
+        screen_resolution=request.screen_resolution,
+        timezone=request.timezone,
+        language=request.language,
     )
-    existing_device = result.scalar_one_or_none()
-
-    is_new = existing_device is None
-    now = datetime.utcnow()
-
-    if is_new:
-        # 신규 디바이스 생성
-        device = DeviceFingerprint(
-            device_id=device_id,
-            canvas_hash=request.canvas_hash,
-            webgl_hash=request.webgl_hash,
-            audio_hash=request.audio_hash,
-            cpu_cores=request.cpu_cores,
-            memory_size=request.memory_size,
-            screen_resolution=request.screen_resolution,
-            timezone=request.timezone,
-            language=request.language,
-            user_agent=request.user_agent,
-            created_at=now,
-            last_seen_at=now,
-            blacklisted=False,
-        )
-        db.add(device)
-        await db.commit()
-        await db.refresh(device)
-    else:
-        # 기존 디바이스 업데이트 (last_seen_at)
-        existing_device.last_seen_at = now
-        existing_device.user_agent = request.user_agent  # User-Agent 업데이트
-        await db.commit()
-        await db.refresh(existing_device)
-        device = existing_device
 
-    # 디바이스 정보 Redis 캐싱 (TTL 24시간)
-    device_data = {
-        "device_id": device.device_id,
-        "canvas_hash": device.canvas_hash,
-        "webgl_hash": device.webgl_hash,
-        "audio_hash": device.audio_hash,
-        "cpu_cores": device.cpu_cores,
-        "memory_size": device.memory_size,
-        "screen_resolution": device.screen_resolution,
-        "timezone": device.timezone,
-        "language": device.language,
-        "user_agent": device.user_agent,
-        "blacklisted": device.blacklisted,
-        "blacklist_reason": device.blacklist_reason,
-        "created_at": device.created_at.isoformat(),
-        "last_seen_at": device.last_seen_at.isoformat(),
-    }
-    await cache_device_fingerprint(device_id, device_data)
+    device, is_new = await get_device_fingerprint_service().collect(
+        device_id, request.model_dump()
+    )
 
     return DeviceFingerprintResponse(
-        device_id=device.device_id,
+        device_id=device["device_id"],
         is_new=is_new,
-        blacklisted=device.blacklisted,
-        blacklist_reason=device.blacklist_reason,
-        created_at=device.created_at,
-        last_seen_at=device.last_seen_at,
+        blacklisted=device["blacklisted"],
+        blacklist_reason=device.get("blacklist_reason"),
+        created_at=datetime.fromisoformat(device["created_at"]),
+        last_seen_at=datetime.fromisoformat(device["last_seen_at"]),
     )
 
 
@@ -185,6 +132,10 @@ async def get_device_fingerprint(device_id: str, db: AsyncSession = Depends(get_
     # Redis 캐시 조회 시도
     cached_data = await get_cached_device_fingerprint(device_id)
     if cached_data:
+        # 블랙리스트 여부는 상태 키(없으면 DB)에서 읽음
+        cached_data.update(
+            await get_device_fingerprint_service().blacklist_status(device_id)
+        )
         # 캐시 히트: 캐시 데이터를 파싱하여 반환
         return DeviceInfoResponse(
             device_id=cached_data["device_id"],
@@ -219,23 +170,7 @@ async def get_device_fingerprint(device_id: str, db: AsyncSession = Depends(get_
         )
 
     # DB 조회 결과를 캐시에 저장
-    device_data = {
-        "device_id": device.device_id,
-        "canvas_hash": device.canvas_hash,
-        "webgl_hash": device.webgl_hash,
-        "audio_hash": device.audio_hash,
-        "cpu_cores": device.cpu_cores,
-        "memory_size": device.memory_size,
-        "screen_resolution": device.screen_resolution,
-        "timezone": device.timezone,
-        "language": device.language,
-        "user_agent": device.user_agent,
-        "blacklisted": device.blacklisted,
-        "blacklist_reason": device.blacklist_reason,
-        "created_at": device.created_at.isoformat(),
-        "last_seen_at": device.last_seen_at.isoformat(),
-        "updated_at": device.updated_at.isoformat(),
-    }
+    device_data = device_to_cache_data(device)
     await cache_device_fingerprint(device_id, device_data)
 
     return DeviceInfoResponse(
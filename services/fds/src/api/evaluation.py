@@ -5,17 +5,31 @@ FDS 평가 API 엔드포인트
 """
 
 import logging
+from datetime import datetime
+from uuid import uuid4
+
 from fastapi import APIRouter, HTTPException, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
-from ..models import get_db, Transaction, DeviceType, RiskLevel, EvaluationStatus
+from ..models import (
+    get_db,
+    Transaction,
+    DeviceType,
+    RiskLevel,
+    EvaluationStatus,
+    ReviewQueue,
+    ReviewStatus,
+)
 from ..models.schemas import (
     FDSEvaluationRequest,
     FDSEvaluationResponse,
     FDSErrorResponse,
 )
-from ..services.review_queue_service import ReviewQueueService
+from ..services.evaluation_records import build_evaluation_records
+from ..services.write_behind import get_write_behind_queue
+from ..services.review_queue_engine import get_review_queue_engine
+from ..services.transaction_partitions import assign_partition_key
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -116,7 +130,10 @@ async def evaluate_transaction(
         # 2. 평가 엔진으로 거래 평가
         evaluation_result = await engine.evaluate(request)
 
-        # 3. 평가 결과를 데이터베이스에 저장
+        # 3. 평가 결과 영속화 (write-behind: 응답 경로에서 DB 쓰기 없음)
+        decision = evaluation_result.decision.value
+        is_blocked = decision == "blocked"
+
         transaction = Transaction(
             id=request.transaction_id,
             user_id=request.user_id,
@@ -131,43 +148,50 @@ async def evaluate_transaction(
             },
             risk_score=evaluation_result.risk_score,
             risk_level=RiskLevel(evaluation_result.risk_level.value),
+            # 고위험 거래는 검토 큐에 함께 기록되므로 바로 MANUAL_REVIEW
             evaluation_status=EvaluationStatus.APPROVED
-            if evaluation_result.decision.value == "approve"
-            else EvaluationStatus.BLOCKED
-            if evaluation_result.decision.value == "blocked"
+            if decision == "approve"
+            else EvaluationStatus.MANUAL_REVIEW
+            if is_blocked
             else EvaluationStatus.EVALUATING,
             evaluation_time_ms=evaluation_result.evaluation_metadata.evaluation_time_ms,
             evaluated_at=evaluation_result.evaluation_metadata.timestamp,
+            # 파티션 키: 서버 시각, 같은 주문 재요청은 같은 값 (ON CONFLICT 중복 제거)
+            created_at=await assign_partition_key(request.order_id, redis, db),
         )
 
-        db.add(transaction)
-        await db.commit()
-        await db.refresh(transaction)
+        # 거래 + 위험 요인/룰 실행 (+ 검토 큐) 를 한 묶음으로 같은 배치에 기록
+        records = [transaction]
 
         # 4. 고위험 거래(BLOCKED)는 자동으로 검토 큐에 추가 (Phase 5: T073)
-        if evaluation_result.decision.value == "blocked":
-            try:
-                review_queue_service = ReviewQueueService(db)
-                review_queue = await review_queue_service.add_to_review_queue(
-                    transaction.id
+        review_queue = None
+        if is_blocked:
+            review_queue = ReviewQueue(
+                id=uuid4(),
+                transaction_id=transaction.id,
+                status=ReviewStatus.PENDING,
+                added_at=datetime.utcnow(),
+            )
+            records.append(review_queue)
+
+        records.extend(build_evaluation_records(transaction.id, evaluation_result))
+        await get_write_behind_queue().enqueue_many(records)
+
+        if review_queue is not None:
+            # 분석가 할당 대기열에 위험 점수 우선순위로 추가
+            engine = await get_review_queue_engine()
+            if engine is not None:
+                await engine.enqueue(
+                    review_queue.id, transaction.risk_score, review_queue.added_at
                 )
 
-                if review_queue:
-                    # 검토 큐 ID를 응답에 포함
-                    evaluation_result.recommended_action.review_queue_id = str(
-                        review_queue.id
-                    )
-
-                    logger.info(
-                        f"고위험 거래를 검토 큐에 추가: transaction_id={transaction.id}, "
-                        f"queue_id={review_queue.id}, risk_score={evaluation_result.risk_score}"
-                    )
-            except Exception as e:
-                # 검토 큐 추가 실패 시 로그만 남기고 계속 진행 (fail-safe)
-                logger.error(
-                    f"검토 큐 추가 실패: transaction_id={transaction.id}, error={str(e)}",
-                    exc_info=True,
-                )
+            # 검토 큐 ID를 응답에 포함
+            evaluation_result.recommended_action.review_queue_id = str(review_queue.id)
+
+            logger.info(
+                f"고위험 거래를 검토 큐에 추가: transaction_id={transaction.id}, "
+                f"queue_id={review_queue.id}, risk_score={evaluation_result.risk_score}"
+            )
 
         logger.info(
             f"FDS 평가 완료: transaction_id={request.transaction_id}, "
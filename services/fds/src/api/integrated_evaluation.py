@@ -17,16 +17,21 @@
 
 import logging
 import os
+from typing import List, Optional
+from uuid import UUID
+
 from fastapi import APIRouter, HTTPException, Header, status, Depends
+from pydantic import BaseModel, Field
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import (
     get_db,
-    get_redis,
     Transaction,
     DeviceType,
     RiskLevel,
     EvaluationStatus,
+    DetectionRule,
 )
 from ..models.schemas import (
     FDSEvaluationRequest,
@@ -34,7 +39,18 @@ from ..models.schemas import (
     FDSErrorResponse,
 )
 from ..engines.integrated_evaluation_engine import IntegratedEvaluationEngine
+from ..services.dashboard_rollup import get_dashboard_rollup
+from ..services.evaluation_records import build_evaluation_records
 from ..services.review_queue_service import ReviewQueueService
+from ..services.shadow_evaluation import (
+    ShadowCandidate,
+    ShadowConfig,
+    UnknownShadowModelError,
+    get_shadow_evaluator,
+    list_shadow_models,
+)
+from ..services.transaction_partitions import assign_partition_key
+from ..utils.redis_client import get_redis
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -166,6 +182,7 @@ async def evaluate_transaction_integrated(
             ml_model_path=ml_model_path,
             geoip_db_path=geoip_path,
             asn_db_path=asn_path,
+            shadow_evaluator=get_shadow_evaluator(),
         )
 
         # 3. 통합 평가 수행
@@ -193,12 +210,20 @@ async def evaluate_transaction_integrated(
             else EvaluationStatus.EVALUATING,
             evaluation_time_ms=evaluation_result.evaluation_metadata.evaluation_time_ms,
             evaluated_at=evaluation_result.evaluation_metadata.timestamp,
+            # 파티션 키: 서버 시각, 같은 주문 재요청은 같은 값 (ON CONFLICT 중복 제거)
+            created_at=await assign_partition_key(request.order_id, redis, db),
         )
 
         db.add(transaction)
+        # 위험 요인 / 룰 실행 기록 (거래와 같은 커밋)
+        db.add_all(build_evaluation_records(transaction.id, evaluation_result))
         await db.commit()
         await db.refresh(transaction)
 
+        rollup = await get_dashboard_rollup()
+        if rollup is not None:
+            await rollup.record_instances(transactions=[transaction])
+
         # 5. 고위험 거래(BLOCKED)는 자동으로 검토 큐에 추가
         if evaluation_result.decision.value == "blocked":
             try:
@@ -382,3 +407,126 @@ async def get_metrics(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="메트릭 조회 중 에러가 발생했습니다",
         )
+
+
+# === Shadow 평가 ===
+
+
+class ShadowEnableRequest(BaseModel):
+    """Shadow 평가 활성화 요청"""
+
+    name: str = Field(..., description="후보 이름", max_length=100)
+    ml_model_id: Optional[str] = Field(
+        None,
+        description="후보 ML 모델 ID (FDS_SHADOW_MODEL_DIR 에 등록된 모델)",
+        max_length=100,
+    )
+    rule_ids: List[UUID] = Field(
+        default_factory=list, description="후보 DetectionRule ID (비활성 새 버전 포함)"
+    )
+    sample_percentage: int = Field(100, description="shadow 평가할 트래픽 비율", ge=1, le=100)
+
+
+@router.post(
+    "/shadow",
+    status_code=status.HTTP_200_OK,
+    summary="[통합] Shadow 평가 활성화",
+    description="후보 룰/모델을 실제 결정에 반영하지 않고 운영 트래픽으로 평가합니다.",
+)
+async def enable_shadow_evaluation(
+    body: ShadowEnableRequest,
+    db: AsyncSession = Depends(get_db),
+    token_valid: bool = Depends(verify_service_token),
+) -> dict:
+    """
+    Shadow 평가 활성화 (기존 후보와 통계는 교체, 다른 API 워커는 다음 동기화 때 적용)
+
+    Args:
+        body: 후보 구성
+        db: 데이터베이스 세션
+        token_valid: 서비스 토큰 검증 결과
+
+    Returns:
+        dict: shadow 평가 상태
+    """
+    if not body.ml_model_id and not body.rule_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="후보 ML 모델 또는 후보 룰이 필요합니다",
+        )
+
+    rules = []
+    if body.rule_ids:
+        result = await db.execute(
+            select(DetectionRule).where(DetectionRule.id.in_(body.rule_ids))
+        )
+        rules = list(result.scalars().all())
+        missing = set(body.rule_ids) - {rule.id for rule in rules}
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"룰을 찾을 수 없습니다: {sorted(str(m) for m in missing)}",
+            )
+        # 후보 룰은 세션과 분리해 shadow 워커에서만 사용
+        for rule in rules:
+            db.expunge(rule)
+
+    config = ShadowConfig(
+        name=body.name,
+        ml_model_id=body.ml_model_id,
+        rule_ids=[str(rule.id) for rule in rules],
+        sample_percentage=body.sample_percentage,
+    )
+    try:
+        candidate = ShadowCandidate.build(
+            name=config.name,
+            redis=await get_redis(),
+            ml_model_id=config.ml_model_id,
+            rules=rules,
+            sample_percentage=config.sample_percentage,
+        )
+    except UnknownShadowModelError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error(f"[SHADOW] 후보 구성 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"후보 구성에 실패했습니다: {e}",
+        )
+
+    return await get_shadow_evaluator().activate(config, candidate)
+
+
+@router.delete(
+    "/shadow",
+    status_code=status.HTTP_200_OK,
+    summary="[통합] Shadow 평가 비활성화",
+    description="Shadow 평가를 중지하고 최종 집계를 반환합니다.",
+)
+async def disable_shadow_evaluation(
+    token_valid: bool = Depends(verify_service_token),
+) -> dict:
+    """Shadow 평가 비활성화 (모든 API 워커)"""
+    return await get_shadow_evaluator().deactivate()
+
+
+@router.get(
+    "/shadow/stats",
+    status_code=status.HTTP_200_OK,
+    summary="[통합] Shadow 평가 통계",
+    description="라이브 대비 후보의 결정 분포, 점수 차이, 지연 시간 집계를 조회합니다.",
+)
+async def get_shadow_stats() -> dict:
+    """Shadow 평가 집계 조회 (전체 API 워커 합계)"""
+    return await get_shadow_evaluator().get_shared_stats()
+
+
+@router.get(
+    "/shadow/models",
+    status_code=status.HTTP_200_OK,
+    summary="[통합] Shadow 후보 모델 목록",
+    description="shadow 평가에 지정할 수 있는 등록된 후보 모델 ID 를 조회합니다.",
+)
+async def get_shadow_models() -> dict:
+    """등록된 후보 모델 ID 목록"""
+    return {"models": list_shadow_models()}
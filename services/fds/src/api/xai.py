@@ -6,6 +6,9 @@ SHAP/LIME 기반 ML 모델 예측 설명을 제공합니다.
 엔드포인트:
 - GET /v1/fds/xai/{transaction_id}: 거래에 대한 XAI 분석 결과 조회
 - POST /v1/fds/xai/explain: 실시간 XAI 분석 수행
+- POST /v1/fds/xai/explain/batch: 여러 거래 SHAP 배치 분석
+- POST /v1/fds/xai/jobs: 대량 분석 작업 등록 (비동기)
+- GET /v1/fds/xai/jobs/{job_id}: 분석 작업 진행 상황/결과 조회
 
 목표:
 - 3클릭 이내로 거래 차단 사유 확인 가능
@@ -15,14 +18,15 @@ SHAP/LIME 기반 ML 모델 예측 설명을 제공합니다.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
 import uuid
 import pandas as pd
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.db.session import get_db
+from src.models import get_db
+from src.models.base import AsyncSessionLocal
 from src.services.xai_service import XAIService
 
 logger = logging.getLogger(__name__)
@@ -165,6 +169,57 @@ class XAIResponse(BaseModel):
         }
 
 
+class BatchExplainItem(BaseModel):
+    """배치 분석 대상 거래"""
+
+    transaction_id: str = Field(..., description="거래 ID")
+    features: Dict[str, float] = Field(..., description="Feature 데이터 (dict 형식)")
+
+
+class BatchExplainRequest(BaseModel):
+    """배치 XAI 분석 요청 (SHAP 전용)"""
+
+    items: List[BatchExplainItem] = Field(..., min_length=1, description="분석 대상 거래")
+    model_type: str = Field("tree", description="모델 타입 (tree)", pattern="^tree$")
+
+
+class BatchExplainResponse(BaseModel):
+    """배치 XAI 분석 응답"""
+
+    results: List[XAIResponse] = Field(..., description="거래별 분석 결과")
+    count: int = Field(..., description="결과 수")
+
+
+class XAIJobResponse(BaseModel):
+    """비동기 XAI 분석 작업 상태"""
+
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="pending, running, completed, failed")
+    total: int = Field(..., description="전체 거래 수")
+    completed: int = Field(..., description="완료된 거래 수")
+    error: Optional[str] = Field(None, description="실패 사유")
+    created_at: str = Field(..., description="등록 일시 (ISO 8601)")
+    finished_at: Optional[str] = Field(None, description="종료 일시 (ISO 8601)")
+    results: Optional[List[XAIResponse]] = Field(None, description="분석 결과 (완료분)")
+
+
+# 동기 배치 API 최대 거래 수 (초과 시 작업 모드 사용)
+MAX_SYNC_BATCH_SIZE = 500
+
+
+def _parse_batch(request: BatchExplainRequest):
+    """배치 요청 → (거래 ID 목록, feature DataFrame)"""
+    try:
+        transaction_ids = [uuid.UUID(item.transaction_id) for item in request.items]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid transaction_id format: {e}",
+        )
+    features_df = pd.DataFrame([item.features for item in request.items])
+    return transaction_ids, features_df
+
+
 # ================== API Endpoints ==================
 
 
@@ -302,6 +357,92 @@ async def explain_prediction(
         )
 
 
+@router.post("/explain/batch", response_model=BatchExplainResponse)
+async def explain_batch(
+    request: BatchExplainRequest,
+    save_to_db: bool = Query(True, description="분석 결과를 데이터베이스에 저장할지 여부"),
+    db_session: AsyncSession = Depends(get_db),
+    xai_service: XAIService = Depends(get_xai_service),
+):
+    """
+    여러 거래에 대한 SHAP 배치 분석
+
+    TreeExplainer 1회 호출로 여러 거래를 계산하며, 같은 모델 버전/feature 벡터는
+    캐시된 결과를 재사용합니다. 대량(500건 초과) 분석은 /jobs 를 사용하세요.
+
+    Raises:
+        400: 잘못된 요청 또는 배치 분석 불가
+        413: 동기 배치 최대 거래 수 초과
+    """
+    if len(request.items) > MAX_SYNC_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large (max {MAX_SYNC_BATCH_SIZE}), use /v1/fds/xai/jobs",
+        )
+
+    transaction_ids, features_df = _parse_batch(request)
+    try:
+        results = await xai_service.explain_batch(
+            transaction_ids,
+            features_df,
+            model_type=request.model_type,
+            db_session=db_session if save_to_db else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {"results": results, "count": len(results)}
+
+
+@router.post(
+    "/jobs", response_model=XAIJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_explanation_job(
+    request: BatchExplainRequest,
+    save_to_db: bool = Query(True, description="분석 결과를 데이터베이스에 저장할지 여부"),
+    xai_service: XAIService = Depends(get_xai_service),
+):
+    """
+    대량 XAI 분석 작업 등록 (검토 큐 일괄 설명 생성용)
+
+    즉시 작업 ID를 반환하며, GET /jobs/{job_id} 로 진행 상황과 결과를 조회합니다.
+    """
+    transaction_ids, features_df = _parse_batch(request)
+    try:
+        job = await xai_service.submit_job(
+            transaction_ids,
+            features_df,
+            model_type=request.model_type,
+            session_factory=AsyncSessionLocal if save_to_db else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(f"[XAI API] Job {job.job_id} submitted ({job.total} transactions)")
+    return job.to_dict(include_results=False)
+
+
+@router.get("/jobs/{job_id}", response_model=XAIJobResponse)
+async def get_explanation_job(
+    job_id: str,
+    include_results: bool = Query(True, description="완료된 분석 결과 포함 여부"),
+    xai_service: XAIService = Depends(get_xai_service),
+):
+    """
+    XAI 분석 작업 진행 상황/결과 조회
+
+    Raises:
+        404: 작업을 찾을 수 없음 (만료 포함)
+    """
+    job = await xai_service.get_job(job_id, include_results=include_results)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"XAI job not found: {job_id}",
+        )
+    return job.to_dict(include_results=include_results)
+
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(xai_service: XAIService = Depends(get_xai_service)):
     """
@@ -318,4 +459,5 @@ async def health_check(xai_service: XAIService = Depends(get_xai_service)):
         "lime_enabled": xai_service.enable_lime,
         "timeout_seconds": xai_service.timeout_seconds,
         "max_display_features": xai_service.max_display_features,
+        **xai_service.get_stats(),
     }
@@ -2,10 +2,147 @@
 Behavior Analysis Engine
 
 마우스 움직임, 키보드 타이핑, 클릭스트림 분석으로 봇 탐지
+
+- 텔레메트리를 NumPy structured array 로 변환해 필드별 통계를 한 번의
+  벡터 연산으로 계산
+- 세션 통계(개수/평균/M2/임계값 초과 수)를 누적해 긴 세션을 청크 단위로
+  증분 채점 (이전 이벤트 재분석 없음)
 """
 
-from typing import Dict, List, Any
-import statistics
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+
+# 텔레메트리 structured array 형식 (누락 필드는 NaN)
+MOUSE_DTYPE = np.dtype(
+    [
+        ("timestamp", "i8"),
+        ("x", "i4"),
+        ("y", "i4"),
+        ("speed", "f8"),
+        ("acceleration", "f8"),
+        ("curvature", "f8"),
+    ]
+)
+KEYBOARD_DTYPE = np.dtype(
+    [("timestamp", "i8"), ("duration", "f8"), ("is_backspace", "?")]
+)
+CLICKSTREAM_DTYPE = np.dtype([("timestamp", "i8"), ("duration", "f8")])
+
+BACKSPACE_KEYS = ("Backspace", "Delete")
+
+Events = Union[Sequence[Dict[str, Any]], np.ndarray, None]
+
+
+def mouse_events_to_array(events: Events) -> np.ndarray:
+    """마우스 이벤트 목록 → MOUSE_DTYPE 배열"""
+    if isinstance(events, np.ndarray):
+        return events
+    nan = float("nan")
+    return np.array(
+        [
+            (
+                e.get("timestamp", 0),
+                e.get("x", 0),
+                e.get("y", 0),
+                e.get("speed", nan),
+                e.get("acceleration", nan),
+                e.get("curvature", nan),
+            )
+            for e in events or ()
+        ],
+        dtype=MOUSE_DTYPE,
+    )
+
+
+def keyboard_events_to_array(events: Events) -> np.ndarray:
+    """키보드 이벤트 목록 → KEYBOARD_DTYPE 배열"""
+    if isinstance(events, np.ndarray):
+        return events
+    nan = float("nan")
+    return np.array(
+        [
+            (
+                e.get("timestamp", 0),
+                e.get("duration", nan),
+                e.get("key") in BACKSPACE_KEYS,
+            )
+            for e in events or ()
+        ],
+        dtype=KEYBOARD_DTYPE,
+    )
+
+
+def clickstream_to_array(events: Events) -> np.ndarray:
+    """클릭스트림 목록 → CLICKSTREAM_DTYPE 배열"""
+    if isinstance(events, np.ndarray):
+        return events
+    nan = float("nan")
+    return np.array(
+        [(e.get("timestamp", 0), e.get("duration", nan)) for e in events or ()],
+        dtype=CLICKSTREAM_DTYPE,
+    )
+
+
+@dataclass
+class RunningStats:
+    """개수/평균/M2 누적 통계 (청크 병합: Chan 병렬 분산 알고리즘)"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        n = int(values.size)
+        if n == 0:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(np.square(values - chunk_mean).sum())
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    @property
+    def stdev(self) -> float:
+        """표본 표준편차 (statistics.stdev 와 동일, 2개 미만이면 0)"""
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+
+@dataclass
+class BehaviorSessionState:
+    """세션 누적 통계 (직렬화해 청크 사이에 보관 가능)"""
+
+    mouse_total: int = 0
+    mouse_speed: RunningStats = field(default_factory=RunningStats)
+    mouse_acceleration: RunningStats = field(default_factory=RunningStats)
+    mouse_curvature: RunningStats = field(default_factory=RunningStats)
+    mouse_low_curvature: int = 0
+    mouse_high_speed: int = 0
+
+    keyboard_total: int = 0
+    keyboard_duration: RunningStats = field(default_factory=RunningStats)
+    keyboard_backspace: int = 0
+    keyboard_fast: int = 0
+
+    clickstream_total: int = 0
+    clickstream_duration: RunningStats = field(default_factory=RunningStats)
+    clickstream_short: int = 0
+    clickstream_long: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BehaviorSessionState":
+        return cls(
+            **{
+                key: RunningStats(**value) if isinstance(value, dict) else value
+                for key, value in data.items()
+            }
+        )
 
 
 class BehaviorAnalysisEngine:
@@ -24,25 +161,54 @@ class BehaviorAnalysisEngine:
 
     def analyze(
         self,
-        mouse_movements: List[Dict[str, Any]],
-        keyboard_events: List[Dict[str, Any]],
-        clickstream: List[Dict[str, Any]],
+        mouse_movements: Events,
+        keyboard_events: Events,
+        clickstream: Events,
     ) -> Dict[str, Any]:
         """
         행동 패턴 종합 분석
 
         Args:
-            mouse_movements: 마우스 움직임 데이터
-            keyboard_events: 키보드 이벤트 데이터
-            clickstream: 클릭스트림 데이터
+            mouse_movements: 마우스 움직임 데이터 (dict 목록 또는 MOUSE_DTYPE 배열)
+            keyboard_events: 키보드 이벤트 데이터 (dict 목록 또는 KEYBOARD_DTYPE 배열)
+            clickstream: 클릭스트림 데이터 (dict 목록 또는 CLICKSTREAM_DTYPE 배열)
 
         Returns:
             분석 결과 및 봇 점수
         """
-        # 각 분석 수행
-        mouse_analysis = self.analyze_mouse_movements(mouse_movements)
-        keyboard_analysis = self.analyze_keyboard_typing(keyboard_events)
-        clickstream_analysis = self.analyze_clickstream(clickstream)
+        return self.score_chunk(
+            BehaviorSessionState(), mouse_movements, keyboard_events, clickstream
+        )
+
+    def score_chunk(
+        self,
+        state: BehaviorSessionState,
+        mouse_movements: Events = None,
+        keyboard_events: Events = None,
+        clickstream: Events = None,
+    ) -> Dict[str, Any]:
+        """
+        이벤트 청크를 세션 통계에 누적하고 세션 전체 기준으로 재채점
+
+        긴 세션은 도착하는 청크마다 호출하면 되며, 이전 청크는 다시 분석하지
+        않는다 (state 를 제자리에서 갱신).
+
+        Args:
+            state: 세션 누적 통계
+            mouse_movements: 새 마우스 이벤트
+            keyboard_events: 새 키보드 이벤트
+            clickstream: 새 클릭스트림 이벤트
+
+        Returns:
+            세션 전체 분석 결과 및 봇 점수 (analyze() 와 같은 형식)
+        """
+        self._update_mouse(state, mouse_events_to_array(mouse_movements))
+        self._update_keyboard(state, keyboard_events_to_array(keyboard_events))
+        self._update_clickstream(state, clickstream_to_array(clickstream))
+
+        mouse_analysis = self._mouse_summary(state)
+        keyboard_analysis = self._keyboard_summary(state)
+        clickstream_analysis = self._clickstream_summary(state)
 
         # 봇 확률 점수 계산
         bot_score = self.calculate_bot_score(
@@ -59,9 +225,7 @@ class BehaviorAnalysisEngine:
             ),
         }
 
-    def analyze_mouse_movements(
-        self, mouse_movements: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    def analyze_mouse_movements(self, mouse_movements: Events) -> Dict[str, Any]:
         """
         마우스 움직임 분석 (속도, 가속도, 곡률)
 
@@ -73,7 +237,96 @@ class BehaviorAnalysisEngine:
         Returns:
             분석 결과
         """
-        if not mouse_movements:
+        state = BehaviorSessionState()
+        self._update_mouse(state, mouse_events_to_array(mouse_movements))
+        return self._mouse_summary(state)
+
+    def analyze_keyboard_typing(self, keyboard_events: Events) -> Dict[str, Any]:
+        """
+        키보드 타이핑 패턴 분석 (입력 속도, 백스페이스 빈도)
+
+        Args:
+            keyboard_events: 키보드 이벤트 데이터
+                [{"timestamp": int, "key": str, "duration": int}]
+
+        Returns:
+            분석 결과
+        """
+        state = BehaviorSessionState()
+        self._update_keyboard(state, keyboard_events_to_array(keyboard_events))
+        return self._keyboard_summary(state)
+
+    def analyze_clickstream(self, clickstream: Events) -> Dict[str, Any]:
+        """
+        클릭스트림 분석 (페이지 체류 시간 이상치 탐지)
+
+        Args:
+            clickstream: 클릭스트림 데이터
+                [{"page": str, "timestamp": int, "duration": int}]
+
+        Returns:
+            분석 결과
+        """
+        state = BehaviorSessionState()
+        self._update_clickstream(state, clickstream_to_array(clickstream))
+        return self._clickstream_summary(state)
+
+    # ------------------------------------------------------------------
+    # 벡터화 누적 (청크당 필드별 1회 연산)
+    # ------------------------------------------------------------------
+
+    def _update_mouse(self, state: BehaviorSessionState, events: np.ndarray) -> None:
+        if events.size == 0:
+            return
+        speeds = events["speed"][~np.isnan(events["speed"])]
+        curvatures = events["curvature"][~np.isnan(events["curvature"])]
+        accelerations = events["acceleration"]
+
+        state.mouse_total += int(events.size)
+        state.mouse_speed.update(speeds)
+        state.mouse_acceleration.update(accelerations[~np.isnan(accelerations)])
+        state.mouse_curvature.update(curvatures)
+        state.mouse_low_curvature += int(
+            np.count_nonzero(curvatures < self.MOUSE_LOW_CURVATURE_THRESHOLD)
+        )
+        state.mouse_high_speed += int(
+            np.count_nonzero(speeds > self.MOUSE_HIGH_SPEED_THRESHOLD)
+        )
+
+    def _update_keyboard(self, state: BehaviorSessionState, events: np.ndarray) -> None:
+        if events.size == 0:
+            return
+        durations = events["duration"][~np.isnan(events["duration"])]
+
+        state.keyboard_total += int(events.size)
+        state.keyboard_duration.update(durations)
+        state.keyboard_backspace += int(np.count_nonzero(events["is_backspace"]))
+        state.keyboard_fast += int(
+            np.count_nonzero(durations < self.KEYBOARD_FAST_TYPING_THRESHOLD)
+        )
+
+    def _update_clickstream(
+        self, state: BehaviorSessionState, events: np.ndarray
+    ) -> None:
+        if events.size == 0:
+            return
+        durations = events["duration"][~np.isnan(events["duration"])]
+
+        state.clickstream_total += int(events.size)
+        state.clickstream_duration.update(durations)
+        state.clickstream_short += int(
+            np.count_nonzero(durations < self.CLICKSTREAM_SHORT_DURATION_THRESHOLD)
+        )
+        state.clickstream_long += int(
+            np.count_nonzero(durations > self.CLICKSTREAM_LONG_DURATION_THRESHOLD)
+        )
+
+    # ------------------------------------------------------------------
+    # 누적 통계 → 분석 결과
+    # ------------------------------------------------------------------
+
+    def _mouse_summary(self, state: BehaviorSessionState) -> Dict[str, Any]:
+        if state.mouse_total == 0:
             return {
                 "avg_speed": 0,
                 "avg_acceleration": 0,
@@ -84,87 +337,54 @@ class BehaviorAnalysisEngine:
                 "total_movements": 0,
             }
 
-        speeds = [m["speed"] for m in mouse_movements if "speed" in m]
-        accelerations = [
-            m["acceleration"] for m in mouse_movements if "acceleration" in m
-        ]
-        curvatures = [m["curvature"] for m in mouse_movements if "curvature" in m]
-
-        # 통계 계산
-        avg_speed = statistics.mean(speeds) if speeds else 0
-        avg_acceleration = statistics.mean(accelerations) if accelerations else 0
-        avg_curvature = statistics.mean(curvatures) if curvatures else 0
+        curvature_count = state.mouse_curvature.count
+        speed_count = state.mouse_speed.count
 
         # 낮은 곡률 비율 (직선 움직임 = 봇)
-        low_curvature_count = sum(
-            1 for c in curvatures if c < self.MOUSE_LOW_CURVATURE_THRESHOLD
-        )
         low_curvature_ratio = (
-            low_curvature_count / len(curvatures) if curvatures else 1.0
+            state.mouse_low_curvature / curvature_count if curvature_count else 1.0
         )
-
         # 높은 속도 비율 (비정상 빠른 속도 = 봇)
-        high_speed_count = sum(1 for s in speeds if s > self.MOUSE_HIGH_SPEED_THRESHOLD)
-        high_speed_ratio = high_speed_count / len(speeds) if speeds else 0
+        high_speed_ratio = state.mouse_high_speed / speed_count if speed_count else 0
 
         # 봇과 유사한 패턴 판별
         is_bot_like = (
             low_curvature_ratio > 0.7  # 70% 이상 직선 움직임
             or high_speed_ratio > 0.5  # 50% 이상 비정상 속도
-            or len(mouse_movements) < 10  # 마우스 움직임 너무 적음
+            or state.mouse_total < 10  # 마우스 움직임 너무 적음
         )
 
         return {
-            "avg_speed": round(avg_speed, 2),
-            "avg_acceleration": round(avg_acceleration, 2),
-            "avg_curvature": round(avg_curvature, 4),
+            "avg_speed": round(state.mouse_speed.mean, 2),
+            "avg_acceleration": round(state.mouse_acceleration.mean, 2),
+            "avg_curvature": round(state.mouse_curvature.mean, 4),
             "low_curvature_ratio": round(low_curvature_ratio, 2),
             "high_speed_ratio": round(high_speed_ratio, 2),
             "is_bot_like": is_bot_like,
-            "total_movements": len(mouse_movements),
+            "total_movements": state.mouse_total,
         }
 
-    def analyze_keyboard_typing(
-        self, keyboard_events: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """
-        키보드 타이핑 패턴 분석 (입력 속도, 백스페이스 빈도)
-
-        Args:
-            keyboard_events: 키보드 이벤트 데이터
-                [{"timestamp": int, "key": str, "duration": int}]
-
-        Returns:
-            분석 결과
-        """
-        if not keyboard_events:
+    def _keyboard_summary(self, state: BehaviorSessionState) -> Dict[str, Any]:
+        if state.keyboard_total == 0:
             return {
                 "avg_typing_speed": 0,
                 "backspace_ratio": 0,
                 "fast_typing_ratio": 0,
+                "typing_speed_stddev": 0,
                 "is_bot_like": False,  # 타이핑 없음은 정상 (마우스만 사용)
                 "total_keystrokes": 0,
             }
 
-        durations = [e["duration"] for e in keyboard_events if "duration" in e]
-        avg_duration = statistics.mean(durations) if durations else 0
+        durations = state.keyboard_duration
 
         # 백스페이스 빈도 (사람은 실수로 백스페이스 자주 누름)
-        backspace_count = sum(
-            1 for e in keyboard_events if e.get("key") in ["Backspace", "Delete"]
-        )
-        backspace_ratio = (
-            backspace_count / len(keyboard_events) if keyboard_events else 0
-        )
-
+        backspace_ratio = state.keyboard_backspace / state.keyboard_total
         # 빠른 타이핑 비율 (봇은 일정한 빠른 속도)
-        fast_typing_count = sum(
-            1 for d in durations if d < self.KEYBOARD_FAST_TYPING_THRESHOLD
+        fast_typing_ratio = (
+            state.keyboard_fast / durations.count if durations.count else 0
         )
-        fast_typing_ratio = fast_typing_count / len(durations) if durations else 0
-
         # 타이핑 속도 변동 (표준편차 작음 = 일정한 속도 = 봇)
-        typing_speed_stddev = statistics.stdev(durations) if len(durations) > 1 else 0
+        typing_speed_stddev = durations.stdev
 
         # 봇과 유사한 패턴 판별
         is_bot_like = (
@@ -174,66 +394,49 @@ class BehaviorAnalysisEngine:
         )
 
         return {
-            "avg_typing_speed": round(avg_duration, 2),
+            "avg_typing_speed": round(durations.mean, 2),
             "backspace_ratio": round(backspace_ratio, 2),
             "fast_typing_ratio": round(fast_typing_ratio, 2),
             "typing_speed_stddev": round(typing_speed_stddev, 2),
             "is_bot_like": is_bot_like,
-            "total_keystrokes": len(keyboard_events),
+            "total_keystrokes": state.keyboard_total,
         }
 
-    def analyze_clickstream(self, clickstream: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        클릭스트림 분석 (페이지 체류 시간 이상치 탐지)
-
-        Args:
-            clickstream: 클릭스트림 데이터
-                [{"page": str, "timestamp": int, "duration": int}]
-
-        Returns:
-            분석 결과
-        """
-        if not clickstream:
+    def _clickstream_summary(self, state: BehaviorSessionState) -> Dict[str, Any]:
+        if state.clickstream_total == 0:
             return {
                 "avg_page_duration": 0,
                 "short_duration_ratio": 0,
                 "long_duration_ratio": 0,
+                "duration_stddev": 0,
                 "is_bot_like": False,
                 "total_pages": 0,
             }
 
-        durations = [c["duration"] for c in clickstream if "duration" in c]
-        avg_duration = statistics.mean(durations) if durations else 0
+        durations = state.clickstream_duration
+        count = durations.count
 
         # 짧은 체류 시간 비율 (봇은 빠르게 페이지 전환)
-        short_duration_count = sum(
-            1 for d in durations if d < self.CLICKSTREAM_SHORT_DURATION_THRESHOLD
-        )
-        short_duration_ratio = short_duration_count / len(durations) if durations else 0
-
+        short_duration_ratio = state.clickstream_short / count if count else 0
         # 긴 체류 시간 비율 (봇이 멈춤)
-        long_duration_count = sum(
-            1 for d in durations if d > self.CLICKSTREAM_LONG_DURATION_THRESHOLD
-        )
-        long_duration_ratio = long_duration_count / len(durations) if durations else 0
-
+        long_duration_ratio = state.clickstream_long / count if count else 0
         # 페이지 체류 시간 변동 (표준편차 작음 = 일정한 패턴 = 봇)
-        duration_stddev = statistics.stdev(durations) if len(durations) > 1 else 0
+        duration_stddev = durations.stdev
 
         # 봇과 유사한 패턴 판별
         is_bot_like = (
             short_duration_ratio > 0.7  # 70% 이상 매우 짧은 체류
             or duration_stddev < 500  # 체류 시간 변동 거의 없음
-            or avg_duration < 1000  # 평균 체류 시간 < 1초
+            or durations.mean < 1000  # 평균 체류 시간 < 1초
         )
 
         return {
-            "avg_page_duration": round(avg_duration, 2),
+            "avg_page_duration": round(durations.mean, 2),
             "short_duration_ratio": round(short_duration_ratio, 2),
             "long_duration_ratio": round(long_duration_ratio, 2),
             "duration_stddev": round(duration_stddev, 2),
             "is_bot_like": is_bot_like,
-            "total_pages": len(clickstream),
+            "total_pages": state.clickstream_total,
         }
 
     def calculate_bot_score(
@@ -26,6 +26,7 @@ from ..models import (
     ThreatLevel,
     ThreatSource,
 )
+from ..services.bin_range_db import get_bin_range_db
 
 
 class CTIConfig:
@@ -207,7 +208,24 @@ class CTIConnector:
             ThreatType.CARD_BIN, card_bin
         )
 
-        # 3. 캐시에 저장
+        # 3. 로컬 BIN 범위 DB로 발급 정보 보강 (외부 API 호출 없음)
+        try:
+            bin_record = get_bin_range_db().lookup_local(card_bin)
+        except ValueError:
+            bin_record = None
+        internal_result.metadata["bin_info"] = (
+            {
+                "country": bin_record.country or None,
+                "scheme": bin_record.scheme,
+                "card_type": bin_record.card_type,
+                "prepaid": bin_record.prepaid,
+                "bank_name": bin_record.bank_name or None,
+            }
+            if bin_record
+            else None
+        )
+
+        # 4. 캐시에 저장
         await self._save_to_cache(internal_result)
 
         return internal_result
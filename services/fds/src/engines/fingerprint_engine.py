@@ -15,6 +15,35 @@ import pycountry
 logger = logging.getLogger(__name__)
 
 
+def compute_device_id(
+    canvas_hash: str,
+    webgl_hash: str,
+    audio_hash: str,
+    cpu_cores: int,
+    screen_resolution: str,
+    timezone: str,
+    language: str,
+) -> str:
+    """
+    디바이스 ID 계산 (클라이언트와 동일한 알고리즘)
+
+    API 수집 경로와 통합 평가 엔진이 모두 이 함수를 사용한다.
+
+    Returns:
+        64자 SHA-256 해시 문자열
+    """
+    components = [
+        canvas_hash,
+        webgl_hash,
+        audio_hash,
+        str(cpu_cores),
+        screen_resolution,
+        timezone,
+        language,
+    ]
+    return hashlib.sha256("|".join(components).encode()).hexdigest()
+
+
 class FingerprintEngine:
     """디바이스 핑거프린팅 분석 엔진"""
 
@@ -74,19 +103,17 @@ class FingerprintEngine:
         Returns:
             64자 SHA-256 해시 문자열
         """
-        components = [
+        device_id = compute_device_id(
             canvas_hash,
             webgl_hash,
             audio_hash,
-            str(cpu_cores),
+            cpu_cores,
             screen_resolution,
             timezone,
             language,
-        ]
-        combined = "|".join(components)
-        device_id = hashlib.sha256(combined.encode()).hexdigest()
+        )
 
-        logger.debug(f"Generated device ID: {device_id} from components: {components}")
+        logger.debug(f"Generated device ID: {device_id}")
         return device_id
 
     def get_country_from_timezone(self, timezone: str) -> Optional[str]:
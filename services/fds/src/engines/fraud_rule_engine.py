@@ -25,7 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from redis import asyncio as aioredis
 
 from ..models.fraud_rule import RuleCategory
-from ..models.rule_execution import RuleExecution
+from ..services.bin_range_db import get_bin_range_db
 
 
 class RuleAction:
@@ -231,7 +231,7 @@ class FraudRuleEngine:
         """P2. 카드 BIN과 청구 국가 불일치"""
         rule_name = "P2: 카드 BIN 국가 불일치"
 
-        # BIN으로 카드 발급 국가 조회 (간단한 예시)
+        # BIN으로 카드 발급 국가 조회
         bin_country = await self._get_bin_country(tx.card_bin)
         matched = bin_country and bin_country != tx.billing_country
 
@@ -1004,14 +1004,8 @@ class FraudRuleEngine:
     # ========================================================================
 
     async def _get_bin_country(self, card_bin: str) -> Optional[str]:
-        """카드 BIN으로 발급 국가 조회 (Mock)"""
-        # 실제로는 BIN Database API 호출
-        bin_country_map = {
-            "123456": "US",
-            "411111": "US",  # 테스트 카드
-            "543210": "KR",
-        }
-        return bin_country_map.get(card_bin, "KR")
+        """카드 BIN으로 발급 국가 조회 (로컬 BIN 범위 DB, 알 수 없으면 None)"""
+        return await get_bin_range_db().get_country(card_bin)
 
     async def _get_ip_country(self, ip_address: str) -> Optional[str]:
         """IP 주소로 국가 조회 (Mock)"""
@@ -1031,30 +1025,3 @@ class FraudRuleEngine:
 
         # 데이터베이스 조회 (여기서는 0 반환 - Mock)
         return 0
-
-    async def save_rule_executions(
-        self, transaction_id: UUID, results: List[RuleResult]
-    ) -> List[RuleExecution]:
-        """룰 실행 결과를 데이터베이스에 저장"""
-        executions = []
-
-        for result in results:
-            if result.matched:  # 매칭된 룰만 저장
-                execution = RuleExecution(
-                    transaction_id=transaction_id,
-                    rule_id=result.rule_id,
-                    matched=True,
-                    metadata={
-                        "rule_name": result.rule_name,
-                        "rule_category": result.rule_category.value,
-                        "risk_score": result.risk_score,
-                        "action": result.action,
-                        "description": result.description,
-                        **result.metadata,
-                    },
-                )
-                self.db.add(execution)
-                executions.append(execution)
-
-        await self.db.flush()
-        return executions
@@ -19,6 +19,7 @@
 5. ML 모델 평가 (앙상블 모델)
 6. 종합 위험 점수 산출
 7. 의사결정 및 권장 조치 생성
+8. (선택) 후보 룰/모델 shadow 평가 제출 (응답 경로 밖에서 실행)
 
 **성능 목표**:
 - P95 평가 시간: 50ms 이내
@@ -28,7 +29,7 @@
 
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from decimal import Decimal
 
@@ -40,6 +41,13 @@ from ..engines.behavior_analysis_engine import BehaviorAnalysisEngine
 from ..engines.network_analysis_engine import NetworkAnalysisEngine
 from ..engines.fraud_rule_engine import FraudRuleEngine, TransactionData
 from ..engines.ml_engine import MLEngine
+from ..engines.rule_engine import TransactionContext
+from ..data.loaders import (
+    get_disposable_email_domains,
+    get_freight_forwarders,
+    get_test_cards,
+)
+from ..services.shadow_evaluation import ShadowCandidate, ShadowEvaluator
 from ..models.schemas import (
     FDSEvaluationRequest,
     FDSEvaluationResponse,
@@ -68,6 +76,7 @@ class IntegratedEvaluationEngine:
         ml_model_path: Optional[str] = None,
         geoip_db_path: Optional[str] = None,
         asn_db_path: Optional[str] = None,
+        shadow_evaluator: Optional[ShadowEvaluator] = None,
     ):
         """
         통합 평가 엔진 초기화
@@ -78,9 +87,11 @@ class IntegratedEvaluationEngine:
             ml_model_path: ML 모델 파일 경로 (선택)
             geoip_db_path: GeoIP 데이터베이스 경로 (선택)
             asn_db_path: ASN 데이터베이스 경로 (선택)
+            shadow_evaluator: 후보 룰/모델 shadow 평가기 (선택)
         """
         self.db = db
         self.redis = redis
+        self.shadow_evaluator = shadow_evaluator
 
         # 각 엔진 초기화
         self.fingerprint_engine = FingerprintEngine()
@@ -102,7 +113,13 @@ class IntegratedEvaluationEngine:
                 )
 
         # Fraud Rule Engine
-        self.fraud_rule_engine = FraudRuleEngine(db=db, redis=redis)
+        self.fraud_rule_engine = FraudRuleEngine(
+            db=db,
+            redis=redis,
+            test_cards=get_test_cards(),
+            freight_forwarders=get_freight_forwarders(),
+            disposable_email_domains=get_disposable_email_domains(),
+        )
 
         # ML Engine
         self.ml_engine = None
@@ -208,7 +225,7 @@ class IntegratedEvaluationEngine:
                 f"ml: {self._timing_stats['ml_time_ms']}ms"
             )
 
-        return FDSEvaluationResponse(
+        response = FDSEvaluationResponse(
             transaction_id=request.transaction_id,
             risk_score=risk_score,
             risk_level=risk_level,
@@ -218,6 +235,61 @@ class IntegratedEvaluationEngine:
             recommended_action=recommended_action,
         )
 
+        # 10. Shadow 평가 제출 (큐 적재만, 가득 차면 버림)
+        if self.shadow_evaluator is not None and self.shadow_evaluator.enabled:
+            self.shadow_evaluator.submit(self, request, response)
+
+        return response
+
+    async def evaluate_shadow(
+        self,
+        request: FDSEvaluationRequest,
+        live_response: FDSEvaluationResponse,
+        candidate: ShadowCandidate,
+    ) -> Tuple[int, DecisionEnum]:
+        """
+        후보 구성으로 재채점 (ShadowEvaluator 워커에서 호출)
+
+        라이브 위험 요인을 재사용하고, 후보 ML 모델이 있으면 ML 요인을 교체,
+        후보 룰이 있으면 그 요인을 더한 뒤 라이브와 같은 점수/결정 로직을 적용한다.
+
+        Args:
+            request: FDS 평가 요청
+            live_response: 라이브 평가 응답
+            candidate: shadow 후보 구성
+
+        Returns:
+            Tuple[int, DecisionEnum]: 후보 위험 점수와 결정
+        """
+        risk_factors = list(live_response.risk_factors)
+
+        if candidate.ml_engine is not None:
+            risk_factors = [
+                f for f in risk_factors if not f.factor_type.startswith("ml_")
+            ]
+            ml_result = await candidate.ml_engine.evaluate(
+                self._convert_to_dict(request)
+            )
+            risk_factors.extend(self._ml_result_to_factors(ml_result))
+
+        if candidate.rule_engine is not None:
+            rule_results = await candidate.rule_engine.evaluate_transaction(
+                self._convert_to_rule_context(request)
+            )
+            for rule_result in rule_results:
+                risk_factors.append(
+                    RiskFactor(
+                        factor_type=f"rule_{getattr(rule_result.rule_type, 'value', rule_result.rule_type)}",
+                        factor_score=rule_result.risk_score,
+                        description=f"[SHADOW RULE] {rule_result.description}",
+                        severity=SeverityEnum(rule_result.severity.value),
+                    )
+                )
+
+        risk_score = self._calculate_risk_score(risk_factors)
+        risk_level = self._classify_risk_level(risk_score, risk_factors)
+        return risk_score, self._make_decision(risk_level, risk_factors)
+
     async def _evaluate_fingerprint(
         self, request: FDSEvaluationRequest
     ) -> List[RiskFactor]:
@@ -497,6 +569,7 @@ class IntegratedEvaluationEngine:
                             severity=severity_map.get(
                                 rule_result.action, SeverityEnum.MEDIUM
                             ),
+                            rule_id=str(rule_result.rule_id),
                         )
                     )
 
@@ -536,35 +609,8 @@ class IntegratedEvaluationEngine:
             # ML 평가
             ml_result = await self.ml_engine.evaluate(transaction_dict)
 
-            anomaly_score = ml_result.get("anomaly_score", 0)
-            is_anomaly = ml_result.get("is_anomaly", False)
-            confidence = ml_result.get("confidence", 0)
-
             # 이상 탐지 결과를 RiskFactor로 변환
-            if is_anomaly and anomaly_score >= 80:
-                risk_factors.append(
-                    RiskFactor(
-                        factor_type="ml_anomaly_high",
-                        factor_score=int(anomaly_score),
-                        description=(
-                            f"ML 이상 거래 탐지 (점수: {anomaly_score:.1f}, "
-                            f"신뢰도: {confidence:.2f})"
-                        ),
-                        severity=SeverityEnum.HIGH,
-                    )
-                )
-            elif is_anomaly and anomaly_score >= 60:
-                risk_factors.append(
-                    RiskFactor(
-                        factor_type="ml_anomaly_medium",
-                        factor_score=int(anomaly_score),
-                        description=(
-                            f"ML 의심 거래 탐지 (점수: {anomaly_score:.1f}, "
-                            f"신뢰도: {confidence:.2f})"
-                        ),
-                        severity=SeverityEnum.MEDIUM,
-                    )
-                )
+            risk_factors.extend(self._ml_result_to_factors(ml_result))
 
         except Exception as e:
             logger.error(f"ML evaluation failed: {e}")
@@ -573,6 +619,46 @@ class IntegratedEvaluationEngine:
         self._timing_stats["ml_time_ms"] = int((time.time() - start_time) * 1000)
         return risk_factors
 
+    def _ml_result_to_factors(self, ml_result: Dict[str, Any]) -> List[RiskFactor]:
+        """
+        ML 평가 결과를 RiskFactor로 변환 (80점 이상 HIGH, 60점 이상 MEDIUM)
+
+        Args:
+            ml_result: MLEngine.evaluate 결과
+
+        Returns:
+            List[RiskFactor]: ML 기반 위험 요인
+        """
+        anomaly_score = ml_result.get("anomaly_score", 0)
+        is_anomaly = ml_result.get("is_anomaly", False)
+        confidence = ml_result.get("confidence", 0)
+
+        if is_anomaly and anomaly_score >= 80:
+            return [
+                RiskFactor(
+                    factor_type="ml_anomaly_high",
+                    factor_score=int(anomaly_score),
+                    description=(
+                        f"ML 이상 거래 탐지 (점수: {anomaly_score:.1f}, "
+                        f"신뢰도: {confidence:.2f})"
+                    ),
+                    severity=SeverityEnum.HIGH,
+                )
+            ]
+        if is_anomaly and anomaly_score >= 60:
+            return [
+                RiskFactor(
+                    factor_type="ml_anomaly_medium",
+                    factor_score=int(anomaly_score),
+                    description=(
+                        f"ML 의심 거래 탐지 (점수: {anomaly_score:.1f}, "
+                        f"신뢰도: {confidence:.2f})"
+                    ),
+                    severity=SeverityEnum.MEDIUM,
+                )
+            ]
+        return []
+
     def _convert_to_transaction_data(
         self, request: FDSEvaluationRequest
     ) -> TransactionData:
@@ -613,6 +699,33 @@ class IntegratedEvaluationEngine:
             created_at=datetime.utcnow(),
         )
 
+    def _convert_to_rule_context(
+        self, request: FDSEvaluationRequest
+    ) -> TransactionContext:
+        """
+        FDSEvaluationRequest를 TransactionContext로 변환 (DetectionRule 입력)
+
+        Args:
+            request: FDS 평가 요청
+
+        Returns:
+            TransactionContext: 룰 엔진 입력 데이터
+        """
+        return TransactionContext(
+            transaction_id=request.transaction_id,
+            user_id=request.user_id,
+            order_id=request.order_id,
+            amount=request.amount,
+            ip_address=request.ip_address,
+            user_agent=request.user_agent,
+            device_type=request.device_fingerprint.device_type.value,
+            payment_info=request.payment_info.model_dump(),
+            session_context=request.session_context.model_dump()
+            if request.session_context
+            else None,
+            timestamp=request.timestamp.replace(tzinfo=None),
+        )
+
     def _convert_to_dict(self, request: FDSEvaluationRequest) -> Dict[str, Any]:
         """
         FDSEvaluationRequest를 딕셔너리로 변환 (ML 입력)
@@ -4,6 +4,7 @@ ML 기반 이상 탐지 엔진
 기능:
 - ML 모델을 사용한 이상 거래 탐지
 - Isolation Forest, LightGBM 모델 지원
+- ONNX 모델(.onnx) 세션 풀 서빙 (이벤트 루프 비차단)
 - 카나리 배포 지원 (트래픽 분할)
 - 실시간 특징 추출 및 예측
 """
@@ -15,6 +16,8 @@ from datetime import datetime
 
 import numpy as np
 
+from .onnx_model_pool import ONNXModelPool, MODEL_KIND_ANOMALY
+
 
 class MLEngine:
     """ML 기반 이상 탐지 엔진"""
@@ -25,14 +28,17 @@ class MLEngine:
         canary_enabled: bool = False,
         canary_model_path: Optional[str] = None,
         canary_traffic_percentage: int = 0,
+        onnx_pool_size: Optional[int] = None,
     ):
         """
         Args:
-            model_path: 프로덕션 모델 파일 경로
+            model_path: 프로덕션 모델 파일 경로 (.pkl 또는 .onnx)
             canary_enabled: 카나리 배포 활성화 여부
             canary_model_path: 카나리 모델 파일 경로 (선택)
             canary_traffic_percentage: 카나리 트래픽 비율 (0-100)
+            onnx_pool_size: ONNX 모델 세션 풀 크기 (기본: min(4, CPU 수))
         """
+        self.onnx_pool_size = onnx_pool_size
         self.model_path = model_path
         self.canary_enabled = canary_enabled
         self.canary_model_path = canary_model_path
@@ -56,6 +62,8 @@ class MLEngine:
         """
         모델 로드
 
+        .onnx 파일은 ONNX Runtime 세션 풀로, 그 외는 pickle 로 로드
+
         Args:
             model_path: 모델 파일 경로
 
@@ -63,6 +71,8 @@ class MLEngine:
             Any: 로드된 모델 객체
         """
         try:
+            if model_path.endswith(".onnx"):
+                return ONNXModelPool(model_path, pool_size=self.onnx_pool_size)
             with open(model_path, "rb") as f:
                 model = pickle.load(f)
             return model
@@ -131,31 +141,40 @@ class MLEngine:
             # 특징 벡터 생성
             feature_vector = np.array([list(features.values())])
 
+            if isinstance(model, ONNXModelPool):
+                # ONNX Runtime 세션 풀 (스레드 풀에서 실행, GIL 해제)
+                # 입력은 ONNX 메타데이터의 학습 시 특성 순서로 정렬
+                scores = await model.run_async(model.feature_vector(features))
+                if model.model_kind == MODEL_KIND_ANOMALY:
+                    anomaly_score_raw = float(scores[0])
+                    anomaly_score, is_anomaly, confidence = self._score_from_decision(
+                        anomaly_score_raw, anomaly_score_raw < 0
+                    )
+                else:
+                    (
+                        anomaly_score,
+                        is_anomaly,
+                        confidence,
+                    ) = self._score_from_probability(float(scores[0][1]))
+
             # Isolation Forest 예측
-            if hasattr(model, "decision_function"):
+            elif hasattr(model, "decision_function"):
                 # Isolation Forest: decision_function 사용 (낮을수록 이상)
                 anomaly_scores = model.decision_function(feature_vector)
-                anomaly_score_raw = anomaly_scores[0]
-
-                # 점수를 0-100 범위로 정규화 (-1 ~ 0.5 범위 가정)
-                # -1 (이상) → 100, 0.5 (정상) → 0
-                anomaly_score = max(0, min(100, int((0.5 - anomaly_score_raw) * 100)))
 
                 # 예측 (-1: 이상, 1: 정상)
                 predictions = model.predict(feature_vector)
-                is_anomaly = predictions[0] == -1
 
-                # 신뢰도 계산 (0-1 범위)
-                confidence = abs(anomaly_score_raw) / 1.5
+                anomaly_score, is_anomaly, confidence = self._score_from_decision(
+                    anomaly_scores[0], predictions[0] == -1
+                )
 
             elif hasattr(model, "predict_proba"):
                 # LightGBM 등: predict_proba 사용
                 probabilities = model.predict_proba(feature_vector)
-                anomaly_probability = probabilities[0][1]  # 사기 확률
-
-                anomaly_score = int(anomaly_probability * 100)
-                is_anomaly = anomaly_probability > 0.5
-                confidence = max(anomaly_probability, 1 - anomaly_probability)
+                anomaly_score, is_anomaly, confidence = self._score_from_probability(
+                    probabilities[0][1]  # 사기 확률
+                )
 
             else:
                 # 기타 모델: predict만 사용
@@ -184,6 +203,31 @@ class MLEngine:
                 "error": f"예측 실패: {str(e)}",
             }
 
+    @staticmethod
+    def _score_from_decision(anomaly_score_raw: float, is_anomaly: bool):
+        """
+        Isolation Forest decision_function 점수를 (이상 점수, 이상 여부, 신뢰도)로 변환
+        """
+        # 점수를 0-100 범위로 정규화 (-1 ~ 0.5 범위 가정)
+        # -1 (이상) → 100, 0.5 (정상) → 0
+        anomaly_score = max(0, min(100, int((0.5 - anomaly_score_raw) * 100)))
+
+        # 신뢰도 계산 (0-1 범위)
+        confidence = abs(anomaly_score_raw) / 1.5
+
+        return anomaly_score, is_anomaly, confidence
+
+    @staticmethod
+    def _score_from_probability(anomaly_probability: float):
+        """
+        사기 확률을 (이상 점수, 이상 여부, 신뢰도)로 변환
+        """
+        anomaly_score = int(anomaly_probability * 100)
+        is_anomaly = anomaly_probability > 0.5
+        confidence = max(anomaly_probability, 1 - anomaly_probability)
+
+        return anomaly_score, is_anomaly, confidence
+
     def _extract_features(self, transaction_data: Dict[str, Any]) -> Dict[str, float]:
         """
         거래 데이터에서 ML 특징 추출
@@ -233,11 +277,12 @@ class MLEngine:
         # 로그인 빈도 (30일)
         features["login_count_30d"] = float(user_behavior.get("login_count_30d", 0))
 
-        # 시간대 특징 (UTC 기준)
-        current_hour = datetime.utcnow().hour
+        # 시간대 특징 (UTC 기준, 과거 거래 재채점 시 거래 발생 시각 기준)
+        reference_time = transaction_data.get("created_at") or datetime.utcnow()
+        current_hour = reference_time.hour
         features["hour"] = float(current_hour)
         features["is_night"] = 1.0 if (current_hour < 6 or current_hour > 22) else 0.0
-        features["is_weekend"] = 1.0 if datetime.utcnow().weekday() >= 5 else 0.0
+        features["is_weekend"] = 1.0 if reference_time.weekday() >= 5 else 0.0
 
         # 지역 불일치 (등록 국가 vs 현재 국가)
         geolocation = transaction_data.get("geolocation", {})
@@ -406,6 +451,9 @@ class MLEngine:
         """
         return {
             "production_model_loaded": self.production_model is not None,
+            "production_model_runtime": (
+                "onnx" if isinstance(self.production_model, ONNXModelPool) else "pickle"
+            ),
             "production_model_path": self.model_path,
             "production_requests": self.production_requests,
             "canary_enabled": self.canary_enabled,
@@ -0,0 +1,154 @@
+"""
+ONNX Runtime 모델 세션 풀
+
+ml-service 의 TreeModelONNXExporter 가 변환한 트리 모델(.onnx)을 서빙한다.
+- 세션 풀: 동시 요청마다 독립된 InferenceSession 사용
+- 세션별 intra/inter-op 스레드 튜닝 (소형 트리 모델은 1 스레드가 최적)
+- IO 바인딩으로 필요한 점수 출력만 CPU 버퍼에 복사
+- 전용 스레드 풀에서 실행 (ONNX Runtime 이 GIL을 해제하므로 병렬 추론 가능)
+"""
+
+import asyncio
+import json
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# ml-service TreeModelONNXExporter 와 공유하는 metadata_props 키
+METADATA_MODEL_KIND = "shopfds.model_kind"
+METADATA_FEATURE_NAMES = "shopfds.feature_names"
+
+MODEL_KIND_ANOMALY = "anomaly"  # 출력: label(-1/1), scores(decision_function)
+MODEL_KIND_CLASSIFIER = "classifier"  # 출력: label, probabilities(N, 2)
+
+
+class ONNXModelPool:
+    """ONNX Runtime InferenceSession 풀"""
+
+    def __init__(
+        self,
+        model_path: str,
+        pool_size: Optional[int] = None,
+        intra_op_threads: int = 1,
+        inter_op_threads: int = 1,
+    ):
+        """
+        Args:
+            model_path: ONNX 모델 파일 경로
+            pool_size: 세션 수 (기본: min(4, CPU 수))
+            intra_op_threads: 세션별 연산 내 스레드 수
+            inter_op_threads: 세션별 연산 간 스레드 수
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ValueError("onnxruntime 이 설치되어 있지 않습니다")
+
+        self.model_path = model_path
+        self.pool_size = pool_size or min(4, os.cpu_count() or 1)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        options.log_severity_level = 3
+
+        self._sessions: "queue.Queue[ort.InferenceSession]" = queue.Queue()
+        for _ in range(self.pool_size):
+            self._sessions.put(
+                ort.InferenceSession(
+                    model_path,
+                    sess_options=options,
+                    providers=["CPUExecutionProvider"],
+                )
+            )
+
+        # 메타데이터 / 입출력 정보 (모든 세션 동일)
+        session = self._sessions.queue[0]
+        metadata = session.get_modelmeta().custom_metadata_map
+        self.model_kind = metadata.get(METADATA_MODEL_KIND, MODEL_KIND_CLASSIFIER)
+        self.feature_names: List[str] = json.loads(
+            metadata.get(METADATA_FEATURE_NAMES, "[]")
+        )
+
+        model_input = session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.n_features = model_input.shape[1]
+        # 두 번째 출력이 점수 (anomaly: scores, classifier: probabilities)
+        self.score_output = session.get_outputs()[1].name
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.pool_size, thread_name_prefix="onnx-pool"
+        )
+        self._warm_up()
+
+    def _warm_up(self):
+        """세션별 첫 추론 지연(메모리 할당 등)을 로드 시점에 소모"""
+        dummy = np.zeros((1, self.n_features), dtype=np.float32)
+        sessions = [self._sessions.get() for _ in range(self.pool_size)]
+        for session in sessions:
+            session.run([self.score_output], {self.input_name: dummy})
+            self._sessions.put(session)
+
+    def feature_vector(self, features: Dict[str, float]) -> np.ndarray:
+        """
+        특징 dict 를 학습 시 특성 순서대로 (1, n_features) 행렬로 변환
+
+        메타데이터에 특성 이름이 없으면 dict 순서를 그대로 사용
+
+        Raises:
+            KeyError: 모델이 요구하는 특성이 없는 경우
+        """
+        if not self.feature_names:
+            return np.array([list(features.values())])
+        return np.array([[features[name] for name in self.feature_names]])
+
+    def run(self, feature_matrix: np.ndarray) -> np.ndarray:
+        """
+        동기 추론 (IO 바인딩)
+
+        Args:
+            feature_matrix: (N, n_features) 특징 행렬
+
+        Returns:
+            np.ndarray: anomaly 모델은 (N,) decision 점수, classifier 는 (N, 2) 확률
+        """
+        inputs = np.ascontiguousarray(feature_matrix, dtype=np.float32)
+        session = self._sessions.get()
+        try:
+            binding = session.io_binding()
+            binding.bind_cpu_input(self.input_name, inputs)
+            binding.bind_output(self.score_output)
+            session.run_with_iobinding(binding)
+            scores = binding.copy_outputs_to_cpu()[0]
+        finally:
+            self._sessions.put(session)
+
+        if self.model_kind == MODEL_KIND_ANOMALY:
+            return scores.ravel()
+        return scores
+
+    async def run_async(self, feature_matrix: np.ndarray) -> np.ndarray:
+        """이벤트 루프를 막지 않도록 전용 스레드 풀에서 추론"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.run, feature_matrix)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            "model_path": self.model_path,
+            "model_kind": self.model_kind,
+            "pool_size": self.pool_size,
+            "n_features": self.n_features,
+        }
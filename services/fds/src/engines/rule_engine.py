@@ -8,7 +8,7 @@ FDS의 핵심 컴포넌트로, 데이터베이스에 저장된 탐지 룰을 로
 1. 활성화된 룰을 데이터베이스에서 동적으로 로드
 2. 우선순위에 따라 룰을 순차적으로 평가
 3. 각 룰의 조건을 검증하고 위험 점수 산정
-4. 탐지된 위험 요인을 RiskFactor로 기록
+4. 탐지된 위험 요인을 평가 결과로 반환
 """
 
 from typing import List, Dict, Any, Optional
@@ -23,7 +23,6 @@ from redis import asyncio as aioredis
 from ..models import (
     DetectionRule,
     RiskFactor,
-    FactorType,
     FactorSeverity,
     RuleType,
 )
@@ -291,7 +290,7 @@ class RuleEngine:
                     rule_type=rule.rule_type,
                     triggered=True,
                     risk_score=rule.risk_score_weight,
-                    severity=FactorSeverity.determine_severity(rule.risk_score_weight),
+                    severity=RiskFactor.determine_severity(rule.risk_score_weight),
                     description=f"{scope}={scope_value}에서 {window_seconds}초 내 {transaction_count}회 거래 시도 (임계값: {max_transactions}회)",
                     metadata={
                         "scope": scope,
@@ -362,7 +361,7 @@ class RuleEngine:
                 rule_type=rule.rule_type,
                 triggered=True,
                 risk_score=rule.risk_score_weight,
-                severity=FactorSeverity.determine_severity(rule.risk_score_weight),
+                severity=RiskFactor.determine_severity(rule.risk_score_weight),
                 description=f"거래 금액({actual_value:,.0f}원)이 임계값({threshold_value:,.0f}원) {operator}",
                 metadata={
                     "field": field,
@@ -433,7 +432,7 @@ class RuleEngine:
                 rule_type=rule.rule_type,
                 triggered=True,
                 risk_score=rule.risk_score_weight,
-                severity=FactorSeverity.determine_severity(rule.risk_score_weight),
+                severity=RiskFactor.determine_severity(rule.risk_score_weight),
                 description=f"등록 주소({registered_region})와 IP 위치({current_region}) 불일치: {distance_km:.1f}km (임계값: {max_distance_km}km)",
                 metadata={
                     "registered_location": {
@@ -521,7 +520,7 @@ class RuleEngine:
                 rule_type=rule.rule_type,
                 triggered=True,
                 risk_score=rule.risk_score_weight,
-                severity=FactorSeverity.determine_severity(rule.risk_score_weight),
+                severity=RiskFactor.determine_severity(rule.risk_score_weight),
                 description=f"비정상 시간대 거래: {current_hour}시 (허용: {end_hour}시 이후)",
                 metadata={
                     "current_hour": current_hour,
@@ -555,52 +554,3 @@ class RuleEngine:
             rule_type=rule.rule_type,
             triggered=False,
         )
-
-    async def create_risk_factors(
-        self, transaction_id: UUID, results: List[RuleEvaluationResult]
-    ) -> List[RiskFactor]:
-        """
-        룰 평가 결과를 RiskFactor로 변환하여 데이터베이스에 저장
-
-        Args:
-            transaction_id: 거래 ID
-            results: 룰 평가 결과 목록
-
-        Returns:
-            List[RiskFactor]: 생성된 위험 요인 목록
-        """
-        risk_factors: List[RiskFactor] = []
-
-        for result in results:
-            # 룰 유형을 FactorType으로 매핑
-            factor_type_map = {
-                RuleType.VELOCITY: FactorType.VELOCITY_CHECK,
-                RuleType.THRESHOLD: FactorType.AMOUNT_THRESHOLD,
-                RuleType.LOCATION: FactorType.LOCATION_MISMATCH,
-                RuleType.BLACKLIST: FactorType.SUSPICIOUS_IP,
-                RuleType.TIME_PATTERN: FactorType.SUSPICIOUS_TIME,
-            }
-
-            factor_type = factor_type_map.get(
-                result.rule_type, FactorType.VELOCITY_CHECK
-            )
-
-            risk_factor = RiskFactor(
-                transaction_id=transaction_id,
-                factor_type=factor_type,
-                factor_score=result.risk_score,
-                severity=result.severity,
-                description=result.description,
-                risk_metadata={
-                    "rule_id": str(result.rule_id),
-                    "rule_name": result.rule_name,
-                    **result.metadata,
-                },
-            )
-
-            self.db.add(risk_factor)
-            risk_factors.append(risk_factor)
-
-        await self.db.flush()
-
-        return risk_factors
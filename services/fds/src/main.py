@@ -16,6 +16,13 @@ env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 from .models import init_db, close_db
+from .services.write_behind import get_write_behind_queue
+from .services.dashboard_rollup import get_dashboard_rollup
+from .services.review_queue_engine import get_review_queue_engine
+from .services.transaction_partitions import get_transaction_partition_manager
+from .services.device_fingerprint_service import get_device_fingerprint_service
+from .services.verification_cache import close_provider_clients
+from .services.shadow_evaluation import get_shadow_evaluator
 from .api.evaluation import router as evaluation_router
 from .api.integrated_evaluation import (
     router as integrated_evaluation_router,
@@ -51,11 +58,35 @@ async def lifespan(app: FastAPI):
     logger.info("FDS 서비스 시작 중...")
     await init_db()
     logger.info("데이터베이스 초기화 완료")
+    try:
+        # 거래 파티션 미리 생성 (이후 정기 관리는 Celery Beat)
+        await get_transaction_partition_manager().maintain()
+    except Exception as e:
+        logger.warning(f"거래 파티션 관리 실패: {e}")
+    rollup = await get_dashboard_rollup()
+    if rollup is not None:
+        # 플러시된 평가 결과를 대시보드 롤업 버킷에 반영 (스필 재생 전에 등록)
+        await rollup.mark_started()
+        rollup.attach(get_write_behind_queue())
+    await get_write_behind_queue().start()
+    review_queue_engine = await get_review_queue_engine()
+    if review_queue_engine is not None:
+        # DB 의 검토 대기 항목으로 할당 대기열 보정 후 만료 리스 회수 시작
+        await review_queue_engine.rebuild()
+        await review_queue_engine.start()
+    await get_device_fingerprint_service().start()
+    await get_shadow_evaluator().start()  # 워커 간 shadow 구성/집계 동기화
 
     yield
 
     # 종료 시
     logger.info("FDS 서비스 종료 중...")
+    await get_shadow_evaluator().stop()  # shadow 워커 종료 (대기 작업은 버림)
+    await get_device_fingerprint_service().stop()  # 남은 last_seen_at 갱신 기록
+    if review_queue_engine is not None:
+        await review_queue_engine.stop()  # 진행 중인 할당 상태 DB 반영
+    await get_write_behind_queue().stop()  # 남은 평가 결과 기록
+    await close_provider_clients()  # 외부 검증 API 커넥션 풀 종료
     await close_db()
     logger.info("데이터베이스 연결 종료 완료")
 
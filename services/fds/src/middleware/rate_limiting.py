@@ -7,7 +7,7 @@ DDoS 방어, API 남용 방지, 공정한 리소스 사용을 보장합니다.
 - IP 기반: 60 requests/minute (일반)
 - API Key 기반: 1000 requests/minute (인증된 서비스)
 - Endpoint별: 커스텀 제한
-- Sliding Window 알고리즘 사용
+- GCRA 알고리즘 사용 (src.utils.rate_limiter, 키당 O(1) 메모리)
 
 **응답 헤더**:
 - X-RateLimit-Limit: 최대 요청 수
@@ -15,6 +15,7 @@ DDoS 방어, API 남용 방지, 공정한 리소스 사용을 보장합니다.
 - X-RateLimit-Reset: 제한 리셋 시간 (Unix timestamp)
 """
 
+import math
 import time
 import logging
 from typing import Optional, Callable
@@ -23,6 +24,8 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from redis import asyncio as aioredis
 
+from src.utils.rate_limiter import GCRARateLimiter, RateLimitPolicy, RateLimitResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,17 +42,37 @@ class RateLimitConfig:
 
     # Endpoint별 커스텀 제한
     ENDPOINT_LIMITS = {
-        "/v1/fds/evaluate": {"limit": 100, "window": 60},  # 100 req/min
-        "/internal/fds/evaluate": {"limit": 500, "window": 60},  # 500 req/min
-        "/v1/fds/health": {"limit": 300, "window": 60},  # 300 req/min
+        "/v1/fds/evaluate": RateLimitPolicy(limit=100, window_seconds=60),
+        "/internal/fds/evaluate": RateLimitPolicy(limit=500, window_seconds=60),
+        "/v1/fds/health": RateLimitPolicy(limit=300, window_seconds=60),
     }
 
+    @classmethod
+    def policy_for(cls, endpoint: str, client_id: str) -> RateLimitPolicy:
+        """
+        요청에 적용할 정책 (Endpoint별 > 서비스 토큰 > IP 순)
+
+        Args:
+            endpoint: 엔드포인트 경로
+            client_id: 클라이언트 식별자
+
+        Returns:
+            RateLimitPolicy: 적용할 정책
+        """
+        if endpoint in cls.ENDPOINT_LIMITS:
+            return cls.ENDPOINT_LIMITS[endpoint]
+        if client_id.startswith("service:"):
+            return RateLimitPolicy(
+                limit=cls.SERVICE_LIMIT, window_seconds=cls.SERVICE_WINDOW
+            )
+        return RateLimitPolicy(limit=cls.IP_LIMIT, window_seconds=cls.IP_WINDOW)
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate Limiting 미들웨어
 
-    Sliding Window 알고리즘을 사용하여 요청 속도를 제한합니다.
+    GCRA 알고리즘을 사용하여 요청 속도를 제한합니다.
     """
 
     def __init__(self, app, redis: Optional[aioredis.Redis] = None):
@@ -60,7 +83,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self.redis = redis
-        self._in_memory_cache = {}  # Redis가 없을 때 사용
+        self.limiter = GCRARateLimiter(redis)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -80,12 +103,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Rate Limiting 체크
         client_id = self._get_client_id(request)
         endpoint = request.url.path
-        limit, window, remaining, reset_time = await self._check_rate_limit(
-            client_id, endpoint
-        )
+        limit, window, result = await self._check_rate_limit(client_id, endpoint)
+        reset_time = int(time.time() + result.reset_after)
 
         # Rate Limit 초과 시 429 응답
-        if remaining < 0:
+        if not result.allowed:
             logger.warning(
                 f"[RATE LIMIT EXCEEDED] client={client_id}, "
                 f"endpoint={endpoint}, limit={limit}/{window}s"
@@ -106,7 +128,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Limit": str(limit),
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Reset": str(reset_time),
-                    "Retry-After": str(window),
+                    "Retry-After": str(math.ceil(result.retry_after)),
                 },
             )
 
@@ -115,7 +137,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Rate Limit 헤더 추가
         response.headers["X-RateLimit-Limit"] = str(limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
         response.headers["X-RateLimit-Reset"] = str(reset_time)
 
         return response
@@ -149,142 +171,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     async def _check_rate_limit(
         self, client_id: str, endpoint: str
-    ) -> tuple[int, int, int, int]:
+    ) -> tuple[int, int, RateLimitResult]:
         """
-        Rate Limit 체크 및 업데이트 (Sliding Window)
+        Rate Limit 체크 및 업데이트 (GCRA)
 
         Args:
             client_id: 클라이언트 식별자
             endpoint: 엔드포인트 경로
 
         Returns:
-            tuple: (limit, window, remaining, reset_time)
-        """
-        # Endpoint별 제한 확인
-        if endpoint in RateLimitConfig.ENDPOINT_LIMITS:
-            config = RateLimitConfig.ENDPOINT_LIMITS[endpoint]
-            limit = config["limit"]
-            window = config["window"]
-        # 서비스 토큰 기반 제한
-        elif client_id.startswith("service:"):
-            limit = RateLimitConfig.SERVICE_LIMIT
-            window = RateLimitConfig.SERVICE_WINDOW
-        # IP 기반 제한 (기본)
-        else:
-            limit = RateLimitConfig.IP_LIMIT
-            window = RateLimitConfig.IP_WINDOW
-
-        current_time = int(time.time())
-        window_start = current_time - window
-
-        # Redis 사용 시
-        if self.redis:
-            return await self._check_rate_limit_redis(
-                client_id, endpoint, limit, window, current_time, window_start
-            )
-        # 인메모리 사용 시 (개발 환경)
-        else:
-            return self._check_rate_limit_memory(
-                client_id, endpoint, limit, window, current_time, window_start
-            )
-
-    async def _check_rate_limit_redis(
-        self,
-        client_id: str,
-        endpoint: str,
-        limit: int,
-        window: int,
-        current_time: int,
-        window_start: int,
-    ) -> tuple[int, int, int, int]:
+            tuple: (limit, window, 판정 결과)
         """
-        Redis 기반 Rate Limiting (Sliding Window)
-
-        Args:
-            client_id: 클라이언트 식별자
-            endpoint: 엔드포인트
-            limit: 최대 요청 수
-            window: 시간 윈도우 (초)
-            current_time: 현재 시간 (Unix timestamp)
-            window_start: 윈도우 시작 시간
-
-        Returns:
-            tuple: (limit, window, remaining, reset_time)
-        """
-        key = f"rate_limit:{client_id}:{endpoint}"
-
-        try:
-            # Sorted Set을 사용한 Sliding Window
-            # 1. 윈도우 밖의 오래된 요청 제거
-            await self.redis.zremrangebyscore(key, 0, window_start)
-
-            # 2. 현재 윈도우 내 요청 수 확인
-            request_count = await self.redis.zcard(key)
-
-            # 3. 새 요청 추가
-            await self.redis.zadd(key, {str(current_time): current_time})
-
-            # 4. TTL 설정 (윈도우 크기 + 여유)
-            await self.redis.expire(key, window + 10)
-
-            # 남은 요청 수 계산
-            remaining = max(0, limit - request_count - 1)
-
-            # 리셋 시간 (현재 윈도우 종료 시간)
-            reset_time = current_time + window
-
-            return limit, window, remaining, reset_time
-
-        except Exception as e:
-            logger.error(f"Redis Rate Limiting 실패: {e}")
-            # Redis 실패 시 제한 없이 통과 (Fail-Open)
-            return limit, window, limit, current_time + window
-
-    def _check_rate_limit_memory(
-        self,
-        client_id: str,
-        endpoint: str,
-        limit: int,
-        window: int,
-        current_time: int,
-        window_start: int,
-    ) -> tuple[int, int, int, int]:
-        """
-        인메모리 Rate Limiting (개발 환경용)
-
-        Args:
-            client_id: 클라이언트 식별자
-            endpoint: 엔드포인트
-            limit: 최대 요청 수
-            window: 시간 윈도우 (초)
-            current_time: 현재 시간
-            window_start: 윈도우 시작 시간
-
-        Returns:
-            tuple: (limit, window, remaining, reset_time)
-        """
-        key = f"{client_id}:{endpoint}"
-
-        # 캐시 초기화
-        if key not in self._in_memory_cache:
-            self._in_memory_cache[key] = []
-
-        # 오래된 요청 제거
-        self._in_memory_cache[key] = [
-            t for t in self._in_memory_cache[key] if t > window_start
-        ]
-
-        # 현재 요청 추가
-        self._in_memory_cache[key].append(current_time)
-
-        # 요청 수 계산
-        request_count = len(self._in_memory_cache[key])
-        remaining = max(0, limit - request_count)
-
-        # 리셋 시간
-        reset_time = current_time + window
-
-        return limit, window, remaining, reset_time
+        policy = RateLimitConfig.policy_for(endpoint, client_id)
+        result = await self.limiter.check(f"{client_id}:{endpoint}", policy)
+        return policy.limit, policy.window_seconds, result
 
 
 def create_rate_limit_middleware(redis: Optional[aioredis.Redis] = None):
@@ -33,13 +33,14 @@ from .review_queue import (
     ReviewDecision,
 )
 from .device_fingerprint import DeviceFingerprint
-from .behavior_pattern import BehaviorPattern
+from .behavior_pattern import BehaviorPattern, BehaviorTelemetry
 from .network_analysis import NetworkAnalysis
 from .fraud_rule import FraudRule, RuleCategory
 from .rule_execution import RuleExecution
 from .xai_explanation import XAIExplanation
 from .external_service_log import ExternalServiceLog, ServiceName
 from .blacklist_entry import BlacklistEntry, BlacklistEntryType
+from .rescore import RescoreRun, TransactionRescore
 
 __all__ = [
     # Base
@@ -74,6 +75,7 @@ __all__ = [
     # Advanced FDS - Phase 2
     "DeviceFingerprint",
     "BehaviorPattern",
+    "BehaviorTelemetry",
     "NetworkAnalysis",
     "FraudRule",
     "RuleCategory",
@@ -83,4 +85,7 @@ __all__ = [
     "ServiceName",
     "BlacklistEntry",
     "BlacklistEntryType",
+    # Rescoring
+    "RescoreRun",
+    "TransactionRescore",
 ]
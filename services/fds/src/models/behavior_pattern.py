@@ -1,35 +1,53 @@
 """
 BehaviorPattern 모델
 
-사용자의 마우스, 키보드, 클릭스트림 패턴을 저장한다.
+사용자의 마우스, 키보드, 클릭스트림 패턴 분석 결과를 저장한다.
+
+- behavior_patterns: 세션별 요약 통계와 봇 점수 (조회 빈도 높은 hot 테이블)
+- behavior_telemetry: 원본 이벤트 스트림 (컬럼 단위 델타 인코딩 + 압축 blob,
+  원본 이벤트가 필요할 때만 조회/디코딩)
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, Index, UUID
+from functools import cached_property
+from typing import Any, Dict, List
+
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    DateTime,
+    Index,
+    UUID,
+)
 from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
-from src.models.base import Base
+from .base import Base
+from ..utils.telemetry_codec import CODEC_VERSION, decode_columns, decode_events
 import uuid
 
 
 class BehaviorPattern(Base):
-    """행동 패턴 모델"""
+    """행동 패턴 모델 (요약 통계)"""
 
     __tablename__ = "behavior_patterns"
 
     session_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="세션 ID"
     )
-    user_id = Column(UUID(as_uuid=True), nullable=False, comment="사용자 ID")
-    mouse_movements = Column(
-        JSON,
-        nullable=True,
-        comment="마우스 움직임 데이터 [{timestamp, x, y, speed, acceleration, curvature}]",
+    user_id = Column(UUID(as_uuid=True), nullable=True, comment="사용자 ID (로그인 시)")
+    mouse_event_count = Column(Integer, default=0, nullable=False, comment="마우스 이벤트 수")
+    keyboard_event_count = Column(
+        Integer, default=0, nullable=False, comment="키보드 이벤트 수"
     )
-    keyboard_events = Column(
-        JSON, nullable=True, comment="키보드 이벤트 [{timestamp, key, duration}]"
+    clickstream_event_count = Column(
+        Integer, default=0, nullable=False, comment="클릭스트림 이벤트 수"
     )
-    clickstream = Column(
-        JSON, nullable=True, comment="클릭스트림 [{page, timestamp, duration}]"
+    analysis_summary = Column(
+        JSON,
+        nullable=True,
+        comment="분석 요약 {mouse_analysis, keyboard_analysis, clickstream_analysis, risk_factors}",
     )
     bot_score = Column(Integer, default=0, nullable=False, comment="봇 확률 (0-100)")
     created_at = Column(
@@ -43,3 +61,59 @@ class BehaviorPattern(Base):
 
     def __repr__(self):
         return f"<BehaviorPattern(session_id={self.session_id}, user_id={self.user_id}, bot_score={self.bot_score})>"
+
+
+class BehaviorTelemetry(Base):
+    """행동 텔레메트리 원본 이벤트 (압축 컬럼 blob)"""
+
+    __tablename__ = "behavior_telemetry"
+
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("behavior_patterns.session_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="세션 ID",
+    )
+    codec_version = Column(
+        SmallInteger, default=CODEC_VERSION, nullable=False, comment="코덱 버전"
+    )
+    mouse_blob = Column(
+        LargeBinary,
+        nullable=True,
+        comment="마우스 움직임 [{timestamp, x, y, speed, acceleration, curvature}]",
+    )
+    keyboard_blob = Column(
+        LargeBinary, nullable=True, comment="키보드 이벤트 [{timestamp, key, duration}]"
+    )
+    clickstream_blob = Column(
+        LargeBinary, nullable=True, comment="클릭스트림 [{page, timestamp, duration}]"
+    )
+    created_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="생성 일시"
+    )
+
+    __table_args__ = (Index("idx_behavior_telemetry_created_at", "created_at"),)
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[Dict[str, Any]]:
+        return decode_events(blob) if blob else []
+
+    # 원본 이벤트는 처음 접근할 때 디코딩 (인스턴스별 캐시)
+    @cached_property
+    def mouse_movements(self) -> List[Dict[str, Any]]:
+        return self._decode(self.mouse_blob)
+
+    @cached_property
+    def keyboard_events(self) -> List[Dict[str, Any]]:
+        return self._decode(self.keyboard_blob)
+
+    @cached_property
+    def clickstream(self) -> List[Dict[str, Any]]:
+        return self._decode(self.clickstream_blob)
+
+    def mouse_columns(self) -> Dict[str, Any]:
+        """마우스 이벤트 컬럼 배열 (오프라인 학습용, dict 변환 없음)"""
+        return decode_columns(self.mouse_blob) if self.mouse_blob else {}
+
+    def __repr__(self):
+        return f"<BehaviorTelemetry(session_id={self.session_id}, codec_version={self.codec_version})>"
@@ -17,7 +17,7 @@ from sqlalchemy import (
     Boolean,
     UniqueConstraint,
 )
-from src.models.base import Base
+from .base import Base
 import uuid
 
 
@@ -6,7 +6,7 @@ DeviceFingerprint 모델
 
 from datetime import datetime
 from sqlalchemy import Column, String, Integer, Text, Boolean, DateTime, Index
-from src.models.base import Base
+from .base import Base
 
 
 class DeviceFingerprint(Base):
@@ -8,7 +8,7 @@ from datetime import datetime
 import enum
 from sqlalchemy import Column, Text, Integer, DateTime, Index, UUID, Enum
 from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
-from src.models.base import Base
+from .base import Base
 import uuid
 
 
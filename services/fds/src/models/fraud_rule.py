@@ -18,7 +18,7 @@ from sqlalchemy import (
     Enum,
 )
 from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
-from src.models.base import Base
+from .base import Base
 import uuid
 
 
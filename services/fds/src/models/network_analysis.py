@@ -14,7 +14,7 @@ from sqlalchemy import (
     Index,
     UUID,
 )
-from src.models.base import Base
+from .base import Base
 
 
 class NetworkAnalysis(Base):
@@ -0,0 +1,102 @@
+"""
+RescoreRun / TransactionRescore 모델
+
+룰/모델 변경 후 과거 거래 재채점(replay) 실행 상태와 결과 차이를 저장한다.
+
+- rescore_runs: 실행 단위 진행 상태 (keyset 체크포인트, 처리량, 영향 요약)
+- transaction_rescores: 결정 또는 점수가 바뀐 거래별 차이
+"""
+
+from datetime import datetime
+from sqlalchemy import (
+    Column,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    UUID,
+)
+from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
+from .base import Base
+import uuid
+
+
+class RescoreRun(Base):
+    """재채점 실행 모델 (체크포인트)"""
+
+    __tablename__ = "rescore_runs"
+
+    run_id = Column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="실행 ID"
+    )
+    status = Column(
+        String(20),
+        nullable=False,
+        default="running",
+        comment="상태 (running/completed/failed)",
+    )
+    cutoff_time = Column(DateTime, nullable=False, comment="재채점 시작 기준 시각")
+    end_time = Column(DateTime, nullable=True, comment="재채점 종료 기준 시각")
+    last_created_at = Column(
+        DateTime, nullable=True, comment="체크포인트: 마지막 처리 거래 created_at"
+    )
+    last_transaction_id = Column(
+        UUID(as_uuid=True), nullable=True, comment="체크포인트: 마지막 처리 거래 ID"
+    )
+    processed_count = Column(Integer, default=0, nullable=False, comment="처리 거래 수")
+    changed_count = Column(Integer, default=0, nullable=False, comment="차이 발생 거래 수")
+    summary = Column(JSON, nullable=True, comment="영향 요약 (결정 전이, 점수 변화)")
+    started_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="시작 일시"
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="체크포인트 갱신 일시",
+    )
+
+    __table_args__ = (Index("idx_rescore_runs_status", "status"),)
+
+    def __repr__(self):
+        return f"<RescoreRun(run_id={self.run_id}, status={self.status}, processed={self.processed_count})>"
+
+
+class TransactionRescore(Base):
+    """거래 재채점 차이 모델"""
+
+    __tablename__ = "transaction_rescores"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="ID")
+    run_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("rescore_runs.run_id", ondelete="CASCADE"),
+        nullable=False,
+        comment="실행 ID",
+    )
+    transaction_id = Column(UUID(as_uuid=True), nullable=False, comment="거래 ID")
+    old_risk_score = Column(Integer, nullable=False, comment="기존 위험 점수")
+    new_risk_score = Column(Integer, nullable=False, comment="재채점 위험 점수")
+    score_delta = Column(Integer, nullable=False, comment="점수 변화 (new - old)")
+    old_decision = Column(String(30), nullable=False, comment="기존 결정")
+    new_decision = Column(String(30), nullable=False, comment="재채점 결정")
+    decision_changed = Column(Boolean, nullable=False, comment="결정 변경 여부")
+    created_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="생성 일시"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "run_id", "transaction_id", name="uq_transaction_rescores_run_tx"
+        ),
+        Index(
+            "idx_transaction_rescores_decision_changed", "run_id", "decision_changed"
+        ),
+    )
+
+    def __repr__(self):
+        return f"<TransactionRescore(transaction_id={self.transaction_id}, {self.old_decision}->{self.new_decision})>"
@@ -10,7 +10,6 @@ from typing import Optional
 from uuid import UUID, uuid4
 import enum
 from sqlalchemy import (
-    ForeignKey,
     Text,
     Enum as SQLEnum,
 )
@@ -59,7 +58,6 @@ class ReviewQueue(Base):
     # 관계 필드: Transaction과 1:1 관계
     transaction_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("transactions.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
         comment="거래 ID (1:1 관계)",
@@ -12,7 +12,6 @@ from uuid import UUID, uuid4
 import enum
 from sqlalchemy import (
     CheckConstraint,
-    ForeignKey,
     Index,
     Integer,
     String,
@@ -72,10 +71,9 @@ class RiskFactor(Base):
     # 관계 필드 (외래 키)
     transaction_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("transactions.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
-        comment="거래 ID",
+        comment="거래 ID (transactions.id)",
     )
 
     # 위험 요인 정보
@@ -7,7 +7,7 @@ RuleExecution 모델
 from datetime import datetime
 from sqlalchemy import Column, Boolean, DateTime, Index, UUID
 from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
-from src.models.base import Base
+from .base import Base
 import uuid
 
 
@@ -32,6 +32,7 @@ class RiskLevelEnum(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+    CRITICAL = "critical"
 
 
 class DecisionEnum(str, Enum):
@@ -49,6 +50,7 @@ class SeverityEnum(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+    CRITICAL = "critical"
 
 
 # ============================================================================
@@ -143,6 +145,7 @@ class RiskFactor(BaseModel):
     severity: SeverityEnum = Field(..., description="심각도")
     model_version: Optional[str] = Field(None, description="ML 모델 버전 (ML 요인인 경우)")
     source: Optional[str] = Field(None, description="출처 (CTI 요인인 경우)")
+    rule_id: Optional[str] = Field(None, description="탐지 룰 ID (룰 요인인 경우)")
 
 
 class EvaluationMetadata(BaseModel):
@@ -59,6 +59,11 @@ class Transaction(Base):
     FDS가 평가하는 개별 거래 이벤트를 저장합니다.
     각 주문(Order)마다 하나의 Transaction이 생성되며,
     위험 점수와 평가 결과를 기록합니다.
+
+    테이블은 created_at 범위 파티션 (PostgreSQL native partitioning) 으로,
+    파티션 생성/보존 기간 관리는 services.transaction_partitions 에서 합니다.
+    파티션 키가 포함되어야 하므로 기본 키는 (id, created_at) 이며,
+    ORM 식별자는 id 단독으로 유지합니다.
     """
 
     __tablename__ = "transactions"
@@ -79,10 +84,12 @@ class Transaction(Base):
         comment="사용자 ID",
     )
 
+    # 주문당 1건: 파티션 테이블의 UNIQUE 제약은 파티션 키를 포함해야 하므로
+    # (order_id, created_at) 유니크 인덱스 + 같은 주문은 같은 created_at 배정
+    # (services.transaction_partitions.assign_partition_key)
     order_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=False,
-        unique=True,
         comment="주문 ID (1:1 관계)",
     )
 
@@ -151,11 +158,13 @@ class Transaction(Base):
     )
 
     # 타임스탬프
+    # 파티션 키: 서버 시각 (같은 주문의 재요청은 처음 배정한 값)
     created_at: Mapped[datetime] = mapped_column(
+        primary_key=True,
+        default=datetime.utcnow,
         server_default=func.now(),
         nullable=False,
-        index=True,
-        comment="거래 발생 일시",
+        comment="거래 발생 일시 (파티션 키)",
     )
 
     evaluated_at: Mapped[Optional[datetime]] = mapped_column(
@@ -163,6 +172,15 @@ class Transaction(Base):
         comment="평가 완료 일시",
     )
 
+    # DB 기록 시각: write-behind 배치/스필 재생으로 created_at 보다 늦게 기록될
+    # 수 있으므로, 새로 기록된 거래를 따라가는 소비자 (ML 스트리밍 드리프트
+    # 수집) 는 created_at 대신 이 컬럼을 워터마크로 사용
+    ingested_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+        comment="DB 기록 일시 (증분 수집 워터마크)",
+    )
+
     # CHECK 제약 조건
     __table_args__ = (
         CheckConstraint(
@@ -180,8 +198,19 @@ class Transaction(Base):
             postgresql_ops={"created_at": "DESC"},
         ),
         Index("ix_transactions_user_id_created_at", "user_id", "created_at"),
+        Index("ix_transactions_ingested_at_id", "ingested_at", "id"),
+        Index(
+            "uq_transactions_order_id_created_at",
+            "order_id",
+            "created_at",
+            unique=True,
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
+    # 기본 키는 (id, created_at) 이지만 세션 식별자/조회는 id 로 유지
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return (
             f"<Transaction(id={self.id}, "
@@ -7,7 +7,7 @@ SHAP/LIME 기반 XAI 분석 결과를 저장한다.
 from datetime import datetime
 from sqlalchemy import Column, Integer, DateTime, Index, UUID
 from sqlalchemy.dialects.postgresql import JSON  # JSON -> JSON for SQLite compatibility
-from src.models.base import Base
+from .base import Base
 import uuid
 
 
@@ -2,28 +2,175 @@
 Batch Service for FDS
 
 이 모듈은 FDS 배치 재평가 로직을 제공합니다.
+
+룰/모델 변경 시 과거 거래를 재채점(replay)한다.
+
+- transactions 를 (created_at, id) keyset 페이지네이션으로 스트리밍
+- 페이지를 청크로 나눠 프로세스 풀(rescore_worker)에서 병렬 채점
+- Redis 상태는 실행 시작 시점 스냅샷 사용 (운영 키 읽기 전용)
+- 후보 설정(재채점 모델)을 현재 운영 설정으로 재채점한 기준값과 비교
+- 결정/점수가 바뀐 거래만 transaction_rescores 에 다중 행 INSERT
+  (바인드 파라미터 한도 안으로 나눠 실행)
+- 페이지마다 차이 기록과 체크포인트(rescore_runs)를 한 트랜잭션으로 커밋,
+  run_id 로 중단 지점부터 재개
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import os
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..data.loaders import (
+    get_disposable_email_domains,
+    get_freight_forwarders,
+    get_test_cards,
+)
+from ..models.rescore import RescoreRun, TransactionRescore
+from ..models.transaction import Transaction
+from .rescore_worker import (
+    DECISION_APPROVED,
+    DECISION_BLOCKED,
+    RedisSnapshot,
+    RescoreConfig,
+    init_worker,
+    score_rows,
+)
+from .transaction_partitions import created_within
+
 logger = logging.getLogger(__name__)
 
+# 문장당 바인드 파라미터 한도 (PostgreSQL 프로토콜 / asyncpg: 32767)
+MAX_BIND_PARAMS = 32767
+
+
+@dataclass
+class RescoreSummary:
+    """재채점 영향 요약 (재개 시 rescore_runs.summary 에서 복원)"""
+
+    evaluated: int = 0
+    changed: int = 0
+    newly_blocked: int = 0
+    newly_approved: int = 0
+    score_delta_sum: int = 0
+    max_score_increase: int = 0
+    max_score_decrease: int = 0
+    baseline_mismatches: int = 0
+    transitions: Counter = field(default_factory=Counter)
+    matched_rules: Counter = field(default_factory=Counter)
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.evaluated += 1
+        delta = result["score_delta"]
+        self.score_delta_sum += delta
+        self.max_score_increase = max(self.max_score_increase, delta)
+        self.max_score_decrease = min(self.max_score_decrease, delta)
+        if result["old_decision"] != result["stored_decision"]:
+            self.baseline_mismatches += 1
+
+        if result["decision_changed"] or delta:
+            self.changed += 1
+        if result["decision_changed"]:
+            self.transitions[f"{result['old_decision']}->{result['new_decision']}"] += 1
+            if result["new_decision"] == DECISION_BLOCKED:
+                self.newly_blocked += 1
+            elif result["new_decision"] == DECISION_APPROVED:
+                self.newly_approved += 1
+        self.matched_rules.update(result.get("matched_rules", ()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "evaluated": self.evaluated,
+            "changed": self.changed,
+            "newly_blocked": self.newly_blocked,
+            "newly_approved": self.newly_approved,
+            "score_delta_sum": self.score_delta_sum,
+            "avg_score_delta": round(self.score_delta_sum / self.evaluated, 2)
+            if self.evaluated
+            else 0.0,
+            "max_score_increase": self.max_score_increase,
+            "max_score_decrease": self.max_score_decrease,
+            "baseline_mismatches": self.baseline_mismatches,
+            "transitions": dict(self.transitions),
+            "matched_rules": dict(self.matched_rules),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "RescoreSummary":
+        if not data:
+            return cls()
+        return cls(
+            evaluated=data["evaluated"],
+            changed=data["changed"],
+            newly_blocked=data["newly_blocked"],
+            newly_approved=data["newly_approved"],
+            score_delta_sum=data["score_delta_sum"],
+            max_score_increase=data["max_score_increase"],
+            max_score_decrease=data["max_score_decrease"],
+            baseline_mismatches=data.get("baseline_mismatches", 0),
+            transitions=Counter(data["transitions"]),
+            matched_rules=Counter(data["matched_rules"]),
+        )
+
 
 class BatchService:
     """FDS 배치 재평가 서비스"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        redis=None,
+        ml_model_path: Optional[str] = None,
+        baseline_model_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        page_size: int = 5000,
+        chunk_size: int = 500,
+        executor_class: Type[Executor] = ProcessPoolExecutor,
+    ):
+        """
+        Args:
+            db: 데이터베이스 세션
+            redis: 스냅샷을 만들 Redis 클라이언트 (None 이면 빈 스냅샷)
+            ml_model_path: 재채점에 사용할 후보 ML 모델 경로 (None 이면 룰만)
+            baseline_model_path: 비교 기준 ML 모델 경로 (기본: 운영 모델
+                FDS_ML_MODEL_PATH, 없으면 룰만)
+            workers: 워커 수 (기본: CPU 수)
+            page_size: keyset 페이지 크기 (체크포인트 단위)
+            chunk_size: 워커에 전달하는 청크 크기
+            executor_class: 워커 풀 클래스 (테스트: ThreadPoolExecutor)
+        """
         self.db = db
+        self.redis = redis
+        self.ml_model_path = ml_model_path or os.getenv("FDS_RESCORE_MODEL_PATH")
+        self.baseline_model_path = baseline_model_path or os.getenv("FDS_ML_MODEL_PATH")
+        self.workers = workers or os.cpu_count() or 1
+        self.page_size = page_size
+        self.chunk_size = chunk_size
+        self.executor_class = executor_class
 
-    async def reevaluate_transactions(self, cutoff_time: datetime) -> Dict[str, Any]:
+    async def reevaluate_transactions(
+        self,
+        cutoff_time: datetime,
+        end_time: Optional[datetime] = None,
+        run_id: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
         """
         지난 기간의 거래를 재평가
 
         Args:
             cutoff_time: 재평가 시작 시간 (이 시간 이후의 거래만 재평가)
+            end_time: 재평가 종료 시간 (기본: 제한 없음)
+            run_id: 중단된 실행 ID (지정 시 체크포인트부터 재개)
 
         Returns:
             Dict[str, Any]: 재평가 결과
@@ -33,60 +180,190 @@ class BatchService:
                 f"[BatchService] Starting transaction re-evaluation since {cutoff_time}"
             )
 
-            # TODO: 실제 구현에서는 FDS evaluation history를 조회하여 재평가
-            # 1. cutoff_time 이후의 모든 거래 조회
-            # transactions = await self.db.execute(
-            #     select(FDSEvaluationHistory)
-            #     .where(FDSEvaluationHistory.evaluated_at >= cutoff_time)
-            #     .order_by(FDSEvaluationHistory.evaluated_at)
-            # )
-            # transactions = transactions.scalars().all()
-
-            # 2. 각 거래를 FDS 엔진으로 재평가
-            # from src.engines.evaluation_engine import EvaluationEngine
-            # evaluation_engine = EvaluationEngine()
-            # for transaction in transactions:
-            #     new_result = await evaluation_engine.evaluate(transaction)
-            #     # 결과 비교 및 업데이트
-            #     if new_result['risk_level'] != transaction.risk_level:
-            #         logger.warning(
-            #             f"Risk level changed for transaction {transaction.transaction_id}: "
-            #             f"{transaction.risk_level} -> {new_result['risk_level']}"
-            #         )
-            #         # 재평가 결과 저장
-            #         await self._save_reevaluation_result(transaction, new_result)
-
-            # 플레이스홀더 결과
-            evaluated_count = 0
-            high_risk_count = 0
-            false_positive_count = 0
-
-            logger.info(f"[SUCCESS] Re-evaluated {evaluated_count} transactions")
+            run = await self._start_or_resume_run(cutoff_time, end_time, run_id)
+            summary = RescoreSummary.from_dict(run.summary)
+
+            snapshot = (
+                await RedisSnapshot.capture(self.redis)
+                if self.redis
+                else RedisSnapshot()
+            )
+            config = RescoreConfig(
+                test_cards=get_test_cards(),
+                freight_forwarders=get_freight_forwarders(),
+                disposable_email_domains=get_disposable_email_domains(),
+                ml_model_path=self.ml_model_path,
+                baseline_ml_model_path=self.baseline_model_path,
+                snapshot=snapshot,
+            )
+            logger.info(
+                f"[BatchService] Run {run.run_id}: {len(snapshot)} Redis keys in snapshot, "
+                f"{self.workers} workers"
+            )
+
+            started = time.monotonic()
+            processed = 0
+            executor = self.executor_class(
+                max_workers=self.workers, initializer=init_worker, initargs=(config,)
+            )
+            try:
+                while True:
+                    rows = await self._fetch_page(run)
+                    if not rows:
+                        break
+
+                    results = await self._score_page(executor, rows)
+                    for result in results:
+                        summary.add(result)
+                    diffs = [
+                        r for r in results if r["decision_changed"] or r["score_delta"]
+                    ]
+                    await self._write_page(run, rows[-1], diffs, summary)
+
+                    processed += len(rows)
+                    elapsed = time.monotonic() - started
+                    logger.info(
+                        f"[BatchService] Run {run.run_id}: {summary.evaluated} evaluated, "
+                        f"{summary.changed} changed ({processed / elapsed:.0f} tx/s)"
+                    )
+            finally:
+                executor.shutdown(wait=True)
+
+            run.status = "completed"
+            await self.db.commit()
+
+            elapsed = time.monotonic() - started
+            logger.info(f"[SUCCESS] Re-evaluated {summary.evaluated} transactions")
 
             return {
                 "success": True,
-                "evaluated_count": evaluated_count,
-                "high_risk_count": high_risk_count,
-                "false_positive_count": false_positive_count,
+                "run_id": str(run.run_id),
+                "evaluated_count": summary.evaluated,
+                "changed_count": summary.changed,
+                "high_risk_count": summary.newly_blocked,
+                "false_positive_count": summary.newly_approved,
                 "cutoff_time": cutoff_time.isoformat(),
+                "elapsed_seconds": round(elapsed, 2),
+                "throughput_per_sec": round(processed / elapsed, 1) if elapsed else 0.0,
+                "summary": summary.to_dict(),
             }
 
         except Exception as exc:
             logger.error(f"[FAIL] Failed to re-evaluate transactions: {exc}")
             raise
 
-    async def _save_reevaluation_result(
-        self, original_transaction: Any, new_result: Dict[str, Any]
-    ):
-        """
-        재평가 결과 저장
+    async def _start_or_resume_run(
+        self,
+        cutoff_time: datetime,
+        end_time: Optional[datetime],
+        run_id: Optional[UUID],
+    ) -> RescoreRun:
+        if run_id is not None:
+            run = await self.db.get(RescoreRun, run_id)
+            if run is None:
+                raise ValueError(f"Rescore run not found: {run_id}")
+            logger.info(
+                f"[BatchService] Resuming run {run_id} after {run.processed_count} "
+                f"transactions (checkpoint {run.last_created_at})"
+            )
+            run.status = "running"
+            return run
 
-        Args:
-            original_transaction: 원본 거래 객체
-            new_result: 재평가 결과
-        """
-        # TODO: 재평가 결과를 데이터베이스에 저장
-        # 1. FDSReevaluationHistory 테이블에 기록
-        # 2. 위험도가 변경된 경우 알림 발송
-        # 3. 통계 업데이트
-        pass
+        run = RescoreRun(cutoff_time=cutoff_time, end_time=end_time, status="running")
+        self.db.add(run)
+        await self.db.commit()
+        return run
+
+    async def _fetch_page(self, run: RescoreRun) -> List[Dict[str, Any]]:
+        """체크포인트 다음 페이지 (keyset: created_at, id)"""
+        stmt = select(
+            Transaction.id,
+            Transaction.user_id,
+            Transaction.amount,
+            Transaction.ip_address,
+            Transaction.user_agent,
+            Transaction.device_type,
+            Transaction.geolocation,
+            Transaction.risk_score,
+            Transaction.evaluation_status,
+            Transaction.created_at,
+        )
+
+        # 행 비교 (created_at, id) > (...) 는 파티션 프루닝에 쓰이지 않으므로
+        # 체크포인트 시각을 하한으로 한 범위 조건을 함께 지정
+        stmt = stmt.where(
+            created_within(run.last_created_at or run.cutoff_time, run.end_time)
+        )
+        if run.last_created_at is not None:
+            stmt = stmt.where(
+                tuple_(Transaction.created_at, Transaction.id)
+                > tuple_(run.last_created_at, run.last_transaction_id)
+            )
+
+        stmt = stmt.order_by(Transaction.created_at, Transaction.id).limit(
+            self.page_size
+        )
+        result = await self.db.execute(stmt)
+
+        rows = []
+        for row in result:
+            data = dict(row._mapping)
+            # 워커로 보내기 전에 Enum → 문자열
+            data["device_type"] = getattr(
+                data["device_type"], "value", data["device_type"]
+            )
+            data["evaluation_status"] = getattr(
+                data["evaluation_status"], "value", data["evaluation_status"]
+            )
+            rows.append(data)
+        return rows
+
+    async def _score_page(
+        self, executor: Executor, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """페이지를 청크로 나눠 워커 풀에서 병렬 채점 (입력 순서 유지)"""
+        loop = asyncio.get_running_loop()
+        chunks = [
+            rows[start : start + self.chunk_size]
+            for start in range(0, len(rows), self.chunk_size)
+        ]
+        chunk_results = await asyncio.gather(
+            *[loop.run_in_executor(executor, score_rows, chunk) for chunk in chunks]
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def _write_page(
+        self,
+        run: RescoreRun,
+        last_row: Dict[str, Any],
+        diffs: List[Dict[str, Any]],
+        summary: RescoreSummary,
+    ) -> None:
+        """차이 다중 행 INSERT + 체크포인트 갱신 (한 트랜잭션)"""
+        if diffs:
+            table = TransactionRescore.__table__
+            insert = (
+                sqlite_insert if self.db.bind.dialect.name == "sqlite" else pg_insert
+            )
+            rows = [
+                {
+                    "run_id": run.run_id,
+                    **{k: v for k, v in diff.items() if k in table.c},
+                }
+                for diff in diffs
+            ]
+            # 기본값 컬럼(id, created_at)도 행마다 파라미터로 바인드됨
+            rows_per_statement = MAX_BIND_PARAMS // len(table.c)
+            for start in range(0, len(rows), rows_per_statement):
+                await self.db.execute(
+                    insert(table)
+                    .values(rows[start : start + rows_per_statement])
+                    .on_conflict_do_nothing(index_elements=["run_id", "transaction_id"])
+                )
+
+        run.last_created_at = last_row["created_at"]
+        run.last_transaction_id = last_row["id"]
+        run.processed_count = summary.evaluated
+        run.changed_count = summary.changed
+        run.summary = summary.to_dict()
+        await self.db.commit()
@@ -0,0 +1,394 @@
+"""
+로컬 BIN 범위 데이터베이스
+
+카드 BIN(IIN) 조회를 요청마다 binlist.net 에 보내는 대신, 파일에서 읽은
+BIN 범위 테이블을 메모리에 올려 O(log n) 이진 탐색으로 조회한다.
+
+- BIN 은 8자리 정수로 정규화 (6자리 BIN "411111" → 41111100)
+- 중첩 범위(스킴 전체 범위 안의 발급사 범위)는 로드 시 서로 겹치지 않는
+  구간으로 평탄화하며, 가장 좁은 범위가 우선
+- 구간 경계는 array('I') 로, 발급사 정보는 중복 제거된 레코드로 보관
+- 파일 변경 시 다음 조회에서 백그라운드 재로드 후 테이블 교체 (hot reload)
+- 로컬 미스 시 선택적으로 원격(binlist.net) 조회, 결과는 Redis 에 장기 캐싱
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.services.bin_service import BINService
+from src.services.verification_cache import get_provider_gate
+from src.utils.cache_utils import CacheKeys, CacheTTL, get_cache
+
+logger = logging.getLogger(__name__)
+
+BIN_KEY_DIGITS = 8
+
+DEFAULT_BIN_RANGES_PATH = os.getenv(
+    "FDS_BIN_RANGES_PATH",
+    str(Path(__file__).resolve().parent.parent / "data" / "bin_ranges.csv"),
+)
+
+
+@dataclass(frozen=True)
+class BINRecord:
+    """BIN 범위의 발급 정보"""
+
+    country: str
+    scheme: str
+    card_type: str
+    prepaid: bool
+    bank_name: str
+
+    def to_lookup_result(self, bin_prefix: str, source: str) -> Dict[str, Any]:
+        """BINService.lookup_bin() 과 같은 형식의 결과"""
+        return {
+            "bin": bin_prefix,
+            "scheme": self.scheme or "unknown",
+            "type": self.card_type or "unknown",
+            "brand": "",
+            "prepaid": self.prepaid,
+            "country": {"alpha2": self.country, "name": "", "currency": ""},
+            "bank": {"name": self.bank_name, "url": "", "phone": "", "city": ""},
+            "raw_response": {},
+            "source": source,
+            "checked_at": datetime.utcnow().isoformat(),
+        }
+
+
+def normalize_bin(bin_number: str) -> int:
+    """
+    6~8자리 BIN → 8자리 정수 키
+
+    Raises:
+        ValueError: BIN 형식이 잘못된 경우
+    """
+    if not bin_number or not bin_number.isdigit():
+        raise ValueError(f"Invalid BIN format: {bin_number}")
+    if len(bin_number) < 6 or len(bin_number) > BIN_KEY_DIGITS:
+        raise ValueError(f"BIN must be 6-8 digits, got: {len(bin_number)}")
+    return int(bin_number.ljust(BIN_KEY_DIGITS, "0"))
+
+
+def _prefix_bounds(prefix: str) -> Tuple[int, int]:
+    """BIN 접두사가 덮는 8자리 키 범위 (양 끝 포함)"""
+    return int(prefix.ljust(BIN_KEY_DIGITS, "0")), int(
+        prefix.ljust(BIN_KEY_DIGITS, "9")
+    )
+
+
+class BINRangeTable:
+    """
+    서로 겹치지 않는 정렬된 BIN 구간 테이블 (불변)
+    """
+
+    def __init__(
+        self,
+        starts: array,
+        ends: array,
+        record_index: array,
+        records: Tuple[BINRecord, ...],
+    ):
+        self._starts = starts
+        self._ends = ends
+        self._record_index = record_index
+        self._records = records
+
+    @classmethod
+    def from_ranges(
+        cls, ranges: Iterable[Tuple[int, int, BINRecord]]
+    ) -> "BINRangeTable":
+        """
+        (시작, 끝, 레코드) 범위 목록으로 테이블 구성
+
+        겹치는 범위는 더 늦게 시작하는(= 더 안쪽의) 범위가 해당 구간을 덮는다.
+        """
+        starts, ends, record_index = array("I"), array("I"), array("I")
+        interned: Dict[BINRecord, int] = {}
+
+        def emit(lo: int, hi: int, record: BINRecord):
+            if lo > hi:
+                return
+            idx = interned.setdefault(record, len(interned))
+            # 인접한 같은 레코드 구간은 병합
+            if ends and ends[-1] + 1 == lo and record_index[-1] == idx:
+                ends[-1] = hi
+                return
+            starts.append(lo)
+            ends.append(hi)
+            record_index.append(idx)
+
+        # 시작 오름차순, 같은 시작이면 넓은 범위 먼저 (스택 바닥)
+        ordered = sorted(ranges, key=lambda r: (r[0], -r[1]))
+        stack: List[Tuple[int, int, BINRecord]] = []
+        cursor = 0
+
+        def close_until(position: int):
+            nonlocal cursor
+            while stack and stack[-1][1] < position:
+                _, end, record = stack.pop()
+                emit(cursor, end, record)
+                cursor = max(cursor, end + 1)
+                # 이미 끝난 바깥 범위 정리
+                while stack and stack[-1][1] < cursor:
+                    stack.pop()
+
+        for start, end, record in ordered:
+            close_until(start)
+            if stack:
+                emit(cursor, start - 1, stack[-1][2])
+            cursor = start
+            stack.append((start, end, record))
+        close_until(10**BIN_KEY_DIGITS)
+
+        records = tuple(sorted(interned, key=interned.get))
+        return cls(starts, ends, record_index, records)
+
+    def lookup(self, key: int) -> Optional[BINRecord]:
+        """8자리 BIN 키가 속한 구간의 레코드 (O(log n))"""
+        i = bisect_right(self._starts, key) - 1
+        if i >= 0 and key <= self._ends[i]:
+            return self._records[self._record_index[i]]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def record_count(self) -> int:
+        return len(self._records)
+
+
+def load_bin_ranges(path: str) -> BINRangeTable:
+    """
+    BIN 범위 CSV 파일 로드
+
+    컬럼: range_start, range_end, country, scheme, card_type, prepaid, bank_name
+    range_end 가 비어 있으면 range_start 접두사 전체 범위. '#' 줄은 주석.
+    """
+    ranges = []
+    with open(path, newline="", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip() and not line.startswith("#"))
+        for row in csv.DictReader(lines):
+            start_prefix = row["range_start"].strip()
+            end_prefix = (row.get("range_end") or "").strip() or start_prefix
+            start, _ = _prefix_bounds(start_prefix)
+            _, end = _prefix_bounds(end_prefix)
+            record = BINRecord(
+                country=(row.get("country") or "").strip().upper(),
+                scheme=(row.get("scheme") or "").strip().lower(),
+                card_type=(row.get("card_type") or "").strip().lower(),
+                prepaid=(row.get("prepaid") or "").strip().lower()
+                in ("1", "true", "y"),
+                bank_name=(row.get("bank_name") or "").strip(),
+            )
+            ranges.append((start, end, record))
+
+    return BINRangeTable.from_ranges(ranges)
+
+
+class BINRangeDatabase:
+    """
+    BIN 조회 진입점 (로컬 범위 테이블 + 선택적 원격 폴백)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        reload_check_interval: float = 60.0,
+        remote_fallback: Optional[bool] = None,
+        remote_cache_ttl: int = CacheTTL.BIN_LOOKUP,
+        bin_service: Optional[BINService] = None,
+    ):
+        """
+        Args:
+            path: BIN 범위 CSV 경로
+            reload_check_interval: 파일 변경 확인 주기 (초)
+            remote_fallback: 로컬 미스 시 binlist.net 조회 여부
+                (기본값: 환경 변수 FDS_BIN_REMOTE_FALLBACK)
+            remote_cache_ttl: 원격 조회 결과 캐시 TTL (초)
+            bin_service: 원격 조회용 BINService
+        """
+        self.path = path or DEFAULT_BIN_RANGES_PATH
+        self.reload_check_interval = reload_check_interval
+        if remote_fallback is None:
+            remote_fallback = os.getenv("FDS_BIN_REMOTE_FALLBACK", "false") == "true"
+        self.remote_fallback = remote_fallback
+        self.remote_cache_ttl = remote_cache_ttl
+        self.bin_service = bin_service or BINService()
+
+        self._table = BINRangeTable.from_ranges([])
+        self._loaded_mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._reload_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.local_hits = 0
+        self.local_misses = 0
+        self.remote_lookups = 0
+        self.reloads = 0
+
+        self.reload()
+
+    def reload(self) -> bool:
+        """
+        BIN 범위 파일을 다시 읽어 테이블 교체
+
+        Returns:
+            bool: 교체 여부 (파일이 없거나 형식 오류면 기존 테이블 유지)
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+            table = load_bin_ranges(self.path)
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"[BIN-DB] Failed to load {self.path}: {e}")
+            return False
+
+        self._table = table
+        self._loaded_mtime = mtime
+        self.reloads += 1
+        logger.info(
+            f"[BIN-DB] Loaded {len(table)} ranges "
+            f"({table.record_count} issuer records) from {self.path}"
+        )
+        return True
+
+    def _maybe_schedule_reload(self):
+        """파일 mtime 이 바뀌었으면 백그라운드 재로드 (조회는 기존 테이블 사용)"""
+        now = time.monotonic()
+        if now - self._last_check < self.reload_check_interval:
+            return
+        self._last_check = now
+
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        if self._reload_task and not self._reload_task.done():
+            return
+
+        loop = asyncio.get_running_loop()
+        self._reload_task = loop.create_task(
+            asyncio.to_thread(self.reload)  # 대용량 파일 파싱은 스레드에서
+        )
+
+    def lookup_local(self, bin_number: str) -> Optional[BINRecord]:
+        """
+        로컬 테이블 조회 (I/O 없음)
+
+        Raises:
+            ValueError: BIN 형식이 잘못된 경우
+        """
+        record = self._table.lookup(normalize_bin(bin_number))
+        if record is None:
+            self.local_misses += 1
+        else:
+            self.local_hits += 1
+        return record
+
+    async def lookup(self, bin_number: str) -> Dict[str, Any]:
+        """
+        BIN 조회 (BINService.lookup_bin() 과 같은 형식, risk_score 포함)
+
+        Raises:
+            ValueError: BIN 형식이 잘못된 경우
+        """
+        self._maybe_schedule_reload()
+
+        bin_prefix = bin_number[:BIN_KEY_DIGITS]
+        record = self.lookup_local(bin_prefix)
+
+        result = None
+        if record is not None and record.country:
+            result = record.to_lookup_result(bin_prefix, source="local")
+        elif self.remote_fallback:
+            try:
+                result = await self._lookup_remote(bin_prefix)
+            except Exception as e:
+                logger.warning(f"[BIN-DB] Remote lookup failed for {bin_prefix}: {e}")
+
+        if result is None:
+            if record is not None:
+                # 스킴 범위만 일치 (발급 국가 불명)
+                result = record.to_lookup_result(bin_prefix, source="local")
+            else:
+                result = BINService.unknown_bin_result(bin_prefix)
+                result["source"] = "local"
+
+        result["risk_score"] = self.bin_service.calculate_risk_score(result)
+        return result
+
+    async def _lookup_remote(self, bin_prefix: str) -> Dict[str, Any]:
+        """원격 BIN 조회 (Redis 장기 캐시, 캐시 장애 시 원격 직접 조회)"""
+        cache_key = CacheKeys.bin_lookup(bin_prefix[:6])
+        cache = get_cache()
+        try:
+            cached = await cache.get_json(cache_key)
+            if cached:
+                return cached
+        except Exception as e:
+            logger.warning(f"[BIN-DB] Cache read failed: {e}")
+
+        self.remote_lookups += 1
+        async with get_provider_gate("binlist"):
+            result = await self.bin_service.lookup_bin(bin_prefix)
+        result["source"] = "remote"
+        result.pop("raw_response", None)
+
+        try:
+            # 미등록 BIN(404) 결과도 캐싱해 rate limit 소모 방지
+            await cache.set(cache_key, json.dumps(result), self.remote_cache_ttl)
+        except Exception as e:
+            logger.warning(f"[BIN-DB] Cache write failed: {e}")
+        return result
+
+    async def get_country(self, bin_number: Optional[str]) -> Optional[str]:
+        """카드 발급 국가 (ISO alpha-2), 알 수 없으면 None"""
+        if not bin_number:
+            return None
+        try:
+            result = await self.lookup(bin_number)
+        except Exception as e:
+            logger.warning(f"[BIN-DB] Country lookup failed for {bin_number}: {e}")
+            return None
+        return result["country"]["alpha2"] or None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "ranges": len(self._table),
+            "issuer_records": self._table.record_count,
+            "local_hits": self.local_hits,
+            "local_misses": self.local_misses,
+            "remote_fallback": self.remote_fallback,
+            "remote_lookups": self.remote_lookups,
+            "reloads": self.reloads,
+        }
+
+
+# 싱글톤 인스턴스
+_bin_range_db: Optional[BINRangeDatabase] = None
+
+
+def get_bin_range_db() -> BINRangeDatabase:
+    """
+    BIN 범위 데이터베이스 싱글톤 인스턴스 가져오기
+
+    Returns:
+        BINRangeDatabase 인스턴스
+    """
+    global _bin_range_db
+    if _bin_range_db is None:
+        _bin_range_db = BINRangeDatabase()
+    return _bin_range_db
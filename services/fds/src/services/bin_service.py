@@ -11,6 +11,8 @@ from typing import Dict, Optional
 import httpx
 from datetime import datetime
 
+from src.services.verification_cache import get_provider_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,10 +83,10 @@ class BINService:
         logger.info(f"[BINList] Looking up BIN: {bin_prefix}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            client = get_provider_client("binlist", self.timeout)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
 
             # Parse response
             result = {
@@ -127,18 +129,7 @@ class BINService:
             if e.response.status_code == 404:
                 # BIN not found
                 logger.warning(f"[BINList] BIN not found: {bin_prefix}")
-                return {
-                    "bin": bin_prefix,
-                    "scheme": "unknown",
-                    "type": "unknown",
-                    "brand": "",
-                    "prepaid": False,
-                    "country": {"alpha2": "", "name": "", "currency": ""},
-                    "bank": {"name": "", "url": "", "phone": "", "city": ""},
-                    "risk_score": 50,  # Unknown BIN is medium risk
-                    "raw_response": {},
-                    "checked_at": datetime.utcnow().isoformat(),
-                }
+                return self.unknown_bin_result(bin_prefix)
             elif e.response.status_code == 429:
                 # Rate limit exceeded
                 logger.error("[BINList] Rate limit exceeded")
@@ -153,6 +144,30 @@ class BINService:
             logger.error(f"[BINList] Unexpected error looking up BIN: {e}")
             raise
 
+    @staticmethod
+    def unknown_bin_result(bin_prefix: str) -> Dict:
+        """
+        Result for a BIN with no issuer data
+
+        Args:
+            bin_prefix: BIN prefix that was looked up
+
+        Returns:
+            Dict in lookup_bin() format
+        """
+        return {
+            "bin": bin_prefix,
+            "scheme": "unknown",
+            "type": "unknown",
+            "brand": "",
+            "prepaid": False,
+            "country": {"alpha2": "", "name": "", "currency": ""},
+            "bank": {"name": "", "url": "", "phone": "", "city": ""},
+            "risk_score": 50,  # Unknown BIN is medium risk
+            "raw_response": {},
+            "checked_at": datetime.utcnow().isoformat(),
+        }
+
     def calculate_risk_score(self, bin_data: Dict) -> int:
         """
         Calculate risk score (0-100) from BIN data
@@ -0,0 +1,497 @@
+"""
+대시보드 롤업 (분/시/일 버킷 카운터)
+
+관리자 대시보드 통계가 요청마다 transactions/review_queue 를 윈도우 전체 스캔하지
+않도록, 평가/검토 결과가 기록될 때 Redis 해시 버킷의 카운터를 증분한다.
+
+- 키: {prefix}:{m|h|d}:{버킷 시작 epoch} (해시), 한 이벤트를 세 해상도에 모두 기록
+- 필드: tx:total, tx:status:{평가 상태}, tx:risk:{위험 수준},
+  tx:eval_ms_sum, tx:eval_count, tx:eval:{le_경계} (평가 시간 히스토그램),
+  rq:total, rq:status:{검토 상태}
+- 윈도우 조회: [start, end) 를 정렬된 일/시/분 버킷으로 덮어 (30일 기준 약 200개)
+  파이프라인 HGETALL 한 번으로 합산
+- 상태 변경 (검토 할당/완료, 거래 승인/차단): 원래 버킷 (거래 created_at,
+  검토 added_at) 에서 이전 상태 -1, 새 상태 +1
+
+롤업은 covered_since 이후 구간만 정확하다. 그 이전을 포함하는 윈도우는
+summarize() 가 None 을 반환하므로 호출 측이 DB 집계로 대체하며, backfill() 로
+과거 구간을 한 번 채울 수 있다.
+
+버킷 갱신이 실패하면 해당 이벤트의 분 버킷을 누락 구간({prefix}:gaps, 정렬
+집합)으로 기록하고, 누락 구간과 겹치는 윈도우도 DB 집계로 대체한다. 누락 구간
+기록까지 실패하면 프로세스 메모리에 보관했다가 다음 갱신 파이프라인에 함께 보낸다.
+"""
+
+import enum
+import logging
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from ..models.review_queue import ReviewQueue
+from ..models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# (이름, 버킷 크기 초, 보존 기간 초) - 큰 해상도부터
+RESOLUTIONS: Tuple[Tuple[str, int, int], ...] = (
+    ("d", 86400, 40 * 86400),
+    ("h", 3600, 40 * 86400),
+    ("m", 60, 2 * 86400),
+)
+
+# 평가 시간 히스토그램 경계 (ms)
+EVAL_TIME_BOUNDS_MS = (10, 25, 50, 100, 200, 500, 1000)
+
+# write-behind 플러시 시 RETURNING 으로 받을 컬럼
+TRANSACTION_COLUMNS = (
+    "created_at",
+    "evaluation_status",
+    "risk_level",
+    "evaluation_time_ms",
+)
+REVIEW_QUEUE_COLUMNS = ("added_at", "status")
+
+SCOPE_TRANSACTION = "tx"
+SCOPE_REVIEW = "rq"
+
+
+def _epoch(dt: datetime) -> int:
+    """naive datetime 은 UTC 로 간주"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _label(value: Any) -> str:
+    return value.value if isinstance(value, enum.Enum) else str(value)
+
+
+def eval_time_field(evaluation_time_ms: int) -> str:
+    """평가 시간 히스토그램 필드명"""
+    for bound in EVAL_TIME_BOUNDS_MS:
+        if evaluation_time_ms <= bound:
+            return f"tx:eval:le_{bound}"
+    return "tx:eval:le_inf"
+
+
+def bucket_plan(start: int, end: int) -> List[Tuple[str, int]]:
+    """
+    [start, end) 를 덮는 최소 버킷 목록
+
+    분 단위로 정렬한 뒤 경계가 맞는 가장 큰 해상도부터 사용한다.
+    현재 진행 중인 시/일은 완결되지 않았으므로 분/시 버킷으로 덮는다.
+
+    Args:
+        start: 시작 epoch (분 단위로 내림)
+        end: 끝 epoch (분 단위로 올림, 현재 분 포함)
+
+    Returns:
+        list: (해상도 이름, 버킷 시작 epoch)
+    """
+    start -= start % 60
+    end += -end % 60
+    # 보존 기간이 지난 분 버킷은 쓰지 않고 시 단위로 내림 (최대 59분 추가 포함)
+    if end - start > RESOLUTIONS[-1][2]:
+        start -= start % 3600
+
+    plan = []
+    t = start
+    while t < end:
+        for name, size, _ in RESOLUTIONS:
+            if t % size == 0 and t + size <= end:
+                plan.append((name, t))
+                t += size
+                break
+    return plan
+
+
+class DashboardRollup:
+    """
+    Redis 해시 버킷 기반 대시보드 롤업
+
+    기록은 best-effort 이며 실패해도 예외를 전파하지 않는다 (통계 errors 증가).
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        prefix: str = "fds:rollup",
+        since_cache_seconds: float = 60.0,
+    ):
+        """
+        Args:
+            redis: 비동기 Redis 클라이언트
+            prefix: 키 접두사
+            since_cache_seconds: covered_since 로컬 캐시 시간
+        """
+        self.redis = redis
+        self.prefix = prefix
+        self.since_cache_seconds = since_cache_seconds
+
+        self._since: Optional[int] = None
+        self._since_loaded_at = 0.0
+
+        # Redis 에 아직 기록하지 못한 누락 구간 (분 버킷 시작 epoch)
+        self._pending_gaps: Set[int] = set()
+
+        self.stats = {
+            "events": 0,
+            "writes": 0,
+            "reads": 0,
+            "errors": 0,
+            "gaps": 0,
+        }
+
+    # --- 기록 ---
+
+    async def mark_started(self) -> None:
+        """롤업 기록 시작 시각 등록 (이미 있으면 유지)"""
+        try:
+            await self.redis.set(f"{self.prefix}:since", int(time.time()), nx=True)
+            self._since_loaded_at = 0.0
+        except Exception as e:
+            logger.warning(f"[ROLLUP] since 기록 실패: {e}")
+            self.stats["errors"] += 1
+
+    def attach(self, write_behind: Any) -> None:
+        """
+        write-behind 플러시 리스너로 등록 (새로 INSERT 된 거래/검토 큐 행 반영)
+
+        Args:
+            write_behind: WriteBehindQueue 인스턴스 (start() 전에 등록)
+        """
+        write_behind.add_flush_listener(
+            "transactions", TRANSACTION_COLUMNS, self.record_transactions
+        )
+        write_behind.add_flush_listener(
+            "review_queue", REVIEW_QUEUE_COLUMNS, self.record_review_queue
+        )
+
+    async def record_transactions(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        새로 기록된 거래 반영
+
+        Args:
+            rows: TRANSACTION_COLUMNS 를 포함한 거래 행
+        """
+        deltas = []
+        for row in rows:
+            fields = Counter(
+                {
+                    "tx:total": 1,
+                    f"tx:status:{_label(row['evaluation_status'])}": 1,
+                    f"tx:risk:{_label(row['risk_level'])}": 1,
+                }
+            )
+            if row.get("evaluation_time_ms") is not None:
+                evaluation_time_ms = int(row["evaluation_time_ms"])
+                fields["tx:eval_ms_sum"] += evaluation_time_ms
+                fields["tx:eval_count"] += 1
+                fields[eval_time_field(evaluation_time_ms)] += 1
+            deltas.append((_epoch(row["created_at"]), fields))
+        await self._apply(deltas)
+
+    async def record_review_queue(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        새로 추가된 검토 큐 항목 반영
+
+        Args:
+            rows: REVIEW_QUEUE_COLUMNS 를 포함한 검토 큐 행
+        """
+        await self._apply(
+            [
+                (
+                    _epoch(row["added_at"]),
+                    Counter({"rq:total": 1, f"rq:status:{_label(row['status'])}": 1}),
+                )
+                for row in rows
+            ]
+        )
+
+    async def record_instances(
+        self,
+        transactions: Iterable[Transaction] = (),
+        review_queue: Iterable[ReviewQueue] = (),
+    ) -> None:
+        """
+        write-behind 를 거치지 않고 직접 커밋한 ORM 인스턴스 반영 (refresh 이후 호출)
+
+        Args:
+            transactions: 새로 기록된 거래
+            review_queue: 새로 추가된 검토 큐 항목
+        """
+        await self.record_transactions(
+            {c: getattr(t, c) for c in TRANSACTION_COLUMNS} for t in transactions
+        )
+        await self.record_review_queue(
+            {c: getattr(r, c) for c in REVIEW_QUEUE_COLUMNS} for r in review_queue
+        )
+
+    async def record_status_changes(
+        self, changes: Iterable[Tuple[str, datetime, Any, Any]]
+    ) -> None:
+        """
+        상태 변경 반영 (원래 버킷에서 이전 상태 -1, 새 상태 +1)
+
+        covered_since 이전 행의 변경은 무시한다 (backfill 이 현재 상태로 채움).
+
+        Args:
+            changes: (SCOPE_TRANSACTION/SCOPE_REVIEW, 버킷 기준 시각 (거래 created_at
+                / 검토 added_at), 이전 상태, 새 상태)
+        """
+        since = await self.covered_since()
+        deltas = []
+        for scope, at, old, new in changes:
+            old, new = _label(old), _label(new)
+            epoch = _epoch(at)
+            if old == new or since is None or epoch < since:
+                continue
+            deltas.append(
+                (
+                    epoch,
+                    Counter({f"{scope}:status:{old}": -1, f"{scope}:status:{new}": 1}),
+                )
+            )
+        await self._apply(deltas)
+
+    async def _apply(self, deltas: List[Tuple[int, Counter]]) -> None:
+        if not deltas:
+            return
+
+        per_key: Dict[Tuple[str, int, int], Counter] = defaultdict(Counter)
+        for epoch, fields in deltas:
+            for name, size, ttl in RESOLUTIONS:
+                per_key[(name, epoch - epoch % size, ttl)].update(fields)
+
+        pending = set(self._pending_gaps)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            if pending:
+                self._queue_gaps(pipe, pending)
+            for (name, bucket, ttl), fields in per_key.items():
+                key = f"{self.prefix}:{name}:{bucket}"
+                for field, amount in fields.items():
+                    if amount:
+                        pipe.hincrby(key, field, amount)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+            self._pending_gaps -= pending
+            self.stats["events"] += len(deltas)
+            self.stats["writes"] += 1
+        except Exception as e:
+            # 일부 명령만 반영됐을 수 있으므로 재시도하지 않고 누락 구간으로 표시
+            logger.warning(f"[ROLLUP] 버킷 갱신 실패 ({len(deltas)} events): {e}")
+            self.stats["errors"] += 1
+            await self._record_gaps(epoch - epoch % 60 for epoch, _ in deltas)
+
+    def _queue_gaps(self, pipe: Any, gaps: Iterable[int]) -> None:
+        key = f"{self.prefix}:gaps"
+        retention = RESOLUTIONS[0][2]
+        pipe.zadd(key, {str(gap): gap for gap in gaps})
+        pipe.zremrangebyscore(key, "-inf", int(time.time()) - retention)
+        pipe.expire(key, retention)
+
+    async def _record_gaps(self, gaps: Iterable[int]) -> None:
+        """누락 구간 기록 (실패 시 다음 갱신까지 메모리에 보관)"""
+        self._pending_gaps.update(gaps)
+        self.stats["gaps"] += 1
+        pending = set(self._pending_gaps)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_gaps(pipe, pending)
+            await pipe.execute()
+            self._pending_gaps -= pending
+        except Exception as e:
+            logger.warning(f"[ROLLUP] 누락 구간 기록 실패 ({len(pending)} buckets): {e}")
+            self.stats["errors"] += 1
+
+    # --- 조회 ---
+
+    async def covered_since(self) -> Optional[int]:
+        """롤업이 정확한 구간의 시작 epoch (없으면 None)"""
+        if time.monotonic() - self._since_loaded_at < self.since_cache_seconds:
+            return self._since
+        try:
+            raw = await self.redis.get(f"{self.prefix}:since")
+        except Exception as e:
+            logger.warning(f"[ROLLUP] since 조회 실패: {e}")
+            self.stats["errors"] += 1
+            return None
+        self._since = int(raw) if raw is not None else None
+        self._since_loaded_at = time.monotonic()
+        return self._since
+
+    async def summarize(
+        self, start: datetime, end: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        윈도우 통계 합산
+
+        Args:
+            start: 윈도우 시작
+            end: 윈도우 끝 (기본: 현재)
+
+        Returns:
+            dict: 대시보드 통계 (롤업이 윈도우를 덮지 못하거나, 누락 구간과
+                겹치거나, Redis 오류면 None)
+        """
+        start_epoch = _epoch(start)
+        end_epoch = _epoch(end) if end else int(time.time())
+
+        since = await self.covered_since()
+        if since is None or since > start_epoch:
+            return None
+
+        plan = bucket_plan(start_epoch, end_epoch)
+        # 계획이 실제로 덮는 구간 (시 단위 내림, 분 단위 올림 포함)
+        low = plan[0][1] if plan else start_epoch
+        high = end_epoch + -end_epoch % 60
+        if any(low <= gap < high for gap in self._pending_gaps):
+            return None
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for name, bucket in plan:
+                pipe.hgetall(f"{self.prefix}:{name}:{bucket}")
+            pipe.zcount(f"{self.prefix}:gaps", low, high - 1)
+            *buckets, gaps = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[ROLLUP] 버킷 조회 실패: {e}")
+            self.stats["errors"] += 1
+            return None
+        self.stats["reads"] += 1
+        if gaps:
+            return None
+
+        totals: Counter = Counter()
+        for bucket in buckets:
+            for field, value in (bucket or {}).items():
+                if isinstance(field, bytes):
+                    field = field.decode()
+                totals[field] += int(value)
+
+        eval_count = totals["tx:eval_count"]
+        return {
+            "transaction_summary": {
+                "total": totals["tx:total"],
+                "approved": totals["tx:status:approved"],
+                "blocked": totals["tx:status:blocked"],
+                "manual_review": totals["tx:status:manual_review"],
+            },
+            "risk_distribution": {
+                "low": totals["tx:risk:low"],
+                "medium": totals["tx:risk:medium"],
+                "high": totals["tx:risk:high"],
+            },
+            "review_queue_summary": {
+                "total": totals["rq:total"],
+                "pending": totals["rq:status:pending"],
+                "in_review": totals["rq:status:in_review"],
+                "completed": totals["rq:status:completed"],
+            },
+            "avg_evaluation_time_ms": (
+                int(totals["tx:eval_ms_sum"] / eval_count) if eval_count else 0
+            ),
+            "evaluation_time_histogram": {
+                f"le_{bound}": totals[f"tx:eval:le_{bound}"]
+                for bound in EVAL_TIME_BOUNDS_MS
+            }
+            | {"le_inf": totals["tx:eval:le_inf"]},
+            "buckets": len(plan),
+        }
+
+    # --- 과거 구간 채우기 ---
+
+    async def backfill(
+        self,
+        session_factory: Callable,
+        start: datetime,
+        chunk_size: int = 5000,
+    ) -> int:
+        """
+        [start, covered_since) 구간을 DB 에서 읽어 버킷을 채우고 covered_since 를 앞당긴다
+
+        운영자가 배포 후 한 번 실행한다. 같은 구간을 두 번 채우지 않도록
+        covered_since 이전만 읽는다.
+
+        Args:
+            session_factory: 세션 팩토리
+            start: 채울 구간의 시작
+            chunk_size: 스트리밍 청크 크기
+
+        Returns:
+            int: 반영한 행 수
+        """
+        self._since_loaded_at = 0.0
+        since = await self.covered_since()
+        if since is None:
+            await self.mark_started()
+            self._since_loaded_at = 0.0
+            since = await self.covered_since()
+        if since is None or _epoch(start) >= since:
+            return 0
+
+        start_epoch = _epoch(start)
+        until = datetime.fromtimestamp(since, tz=timezone.utc).replace(tzinfo=None)
+        start = datetime.fromtimestamp(start_epoch, tz=timezone.utc).replace(
+            tzinfo=None
+        )
+
+        sources = (
+            (
+                Transaction,
+                TRANSACTION_COLUMNS,
+                Transaction.created_at,
+                self.record_transactions,
+            ),
+            (
+                ReviewQueue,
+                REVIEW_QUEUE_COLUMNS,
+                ReviewQueue.added_at,
+                self.record_review_queue,
+            ),
+        )
+
+        count = 0
+        async with session_factory() as session:
+            for model, columns, timestamp, record in sources:
+                stmt = select(*(getattr(model, c) for c in columns)).where(
+                    timestamp >= start, timestamp < until
+                )
+                result = await session.stream(
+                    stmt.execution_options(yield_per=chunk_size)
+                )
+                async for partition in result.mappings().partitions(chunk_size):
+                    await record(partition)
+                    count += len(partition)
+
+        await self.redis.set(f"{self.prefix}:since", start_epoch)
+        self._since_loaded_at = 0.0
+        logger.info(f"[ROLLUP] Backfilled {count} rows from {start.isoformat()}")
+        return count
+
+
+# 싱글톤 인스턴스
+_dashboard_rollup: Optional[DashboardRollup] = None
+
+
+async def get_dashboard_rollup() -> Optional[DashboardRollup]:
+    """
+    대시보드 롤업 싱글톤 인스턴스 가져오기
+
+    Returns:
+        DashboardRollup 인스턴스 (Redis 연결 실패 시 None)
+    """
+    global _dashboard_rollup
+    if _dashboard_rollup is None:
+        from ..utils.redis_client import get_redis
+
+        try:
+            _dashboard_rollup = DashboardRollup(await get_redis())
+        except Exception as e:
+            logger.warning(f"[ROLLUP] Redis 연결 실패, 롤업 비활성화: {e}")
+            return None
+    return _dashboard_rollup
@@ -0,0 +1,314 @@
+"""
+디바이스 핑거프린트 수집 서비스
+
+가장 자주 호출되는 FDS 엔드포인트(/device-fingerprint/collect)의 DB 왕복을
+줄이기 위한 Redis 우선 경로.
+
+- 알려진 디바이스: Redis 캐시에서 바로 응답 (DB I/O 없음), 캐시 값은
+  last_seen_at / user_agent 만 갱신 (전체 값 재기록/TTL 연장 없음)
+- 블랙리스트 여부: 핑거프린트 캐시가 아니라 블랙리스트 API 가 변경 시 기록하는
+  상태 키에서 읽고, 없으면 DB(device_fingerprints) 에서 읽어 채움
+- last_seen_at / user_agent 갱신: 메모리에 디바이스별 최신 값만 모아두고
+  주기적으로 배치 UPDATE (write coalescing)
+- 캐시 미스: INSERT ... ON CONFLICT (device_id) DO UPDATE ... RETURNING
+  단일 문장으로 생성/갱신 후 캐시에 저장
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.base import AsyncSessionLocal
+from ..models.device_fingerprint import DeviceFingerprint
+from ..utils.cache_utils import (
+    cache_device_blacklist_status,
+    cache_device_fingerprint,
+    get_cached_device_blacklist_status,
+    get_cached_device_fingerprint,
+    touch_cached_device_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+# 캐시/응답에 포함되는 컬럼
+DEVICE_FIELDS = (
+    "device_id",
+    "canvas_hash",
+    "webgl_hash",
+    "audio_hash",
+    "cpu_cores",
+    "memory_size",
+    "screen_resolution",
+    "timezone",
+    "language",
+    "user_agent",
+    "blacklisted",
+    "blacklist_reason",
+    "created_at",
+    "last_seen_at",
+    "updated_at",
+)
+
+_DATETIME_FIELDS = ("created_at", "last_seen_at", "updated_at")
+
+
+def device_to_cache_data(device: Any) -> Dict[str, Any]:
+    """DeviceFingerprint 인스턴스(또는 RETURNING 행) → 캐시용 dict"""
+    data = {}
+    for field in DEVICE_FIELDS:
+        value = getattr(device, field)
+        data[field] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+
+class DeviceFingerprintService:
+    """
+    Redis 우선 디바이스 핑거프린트 수집 + last_seen_at 배치 갱신
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        flush_interval_ms: float = 1000.0,
+        max_pending: int = 5000,
+    ):
+        """
+        Args:
+            session_factory: DB 세션 팩토리
+            flush_interval_ms: last_seen_at 배치 갱신 주기
+            max_pending: 대기 갱신이 이 수를 넘으면 주기 전에 플러시
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_pending = max_pending
+
+        # device_id → (last_seen_at, user_agent), 디바이스별 최신 값만 유지
+        self._pending: Dict[str, Tuple[datetime, str]] = {}
+        self._flush_event = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # 통계
+        self.cache_hits = 0
+        self.upserts = 0
+        self.touches = 0
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """대기 중인 갱신을 기록하고 종료"""
+        if not self._running:
+            return
+        self._running = False
+        self._flush_event.set()
+        if self._flusher_task:
+            await self._flusher_task
+        await self.flush()
+        logger.info(f"[DEVICE-FP] Stopped ({self.get_stats()})")
+
+    async def collect(
+        self, device_id: str, fingerprint: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        핑거프린트 수집
+
+        Args:
+            device_id: compute_device_id 로 계산한 디바이스 ID
+            fingerprint: 요청 필드 (canvas_hash, ..., user_agent)
+
+        Returns:
+            (캐시용 디바이스 dict, 신규 디바이스 여부)
+        """
+        now = datetime.utcnow()
+
+        cached = await get_cached_device_fingerprint(device_id)
+        if cached:
+            self.cache_hits += 1
+            cached["last_seen_at"] = now.isoformat()
+            cached["user_agent"] = fingerprint["user_agent"]
+            await self.touch(device_id, now, fingerprint["user_agent"])
+            await touch_cached_device_fingerprint(
+                device_id, cached["last_seen_at"], cached["user_agent"]
+            )
+            cached.update(await self.blacklist_status(device_id))
+            return cached, False
+
+        device_data, is_new = await self.upsert(device_id, fingerprint, now)
+        await cache_device_fingerprint(device_id, device_data)
+        await cache_device_blacklist_status(
+            device_id,
+            device_data["blacklisted"],
+            device_data["blacklist_reason"],
+            only_if_absent=True,
+        )
+        return device_data, is_new
+
+    async def blacklist_status(self, device_id: str) -> Dict[str, Any]:
+        """
+        디바이스 블랙리스트 상태 ({blacklisted, blacklist_reason})
+
+        블랙리스트 API 가 기록한 상태 키를 우선 사용하고, 없으면 DB 에서 읽어
+        채운다 (그 사이 API 가 기록한 상태는 덮어쓰지 않음).
+        """
+        status = await get_cached_device_blacklist_status(device_id)
+        if status is not None:
+            return status
+
+        table = DeviceFingerprint.__table__
+        async with self.session_factory() as session:
+            row = (
+                await session.execute(
+                    select(table.c.blacklisted, table.c.blacklist_reason).where(
+                        table.c.device_id == device_id
+                    )
+                )
+            ).one_or_none()
+
+        if row is None:
+            return {"blacklisted": False, "blacklist_reason": None}
+        await cache_device_blacklist_status(
+            device_id, row.blacklisted, row.blacklist_reason, only_if_absent=True
+        )
+        return {
+            "blacklisted": row.blacklisted,
+            "blacklist_reason": row.blacklist_reason,
+        }
+
+    async def upsert(
+        self, device_id: str, fingerprint: Dict[str, Any], now: datetime
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        INSERT ... ON CONFLICT DO UPDATE 단일 문장으로 생성 또는 갱신
+
+        created_at 은 충돌 시 유지되므로, 반환된 created_at 이 now 와 같으면
+        이번 요청에서 생성된 디바이스다.
+        """
+        table = DeviceFingerprint.__table__
+
+        async with self.session_factory() as session:
+            insert = (
+                sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+            )
+            stmt = insert(table).values(
+                device_id=device_id,
+                **fingerprint,
+                blacklisted=False,
+                created_at=now,
+                last_seen_at=now,
+                updated_at=now,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.device_id],
+                set_={
+                    "last_seen_at": stmt.excluded.last_seen_at,
+                    "user_agent": stmt.excluded.user_agent,
+                },
+            ).returning(*table.c)
+
+            result = await session.execute(stmt)
+            row = result.one()
+            await session.commit()
+
+        self.upserts += 1
+        return device_to_cache_data(row), row.created_at == now
+
+    async def touch(self, device_id: str, seen_at: datetime, user_agent: str):
+        """last_seen_at 갱신 예약 (DB I/O 없음)"""
+        if not self._running:
+            await self.start()
+
+        self.touches += 1
+        self._pending[device_id] = (seen_at, user_agent)
+        if len(self._pending) >= self.max_pending:
+            self._flush_event.set()
+
+    async def _flush_loop(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        대기 중인 last_seen_at 갱신을 배치 UPDATE 로 기록
+
+        Returns:
+            int: 기록한 디바이스 수
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        table = DeviceFingerprint.__table__
+        stmt = (
+            table.update()
+            .where(table.c.device_id == bindparam("b_device_id"))
+            .where(table.c.last_seen_at < bindparam("b_seen_at"))
+            .values(
+                last_seen_at=bindparam("b_seen_at"),
+                user_agent=bindparam("b_user_agent"),
+            )
+        )
+        params = [
+            {"b_device_id": device_id, "b_seen_at": seen_at, "b_user_agent": user_agent}
+            for device_id, (seen_at, user_agent) in pending.items()
+        ]
+
+        try:
+            async with self.session_factory() as session:
+                await session.execute(stmt, params)
+                await session.commit()
+        except Exception as e:
+            # 실패한 갱신은 되돌려 다음 주기에 재시도 (그 사이 더 최신 값은 유지)
+            self.failed_flushes += 1
+            for device_id, value in pending.items():
+                self._pending.setdefault(device_id, value)
+            logger.error(
+                f"[DEVICE-FP] last_seen_at flush failed ({len(pending)} rows): {e}"
+            )
+            return 0
+
+        self.flushed_rows += len(params)
+        return len(params)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "cache_hits": self.cache_hits,
+            "upserts": self.upserts,
+            "touches": self.touches,
+            "pending": len(self._pending),
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+# 싱글톤 인스턴스
+_device_fingerprint_service: Optional[DeviceFingerprintService] = None
+
+
+def get_device_fingerprint_service() -> DeviceFingerprintService:
+    """
+    디바이스 핑거프린트 서비스 싱글톤 인스턴스 가져오기
+
+    Returns:
+        DeviceFingerprintService 인스턴스
+    """
+    global _device_fingerprint_service
+    if _device_fingerprint_service is None:
+        _device_fingerprint_service = DeviceFingerprintService()
+    return _device_fingerprint_service
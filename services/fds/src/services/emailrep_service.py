@@ -11,6 +11,8 @@ from typing import Dict, Optional
 import httpx
 from datetime import datetime
 
+from src.services.verification_cache import get_provider_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,10 +86,10 @@ class EmailRepService:
         logger.info(f"[EmailRep] Checking reputation for: {email}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            client = get_provider_client("emailrep", self.timeout)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
 
             # Parse response
             result = {
@@ -0,0 +1,76 @@
+"""
+평가 결과 기록 (위험 요인 / 룰 실행)
+
+평가 API 가 거래와 같은 write-behind 묶음으로 넣을 RiskFactor, RuleExecution
+행을 평가 응답(FDSEvaluationResponse)에서 만든다.
+
+- 응답의 위험 요인마다 RiskFactor 1행 (관리자 상세 화면의 위험 요인 패널)
+- 룰 요인 (rule_id 가 있는 요인) 은 RuleExecution 1행
+- 행 ID 는 거래 ID 기반 uuid5: 같은 거래 재요청/스필 재생 시 ON CONFLICT 로
+  중복 기록되지 않음
+"""
+
+from typing import Any, Dict, List
+from uuid import UUID, uuid5
+
+from ..models.risk_factor import RiskFactor
+from ..models.rule_execution import RuleExecution
+from ..models.schemas import FDSEvaluationResponse
+
+
+def build_evaluation_records(
+    transaction_id: UUID, evaluation_result: FDSEvaluationResponse
+) -> List[Any]:
+    """
+    평가 결과 → 위험 요인 / 룰 실행 ORM 인스턴스
+
+    Args:
+        transaction_id: 거래 ID
+        evaluation_result: 평가 응답
+
+    Returns:
+        List[Any]: RiskFactor, RuleExecution 인스턴스 (write-behind 큐에 넣을 순서)
+    """
+    records: List[Any] = []
+
+    for index, factor in enumerate(evaluation_result.risk_factors):
+        metadata: Dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("rule_id", factor.rule_id),
+                ("model_version", factor.model_version),
+                ("source", factor.source),
+            )
+            if value is not None
+        }
+        records.append(
+            RiskFactor(
+                id=uuid5(transaction_id, f"risk_factor:{index}"),
+                transaction_id=transaction_id,
+                factor_type=factor.factor_type,
+                factor_score=factor.factor_score,
+                severity=factor.severity.value,
+                description=factor.description,
+                risk_metadata=metadata or None,
+            )
+        )
+
+        if factor.rule_id is not None:
+            records.append(
+                RuleExecution(
+                    execution_id=uuid5(
+                        transaction_id, f"rule_execution:{factor.rule_id}"
+                    ),
+                    transaction_id=transaction_id,
+                    rule_id=UUID(factor.rule_id),
+                    matched=True,
+                    match_metadata={
+                        "factor_type": factor.factor_type,
+                        "risk_score": factor.factor_score,
+                        "severity": factor.severity.value,
+                        "description": factor.description,
+                    },
+                )
+            )
+
+    return records
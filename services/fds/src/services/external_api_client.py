@@ -168,17 +168,15 @@ class ExternalAPIClient:
                 ttl = cache_ttl or CacheTTL.EXTERNAL_API
                 await self.cache.set_json(cache_key, response_data, ttl)
 
-            # 로그 저장 (비동기로 실행, 에러 무시)
-            asyncio.create_task(
-                self._log_api_call(
-                    service_name,
-                    {"url": url, "method": method, "params": params},
-                    response_data,
-                    response_time_ms,
-                    status_code,
-                    error_message,
-                    transaction_id,
-                )
+            # 로그 저장 (write-behind 큐, DB I/O 없음)
+            await self._log_api_call(
+                service_name,
+                {"url": url, "method": method, "params": params},
+                response_data,
+                response_time_ms,
+                status_code,
+                error_message,
+                transaction_id,
             )
 
             return response_data
@@ -189,16 +187,14 @@ class ExternalAPIClient:
             status_code = getattr(e, "status", 500) if hasattr(e, "status") else 500
 
             # 로그 저장 (에러 포함)
-            asyncio.create_task(
-                self._log_api_call(
-                    service_name,
-                    {"url": url, "method": method, "params": params},
-                    None,
-                    response_time_ms,
-                    status_code,
-                    error_message,
-                    transaction_id,
-                )
+            await self._log_api_call(
+                service_name,
+                {"url": url, "method": method, "params": params},
+                None,
+                response_time_ms,
+                status_code,
+                error_message,
+                transaction_id,
             )
 
             raise
@@ -227,21 +223,19 @@ class ExternalAPIClient:
         """
         try:
             from src.models import ExternalServiceLog
-            from src.models.base import AsyncSessionLocal
+            from src.services.write_behind import get_write_behind_queue
             from uuid import UUID
 
-            async with AsyncSessionLocal() as session:
-                log = ExternalServiceLog(
-                    service_name=service_name,
-                    request_data=request_data,
-                    response_data=response_data,
-                    response_time_ms=response_time_ms,
-                    status_code=status_code,
-                    error_message=error_message,
-                    transaction_id=UUID(transaction_id) if transaction_id else None,
-                )
-                session.add(log)
-                await session.commit()
+            log = ExternalServiceLog(
+                service_name=service_name,
+                request_data=request_data,
+                response_data=response_data,
+                response_time_ms=response_time_ms,
+                status_code=status_code,
+                error_message=error_message,
+                transaction_id=UUID(transaction_id) if transaction_id else None,
+            )
+            await get_write_behind_queue().enqueue(log)
         except Exception as e:
             # 로깅 실패는 무시 (원본 API 호출에 영향 없음)
             print(f"[WARN] Failed to log external API call: {e}")
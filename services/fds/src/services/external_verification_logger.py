@@ -12,6 +12,7 @@ from uuid import UUID
 
 from src.services.external_verification_service import ExternalVerificationService
 from src.models.external_service_log import ExternalServiceLog, ServiceName
+from src.services.write_behind import get_write_behind_queue
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ class ExternalVerificationLogger:
         transaction_id: Optional[UUID] = None,
     ):
         """
-        Log external API call to database
+        Queue external API call log for batched persistence
 
         Args:
             service_name: External service name
@@ -69,8 +70,8 @@ class ExternalVerificationLogger:
                 transaction_id=transaction_id,
             )
 
-            self.db.add(log_entry)
-            await self.db.commit()
+            # Batched by the write-behind flusher (no DB round-trip here)
+            await get_write_behind_queue().enqueue(log_entry)
 
             logger.info(
                 f"[ExternalLog] Logged {service_name.value} call: "
@@ -79,7 +80,6 @@ class ExternalVerificationLogger:
 
         except Exception as e:
             logger.error(f"[ExternalLog] Failed to log API call: {e}")
-            await self.db.rollback()
 
     async def verify_email_comprehensive(
         self, email: str, transaction_id: Optional[UUID] = None
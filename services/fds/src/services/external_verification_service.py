@@ -14,7 +14,16 @@ import httpx
 from src.services.emailrep_service import EmailRepService
 from src.services.numverify_service import NumverifyService
 from src.services.bin_service import BINService
+from src.services.bin_range_db import get_bin_range_db
 from src.services.hibp_service import HIBPService
+from src.services.verification_cache import (
+    PROVIDER_POLICIES,
+    VerificationCache,
+    get_provider_gate,
+    get_verification_cache,
+    normalize_email,
+    normalize_phone,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,7 @@ class ExternalVerificationService:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: float = 5.0,
+        verification_cache: Optional[VerificationCache] = None,
     ):
         """
         Initialize external verification service
@@ -43,6 +53,7 @@ class ExternalVerificationService:
             max_retries: Maximum retry attempts (default: 3)
             retry_delay: Initial retry delay in seconds (exponential backoff)
             timeout: Request timeout in seconds (default: 5)
+            verification_cache: Result cache (default: shared process-wide cache)
         """
         self.emailrep = EmailRepService(api_key=emailrep_api_key)
         self.numverify = NumverifyService(api_key=numverify_api_key)
@@ -52,6 +63,7 @@ class ExternalVerificationService:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.cache = verification_cache or get_verification_cache()
 
     async def _retry_with_exponential_backoff(
         self, func, *args, service_name: str, **kwargs
@@ -59,6 +71,9 @@ class ExternalVerificationService:
         """
         Execute function with exponential backoff retry
 
+        Each attempt passes through the provider gate (concurrency limit +
+        shared Redis rate limit); backoff sleeps happen outside the gate.
+
         Args:
             func: Async function to execute
             *args: Function arguments
@@ -72,10 +87,16 @@ class ExternalVerificationService:
             Exception: If all retries fail
         """
         last_exception = None
+        provider = service_name.lower()
+        gate = get_provider_gate(provider) if provider in PROVIDER_POLICIES else None
 
         for attempt in range(self.max_retries):
             try:
-                result = await func(*args, **kwargs)
+                if gate is not None:
+                    async with gate:
+                        result = await func(*args, **kwargs)
+                else:
+                    result = await func(*args, **kwargs)
                 if attempt > 0:
                     logger.info(f"[{service_name}] Success after {attempt} retries")
                 return result
@@ -146,12 +167,18 @@ class ExternalVerificationService:
             "checked_at": datetime.utcnow().isoformat(),
         }
 
-        # Check EmailRep with retry
+        email_key = normalize_email(email)
+
+        # Check EmailRep with retry (cached per normalized email)
         try:
-            emailrep_data = await self._retry_with_exponential_backoff(
-                self.emailrep.check_email_reputation,
-                email,
-                service_name="EmailRep",
+            emailrep_data = await self.cache.get_or_fetch(
+                "emailrep",
+                email_key,
+                lambda: self._retry_with_exponential_backoff(
+                    self.emailrep.check_email_reputation,
+                    email,
+                    service_name="EmailRep",
+                ),
             )
             emailrep_risk = self.emailrep.calculate_risk_score(emailrep_data)
 
@@ -165,10 +192,14 @@ class ExternalVerificationService:
             logger.error(f"[EmailRep] Failed after retries: {e}")
             results["emailrep"]["error"] = str(e)
 
-        # Check HaveIBeenPwned with retry
+        # Check HaveIBeenPwned with retry (cached per normalized email)
         try:
-            hibp_data = await self._retry_with_exponential_backoff(
-                self.hibp.check_breached_account, email, service_name="HIBP"
+            hibp_data = await self.cache.get_or_fetch(
+                "hibp",
+                email_key,
+                lambda: self._retry_with_exponential_backoff(
+                    self.hibp.check_breached_account, email, service_name="HIBP"
+                ),
             )
             hibp_risk = self.hibp.calculate_risk_score(hibp_data)
 
@@ -254,11 +285,15 @@ class ExternalVerificationService:
         }
 
         try:
-            numverify_data = await self._retry_with_exponential_backoff(
-                self.numverify.validate_phone_number,
-                phone_number,
-                country_code,
-                service_name="Numverify",
+            numverify_data = await self.cache.get_or_fetch(
+                "numverify",
+                normalize_phone(phone_number, country_code),
+                lambda: self._retry_with_exponential_backoff(
+                    self.numverify.validate_phone_number,
+                    phone_number,
+                    country_code,
+                    service_name="Numverify",
+                ),
             )
 
             result["available"] = True
@@ -294,7 +329,7 @@ class ExternalVerificationService:
         geoip_country: Optional[str] = None,
     ) -> Dict:
         """
-        Verify card BIN with country mismatch check (with retry)
+        Verify card BIN with country mismatch check (local BIN range DB)
 
         Args:
             bin_number: Card BIN (first 6-8 digits)
@@ -328,9 +363,8 @@ class ExternalVerificationService:
         }
 
         try:
-            bin_data = await self._retry_with_exponential_backoff(
-                self.binlist.lookup_bin, bin_number, service_name="BINList"
-            )
+            # Local BIN range DB (remote lookup only on a miss, long-TTL cached)
+            bin_data = await get_bin_range_db().lookup(bin_number)
 
             result["available"] = True
             result["data"] = bin_data
@@ -356,7 +390,7 @@ class ExternalVerificationService:
                 result["recommendation"] = "allow"
 
         except Exception as e:
-            logger.error(f"[BINList] Failed after retries: {e}")
+            logger.error(f"[BINList] BIN lookup failed: {e}")
             result["error"] = str(e)
             result["risk_score"] = 50  # Fallback
             result["recommendation"] = "review"
@@ -12,6 +12,8 @@ from typing import Dict, Optional
 import httpx
 from datetime import datetime
 
+from src.services.verification_cache import get_provider_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +56,7 @@ class HIBPService:
                     "is_sensitive": bool
                 }],
                 "paste_count": int,
+                "partial": bool,  # paste lookup failed (not cached)
                 "risk_score": int,  # 0-100 (calculated)
                 "raw_response": Dict
             }
@@ -86,25 +89,25 @@ class HIBPService:
         logger.info(f"[HIBP] Checking breaches for: {email}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-
-                # 404 means no breaches found
-                if response.status_code == 404:
-                    logger.info(f"[HIBP] No breaches found for: {email}")
-                    return {
-                        "email": email,
-                        "breached": False,
-                        "breach_count": 0,
-                        "breaches": [],
-                        "paste_count": 0,
-                        "risk_score": 0,
-                        "raw_response": {},
-                        "checked_at": datetime.utcnow().isoformat(),
-                    }
-
-                response.raise_for_status()
-                breaches = response.json()
+            client = get_provider_client("hibp", self.timeout)
+            response = await client.get(url, headers=headers)
+
+            # 404 means no breaches found
+            if response.status_code == 404:
+                logger.info(f"[HIBP] No breaches found for: {email}")
+                return {
+                    "email": email,
+                    "breached": False,
+                    "breach_count": 0,
+                    "breaches": [],
+                    "paste_count": 0,
+                    "risk_score": 0,
+                    "raw_response": {},
+                    "checked_at": datetime.utcnow().isoformat(),
+                }
+
+            response.raise_for_status()
+            breaches = response.json()
 
             # Check pastes (separate API call)
             paste_count = await self._check_pastes(email, headers)
@@ -131,7 +134,8 @@ class HIBPService:
                 "breached": True,
                 "breach_count": len(breach_list),
                 "breaches": breach_list,
-                "paste_count": paste_count,
+                "paste_count": paste_count or 0,
+                "partial": paste_count is None,
                 "raw_response": breaches,
                 "checked_at": datetime.utcnow().isoformat(),
             }
@@ -164,7 +168,7 @@ class HIBPService:
             logger.error(f"[HIBP] Unexpected error checking email: {e}")
             raise
 
-    async def _check_pastes(self, email: str, headers: Dict) -> int:
+    async def _check_pastes(self, email: str, headers: Dict) -> Optional[int]:
         """
         Check if email appears in pastes
 
@@ -173,7 +177,7 @@ class HIBPService:
             headers: Request headers with API key
 
         Returns:
-            Number of paste appearances
+            Number of paste appearances, or None if the lookup failed
         """
         import urllib.parse
 
@@ -181,19 +185,19 @@ class HIBPService:
         url = f"{self.base_url}/pasteaccount/{encoded_email}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
+            client = get_provider_client("hibp", self.timeout)
+            response = await client.get(url, headers=headers)
 
-                if response.status_code == 404:
-                    return 0
+            if response.status_code == 404:
+                return 0
 
-                response.raise_for_status()
-                pastes = response.json()
-                return len(pastes)
+            response.raise_for_status()
+            pastes = response.json()
+            return len(pastes)
 
         except Exception as e:
             logger.warning(f"[HIBP] Error checking pastes: {e}")
-            return 0
+            return None
 
     async def _check_anonymity_fallback(self, email: str) -> Dict:
         """
@@ -245,24 +249,24 @@ class HIBPService:
         logger.info(f"[HIBP] Checking password (k-Anonymity: {hash_prefix})")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Parse response (format: SUFFIX:COUNT\r\n)
-                for line in response.text.splitlines():
-                    parts = line.split(":")
-                    if len(parts) == 2 and parts[0] == hash_suffix:
-                        pwn_count = int(parts[1])
-                        logger.info(f"[HIBP] Password pwned {pwn_count} times")
-
-                        risk_score = min(pwn_count // 10, 100)  # Scale to 0-100
-
-                        return {
-                            "pwned": True,
-                            "pwn_count": pwn_count,
-                            "risk_score": risk_score,
-                        }
+            client = get_provider_client("hibp", self.timeout)
+            response = await client.get(url)
+            response.raise_for_status()
+
+            # Parse response (format: SUFFIX:COUNT\r\n)
+            for line in response.text.splitlines():
+                parts = line.split(":")
+                if len(parts) == 2 and parts[0] == hash_suffix:
+                    pwn_count = int(parts[1])
+                    logger.info(f"[HIBP] Password pwned {pwn_count} times")
+
+                    risk_score = min(pwn_count // 10, 100)  # Scale to 0-100
+
+                    return {
+                        "pwned": True,
+                        "pwn_count": pwn_count,
+                        "risk_score": risk_score,
+                    }
 
             # Password not found in breaches
             logger.info("[HIBP] Password not pwned")
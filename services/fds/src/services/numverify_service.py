@@ -11,6 +11,8 @@ from typing import Dict, Optional
 import httpx
 from datetime import datetime
 
+from src.services.verification_cache import get_provider_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,10 +78,10 @@ class NumverifyService:
         logger.info(f"[Numverify] Validating phone number: {phone_number}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/validate", params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = get_provider_client("numverify", self.timeout)
+            response = await client.get(f"{self.base_url}/validate", params=params)
+            response.raise_for_status()
+            data = response.json()
 
             # Check for API errors
             if not data.get("valid", False) and "error" in data:
@@ -0,0 +1,348 @@
+"""
+과거 거래 재채점 워커
+
+BatchService.reevaluate_transactions 가 프로세스 풀로 분산하는 순수 CPU 작업.
+
+- FraudRuleEngine / MLEngine 을 워커 프로세스마다 한 번 초기화
+- Redis 상태는 실행 시작 시점 스냅샷(RedisSnapshot)에서 읽고, 룰이 쓰는 값
+  (속도 카운터 등)은 워커 메모리에만 반영 (운영 Redis 키는 건드리지 않음)
+- BIN 국가 조회는 로컬 BIN 범위 DB만 사용 (원격 조회 없음)
+- transactions 에 저장되지 않는 입력(카드/이메일/배송지)을 쓰는 룰, 현재 시각
+  또는 앞선 거래가 남긴 상태에 의존하는 룰은 결과에서 제외 (스냅샷은 실행 시점
+  상태이고 워커마다 따로 복사되므로 재현 불가)
+- 비교 기준은 저장된 점수/상태가 아니라 현재 운영 설정(운영 ML 모델)으로 같은 룰
+  제외를 적용해 재채점한 기준값: 저장 점수에는 제외 룰 점수가 포함되고 저장 상태는
+  결정과 다른 값(차단 → manual_review, 중위험 → evaluating)으로 기록되므로 직접
+  비교하면 거의 모든 거래가 변경으로 집계됨
+"""
+
+import asyncio
+import fnmatch
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ..engines.fraud_rule_engine import FraudRuleEngine, RuleAction, TransactionData
+from ..engines.ml_engine import MLEngine
+from ..services.bin_range_db import get_bin_range_db
+
+logger = logging.getLogger(__name__)
+
+# FraudRuleEngine 이 읽는 Redis 키 패턴
+SNAPSHOT_KEY_PATTERNS = (
+    "card_velocity:*",
+    "card_failures:*",
+    "cvv_failures:*",
+    "fraud_bins",
+    "password_failures:*",
+    "last_ip:*",
+    "last_ip_time:*",
+    "login_time:*",
+    "ip_users:*",
+    "known_devices:*",
+    "account_created_at:*",
+    "password_changed_at:*",
+    "login_failures:*",
+    "shipping_users:*",
+    "card_shipping:*",
+    "fraud_addresses",
+    "user_tx_count:*",
+)
+
+# transactions 에 저장되지 않는 입력(카드 번호, 이메일, 배송지 주소)에 의존하는 룰.
+# 빈 값으로 평가하면 오탐(예: S5 불완전한 주소)이 되므로 재채점에서 제외한다.
+MISSING_INPUT_RULES = frozenset(
+    {
+        "P1",
+        "P2",
+        "P4",
+        "P5",
+        "P6",
+        "P7",
+        "P10",
+        "S1",
+        "S2",
+        "S4",
+        "S5",
+        "S6",
+        "S7",
+        "S8",
+    }
+)
+
+# 현재 시각(utcnow)과 스냅샷 시각을 비교하거나(A3/A7/A9), 앞선 거래가 Redis 에
+# 남긴 상태를 읽는 룰(A2 직전 IP, A4 IP 별 사용자 집합, A10 실패 카운터 리셋).
+# 과거 거래 시점의 상태가 아니고, 워커마다 받은 청크 순서에 따라 결과가 달라지므로
+# 재채점에서 제외한다.
+STATEFUL_RULES = frozenset({"A2", "A3", "A4", "A7", "A9", "A10"})
+
+UNREPLAYABLE_RULES = MISSING_INPUT_RULES | STATEFUL_RULES
+
+# 재채점 결정 → transactions.evaluation_status 값
+DECISION_BLOCKED = "blocked"
+DECISION_MANUAL_REVIEW = "manual_review"
+DECISION_APPROVED = "approved"
+
+
+def _to_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class RedisSnapshot:
+    """
+    Redis 키 스냅샷 (FraudRuleEngine 이 사용하는 명령만 지원하는 인메모리 구현)
+
+    redis-py(decode_responses=False) 와 같이 문자열 값은 bytes 로 반환한다.
+    """
+
+    def __init__(
+        self,
+        strings: Optional[Dict[str, bytes]] = None,
+        sets: Optional[Dict[str, Set[str]]] = None,
+    ):
+        self.strings: Dict[str, bytes] = dict(strings or {})
+        self.sets: Dict[str, Set[str]] = {k: set(v) for k, v in (sets or {}).items()}
+
+    @classmethod
+    async def capture(
+        cls, redis, patterns: Iterable[str] = SNAPSHOT_KEY_PATTERNS
+    ) -> "RedisSnapshot":
+        """운영 Redis 에서 룰 관련 키를 읽어 스냅샷 생성 (읽기 전용)"""
+        snapshot = cls()
+        for pattern in patterns:
+            async for key in redis.scan_iter(match=pattern, count=1000):
+                key_str = key.decode() if isinstance(key, bytes) else key
+                key_type = await redis.type(key)
+                key_type = (
+                    key_type.decode() if isinstance(key_type, bytes) else key_type
+                )
+                if key_type == "string":
+                    value = await redis.get(key)
+                    if value is not None:
+                        snapshot.strings[key_str] = _to_bytes(value)
+                elif key_type == "set":
+                    members = await redis.smembers(key)
+                    snapshot.sets[key_str] = {
+                        m.decode() if isinstance(m, bytes) else str(m) for m in members
+                    }
+        return snapshot
+
+    def copy(self) -> "RedisSnapshot":
+        return RedisSnapshot(strings=self.strings, sets=self.sets)
+
+    def __len__(self) -> int:
+        return len(self.strings) + len(self.sets)
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        return [
+            k for k in (*self.strings, *self.sets) if fnmatch.fnmatchcase(k, pattern)
+        ]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.strings.get(key)
+
+    async def set(self, key: str, value: Any, **kwargs) -> bool:
+        self.strings[key] = _to_bytes(value)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.strings.get(key, b"0")) + 1
+        self.strings[key] = _to_bytes(value)
+        return value
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        # 만료는 적용하지 않음 (TTL 에 의존하는 룰은 UNREPLAYABLE_RULES 로 제외)
+        return key in self.strings or key in self.sets
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            deleted += int(self.strings.pop(key, None) is not None)
+            deleted += int(self.sets.pop(key, None) is not None)
+        return deleted
+
+    async def sadd(self, key: str, *members: Any) -> int:
+        target = self.sets.setdefault(key, set())
+        before = len(target)
+        target.update(str(m) for m in members)
+        return len(target) - before
+
+    async def scard(self, key: str) -> int:
+        return len(self.sets.get(key, ()))
+
+    async def sismember(self, key: str, member: Any) -> bool:
+        return str(member) in self.sets.get(key, ())
+
+
+@dataclass
+class RescoreConfig:
+    """워커 초기화 설정 (프로세스 풀 initargs 로 전달, pickle 가능)"""
+
+    test_cards: List[str] = field(default_factory=list)
+    freight_forwarders: List[Dict[str, Any]] = field(default_factory=list)
+    disposable_email_domains: List[str] = field(default_factory=list)
+    ml_model_path: Optional[str] = None
+    baseline_ml_model_path: Optional[str] = None
+    snapshot: RedisSnapshot = field(default_factory=RedisSnapshot)
+
+
+class TransactionRescorer:
+    """한 워커의 재채점기 (룰 엔진 + 후보/기준 ML 엔진)"""
+
+    def __init__(self, config: RescoreConfig):
+        self.rule_engine = FraudRuleEngine(
+            db=None,
+            redis=config.snapshot.copy(),
+            test_cards=config.test_cards,
+            freight_forwarders=config.freight_forwarders,
+            disposable_email_domains=config.disposable_email_domains,
+        )
+        self.ml_engine = (
+            MLEngine(model_path=config.ml_model_path) if config.ml_model_path else None
+        )
+        if config.baseline_ml_model_path == config.ml_model_path:
+            self.baseline_ml_engine = self.ml_engine
+        else:
+            self.baseline_ml_engine = (
+                MLEngine(model_path=config.baseline_ml_model_path)
+                if config.baseline_ml_model_path
+                else None
+            )
+
+    async def score(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        거래 1건 재채점
+
+        Args:
+            row: transactions 행 (id, user_id, amount, ip_address, user_agent,
+                device_type, geolocation, risk_score, evaluation_status, created_at)
+
+        Returns:
+            Dict: 기준(old)/후보(new) 점수와 결정, 차이, 저장된 결정
+        """
+        geolocation = row.get("geolocation") or {}
+        country = geolocation.get("country", "")
+
+        tx = TransactionData(
+            transaction_id=row["id"],
+            user_id=row["user_id"],
+            user_email="",
+            card_number="",
+            card_bin="",
+            card_last4="",
+            amount=Decimal(str(row["amount"])),
+            currency="KRW",
+            ip_address=row["ip_address"],
+            user_agent=row.get("user_agent") or "",
+            shipping_address="",
+            shipping_city="",
+            shipping_country=country,
+            billing_country=country,
+            created_at=row.get("created_at"),
+        )
+        # 룰은 기준/후보가 같으므로 한 번만 평가 (스냅샷 카운터 이중 증가 방지)
+        results, _, _ = await self.rule_engine.evaluate(tx)
+        matched = [
+            r
+            for r in results
+            if r.matched and r.rule_name.split(":", 1)[0] not in UNREPLAYABLE_RULES
+        ]
+        rule_score = sum(r.risk_score for r in matched)
+        rule_actions = [r.action for r in matched]
+
+        ml_input = {
+            "transaction_id": str(row["id"]),
+            "user_id": str(row["user_id"]),
+            "amount": float(row["amount"]),
+            "ip_address": row["ip_address"],
+            "device_type": row.get("device_type") or "unknown",
+            "geolocation": geolocation,
+            "created_at": row.get("created_at"),
+        }
+        new_score = min(rule_score + await _ml_score(self.ml_engine, ml_input), 100)
+        if self.baseline_ml_engine is self.ml_engine:
+            old_score = new_score
+        else:
+            old_score = min(
+                rule_score + await _ml_score(self.baseline_ml_engine, ml_input), 100
+            )
+        new_decision = decide(new_score, rule_actions)
+        old_decision = decide(old_score, rule_actions)
+
+        return {
+            "transaction_id": row["id"],
+            "old_risk_score": old_score,
+            "new_risk_score": new_score,
+            "score_delta": new_score - old_score,
+            "old_decision": old_decision,
+            "new_decision": new_decision,
+            "decision_changed": old_decision != new_decision,
+            "stored_decision": stored_decision(int(row["risk_score"])),
+            "matched_rules": [r.rule_name for r in matched],
+        }
+
+
+async def _ml_score(ml_engine: Optional[MLEngine], ml_input: Dict[str, Any]) -> int:
+    """ML 이상 점수 (엔진이 없거나 정상이면 0)"""
+    if ml_engine is None:
+        return 0
+    ml_result = await ml_engine.evaluate(ml_input)
+    if ml_result.get("is_anomaly"):
+        return int(ml_result.get("anomaly_score", 0))
+    return 0
+
+
+def decide(risk_score: int, rule_actions: Iterable[str]) -> str:
+    """
+    재채점 점수 → 결정 (transactions.evaluation_status 값)
+
+    BLOCK 룰 매칭 또는 71점 이상: blocked, 31-70점 또는 수동 검토 룰: manual_review
+    """
+    rule_actions = set(rule_actions)
+    if RuleAction.BLOCK in rule_actions or risk_score > 70:
+        return DECISION_BLOCKED
+    if RuleAction.MANUAL_REVIEW in rule_actions or risk_score > 30:
+        return DECISION_MANUAL_REVIEW
+    return DECISION_APPROVED
+
+
+def stored_decision(stored_risk_score: int) -> str:
+    """
+    저장된 평가 결과 → 결정 (decide 와 같은 기준)
+
+    transactions.evaluation_status 는 결정 그대로가 아니고(차단 → manual_review,
+    중위험 → evaluating, 검토 후 approved/blocked) 매칭 룰 액션도 저장되지 않으므로
+    저장된 위험 점수에 같은 임계값을 적용한다. 기준 재채점과의 차이는 제외 룰과
+    실행 시점 상태로 인한 재현 오차를 나타낸다.
+    """
+    return decide(stored_risk_score, ())
+
+
+# 워커 프로세스 전역 재채점기
+_rescorer: Optional[TransactionRescorer] = None
+
+
+def init_worker(config: RescoreConfig) -> None:
+    """프로세스 풀 initializer: 엔진을 워커당 한 번 초기화"""
+    global _rescorer
+    get_bin_range_db().remote_fallback = False
+    _rescorer = TransactionRescorer(config)
+
+
+def score_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    거래 청크 재채점 (워커 프로세스에서 실행)
+
+    Returns:
+        List[Dict]: 입력 순서대로 재채점 결과
+    """
+    if _rescorer is None:
+        raise RuntimeError("init_worker() must run before score_rows()")
+
+    async def _score_all():
+        return [await _rescorer.score(row) for row in rows]
+
+    return asyncio.run(_score_all())
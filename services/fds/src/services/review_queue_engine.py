@@ -0,0 +1,684 @@
+"""
+검토 큐 우선순위/할당 엔진
+
+검토 대기 항목을 Redis Sorted Set 에 위험 점수와 대기 시간으로 정렬해 두고,
+분석가의 "다음 항목 가져오기"를 Lua 스크립트 한 번으로 원자적으로 처리한다.
+SELECT → UPDATE → COMMIT 사이에 두 분석가가 같은 항목을 가져가는 경합이 없다.
+
+- pending (ZSET): 검토 대기 항목, 점수가 낮을수록 먼저 (priority_score)
+- leases (ZSET): 할당된 항목, 점수는 리스 만료 시각(ms)
+- owners (HASH): 할당된 항목 → 담당자 ID
+- priority (HASH): 할당된 항목의 원래 우선순위 (리스 만료 시 그대로 대기열 복귀)
+
+리스는 renew() 로 연장하며, 만료된 리스는 다음 claim 또는 리퍼 루프에서
+대기열로 돌아간다. Postgres 는 여전히 원본(source of truth)이며 할당/복귀
+결과는 백그라운드로 반영한다 (rebuild() 로 DB 에서 대기열 재구성 가능).
+
+- DB 반영은 항목별로 순서대로: 항목마다 반영 태스크 하나가 최신 목표 상태
+  (상태, 담당자) 를 기록하고, 기록 중 새 목표가 오면 이어서 기록한다. 실패하면
+  재시도한다 (할당 → 복귀 순서가 뒤바뀌어 DB 에 이전 상태가 남지 않음)
+- 검토 완료 행은 덮어쓰지 않는다 (행 잠금 후 확인)
+- 리퍼 루프가 주기적으로 reconcile() 로 Redis 리스와 DB 상태를 맞춘다 (재시도
+  소진, 프로세스 재시작, 다른 프로세스의 직접 반영과의 순서 역전 복구)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_, select
+
+from ..models.review_queue import ReviewQueue, ReviewStatus
+from ..models.transaction import Transaction
+from .dashboard_rollup import SCOPE_REVIEW, get_dashboard_rollup
+
+logger = logging.getLogger(__name__)
+
+# 위험 점수 1점 = 대기 시간 1시간 (위험 점수 90 항목은 70 항목보다 20시간 먼저
+# 들어온 것과 같은 순서, 오래 기다린 저위험 항목도 결국 앞으로 온다)
+RISK_WEIGHT_SECONDS = 3600
+
+DEFAULT_LEASE_SECONDS = int(os.getenv("FDS_REVIEW_LEASE_SECONDS", "900"))
+
+# 호출당 대기열로 되돌릴 만료 리스 최대 수
+REQUEUE_BATCH = 100
+
+# 엔진이 DB 에 반영하는 상태 (검토 완료 행은 덮어쓰지 않음)
+ACTIVE_STATUSES = (ReviewStatus.PENDING, ReviewStatus.IN_REVIEW)
+
+# KEYS: pending, leases, owners, priority
+# ARGV: now_ms, limit
+# 반환: 대기열로 되돌린 항목 ID 목록
+_REQUEUE_EXPIRED = """
+local function requeue_expired(now, limit)
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, limit)
+    for _, id in ipairs(expired) do
+        local priority = redis.call('HGET', KEYS[4], id)
+        redis.call('ZREM', KEYS[2], id)
+        redis.call('HDEL', KEYS[3], id)
+        redis.call('HDEL', KEYS[4], id)
+        if priority then
+            redis.call('ZADD', KEYS[1], priority, id)
+        end
+    end
+    return expired
+end
+"""
+
+REQUEUE_SCRIPT = (
+    _REQUEUE_EXPIRED
+    + """
+return requeue_expired(tonumber(ARGV[1]), tonumber(ARGV[2]))
+"""
+)
+
+# ARGV: now_ms, limit, lease_ms, reviewer_id
+# 반환: {할당된 항목 ID (없으면 ''), 대기열로 되돌린 항목 ID 목록}
+CLAIM_NEXT_SCRIPT = (
+    _REQUEUE_EXPIRED
+    + """
+local now = tonumber(ARGV[1])
+local expired = requeue_expired(now, tonumber(ARGV[2]))
+
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return {'', expired}
+end
+
+local id = popped[1]
+redis.call('HSET', KEYS[4], id, popped[2])
+redis.call('HSET', KEYS[3], id, ARGV[4])
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), id)
+return {id, expired}
+"""
+)
+
+# ARGV: now_ms, lease_ms, reviewer_id, queue_id, priority (대기열에 없을 때 사용)
+# 반환: 1 (할당/연장), 0 (다른 담당자가 보유 중)
+CLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+local id = ARGV[4]
+
+local owner = redis.call('HGET', KEYS[3], id)
+if owner and owner ~= ARGV[3] and tonumber(redis.call('ZSCORE', KEYS[2], id) or 0) > now then
+    return 0
+end
+
+local priority = redis.call('ZSCORE', KEYS[1], id) or redis.call('HGET', KEYS[4], id) or ARGV[5]
+redis.call('ZREM', KEYS[1], id)
+redis.call('HSET', KEYS[4], id, priority)
+redis.call('HSET', KEYS[3], id, ARGV[3])
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), id)
+return 1
+"""
+
+# ARGV: now_ms, lease_ms, reviewer_id, queue_id
+# 반환: 1 (연장), 0 (보유 중인 리스 없음 또는 만료)
+RENEW_SCRIPT = """
+local id = ARGV[4]
+if redis.call('HGET', KEYS[3], id) ~= ARGV[3] then
+    return 0
+end
+local expires = tonumber(redis.call('ZSCORE', KEYS[2], id) or 0)
+if expires <= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[2]), id)
+return 1
+"""
+
+# ARGV: reviewer_id, queue_id
+# 반환: 1 (대기열로 반환), 0 (보유 중인 리스 없음)
+RELEASE_SCRIPT = """
+local id = ARGV[2]
+if redis.call('HGET', KEYS[3], id) ~= ARGV[1] then
+    return 0
+end
+local priority = redis.call('HGET', KEYS[4], id)
+redis.call('ZREM', KEYS[2], id)
+redis.call('HDEL', KEYS[3], id)
+redis.call('HDEL', KEYS[4], id)
+if priority then
+    redis.call('ZADD', KEYS[1], priority, id)
+end
+return 1
+"""
+
+# ARGV: (queue_id, priority) 쌍
+# 반환: 대기열에 새로 추가된 항목 수 (할당 중인 항목은 건너뜀)
+ENQUEUE_SCRIPT = """
+local added = 0
+for i = 1, #ARGV, 2 do
+    if not redis.call('HGET', KEYS[3], ARGV[i]) then
+        added = added + redis.call('ZADD', KEYS[1], 'NX', ARGV[i + 1], ARGV[i])
+    end
+end
+return added
+"""
+
+
+def priority_score(risk_score: int, added_at: datetime) -> float:
+    """
+    대기열 점수 (낮을수록 먼저 할당)
+
+    Args:
+        risk_score: 위험 점수 (0-100)
+        added_at: 큐 추가 일시
+
+    Returns:
+        float: 추가 시각(초) - 위험 점수 * RISK_WEIGHT_SECONDS
+    """
+    return added_at.timestamp() - (risk_score or 0) * RISK_WEIGHT_SECONDS
+
+
+@dataclass(frozen=True)
+class ReviewLease:
+    """검토 항목 할당 (리스)"""
+
+    queue_id: UUID
+    reviewer_id: UUID
+    expires_at: datetime
+
+
+class ReviewQueueEngine:
+    """
+    Redis 기반 검토 큐 우선순위/할당 엔진
+
+    Example:
+        ```python
+        engine = await get_review_queue_engine()
+        lease = await engine.claim_next(reviewer_id)
+        ...
+        await engine.renew(lease.queue_id, reviewer_id)  # 검토가 길어질 때
+        ```
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        session_factory: Optional[Callable] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        reap_interval_seconds: float = 30.0,
+        prefix: str = "fds:review",
+        persist_retries: int = 3,
+        persist_retry_seconds: float = 0.5,
+    ):
+        """
+        Args:
+            redis: async Redis 클라이언트 (decode_responses=True)
+            session_factory: DB 반영에 사용할 세션 팩토리 (기본: AsyncSessionLocal)
+            lease_seconds: 리스 유효 시간
+            reap_interval_seconds: 만료 리스 회수 주기
+            prefix: Redis 키 prefix
+            persist_retries: DB 반영 실패 또는 행이 아직 없을 때 (write-behind 대기
+                중) 재시도 횟수 (소진 시 reconcile() 이 복구)
+            persist_retry_seconds: 재시도 대기 기본 시간 (시도마다 선형 증가)
+        """
+        self.redis = redis
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.reap_interval_seconds = reap_interval_seconds
+        self.persist_retries = persist_retries
+        self.persist_retry_seconds = persist_retry_seconds
+        self.keys = [
+            f"{prefix}:pending",
+            f"{prefix}:leases",
+            f"{prefix}:owners",
+            f"{prefix}:priority",
+        ]
+
+        self._requeue = redis.register_script(REQUEUE_SCRIPT)
+        self._claim_next = redis.register_script(CLAIM_NEXT_SCRIPT)
+        self._claim = redis.register_script(CLAIM_SCRIPT)
+        self._renew = redis.register_script(RENEW_SCRIPT)
+        self._release = redis.register_script(RELEASE_SCRIPT)
+        self._enqueue = redis.register_script(ENQUEUE_SCRIPT)
+
+        self._reaper_task: Optional[asyncio.Task] = None
+        # 항목별 DB 반영 목표 (상태, 담당자) 와 반영 태스크
+        self._targets: Dict[UUID, Tuple[ReviewStatus, Optional[UUID]]] = {}
+        self._persist_tasks: Dict[UUID, asyncio.Task] = {}
+
+        self.stats = {
+            "claimed": 0,
+            "conflicts": 0,
+            "requeued": 0,
+            "persisted": 0,
+            "persist_errors": 0,
+            "reconciled": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 대기열
+    # ------------------------------------------------------------------
+
+    async def enqueue(
+        self, queue_id: UUID, risk_score: int, added_at: datetime
+    ) -> bool:
+        """
+        검토 대기열에 추가 (이미 대기/할당 중이면 무시)
+
+        Returns:
+            bool: 새로 추가되었는지 여부
+        """
+        return await self.enqueue_many([(queue_id, risk_score, added_at)]) > 0
+
+    async def enqueue_many(self, items: Iterable[Tuple[UUID, int, datetime]]) -> int:
+        """
+        검토 대기열에 일괄 추가
+
+        Args:
+            items: (검토 큐 ID, 위험 점수, 큐 추가 일시)
+
+        Returns:
+            int: 새로 추가된 항목 수 (Redis 오류 시 0, 다음 rebuild() 에서 복구)
+        """
+        args: List[Any] = []
+        for queue_id, risk_score, added_at in items:
+            args.extend([str(queue_id), priority_score(risk_score, added_at)])
+        if not args:
+            return 0
+        try:
+            return int(await self._enqueue(keys=self.keys, args=args))
+        except Exception as e:
+            logger.warning(f"[REVIEW-QUEUE] 대기열 추가 실패: {e}")
+            return 0
+
+    async def peek(self, limit: int = 50, offset: int = 0) -> List[UUID]:
+        """
+        대기열을 우선순위 순으로 조회 (할당하지 않음)
+
+        Returns:
+            list[UUID]: 검토 큐 ID 목록
+        """
+        ids = await self.redis.zrange(self.keys[0], offset, offset + limit - 1)
+        return [UUID(queue_id) for queue_id in ids]
+
+    async def remove(self, queue_id: UUID) -> None:
+        """
+        검토 완료된 항목을 대기열/리스에서 제거
+
+        Redis 오류는 기록만 한다 (남은 항목은 할당 시 DB 상태 확인 후 제거).
+        """
+        member = str(queue_id)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.keys[0], member)
+        pipe.zrem(self.keys[1], member)
+        pipe.hdel(self.keys[2], member)
+        pipe.hdel(self.keys[3], member)
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[REVIEW-QUEUE] 대기열 제거 실패: queue_id={queue_id}, {e}")
+
+    # ------------------------------------------------------------------
+    # 할당
+    # ------------------------------------------------------------------
+
+    async def claim_next(self, reviewer_id: UUID) -> Optional[ReviewLease]:
+        """
+        우선순위가 가장 높은 대기 항목을 원자적으로 할당
+
+        Args:
+            reviewer_id: 검토 담당자 ID
+
+        Returns:
+            Optional[ReviewLease]: 할당된 리스 (대기 항목이 없으면 None)
+        """
+        now_ms = self._now_ms()
+        claimed, expired = await self._claim_next(
+            keys=self.keys,
+            args=[now_ms, REQUEUE_BATCH, self.lease_seconds * 1000, str(reviewer_id)],
+        )
+        self._requeued(expired)
+
+        if not claimed:
+            return None
+
+        self.stats["claimed"] += 1
+        queue_id = UUID(claimed)
+        self._persist_assignment(queue_id, reviewer_id)
+        return self._lease(queue_id, reviewer_id, now_ms)
+
+    async def claim(
+        self,
+        queue_id: UUID,
+        reviewer_id: UUID,
+        risk_score: int = 0,
+        added_at: Optional[datetime] = None,
+    ) -> Optional[ReviewLease]:
+        """
+        특정 항목 할당 (다른 담당자가 유효한 리스를 보유 중이면 실패)
+
+        대기열에 없는 항목 (엔진 도입 전 항목 등) 은 risk_score/added_at 으로
+        우선순위를 계산해 할당한다. DB 반영은 호출 측에서 한다.
+
+        Returns:
+            Optional[ReviewLease]: 할당된 리스 (경합 시 None)
+        """
+        now_ms = self._now_ms()
+        priority = priority_score(risk_score, added_at or datetime.utcnow())
+        granted = await self._claim(
+            keys=self.keys,
+            args=[
+                now_ms,
+                self.lease_seconds * 1000,
+                str(reviewer_id),
+                str(queue_id),
+                priority,
+            ],
+        )
+        if not int(granted):
+            self.stats["conflicts"] += 1
+            return None
+
+        self.stats["claimed"] += 1
+        return self._lease(queue_id, reviewer_id, now_ms)
+
+    async def renew(self, queue_id: UUID, reviewer_id: UUID) -> Optional[ReviewLease]:
+        """
+        리스 연장
+
+        Returns:
+            Optional[ReviewLease]: 연장된 리스 (보유 중이 아니거나 만료되었으면 None)
+        """
+        now_ms = self._now_ms()
+        renewed = await self._renew(
+            keys=self.keys,
+            args=[now_ms, self.lease_seconds * 1000, str(reviewer_id), str(queue_id)],
+        )
+        if not int(renewed):
+            return None
+        return self._lease(queue_id, reviewer_id, now_ms)
+
+    async def release(self, queue_id: UUID, reviewer_id: UUID) -> bool:
+        """
+        할당 반환 (검토하지 않고 대기열로 되돌림)
+
+        Returns:
+            bool: 반환 여부 (보유 중인 리스가 없으면 False)
+        """
+        released = await self._release(
+            keys=self.keys, args=[str(reviewer_id), str(queue_id)]
+        )
+        if not int(released):
+            return False
+
+        self._persist_requeue([queue_id])
+        return True
+
+    async def requeue_expired(self) -> List[UUID]:
+        """
+        만료된 리스를 대기열로 되돌림
+
+        Returns:
+            list[UUID]: 대기열로 돌아간 검토 큐 ID 목록
+        """
+        expired = await self._requeue(
+            keys=self.keys, args=[self._now_ms(), REQUEUE_BATCH]
+        )
+        return self._requeued(expired)
+
+    # ------------------------------------------------------------------
+    # 수명 주기 / DB 동기화
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """만료 리스 회수 루프 시작"""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_loop())
+
+    async def stop(self) -> None:
+        """회수 루프 종료 및 진행 중인 DB 반영 대기"""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+        while self._persist_tasks:
+            await asyncio.gather(*self._persist_tasks.values(), return_exceptions=True)
+
+    async def rebuild(self, session_factory: Optional[Callable] = None) -> int:
+        """
+        DB 의 검토 대기 항목으로 대기열 재구성 (Redis 유실/엔진 도입 시)
+
+        할당 중인 항목은 건너뛰므로 운영 중 실행해도 안전하다.
+
+        Returns:
+            int: 새로 추가된 항목 수
+        """
+        session_factory = session_factory or self._session_factory()
+        async with session_factory() as session:
+            result = await session.execute(
+                select(ReviewQueue.id, Transaction.risk_score, ReviewQueue.added_at)
+                .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+                .where(ReviewQueue.status == ReviewStatus.PENDING)
+            )
+            rows = [tuple(row) for row in result.all()]
+
+        added = 0
+        for start in range(0, len(rows), 1000):
+            added += await self.enqueue_many(rows[start : start + 1000])
+
+        logger.info(f"[REVIEW-QUEUE] Rebuilt pending set: {added}/{len(rows)} added")
+        return added
+
+    async def reconcile(self, session_factory: Optional[Callable] = None) -> int:
+        """
+        Redis 리스 상태를 DB 에 맞춤
+
+        - 리스가 있는 항목: DB 가 다른 상태/담당자면 in_review (리스 보유자)
+        - DB 에서 in_review 인데 리스가 없는 항목: pending 으로 되돌리고 대기열에 추가
+        - 반영 대기 중인 항목과 검토 완료 항목은 건너뜀
+
+        Returns:
+            int: 반영을 예약한 항목 수
+        """
+        owners = await self.redis.hgetall(self.keys[2])
+        leased = {UUID(queue_id): UUID(owner) for queue_id, owner in owners.items()}
+
+        session_factory = session_factory or self._session_factory()
+        async with session_factory() as session:
+            result = await session.execute(
+                select(
+                    ReviewQueue.id,
+                    ReviewQueue.status,
+                    ReviewQueue.assigned_to,
+                    Transaction.risk_score,
+                    ReviewQueue.added_at,
+                )
+                .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+                .where(
+                    or_(
+                        ReviewQueue.status == ReviewStatus.IN_REVIEW,
+                        ReviewQueue.id.in_(list(leased)),
+                    )
+                )
+            )
+            rows = result.all()
+
+        targets: Dict[UUID, Tuple[ReviewStatus, Optional[UUID]]] = {}
+        orphaned: List[Tuple[UUID, int, datetime]] = []
+        for queue_id, status, assigned_to, risk_score, added_at in rows:
+            if queue_id in self._targets or status not in ACTIVE_STATUSES:
+                continue
+            owner = leased.get(queue_id)
+            if owner is not None:
+                if (status, assigned_to) != (ReviewStatus.IN_REVIEW, owner):
+                    targets[queue_id] = (ReviewStatus.IN_REVIEW, owner)
+            elif status == ReviewStatus.IN_REVIEW:
+                orphaned.append((queue_id, risk_score, added_at))
+
+        if orphaned:
+            # 조회 사이에 새로 할당된 항목은 제외
+            owners_now = await self.redis.hmget(
+                self.keys[2], [str(queue_id) for queue_id, _, _ in orphaned]
+            )
+            orphaned = [
+                item for item, owner in zip(orphaned, owners_now) if owner is None
+            ]
+            await self.enqueue_many(orphaned)
+            for queue_id, _, _ in orphaned:
+                targets[queue_id] = (ReviewStatus.PENDING, None)
+
+        for queue_id, (status, assigned_to) in targets.items():
+            self._persist_state(queue_id, status, assigned_to)
+        self.stats["reconciled"] += len(targets)
+        return len(targets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """엔진 통계"""
+        return {**self.stats, "persisting": len(self._persist_tasks)}
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.reap_interval_seconds)
+            try:
+                while len(await self.requeue_expired()) >= REQUEUE_BATCH:
+                    pass
+            except Exception as e:
+                logger.warning(f"[REVIEW-QUEUE] 만료 리스 회수 실패: {e}")
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"[REVIEW-QUEUE] 리스/DB 상태 맞춤 실패: {e}")
+
+    def _requeued(self, expired: List[str]) -> List[UUID]:
+        queue_ids = [UUID(queue_id) for queue_id in expired]
+        if queue_ids:
+            self.stats["requeued"] += len(queue_ids)
+            self._persist_requeue(queue_ids)
+        return queue_ids
+
+    def _persist_assignment(self, queue_id: UUID, reviewer_id: UUID) -> None:
+        self._persist_state(queue_id, ReviewStatus.IN_REVIEW, reviewer_id)
+
+    def _persist_requeue(self, queue_ids: List[UUID]) -> None:
+        for queue_id in queue_ids:
+            self._persist_state(queue_id, ReviewStatus.PENDING, None)
+
+    def _persist_state(
+        self, queue_id: UUID, status: ReviewStatus, assigned_to: Optional[UUID]
+    ) -> None:
+        """항목의 DB 반영 목표 갱신 (반영 태스크가 없으면 시작)"""
+        self._targets[queue_id] = (status, assigned_to)
+        if queue_id not in self._persist_tasks:
+            self._persist_tasks[queue_id] = asyncio.create_task(self._persist(queue_id))
+
+    async def _persist(self, queue_id: UUID) -> None:
+        """
+        항목의 최신 목표 상태를 DB 에 반영 (항목당 태스크 하나, 순서 보장)
+
+        실패하거나 행이 아직 없으면 (write-behind 대기 중) 재시도하고, 기록 중
+        목표가 바뀌면 새 목표를 이어서 기록한다.
+        """
+        attempt = 0
+        try:
+            while queue_id in self._targets:
+                target = self._targets[queue_id]
+                try:
+                    written = await self._write_state(queue_id, *target)
+                except Exception as e:
+                    self.stats["persist_errors"] += 1
+                    logger.warning(f"[REVIEW-QUEUE] DB 반영 실패: queue_id={queue_id}, {e}")
+                    written = False
+
+                if written or attempt >= self.persist_retries:
+                    if not written:
+                        self.stats["persist_errors"] += 1
+                        logger.warning(
+                            f"[REVIEW-QUEUE] DB 반영 포기 (reconcile 에서 복구): "
+                            f"queue_id={queue_id}"
+                        )
+                    if self._targets.get(queue_id) == target:
+                        del self._targets[queue_id]
+                    attempt = 0
+                    continue
+
+                attempt += 1
+                await asyncio.sleep(self.persist_retry_seconds * attempt)
+        finally:
+            # 목표 확인과 태스크 제거 사이에 await 가 없으므로 새 목표가 누락되지 않음
+            self._persist_tasks.pop(queue_id, None)
+
+    async def _write_state(
+        self, queue_id: UUID, status: ReviewStatus, assigned_to: Optional[UUID]
+    ) -> bool:
+        """
+        행을 잠그고 목표 상태 기록 (검토 완료 행은 그대로)
+
+        Returns:
+            bool: 반영 완료 여부 (행이 아직 없으면 False)
+        """
+        session_factory = self._session_factory()
+        async with session_factory() as session:
+            item = await session.get(ReviewQueue, queue_id, with_for_update=True)
+            if item is None:
+                return False
+            from_status, added_at = item.status, item.added_at
+            if from_status not in ACTIVE_STATUSES or (
+                from_status,
+                item.assigned_to,
+            ) == (status, assigned_to):
+                return True
+            item.status = status
+            item.assigned_to = assigned_to
+            await session.commit()
+
+        self.stats["persisted"] += 1
+        if from_status != status:
+            rollup = await get_dashboard_rollup()
+            if rollup is not None:
+                await rollup.record_status_changes(
+                    [(SCOPE_REVIEW, added_at, from_status, status)]
+                )
+        return True
+
+    def _session_factory(self) -> Callable:
+        if self.session_factory is None:
+            from ..models.base import AsyncSessionLocal
+
+            return AsyncSessionLocal
+        return self.session_factory
+
+    def _lease(self, queue_id: UUID, reviewer_id: UUID, now_ms: int) -> ReviewLease:
+        return ReviewLease(
+            queue_id=queue_id,
+            reviewer_id=reviewer_id,
+            expires_at=datetime.utcfromtimestamp(now_ms / 1000 + self.lease_seconds),
+        )
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+
+
+# 싱글톤 인스턴스
+_review_queue_engine: Optional[ReviewQueueEngine] = None
+
+
+async def get_review_queue_engine() -> Optional[ReviewQueueEngine]:
+    """
+    검토 큐 엔진 싱글톤 인스턴스 가져오기
+
+    Returns:
+        ReviewQueueEngine 인스턴스 (Redis 연결 실패 시 None, DB 조회로 대체)
+    """
+    global _review_queue_engine
+    if _review_queue_engine is None:
+        from ..utils.redis_client import get_redis
+
+        try:
+            _review_queue_engine = ReviewQueueEngine(await get_redis())
+        except Exception as e:
+            logger.warning(f"[REVIEW-QUEUE] Redis 연결 실패, 엔진 비활성화: {e}")
+            return None
+    return _review_queue_engine
@@ -15,6 +15,8 @@ from sqlalchemy.exc import IntegrityError
 
 from ..models.review_queue import ReviewQueue, ReviewStatus, ReviewDecision
 from ..models.transaction import Transaction, EvaluationStatus
+from .dashboard_rollup import SCOPE_REVIEW, SCOPE_TRANSACTION, get_dashboard_rollup
+from .review_queue_engine import ReviewLease, get_review_queue_engine
 
 logger = logging.getLogger(__name__)
 
@@ -84,9 +86,30 @@ class ReviewQueueService:
             await self.db.refresh(review_queue)
 
             # 4. 거래 상태 업데이트 (BLOCKED -> MANUAL_REVIEW)
+            previous_status = transaction.evaluation_status
             transaction.evaluation_status = EvaluationStatus.MANUAL_REVIEW
             await self.db.commit()
 
+            engine = await get_review_queue_engine()
+            if engine is not None:
+                await engine.enqueue(
+                    review_queue.id, transaction.risk_score, review_queue.added_at
+                )
+
+            rollup = await get_dashboard_rollup()
+            if rollup is not None:
+                await rollup.record_instances(review_queue=[review_queue])
+                await rollup.record_status_changes(
+                    [
+                        (
+                            SCOPE_TRANSACTION,
+                            transaction.created_at,
+                            previous_status,
+                            EvaluationStatus.MANUAL_REVIEW,
+                        )
+                    ]
+                )
+
             logger.info(
                 f"거래를 검토 큐에 추가했습니다: transaction_id={transaction_id}, "
                 f"queue_id={review_queue.id}, risk_score={transaction.risk_score}"
@@ -121,25 +144,97 @@ class ReviewQueueService:
             ReviewQueue: 업데이트된 검토 큐 엔트리
 
         Raises:
-            ValueError: 검토 큐가 존재하지 않는 경우
+            ValueError: 검토 큐가 존재하지 않거나, 완료되었거나, 다른 담당자가
+                할당받은 경우
         """
         result = await self.db.execute(
-            select(ReviewQueue).where(ReviewQueue.id == queue_id)
+            select(ReviewQueue, Transaction.risk_score)
+            .join(Transaction, ReviewQueue.transaction_id == Transaction.id)
+            .where(ReviewQueue.id == queue_id)
         )
-        review_queue = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if review_queue is None:
+        if row is None:
             raise ValueError(f"검토 큐를 찾을 수 없습니다: {queue_id}")
 
+        review_queue, risk_score = row
+        if review_queue.is_completed:
+            raise ValueError(f"이미 검토가 완료된 항목입니다: {queue_id}")
+
+        # 다른 담당자와 동시에 할당받지 않도록 엔진에서 원자적으로 리스 획득
+        engine = await get_review_queue_engine()
+        if engine is not None:
+            lease = await engine.claim(
+                queue_id, reviewer_id, risk_score, review_queue.added_at
+            )
+            if lease is None:
+                raise ValueError(f"다른 담당자가 검토 중인 항목입니다: {queue_id}")
+
         # 담당자 할당 및 상태 변경
+        previous_status = review_queue.status
         review_queue.assign_to_reviewer(reviewer_id)
         await self.db.commit()
         await self.db.refresh(review_queue)
+        await self._record_review_status_change(review_queue, previous_status)
 
         logger.info(f"검토 담당자 할당: queue_id={queue_id}, reviewer_id={reviewer_id}")
 
         return review_queue
 
+    async def claim_next_review(self, reviewer_id: UUID) -> Optional[ReviewLease]:
+        """
+        우선순위가 가장 높은 대기 항목 할당 (위험 점수 + 대기 시간 순)
+
+        할당은 엔진에서 원자적으로 처리되며 DB 상태 (IN_REVIEW, assigned_to) 는
+        비동기로 반영됩니다.
+
+        Args:
+            reviewer_id: 검토 담당자 사용자 ID
+
+        Returns:
+            Optional[ReviewLease]: 할당된 리스 (대기 항목이 없으면 None)
+
+        Raises:
+            RuntimeError: 검토 큐 엔진 (Redis) 을 사용할 수 없는 경우
+        """
+        engine = await get_review_queue_engine()
+        if engine is None:
+            raise RuntimeError("검토 큐 엔진을 사용할 수 없습니다")
+
+        while True:
+            lease = await engine.claim_next(reviewer_id)
+            if lease is None:
+                return None
+
+            # 대기열에 남아 있던 완료 항목은 버리고 다음 항목 할당
+            review_queue = await self.db.get(ReviewQueue, lease.queue_id)
+            if review_queue is not None and review_queue.is_completed:
+                await engine.remove(lease.queue_id)
+                continue
+
+            logger.info(
+                f"검토 항목 할당: queue_id={lease.queue_id}, reviewer_id={reviewer_id}"
+            )
+            return lease
+
+    async def renew_review_lease(
+        self, queue_id: UUID, reviewer_id: UUID
+    ) -> Optional[ReviewLease]:
+        """
+        검토 할당 리스 연장 (검토가 리스 시간보다 길어지는 경우)
+
+        Args:
+            queue_id: 검토 큐 ID
+            reviewer_id: 검토 담당자 사용자 ID
+
+        Returns:
+            Optional[ReviewLease]: 연장된 리스 (만료되어 대기열로 돌아갔으면 None)
+        """
+        engine = await get_review_queue_engine()
+        if engine is None:
+            return None
+        return await engine.renew(queue_id, reviewer_id)
+
     async def complete_review(
         self,
         queue_id: UUID,
@@ -169,9 +264,15 @@ class ReviewQueueService:
             raise ValueError(f"검토 큐를 찾을 수 없습니다: {queue_id}")
 
         # 검토 완료 처리
+        previous_status = review_queue.status
         review_queue.complete_review(decision, notes)
         await self.db.commit()
         await self.db.refresh(review_queue)
+        await self._record_review_status_change(review_queue, previous_status)
+
+        engine = await get_review_queue_engine()
+        if engine is not None:
+            await engine.remove(queue_id)
 
         logger.info(
             f"검토 완료: queue_id={queue_id}, decision={decision}, "
@@ -184,7 +285,7 @@ class ReviewQueueService:
         self, limit: int = 50, offset: int = 0
     ) -> list[ReviewQueue]:
         """
-        검토 대기 중인 항목 조회
+        검토 대기 중인 항목 조회 (할당 우선순위 순)
 
         Args:
             limit: 조회할 최대 항목 수
@@ -193,6 +294,18 @@ class ReviewQueueService:
         Returns:
             list[ReviewQueue]: 검토 대기 중인 항목 목록
         """
+        engine = await get_review_queue_engine()
+        if engine is not None:
+            queue_ids = await engine.peek(limit, offset)
+            if not queue_ids:
+                return []
+            result = await self.db.execute(
+                select(ReviewQueue).where(ReviewQueue.id.in_(queue_ids))
+            )
+            by_id = {item.id: item for item in result.scalars().all()}
+            # write-behind 로 아직 기록되지 않은 항목은 제외
+            return [by_id[queue_id] for queue_id in queue_ids if queue_id in by_id]
+
         result = await self.db.execute(
             select(ReviewQueue)
             .where(ReviewQueue.status == ReviewStatus.PENDING)
@@ -243,3 +356,20 @@ class ReviewQueueService:
             select(ReviewQueue).where(ReviewQueue.transaction_id == transaction_id)
         )
         return result.scalar_one_or_none()
+
+    async def _record_review_status_change(
+        self, review_queue: ReviewQueue, previous_status: ReviewStatus
+    ) -> None:
+        """검토 상태 변경을 대시보드 롤업에 반영 (best-effort)"""
+        rollup = await get_dashboard_rollup()
+        if rollup is not None:
+            await rollup.record_status_changes(
+                [
+                    (
+                        SCOPE_REVIEW,
+                        review_queue.added_at,
+                        previous_status,
+                        review_queue.status,
+                    )
+                ]
+            )
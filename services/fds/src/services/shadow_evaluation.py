@@ -0,0 +1,780 @@
+"""
+Shadow 평가 (후보 룰/모델 라이브 검증)
+
+새 DetectionRule 버전이나 후보 ML 모델을 실제 결정에 반영하지 않고 운영
+트래픽으로 검증한다.
+
+- 응답 경로: IntegratedEvaluationEngine 이 평가를 마친 뒤 bounded 큐에
+  put_nowait 만 수행 (대기/추가 지연 없음)
+- load shedding: 큐가 가득 차면 shadow 작업을 버리고 카운트만 증가
+- 백그라운드 워커가 후보 구성으로 재채점: 라이브 위험 요인 중 ML 요인은
+  후보 모델 결과로 교체하고 후보 룰 요인을 더해 같은 점수/결정 로직 적용
+- 후보 룰의 Redis 쓰기(속도 카운터 등)는 운영 키에 반영하지 않음
+- 결과는 결정 전이, 점수 차이, 지연 시간 집계 카운터에만 기록
+- 후보 구성과 집계는 Redis 에 두고 API 워커 전체가 공유: 각 워커는 주기적으로
+  로컬 집계를 Redis 해시에 더하고, 구성 버전이 바뀌면 후보를 직접 다시 구성
+- 후보 모델은 FDS_SHADOW_MODEL_DIR 에 배포된 모델 ID 로만 지정 (임의 경로의
+  pickle 로드 금지)
+"""
+
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from ..engines.ml_engine import MLEngine
+from ..engines.rule_engine import RuleEngine
+from ..models.base import AsyncSessionLocal
+from ..models.detection_rule import DetectionRule
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# 후보 모델 등록 디렉터리 (운영자가 배포한 모델 파일, 파일 이름 = 모델 ID)
+SHADOW_MODEL_DIR = os.getenv("FDS_SHADOW_MODEL_DIR", "models/shadow")
+SHADOW_MODEL_EXTENSIONS = (".onnx", ".pkl")
+_MODEL_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,99}$")
+
+# 워커 간 공유 상태 Redis 키
+SHADOW_CONFIG_KEY = "fds:shadow:config"
+SHADOW_STATS_KEY = "fds:shadow:stats:{version}"
+SHADOW_STATS_TTL = 7 * 86400  # 7일
+
+# KEYS[1]: 집계 해시
+# ARGV: ttl, (연산, 필드, 값)... - incr: 더하기, max/min: 더 크거나 작을 때만 교체
+FLUSH_STATS_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+for i = 2, #ARGV, 3 do
+    local op, name, value = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2])
+    if op == 'incr' then
+        redis.call('HINCRBYFLOAT', KEYS[1], name, value)
+    else
+        local current = tonumber(redis.call('HGET', KEYS[1], name))
+        if not current or (op == 'max' and value > current)
+            or (op == 'min' and value < current) then
+            redis.call('HSET', KEYS[1], name, value)
+        end
+    end
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+return 1
+"""
+
+
+class UnknownShadowModelError(ValueError):
+    """등록되지 않은 후보 모델 ID"""
+
+
+def list_shadow_models(model_dir: Optional[str] = None) -> List[str]:
+    """등록된 후보 모델 ID 목록 (모델 디렉터리의 파일 이름, 확장자 제외)"""
+    directory = Path(model_dir or SHADOW_MODEL_DIR)
+    if not directory.is_dir():
+        return []
+    return sorted(
+        path.stem
+        for path in directory.iterdir()
+        if path.is_file()
+        and path.suffix in SHADOW_MODEL_EXTENSIONS
+        and _MODEL_ID_PATTERN.match(path.stem)
+    )
+
+
+def resolve_shadow_model(model_id: str, model_dir: Optional[str] = None) -> str:
+    """
+    후보 모델 ID → 모델 파일 경로
+
+    Raises:
+        UnknownShadowModelError: 형식이 맞지 않거나 등록 디렉터리에 없는 ID
+    """
+    if _MODEL_ID_PATTERN.match(model_id):
+        directory = Path(model_dir or SHADOW_MODEL_DIR)
+        for extension in SHADOW_MODEL_EXTENSIONS:
+            path = directory / f"{model_id}{extension}"
+            if path.is_file():
+                return str(path)
+    raise UnknownShadowModelError(f"등록되지 않은 후보 모델입니다: {model_id}")
+
+
+class ShadowRedis:
+    """
+    쓰기 명령을 운영 Redis 에 적용하지 않는 래퍼
+
+    incr/expire 는 프로세스 메모리의 overlay 카운터에만 반영한다 (첫 incr 는
+    운영 값에서 시작). 후보 velocity 룰이 shadow 트래픽 기준으로 동작하면서도
+    운영 카운터는 바뀌지 않는다.
+    """
+
+    def __init__(self, redis, max_keys: int = 100000):
+        self._redis = redis
+        self._max_keys = max_keys
+        # key -> [값, 만료 시각(monotonic) 또는 None]
+        self._overlay: Dict[str, List[Any]] = {}
+
+    def _local(self, key: str) -> Optional[List[Any]]:
+        entry = self._overlay.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._overlay[key]
+            return None
+        return entry
+
+    def _prune(self) -> None:
+        if len(self._overlay) < self._max_keys:
+            return
+        now = time.monotonic()
+        for key in [k for k, (_, exp) in self._overlay.items() if exp and exp <= now]:
+            del self._overlay[key]
+        if len(self._overlay) >= self._max_keys:
+            self._overlay.clear()
+
+    async def get(self, key: str):
+        entry = self._local(key)
+        if entry is not None:
+            return str(entry[0]).encode()
+        return await self._redis.get(key)
+
+    async def incr(self, key: str) -> int:
+        entry = self._local(key)
+        if entry is None:
+            self._prune()
+            value = await self._redis.get(key)
+            entry = self._overlay[key] = [int(value or 0), None]
+        entry[0] += 1
+        return entry[0]
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        entry = self._local(key)
+        if entry is None:
+            return False
+        entry[1] = time.monotonic() + seconds
+        return True
+
+
+class CandidateRuleEngine(RuleEngine):
+    """DB 대신 후보 룰 목록으로 평가하는 룰 엔진"""
+
+    def __init__(self, rules: List[DetectionRule], redis):
+        super().__init__(db=None, redis=ShadowRedis(redis))
+        self._rule_cache = sorted(rules, key=lambda r: -(r.priority or 0))
+
+    async def load_active_rules(
+        self, force_reload: bool = False
+    ) -> List[DetectionRule]:
+        return self._rule_cache
+
+
+@dataclass
+class ShadowCandidate:
+    """
+    Shadow 평가 후보 구성
+
+    Attributes:
+        name: 후보 이름 (통계 구분용)
+        ml_engine: 후보 ML 엔진 (None 이면 라이브 ML 요인 유지)
+        rule_engine: 후보 룰 엔진 (None 이면 후보 룰 없음)
+        sample_percentage: shadow 평가할 트래픽 비율 (0-100)
+    """
+
+    name: str
+    ml_engine: Optional[MLEngine] = None
+    rule_engine: Optional[CandidateRuleEngine] = None
+    sample_percentage: int = 100
+
+    @classmethod
+    def build(
+        cls,
+        name: str,
+        redis,
+        ml_model_id: Optional[str] = None,
+        rules: Optional[List[DetectionRule]] = None,
+        sample_percentage: int = 100,
+        model_dir: Optional[str] = None,
+    ) -> "ShadowCandidate":
+        """
+        후보 모델 로드 및 후보 룰 엔진 생성 (활성화 시 한 번)
+
+        Raises:
+            UnknownShadowModelError: 등록되지 않은 후보 모델 ID
+        """
+        ml_engine = None
+        if ml_model_id:
+            ml_engine = MLEngine(
+                model_path=resolve_shadow_model(ml_model_id, model_dir)
+            )
+        return cls(
+            name=name,
+            ml_engine=ml_engine,
+            rule_engine=CandidateRuleEngine(rules, redis) if rules else None,
+            sample_percentage=sample_percentage,
+        )
+
+    def should_sample(self, transaction_id: Any) -> bool:
+        if self.sample_percentage >= 100:
+            return True
+        digest = hashlib.md5(str(transaction_id).encode()).hexdigest()
+        return int(digest, 16) % 100 < self.sample_percentage
+
+
+@dataclass
+class ShadowConfig:
+    """워커 간 공유하는 후보 구성 (각 워커가 이 구성으로 후보를 직접 만든다)"""
+
+    name: str
+    ml_model_id: Optional[str] = None
+    rule_ids: List[str] = field(default_factory=list)
+    sample_percentage: int = 100
+    version: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "ShadowConfig":
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return cls(**json.loads(raw))
+
+
+async def load_candidate(config: ShadowConfig, redis) -> ShadowCandidate:
+    """공유 후보 구성 → 이 워커의 후보 (후보 모델 로드, DB 에서 후보 룰 조회)"""
+    rules: List[DetectionRule] = []
+    if config.rule_ids:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(DetectionRule).where(
+                    DetectionRule.id.in_([UUID(rule_id) for rule_id in config.rule_ids])
+                )
+            )
+            rules = list(result.scalars().all())
+            # 후보 룰은 세션과 분리해 shadow 워커에서만 사용
+            session.expunge_all()
+    return ShadowCandidate.build(
+        name=config.name,
+        redis=redis,
+        ml_model_id=config.ml_model_id,
+        rules=rules,
+        sample_percentage=config.sample_percentage,
+    )
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (근사 백분위)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def to_ops(self, prefix: str) -> List[Tuple[str, str, float]]:
+        """공유 집계 해시 반영용 (연산, 필드, 값) 목록"""
+        ops = [
+            ("incr", f"{prefix}:b{index}", count)
+            for index, count in enumerate(self.counts)
+            if count
+        ]
+        if ops:
+            ops.append(("incr", f"{prefix}:total_ms", self.total_ms))
+            ops.append(("max", f"{prefix}:max_ms", self.max_ms))
+        return ops
+
+    def restore(self, key: str, value: float) -> None:
+        """공유 집계 해시 필드 하나 복원"""
+        if key.startswith("b"):
+            self.counts[int(key[1:])] = int(value)
+        elif key in ("total_ms", "max_ms"):
+            setattr(self, key, value)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p 백분위가 속한 버킷 상한 (마지막 버킷은 관측 최대값)"""
+        count = sum(self.counts)
+        if not count:
+            return None
+        threshold = count * p / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                break
+        return round(self.max_ms, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        count = sum(self.counts)
+        return {
+            "avg_ms": round(self.total_ms / count, 2) if count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+# ShadowStats 필드 분류 (공유 집계 해시 필드 이름)
+_COUNTER_FIELDS = (
+    "submitted",
+    "sampled_out",
+    "shed",
+    "evaluated",
+    "errors",
+    "agreements",
+    "score_delta_sum",
+    "abs_score_delta_sum",
+)
+_DECISION_FIELDS = ("transitions", "live_decisions", "shadow_decisions")
+_LATENCY_FIELDS = ("live_latency", "shadow_latency")
+
+
+@dataclass
+class ShadowStats:
+    """Shadow 평가 집계 카운터 (거래별 결과는 저장하지 않음)"""
+
+    submitted: int = 0
+    sampled_out: int = 0
+    shed: int = 0
+    evaluated: int = 0
+    errors: int = 0
+    agreements: int = 0
+    score_delta_sum: int = 0
+    abs_score_delta_sum: int = 0
+    max_score_increase: int = 0
+    max_score_decrease: int = 0
+    transitions: Counter = field(default_factory=Counter)
+    live_decisions: Counter = field(default_factory=Counter)
+    shadow_decisions: Counter = field(default_factory=Counter)
+    live_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    shadow_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record(
+        self,
+        live: Tuple[int, str, float],
+        shadow: Tuple[int, str, float],
+    ) -> None:
+        """(점수, 결정, 평가 시간 ms) 쌍을 집계"""
+        live_score, live_decision, live_ms = live
+        shadow_score, shadow_decision, shadow_ms = shadow
+        delta = shadow_score - live_score
+
+        self.evaluated += 1
+        self.score_delta_sum += delta
+        self.abs_score_delta_sum += abs(delta)
+        self.max_score_increase = max(self.max_score_increase, delta)
+        self.max_score_decrease = min(self.max_score_decrease, delta)
+        self.live_decisions[live_decision] += 1
+        self.shadow_decisions[shadow_decision] += 1
+        if live_decision == shadow_decision:
+            self.agreements += 1
+        else:
+            self.transitions[f"{live_decision}->{shadow_decision}"] += 1
+        self.live_latency.record(live_ms)
+        self.shadow_latency.record(shadow_ms)
+
+    def merge(self, other: "ShadowStats") -> None:
+        """다른 집계를 더함 (공유 집계 반영 실패 시 다음 반영으로 이월)"""
+        for name in _COUNTER_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.max_score_increase = max(self.max_score_increase, other.max_score_increase)
+        self.max_score_decrease = min(self.max_score_decrease, other.max_score_decrease)
+        for name in _DECISION_FIELDS:
+            getattr(self, name).update(getattr(other, name))
+        for name in _LATENCY_FIELDS:
+            getattr(self, name).merge(getattr(other, name))
+
+    def to_ops(self) -> List[Tuple[str, str, float]]:
+        """공유 집계 해시(FLUSH_STATS_SCRIPT) 반영용 (연산, 필드, 값) 목록"""
+        ops = [
+            ("incr", name, getattr(self, name))
+            for name in _COUNTER_FIELDS
+            if getattr(self, name)
+        ]
+        if self.evaluated:
+            ops.append(("max", "max_score_increase", self.max_score_increase))
+            ops.append(("min", "max_score_decrease", self.max_score_decrease))
+        for name in _DECISION_FIELDS:
+            for key, count in getattr(self, name).items():
+                ops.append(("incr", f"{name}:{key}", count))
+        for name in _LATENCY_FIELDS:
+            ops.extend(getattr(self, name).to_ops(name))
+        return ops
+
+    @classmethod
+    def from_fields(cls, fields: Dict[str, Any]) -> "ShadowStats":
+        """공유 집계 해시 → 집계"""
+        stats = cls()
+        for raw_name, raw_value in fields.items():
+            if isinstance(raw_name, bytes):
+                raw_name = raw_name.decode()
+            name, _, key = raw_name.partition(":")
+            value = float(raw_value)
+            if name in _DECISION_FIELDS:
+                getattr(stats, name)[key] = int(value)
+            elif name in _LATENCY_FIELDS:
+                getattr(stats, name).restore(key, value)
+            elif hasattr(stats, name):
+                setattr(stats, name, int(value))
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        evaluated = self.evaluated
+        return {
+            "submitted": self.submitted,
+            "sampled_out": self.sampled_out,
+            "shed": self.shed,
+            "evaluated": evaluated,
+            "errors": self.errors,
+            "agreement_rate": round(self.agreements / evaluated, 4)
+            if evaluated
+            else None,
+            "avg_score_delta": round(self.score_delta_sum / evaluated, 2)
+            if evaluated
+            else None,
+            "avg_abs_score_delta": round(self.abs_score_delta_sum / evaluated, 2)
+            if evaluated
+            else None,
+            "max_score_increase": self.max_score_increase,
+            "max_score_decrease": self.max_score_decrease,
+            "transitions": dict(self.transitions),
+            "live_decisions": dict(self.live_decisions),
+            "shadow_decisions": dict(self.shadow_decisions),
+            "live_latency": self.live_latency.to_dict(),
+            "shadow_latency": self.shadow_latency.to_dict(),
+        }
+
+
+class ShadowStateStore:
+    """워커 간 공유 shadow 상태 (Redis: 후보 구성 + 구성 버전별 집계 해시)"""
+
+    def __init__(self, redis, stats_ttl: int = SHADOW_STATS_TTL):
+        self.redis = redis
+        self.stats_ttl = stats_ttl
+        self._flush_script = redis.register_script(FLUSH_STATS_SCRIPT)
+
+    async def save_config(self, config: ShadowConfig) -> None:
+        await self.redis.set(SHADOW_CONFIG_KEY, config.to_json())
+
+    async def load_config(self) -> Optional[ShadowConfig]:
+        raw = await self.redis.get(SHADOW_CONFIG_KEY)
+        return ShadowConfig.from_json(raw) if raw else None
+
+    async def clear_config(self) -> None:
+        await self.redis.delete(SHADOW_CONFIG_KEY)
+
+    async def flush_stats(self, version: str, stats: ShadowStats) -> None:
+        """로컬 집계를 공유 집계 해시에 더함"""
+        ops = stats.to_ops()
+        if not ops:
+            return
+        args: List[Any] = [self.stats_ttl]
+        for op in ops:
+            args.extend(op)
+        await self._flush_script(
+            keys=[SHADOW_STATS_KEY.format(version=version)], args=args
+        )
+
+    async def load_stats(self, version: str) -> ShadowStats:
+        fields = await self.redis.hgetall(SHADOW_STATS_KEY.format(version=version))
+        return ShadowStats.from_fields(fields)
+
+
+class ShadowEvaluator:
+    """
+    bounded 큐 + 백그라운드 워커 기반 shadow 평가기
+
+    store 가 있으면 후보 구성/집계를 워커 간 공유한다 (sync_interval 마다 동기화).
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        workers: int = 2,
+        store: Optional[ShadowStateStore] = None,
+        sync_interval: float = 5.0,
+        candidate_loader: Optional[
+            Callable[[ShadowConfig, Any], Awaitable[ShadowCandidate]]
+        ] = None,
+    ):
+        """
+        Args:
+            max_queue_size: 대기 가능한 shadow 작업 수 (초과분은 버림)
+            workers: 동시 shadow 평가 워커 수
+            store: 워커 간 공유 상태 (None 이면 start() 에서 Redis 로 생성)
+            sync_interval: 공유 상태 동기화 주기 (초)
+            candidate_loader: 공유 구성 → 후보 (기본: load_candidate)
+        """
+        self.max_queue_size = max_queue_size
+        self.workers = workers
+        self.store = store
+        self.sync_interval = sync_interval
+        self.candidate_loader = candidate_loader or load_candidate
+
+        self.candidate: Optional[ShadowCandidate] = None
+        self.version: Optional[str] = None
+        self.stats = ShadowStats()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._sync_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.candidate is not None
+
+    def enable(self, candidate: ShadowCandidate, version: Optional[str] = None) -> None:
+        """후보 구성으로 shadow 평가 시작 (통계 초기화)"""
+        self.candidate = candidate
+        self.version = version
+        self.stats = ShadowStats()
+        logger.info(
+            f"[SHADOW] Enabled candidate '{candidate.name}' "
+            f"(ml={candidate.ml_engine is not None}, "
+            f"rules={len(candidate.rule_engine._rule_cache) if candidate.rule_engine else 0}, "
+            f"sample={candidate.sample_percentage}%)"
+        )
+
+    def disable(self) -> Dict[str, Any]:
+        """shadow 평가 중지 (대기 중인 작업은 버림) 후 최종 통계 반환"""
+        stats = self.get_stats()
+        self.candidate = None
+        self.version = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._queue.task_done()
+        logger.info(f"[SHADOW] Disabled ({stats})")
+        return stats
+
+    async def start(self) -> None:
+        """공유 상태 동기화 시작 (Redis 연결 실패 시 워커 로컬 상태만 사용)"""
+        if self.store is None:
+            from ..utils.redis_client import get_redis
+
+            try:
+                self.store = ShadowStateStore(await get_redis())
+            except Exception as e:
+                logger.warning(f"[SHADOW] Redis 연결 실패, 워커 로컬 상태만 사용: {e}")
+                return
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def activate(
+        self, config: ShadowConfig, candidate: ShadowCandidate
+    ) -> Dict[str, Any]:
+        """
+        후보 구성을 공유 상태에 기록하고 이 워커에서 바로 시작
+
+        다른 워커는 다음 동기화 때 같은 구성으로 후보를 만든다.
+        """
+        if self.store is not None:
+            await self.store.save_config(config)
+        self.enable(candidate, version=config.version)
+        return await self.get_shared_stats()
+
+    async def deactivate(self) -> Dict[str, Any]:
+        """모든 워커의 shadow 평가 중지 후 최종 공유 집계 반환"""
+        stats = await self.get_shared_stats()
+        if self.store is not None:
+            await self.store.clear_config()
+        self.disable()
+        stats["enabled"] = False
+        return stats
+
+    async def sync(self) -> None:
+        """로컬 집계를 공유 집계에 반영하고 공유 후보 구성을 따라감"""
+        if self.store is None:
+            return
+        await self._flush()
+        config = await self.store.load_config()
+        if (config.version if config else None) == self.version:
+            return
+        if config is None:
+            self.disable()
+            return
+        try:
+            candidate = await self.candidate_loader(config, self.store.redis)
+        except Exception:
+            # 이전 후보로 계속 평가하지 않음 (다음 동기화 때 다시 시도)
+            self.disable()
+            raise
+        self.enable(candidate, version=config.version)
+
+    async def _sync_loop(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning(f"[SHADOW] 공유 상태 동기화 실패: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    async def _flush(self) -> None:
+        """로컬 집계를 공유 집계 해시에 더하고 초기화 (실패 시 다음 반영으로 이월)"""
+        if self.store is None or self.version is None:
+            return
+        version, stats = self.version, self.stats
+        self.stats = ShadowStats()
+        try:
+            await self.store.flush_stats(version, stats)
+        except Exception:
+            if self.version == version:
+                stats.merge(self.stats)
+                self.stats = stats
+            raise
+
+    async def get_shared_stats(self) -> Dict[str, Any]:
+        """전체 워커의 공유 집계 (공유 상태가 없으면 이 워커의 집계)"""
+        if self.store is None:
+            return self.get_stats()
+        config = await self.store.load_config()
+        if config is None:
+            return self.get_stats()
+        if config.version == self.version:
+            await self._flush()
+        shared = await self.store.load_stats(config.version)
+        return {
+            "enabled": True,
+            "candidate": config.name,
+            "version": config.version,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self.max_queue_size,
+            **shared.to_dict(),
+        }
+
+    def submit(self, engine: Any, request: Any, live_response: Any) -> bool:
+        """
+        라이브 평가 결과를 shadow 큐에 추가 (응답 경로, 대기 없음)
+
+        Args:
+            engine: 라이브 평가를 수행한 IntegratedEvaluationEngine
+            request: FDS 평가 요청
+            live_response: 라이브 평가 응답
+
+        Returns:
+            bool: 큐에 들어갔으면 True (비활성/샘플 제외/load shedding 시 False)
+        """
+        candidate = self.candidate
+        if candidate is None:
+            return False
+
+        self.stats.submitted += 1
+        if not candidate.should_sample(request.transaction_id):
+            self.stats.sampled_out += 1
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((candidate, engine, request, live_response))
+            return True
+        except asyncio.QueueFull:
+            self.stats.shed += 1
+            return False
+
+    def _ensure_started(self) -> None:
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def _worker(self):
+        while True:
+            candidate, engine, request, live_response = await self._queue.get()
+            try:
+                if candidate is self.candidate:
+                    await self._evaluate(candidate, engine, request, live_response)
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(
+                    f"[SHADOW] Evaluation failed: "
+                    f"transaction_id={request.transaction_id}, error={e}"
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _evaluate(
+        self,
+        candidate: ShadowCandidate,
+        engine: Any,
+        request: Any,
+        live_response: Any,
+    ) -> None:
+        start_time = time.perf_counter()
+        shadow_score, shadow_decision = await engine.evaluate_shadow(
+            request, live_response, candidate
+        )
+        shadow_ms = (time.perf_counter() - start_time) * 1000
+
+        self.stats.record(
+            live=(
+                live_response.risk_score,
+                live_response.decision.value,
+                live_response.evaluation_metadata.evaluation_time_ms,
+            ),
+            shadow=(shadow_score, shadow_decision.value, shadow_ms),
+        )
+
+    async def drain(self) -> None:
+        """대기 중인 shadow 작업이 모두 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """워커 종료 (대기 중인 작업은 버리고 남은 로컬 집계는 공유 집계에 반영)"""
+        tasks = self._worker_tasks + ([self._sync_task] if self._sync_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._sync_task = None
+        self._queue = None
+        try:
+            await self._flush()
+        except Exception as e:
+            logger.warning(f"[SHADOW] 종료 시 집계 반영 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "candidate": self.candidate.name if self.candidate else None,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self.max_queue_size,
+            **self.stats.to_dict(),
+        }
+
+
+# 싱글톤 인스턴스
+_shadow_evaluator: Optional[ShadowEvaluator] = None
+
+
+def get_shadow_evaluator() -> ShadowEvaluator:
+    """
+    Shadow 평가기 싱글톤 인스턴스 가져오기
+
+    Returns:
+        ShadowEvaluator 인스턴스
+    """
+    global _shadow_evaluator
+    if _shadow_evaluator is None:
+        _shadow_evaluator = ShadowEvaluator()
+    return _shadow_evaluator
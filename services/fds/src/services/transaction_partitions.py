@@ -0,0 +1,528 @@
+"""
+거래 테이블 시간 범위 파티션 관리
+
+transactions 는 created_at 기준 RANGE 파티션 테이블이다 (models.transaction).
+대시보드, 속도 체크 백필, 드리프트/재학습 쿼리가 모두 시간 범위 스캔이므로
+범위에 해당하는 파티션만 읽도록 (partition pruning) 하고, 오래된 이력은
+파티션 단위로 떼어내 핫 테이블 크기를 일정하게 유지한다.
+
+- ensure_partitions: 현재 기간부터 premake 기간 앞까지 파티션 미리 생성
+  (+ 범위 밖 거래를 받는 DEFAULT 파티션, 해당 범위 행이 있으면 옮긴 뒤 생성)
+- archive_expired: 보존 기간이 지난 파티션을 DETACH 후 아카이브 스키마로 이동
+  (선택적으로 콜드 스토리지 테이블스페이스로 이동), 해당 거래의 검토 큐/위험
+  요인 행도 함께 아카이브 스키마로 이동
+- migrate_legacy_table: 기존 비파티션 테이블을 과거 구간 파티션으로 편입
+- created_within: 파티션 프루닝이 보장되는 created_at 범위 조건
+- assign_partition_key: 서버 시각 파티션 키 배정 (같은 주문 재요청은 같은 값)
+
+created_at 에 함수를 씌우거나 (date_trunc, DATE()) timezone 이 있는 값과
+비교하면 (컬럼이 timestamptz 로 캐스팅됨) 프루닝되지 않으므로 시간 범위 조건은
+created_within 으로 만든다.
+"""
+
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, select, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..models.transaction import Transaction
+from ..utils.cache_utils import CacheKeys, CacheTTL
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = "transactions_default"
+LEGACY_PARTITION = "transactions_legacy"
+
+# 파티션과 함께 아카이브하는 거래 참조 테이블 (transaction_id, 파티션 테이블이라 FK 없음)
+ARCHIVED_CHILD_TABLES = ("review_queue", "risk_factors")
+
+PARTITION_INTERVALS = ("day", "month")
+
+DEFAULT_INTERVAL = os.getenv("FDS_TRANSACTION_PARTITION_INTERVAL", "month")
+DEFAULT_PREMAKE = int(os.getenv("FDS_TRANSACTION_PARTITION_PREMAKE", "3"))
+DEFAULT_RETENTION_DAYS = int(os.getenv("FDS_TRANSACTION_RETENTION_DAYS", "730"))
+DEFAULT_ARCHIVE_SCHEMA = os.getenv("FDS_TRANSACTION_ARCHIVE_SCHEMA", "fds_archive")
+DEFAULT_ARCHIVE_TABLESPACE = os.getenv("FDS_TRANSACTION_ARCHIVE_TABLESPACE") or None
+
+# pg_get_expr(relpartbound) 결과: FOR VALUES FROM ('...') TO ('...')
+_BOUND_PATTERN = re.compile(r"FROM \((MINVALUE|'[^']+')\) TO \((MAXVALUE|'[^']+')\)")
+
+PartitionRange = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def to_partition_time(value: datetime) -> datetime:
+    """
+    파티션 키 비교용 시각 (timezone 없는 UTC)
+
+    created_at 은 timestamp without time zone 이므로 timezone 이 있는 값은
+    UTC 로 바꿔 비교해야 컬럼 캐스팅 없이 프루닝된다.
+    """
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def assign_partition_key(
+    order_id: UUID,
+    redis: Any,
+    session: Optional[Any] = None,
+    now: Optional[datetime] = None,
+) -> datetime:
+    """
+    주문의 거래 파티션 키 (created_at) 배정
+
+    파티션 키는 서버 시각이다 (클라이언트 시각을 쓰면 임의 파티션/DEFAULT 파티션에
+    기록될 수 있음). 같은 주문의 재요청은 처음 배정한 값을 받으므로 기본 키
+    (id, created_at) 와 (order_id, created_at) 유니크 인덱스가 같아져 ON CONFLICT
+    로 중복 기록이 걸러진다.
+
+    주문별 첫 배정 시각은 Redis 에 SET NX 로 기록하며 (write-behind 로 아직 DB 에
+    없는 거래 포함), Redis 를 사용할 수 없으면 DB 에 저장된 같은 주문의 거래를 조회한다.
+
+    Args:
+        order_id: 주문 ID
+        redis: async Redis 클라이언트
+        session: Redis 장애 시 조회에 사용할 DB 세션
+        now: 배정 시각 (기본: 현재 UTC)
+
+    Returns:
+        datetime: 파티션 키 (timezone 없는 UTC)
+    """
+    assigned = to_partition_time(now or datetime.utcnow())
+    key = CacheKeys.transaction_partition_key(str(order_id))
+
+    try:
+        if await redis.set(
+            key,
+            assigned.isoformat(),
+            nx=True,
+            ex=CacheTTL.TRANSACTION_PARTITION_KEY,
+        ):
+            return assigned
+        existing = await redis.get(key)
+        if existing:
+            if isinstance(existing, bytes):
+                existing = existing.decode()
+            return datetime.fromisoformat(existing)
+    except Exception as e:
+        logger.warning(f"[PARTITION] 파티션 키 조회 실패, DB 조회로 대체: order_id={order_id}, {e}")
+
+    if session is not None:
+        result = await session.execute(
+            select(Transaction.created_at)
+            .where(Transaction.order_id == order_id)
+            .limit(1)
+        )
+        created_at = result.scalar_one_or_none()
+        if created_at is not None:
+            return created_at
+    return assigned
+
+
+def created_within(
+    start: datetime,
+    end: Optional[datetime] = None,
+    column: Any = Transaction.created_at,
+) -> ColumnElement:
+    """
+    파티션 프루닝이 보장되는 시간 범위 조건 (start <= created_at < end)
+
+    Args:
+        start: 시작 시각 (포함)
+        end: 종료 시각 (미포함, None 이면 상한 없음)
+        column: 파티션 키 컬럼 (별칭 사용 시)
+
+    Returns:
+        ColumnElement: WHERE 조건
+    """
+    condition = column >= to_partition_time(start)
+    if end is not None:
+        condition = and_(condition, column < to_partition_time(end))
+    return condition
+
+
+def period_start(value: datetime, interval: str = DEFAULT_INTERVAL) -> datetime:
+    """value 가 속한 파티션 기간의 시작 시각"""
+    value = to_partition_time(value)
+    if interval == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "month":
+        return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"지원하지 않는 파티션 기간: {interval}")
+
+
+def next_period(start: datetime, interval: str = DEFAULT_INTERVAL) -> datetime:
+    """다음 파티션 기간의 시작 시각"""
+    if interval == "day":
+        return start + timedelta(days=1)
+    if interval == "month":
+        if start.month == 12:
+            return start.replace(year=start.year + 1, month=1)
+        return start.replace(month=start.month + 1)
+    raise ValueError(f"지원하지 않는 파티션 기간: {interval}")
+
+
+def partition_name(start: datetime, interval: str = DEFAULT_INTERVAL) -> str:
+    """파티션 테이블명 (transactions_p202610, transactions_p20261018)"""
+    suffix = start.strftime("%Y%m%d" if interval == "day" else "%Y%m")
+    return f"{PARENT_TABLE}_p{suffix}"
+
+
+def partition_plan(
+    now: datetime, interval: str = DEFAULT_INTERVAL, premake: int = DEFAULT_PREMAKE
+) -> List[Tuple[str, datetime, datetime]]:
+    """
+    현재 기간부터 premake 기간 앞까지의 파티션 목록
+
+    Returns:
+        list: (파티션명, 시작 시각, 종료 시각)
+    """
+    plan = []
+    start = period_start(now, interval)
+    for _ in range(premake + 1):
+        end = next_period(start, interval)
+        plan.append((partition_name(start, interval), start, end))
+        start = end
+    return plan
+
+
+def parse_partition_bound(bound: str) -> Optional[PartitionRange]:
+    """
+    pg_get_expr(relpartbound) 파싱
+
+    Returns:
+        (시작, 종료) - MINVALUE/MAXVALUE 는 None, DEFAULT 파티션은 None 반환
+    """
+    match = _BOUND_PATTERN.search(bound or "")
+    if match is None:
+        return None
+
+    def value(token: str) -> Optional[datetime]:
+        if token in ("MINVALUE", "MAXVALUE"):
+            return None
+        return datetime.fromisoformat(token.strip("'"))
+
+    return value(match.group(1)), value(match.group(2))
+
+
+def _overlaps(start: datetime, end: datetime, existing: PartitionRange) -> bool:
+    lower, upper = existing
+    return (lower is None or lower < end) and (upper is None or start < upper)
+
+
+def _literal(value: datetime) -> str:
+    return f"'{value.isoformat(sep=' ')}'"
+
+
+class TransactionPartitionManager:
+    """
+    거래 테이블 파티션 생성/보존 기간 관리
+
+    Example:
+        ```python
+        manager = get_transaction_partition_manager()
+        await manager.maintain()  # 파티션 미리 생성 + 만료 파티션 아카이브
+        ```
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        interval: str = DEFAULT_INTERVAL,
+        premake: int = DEFAULT_PREMAKE,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        archive_schema: str = DEFAULT_ARCHIVE_SCHEMA,
+        archive_tablespace: Optional[str] = DEFAULT_ARCHIVE_TABLESPACE,
+    ):
+        """
+        Args:
+            session_factory: DDL 실행에 사용할 세션 팩토리 (기본: AsyncSessionLocal)
+            interval: 파티션 기간 (day/month)
+            premake: 미리 만들어 둘 미래 기간 수
+            retention_days: 핫 테이블 보존 기간 (0 이면 아카이브하지 않음)
+            archive_schema: 떼어낸 파티션을 옮길 스키마
+            archive_tablespace: 떼어낸 파티션을 옮길 테이블스페이스 (콜드 스토리지)
+        """
+        if interval not in PARTITION_INTERVALS:
+            raise ValueError(f"지원하지 않는 파티션 기간: {interval}")
+
+        self.session_factory = session_factory
+        self.interval = interval
+        self.premake = premake
+        self.retention_days = retention_days
+        self.archive_schema = archive_schema
+        self.archive_tablespace = archive_tablespace
+
+    async def is_partitioned(self) -> bool:
+        """transactions 가 파티션 테이블인지 여부"""
+        async with self._session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT 1 FROM pg_partitioned_table "
+                    "WHERE partrelid = to_regclass(:table)"
+                ),
+                {"table": PARENT_TABLE},
+            )
+            return result.scalar_one_or_none() is not None
+
+    async def list_partitions(self) -> Dict[str, Optional[PartitionRange]]:
+        """
+        현재 연결된 파티션
+
+        Returns:
+            dict: 파티션명 → (시작, 종료) (DEFAULT 파티션은 None)
+        """
+        async with self._session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                    "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = to_regclass(:table)"
+                ),
+                {"table": PARENT_TABLE},
+            )
+            return {name: parse_partition_bound(bound) for name, bound in result.all()}
+
+    async def ensure_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        현재 기간부터 premake 기간 앞까지 파티션 생성 (멱등)
+
+        Returns:
+            list[str]: 새로 생성한 파티션명
+        """
+        now = now or datetime.utcnow()
+        existing = await self.list_partitions()
+
+        if DEFAULT_PARTITION not in existing:
+            await self._execute(
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+                f"PARTITION OF {PARENT_TABLE} DEFAULT"
+            )
+
+        created = []
+        ranges = [bound for bound in existing.values() if bound is not None]
+        for name, start, end in partition_plan(now, self.interval, self.premake):
+            if name in existing or any(_overlaps(start, end, r) for r in ranges):
+                continue
+            await self._create_partition(name, start, end)
+            created.append(name)
+
+        if created:
+            logger.info(f"[PARTITION] Created {PARENT_TABLE} partitions: {created}")
+        return created
+
+    async def archive_expired(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        보존 기간이 지난 파티션을 떼어내 아카이브 스키마로 이동
+
+        아카이브된 파티션은 {archive_schema}.{파티션명} 으로 조회할 수 있다.
+        해당 거래의 검토 큐/위험 요인 행 (ARCHIVED_CHILD_TABLES) 은 같은 트랜잭션에서
+        {archive_schema}.{테이블명} 으로 옮기므로 핫 테이블에 고아 행이 남지 않는다.
+
+        Returns:
+            list[str]: 아카이브한 파티션명
+        """
+        if self.retention_days <= 0:
+            return []
+
+        cutoff = to_partition_time(now or datetime.utcnow()) - timedelta(
+            days=self.retention_days
+        )
+        expired = [
+            name
+            for name, bound in (await self.list_partitions()).items()
+            if bound is not None and bound[1] is not None and bound[1] <= cutoff
+        ]
+
+        for name in sorted(expired):
+            statements = [
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}",
+                f"CREATE SCHEMA IF NOT EXISTS {self.archive_schema}",
+                f"ALTER TABLE {name} SET SCHEMA {self.archive_schema}",
+            ]
+            if self.archive_tablespace:
+                statements.append(
+                    f"ALTER TABLE {self.archive_schema}.{name} "
+                    f"SET TABLESPACE {self.archive_tablespace}"
+                )
+            for child in ARCHIVED_CHILD_TABLES:
+                archive = f"{self.archive_schema}.{child}"
+                statements += [
+                    f"CREATE TABLE IF NOT EXISTS {archive} (LIKE {child} INCLUDING ALL)",
+                    f"WITH moved AS (DELETE FROM {child} c "
+                    f"USING {self.archive_schema}.{name} t "
+                    f"WHERE c.transaction_id = t.id RETURNING c.*) "
+                    f"INSERT INTO {archive} SELECT * FROM moved",
+                ]
+            await self._execute(*statements)
+
+        if expired:
+            logger.info(
+                f"[PARTITION] Archived {PARENT_TABLE} partitions to "
+                f"{self.archive_schema}: {sorted(expired)}"
+            )
+        return sorted(expired)
+
+    async def maintain(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """
+        정기 관리 (파티션 미리 생성 + 만료 파티션 아카이브)
+
+        Returns:
+            dict: created, archived
+        """
+        if not await self.is_partitioned():
+            logger.warning(
+                f"[PARTITION] {PARENT_TABLE} 가 파티션 테이블이 아닙니다. "
+                "scripts/partition_transactions.py 로 전환하세요."
+            )
+            return {"created": [], "archived": []}
+
+        created = await self.ensure_partitions(now)
+        archived = await self.archive_expired(now)
+        return {"created": created, "archived": archived}
+
+    async def migrate_legacy_table(self, now: Optional[datetime] = None) -> bool:
+        """
+        기존 비파티션 transactions 를 파티션 테이블로 전환
+
+        기존 테이블은 transactions_legacy 로 이름을 바꿔 (MINVALUE, 다음 기간 시작)
+        구간 파티션으로 편입하므로 행 복사가 없다. 편입 시 범위 검증을 위해
+        기존 테이블을 한 번 스캔하며 그동안 거래 기록이 잠긴다 (점검 시간에 실행).
+        거래를 참조하던 FK 는 삭제된다 (파티션 테이블은 id 단독 FK 불가).
+
+        Returns:
+            bool: 전환 여부 (이미 파티션 테이블이거나 테이블이 없으면 False)
+        """
+        current = period_start(now or datetime.utcnow(), self.interval)
+        boundary = next_period(current, self.interval)
+
+        async with self._session() as session:
+            # relkind: 'r' 일반 테이블, 'p' 파티션 테이블
+            relkind = await session.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": PARENT_TABLE},
+            )
+            if relkind.scalar_one_or_none() != "r":
+                return False
+
+            await session.execute(
+                text(f"ALTER TABLE {PARENT_TABLE} RENAME TO {LEGACY_PARTITION}")
+            )
+
+            # 거래를 참조하는 FK 삭제
+            foreign_keys = await session.execute(
+                text(
+                    "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+                    "WHERE contype = 'f' AND confrelid = to_regclass(:table)"
+                ),
+                {"table": LEGACY_PARTITION},
+            )
+            for table_name, constraint in foreign_keys.all():
+                await session.execute(
+                    text(f'ALTER TABLE {table_name} DROP CONSTRAINT "{constraint}"')
+                )
+
+            # 새 부모 테이블과 인덱스명이 겹치지 않도록 기존 인덱스 이름 변경
+            indexes = await session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+                {"table": LEGACY_PARTITION},
+            )
+            for (index_name,) in indexes.all():
+                await session.execute(
+                    text(
+                        f'ALTER INDEX "{index_name}" '
+                        f'RENAME TO "{(index_name + "_legacy")[:63]}"'
+                    )
+                )
+
+            connection = await session.connection()
+            await connection.run_sync(
+                lambda sync_conn: Transaction.__table__.create(
+                    sync_conn, checkfirst=True
+                )
+            )
+            await session.execute(
+                text(
+                    f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {LEGACY_PARTITION} "
+                    f"FOR VALUES FROM (MINVALUE) TO ({_literal(boundary)})"
+                )
+            )
+            await session.commit()
+
+        logger.info(
+            f"[PARTITION] Converted {PARENT_TABLE} to partitioned table "
+            f"(legacy rows < {boundary.isoformat()})"
+        )
+        return True
+
+    async def _create_partition(
+        self, name: str, start: datetime, end: datetime
+    ) -> None:
+        """
+        파티션 생성
+
+        DEFAULT 파티션에 이미 해당 범위 행이 있으면 (파티션 생성 전에 들어온 거래)
+        생성이 실패하므로, DEFAULT 를 떼어낸 상태에서 만들고 행을 옮긴다.
+        """
+        create = (
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ({_literal(start)}) TO ({_literal(end)})"
+        )
+        in_range = f"created_at >= {_literal(start)} AND created_at < {_literal(end)}"
+
+        async with self._session() as session:
+            stray = await session.execute(
+                text(f"SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range} LIMIT 1")
+            )
+            if stray.scalar_one_or_none() is None:
+                await session.execute(text(create))
+            else:
+                for statement in (
+                    f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}",
+                    create,
+                    f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}",
+                    f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}",
+                    f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT",
+                ):
+                    await session.execute(text(statement))
+                logger.warning(
+                    f"[PARTITION] Moved rows from {DEFAULT_PARTITION} into {name}"
+                )
+            await session.commit()
+
+    async def _execute(self, *statements: str) -> None:
+        """DDL 을 한 트랜잭션으로 실행"""
+        async with self._session() as session:
+            for statement in statements:
+                await session.execute(text(statement))
+            await session.commit()
+
+    def _session(self) -> Any:
+        if self.session_factory is None:
+            from ..models.base import AsyncSessionLocal
+
+            return AsyncSessionLocal()
+        return self.session_factory()
+
+
+# 싱글톤 인스턴스
+_transaction_partition_manager: Optional[TransactionPartitionManager] = None
+
+
+def get_transaction_partition_manager() -> TransactionPartitionManager:
+    """
+    거래 파티션 관리자 싱글톤 인스턴스 가져오기
+
+    Returns:
+        TransactionPartitionManager 인스턴스 (환경 변수 설정 사용)
+    """
+    global _transaction_partition_manager
+    if _transaction_partition_manager is None:
+        _transaction_partition_manager = TransactionPartitionManager()
+    return _transaction_partition_manager
@@ -0,0 +1,398 @@
+"""
+Verification Cache
+
+Shared caching, single-flight and rate limiting layer for third-party
+verification providers (EmailRep, HaveIBeenPwned, Numverify, BINList).
+
+- Results are cached in Redis per provider, keyed by a hash of the
+  normalized lookup key (email / phone / BIN), with per-provider TTLs
+- Provider failures are negatively cached for a short TTL so a failing
+  provider is not hammered on every order; partial results (a sub-lookup
+  failed) are returned but not cached
+- Concurrent lookups of the same key share one request: within a process
+  through an in-flight future, across workers through a Redis lock whose
+  holder fetches while the others poll the result cache
+- Each provider gets one pooled httpx.AsyncClient and a gate: a per-process
+  concurrency limit (pool size) plus a GCRA rate limit kept in Redis, so all
+  workers share one request budget per provider
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.utils.cache_utils import CacheKeys, CacheTTL, get_cache
+from src.utils.rate_limiter import GCRARateLimiter, RateLimitPolicy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProviderPolicy:
+    """Per-provider cache TTLs and request limits"""
+
+    ttl: int
+    negative_ttl: int
+    max_concurrency: int
+    rate_per_second: int
+    burst: int
+
+    @property
+    def rate_limit(self) -> RateLimitPolicy:
+        """Shared GCRA policy (rate_per_second, up to burst back-to-back)"""
+        return RateLimitPolicy(
+            limit=self.rate_per_second, window_seconds=1, burst=self.burst
+        )
+
+
+PROVIDER_POLICIES: Dict[str, ProviderPolicy] = {
+    "emailrep": ProviderPolicy(
+        ttl=CacheTTL.EMAIL_REPUTATION,
+        negative_ttl=CacheTTL.VERIFICATION_NEGATIVE,
+        max_concurrency=10,
+        rate_per_second=5,
+        burst=10,
+    ),
+    "hibp": ProviderPolicy(
+        ttl=CacheTTL.BREACH_CHECK,
+        negative_ttl=CacheTTL.VERIFICATION_NEGATIVE,
+        max_concurrency=5,
+        rate_per_second=10,
+        burst=10,
+    ),
+    "numverify": ProviderPolicy(
+        ttl=CacheTTL.PHONE_VALIDATION,
+        negative_ttl=CacheTTL.VERIFICATION_NEGATIVE,
+        max_concurrency=5,
+        rate_per_second=2,
+        burst=5,
+    ),
+    "binlist": ProviderPolicy(
+        ttl=CacheTTL.BIN_LOOKUP,
+        negative_ttl=CacheTTL.VERIFICATION_NEGATIVE,
+        max_concurrency=5,
+        rate_per_second=1,
+        burst=5,
+    ),
+}
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when a provider failure is served from the negative cache"""
+
+
+def normalize_email(email: str) -> str:
+    """Normalize email for cache keys (trim + lowercase)"""
+    return email.strip().lower()
+
+
+def normalize_phone(phone_number: str, country_code: Optional[str] = None) -> str:
+    """Normalize phone number for cache keys (digits only, keep leading +)"""
+    phone = phone_number.strip()
+    digits = re.sub(r"\D", "", phone)
+    prefix = "+" if phone.startswith("+") else ""
+    return f"{(country_code or '').upper()}:{prefix}{digits}"
+
+
+class ProviderGate:
+    """Per-process concurrency limit + shared GCRA rate limit for one provider"""
+
+    def __init__(
+        self,
+        provider: str,
+        policy: ProviderPolicy,
+        limiter: Optional[GCRARateLimiter] = None,
+    ):
+        """
+        Args:
+            provider: Provider name (rate limit key)
+            policy: Provider policy
+            limiter: Rate limiter (default: Redis-backed, from get_cache())
+        """
+        self.provider = provider
+        self.policy = policy
+        self._semaphore = asyncio.Semaphore(policy.max_concurrency)
+        self._limiter = limiter
+        self.throttled = 0
+
+    async def _get_limiter(self) -> GCRARateLimiter:
+        if self._limiter is None:
+            cache = get_cache()
+            if cache.client is None:
+                await cache.connect()
+            self._limiter = GCRARateLimiter(cache.client, prefix="provider_rate")
+        return self._limiter
+
+    async def _acquire_rate(self) -> None:
+        """Wait until the shared rate limit admits one request"""
+        limiter = await self._get_limiter()
+        while True:
+            result = await limiter.check(self.provider, self.policy.rate_limit)
+            if result.allowed:
+                return
+            self.throttled += 1
+            await asyncio.sleep(result.retry_after)
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            await self._acquire_rate()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore.release()
+        return False
+
+
+_gates: Dict[str, ProviderGate] = {}
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_provider_gate(provider: str) -> ProviderGate:
+    """Shared gate for a provider"""
+    gate = _gates.get(provider)
+    if gate is None:
+        gate = _gates[provider] = ProviderGate(provider, PROVIDER_POLICIES[provider])
+    return gate
+
+
+def get_provider_client(provider: str, timeout: float) -> httpx.AsyncClient:
+    """Shared pooled HTTP client for a provider (keep-alive connections)"""
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        policy = PROVIDER_POLICIES[provider]
+        client = _clients[provider] = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=policy.max_concurrency,
+                max_keepalive_connections=policy.max_concurrency,
+            ),
+        )
+    return client
+
+
+async def close_provider_clients() -> None:
+    """Close all pooled provider clients (application shutdown)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+class VerificationCache:
+    """Redis result cache with negative caching and single-flight"""
+
+    def __init__(
+        self,
+        cache=None,
+        lock_ttl: int = CacheTTL.VERIFICATION_LOCK,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Args:
+            cache: RedisCache instance (default: shared get_cache())
+            lock_ttl: Cross-worker lookup lock TTL in seconds (also the
+                longest a waiting worker polls before fetching itself)
+            poll_interval: Result cache poll interval while another worker
+                holds the lookup lock
+        """
+        self._cache = cache
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Statistics
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.remote_coalesced = 0
+        self.uncached = 0
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            self._cache = get_cache()
+        return self._cache
+
+    async def get_or_fetch(
+        self,
+        provider: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return the cached provider result, or fetch it once
+
+        Args:
+            provider: Provider name (key of PROVIDER_POLICIES)
+            key: Normalized lookup key (email / phone / BIN)
+            fetch: Coroutine factory performing the provider call. A result
+                dict with a truthy "partial" field is returned but not cached
+
+        Returns:
+            Provider result
+
+        Raises:
+            ProviderUnavailableError: If a recent failure is negatively cached
+            Exception: Whatever fetch raises on a cache miss
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        cache_key = CacheKeys.verification(provider, digest)
+
+        cached = await self._read(cache_key)
+        if cached is not None:
+            if "error" in cached:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return self._unwrap(cached)
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+
+        try:
+            value = await self._lookup(provider, digest, cache_key, fetch)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so waiters-less failures don't log warnings
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(cache_key, None)
+            if not future.done():
+                # Leader cancelled: let waiters fail instead of hanging
+                future.set_exception(ProviderUnavailableError("lookup cancelled"))
+                future.exception()
+
+    async def _lookup(
+        self,
+        provider: str,
+        digest: str,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Fetch while holding the cross-worker lock, or wait for its holder"""
+        lock_key = CacheKeys.verification_lock(provider, digest)
+        token: Optional[str] = uuid.uuid4().hex
+
+        if not await self._acquire_lock(lock_key, token):
+            cached = await self._wait_for_holder(cache_key, lock_key)
+            if cached is not None:
+                self.remote_coalesced += 1
+                return self._unwrap(cached)
+            # Holder finished without a cacheable result: fetch ourselves
+            token = None
+
+        self.misses += 1
+        policy = PROVIDER_POLICIES[provider]
+        try:
+            try:
+                value = await fetch()
+            except Exception as e:
+                await self._write(cache_key, {"error": str(e)}, policy.negative_ttl)
+                raise
+            if isinstance(value, dict) and value.get("partial"):
+                self.uncached += 1
+            else:
+                await self._write(cache_key, {"value": value}, policy.ttl)
+            return value
+        finally:
+            if token is not None:
+                await self._release_lock(lock_key, token)
+
+    async def _wait_for_holder(
+        self, cache_key: str, lock_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Poll the result cache until the lock holder writes it or gives up"""
+        deadline = time.monotonic() + self.lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            cached = await self._read(cache_key)
+            if cached is not None:
+                return cached
+            try:
+                if not await self.cache.exists(lock_key):
+                    # The holder may have written just before releasing
+                    return await self._read(cache_key)
+            except Exception as e:
+                logger.warning(f"[VerificationCache] Lock check failed: {e}")
+                return None
+        return None
+
+    @staticmethod
+    def _unwrap(cached: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in cached:
+            raise ProviderUnavailableError(cached["error"])
+        return cached["value"]
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        try:
+            return await self.cache.acquire_lock(lock_key, token, self.lock_ttl)
+        except Exception as e:
+            # Redis down: fetch without cross-worker coalescing
+            logger.warning(f"[VerificationCache] Lock acquire failed: {e}")
+            return True
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            await self.cache.release_lock(lock_key, token)
+        except Exception as e:
+            logger.warning(f"[VerificationCache] Lock release failed: {e}")
+
+    async def _read(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await self.cache.get_json(cache_key)
+        except Exception as e:
+            logger.warning(f"[VerificationCache] Cache read failed: {e}")
+            return None
+
+    async def _write(self, cache_key: str, value: Dict[str, Any], ttl: int) -> None:
+        try:
+            await self.cache.set_json(cache_key, value, ttl)
+        except Exception as e:
+            logger.warning(f"[VerificationCache] Cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        shared = self.hits + self.coalesced + self.remote_coalesced
+        lookups = shared + self.negative_hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "remote_coalesced": self.remote_coalesced,
+            "uncached": self.uncached,
+            "inflight": len(self._inflight),
+            "hit_rate": round(shared / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Singleton instance
+_verification_cache: Optional[VerificationCache] = None
+
+
+def get_verification_cache() -> VerificationCache:
+    """Shared verification cache"""
+    global _verification_cache
+    if _verification_cache is None:
+        _verification_cache = VerificationCache()
+    return _verification_cache
@@ -0,0 +1,588 @@
+"""
+Write-Behind 영속화 파이프라인
+
+평가 응답 경로에서 DB 쓰기를 제거하기 위해 평가 결과(Transaction,
+ReviewQueue), 외부 API 호출 로그, 행동 패턴/텔레메트리를 프로세스 내
+bounded 큐에 넣고 백그라운드 플러셔가 모아서 저장한다.
+
+- 배치 크기(batch_size) 또는 대기 시간(flush_interval_ms) 중 먼저 도달한
+  조건으로 플러시
+- enqueue_many 로 넣은 묶음 (거래 + 위험 요인/룰 실행 기록 등) 은 나뉘지 않고
+  같은 배치(트랜잭션)로 기록
+- 테이블별 다중 행 INSERT ... ON CONFLICT DO NOTHING (재시도/재생 시 멱등),
+  UPSERT_TABLES 는 ON CONFLICT DO UPDATE (같은 키의 마지막 값으로 갱신)
+- FK 순서대로 한 트랜잭션에 기록 (transactions → review_queue → ...)
+- 백프레셔: 큐가 가득 차면 enqueue_timeout_ms 동안 대기, 그래도 가득 차면
+  스필 파일에 기록
+- DB 장애/지연: 재시도 후 실패한 배치는 스필 파일(JSON lines)에 기록, 이후
+  플러시가 성공하면 스필 파일을 재생 (읽을 수 없는 줄은 .corrupt 로 격리)
+- 제약/타입 오류(IntegrityError, DataError): 배치를 행 단위로 다시 기록하고
+  거부된 행만 데드레터 파일(.dead)에 오류와 함께 기록
+- 플러시 리스너: 커밋 후 실제로 INSERT 된 행(RETURNING)을 테이블별로 전달
+  (대시보드 롤업 등, 재시도/재생 시에도 중복 전달 없음)
+"""
+
+import asyncio
+import base64
+import enum
+import json
+import logging
+import os
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Enum as SAEnum, inspect as sa_inspect
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.base import AsyncSessionLocal, Base
+
+logger = logging.getLogger(__name__)
+
+# FK 의존 순서 (부모 테이블 먼저)
+TABLE_FLUSH_ORDER = (
+    "transactions",
+    "review_queue",
+    "risk_factors",
+    "rule_executions",
+    "external_service_logs",
+    "behavior_patterns",
+    "behavior_telemetry",
+)
+
+# 같은 키로 다시 기록되면 최신 값으로 갱신하는 테이블 (세션 재전송 등)
+UPSERT_TABLES = ("behavior_patterns", "behavior_telemetry")
+
+# 서비스 디렉터리 아래 (공유 /tmp 에 두지 않음), 배포 시 영속 볼륨으로 지정
+DEFAULT_SPILL_PATH = os.getenv(
+    "FDS_WRITE_BEHIND_SPILL_PATH",
+    str(Path(__file__).resolve().parents[2] / "var" / "fds_write_behind.spill"),
+)
+
+# 행 단위 재기록에서도 통과할 수 없는 오류 (재시도해도 결과가 같음)
+REJECTED_ROW_ERRORS = (IntegrityError, DataError)
+
+Record = Tuple[str, Dict[str, Any]]
+FlushListener = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+def model_to_row(instance: Any) -> Record:
+    """
+    ORM 인스턴스 → (테이블명, 컬럼 값 dict)
+
+    명시되지 않은 컬럼은 Python 측 기본값(uuid4, utcnow 등)을 적용하고,
+    서버 기본값(server_default) 컬럼은 생략한다.
+    """
+    mapper = sa_inspect(type(instance))
+    state_dict = sa_inspect(instance).dict
+    row: Dict[str, Any] = {}
+
+    for attr in mapper.column_attrs:
+        column = attr.columns[0]
+        if attr.key in state_dict:
+            row[column.key] = state_dict[attr.key]
+            continue
+
+        default = column.default
+        if default is None:
+            continue
+        if default.is_callable:
+            row[column.key] = default.arg(None)
+        elif default.is_scalar:
+            row[column.key] = default.arg
+
+    return mapper.local_table.name, row
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON 으로 표현할 수 없는 컬럼 값 인코딩 (json.dumps default)"""
+    if isinstance(value, enum.Enum):
+        # str/int Enum 은 json 이 값으로 직렬화하므로 일반 Enum 도 값으로 통일
+        return value.value
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Unsupported spill value type: {type(value).__name__}")
+
+
+def encode_record(record: Record) -> str:
+    """레코드 → 스필 파일 한 줄 (JSON)"""
+    table_name, row = record
+    return json.dumps({"table": table_name, "row": row}, default=_encode_value)
+
+
+def _decode_value(column: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+        return column_type.enum_class(value)
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return value
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is dt_time:
+        return dt_time.fromisoformat(value)
+    if python_type in (uuid.UUID, Decimal):
+        return python_type(value)
+    if python_type is bytes:
+        return base64.b64decode(value)
+    return value
+
+
+def decode_record(line: str) -> Record:
+    """
+    스필 파일 한 줄 → 레코드 (컬럼 타입 기준으로 값 복원)
+
+    Raises:
+        ValueError, KeyError, TypeError: 손상되었거나 알 수 없는 테이블/컬럼
+    """
+    data = json.loads(line)
+    table = Base.metadata.tables[data["table"]]
+    row = {
+        key: _decode_value(table.c[key], value) for key, value in data["row"].items()
+    }
+    return table.name, row
+
+
+def _append_lines(path: Path, lines: List[str]) -> None:
+    """파일에 줄 추가 기록 (소유자 전용 권한, fsync)"""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    with os.fdopen(fd, "a", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class WriteBehindQueue:
+    """
+    bounded 큐 + 백그라운드 배치 플러셔
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval_ms: float = 200.0,
+        enqueue_timeout_ms: float = 20.0,
+        max_retries: int = 3,
+        spill_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            session_factory: 플러시용 세션 팩토리
+            max_queue_size: 큐 최대 묶음 수 (enqueue 1회 = 1묶음)
+            batch_size: 플러시당 최대 레코드 수 (묶음은 나누지 않으므로
+                마지막 묶음만큼 넘을 수 있음)
+            flush_interval_ms: 첫 레코드 이후 플러시까지 최대 대기 시간
+            enqueue_timeout_ms: 큐가 가득 찼을 때 대기 시간 (초과 시 스필)
+            max_retries: 배치 쓰기 재시도 횟수 (초과 시 스필)
+            spill_path: 스필 파일 경로 (격리/데드레터 파일은 같은 위치의
+                .corrupt / .dead)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.enqueue_timeout = enqueue_timeout_ms / 1000.0
+        self.max_retries = max_retries
+        self.spill_path = Path(spill_path or DEFAULT_SPILL_PATH)
+        self.quarantine_path = self.spill_path.with_suffix(".corrupt")
+        self.dead_letter_path = self.spill_path.with_suffix(".dead")
+
+        # 큐 항목은 같은 배치로 기록할 레코드 묶음
+        self._queue: "asyncio.Queue[List[Record]]" = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        # 테이블명 -> [(RETURNING 컬럼, 리스너)]
+        self._listeners: Dict[
+            str, List[Tuple[Tuple[str, ...], FlushListener]]
+        ] = defaultdict(list)
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # 통계
+        self.enqueued = 0
+        self.flushed_rows: Dict[str, int] = defaultdict(int)
+        self.batches = 0
+        self.failed_batches = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.quarantined = 0
+        self.dead_lettered = 0
+        self.backpressure_waits = 0
+        self.last_flush_ms = 0.0
+
+    async def start(self):
+        """플러셔 시작 (이전 실행의 스필 파일 재생 포함)"""
+        if self._running:
+            return
+        self._running = True
+        await self._replay_spill()
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            f"[WRITE-BEHIND] Started (batch_size={self.batch_size}, "
+            f"flush_interval={self.flush_interval * 1000:.0f}ms)"
+        )
+
+    async def stop(self):
+        """남은 레코드를 모두 기록하고 플러셔 종료"""
+        if not self._running:
+            return
+        self._running = False
+        # 플러셔는 큐가 빌 때까지 기록한 뒤 종료
+        if self._flusher_task:
+            await self._flusher_task
+
+        logger.info(f"[WRITE-BEHIND] Stopped ({self.get_stats()})")
+
+    def add_flush_listener(
+        self, table_name: str, columns: Tuple[str, ...], listener: FlushListener
+    ) -> None:
+        """
+        플러시 리스너 등록
+
+        배치 커밋 후 해당 테이블에 새로 INSERT 된 행(ON CONFLICT 로 건너뛴 행 제외)의
+        columns 값을 리스너에 전달한다. 리스너 예외는 기록만 하고 무시한다.
+
+        Args:
+            table_name: 테이블명
+            columns: RETURNING 으로 받을 컬럼 (서버 기본값 컬럼 포함 가능)
+            listener: async 콜백 (행 dict 리스트)
+        """
+        self._listeners[table_name].append((tuple(columns), listener))
+
+    async def enqueue(self, instance: Any) -> bool:
+        """
+        ORM 인스턴스를 쓰기 큐에 추가 (DB I/O 없음)
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 스필 파일로 기록됐으면 False
+        """
+        return await self.enqueue_many([instance])
+
+    async def enqueue_many(self, instances: List[Any]) -> bool:
+        """
+        ORM 인스턴스 묶음을 쓰기 큐에 추가 (DB I/O 없음)
+
+        묶음은 같은 배치로 기록된다 (거래와 그 위험 요인/룰 실행 기록 등).
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 스필 파일로 기록됐으면 False
+        """
+        if not instances:
+            return True
+        if not self._running:
+            # lifespan 밖(Celery 워커, 스크립트)에서는 첫 사용 시 시작
+            await self.start()
+
+        group = [model_to_row(instance) for instance in instances]
+        self.enqueued += len(group)
+
+        try:
+            self._queue.put_nowait(group)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        # 백프레셔: 플러셔가 비울 시간을 잠시 준다
+        self.backpressure_waits += 1
+        try:
+            await asyncio.wait_for(self._queue.put(group), self.enqueue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._spill(group)
+            return False
+
+    def _drain_nowait(self, limit: int) -> List[Record]:
+        records: List[Record] = []
+        while len(records) < limit:
+            try:
+                records.extend(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return records
+
+    async def _flush_loop(self):
+        while self._running or not self._queue.empty():
+            try:
+                first = await asyncio.wait_for(self._queue.get(), self.flush_interval)
+            except asyncio.TimeoutError:
+                continue
+            batch = list(first)
+            deadline = time.monotonic() + self.flush_interval
+
+            # 크기 또는 시간 조건 중 먼저 도달할 때까지 수집
+            while len(batch) < self.batch_size:
+                batch.extend(self._drain_nowait(self.batch_size - len(batch)))
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.extend(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            if await self._write_batch(batch) and self.spill_path.exists():
+                await self._replay_spill()
+
+    async def _write_batch(self, batch: List[Record]) -> bool:
+        """
+        배치 기록 (재시도 후 실패 시 스필)
+
+        제약/타입 오류는 재시도해도 같은 결과이므로 바로 행 단위 기록으로
+        넘어가 거부된 행만 데드레터로 보낸다.
+
+        Returns:
+            bool: DB 기록 성공 여부
+        """
+        if not batch:
+            return True
+
+        for attempt in range(self.max_retries):
+            try:
+                start = time.perf_counter()
+                await self._insert_records(batch)
+                self.last_flush_ms = (time.perf_counter() - start) * 1000
+                self.batches += 1
+                return True
+            except REJECTED_ROW_ERRORS as e:
+                logger.warning(
+                    f"[WRITE-BEHIND] Batch rejected ({len(batch)} rows), "
+                    f"retrying row by row: {e}"
+                )
+                return await self._write_rows(batch)
+            except Exception as e:
+                logger.warning(
+                    f"[WRITE-BEHIND] Batch write failed "
+                    f"(attempt {attempt + 1}/{self.max_retries}, {len(batch)} rows): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(0.1 * 2**attempt)
+
+        self.failed_batches += 1
+        self._spill(batch)
+        return False
+
+    async def _write_rows(self, batch: List[Record]) -> bool:
+        """
+        행 단위 기록 (FK 순서) - 거부된 행은 데드레터, 나머지는 정상 기록
+
+        부모 행이 거부되면 자식 행도 FK 오류로 함께 데드레터로 간다.
+        도중에 DB 장애가 나면 남은 행은 스필한다.
+        """
+        ordered = sorted(batch, key=lambda record: self._flush_order(record[0]))
+        for index, record in enumerate(ordered):
+            try:
+                await self._insert_records([record])
+            except REJECTED_ROW_ERRORS as e:
+                self._dead_letter(record, e)
+            except Exception as e:
+                logger.warning(f"[WRITE-BEHIND] Row-by-row write failed: {e}")
+                self.failed_batches += 1
+                self._spill(ordered[index:])
+                return False
+
+        self.batches += 1
+        return True
+
+    @staticmethod
+    def _flush_order(table_name: str) -> int:
+        if table_name in TABLE_FLUSH_ORDER:
+            return TABLE_FLUSH_ORDER.index(table_name)
+        return len(TABLE_FLUSH_ORDER)
+
+    async def _insert_records(self, batch: List[Record]):
+        """테이블/컬럼 집합별 다중 행 INSERT (한 트랜잭션)"""
+        grouped: Dict[Tuple[str, frozenset], List[Dict[str, Any]]] = defaultdict(list)
+        for table_name, row in batch:
+            grouped[(table_name, frozenset(row))].append(row)
+
+        inserted: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        async with self.session_factory() as session:
+            # 개발/테스트용 SQLite 도 ON CONFLICT DO NOTHING 지원
+            insert = (
+                sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+            )
+            for key in sorted(grouped, key=lambda key: self._flush_order(key[0])):
+                table_name = key[0]
+                table = Base.metadata.tables[table_name]
+                rows = grouped[key]
+                if table_name in UPSERT_TABLES:
+                    stmt = self._upsert(insert, table, rows)
+                else:
+                    stmt = insert(table).values(rows).on_conflict_do_nothing()
+
+                columns = self._returning_columns(table_name)
+                if not columns:
+                    await session.execute(stmt)
+                    continue
+                result = await session.execute(
+                    stmt.returning(*(table.c[column] for column in columns))
+                )
+                inserted[table_name].extend(dict(row) for row in result.mappings())
+            await session.commit()
+
+        for (table_name, _), rows in grouped.items():
+            self.flushed_rows[table_name] += len(rows)
+
+        await self._notify_listeners(inserted)
+
+    @staticmethod
+    def _upsert(insert: Callable, table: Any, rows: List[Dict[str, Any]]):
+        """INSERT ... ON CONFLICT (PK) DO UPDATE (배치 내 같은 키는 마지막 행만)"""
+        key_columns = [column.key for column in table.primary_key]
+        latest = {tuple(row[k] for k in key_columns): row for row in rows}
+        stmt = insert(table).values(list(latest.values()))
+        return stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column not in key_columns and column != "created_at"
+            },
+        )
+
+    def _returning_columns(self, table_name: str) -> Tuple[str, ...]:
+        columns: List[str] = []
+        for listener_columns, _ in self._listeners.get(table_name, ()):
+            columns.extend(c for c in listener_columns if c not in columns)
+        return tuple(columns)
+
+    async def _notify_listeners(self, inserted: Dict[str, List[Dict[str, Any]]]):
+        for table_name, rows in inserted.items():
+            if not rows:
+                continue
+            for _, listener in self._listeners[table_name]:
+                try:
+                    await listener(rows)
+                except Exception as e:
+                    logger.warning(
+                        f"[WRITE-BEHIND] Flush listener failed ({table_name}): {e}"
+                    )
+
+    def _spill(self, records: List[Record]):
+        """레코드를 스필 파일에 추가 기록 (JSON lines, fsync)"""
+        if not records:
+            return
+        try:
+            _append_lines(self.spill_path, [encode_record(r) for r in records])
+            self.spilled += len(records)
+            logger.warning(
+                f"[WRITE-BEHIND] Spilled {len(records)} records to {self.spill_path}"
+            )
+        except (OSError, TypeError) as e:
+            logger.error(
+                f"[WRITE-BEHIND] Spill failed, {len(records)} records lost: {e}"
+            )
+
+    def _dead_letter(self, record: Record, error: Exception):
+        """DB 가 거부한 행을 오류와 함께 데드레터 파일에 기록 (재시도하지 않음)"""
+        self.dead_lettered += 1
+        logger.error(
+            f"[WRITE-BEHIND] Row rejected ({record[0]}), dead-lettered: {error}"
+        )
+        try:
+            entry = json.loads(encode_record(record))
+            entry["error"] = str(getattr(error, "orig", error))
+            _append_lines(self.dead_letter_path, [json.dumps(entry)])
+        except (OSError, TypeError) as e:
+            logger.error(f"[WRITE-BEHIND] Dead-letter write failed, row lost: {e}")
+
+    def _quarantine(self, lines: List[str]):
+        """읽을 수 없는 스필 줄을 격리 파일로 옮김 (원문 보존)"""
+        self.quarantined += len(lines)
+        logger.error(
+            f"[WRITE-BEHIND] Quarantined {len(lines)} corrupt spill lines "
+            f"to {self.quarantine_path}"
+        )
+        try:
+            _append_lines(self.quarantine_path, lines)
+        except OSError as e:
+            logger.error(f"[WRITE-BEHIND] Quarantine write failed: {e}")
+
+    async def _replay_spill(self):
+        """스필 파일을 배치 단위로 DB에 재기록"""
+        if not self.spill_path.exists():
+            return
+
+        replay_path = self.spill_path.with_suffix(".replaying")
+        if not replay_path.exists():
+            os.replace(self.spill_path, replay_path)
+
+        records: List[Record] = []
+        corrupt: List[str] = []
+        with open(replay_path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip():
+                    continue
+                try:
+                    records.append(decode_record(line))
+                except (ValueError, KeyError, TypeError):
+                    corrupt.append(line)
+        if corrupt:
+            self._quarantine(corrupt)
+
+        for start in range(0, len(records), self.batch_size):
+            chunk = records[start : start + self.batch_size]
+            if not await self._write_batch(chunk):
+                # 실패한 배치는 _write_batch 가 다시 스필; 나머지도 보존
+                self._spill(records[start + self.batch_size :])
+                break
+            self.replayed += len(chunk)
+
+        replay_path.unlink(missing_ok=True)
+        logger.info(f"[WRITE-BEHIND] Replayed {self.replayed} spilled records")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "flushed_rows": dict(self.flushed_rows),
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "quarantined": self.quarantined,
+            "dead_lettered": self.dead_lettered,
+            "backpressure_waits": self.backpressure_waits,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+
+# 싱글톤 인스턴스
+_write_behind_queue: Optional[WriteBehindQueue] = None
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    """
+    Write-behind 큐 싱글톤 인스턴스 가져오기
+
+    Returns:
+        WriteBehindQueue 인스턴스
+    """
+    global _write_behind_queue
+    if _write_behind_queue is None:
+        _write_behind_queue = WriteBehindQueue()
+    return _write_behind_queue
@@ -11,6 +11,12 @@ SHAP (SHapley Additive exPlanations) 및 LIME (Local Interpretable Model-agnosti
 4. Feature 기여도 계산 (워터폴 차트 데이터)
 5. 타임아웃 처리 (5초 제한)
 6. SHAP 값 검증 (feature 값과 일치 확인)
+7. 상주 워커 풀에서 계산 (run_in_executor, 이벤트 루프 비차단, 타임아웃된
+   계산이 끝날 때까지 워커 슬롯 점유 → 대기열 무한 증가 방지)
+8. (모델 버전, feature 벡터 해시) 기준 결과 캐시
+9. 배치 SHAP (여러 거래를 TreeExplainer 1회 호출로 계산)
+10. 비동기 작업 모드 (대량 검토 큐 설명 생성 후 폴링, 작업 상태/결과는
+    Redis 에 저장하여 모든 API 워커에서 조회)
 
 목표:
 - SHAP 분석: 95%가 5초 이내 완료
@@ -18,11 +24,17 @@ SHAP (SHapley Additive exPlanations) 및 LIME (Local Interpretable Model-agnosti
 - 워터폴 차트 데이터 생성
 """
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import time
 import traceback
-from typing import Dict, Any, Optional, List, Tuple
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -51,6 +63,104 @@ from src.models.xai_explanation import XAIExplanation
 
 logger = logging.getLogger(__name__)
 
+# 비동기 작업 Redis 키 / 보관 기간
+XAI_JOB_KEY_PREFIX = "fds:xai:job:"
+XAI_JOB_TTL_SECONDS = 24 * 3600
+
+
+def feature_vector_hash(features: pd.DataFrame, row: int = 0) -> str:
+    """Feature 벡터 해시 (컬럼명 + float64 값)"""
+    digest = hashlib.sha1("|".join(map(str, features.columns)).encode())
+    digest.update(np.ascontiguousarray(features.iloc[row].values, dtype=np.float64))
+    return digest.hexdigest()
+
+
+@dataclass
+class XAIJob:
+    """비동기 XAI 설명 작업"""
+
+    job_id: str
+    total: int
+    status: str = "pending"  # pending, running, completed, failed
+    completed: int = 0
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self, include_results: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "XAIJob":
+        finished_at = data.get("finished_at")
+        return cls(
+            job_id=data["job_id"],
+            total=data["total"],
+            status=data["status"],
+            completed=data["completed"],
+            results=data.get("results") or [],
+            error=data.get("error"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+        )
+
+
+class XAIJobStore:
+    """
+    비동기 XAI 작업 저장소 (Redis)
+
+    작업은 등록한 워커에서 실행되지만 상태와 결과는 Redis 에 기록하므로
+    어느 API 워커에서든 조회할 수 있다. 상태와 결과 목록은 같은 TTL 로 만료된다.
+    """
+
+    def __init__(self, redis: Any, ttl_seconds: int = XAI_JOB_TTL_SECONDS):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _keys(job_id: str) -> Tuple[str, str]:
+        key = f"{XAI_JOB_KEY_PREFIX}{job_id}"
+        return key, f"{key}:results"
+
+    async def save(self, job: XAIJob, results: Optional[List[Dict[str, Any]]] = None):
+        """작업 상태 저장 (results 가 있으면 결과 목록에 추가, 한 트랜잭션)"""
+        state_key, results_key = self._keys(job.job_id)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(
+            state_key,
+            json.dumps(job.to_dict(include_results=False)),
+            ex=self.ttl_seconds,
+        )
+        if results:
+            pipe.rpush(results_key, *(json.dumps(r, default=str) for r in results))
+            pipe.expire(results_key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def load(self, job_id: str, include_results: bool = True) -> Optional[XAIJob]:
+        """작업 조회 (없거나 만료되면 None)"""
+        state_key, results_key = self._keys(job_id)
+        raw = await self.redis.get(state_key)
+        if raw is None:
+            return None
+        job = XAIJob.from_dict(json.loads(raw))
+        if include_results:
+            job.results = [
+                json.loads(r) for r in await self.redis.lrange(results_key, 0, -1)
+            ]
+        return job
+
 
 class XAIService:
     """
@@ -65,6 +175,11 @@ class XAIService:
         enable_shap: bool = True,
         enable_lime: bool = True,
         max_display_features: int = 5,
+        max_workers: int = 2,
+        cache_size: int = 10000,
+        batch_size: int = 256,
+        batch_timeout_seconds: int = 30,
+        job_store: Optional[XAIJobStore] = None,
     ):
         """
         Args:
@@ -72,11 +187,43 @@ class XAIService:
             enable_shap: SHAP 분석 활성화
             enable_lime: LIME 분석 활성화
             max_display_features: 상위 위험 요인 표시 개수
+            max_workers: 설명 계산 워커 스레드 수 (프로세스 수명 동안 유지,
+                동시에 실행/대기할 수 있는 계산 수의 상한)
+            cache_size: 설명 결과 캐시 최대 항목 수
+            batch_size: 배치/작업 모드의 TreeExplainer 1회 호출당 거래 수
+            batch_timeout_seconds: 배치 1회 계산 타임아웃 (초)
+            job_store: 비동기 작업 저장소 (None 이면 첫 사용 시 Redis 로 생성)
         """
         self.timeout_seconds = timeout_seconds
         self.enable_shap = enable_shap and SHAP_AVAILABLE
         self.enable_lime = enable_lime and LIME_AVAILABLE
         self.max_display_features = max_display_features
+        self.batch_size = batch_size
+        self.batch_timeout_seconds = batch_timeout_seconds
+        self.max_workers = max_workers
+
+        # 상주 워커 풀 (호출마다 executor 를 만들지 않음)
+        # explainer 가 모델 객체를 참조하므로 프로세스 풀 대신 스레드 풀 사용
+        # (SHAP/NumPy 연산은 대부분 GIL 을 해제)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="xai"
+        )
+        # 스레드는 중단할 수 없으므로 타임아웃된 계산도 실제로 끝날 때까지
+        # 슬롯을 점유한다 (막힌 워커 뒤로 요청이 쌓이지 않게 함)
+        self._slots = asyncio.Semaphore(max_workers)
+        self.pool_timeouts = 0
+        self.pool_rejections = 0
+
+        # (모델 버전, 모델 타입, feature 해시) → 설명 결과
+        self.model_version: str = "unversioned"
+        self._cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # 비동기 작업 (상태는 저장소, 실행 태스크는 이 워커)
+        self._job_store = job_store
+        self._job_tasks: Dict[str, asyncio.Task] = {}
 
         # 캐시된 explainer (모델 로드 시 설정)
         self.tree_explainer: Optional[Any] = None
@@ -93,6 +240,7 @@ class XAIService:
         deep_model: Optional[Any] = None,
         feature_names: Optional[List[str]] = None,
         training_data: Optional[pd.DataFrame] = None,
+        model_version: Optional[str] = None,
     ) -> None:
         """
         Explainer 초기화
@@ -102,10 +250,17 @@ class XAIService:
             deep_model: 딥러닝 모델 (Autoencoder, LSTM)
             feature_names: Feature 이름 목록
             training_data: 학습 데이터 (LIME 배경 데이터)
+            model_version: 모델 버전 (설명 캐시 키)
         """
         self.feature_names = feature_names
         self.feature_count = len(feature_names) if feature_names else 0
 
+        # 모델이 바뀌면 이전 버전의 설명은 더 이상 유효하지 않음
+        self.model_version = (
+            model_version or f"unversioned-{id(tree_model or deep_model)}"
+        )
+        self._cache.clear()
+
         # SHAP TreeExplainer 초기화 (Random Forest, XGBoost)
         if self.enable_shap and tree_model is not None and SHAP_AVAILABLE:
             try:
@@ -187,6 +342,15 @@ class XAIService:
                 f"features must contain exactly 1 row, got {features.shape[0]}"
             )
 
+        # 동일 모델 버전 + 동일 feature 벡터는 캐시된 설명 재사용
+        cache_key = (self.model_version, model_type, feature_vector_hash(features))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            result = self._from_cache(cached, transaction_id, start_time)
+            if db_session:
+                await self._save_explanation(transaction_id, result, db_session)
+            return result
+
         result = {
             "transaction_id": str(transaction_id),
             "shap_values": None,
@@ -250,12 +414,239 @@ class XAIService:
             f"[XAI] Explanation generated for transaction {transaction_id} in {elapsed_ms}ms"
         )
 
+        # 타임아웃/실패한 결과는 캐싱하지 않음
+        if result["shap_values"] or result["lime_explanation"]:
+            self._cache_put(cache_key, result)
+
         # 데이터베이스 저장 (옵션)
         if db_session:
             await self._save_explanation(transaction_id, result, db_session)
 
         return result
 
+    async def explain_batch(
+        self,
+        transaction_ids: List[uuid.UUID],
+        features: pd.DataFrame,
+        model_type: str = "tree",
+        db_session: Optional[AsyncSession] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 거래의 SHAP 설명을 TreeExplainer 배치 호출로 생성 (LIME 제외)
+
+        Args:
+            transaction_ids: 거래 ID 목록
+            features: 입력 특징 데이터 (거래당 1행, transaction_ids 와 같은 순서)
+            model_type: 모델 타입 (배치는 "tree" 만 지원)
+            db_session: 데이터베이스 세션 (결과 저장용)
+
+        Returns:
+            거래별 설명 결과 목록 (explain_prediction 과 같은 형식)
+        """
+        if len(transaction_ids) != features.shape[0]:
+            raise ValueError(
+                f"transaction_ids ({len(transaction_ids)}) and features "
+                f"({features.shape[0]} rows) must have the same length"
+            )
+        if model_type != "tree" or self.tree_explainer is None:
+            raise ValueError("Batch explanations require an initialized tree explainer")
+
+        start_time = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transaction_ids)
+        misses: List[int] = []
+        keys = []
+
+        for i, transaction_id in enumerate(transaction_ids):
+            key = (self.model_version, model_type, feature_vector_hash(features, i))
+            keys.append(key)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = self._from_cache(cached, transaction_id, start_time)
+            else:
+                misses.append(i)
+
+        for chunk_start in range(0, len(misses), self.batch_size):
+            chunk = misses[chunk_start : chunk_start + self.batch_size]
+            chunk_features = features.iloc[chunk]
+            chunk_start_time = time.time()
+            computed = await self._run_in_pool(
+                lambda: self._shap_tree_values(chunk_features),
+                self.batch_timeout_seconds,
+                f"SHAP TreeExplainer batch ({len(chunk)} rows)",
+            )
+            per_row_ms = int((time.time() - chunk_start_time) * 1000 / len(chunk))
+
+            for offset, i in enumerate(chunk):
+                result = {
+                    "transaction_id": str(transaction_ids[i]),
+                    "shap_values": None,
+                    "lime_explanation": None,
+                    "top_risk_factors": [],
+                    "explanation_time_ms": per_row_ms,
+                    "generated_at": datetime.utcnow().isoformat(),
+                }
+                if computed is not None:
+                    shap_values, base_values = computed
+                    row = features.iloc[[i]]
+                    result["shap_values"] = self._format_shap_values(
+                        shap_values[offset], base_values[offset], row
+                    )
+                    result["top_risk_factors"] = self._compute_top_risk_factors(
+                        result["shap_values"]
+                    )
+                    result["validation"] = self._validate_shap_values(
+                        result["shap_values"], row
+                    )
+                    self._cache_put(keys[i], result)
+                results[i] = result
+
+        logger.info(
+            f"[XAI] Batch explanation for {len(transaction_ids)} transactions "
+            f"({len(misses)} computed, {len(transaction_ids) - len(misses)} cached) "
+            f"in {int((time.time() - start_time) * 1000)}ms"
+        )
+
+        if db_session:
+            await self._save_explanations(
+                [r for r in results if r["shap_values"]], db_session
+            )
+
+        return results
+
+    async def submit_job(
+        self,
+        transaction_ids: List[uuid.UUID],
+        features: pd.DataFrame,
+        model_type: str = "tree",
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> XAIJob:
+        """
+        대량 설명 생성 작업 등록 (즉시 반환, get_job 으로 진행 상황 폴링)
+
+        Args:
+            transaction_ids: 거래 ID 목록
+            features: 입력 특징 데이터 (거래당 1행)
+            model_type: 모델 타입 (배치는 "tree" 만 지원)
+            session_factory: 결과 저장용 세션 팩토리 (None 이면 저장 안 함)
+
+        Returns:
+            등록된 작업
+        """
+        if len(transaction_ids) != features.shape[0]:
+            raise ValueError("transaction_ids and features must have the same length")
+
+        store = await self._get_job_store()
+        job = XAIJob(job_id=str(uuid.uuid4()), total=len(transaction_ids))
+        await store.save(job)
+
+        task = asyncio.create_task(
+            self._run_job(
+                store, job, transaction_ids, features, model_type, session_factory
+            )
+        )
+        self._job_tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._job_tasks.pop(job.job_id, None))
+        return job
+
+    async def get_job(
+        self, job_id: str, include_results: bool = True
+    ) -> Optional[XAIJob]:
+        """비동기 작업 조회 (다른 워커에서 등록한 작업 포함)"""
+        store = await self._get_job_store()
+        return await store.load(job_id, include_results=include_results)
+
+    async def _get_job_store(self) -> XAIJobStore:
+        if self._job_store is None:
+            from src.utils.redis_client import get_redis
+
+            self._job_store = XAIJobStore(await get_redis())
+        return self._job_store
+
+    async def _run_job(
+        self,
+        store: XAIJobStore,
+        job: XAIJob,
+        transaction_ids: List[uuid.UUID],
+        features: pd.DataFrame,
+        model_type: str,
+        session_factory: Optional[Callable[[], AsyncSession]],
+    ) -> None:
+        job.status = "running"
+        try:
+            await store.save(job)
+            for start in range(0, job.total, self.batch_size):
+                end = start + self.batch_size
+                results = await self.explain_batch(
+                    transaction_ids[start:end], features.iloc[start:end], model_type
+                )
+                if session_factory is not None:
+                    async with session_factory() as session:
+                        await self._save_explanations(
+                            [r for r in results if r["shap_values"]], session
+                        )
+                job.completed += len(results)
+                await store.save(job, results)
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"[XAI] Job {job.job_id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow()
+            try:
+                await store.save(job)
+            except Exception as e:
+                logger.error(f"[XAI] Job {job.job_id} state save failed: {e}")
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        cached = self._cache.get(key)
+        if cached is None:
+            self.cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return cached
+
+    def _cache_put(self, key: Tuple[str, str, str], result: Dict[str, Any]) -> None:
+        self._cache[key] = copy.deepcopy(result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _from_cache(
+        self,
+        cached: Dict[str, Any],
+        transaction_id: uuid.UUID,
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """캐시된 설명을 현재 거래용 결과로 복사"""
+        result = copy.deepcopy(cached)
+        result["transaction_id"] = str(transaction_id)
+        result["generated_at"] = datetime.utcnow().isoformat()
+        result["explanation_time_ms"] = int((time.time() - start_time) * 1000)
+        result["cached"] = True
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시/작업 통계"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "model_version": self.model_version,
+            "cache_size": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "running_jobs": len(self._job_tasks),
+            "pool_timeouts": self.pool_timeouts,
+            "pool_rejections": self.pool_rejections,
+        }
+
+    def shutdown(self) -> None:
+        """워커 풀 종료"""
+        for task in self._job_tasks.values():
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     async def _compute_shap_tree(
         self, features: pd.DataFrame
     ) -> Tuple[Optional[np.ndarray], Optional[float]]:
@@ -271,36 +662,39 @@ class XAIService:
         if not SHAP_AVAILABLE or self.tree_explainer is None:
             return None, None
 
-        def _compute():
-            explanation = self.tree_explainer(features)
-            # TreeExplainer는 클래스별 SHAP 값 반환 (shape: [1, features, 2])
-            # 사기 클래스(인덱스 1)만 사용
-            shap_values = (
-                explanation.values[0, :, 1]
-                if len(explanation.values.shape) == 3
-                else explanation.values[0]
-            )
-            base_value = (
-                explanation.base_values[0, 1]
-                if len(explanation.base_values.shape) == 2
-                else explanation.base_values[0]
-            )
-            return shap_values, base_value
-
-        # T082: 타임아웃 처리 (5초)
-        try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(_compute)
-                shap_values, base_value = future.result(timeout=self.timeout_seconds)
-                return shap_values, base_value
-        except FuturesTimeoutError:
-            logger.warning(
-                f"[XAI] SHAP TreeExplainer timeout after {self.timeout_seconds}s"
-            )
-            return None, None
-        except Exception as e:
-            logger.error(f"[XAI] SHAP TreeExplainer error: {e}")
+        # T082: 타임아웃 처리 (5초, 워커 풀에서 계산하므로 이벤트 루프는 비차단)
+        computed = await self._run_in_pool(
+            lambda: self._shap_tree_values(features),
+            self.timeout_seconds,
+            "SHAP TreeExplainer",
+        )
+        if computed is None:
             return None, None
+        shap_values, base_values = computed
+        return shap_values[0], base_values[0]
+
+    def _shap_tree_values(
+        self, features: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        TreeExplainer 1회 호출로 여러 행의 SHAP 값 계산 (워커 스레드에서 실행)
+
+        Returns:
+            (shap_values [rows, features], base_values [rows])
+        """
+        explanation = self.tree_explainer(features)
+        # TreeExplainer는 클래스별 SHAP 값 반환 (shape: [rows, features, 2])
+        # 사기 클래스(인덱스 1)만 사용
+        shap_values = (
+            explanation.values[:, :, 1]
+            if len(explanation.values.shape) == 3
+            else explanation.values
+        )
+        base_values = np.asarray(explanation.base_values)
+        if base_values.ndim == 2:
+            base_values = base_values[:, 1]
+        base_values = np.broadcast_to(base_values, (shap_values.shape[0],))
+        return shap_values, base_values
 
     async def _compute_shap_deep(
         self, features: pd.DataFrame
@@ -331,19 +725,10 @@ class XAIService:
             return shap_values, base_value
 
         # T082: 타임아웃 처리 (5초)
-        try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(_compute)
-                shap_values, base_value = future.result(timeout=self.timeout_seconds)
-                return shap_values, base_value
-        except FuturesTimeoutError:
-            logger.warning(
-                f"[XAI] SHAP DeepExplainer timeout after {self.timeout_seconds}s"
-            )
-            return None, None
-        except Exception as e:
-            logger.error(f"[XAI] SHAP DeepExplainer error: {e}")
-            return None, None
+        computed = await self._run_in_pool(
+            _compute, self.timeout_seconds, "SHAP DeepExplainer"
+        )
+        return computed if computed is not None else (None, None)
 
     async def _compute_lime(
         self, features: pd.DataFrame, model: Any
@@ -401,17 +786,54 @@ class XAIService:
             return lime_result
 
         # T082: 타임아웃 처리 (5초)
+        return await self._run_in_pool(_compute, self.timeout_seconds, "LIME")
+
+    async def _run_in_pool(
+        self, fn: Callable[[], Any], timeout: float, label: str
+    ) -> Optional[Any]:
+        """
+        상주 워커 풀에서 계산 실행 (타임아웃/오류 시 None)
+
+        워커 슬롯을 얻을 때까지 기다린 시간도 타임아웃에 포함된다.
+        타임아웃 시 요청은 즉시 반환되고, 실행 중인 계산은 끝날 때까지 슬롯을
+        점유한다 (모든 슬롯이 막혀 있으면 새 계산은 대기 후 거절).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(_compute)
-                result = future.result(timeout=self.timeout_seconds)
-                return result
-        except FuturesTimeoutError:
-            logger.warning(f"[XAI] LIME timeout after {self.timeout_seconds}s")
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.pool_rejections += 1
+            logger.warning(
+                f"[XAI] {label} rejected: all {self.max_workers} workers busy "
+                f"for {timeout}s"
+            )
             return None
+
+        try:
+            future = self._executor.submit(fn)
+        except RuntimeError:
+            self._slots.release()
+            raise
+
+        def release_slot(_):
+            try:
+                loop.call_soon_threadsafe(self._slots.release)
+            except RuntimeError:
+                pass  # 이벤트 루프 종료 후 완료
+
+        future.add_done_callback(release_slot)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), max(deadline - loop.time(), 0)
+            )
+        except asyncio.TimeoutError:
+            self.pool_timeouts += 1
+            logger.warning(f"[XAI] {label} timeout after {timeout}s")
         except Exception as e:
-            logger.error(f"[XAI] LIME error: {e}")
-            return None
+            logger.error(f"[XAI] {label} error: {e}")
+        return None
 
     def _format_shap_values(
         self,
@@ -588,6 +1010,39 @@ class XAIService:
             logger.error(f"[XAI] Failed to save explanation to DB: {e}")
             await db_session.rollback()
 
+    async def _save_explanations(
+        self, results: List[Dict[str, Any]], db_session: AsyncSession
+    ) -> None:
+        """
+        여러 XAI 분석 결과를 한 번의 커밋으로 저장
+
+        Args:
+            results: XAI 분석 결과 목록
+            db_session: 데이터베이스 세션
+        """
+        if not results:
+            return
+        try:
+            db_session.add_all(
+                [
+                    XAIExplanation(
+                        explanation_id=uuid.uuid4(),
+                        transaction_id=uuid.UUID(result["transaction_id"]),
+                        shap_values=result.get("shap_values"),
+                        lime_explanation=result.get("lime_explanation"),
+                        top_risk_factors=result.get("top_risk_factors"),
+                        explanation_time_ms=result.get("explanation_time_ms"),
+                        generated_at=datetime.utcnow(),
+                    )
+                    for result in results
+                ]
+            )
+            await db_session.commit()
+            logger.info(f"[XAI] {len(results)} explanations saved to DB")
+        except Exception as e:
+            logger.error(f"[XAI] Failed to save explanations to DB: {e}")
+            await db_session.rollback()
+
     async def get_explanation_by_transaction(
         self, transaction_id: uuid.UUID, db_session: AsyncSession
     ) -> Optional[Dict[str, Any]]:
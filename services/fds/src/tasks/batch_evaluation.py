@@ -5,19 +5,52 @@ Batch Evaluation Tasks for FDS Service
 """
 
 from src.tasks import app
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_reevaluation(
+    cutoff_time: datetime, run_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """워커 이벤트 루프에서 BatchService 재채점 실행"""
+    from uuid import UUID
+
+    from src.models.base import AsyncSessionLocal
+    from src.services.batch_service import BatchService
+    from src.utils.redis_client import close_redis, get_redis
+
+    redis = None
+    try:
+        redis = await get_redis()
+    except Exception as e:
+        logger.warning(
+            f"[WARNING] Redis unavailable, rescoring with empty snapshot: {e}"
+        )
+
+    try:
+        async with AsyncSessionLocal() as session:
+            batch_service = BatchService(session, redis=redis)
+            return await batch_service.reevaluate_transactions(
+                cutoff_time, run_id=UUID(run_id) if run_id else None
+            )
+    finally:
+        if redis is not None:
+            await close_redis()
+
+
 @app.task(
     bind=True,
     name="src.tasks.batch_evaluation.batch_evaluate_transactions",
     max_retries=2,
     default_retry_delay=600,
 )
-def batch_evaluate_transactions(self, hours_ago: int = 24):
+def batch_evaluate_transactions(
+    self, hours_ago: int = 24, run_id: Optional[str] = None
+):
     """
     배치 거래 재평가
 
@@ -28,6 +61,7 @@ def batch_evaluate_transactions(self, hours_ago: int = 24):
     Args:
         self: Celery 작업 인스턴스
         hours_ago: 재평가할 거래 기간 (시간 단위, 기본 24시간)
+        run_id: 중단된 재채점 실행 ID (지정 시 체크포인트부터 재개)
 
     Returns:
         Dict[str, Any]: 배치 평가 결과
@@ -41,21 +75,18 @@ def batch_evaluate_transactions(self, hours_ago: int = 24):
         cutoff_time = datetime.now() - timedelta(hours=hours_ago)
         logger.info(f"[INFO] Evaluating transactions since {cutoff_time}")
 
-        # 배치 평가 서비스 호출
-        # TODO: 실제 batch_service.py의 BatchService 클래스 사용
-        # from src.services.batch_service import BatchService
-        # batch_service = BatchService()
-        # result = await batch_service.reevaluate_transactions(cutoff_time)
+        # 배치 평가 서비스 호출 (keyset 스트리밍 + 프로세스 풀 재채점)
+        result = asyncio.run(_run_reevaluation(cutoff_time, run_id))
 
-        # 플레이스홀더 결과
-        evaluated_count = 0  # 실제 구현 시 재평가된 거래 수
-        high_risk_count = 0  # 고위험으로 재분류된 거래 수
-        false_positive_count = 0  # 오탐으로 확인된 거래 수
+        evaluated_count = result["evaluated_count"]  # 재평가된 거래 수
+        high_risk_count = result["high_risk_count"]  # 차단으로 재분류된 거래 수
+        false_positive_count = result["false_positive_count"]  # 승인으로 재분류된 거래 수
 
         logger.info(
             f"[SUCCESS] Batch evaluation completed: "
             f"evaluated={evaluated_count}, high_risk={high_risk_count}, "
-            f"false_positive={false_positive_count}"
+            f"false_positive={false_positive_count}, "
+            f"throughput={result['throughput_per_sec']}/s"
         )
 
         return {
@@ -66,6 +97,9 @@ def batch_evaluate_transactions(self, hours_ago: int = 24):
             "high_risk_count": high_risk_count,
             "false_positive_count": false_positive_count,
             "hours_ago": hours_ago,
+            "run_id": result["run_id"],
+            "throughput_per_sec": result["throughput_per_sec"],
+            "summary": result["summary"],
         }
 
     except Exception as exc:
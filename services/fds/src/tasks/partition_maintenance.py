@@ -0,0 +1,70 @@
+"""
+Partition Maintenance Tasks for FDS Service
+
+거래 테이블(transactions) 파티션을 미리 생성하고, 보존 기간이 지난 파티션을
+아카이브 스키마로 떼어내는 Celery 작업입니다.
+"""
+
+from src.tasks import app
+import asyncio
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_maintenance() -> Dict[str, Any]:
+    """워커 이벤트 루프에서 파티션 관리 실행"""
+    from src.models.base import engine
+    from src.services.transaction_partitions import get_transaction_partition_manager
+
+    try:
+        return await get_transaction_partition_manager().maintain()
+    finally:
+        # asyncio.run 마다 새 이벤트 루프이므로 풀 연결 정리
+        await engine.dispose()
+
+
+@app.task(
+    bind=True,
+    name="src.tasks.partition_maintenance.maintain_transaction_partitions",
+    max_retries=3,
+    default_retry_delay=900,
+)
+def maintain_transaction_partitions(self):
+    """
+    거래 파티션 정기 관리
+
+    Celery Beat 스케줄: 매일 오전 3시 실행
+
+    Args:
+        self: Celery 작업 인스턴스
+
+    Returns:
+        Dict[str, Any]: 생성/아카이브한 파티션 목록
+    """
+    try:
+        result = asyncio.run(_run_maintenance())
+
+        logger.info(
+            f"[SUCCESS] Transaction partition maintenance completed: "
+            f"created={result['created']}, archived={result['archived']}"
+        )
+
+        return {"success": True, **result}
+
+    except Exception as exc:
+        logger.error(f"[FAIL] Failed to maintain transaction partitions: {exc}")
+
+        # 미리 만들어 둔 파티션이 있으므로 다음 재시도까지 기록에는 문제 없음
+        if self.request.retries < self.max_retries:
+            logger.warning(
+                f"[RETRY] Retrying partition maintenance (attempt {self.request.retries + 1}/{self.max_retries})"
+            )
+            raise self.retry(exc=exc, countdown=900)
+
+        return {
+            "success": False,
+            "message": "Failed to maintain transaction partitions",
+            "error": str(exc),
+        }
@@ -7,8 +7,9 @@ FDS 서비스에서 사용하는 Redis 캐싱 유틸리티 함수들을 제공
 
 import json
 import os
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict, Tuple
 import redis.asyncio as redis
+from redis.exceptions import WatchError
 
 
 class RedisCache:
@@ -110,6 +111,58 @@ class RedisCache:
         json_value = json.dumps(value, ensure_ascii=False)
         return await self.set(key, json_value, ttl)
 
+    async def update_json(
+        self,
+        key: str,
+        update: Callable[[Optional[Dict[str, Any]]], Tuple[Dict[str, Any], Any]],
+        ttl: Optional[int] = None,
+        max_retries: int = 5,
+    ) -> Any:
+        """
+        JSON 값 원자적 갱신 (WATCH/MULTI 낙관적 동시성 제어)
+
+        읽은 뒤 다른 클라이언트가 같은 키를 바꾸면 최신 값으로 update 를
+        다시 실행한다 (update 는 부작용 없이 여러 번 호출될 수 있어야 함).
+
+        Args:
+            key: 캐시 키
+            update: 현재 값(없으면 None) → (저장할 값, 반환할 결과)
+            ttl: Time-To-Live (초 단위), None이면 만료 없음
+            max_retries: 충돌 시 최대 시도 횟수
+
+        Returns:
+            마지막으로 커밋된 update 의 결과
+
+        Raises:
+            WatchError: max_retries 번 모두 충돌
+        """
+        if self.client is None:
+            await self.connect()
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            for _ in range(max_retries):
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.get(key)
+                    try:
+                        current = json.loads(raw) if raw else None
+                    except json.JSONDecodeError:
+                        current = None
+                    value, result = update(current)
+
+                    pipe.multi()
+                    json_value = json.dumps(value, ensure_ascii=False)
+                    if ttl:
+                        pipe.setex(key, ttl, json_value)
+                    else:
+                        pipe.set(key, json_value)
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    continue
+
+        raise WatchError(f"Concurrent updates on {key} (retries={max_retries})")
+
     async def delete(self, key: str) -> int:
         """
         키 삭제
@@ -167,6 +220,33 @@ class RedisCache:
             await self.connect()
         return await self.client.incrby(key, amount)
 
+    async def acquire_lock(self, key: str, token: str, ttl: int) -> bool:
+        """
+        잠금 획득 (SET NX EX, 워커 간 공유)
+
+        Args:
+            key: 잠금 키
+            token: 소유자 토큰 (해제 시 확인)
+            ttl: 잠금 만료 시간 (초, 소유자가 죽어도 풀림)
+
+        Returns:
+            획득 여부
+        """
+        if self.client is None:
+            await self.connect()
+        return bool(await self.client.set(key, token, ex=ttl, nx=True))
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """
+        잠금 해제 (소유자 토큰이 같을 때만, 만료 후 다른 소유자 잠금은 유지)
+
+        Returns:
+            해제 여부
+        """
+        if self.client is None:
+            await self.connect()
+        return bool(await self.client.eval(RELEASE_LOCK_SCRIPT, 1, key, token))
+
     async def flush_pattern(self, pattern: str) -> int:
         """
         패턴과 일치하는 모든 키 삭제
@@ -187,6 +267,15 @@ class RedisCache:
         return deleted
 
 
+# KEYS[1]: 잠금 키, ARGV[1]: 소유자 토큰
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
 # 싱글톤 인스턴스
 _cache_instance: Optional[RedisCache] = None
 
@@ -213,6 +302,11 @@ class CacheKeys:
         """디바이스 핑거프린트 캐시 키"""
         return f"device:{device_id}"
 
+    @staticmethod
+    def device_blacklist(device_id: str) -> str:
+        """디바이스 블랙리스트 상태 캐시 키 (블랙리스트 API 가 변경 시 갱신)"""
+        return f"device_blacklist:{device_id}"
+
     @staticmethod
     def network_analysis(ip_address: str) -> str:
         """네트워크 분석 캐시 키"""
@@ -233,16 +327,50 @@ class CacheKeys:
         """사기 탐지 룰 결과 캐시 키"""
         return f"rule_result:{transaction_id}"
 
+    @staticmethod
+    def bin_lookup(bin_prefix: str) -> str:
+        """원격 BIN 조회 결과 캐시 키"""
+        return f"bin:{bin_prefix}"
+
+    @staticmethod
+    def behavior_session_state(session_id: str) -> str:
+        """행동 패턴 세션 누적 통계 캐시 키"""
+        return f"behavior_state:{session_id}"
+
+    @staticmethod
+    def verification(provider: str, key_hash: str) -> str:
+        """외부 검증 결과 캐시 키 (정규화 키의 해시)"""
+        return f"verify:{provider}:{key_hash}"
+
+    @staticmethod
+    def verification_lock(provider: str, key_hash: str) -> str:
+        """외부 검증 조회 잠금 키 (워커 간 single-flight)"""
+        return f"verify_lock:{provider}:{key_hash}"
+
+    @staticmethod
+    def transaction_partition_key(order_id: str) -> str:
+        """주문의 거래 파티션 키 (created_at) 키 (재요청 멱등성)"""
+        return f"txn_partition_key:{order_id}"
+
 
 # TTL 상수 (초 단위)
 class CacheTTL:
     """캐시 만료 시간 상수"""
 
     DEVICE_FINGERPRINT = 86400  # 24시간
+    DEVICE_BLACKLIST = 86400  # 24시간 (만료 시 DB 에서 다시 읽음)
     NETWORK_ANALYSIS = 3600  # 1시간
     BLACKLIST_CHECK = 300  # 5분
     EXTERNAL_API = 1800  # 30분
     FRAUD_RULE_RESULT = 600  # 10분
+    BIN_LOOKUP = 86400 * 30  # 30일 (BIN 발급 정보는 거의 바뀌지 않음)
+    BEHAVIOR_SESSION_STATE = 3600  # 1시간 (마지막 청크 기준)
+    EMAIL_REPUTATION = 86400  # 24시간
+    BREACH_CHECK = 86400  # 24시간
+    PHONE_VALIDATION = 86400 * 7  # 7일
+    VERIFICATION_NEGATIVE = 300  # 5분 (외부 검증 실패 결과)
+    VERIFICATION_LOCK = 30  # 30초 (외부 검증 조회 잠금, 조회 재시도 포함)
+    TRANSACTION_PARTITION_KEY = 86400 * 7  # 7일 (주문 재요청/재평가 허용 기간)
 
 
 # 편의 함수
@@ -264,6 +392,85 @@ async def cache_device_fingerprint(
     return await cache.set_json(key, fingerprint_data, CacheTTL.DEVICE_FINGERPRINT)
 
 
+# 캐시된 핑거프린트의 last_seen_at/user_agent 만 갱신 (TTL 유지, 키가 없으면 무시)
+TOUCH_DEVICE_FINGERPRINT_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return 0
+end
+local data = cjson.decode(raw)
+data['last_seen_at'] = ARGV[1]
+data['user_agent'] = ARGV[2]
+redis.call('SET', KEYS[1], cjson.encode(data), 'KEEPTTL')
+return 1
+"""
+
+
+async def touch_cached_device_fingerprint(
+    device_id: str, last_seen_at: str, user_agent: str
+) -> bool:
+    """
+    캐시된 디바이스 핑거프린트의 최근 접속 정보만 갱신
+
+    전체 값을 다시 쓰지 않으므로 그 사이 무효화/갱신된 값을 되살리지 않고
+    TTL 도 연장하지 않는다.
+
+    Returns:
+        캐시에 키가 있어 갱신했으면 True
+    """
+    cache = get_cache()
+    if cache.client is None:
+        await cache.connect()
+    key = CacheKeys.device_fingerprint(device_id)
+    updated = await cache.client.eval(
+        TOUCH_DEVICE_FINGERPRINT_SCRIPT, 1, key, last_seen_at, user_agent
+    )
+    return bool(updated)
+
+
+async def cache_device_blacklist_status(
+    device_id: str,
+    blacklisted: bool,
+    blacklist_reason: Optional[str],
+    only_if_absent: bool = False,
+) -> bool:
+    """
+    디바이스 블랙리스트 상태 캐싱
+
+    Args:
+        device_id: 디바이스 ID
+        blacklisted: 블랙리스트 여부
+        blacklist_reason: 블랙리스트 사유
+        only_if_absent: DB 조회 결과로 채울 때 True (블랙리스트 API 가 먼저
+            기록한 상태를 덮어쓰지 않음)
+
+    Returns:
+        저장 여부
+    """
+    cache = get_cache()
+    if cache.client is None:
+        await cache.connect()
+    value = json.dumps(
+        {"blacklisted": blacklisted, "blacklist_reason": blacklist_reason},
+        ensure_ascii=False,
+    )
+    return bool(
+        await cache.client.set(
+            CacheKeys.device_blacklist(device_id),
+            value,
+            ex=CacheTTL.DEVICE_BLACKLIST,
+            nx=only_if_absent,
+        )
+    )
+
+
+async def get_cached_device_blacklist_status(
+    device_id: str,
+) -> Optional[Dict[str, Any]]:
+    """캐시된 디바이스 블랙리스트 상태 조회 ({blacklisted, blacklist_reason} 또는 None)"""
+    return await get_cache().get_json(CacheKeys.device_blacklist(device_id))
+
+
 async def get_cached_device_fingerprint(
     device_id: str,
 ) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,208 @@
+"""
+행동 텔레메트리 컬럼 코덱
+
+마우스/키보드/클릭스트림 이벤트 목록을 컬럼 단위로 변환해 압축 바이너리
+blob 으로 저장한다.
+
+- 타임스탬프/좌표: 델타 인코딩 후 값 범위에 맞는 최소 정수 타입으로 축소
+- 체류/입력 시간: 정수면 최소 정수 타입, 소수가 있으면 float64
+- 속도/가속도/곡률: float32 (float32 로 정확히 왕복되지 않는 값이 있으면 float64)
+- 키/페이지 문자열: 사전(dictionary) 인코딩
+- 누락/None 값: 컬럼별 존재 비트맵으로 기록 (디코딩 시 필드 생략,
+  컬럼 배열에서는 NaN / None)
+- 전체 payload 는 zlib 압축
+
+blob 형식: zlib( uint32 헤더 길이 | JSON 헤더 | 컬럼별 [존재 비트맵] 값 바이트... )
+"""
+
+import json
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CODEC_VERSION = 1
+
+# (필드명, 인코딩) - delta: 델타 정수, num: 정수/실수, f4: float32, dict: 사전 문자열
+ColumnSchema = Tuple[Tuple[str, str], ...]
+
+MOUSE_SCHEMA: ColumnSchema = (
+    ("timestamp", "delta"),
+    ("x", "delta"),
+    ("y", "delta"),
+    ("speed", "f4"),
+    ("acceleration", "f4"),
+    ("curvature", "f4"),
+)
+KEYBOARD_SCHEMA: ColumnSchema = (
+    ("timestamp", "delta"),
+    ("key", "dict"),
+    ("duration", "num"),
+)
+CLICKSTREAM_SCHEMA: ColumnSchema = (
+    ("page", "dict"),
+    ("timestamp", "delta"),
+    ("duration", "num"),
+)
+
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+_HEADER_LEN = struct.Struct("<I")
+
+
+def _narrow_int(values: np.ndarray) -> np.ndarray:
+    """값 범위에 맞는 가장 작은 부호 있는 정수 타입으로 변환"""
+    if values.size == 0:
+        return values.astype(np.int8)
+    lo, hi = int(values.min()), int(values.max())
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _float32_exact(value: float) -> bool:
+    """float32 최단 표기로 복원했을 때 원래 값과 같은지"""
+    return float(f"{np.float32(value):.7g}") == value
+
+
+def _encode_column(values: List[Any], kind: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """존재하는 값만으로 컬럼 배열 생성 → (배열, 헤더 메타)"""
+    if kind == "dict":
+        raw = [str(v) for v in values]
+        vocabulary = list(dict.fromkeys(raw))
+        index = {value: i for i, value in enumerate(vocabulary)}
+        data = _narrow_int(np.fromiter((index[v] for v in raw), np.int64, len(raw)))
+        return data, {"kind": kind, "vocabulary": vocabulary}
+
+    integral = all(isinstance(v, int) and not isinstance(v, bool) for v in values)
+    if kind == "delta" and integral:
+        data = np.fromiter(values, np.int64, len(values))
+        if data.size:
+            data = np.diff(data, prepend=np.int64(0))
+        return _narrow_int(data), {"kind": kind}
+    if kind == "num" and integral:
+        return _narrow_int(np.fromiter(values, np.int64, len(values))), {"kind": kind}
+    if kind == "f4" and all(_float32_exact(float(v)) for v in values):
+        return np.fromiter(values, np.float32, len(values)), {"kind": kind}
+
+    # 소수 값이 있는 정수 컬럼 / float32 로 표현할 수 없는 값 → 무손실 float64
+    return np.fromiter(values, np.float64, len(values)), {"kind": "num"}
+
+
+def encode_events(
+    events: Sequence[Dict[str, Any]], schema: ColumnSchema, level: int = 6
+) -> bytes:
+    """
+    이벤트 목록 → 압축 blob
+
+    Args:
+        events: 이벤트 dict 목록 (누락/None 필드는 존재 비트맵에 기록)
+        schema: 컬럼 스키마
+        level: zlib 압축 레벨
+
+    Returns:
+        bytes: 압축 blob
+    """
+    columns = []
+    chunks = []
+
+    for name, kind in schema:
+        raw = [e.get(name) for e in events]
+        present = np.fromiter((v is not None for v in raw), bool, len(raw))
+        data, meta = _encode_column([v for v in raw if v is not None], kind)
+        meta["name"] = name
+
+        if not present.all():
+            mask = np.packbits(present)
+            meta["mask_nbytes"] = mask.nbytes
+            chunks.append(mask.tobytes())
+
+        meta["dtype"] = data.dtype.str
+        meta["nbytes"] = data.nbytes
+        columns.append(meta)
+        chunks.append(data.tobytes())
+
+    header = json.dumps(
+        {"v": CODEC_VERSION, "n": len(events), "columns": columns},
+        separators=(",", ":"),
+    ).encode()
+    payload = b"".join([_HEADER_LEN.pack(len(header)), header, *chunks])
+    return zlib.compress(payload, level)
+
+
+def _decode(
+    blob: bytes,
+) -> Tuple[int, Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]]]:
+    """압축 blob → (이벤트 수, {필드명: (존재하는 값 배열, 존재 마스크 또는 None)})"""
+    payload = zlib.decompress(blob)
+    (header_len,) = _HEADER_LEN.unpack_from(payload)
+    offset = _HEADER_LEN.size
+    header = json.loads(payload[offset : offset + header_len])
+    offset += header_len
+
+    if header["v"] != CODEC_VERSION:
+        raise ValueError(f"Unsupported telemetry codec version: {header['v']}")
+
+    count = header["n"]
+    columns: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]] = {}
+    for meta in header["columns"]:
+        present = None
+        if "mask_nbytes" in meta:
+            mask = np.frombuffer(
+                payload, dtype=np.uint8, count=meta["mask_nbytes"], offset=offset
+            )
+            present = np.unpackbits(mask, count=count).astype(bool)
+            offset += meta["mask_nbytes"]
+
+        dtype = np.dtype(meta["dtype"])
+        data = np.frombuffer(
+            payload, dtype=dtype, count=meta["nbytes"] // dtype.itemsize, offset=offset
+        )
+        offset += meta["nbytes"]
+
+        if meta["kind"] == "delta":
+            data = np.cumsum(data, dtype=np.int64)
+        elif meta["kind"] == "dict":
+            data = np.asarray(meta["vocabulary"], dtype=object)[data]
+        columns[meta["name"]] = (data, present)
+
+    return count, columns
+
+
+def decode_columns(blob: bytes) -> Dict[str, np.ndarray]:
+    """
+    압축 blob → 컬럼 배열 (오프라인 학습 등 벡터 연산용)
+
+    사전 인코딩 컬럼은 문자열 object 배열로 복원한다. 누락 값이 있는 숫자
+    컬럼은 float64 (누락 = NaN), 문자열 컬럼은 None 으로 채운다.
+    """
+    count, decoded = _decode(blob)
+    columns: Dict[str, np.ndarray] = {}
+    for name, (data, present) in decoded.items():
+        if present is not None:
+            if data.dtype == object:
+                full = np.full(count, None, dtype=object)
+            else:
+                full = np.full(count, np.nan, dtype=np.float64)
+            full[present] = data
+            data = full
+        columns[name] = data
+    return columns
+
+
+def decode_events(blob: bytes) -> List[Dict[str, Any]]:
+    """압축 blob → 이벤트 dict 목록 (원본 API 형식, 누락 필드는 생략)"""
+    count, decoded = _decode(blob)
+    events: List[Dict[str, Any]] = [{} for _ in range(count)]
+    for name, (data, present) in decoded.items():
+        if data.dtype == np.float32:
+            # float32 최단 표기로 복원 (1234.57 → 1234.5699462890625 방지)
+            values = [float(f"{v:.7g}") for v in data.tolist()]
+        else:
+            values = data.tolist()
+        rows = range(count) if present is None else np.flatnonzero(present).tolist()
+        for row, value in zip(rows, values):
+            events[row][name] = value
+    return events
@@ -8,11 +8,35 @@ import pytest
 from datetime import datetime, timedelta
 
 
+@pytest.fixture
+def fake_reevaluation(monkeypatch):
+    """DB 없이 재채점 실행 결과를 대체"""
+    calls = []
+
+    async def _run_reevaluation(cutoff_time, run_id=None):
+        calls.append((cutoff_time, run_id))
+        return {
+            "success": True,
+            "run_id": run_id or "00000000-0000-0000-0000-000000000001",
+            "evaluated_count": 0,
+            "changed_count": 0,
+            "high_risk_count": 0,
+            "false_positive_count": 0,
+            "throughput_per_sec": 0.0,
+            "summary": {},
+        }
+
+    monkeypatch.setattr(
+        "src.tasks.batch_evaluation._run_reevaluation", _run_reevaluation
+    )
+    return calls
+
+
 @pytest.mark.integration
 class TestFDSBatchEvaluation:
     """FDS 배치 평가 Celery 작업 테스트"""
 
-    def test_batch_evaluate_transactions_task(self):
+    def test_batch_evaluate_transactions_task(self, fake_reevaluation):
         """지난 24시간 거래 배치 재평가 작업 테스트"""
         from src.tasks.batch_evaluation import batch_evaluate_transactions
 
@@ -25,7 +49,7 @@ class TestFDSBatchEvaluation:
         assert result.result["hours_ago"] == 24
         assert "cutoff_time" in result.result
 
-    def test_batch_evaluate_custom_timeframe(self):
+    def test_batch_evaluate_custom_timeframe(self, fake_reevaluation):
         """커스텀 시간 범위 배치 평가 테스트"""
         from src.tasks.batch_evaluation import batch_evaluate_transactions
 
@@ -35,6 +59,19 @@ class TestFDSBatchEvaluation:
         # 검증
         assert result.successful()
         assert result.result["hours_ago"] == 48
+        ((cutoff_time, _),) = fake_reevaluation
+        assert datetime.now() - cutoff_time >= timedelta(hours=48)
+
+    def test_batch_evaluate_resumes_run(self, fake_reevaluation):
+        """중단된 재채점 실행 재개 테스트"""
+        from src.tasks.batch_evaluation import batch_evaluate_transactions
+
+        run_id = "00000000-0000-0000-0000-0000000000aa"
+        result = batch_evaluate_transactions.apply(kwargs={"run_id": run_id})
+
+        assert result.successful()
+        assert result.result["run_id"] == run_id
+        assert fake_reevaluation[0][1] == run_id
 
 
 @pytest.mark.integration
@@ -64,7 +101,6 @@ class TestFDSCeleryQueueRouting:
 
     def test_batch_task_routed_to_fds_batch_queue(self):
         """배치 평가 작업이 fds_batch 큐로 라우팅되는지 테스트"""
-        from src.tasks.batch_evaluation import batch_evaluate_transactions
         import sys
 
         sys.path.insert(0, "..")
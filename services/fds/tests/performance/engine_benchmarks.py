@@ -0,0 +1,677 @@
+"""
+FDS 엔진 인프로세스 마이크로벤치마크
+
+scripts/performance_benchmark.py 는 HTTP 엔드포인트를 호출하므로 전체 스택이 필요하다.
+이 모듈은 엔진을 프로세스 안에서 직접 호출해 호출당 지연 시간 백분위와 메모리
+할당량을 측정하고, JSON 기준선과 비교해 회귀를 판정한다.
+
+로컬 대체 구성:
+- Redis: fakeredis (설치된 경우), 없으면 인메모리 RedisSnapshot
+- DB: SQLite 인메모리 (--database-url 로 임시 Postgres 지정 가능)
+- GeoIP/ASN: mmdb_fixture 로 생성한 로컬 .mmdb
+- ML: 합성 데이터로 학습한 IsolationForest (pickle)
+- TOR 목록/DNS PTR 조회: 외부 네트워크 호출이므로 로컬 값으로 고정
+
+**실행 방법**:
+    cd services/fds
+    python tests/performance/engine_benchmarks.py
+    python tests/performance/engine_benchmarks.py --only ml_engine,fraud_rule_engine
+    python tests/performance/engine_benchmarks.py --latency-threshold 0.1 --fail-on-regression
+
+결과는 .benchmarks/engines/ 에 실행 시각별 파일과 latest.json 으로 저장되며,
+기본적으로 직전 실행(latest.json)을 기준선으로 비교한다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import pickle
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+# 프로젝트 루트를 Python path에 추가 (스크립트로 실행하는 경우)
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# ruff: noqa: E402
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sqlalchemy import UUID as SQL_UUID, MetaData, Uuid, delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from mmdb_fixture import asn_record, city_record, write_mmdb
+from src.cache.blacklist import (
+    BlacklistEntry,
+    BlacklistManager,
+    BlacklistReason,
+    BlacklistType,
+)
+from src.data.loaders import (
+    get_disposable_email_domains,
+    get_freight_forwarders,
+    get_test_cards,
+)
+from src.engines.behavior_analysis_engine import BehaviorAnalysisEngine
+from src.engines.fraud_rule_engine import FraudRuleEngine, TransactionData
+from src.engines.integrated_evaluation_engine import IntegratedEvaluationEngine
+from src.engines.ml_engine import MLEngine
+from src.engines.network_analysis_engine import NetworkAnalysisEngine
+from src.engines.rule_engine import RuleEngine, TransactionContext
+from src.models.detection_rule import DetectionRule, RuleType
+from src.models.schemas import FDSEvaluationRequest
+from src.services.rescore_worker import RedisSnapshot
+
+DEFAULT_RESULTS_DIR = project_root / ".benchmarks" / "engines"
+
+# 네트워크 픽스처 (문서용 예약 대역, RFC 5737)
+DOMESTIC_IP = "203.0.113.10"
+HOSTING_IP = "198.51.100.20"
+BLACKLISTED_IP = "192.0.2.66"
+TOR_EXIT_IP = "192.0.2.1"
+
+Call = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 1건의 측정 결과 (지연 시간 단위: µs, 할당 단위: bytes)"""
+
+    name: str
+    iterations: int
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    mean_us: float
+    min_us: float
+    max_us: float
+    alloc_peak_bytes: int
+    alloc_retained_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Regression:
+    """기준선 대비 회귀 항목"""
+
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change_ratio(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.benchmark}.{self.metric}: {self.baseline:.1f} -> "
+            f"{self.current:.1f} (+{self.change_ratio:.1%})"
+        )
+
+
+def _percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위"""
+    index = max(0, math.ceil(q * len(sorted_samples)) - 1)
+    return sorted_samples[min(index, len(sorted_samples) - 1)]
+
+
+async def measure(
+    name: str,
+    call: Call,
+    iterations: int = 500,
+    warmup: int = 50,
+    alloc_iterations: int = 50,
+) -> BenchmarkResult:
+    """
+    호출당 지연 시간과 할당량 측정
+
+    tracemalloc 은 할당마다 오버헤드가 크므로 지연 시간 측정과 분리된 별도
+    패스에서 호출당 최대 할당량(peak)과 호출 후에도 남는 증가분(retained)을 잰다.
+    """
+    for _ in range(warmup):
+        await call()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await call()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    samples.sort()
+
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        start_current, _ = tracemalloc.get_traced_memory()
+        for _ in range(alloc_iterations):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await call()
+            current, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        retained = current - start_current if alloc_iterations else 0
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        p50_us=round(_percentile(samples, 0.50), 2),
+        p95_us=round(_percentile(samples, 0.95), 2),
+        p99_us=round(_percentile(samples, 0.99), 2),
+        mean_us=round(sum(samples) / len(samples), 2),
+        min_us=round(samples[0], 2),
+        max_us=round(samples[-1], 2),
+        alloc_peak_bytes=peak_total // max(alloc_iterations, 1),
+        alloc_retained_bytes=max(retained, 0) // max(alloc_iterations, 1),
+    )
+
+
+def create_redis() -> Any:
+    """fakeredis 가 있으면 사용하고, 없으면 저장소의 인메모리 RedisSnapshot 사용"""
+    try:
+        from fakeredis import aioredis as fake_aioredis
+    except ImportError:
+        return RedisSnapshot()
+    return fake_aioredis.FakeRedis()
+
+
+async def _no_ptr_record(ip_address: str) -> Optional[str]:
+    """DNS PTR 조회 대체 (외부 DNS 의존성 제거)"""
+    return None
+
+
+def _pin_network_lookups(engine: Optional[NetworkAnalysisEngine]) -> None:
+    """TOR 목록 다운로드와 DNS 조회를 로컬 값으로 고정"""
+    if engine is None:
+        return
+    engine.tor_exit_nodes = {TOR_EXIT_IP}
+    engine.tor_list_last_updated = datetime.utcnow()
+    engine.get_dns_ptr_record = _no_ptr_record
+
+
+def _behavior_events() -> Dict[str, List[Dict[str, Any]]]:
+    """결정적 마우스/키보드/클릭스트림 이벤트"""
+    rng = np.random.default_rng(7)
+    base = 1_700_000_000_000
+    mouse, x, y, t = [], 100.0, 100.0, base
+    for _ in range(200):
+        t += int(rng.integers(8, 40))
+        x += float(rng.normal(4, 3))
+        y += float(rng.normal(2, 3))
+        mouse.append({"timestamp": t, "x": round(x, 1), "y": round(y, 1)})
+
+    keyboard, t = [], base
+    for i in range(60):
+        t += int(rng.integers(80, 260))
+        keyboard.append(
+            {
+                "timestamp": t,
+                "duration": int(rng.integers(60, 140)),
+                "key": "abcdef"[i % 6],
+            }
+        )
+
+    clickstream, t = [], base
+    for _ in range(20):
+        t += int(rng.integers(1500, 9000))
+        clickstream.append({"timestamp": t, "duration": int(rng.integers(1000, 8000))})
+
+    return {
+        "mouse_movements": mouse,
+        "keyboard_events": keyboard,
+        "clickstream": clickstream,
+    }
+
+
+def _detection_rules() -> List[DetectionRule]:
+    def rule(
+        rule_type: RuleType, condition: Dict[str, Any], weight: int, priority: int
+    ):
+        return DetectionRule(
+            id=uuid4(),
+            name=f"bench-{rule_type.value}-{priority}",
+            rule_type=rule_type,
+            condition=condition,
+            risk_score_weight=weight,
+            is_active=True,
+            priority=priority,
+            times_triggered=0,
+        )
+
+    return [
+        rule(RuleType.VELOCITY, {"window_seconds": 300, "max_transactions": 3}, 40, 90),
+        rule(
+            RuleType.THRESHOLD,
+            {"field": "amount", "operator": "gt", "value": 1000000},
+            30,
+            80,
+        ),
+        rule(RuleType.BLACKLIST, {"type": "ip", "values": [BLACKLISTED_IP]}, 100, 70),
+        rule(RuleType.TIME_PATTERN, {"start_hour": 0, "end_hour": 5}, 15, 60),
+        rule(RuleType.DEVICE_PATTERN, {"max_devices": 3}, 20, 50),
+    ]
+
+
+class EngineBenchmarks:
+    """엔진 인스턴스와 입력을 준비하고 벤치마크별 호출 함수를 제공"""
+
+    def __init__(
+        self, workdir: Path, database_url: str = "sqlite+aiosqlite:///:memory:"
+    ):
+        self.workdir = Path(workdir)
+        self.database_url = database_url
+        self.redis = create_redis()
+        self._db_engine = None
+        self._session = None
+        self._rule_ids: List[Any] = []
+
+    async def setup(self) -> None:
+        self.geoip_db_path = str(
+            write_mmdb(
+                self.workdir / "GeoLite2-City.mmdb",
+                "GeoLite2-City",
+                {
+                    "203.0.113.0/24": city_record("KR", "Seoul", 37.5665, 126.978),
+                    "198.51.100.0/24": city_record("US", "Ashburn", 39.0438, -77.4874),
+                    "192.0.2.0/24": city_record("NL", "Amsterdam", 52.3676, 4.9041),
+                },
+            )
+        )
+        self.asn_db_path = str(
+            write_mmdb(
+                self.workdir / "GeoLite2-ASN.mmdb",
+                "GeoLite2-ASN",
+                {
+                    "203.0.113.0/24": asn_record(64500, "Example Telecom"),
+                    "198.51.100.0/24": asn_record(16509, "Amazon.com, Inc."),
+                    "192.0.2.0/24": asn_record(64501, "Example Hosting"),
+                },
+            )
+        )
+
+        # ML 모델 (특징 15개)
+        rng = np.random.default_rng(0)
+        model = IsolationForest(n_estimators=100, random_state=0)
+        model.fit(rng.normal(size=(512, 15)))
+        self.ml_model_path = str(self.workdir / "isolation_forest.pkl")
+        with open(self.ml_model_path, "wb") as f:
+            pickle.dump(model, f)
+
+        # 블랙리스트 시드
+        self.blacklist = BlacklistManager(self.redis)
+        for entry_type, value in (
+            (BlacklistType.IP, BLACKLISTED_IP),
+            (BlacklistType.EMAIL_DOMAIN, "mailinator.com"),
+            (BlacklistType.CARD_BIN, "400000"),
+        ):
+            entry = BlacklistEntry(
+                id=str(uuid4()),
+                entry_type=entry_type,
+                value=value,
+                reason=BlacklistReason.FRAUD_DETECTED,
+                added_by="benchmark",
+                added_at=datetime.utcnow(),
+            )
+            await self.redis.set(
+                self.blacklist._get_key(entry_type, value), json.dumps(entry.to_dict())
+            )
+
+        # 룰 엔진 DB (SQLite 는 네이티브 UUID 가 없으므로 Uuid 로 바꾼 사본 테이블 생성)
+        self._db_engine = create_async_engine(self.database_url)
+        metadata = MetaData()
+        for column in DetectionRule.__table__.to_metadata(metadata).columns:
+            if isinstance(column.type, SQL_UUID):
+                column.type = Uuid()
+        async with self._db_engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        self._session = async_sessionmaker(self._db_engine, expire_on_commit=False)()
+        rules = _detection_rules()
+        self._session.add_all(rules)
+        await self._session.commit()
+        self._rule_ids = [rule.id for rule in rules]
+
+        self.fraud_rule_engine = FraudRuleEngine(
+            db=None,
+            redis=self.redis,
+            test_cards=get_test_cards(),
+            freight_forwarders=get_freight_forwarders(),
+            disposable_email_domains=get_disposable_email_domains(),
+        )
+        self.rule_engine = RuleEngine(db=self._session, redis=self.redis)
+        self.network_engine = NetworkAnalysisEngine(
+            geoip_db_path=self.geoip_db_path, asn_db_path=self.asn_db_path
+        )
+        _pin_network_lookups(self.network_engine)
+        self.behavior_engine = BehaviorAnalysisEngine()
+        self.ml_engine = MLEngine(model_path=self.ml_model_path)
+        self.integrated_engine = IntegratedEvaluationEngine(
+            db=None,
+            redis=self.redis,
+            ml_model_path=self.ml_model_path,
+            geoip_db_path=self.geoip_db_path,
+            asn_db_path=self.asn_db_path,
+        )
+        _pin_network_lookups(self.integrated_engine.network_analysis_engine)
+
+        self._build_inputs()
+
+    def _build_inputs(self) -> None:
+        user_id = uuid4()
+        self.transaction = TransactionData(
+            transaction_id=uuid4(),
+            user_id=user_id,
+            user_email="buyer@example.com",
+            card_number="5412345678901234",
+            card_bin="541234",
+            card_last4="1234",
+            amount=Decimal("189000"),
+            currency="KRW",
+            ip_address=DOMESTIC_IP,
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            shipping_address="서울시 강남구 테헤란로 123",
+            shipping_city="Seoul",
+            shipping_country="KR",
+            billing_country="KR",
+            device_id="device-bench",
+        )
+        self.context = TransactionContext(
+            transaction_id=uuid4(),
+            user_id=user_id,
+            order_id=uuid4(),
+            amount=Decimal("189000"),
+            ip_address=DOMESTIC_IP,
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            device_type="desktop",
+            geolocation={"country": "KR", "city": "Seoul"},
+            payment_info={"card_bin": "541234"},
+        )
+        self.ml_input = {
+            "transaction_id": str(uuid4()),
+            "user_id": str(user_id),
+            "amount": 189000,
+            "ip_address": DOMESTIC_IP,
+            "device_type": "desktop",
+            "user_behavior": {
+                "recent_transaction_count": 2,
+                "avg_transaction_amount": 120000,
+                "account_age_days": 420,
+                "login_count_30d": 18,
+            },
+        }
+        self.behavior_input = _behavior_events()
+        self.request = FDSEvaluationRequest(
+            transaction_id=uuid4(),
+            user_id=user_id,
+            order_id=uuid4(),
+            amount=Decimal("189000"),
+            ip_address=DOMESTIC_IP,
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            device_fingerprint={"device_type": "desktop"},
+            shipping_info={
+                "name": "홍길동",
+                "address": "서울시 강남구 테헤란로 123",
+                "phone": "010-1234-5678",
+            },
+            payment_info={
+                "method": "credit_card",
+                "card_bin": "541234",
+                "card_last_four": "1234",
+            },
+            timestamp=datetime.utcnow(),
+        )
+
+    def cases(self) -> Dict[str, Call]:
+        """벤치마크 이름 → 인자 없는 비동기 호출"""
+
+        async def behavior_analyze():
+            return self.behavior_engine.analyze(**self.behavior_input)
+
+        return {
+            "fraud_rule_engine.evaluate": lambda: self.fraud_rule_engine.evaluate(
+                self.transaction
+            ),
+            "rule_engine.evaluate_transaction": lambda: self.rule_engine.evaluate_transaction(
+                self.context
+            ),
+            "network_analysis_engine.analyze_network": lambda: self.network_engine.analyze_network(
+                HOSTING_IP, billing_country="KR"
+            ),
+            "behavior_analysis_engine.analyze": behavior_analyze,
+            "ml_engine.evaluate": lambda: self.ml_engine.evaluate(self.ml_input),
+            "blacklist_manager.is_blacklisted": lambda: self.blacklist.is_blacklisted(
+                ip=DOMESTIC_IP,
+                email="buyer@mailinator.com",
+                card_bin="541234",
+                user_id=str(self.context.user_id),
+            ),
+            "integrated_evaluation_engine.evaluate": lambda: self.integrated_engine.evaluate(
+                self.request
+            ),
+        }
+
+    async def close(self) -> None:
+        for engine in (
+            self.network_engine,
+            self.integrated_engine.network_analysis_engine,
+        ):
+            if engine is not None:
+                engine.close()
+        if self._session is not None:
+            # 임시 Postgres 를 지정한 경우 시드한 룰만 제거
+            await self._session.execute(
+                delete(DetectionRule).where(DetectionRule.id.in_(self._rule_ids))
+            )
+            await self._session.commit()
+            await self._session.close()
+        if self._db_engine is not None:
+            await self._db_engine.dispose()
+
+
+async def run_suite(
+    iterations: int = 500,
+    warmup: int = 50,
+    alloc_iterations: int = 50,
+    only: Optional[Sequence[str]] = None,
+    database_url: str = "sqlite+aiosqlite:///:memory:",
+) -> Dict[str, Any]:
+    """
+    전체(또는 선택한) 벤치마크 실행
+
+    Args:
+        only: 실행할 벤치마크 이름 접두사 목록 (예: ["ml_engine"])
+
+    Returns:
+        Dict: {"meta": {...}, "benchmarks": {이름: BenchmarkResult.to_dict()}}
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="fds-bench-") as workdir:
+        suite = EngineBenchmarks(Path(workdir), database_url=database_url)
+        # 측정 중 엔진 로그(경고/에러 포함)가 지연 시간에 섞이지 않도록 비활성화
+        logging.disable(logging.CRITICAL)
+        try:
+            await suite.setup()
+            for name, call in suite.cases().items():
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                result = await measure(name, call, iterations, warmup, alloc_iterations)
+                results[name] = result.to_dict()
+        finally:
+            await suite.close()
+            logging.disable(logging.NOTSET)
+
+    return {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "redis_backend": type(suite.redis).__module__,
+            "iterations": iterations,
+            "warmup": warmup,
+            "alloc_iterations": alloc_iterations,
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    latency_threshold: float = 0.20,
+    alloc_threshold: float = 0.25,
+    min_latency_delta_us: float = 5.0,
+    min_alloc_delta_bytes: int = 1024,
+) -> List[Regression]:
+    """
+    기준선 대비 회귀 판정
+
+    비율 임계값을 넘고 절대 증가량도 하한(노이즈 바닥)을 넘어야 회귀로 본다.
+    양쪽 실행에 모두 있는 벤치마크만 비교한다.
+    """
+    regressions = []
+    for name, now in current.get("benchmarks", {}).items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if not before:
+            continue
+        for metric in ("p50_us", "p95_us"):
+            if (
+                now[metric] > before[metric] * (1 + latency_threshold)
+                and now[metric] - before[metric] > min_latency_delta_us
+            ):
+                regressions.append(
+                    Regression(name, metric, before[metric], now[metric])
+                )
+        metric = "alloc_peak_bytes"
+        if (
+            now[metric] > before[metric] * (1 + alloc_threshold)
+            and now[metric] - before[metric] > min_alloc_delta_bytes
+        ):
+            regressions.append(Regression(name, metric, before[metric], now[metric]))
+    return regressions
+
+
+def save_results(
+    results: Dict[str, Any], results_dir: Path = DEFAULT_RESULTS_DIR
+) -> Path:
+    """
+    실행 시각별 파일과 latest.json 저장
+
+    --only 로 일부만 실행한 경우에도 나머지 벤치마크의 기준선이 사라지지 않도록
+    latest.json 은 이전 결과에 이번 결과를 덮어써 병합한다.
+    """
+    results_dir = Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = results_dir / f"{stamp}.json"
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    latest_path = results_dir / "latest.json"
+    previous = load_results(latest_path) or {}
+    latest = {
+        "meta": results["meta"],
+        "benchmarks": {**previous.get("benchmarks", {}), **results["benchmarks"]},
+    }
+    latest_path.write_text(
+        json.dumps(latest, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    return path
+
+
+def load_results(path: Path) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def format_report(
+    results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None
+) -> str:
+    lines = [
+        f"{'benchmark':<42}{'p50(us)':>10}{'p95(us)':>10}{'p99(us)':>10}"
+        f"{'peak(B)':>10}{'retained(B)':>13}{'p50 vs base':>13}"
+    ]
+    for name, r in results["benchmarks"].items():
+        before = (baseline or {}).get("benchmarks", {}).get(name)
+        delta = f"{r['p50_us'] / before['p50_us'] - 1:+.1%}" if before else "-"
+        lines.append(
+            f"{name:<42}{r['p50_us']:>10.1f}{r['p95_us']:>10.1f}{r['p99_us']:>10.1f}"
+            f"{r['alloc_peak_bytes']:>10}{r['alloc_retained_bytes']:>13}{delta:>13}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FDS 엔진 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--alloc-iterations", type=int, default=50)
+    parser.add_argument("--only", help="쉼표로 구분한 벤치마크 이름 접두사")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite:///:memory:",
+        help="RuleEngine 용 DB (기본: SQLite 인메모리, 임시 Postgres 지정 가능)",
+    )
+    parser.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR)
+    parser.add_argument(
+        "--baseline", type=Path, help="비교할 기준선 JSON (기본: results-dir/latest.json)"
+    )
+    parser.add_argument("--latency-threshold", type=float, default=0.20)
+    parser.add_argument("--alloc-threshold", type=float, default=0.25)
+    parser.add_argument("--min-latency-delta-us", type=float, default=5.0)
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="회귀 발견 시 종료 코드 1"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline or args.results_dir / "latest.json")
+    results = asyncio.run(
+        run_suite(
+            iterations=args.iterations,
+            warmup=args.warmup,
+            alloc_iterations=args.alloc_iterations,
+            only=args.only.split(",") if args.only else None,
+            database_url=args.database_url,
+        )
+    )
+
+    print(format_report(results, baseline))
+    if not args.no_save:
+        print(f"\n[SAVED] {save_results(results, args.results_dir)}")
+
+    if baseline is None:
+        print("[INFO] 기준선 없음 - 이번 실행 결과가 다음 비교의 기준선이 됩니다")
+        return 0
+
+    regressions = compare(
+        baseline,
+        results,
+        latency_threshold=args.latency_threshold,
+        alloc_threshold=args.alloc_threshold,
+        min_latency_delta_us=args.min_latency_delta_us,
+    )
+    if not regressions:
+        print("[OK] 기준선 대비 회귀 없음")
+        return 0
+
+    print(f"[REGRESSION] {len(regressions)}건")
+    for regression in regressions:
+        print(f"  - {regression}")
+    return 1 if args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+엔진 마이크로벤치마크 스위트 검증
+
+- 모든 엔진 벤치마크가 로컬 대체 구성만으로 실행됨
+- 기준선 비교: 임계값과 노이즈 바닥을 모두 넘어야 회귀
+- mmdb 픽스처를 geoip2 로 읽을 수 있음
+"""
+
+import geoip2.database
+import pytest
+
+from engine_benchmarks import compare, load_results, run_suite, save_results
+from mmdb_fixture import asn_record, city_record, write_mmdb
+
+
+def _results(**benchmarks):
+    return {
+        "meta": {},
+        "benchmarks": {
+            name: {"p50_us": p50, "p95_us": p95, "alloc_peak_bytes": peak}
+            for name, (p50, p95, peak) in benchmarks.items()
+        },
+    }
+
+
+@pytest.mark.performance
+def test_mmdb_fixture_is_readable(tmp_path):
+    city = write_mmdb(
+        tmp_path / "city.mmdb",
+        "GeoLite2-City",
+        {"203.0.113.0/24": city_record("KR", "Seoul", 37.5665, 126.978)},
+    )
+    asn = write_mmdb(
+        tmp_path / "asn.mmdb",
+        "GeoLite2-ASN",
+        {"198.51.100.0/24": asn_record(16509, "Amazon.com, Inc.")},
+    )
+
+    with geoip2.database.Reader(str(city)) as reader:
+        response = reader.city("203.0.113.77")
+        assert (response.country.iso_code, response.city.name) == ("KR", "Seoul")
+    with geoip2.database.Reader(str(asn)) as reader:
+        assert reader.asn("198.51.100.1").autonomous_system_number == 16509
+
+
+@pytest.mark.performance
+async def test_suite_runs_every_engine_in_process():
+    results = await run_suite(iterations=5, warmup=1, alloc_iterations=2)
+
+    assert set(results["benchmarks"]) == {
+        "fraud_rule_engine.evaluate",
+        "rule_engine.evaluate_transaction",
+        "network_analysis_engine.analyze_network",
+        "behavior_analysis_engine.analyze",
+        "ml_engine.evaluate",
+        "blacklist_manager.is_blacklisted",
+        "integrated_evaluation_engine.evaluate",
+    }
+    for result in results["benchmarks"].values():
+        assert (
+            0
+            < result["min_us"]
+            <= result["p50_us"]
+            <= result["p99_us"]
+            <= result["max_us"]
+        )
+        assert result["alloc_peak_bytes"] > 0
+
+
+@pytest.mark.performance
+def test_compare_flags_only_regressions_above_threshold_and_noise_floor():
+    baseline = _results(
+        a=(100.0, 150.0, 10_000), b=(2.0, 3.0, 500), c=(50.0, 60.0, 4_000)
+    )
+    current = _results(
+        a=(130.0, 160.0, 20_000),  # p50 +30%, 할당 2배
+        b=(4.0, 6.0, 1_200),  # 비율은 크지만 절대 증가량이 노이즈 바닥 이하
+        c=(45.0, 60.0, 4_000),
+        d=(999.0, 999.0, 99_999),  # 기준선에 없는 벤치마크는 비교하지 않음
+    )
+
+    regressions = compare(
+        baseline, current, latency_threshold=0.2, alloc_threshold=0.25
+    )
+
+    assert [(r.benchmark, r.metric) for r in regressions] == [
+        ("a", "p50_us"),
+        ("a", "alloc_peak_bytes"),
+    ]
+    assert regressions[0].change_ratio == pytest.approx(0.3)
+    assert compare(baseline, current, latency_threshold=0.5, alloc_threshold=1.5) == []
+
+
+@pytest.mark.performance
+def test_partial_run_keeps_other_baselines(tmp_path):
+    save_results(_results(a=(100.0, 150.0, 10_000), b=(2.0, 3.0, 500)), tmp_path)
+    save_results(_results(a=(90.0, 140.0, 9_000)), tmp_path)
+
+    latest = load_results(tmp_path / "latest.json")
+
+    assert latest["benchmarks"]["a"]["p50_us"] == 90.0
+    assert latest["benchmarks"]["b"]["p50_us"] == 2.0
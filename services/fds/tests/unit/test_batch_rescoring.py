@@ -0,0 +1,278 @@
+"""
+과거 거래 재채점 유닛 테스트
+
+- Redis 스냅샷: 룰이 쓰는 값은 스냅샷에만 반영
+- 워커 청크 분할과 무관한 결과 (상태/현재 시각 의존 룰 제외)
+- 병렬 채점 결과/차이 기록/영향 요약 (후보 vs 현재 설정 기준 재채점)
+- 저장된 상태 값/제외 룰 점수는 변경으로 집계되지 않음
+- 체크포인트에서 재개 시 중복 없이 이어서 처리
+- 차이 INSERT 는 바인드 파라미터 한도 안으로 분할
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import UUID as SQL_UUID, MetaData, Uuid, event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import src.services.batch_service as batch_service
+from src.models.rescore import RescoreRun, TransactionRescore
+from src.services.batch_service import BatchService
+from src.services.rescore_worker import (
+    RedisSnapshot,
+    RescoreConfig,
+    init_worker,
+    score_rows,
+)
+
+START = datetime(2025, 1, 1)
+
+
+def _rows(n: int):
+    rows = []
+    for i in range(n):
+        rows.append(
+            {
+                # 3건마다 300만원 이상 고액 (P9 룰 → 재채점 시 점수 상승)
+                "id": UUID(int=i + 1),
+                "user_id": uuid4(),
+                "amount": Decimal("3500000") if i % 3 == 0 else Decimal("12345"),
+                "ip_address": f"192.168.0.{i + 1}",
+                "user_agent": "Mozilla/5.0",
+                "device_type": "desktop",
+                "geolocation": {"country": "KR"},
+                "risk_score": 10,
+                "evaluation_status": "approved",
+                "created_at": START + timedelta(minutes=i),
+            }
+        )
+    return rows
+
+
+class _FlagAmount:
+    """특정 금액만 이상으로 판정하는 후보 모델 (predict 만 제공)"""
+
+    def __init__(self, amount: float):
+        self.amount = amount
+
+    def predict(self, feature_vector):
+        return [1 if row[0] == self.amount else 0 for row in feature_vector]
+
+
+@pytest.fixture
+def candidate_model_path(tmp_path):
+    # 고액이 아닌 거래를 이상으로 판정 → 재채점 시 approved -> blocked
+    path = tmp_path / "candidate.pkl"
+    path.write_bytes(pickle.dumps(_FlagAmount(12345.0)))
+    return str(path)
+
+
+class _InMemoryBatchService(BatchService):
+    """transactions 조회만 메모리 목록으로 대체 (keyset 의미는 동일)"""
+
+    def __init__(self, db, rows, fail_after_pages=None, **kwargs):
+        super().__init__(db, executor_class=ThreadPoolExecutor, **kwargs)
+        self.rows = rows
+        self.pages = 0
+        self.fail_after_pages = fail_after_pages
+
+    async def _fetch_page(self, run):
+        if self.fail_after_pages is not None and self.pages >= self.fail_after_pages:
+            raise ConnectionError("db connection lost")
+        self.pages += 1
+        cursor = (run.last_created_at, run.last_transaction_id)
+        return [
+            r
+            for r in self.rows
+            if run.last_created_at is None or (r["created_at"], r["id"]) > cursor
+        ][: self.page_size]
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    # SQLite 는 네이티브 UUID 가 없으므로 CHAR(32) 로 저장하는 사본 테이블 생성
+    metadata = MetaData()
+    for table in (RescoreRun.__table__, TransactionRescore.__table__):
+        for column in table.to_metadata(metadata).columns:
+            if isinstance(column.type, SQL_UUID):
+                column.type = Uuid()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.unit
+def test_worker_uses_snapshot_without_touching_live_state():
+    snapshot = RedisSnapshot(sets={"fraud_addresses": set()})
+    init_worker(RescoreConfig(snapshot=snapshot))
+
+    results = score_rows(_rows(3))
+
+    assert [r["transaction_id"] for r in results] == [
+        UUID(int=1),
+        UUID(int=2),
+        UUID(int=3),
+    ]
+    assert results[0]["new_decision"] == "blocked"
+    # 후보 모델이 없으면 기준 재채점과 같으므로 변경 없음 (저장 점수와 무관)
+    assert results[0]["old_decision"] == "blocked"
+    assert results[0]["decision_changed"] is False
+    assert results[0]["stored_decision"] == "approved"
+    assert results[1]["new_decision"] == "approved"
+    # 저장되지 않는 배송지 입력에 의존하는 룰(S5 등)은 재채점에서 제외
+    assert not any(
+        name.startswith("S5") for r in results for name in r["matched_rules"]
+    )
+    # 워커의 스냅샷 복사본만 갱신되고 원본 스냅샷은 그대로
+    assert snapshot.keys("ip_users:*") == []
+
+
+@pytest.mark.unit
+def test_results_do_not_depend_on_worker_chunking():
+    rows = _rows(8)
+    for row in rows:
+        row["ip_address"] = "203.0.113.7"  # 같은 IP 의 여러 사용자 (A4)
+    snapshot = RedisSnapshot(
+        strings={
+            f"last_ip:{rows[0]['user_id']}": b"198.51.100.1",  # A2
+            f"login_time:{rows[1]['user_id']}": b"0",  # A3 (현재 시각 기준)
+        }
+    )
+
+    init_worker(RescoreConfig(snapshot=snapshot))
+    single = score_rows(rows)
+    split = []
+    for chunk in (rows[:4], rows[4:]):
+        # 청크마다 새 워커 (스냅샷 복사본도 새로 시작)
+        init_worker(RescoreConfig(snapshot=snapshot))
+        split.extend(score_rows(chunk))
+
+    assert single == split
+    matched = {name.split(":", 1)[0] for r in single for name in r["matched_rules"]}
+    assert matched.isdisjoint({"A2", "A3", "A4"})
+
+
+@pytest.mark.unit
+async def test_rescoring_writes_diffs_and_resumes_from_checkpoint(
+    session_factory, candidate_model_path
+):
+    rows = _rows(25)
+
+    async with session_factory() as session:
+        service = _InMemoryBatchService(
+            session,
+            rows,
+            fail_after_pages=2,
+            ml_model_path=candidate_model_path,
+            workers=2,
+            page_size=10,
+            chunk_size=4,
+        )
+        with pytest.raises(ConnectionError):
+            await service.reevaluate_transactions(START)
+        run_id = (await session.execute(select(RescoreRun.run_id))).scalar_one()
+
+    async with session_factory() as session:
+        run = await session.get(RescoreRun, run_id)
+        assert run.processed_count == 20
+        assert run.status == "running"
+
+        service = _InMemoryBatchService(
+            session, rows, ml_model_path=candidate_model_path, workers=2, page_size=10
+        )
+        result = await service.reevaluate_transactions(START, run_id=run_id)
+
+    assert result["evaluated_count"] == 25
+    assert result["summary"]["evaluated"] == 25
+    # 후보 모델이 판정한 16건만 approved -> blocked, 고액 9건은 기준과 같음
+    assert result["high_risk_count"] == 16
+    assert result["summary"]["transitions"] == {"approved->blocked": 16}
+    assert result["changed_count"] == 16
+    # 고액 9건은 저장 점수(10)와 기준 재채점 결정이 다름 (재현 오차)
+    assert result["summary"]["baseline_mismatches"] == 9
+    assert result["throughput_per_sec"] > 0
+
+    async with session_factory() as session:
+        run = await session.get(RescoreRun, run_id)
+        diff_count = (
+            await session.execute(select(func.count()).select_from(TransactionRescore))
+        ).scalar_one()
+        changed = (
+            await session.execute(
+                select(func.count())
+                .select_from(TransactionRescore)
+                .where(TransactionRescore.decision_changed.is_(True))
+            )
+        ).scalar_one()
+
+    assert run.status == "completed"
+    assert run.last_transaction_id == UUID(int=25)
+    assert diff_count == result["changed_count"]
+    assert changed == sum(result["summary"]["transitions"].values())
+
+
+@pytest.mark.unit
+async def test_stored_status_and_excluded_rule_scores_are_not_changes(
+    session_factory,
+):
+    rows = _rows(6)
+    for row in rows:
+        if row["amount"] == Decimal("3500000"):
+            # 평가 API 는 차단 거래를 manual_review 로 저장
+            row["risk_score"], row["evaluation_status"] = 85, "manual_review"
+        else:
+            # 제외 룰(A3 등) 점수가 포함된 중위험 거래는 evaluating 으로 저장
+            row["risk_score"], row["evaluation_status"] = 45, "evaluating"
+
+    async with session_factory() as session:
+        service = _InMemoryBatchService(session, rows, workers=2, page_size=10)
+        result = await service.reevaluate_transactions(START)
+
+    assert result["changed_count"] == 0
+    assert result["summary"]["transitions"] == {}
+    # 제외 룰 점수가 빠진 중위험 4건만 기준 재채점 결정이 저장 결정과 다름
+    assert result["summary"]["baseline_mismatches"] == 4
+
+    async with session_factory() as session:
+        diff_count = (
+            await session.execute(select(func.count()).select_from(TransactionRescore))
+        ).scalar_one()
+    assert diff_count == 0
+
+
+@pytest.mark.unit
+async def test_diff_insert_is_split_under_bind_parameter_limit(
+    session_factory, candidate_model_path, monkeypatch
+):
+    columns = len(TransactionRescore.__table__.c)
+    # 문장당 3행까지 허용되는 한도
+    monkeypatch.setattr(batch_service, "MAX_BIND_PARAMS", columns * 3 + 1)
+    rows = _rows(12)
+
+    async with session_factory() as session:
+        params = []
+
+        @event.listens_for(session.bind.sync_engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO transaction_rescores"):
+                params.append(len(parameters))
+
+        service = _InMemoryBatchService(
+            session, rows, ml_model_path=candidate_model_path, page_size=12
+        )
+        result = await service.reevaluate_transactions(START)
+
+        diff_count = (
+            await session.execute(select(func.count()).select_from(TransactionRescore))
+        ).scalar_one()
+
+    # 한 페이지의 차이 8건 → 3 + 3 + 2 행
+    assert result["changed_count"] == 8
+    assert diff_count == 8
+    assert params == [columns * 3, columns * 3, columns * 2]
@@ -0,0 +1,97 @@
+"""
+BehaviorAnalysisEngine 유닛 테스트
+
+- structured array 입력과 dict 목록 입력의 결과 일치
+- 청크 증분 채점 결과가 전체 재분석 결과와 일치
+"""
+
+import random
+import statistics
+
+import pytest
+
+from src.engines.behavior_analysis_engine import (
+    BehaviorAnalysisEngine,
+    BehaviorSessionState,
+    keyboard_events_to_array,
+    mouse_events_to_array,
+)
+
+
+def _session(seed: int = 0):
+    rng = random.Random(seed)
+    mouse = [
+        {
+            "timestamp": i,
+            "x": i,
+            "y": i,
+            "speed": rng.uniform(0, 8000),
+            "acceleration": rng.uniform(-5, 5),
+            "curvature": rng.random() * 0.3,
+        }
+        for i in range(500)
+    ]
+    keyboard = [
+        {
+            "timestamp": i,
+            "key": rng.choice(["a", "b", "Backspace"]),
+            "duration": rng.randint(10, 200),
+        }
+        for i in range(120)
+    ]
+    clickstream = [
+        {"page": "/", "timestamp": i, "duration": rng.randint(100, 5000)}
+        for i in range(30)
+    ]
+    return mouse, keyboard, clickstream
+
+
+@pytest.mark.unit
+def test_vectorized_statistics_match_reference():
+    mouse, keyboard, _ = _session()
+    engine = BehaviorAnalysisEngine()
+
+    mouse_analysis = engine.analyze_mouse_movements(mouse_events_to_array(mouse))
+    keyboard_analysis = engine.analyze_keyboard_typing(keyboard)
+
+    speeds = [m["speed"] for m in mouse]
+    durations = [k["duration"] for k in keyboard]
+    assert mouse_analysis["avg_speed"] == round(statistics.mean(speeds), 2)
+    assert mouse_analysis["high_speed_ratio"] == round(
+        sum(s > engine.MOUSE_HIGH_SPEED_THRESHOLD for s in speeds) / len(speeds), 2
+    )
+    assert keyboard_analysis["typing_speed_stddev"] == round(
+        statistics.stdev(durations), 2
+    )
+    assert (
+        engine.analyze_keyboard_typing(keyboard_events_to_array(keyboard))
+        == keyboard_analysis
+    )
+
+
+@pytest.mark.unit
+def test_incremental_chunks_match_full_analysis():
+    mouse, keyboard, clickstream = _session(seed=1)
+    engine = BehaviorAnalysisEngine()
+    full = engine.analyze(mouse, keyboard, clickstream)
+
+    state = BehaviorSessionState()
+    for start in range(0, len(mouse), 64):
+        end = start + 64
+        result = engine.score_chunk(
+            state, mouse[start:end], keyboard[start:end], clickstream[start:end]
+        )
+        # 청크 사이에 상태를 직렬화/복원해도 동일
+        state = BehaviorSessionState.from_dict(state.to_dict())
+
+    assert result == full
+    assert state.mouse_total == len(mouse)
+
+
+@pytest.mark.unit
+def test_empty_session_is_scored_without_errors():
+    result = BehaviorAnalysisEngine().analyze([], [], [])
+
+    assert result["mouse_analysis"]["is_bot_like"] is True
+    assert result["clickstream_analysis"]["total_pages"] == 0
+    assert 0 <= result["bot_score"] <= 100
@@ -0,0 +1,151 @@
+"""
+행동 패턴 API 유닛 테스트
+
+- 같은 세션 청크가 동시에 도착해도 누적 통계 갱신이 유실되지 않음 (WATCH/MULTI)
+- 충돌이 계속되면 409
+- 분석 배열 범위를 넘는 타임스탬프/좌표는 요청 검증에서 거절
+- UUID 가 아닌 세션 ID 는 항상 같은 uuid5 로 변환
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from redis.exceptions import WatchError
+
+import src.api.behavior_pattern as behavior_pattern_api
+from src.api.behavior_pattern import (
+    MAX_TIMESTAMP_MS,
+    BehaviorChunkRequest,
+    MouseMovementInput,
+    score_behavior_chunk,
+    session_uuid,
+)
+from src.utils.cache_utils import CacheKeys, RedisCache
+
+
+class _FakeRedis:
+    """WATCH 이후 키가 바뀌면 EXEC 가 WatchError 를 내는 가짜 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.versions = {}
+        self.conflicts = 0
+        self.always_conflict = False
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.watched = {}
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def watch(self, key):
+        self.watched[key] = self.redis.versions.get(key, 0)
+
+    async def get(self, key):
+        value = self.redis.values.get(key)
+        # 다른 요청이 끼어들 수 있게 양보
+        await asyncio.sleep(0)
+        return value
+
+    def multi(self):
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        commands, watched = self.commands, self.watched
+        self.commands, self.watched = [], {}
+        changed = any(
+            self.redis.versions.get(key, 0) != version
+            for key, version in watched.items()
+        )
+        if changed or self.redis.always_conflict:
+            self.redis.conflicts += 1
+            raise WatchError("watched key changed")
+        for key, value in commands:
+            self.redis.values[key] = value
+            self.redis.versions[key] = self.redis.versions.get(key, 0) + 1
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _FakeRedis()
+    cache = RedisCache()
+    cache.client = fake
+    monkeypatch.setattr(behavior_pattern_api, "get_cache", lambda: cache)
+    return fake
+
+
+def _chunk(n: int) -> BehaviorChunkRequest:
+    return BehaviorChunkRequest(
+        mouse_movements=[
+            {
+                "timestamp": 1_700_000_000_000 + i * 16,
+                "x": i,
+                "y": i,
+                "speed": 800.0,
+                "acceleration": 1.0,
+                "curvature": 0.5,
+            }
+            for i in range(n)
+        ]
+    )
+
+
+@pytest.mark.unit
+async def test_concurrent_chunks_are_not_lost(redis):
+    await asyncio.gather(
+        score_behavior_chunk("s-1", _chunk(3)),
+        score_behavior_chunk("s-1", _chunk(5)),
+    )
+
+    saved = json.loads(redis.values[CacheKeys.behavior_session_state("s-1")])
+    assert saved["mouse_total"] == 8
+    assert redis.conflicts == 1
+
+
+@pytest.mark.unit
+async def test_persistent_conflict_returns_409(redis):
+    redis.always_conflict = True
+
+    with pytest.raises(HTTPException) as exc:
+        await score_behavior_chunk("s-2", _chunk(1))
+
+    assert exc.value.status_code == 409
+
+
+@pytest.mark.unit
+def test_out_of_range_event_values_are_rejected():
+    event = {"timestamp": 0, "x": 0, "y": 0, "speed": 1.0}
+    event.update(acceleration=0.0, curvature=0.5)
+
+    assert MouseMovementInput(**{**event, "timestamp": MAX_TIMESTAMP_MS})
+    for override in ({"timestamp": 2**70}, {"timestamp": -1}, {"x": 2**40}):
+        with pytest.raises(ValidationError):
+            MouseMovementInput(**{**event, **override})
+
+
+@pytest.mark.unit
+def test_session_id_is_derived_deterministically():
+    client_id = "web-7f3a9c"
+    assert session_uuid(client_id) == session_uuid(client_id)
+    assert session_uuid(client_id).version == 5
+    assert session_uuid(client_id) != session_uuid("web-other")
+
+    existing = uuid.uuid4()
+    assert session_uuid(str(existing)) == existing
@@ -0,0 +1,81 @@
+"""
+로컬 BIN 범위 데이터베이스 유닛 테스트
+
+- 중첩 범위 평탄화 (가장 좁은 범위 우선)
+- 6~8자리 BIN 조회
+- 파일 변경 시 hot reload
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from src.services.bin_range_db import (
+    BINRangeDatabase,
+    BINRangeTable,
+    BINRecord,
+    normalize_bin,
+)
+
+VISA = BINRecord("", "visa", "unknown", False, "")
+US_ISSUER = BINRecord("US", "visa", "credit", False, "Test Issuer")
+KR_PREPAID = BINRecord("KR", "visa", "prepaid", True, "")
+
+CSV_HEADER = "range_start,range_end,country,scheme,card_type,prepaid,bank_name\n"
+
+
+@pytest.mark.unit
+def test_nested_ranges_resolve_to_narrowest_range():
+    table = BINRangeTable.from_ranges(
+        [
+            (40000000, 49999999, VISA),
+            (41111100, 41111199, US_ISSUER),
+            (41111150, 41111159, KR_PREPAID),
+        ]
+    )
+
+    assert table.lookup(normalize_bin("400000")) == VISA
+    assert table.lookup(normalize_bin("411111")) == US_ISSUER
+    assert table.lookup(normalize_bin("41111155")) == KR_PREPAID
+    assert table.lookup(normalize_bin("41111160")) == US_ISSUER
+    assert table.lookup(normalize_bin("41111200")) == VISA
+    assert table.lookup(normalize_bin("510000")) is None
+    # 경계: 바깥 범위 5구간 + 레코드 3개
+    assert len(table) == 5
+    assert table.record_count == 3
+
+
+@pytest.mark.unit
+def test_normalize_bin_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        normalize_bin("4111")
+    with pytest.raises(ValueError):
+        normalize_bin("41x111")
+
+
+@pytest.mark.unit
+async def test_lookup_and_hot_reload(tmp_path):
+    path = tmp_path / "bin_ranges.csv"
+    path.write_text(
+        CSV_HEADER
+        + "40000000,49999999,,visa,unknown,false,\n411111,,US,visa,credit,false,\n"
+    )
+    db = BINRangeDatabase(
+        path=str(path), reload_check_interval=0, remote_fallback=False
+    )
+
+    assert await db.get_country("411111") == "US"
+    assert await db.get_country("400000") is None  # 스킴 범위만 일치
+    unknown = await db.lookup("900000")
+    assert unknown["scheme"] == "unknown"
+    assert unknown["risk_score"] > 0
+
+    path.write_text(CSV_HEADER + "411111,,KR,visa,credit,false,\n")
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+
+    await db.lookup("411111")  # 변경 감지 → 백그라운드 재로드
+    await asyncio.wait_for(db._reload_task, timeout=5)
+
+    assert await db.get_country("411111") == "KR"
+    assert db.get_stats()["reloads"] == 2
@@ -0,0 +1,379 @@
+"""
+대시보드 롤업 유닛 테스트
+
+- 윈도우를 일/시/분 버킷으로 덮는 계획 (30일 윈도우도 수백 개 이내)
+- 기록 → 합산 결과가 DB 집계와 같은 형태/값
+- 상태 변경은 원래 버킷에서 이동, covered_since 이전은 무시
+- 버킷 갱신 실패 구간은 누락 구간으로 기록되어 겹치는 윈도우는 DB 집계로 대체
+- write-behind 플러시 리스너는 실제로 INSERT 된 행만 전달 (RETURNING)
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.models import ReviewQueue, ReviewStatus, Transaction
+from src.models.transaction import DeviceType, EvaluationStatus, RiskLevel
+from src.services.dashboard_rollup import (
+    SCOPE_REVIEW,
+    SCOPE_TRANSACTION,
+    DashboardRollup,
+    bucket_plan,
+)
+from src.services.write_behind import WriteBehindQueue
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(("hincrby", key, field, amount))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key))
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    def zadd(self, key, mapping):
+        self.commands.append(("zadd", key, mapping))
+
+    def zremrangebyscore(self, key, low, high):
+        self.commands.append(("zremrangebyscore", key, low, high))
+
+    def zcount(self, key, low, high):
+        self.commands.append(("zcount", key, low, high))
+
+    async def execute(self):
+        if self.redis.down:
+            raise ConnectionError("redis down")
+        if self.redis.fail_writes and any(c[0] == "hincrby" for c in self.commands):
+            raise TimeoutError("pipeline timeout")
+        results = []
+        for command, key, *args in self.commands:
+            if command == "hincrby":
+                field, amount = args
+                self.redis.hashes[key][field] = (
+                    self.redis.hashes[key].get(field, 0) + amount
+                )
+                results.append(self.redis.hashes[key][field])
+            elif command == "hgetall":
+                results.append(
+                    {f: str(v) for f, v in self.redis.hashes.get(key, {}).items()}
+                )
+            elif command == "zadd":
+                self.redis.sorted_sets[key].update(args[0])
+                results.append(len(args[0]))
+            elif command == "zcount":
+                low, high = args
+                results.append(
+                    sum(
+                        low <= score <= high
+                        for score in self.redis.sorted_sets[key].values()
+                    )
+                )
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """DashboardRollup 이 사용하는 명령만 지원하는 인메모리 async Redis"""
+
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+        self.sorted_sets = defaultdict(dict)
+        self.values = {}
+        self.down = False
+        self.fail_writes = False
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def set(self, key, value, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = str(value)
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+def _row(created_at, status, risk, evaluation_time_ms):
+    return {
+        "created_at": created_at,
+        "evaluation_status": status,
+        "risk_level": risk,
+        "evaluation_time_ms": evaluation_time_ms,
+    }
+
+
+@pytest.mark.unit
+def test_bucket_plan_covers_window_with_few_buckets():
+    end = int(datetime(2025, 3, 31, 13, 27, 30).timestamp())
+    start = end - 30 * 86400
+
+    plan = bucket_plan(start, end)
+
+    sizes = {"d": 86400, "h": 3600, "m": 60}
+    assert len(plan) < 250
+    # 버킷이 겹치거나 비지 않고 이어짐
+    for (name, bucket), (_, next_bucket) in zip(plan, plan[1:]):
+        assert bucket + sizes[name] == next_bucket
+    # 오래된 시작 구간은 분 버킷 대신 시 버킷 사용 (분 버킷 보존 기간 초과)
+    assert plan[0][0] == "h"
+    assert plan[-1][0] == "m" and plan[-1][1] <= end < plan[-1][1] + 60
+
+    short = bucket_plan(end - 3600, end)
+    assert all(name in ("h", "m") for name, _ in short)
+    assert len(short) <= 61
+
+
+@pytest.mark.unit
+async def test_summarize_sums_recorded_events_and_status_changes():
+    redis = FakeRedis()
+    rollup = DashboardRollup(redis)
+    now = datetime.utcnow()
+    await redis.set("fds:rollup:since", int((now - timedelta(days=10)).timestamp()))
+
+    await rollup.record_transactions(
+        [
+            _row(
+                now - timedelta(minutes=5), EvaluationStatus.APPROVED, RiskLevel.LOW, 20
+            ),
+            _row(
+                now - timedelta(hours=5),
+                EvaluationStatus.APPROVED,
+                RiskLevel.MEDIUM,
+                80,
+            ),
+            _row(
+                now - timedelta(days=3),
+                EvaluationStatus.MANUAL_REVIEW,
+                RiskLevel.HIGH,
+                140,
+            ),
+        ]
+    )
+    added_at = now - timedelta(days=3)
+    await rollup.record_review_queue(
+        [{"added_at": added_at, "status": ReviewStatus.PENDING}]
+    )
+
+    # 검토 완료: 원래 버킷에서 상태 이동
+    await rollup.record_status_changes(
+        [
+            (SCOPE_REVIEW, added_at, ReviewStatus.PENDING, ReviewStatus.COMPLETED),
+            (
+                SCOPE_TRANSACTION,
+                added_at,
+                EvaluationStatus.MANUAL_REVIEW,
+                EvaluationStatus.BLOCKED,
+            ),
+        ]
+    )
+
+    week = await rollup.summarize(now - timedelta(days=7), now)
+    assert week["transaction_summary"] == {
+        "total": 3,
+        "approved": 2,
+        "blocked": 1,
+        "manual_review": 0,
+    }
+    assert week["risk_distribution"] == {"low": 1, "medium": 1, "high": 1}
+    assert week["review_queue_summary"] == {
+        "total": 1,
+        "pending": 0,
+        "in_review": 0,
+        "completed": 1,
+    }
+    assert week["avg_evaluation_time_ms"] == 80
+    assert week["evaluation_time_histogram"]["le_25"] == 1
+    assert week["evaluation_time_histogram"]["le_200"] == 1
+
+    hour = await rollup.summarize(now - timedelta(hours=1), now)
+    assert hour["transaction_summary"]["total"] == 1
+
+    # 롤업 기록 시작 이전을 포함하는 윈도우 → DB 집계로 대체
+    assert await rollup.summarize(now - timedelta(days=30), now) is None
+
+
+@pytest.mark.unit
+async def test_status_change_before_covered_since_is_ignored():
+    redis = FakeRedis()
+    rollup = DashboardRollup(redis)
+    await rollup.mark_started()
+
+    await rollup.record_status_changes(
+        [
+            (
+                SCOPE_REVIEW,
+                datetime.utcnow() - timedelta(days=1),
+                ReviewStatus.PENDING,
+                ReviewStatus.COMPLETED,
+            )
+        ]
+    )
+
+    assert redis.hashes == {}
+
+
+@pytest.mark.unit
+async def test_failed_write_marks_gap_and_overlapping_windows_fall_back():
+    redis = FakeRedis()
+    rollup = DashboardRollup(redis)
+    now = datetime.utcnow()
+    await redis.set("fds:rollup:since", int((now - timedelta(days=10)).timestamp()))
+    await rollup.record_transactions(
+        [_row(now - timedelta(minutes=5), EvaluationStatus.APPROVED, RiskLevel.LOW, 20)]
+    )
+
+    # 3일 전 거래의 상태 변경 반영 실패 (파이프라인 타임아웃)
+    redis.fail_writes = True
+    await rollup.record_status_changes(
+        [
+            (
+                SCOPE_TRANSACTION,
+                now - timedelta(days=3),
+                EvaluationStatus.MANUAL_REVIEW,
+                EvaluationStatus.BLOCKED,
+            )
+        ]
+    )
+    redis.fail_writes = False
+
+    assert rollup.stats["gaps"] == 1
+    assert len(redis.sorted_sets["fds:rollup:gaps"]) == 1
+    # 누락 구간을 포함하는 윈도우는 DB 집계로 대체, 포함하지 않는 윈도우는 롤업 사용
+    assert await rollup.summarize(now - timedelta(days=7), now) is None
+    hour = await rollup.summarize(now - timedelta(hours=1), now)
+    assert hour["transaction_summary"]["total"] == 1
+
+
+@pytest.mark.unit
+async def test_gap_is_kept_in_memory_until_redis_recovers():
+    redis = FakeRedis()
+    rollup = DashboardRollup(redis)
+    now = datetime.utcnow()
+    await redis.set("fds:rollup:since", int((now - timedelta(days=10)).timestamp()))
+
+    redis.down = True
+    await rollup.record_transactions(
+        [_row(now - timedelta(hours=2), EvaluationStatus.APPROVED, RiskLevel.LOW, 20)]
+    )
+    redis.down = False
+
+    # 누락 구간 기록도 실패 → 이 프로세스에서는 메모리의 누락 구간으로 대체
+    assert redis.sorted_sets["fds:rollup:gaps"] == {}
+    assert await rollup.summarize(now - timedelta(hours=3), now) is None
+
+    # 다음 갱신에 함께 기록되어 다른 프로세스(관리자 대시보드)도 대체
+    await rollup.record_transactions(
+        [_row(now, EvaluationStatus.APPROVED, RiskLevel.LOW, 20)]
+    )
+    assert len(redis.sorted_sets["fds:rollup:gaps"]) == 1
+    other = DashboardRollup(redis)
+    assert await other.summarize(now - timedelta(hours=3), now) is None
+    assert (await other.summarize(now - timedelta(hours=1), now)) is not None
+
+
+class _Dialect:
+    name = "postgresql"
+
+
+class _Bind:
+    dialect = _Dialect()
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self.rows
+
+
+class _FakeSession:
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING 을 흉내내는 가짜 세션"""
+
+    bind = _Bind()
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        rows = self.tables.setdefault(stmt.table.name, {})
+        inserted = []
+        for row in stmt._multi_values[0]:
+            if row["id"] in rows:
+                continue
+            # 서버 기본값 (created_at / added_at = now())
+            now = datetime.utcnow()
+            row = {"created_at": now, "added_at": now, **row}
+            rows[row["id"]] = row
+            inserted.append(row)
+        return _Result(
+            [{c.key: row[c.key] for c in stmt._returning} for row in inserted]
+        )
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.unit
+async def test_write_behind_listener_receives_only_inserted_rows(tmp_path):
+    tables = {}
+    redis = FakeRedis()
+    rollup = DashboardRollup(redis)
+    await redis.set("fds:rollup:since", int(datetime.utcnow().timestamp()) - 86400)
+
+    queue = WriteBehindQueue(
+        session_factory=lambda: _FakeSession(tables),
+        flush_interval_ms=20,
+        spill_path=str(tmp_path / "spill"),
+    )
+    rollup.attach(queue)
+
+    transaction = Transaction(
+        id=uuid4(),
+        user_id=uuid4(),
+        order_id=uuid4(),
+        amount=Decimal("150000.00"),
+        ip_address="211.234.10.1",
+        user_agent="pytest",
+        device_type=DeviceType.DESKTOP,
+        risk_score=90,
+        risk_level=RiskLevel.HIGH,
+        evaluation_status=EvaluationStatus.MANUAL_REVIEW,
+        evaluation_time_ms=42,
+    )
+    await queue.enqueue(transaction)
+    await queue.enqueue(
+        ReviewQueue(
+            id=uuid4(), transaction_id=transaction.id, status=ReviewStatus.PENDING
+        )
+    )
+    await queue.stop()
+
+    # 재전송된 거래는 ON CONFLICT 로 건너뛰므로 롤업에도 다시 반영되지 않음
+    await queue.start()
+    await queue.enqueue(transaction)
+    await queue.stop()
+
+    stats = await rollup.summarize(datetime.utcnow() - timedelta(hours=1))
+    assert stats["transaction_summary"]["total"] == 1
+    assert stats["transaction_summary"]["manual_review"] == 1
+    assert stats["review_queue_summary"]["pending"] == 1
+    assert stats["avg_evaluation_time_ms"] == 42
@@ -0,0 +1,200 @@
+"""
+디바이스 핑거프린트 서비스 유닛 테스트
+
+- INSERT ... ON CONFLICT DO UPDATE 단일 문장 생성/갱신
+- last_seen_at 갱신 병합 (디바이스별 최신 값만 배치 기록)
+- 디바이스 ID 계산 통일
+- 캐시 히트: 최근 접속 정보만 갱신 (TTL 유지), 블랙리스트 여부는 상태 키/DB 기준
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.engines.fingerprint_engine import FingerprintEngine, compute_device_id
+from src.models.device_fingerprint import DeviceFingerprint
+from src.services.device_fingerprint_service import DeviceFingerprintService
+from src.utils import cache_utils
+from src.utils.cache_utils import CacheKeys, RedisCache, cache_device_blacklist_status
+
+FINGERPRINT = {
+    "canvas_hash": "c" * 64,
+    "webgl_hash": "w" * 64,
+    "audio_hash": "a" * 64,
+    "cpu_cores": 8,
+    "memory_size": 16384,
+    "screen_resolution": "1920x1080",
+    "timezone": "Asia/Seoul",
+    "language": "ko-KR",
+    "user_agent": "Mozilla/5.0",
+}
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(DeviceFingerprint.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class _FakeRedis:
+    """GET/SET(NX, EX)/TTL 과 핑거프린트 touch 스크립트만 흉내 내는 가짜 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+    async def setex(self, key, ttl, value):
+        return await self.set(key, value, ex=ttl)
+
+    async def delete(self, key):
+        self.ttls.pop(key, None)
+        return int(self.values.pop(key, None) is not None)
+
+    async def eval(self, script, numkeys, key, last_seen_at, user_agent):
+        assert script == cache_utils.TOUCH_DEVICE_FINGERPRINT_SCRIPT
+        if key not in self.values:
+            return 0
+        data = json.loads(self.values[key])
+        data.update(last_seen_at=last_seen_at, user_agent=user_agent)
+        self.values[key] = json.dumps(data)  # KEEPTTL
+        return 1
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _FakeRedis()
+    cache = RedisCache()
+    cache.client = fake
+    monkeypatch.setattr(cache_utils, "_cache_instance", cache)
+    return fake
+
+
+def _device_id() -> str:
+    fields = {
+        k: v for k, v in FINGERPRINT.items() if k not in ("memory_size", "user_agent")
+    }
+    return compute_device_id(**fields)
+
+
+@pytest.mark.unit
+def test_engine_and_api_share_device_id_algorithm():
+    fields = {
+        k: v for k, v in FINGERPRINT.items() if k not in ("memory_size", "user_agent")
+    }
+    assert FingerprintEngine().generate_device_id(**fields) == _device_id()
+    assert len(_device_id()) == 64
+
+
+@pytest.mark.unit
+async def test_upsert_creates_then_updates_in_single_statement(session_factory):
+    service = DeviceFingerprintService(session_factory=session_factory)
+    device_id = _device_id()
+    first_seen = datetime(2025, 1, 1, 12, 0, 0)
+
+    created, is_new = await service.upsert(device_id, FINGERPRINT, first_seen)
+    updated, is_new_again = await service.upsert(
+        device_id,
+        {**FINGERPRINT, "user_agent": "Mozilla/6.0"},
+        first_seen + timedelta(minutes=5),
+    )
+
+    assert is_new is True
+    assert is_new_again is False
+    assert updated["created_at"] == created["created_at"]
+    assert updated["user_agent"] == "Mozilla/6.0"
+    assert datetime.fromisoformat(updated["last_seen_at"]) == first_seen + timedelta(
+        minutes=5
+    )
+
+
+@pytest.mark.unit
+async def test_touches_are_coalesced_into_one_update_per_device(session_factory):
+    service = DeviceFingerprintService(session_factory=session_factory)
+    device_id = _device_id()
+    first_seen = datetime(2025, 1, 1, 12, 0, 0)
+    await service.upsert(device_id, FINGERPRINT, first_seen)
+
+    for minutes in range(1, 11):
+        await service.touch(
+            device_id, first_seen + timedelta(minutes=minutes), f"agent-{minutes}"
+        )
+    # 늦게 도착한 이전 시각은 last_seen_at 을 되돌리지 않음
+    assert await service.flush() == 1
+    await service.touch(device_id, first_seen, "stale-agent")
+    await service.flush()
+    await service.stop()
+
+    async with session_factory() as session:
+        device = (
+            await session.execute(
+                select(DeviceFingerprint).where(
+                    DeviceFingerprint.device_id == device_id
+                )
+            )
+        ).scalar_one()
+
+    assert device.last_seen_at == first_seen + timedelta(minutes=10)
+    assert device.user_agent == "agent-10"
+    assert service.get_stats()["touches"] == 11
+
+
+@pytest.mark.unit
+async def test_cache_hit_touches_only_last_seen_and_reads_blacklist_status(
+    session_factory, redis
+):
+    service = DeviceFingerprintService(session_factory=session_factory)
+    device_id = _device_id()
+    blob_key = CacheKeys.device_fingerprint(device_id)
+
+    _, is_new = await service.collect(device_id, FINGERPRINT)
+    assert is_new is True
+    redis.ttls[blob_key] = 120  # 남은 TTL
+
+    # 블랙리스트 API: DB 갱신 후 상태 키 기록 (캐시 값은 아직 blacklisted=False)
+    async with session_factory() as session:
+        await session.execute(
+            DeviceFingerprint.__table__.update().values(
+                blacklisted=True, blacklist_reason="chargeback"
+            )
+        )
+        await session.commit()
+    await cache_device_blacklist_status(device_id, True, "chargeback")
+
+    device, is_new = await service.collect(
+        device_id, {**FINGERPRINT, "user_agent": "Mozilla/6.0"}
+    )
+
+    assert is_new is False
+    assert device["blacklisted"] is True
+    assert device["blacklist_reason"] == "chargeback"
+    cached = json.loads(redis.values[blob_key])
+    assert cached["user_agent"] == "Mozilla/6.0"
+    assert cached["blacklisted"] is False  # 전체 값을 다시 쓰지 않음
+    assert redis.ttls[blob_key] == 120  # TTL 연장 없음
+
+    # 무효화된 캐시를 되살리지 않음, 상태 키가 없으면 DB 에서 읽음
+    await redis.delete(blob_key)
+    await redis.delete(CacheKeys.device_blacklist(device_id))
+    redis.values[blob_key] = json.dumps(cached)
+    device, _ = await service.collect(device_id, FINGERPRINT)
+    assert device["blacklisted"] is True
+    await redis.delete(blob_key)
+    await cache_utils.touch_cached_device_fingerprint(device_id, "now", "agent")
+    assert blob_key not in redis.values
+    await service.stop()
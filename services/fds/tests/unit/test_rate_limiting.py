@@ -0,0 +1,60 @@
+"""
+Rate Limiting 미들웨어 유닛 테스트
+
+- RateLimitConfig 경로별/서비스 토큰 정책 적용
+- 한도 초과 시 429 + Retry-After (요청 간격 기준)
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.middleware.rate_limiting import RateLimitConfig, RateLimitMiddleware
+from src.utils.rate_limiter import RateLimitPolicy
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.post("/v1/fds/evaluate")
+    async def evaluate():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+def test_policy_for_prefers_endpoint_then_service_token():
+    assert RateLimitConfig.policy_for(
+        "/v1/fds/evaluate", "ip:1.2.3.4"
+    ) == RateLimitPolicy(limit=100, window_seconds=60)
+    assert RateLimitConfig.policy_for("/v1/other", "service:abc").limit == (
+        RateLimitConfig.SERVICE_LIMIT
+    )
+    assert RateLimitConfig.policy_for("/v1/other", "ip:1.2.3.4").limit == (
+        RateLimitConfig.IP_LIMIT
+    )
+
+
+@pytest.mark.unit
+def test_requests_over_limit_get_429_with_retry_after():
+    client = _client()
+    headers = {"x-forwarded-for": "203.0.113.7"}
+
+    statuses = [
+        client.post("/v1/fds/evaluate", headers=headers).status_code for _ in range(101)
+    ]
+    blocked = client.post("/v1/fds/evaluate", headers=headers)
+
+    assert statuses[:100] == [200] * 100
+    assert statuses[100] == 429
+    assert blocked.status_code == 429
+    # 100 req/min → 요청 간격 0.6초
+    assert blocked.headers["Retry-After"] == "1"
+    assert blocked.headers["X-RateLimit-Remaining"] == "0"
+
+    # 다른 클라이언트는 독립적으로 제한
+    other = client.post("/v1/fds/evaluate", headers={"x-forwarded-for": "203.0.113.8"})
+    assert other.status_code == 200
+    assert other.headers["X-RateLimit-Remaining"] == "99"
@@ -0,0 +1,388 @@
+"""
+검토 큐 엔진 유닛 테스트
+
+- 위험 점수 + 대기 시간 우선순위로 할당, 동시 할당 시 중복 없음
+- 리스 연장/만료 (만료된 항목은 원래 우선순위로 대기열 복귀)
+- 특정 항목 할당 경합, 할당 중인 항목은 재구성 시 건너뜀
+- 할당 결과는 백그라운드로 DB 반영 (항목별 순서 보장, 실패 시 재시도)
+- reconcile: Redis 리스 상태를 DB 에 맞춤
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.review_queue import ReviewStatus
+from src.services.review_queue_engine import (
+    CLAIM_NEXT_SCRIPT,
+    CLAIM_SCRIPT,
+    ENQUEUE_SCRIPT,
+    RELEASE_SCRIPT,
+    RENEW_SCRIPT,
+    REQUEUE_SCRIPT,
+    ReviewQueueEngine,
+)
+
+
+class FakeScriptRedis:
+    """검토 큐 Lua 스크립트를 같은 동작의 파이썬 코드로 흉내 내는 Redis"""
+
+    def __init__(self):
+        self.pending = {}
+        self.leases = {}
+        self.owners = {}
+        self.priority = {}
+
+    def register_script(self, script):
+        handler = {
+            REQUEUE_SCRIPT: self._requeue,
+            CLAIM_NEXT_SCRIPT: self._claim_next,
+            CLAIM_SCRIPT: self._claim,
+            RENEW_SCRIPT: self._renew,
+            RELEASE_SCRIPT: self._release,
+            ENQUEUE_SCRIPT: self._enqueue,
+        }[script]
+
+        async def run(keys, args):
+            return handler(*args)
+
+        return run
+
+    async def hgetall(self, key):
+        return dict(self.owners)
+
+    async def hmget(self, key, members):
+        return [self.owners.get(member) for member in members]
+
+    async def zrange(self, key, start, end):
+        ordered = sorted(self.pending, key=lambda member: self.pending[member])
+        return ordered[start : end + 1]
+
+    def _requeue(self, now, limit):
+        expired = sorted(
+            (m for m, expires in self.leases.items() if expires <= now),
+            key=self.leases.get,
+        )[:limit]
+        for member in expired:
+            del self.leases[member]
+            self.owners.pop(member, None)
+            self.pending[member] = self.priority.pop(member)
+        return expired
+
+    def _claim_next(self, now, limit, lease_ms, reviewer):
+        expired = self._requeue(now, limit)
+        if not self.pending:
+            return ["", expired]
+        member = min(self.pending, key=self.pending.get)
+        self.priority[member] = self.pending.pop(member)
+        self.owners[member] = reviewer
+        self.leases[member] = now + lease_ms
+        return [member, expired]
+
+    def _claim(self, now, lease_ms, reviewer, member, priority):
+        owner = self.owners.get(member)
+        if owner and owner != reviewer and self.leases.get(member, 0) > now:
+            return 0
+        self.priority[member] = self.pending.pop(
+            member, self.priority.get(member, priority)
+        )
+        self.owners[member] = reviewer
+        self.leases[member] = now + lease_ms
+        return 1
+
+    def _renew(self, now, lease_ms, reviewer, member):
+        if self.owners.get(member) != reviewer or self.leases.get(member, 0) <= now:
+            return 0
+        self.leases[member] = now + lease_ms
+        return 1
+
+    def _release(self, reviewer, member):
+        if self.owners.get(member) != reviewer:
+            return 0
+        del self.leases[member]
+        del self.owners[member]
+        self.pending[member] = self.priority.pop(member)
+        return 1
+
+    def _enqueue(self, *args):
+        added = 0
+        for member, priority in zip(args[::2], args[1::2]):
+            if member not in self.owners and member not in self.pending:
+                self.pending[member] = priority
+                added += 1
+        return added
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class _FakeDatabase:
+    """검토 큐 행을 메모리에 두는 가짜 DB (없는 행은 PENDING 으로 생성)"""
+
+    def __init__(self):
+        self.rows = {}
+        self.commits = []
+        self.missing = set()  # 아직 INSERT 되지 않은 행 (write-behind 대기)
+        self.failures = 0  # 실패할 남은 커밋 수
+        self.gate = None  # 설정 시 커밋이 이 이벤트를 기다림
+
+    def add(self, queue_id, status, assigned_to=None, risk_score=80):
+        self.rows[queue_id] = SimpleNamespace(
+            status=status,
+            assigned_to=assigned_to,
+            added_at=datetime.utcnow(),
+            risk_score=risk_score,
+        )
+
+    def session(self):
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    """get(with_for_update) / commit / reconcile 조회만 흉내 내는 가짜 세션"""
+
+    def __init__(self, database):
+        self.database = database
+        self.items = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, model, queue_id, with_for_update=False):
+        if queue_id in self.database.missing:
+            return None
+        if queue_id not in self.database.rows:
+            self.database.add(queue_id, ReviewStatus.PENDING)
+        # 커밋 전 변경은 DB 에 보이지 않도록 복사본 반환
+        item = SimpleNamespace(**vars(self.database.rows[queue_id]))
+        self.items.append((queue_id, item))
+        return item
+
+    async def execute(self, stmt):
+        return _Rows(
+            [
+                (queue_id, r.status, r.assigned_to, r.risk_score, r.added_at)
+                for queue_id, r in self.database.rows.items()
+            ]
+        )
+
+    async def commit(self):
+        if self.database.gate is not None:
+            await self.database.gate.wait()
+        if self.database.failures:
+            self.database.failures -= 1
+            raise ConnectionError("db connection lost")
+        for queue_id, item in self.items:
+            self.database.rows[queue_id] = item
+            self.database.commits.append(
+                {"status": item.status, "assigned_to": item.assigned_to}
+            )
+
+
+def _engine(database=None):
+    database = _FakeDatabase() if database is None else database
+    return ReviewQueueEngine(
+        FakeScriptRedis(),
+        session_factory=database.session,
+        lease_seconds=60,
+        persist_retry_seconds=0,
+    )
+
+
+@pytest.mark.unit
+async def test_claim_next_orders_by_risk_and_age_without_duplicates():
+    engine = _engine()
+    now = datetime.utcnow()
+    old_low = uuid4()
+    new_high = uuid4()
+    new_low = uuid4()
+    await engine.enqueue(new_low, 60, now)
+    await engine.enqueue(old_low, 60, now - timedelta(hours=3))
+    await engine.enqueue(new_high, 90, now)
+    # 중복 추가는 무시
+    assert await engine.enqueue(new_high, 90, now) is False
+
+    assert await engine.peek() == [new_high, old_low, new_low]
+
+    leases = await asyncio.gather(*(engine.claim_next(uuid4()) for _ in range(5)))
+    claimed = [lease.queue_id for lease in leases if lease is not None]
+    assert claimed == [new_high, old_low, new_low]
+    assert leases[3] is None and leases[4] is None
+
+    await engine.stop()
+    assert engine.get_stats()["persisted"] == 3
+
+
+@pytest.mark.unit
+async def test_expired_lease_returns_to_pending_and_renew_extends():
+    database = _FakeDatabase()
+    engine = _engine(database)
+    reviewer = uuid4()
+    other = uuid4()
+    first = uuid4()
+    second = uuid4()
+    now = datetime.utcnow()
+    await engine.enqueue(first, 95, now)
+    await engine.enqueue(second, 40, now)
+
+    clock = [1_000_000]
+    engine._now_ms = lambda: clock[0]
+
+    lease = await engine.claim_next(reviewer)
+    assert lease.queue_id == first
+    await asyncio.sleep(0)  # 할당 DB 반영
+    assert await engine.renew(first, other) is None
+
+    clock[0] += 50_000
+    assert await engine.renew(first, reviewer) is not None
+
+    # 연장 후 60초 이내에는 다른 담당자가 가져갈 수 없음
+    clock[0] += 50_000
+    assert await engine.claim(first, other) is None
+    assert (await engine.claim_next(other)).queue_id == second
+
+    # 만료 → 원래 우선순위로 대기열 복귀, DB 는 PENDING 으로 되돌림
+    clock[0] += 61_000
+    assert await engine.requeue_expired() == [first, second]
+    assert await engine.renew(first, reviewer) is None
+    assert await engine.peek() == [first, second]
+
+    await engine.stop()
+    assert database.commits[0] == {
+        "status": ReviewStatus.IN_REVIEW,
+        "assigned_to": reviewer,
+    }
+    assert database.rows[first].status == ReviewStatus.PENDING
+    assert database.rows[second].status == ReviewStatus.PENDING
+
+
+@pytest.mark.unit
+async def test_release_and_remove():
+    engine = _engine()
+    reviewer = uuid4()
+    queue_id = uuid4()
+    await engine.enqueue(queue_id, 80, datetime.utcnow())
+
+    await engine.claim(queue_id, reviewer)
+    # 할당 중인 항목은 재구성(enqueue) 시 대기열에 다시 들어가지 않음
+    assert await engine.enqueue(queue_id, 80, datetime.utcnow()) is False
+    assert await engine.release(queue_id, uuid4()) is False
+    assert await engine.release(queue_id, reviewer) is True
+    assert await engine.peek() == [queue_id]
+
+    engine.redis.pipeline = lambda transaction=True: _RemovePipeline(engine.redis)
+    await engine.remove(queue_id)
+    assert await engine.peek() == []
+    assert await engine.claim_next(reviewer) is None
+    await engine.stop()
+
+
+class _RemovePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.members = []
+
+    def zrem(self, key, member):
+        self.members.append(member)
+
+    def hdel(self, key, member):
+        self.members.append(member)
+
+    async def execute(self):
+        for member in self.members:
+            for store in (
+                self.redis.pending,
+                self.redis.leases,
+                self.redis.owners,
+                self.redis.priority,
+            ):
+                store.pop(member, None)
+
+
+@pytest.mark.unit
+async def test_assignment_and_requeue_are_persisted_in_order():
+    database = _FakeDatabase()
+    engine = _engine(database)
+    reviewer = uuid4()
+    queue_id = uuid4()
+    await engine.enqueue(queue_id, 90, datetime.utcnow())
+    clock = [1_000_000]
+    engine._now_ms = lambda: clock[0]
+
+    # 할당 반영이 커밋 중일 때 리스가 만료되어 복귀
+    database.gate = asyncio.Event()
+    await engine.claim_next(reviewer)
+    await asyncio.sleep(0)
+    clock[0] += 61_000
+    assert await engine.requeue_expired() == [queue_id]
+    assert engine.get_stats()["persisting"] == 1
+    database.gate.set()
+    await engine.stop()
+
+    # 복귀가 할당보다 먼저 기록되어 DB 에 in_review 가 남지 않음
+    assert database.commits == [
+        {"status": ReviewStatus.IN_REVIEW, "assigned_to": reviewer},
+        {"status": ReviewStatus.PENDING, "assigned_to": None},
+    ]
+    assert database.rows[queue_id].status == ReviewStatus.PENDING
+
+
+@pytest.mark.unit
+async def test_failed_persist_is_retried_and_completed_rows_are_kept():
+    database = _FakeDatabase()
+    engine = _engine(database)
+    reviewer = uuid4()
+    queue_id, completed = uuid4(), uuid4()
+    database.add(completed, ReviewStatus.COMPLETED, assigned_to=reviewer)
+    await engine.enqueue(queue_id, 90, datetime.utcnow())
+    await engine.enqueue(completed, 80, datetime.utcnow())
+
+    database.failures = 2
+    await engine.claim_next(reviewer)
+    await engine.claim_next(reviewer)
+    await engine.stop()
+
+    assert database.rows[queue_id].status == ReviewStatus.IN_REVIEW
+    assert database.rows[queue_id].assigned_to == reviewer
+    # 검토 완료 행은 남은 리스로 덮어쓰지 않음
+    assert database.rows[completed].status == ReviewStatus.COMPLETED
+    assert engine.get_stats()["persist_errors"] == 2
+    assert engine.get_stats()["persisting"] == 0
+
+
+@pytest.mark.unit
+async def test_reconcile_restores_db_state_from_leases():
+    database = _FakeDatabase()
+    engine = _engine(database)
+    reviewer, stale = uuid4(), uuid4()
+    leased, orphaned, completed = uuid4(), uuid4(), uuid4()
+
+    # DB 반영을 잃은 할당 (pending 으로 남음)
+    await engine.claim(leased, reviewer)
+    database.add(leased, ReviewStatus.PENDING)
+    # 리스 없이 in_review 로 남은 항목 (복귀 반영 유실)
+    database.add(orphaned, ReviewStatus.IN_REVIEW, assigned_to=stale, risk_score=70)
+    database.add(completed, ReviewStatus.COMPLETED, assigned_to=stale)
+
+    assert await engine.reconcile() == 2
+    await engine.stop()
+
+    assert database.rows[leased].status == ReviewStatus.IN_REVIEW
+    assert database.rows[leased].assigned_to == reviewer
+    assert database.rows[orphaned].status == ReviewStatus.PENDING
+    assert database.rows[orphaned].assigned_to is None
+    assert database.rows[completed].status == ReviewStatus.COMPLETED
+    # 리스 없던 항목은 대기열로 돌아가 다시 할당 가능
+    assert await engine.peek() == [orphaned]
+    assert UUID(engine.redis.owners[str(leased)]) == reviewer
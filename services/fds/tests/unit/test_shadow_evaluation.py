@@ -0,0 +1,272 @@
+"""
+Shadow 평가 유닛 테스트
+
+- 후보 룰/모델 결과는 라이브 결정에 영향 없음, 집계 카운터에만 기록
+- 큐가 가득 차면 shadow 작업을 버림 (load shedding)
+- 후보 velocity 룰은 운영 Redis 카운터를 바꾸지 않음
+- 후보 구성/집계는 Redis 로 API 워커 간 공유
+- 후보 모델은 등록된 모델 ID 로만 지정
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.engines.integrated_evaluation_engine import IntegratedEvaluationEngine
+from src.models.detection_rule import DetectionRule, RuleType
+from src.models.schemas import DecisionEnum, FDSEvaluationRequest
+from src.services.shadow_evaluation import (
+    ShadowCandidate,
+    ShadowConfig,
+    ShadowEvaluator,
+    ShadowStateStore,
+    UnknownShadowModelError,
+    list_shadow_models,
+    resolve_shadow_model,
+)
+
+
+class _FakeRedis:
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.writes = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def incr(self, key):
+        self.writes.append(key)
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def expire(self, key, seconds):
+        self.writes.append(key)
+        return True
+
+
+class _FakeSharedRedis:
+    """shadow 공유 상태용 가짜 Redis (FLUSH_STATS_SCRIPT 의미를 파이썬으로 재현)"""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def hgetall(self, key):
+        return {k: str(v) for k, v in self.hashes.get(key, {}).items()}
+
+    def register_script(self, script):
+        async def run(keys, args):
+            target = self.hashes.setdefault(keys[0], {})
+            for i in range(1, len(args), 3):
+                op, name, value = args[i], args[i + 1], float(args[i + 2])
+                current = target.get(name)
+                if op == "incr":
+                    target[name] = (current or 0) + value
+                elif current is None or (op == "max") == (value > current):
+                    target[name] = value
+
+        return run
+
+
+class _FakeMLEngine:
+    def __init__(self, anomaly_score):
+        self.anomaly_score = anomaly_score
+
+    async def evaluate(self, transaction_data):
+        return {
+            "anomaly_score": self.anomaly_score,
+            "is_anomaly": True,
+            "confidence": 0.9,
+        }
+
+
+def _request(amount="50000"):
+    return FDSEvaluationRequest(
+        transaction_id=uuid4(),
+        user_id=uuid4(),
+        order_id=uuid4(),
+        amount=Decimal(amount),
+        ip_address="192.168.0.10",
+        user_agent="Mozilla/5.0",
+        device_fingerprint={"device_type": "desktop"},
+        shipping_info={
+            "name": "홍길동",
+            "address": "서울시 강남구 테헤란로 1",
+            "phone": "010-0000-0000",
+        },
+        payment_info={
+            "method": "credit_card",
+            "card_bin": "123456",
+            "card_last_four": "4242",
+        },
+        timestamp=datetime.utcnow(),
+    )
+
+
+def _rule(rule_type, condition, weight):
+    return DetectionRule(
+        id=uuid4(),
+        name=f"candidate-{rule_type.value}",
+        rule_type=rule_type,
+        condition=condition,
+        risk_score_weight=weight,
+        is_active=False,
+        priority=50,
+        times_triggered=0,
+    )
+
+
+@pytest.mark.unit
+async def test_candidate_decisions_only_reach_counters():
+    redis = _FakeRedis()
+    shadow = ShadowEvaluator()
+    rule = _rule(
+        RuleType.THRESHOLD, {"field": "amount", "operator": "gt", "value": 30000}, 95
+    )
+    shadow.enable(ShadowCandidate.build("threshold-v2", redis, rules=[rule]))
+    engine = IntegratedEvaluationEngine(db=None, redis=redis, shadow_evaluator=shadow)
+
+    try:
+        live = await engine.evaluate(_request())
+        await shadow.drain()
+    finally:
+        await shadow.stop()
+
+    assert live.decision == DecisionEnum.APPROVE
+    stats = shadow.get_stats()
+    assert stats["evaluated"] == 1
+    assert stats["transitions"] == {"approve->blocked": 1}
+    assert stats["live_decisions"] == {"approve": 1}
+    assert stats["shadow_decisions"] == {"blocked": 1}
+    assert stats["max_score_increase"] >= 90
+    assert rule.times_triggered == 1
+
+
+@pytest.mark.unit
+async def test_candidate_model_replaces_live_ml_factors():
+    redis = _FakeRedis()
+    engine = IntegratedEvaluationEngine(db=None, redis=redis)
+    engine.ml_engine = _FakeMLEngine(anomaly_score=85)
+    request = _request()
+    live = await engine.evaluate(request)
+
+    candidate = ShadowCandidate(
+        name="model-v2", ml_engine=_FakeMLEngine(anomaly_score=10)
+    )
+    score, decision = await engine.evaluate_shadow(request, live, candidate)
+
+    assert live.decision == DecisionEnum.BLOCKED
+    assert (score, decision) == (0, DecisionEnum.APPROVE)
+
+
+@pytest.mark.unit
+async def test_full_queue_sheds_shadow_work():
+    redis = _FakeRedis()
+    shadow = ShadowEvaluator(max_queue_size=2, workers=1)
+    shadow.enable(
+        ShadowCandidate(name="model-v2", ml_engine=_FakeMLEngine(anomaly_score=70))
+    )
+    engine = IntegratedEvaluationEngine(db=None, redis=redis)
+    live = await engine.evaluate(_request())
+
+    try:
+        # 워커가 실행될 틈 없이 연속 제출
+        accepted = [shadow.submit(engine, _request(), live) for _ in range(5)]
+        await shadow.drain()
+    finally:
+        await shadow.stop()
+
+    assert accepted == [True, True, False, False, False]
+    stats = shadow.get_stats()
+    assert (stats["submitted"], stats["shed"], stats["evaluated"]) == (5, 3, 2)
+
+
+@pytest.mark.unit
+async def test_candidate_velocity_rule_does_not_touch_live_counters():
+    request = _request()
+    redis = _FakeRedis({f"velocity:ip:{request.ip_address}": b"2"})
+    rule = _rule(RuleType.VELOCITY, {"window_seconds": 60, "max_transactions": 3}, 60)
+    candidate = ShadowCandidate.build("velocity-v2", redis, rules=[rule])
+    engine = IntegratedEvaluationEngine(db=None, redis=redis)
+    live = await engine.evaluate(request)
+
+    first = await engine.evaluate_shadow(request, live, candidate)
+    second = await engine.evaluate_shadow(request, live, candidate)
+
+    # 운영 값(2)에서 시작해 shadow overlay 에서만 3, 4 로 증가
+    assert first[0] < second[0]
+    assert redis.writes == []
+    assert redis.data[f"velocity:ip:{request.ip_address}"] == b"2"
+
+
+@pytest.mark.unit
+async def test_config_and_stats_are_shared_across_workers():
+    redis = _FakeSharedRedis()
+
+    async def loader(config, _redis):
+        return ShadowCandidate(
+            name=config.name, ml_engine=_FakeMLEngine(anomaly_score=70)
+        )
+
+    workers = [
+        ShadowEvaluator(store=ShadowStateStore(redis), candidate_loader=loader)
+        for _ in range(2)
+    ]
+    config = ShadowConfig(name="model-v2", ml_model_id="model-v2")
+    await workers[0].activate(config, await loader(config, redis))
+    await workers[1].sync()
+    assert workers[1].version == config.version
+
+    engine = IntegratedEvaluationEngine(db=None, redis=_FakeRedis())
+    live = await engine.evaluate(_request())
+    try:
+        for worker in workers:
+            worker.submit(engine, _request(), live)
+            worker.submit(engine, _request(), live)
+            await worker.drain()
+        await workers[1].sync()
+        stats = await workers[0].get_shared_stats()
+    finally:
+        for worker in workers:
+            await worker.stop()
+
+    assert (stats["candidate"], stats["submitted"], stats["evaluated"]) == (
+        "model-v2",
+        4,
+        4,
+    )
+    assert stats["transitions"] == {"approve->additional_auth_required": 4}
+    assert stats["live_latency"]["avg_ms"] is not None
+
+    # 한 워커에서 비활성화하면 다른 워커도 다음 동기화 때 중지
+    final = await workers[0].deactivate()
+    await workers[1].sync()
+    assert final["evaluated"] == 4 and final["enabled"] is False
+    assert not workers[1].enabled
+
+
+@pytest.mark.unit
+def test_candidate_model_must_be_registered(tmp_path):
+    (tmp_path / "fraud-v2.onnx").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("")
+
+    assert list_shadow_models(str(tmp_path)) == ["fraud-v2"]
+    assert resolve_shadow_model("fraud-v2", str(tmp_path)) == str(
+        tmp_path / "fraud-v2.onnx"
+    )
+    for model_id in ("fraud-v3", "../fraud-v2", "/tmp/evil", "notes"):
+        with pytest.raises(UnknownShadowModelError):
+            resolve_shadow_model(model_id, str(tmp_path))
+    with pytest.raises(UnknownShadowModelError):
+        ShadowCandidate.build("x", _FakeRedis(), ml_model_id="../../etc/model")
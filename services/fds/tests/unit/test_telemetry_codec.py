@@ -0,0 +1,121 @@
+"""
+행동 텔레메트리 코덱 유닛 테스트
+
+- 인코딩/디코딩 무손실 왕복 (누락/None 필드, 소수 체류 시간 포함)
+- JSON 대비 저장 크기 감소
+- BehaviorTelemetry 지연 디코딩
+"""
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from src.models.behavior_pattern import BehaviorTelemetry
+from src.utils.telemetry_codec import (
+    CLICKSTREAM_SCHEMA,
+    KEYBOARD_SCHEMA,
+    MOUSE_SCHEMA,
+    decode_columns,
+    decode_events,
+    encode_events,
+)
+
+
+def _mouse(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    timestamp, x, y = 1_700_000_000_000, 500, 400
+    events = []
+    for _ in range(n):
+        timestamp += rng.randint(8, 24)
+        x += rng.randint(-15, 15)
+        y += rng.randint(-15, 15)
+        events.append(
+            {
+                "timestamp": timestamp,
+                "x": x,
+                "y": y,
+                "speed": round(rng.uniform(0, 3000), 2),
+                "acceleration": round(rng.uniform(-50, 50), 2),
+                "curvature": round(rng.random(), 3),
+            }
+        )
+    return events
+
+
+@pytest.mark.unit
+def test_round_trip_is_lossless():
+    mouse = _mouse(1000)
+    keyboard = [
+        {"timestamp": 1_700_000_000_000 + i * 120, "key": "*", "duration": 80 + i % 40}
+        for i in range(200)
+    ]
+    clickstream = [
+        {
+            "page": f"/products/{i % 5}",
+            "timestamp": 1_700_000_000_000 + i,
+            "duration": i * 1000,
+        }
+        for i in range(20)
+    ]
+
+    assert decode_events(encode_events(mouse, MOUSE_SCHEMA)) == mouse
+    assert decode_events(encode_events(keyboard, KEYBOARD_SCHEMA)) == keyboard
+    assert decode_events(encode_events(clickstream, CLICKSTREAM_SCHEMA)) == clickstream
+
+
+@pytest.mark.unit
+def test_encoded_blob_is_much_smaller_than_json():
+    mouse = _mouse(5000)
+    blob = encode_events(mouse, MOUSE_SCHEMA)
+
+    assert len(blob) * 5 < len(json.dumps(mouse).encode())
+
+    columns = decode_columns(blob)
+    assert columns["timestamp"].dtype == np.int64
+    assert columns["speed"].dtype == np.float32
+    assert len(columns["x"]) == 5000
+
+
+@pytest.mark.unit
+def test_telemetry_model_decodes_lazily():
+    mouse = _mouse(10)
+    telemetry = BehaviorTelemetry(
+        mouse_blob=encode_events(mouse, MOUSE_SCHEMA), keyboard_blob=None
+    )
+
+    assert telemetry.mouse_movements == mouse
+    assert telemetry.keyboard_events == []
+    assert decode_events(encode_events([], CLICKSTREAM_SCHEMA)) == []
+
+
+@pytest.mark.unit
+def test_missing_values_and_floats_survive_round_trip():
+    keyboard = [
+        {"timestamp": 1_700_000_000_000, "key": "*", "duration": 81.25},
+        {"timestamp": 1_700_000_000_120, "key": None, "duration": None},
+        {"timestamp": 1_700_000_000_250, "duration": 79.5},
+    ]
+    mouse = _mouse(3)
+    mouse[1]["speed"] = None
+    del mouse[2]["curvature"]
+    mouse[0]["acceleration"] = 0.1 + 0.2  # float32 로 표현 불가 → float64
+
+    decoded = decode_events(encode_events(keyboard, KEYBOARD_SCHEMA))
+    assert decoded == [
+        {"timestamp": 1_700_000_000_000, "key": "*", "duration": 81.25},
+        {"timestamp": 1_700_000_000_120},
+        {"timestamp": 1_700_000_000_250, "duration": 79.5},
+    ]
+
+    decoded = decode_events(encode_events(mouse, MOUSE_SCHEMA))
+    assert decoded[0] == mouse[0]
+    assert "speed" not in decoded[1]
+    assert "curvature" not in decoded[2]
+
+    # 컬럼 배열에서는 누락 = NaN (분석 엔진과 같은 의미)
+    columns = decode_columns(encode_events(mouse, MOUSE_SCHEMA))
+    assert np.isnan(columns["speed"][1])
+    assert np.isnan(columns["curvature"][2])
+    assert columns["timestamp"].dtype == np.int64
@@ -0,0 +1,259 @@
+"""
+거래 파티션 관리 유닛 테스트
+
+- 파티션 기간 계산 (월/일, 연말 경계) 및 파티션 경계 파싱
+- created_within: timezone 있는 값은 UTC 로 바꿔 컬럼 캐스팅 없이 비교
+- ensure_partitions: 기존 (legacy 포함) 범위와 겹치지 않는 파티션만 생성
+- archive_expired: 보존 기간이 지난 파티션만 떼어내 아카이브 스키마로 이동
+  (검토 큐/위험 요인 행도 함께 이동)
+- assign_partition_key: 서버 시각 배정, 같은 주문 재요청은 같은 값
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models.transaction import Transaction
+from src.services.transaction_partitions import (
+    DEFAULT_PARTITION,
+    LEGACY_PARTITION,
+    TransactionPartitionManager,
+    assign_partition_key,
+    created_within,
+    parse_partition_bound,
+    partition_plan,
+)
+
+
+class _Result:
+    def __init__(self, rows=None, scalar=None):
+        self.rows = rows or []
+        self.scalar = scalar
+
+    def all(self):
+        return self.rows
+
+    def scalar_one_or_none(self):
+        return self.scalar
+
+
+class _FakeCatalog:
+    """pg_inherits / DDL 만 흉내 내는 가짜 세션 팩토리"""
+
+    def __init__(self, partitions):
+        self.partitions = dict(partitions)
+        self.statements = []
+
+    def __call__(self):
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if "pg_inherits" in sql:
+            return _Result(rows=list(self.catalog.partitions.items()))
+        if sql.startswith("SELECT 1 FROM transactions_default"):
+            return _Result(scalar=None)
+        self.catalog.statements.append(sql)
+        return _Result()
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.unit
+def test_partition_plan_and_bounds():
+    plan = partition_plan(datetime(2026, 11, 18, 13, 5), interval="month", premake=2)
+    assert plan == [
+        ("transactions_p202611", datetime(2026, 11, 1), datetime(2026, 12, 1)),
+        ("transactions_p202612", datetime(2026, 12, 1), datetime(2027, 1, 1)),
+        ("transactions_p202701", datetime(2027, 1, 1), datetime(2027, 2, 1)),
+    ]
+
+    daily = partition_plan(datetime(2026, 12, 31, 23, 59), interval="day", premake=1)
+    assert [name for name, _, _ in daily] == [
+        "transactions_p20261231",
+        "transactions_p20270101",
+    ]
+
+    assert parse_partition_bound(
+        "FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')"
+    ) == (datetime(2026, 10, 1), datetime(2026, 11, 1))
+    assert parse_partition_bound(
+        "FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00')"
+    ) == (None, datetime(2026, 11, 1))
+    assert parse_partition_bound("DEFAULT") is None
+
+
+@pytest.mark.unit
+def test_created_within_compares_bare_column_in_utc():
+    start = datetime(2026, 10, 18, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    condition = created_within(start, datetime(2026, 10, 19))
+
+    compiled = condition.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "transactions.created_at >= " in sql
+    assert "transactions.created_at < " in sql
+    assert "CAST" not in sql and "date_trunc" not in sql
+    assert list(compiled.params.values()) == [
+        datetime(2026, 10, 18, 0, 0),
+        datetime(2026, 10, 19),
+    ]
+
+
+@pytest.mark.unit
+async def test_ensure_partitions_skips_ranges_covered_by_legacy():
+    catalog = _FakeCatalog(
+        {LEGACY_PARTITION: "FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00')"}
+    )
+    manager = TransactionPartitionManager(session_factory=catalog, premake=2)
+
+    created = await manager.ensure_partitions(datetime(2026, 10, 18))
+
+    assert created == ["transactions_p202611", "transactions_p202612"]
+    assert any(
+        f"{DEFAULT_PARTITION} PARTITION OF transactions DEFAULT" in s
+        for s in catalog.statements
+    )
+    assert any(
+        "transactions_p202611 PARTITION OF transactions "
+        "FOR VALUES FROM ('2026-11-01 00:00:00') TO ('2026-12-01 00:00:00')" in s
+        for s in catalog.statements
+    )
+
+
+@pytest.mark.unit
+async def test_archive_expired_detaches_only_old_partitions():
+    catalog = _FakeCatalog(
+        {
+            DEFAULT_PARTITION: "DEFAULT",
+            "transactions_p202408": "FOR VALUES FROM ('2024-08-01 00:00:00') TO ('2024-09-01 00:00:00')",
+            "transactions_p202409": "FOR VALUES FROM ('2024-09-01 00:00:00') TO ('2024-10-01 00:00:00')",
+            "transactions_p202610": "FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')",
+        }
+    )
+    manager = TransactionPartitionManager(
+        session_factory=catalog, retention_days=760, archive_tablespace="cold"
+    )
+
+    archived = await manager.archive_expired(datetime(2026, 10, 18))
+
+    assert archived == ["transactions_p202408"]
+    assert catalog.statements == [
+        "ALTER TABLE transactions DETACH PARTITION transactions_p202408",
+        "CREATE SCHEMA IF NOT EXISTS fds_archive",
+        "ALTER TABLE transactions_p202408 SET SCHEMA fds_archive",
+        "ALTER TABLE fds_archive.transactions_p202408 SET TABLESPACE cold",
+        "CREATE TABLE IF NOT EXISTS fds_archive.review_queue "
+        "(LIKE review_queue INCLUDING ALL)",
+        "WITH moved AS (DELETE FROM review_queue c "
+        "USING fds_archive.transactions_p202408 t "
+        "WHERE c.transaction_id = t.id RETURNING c.*) "
+        "INSERT INTO fds_archive.review_queue SELECT * FROM moved",
+        "CREATE TABLE IF NOT EXISTS fds_archive.risk_factors "
+        "(LIKE risk_factors INCLUDING ALL)",
+        "WITH moved AS (DELETE FROM risk_factors c "
+        "USING fds_archive.transactions_p202408 t "
+        "WHERE c.transaction_id = t.id RETURNING c.*) "
+        "INSERT INTO fds_archive.risk_factors SELECT * FROM moved",
+    ]
+
+    # 보존 기간 0 → 아카이브하지 않음
+    manager.retention_days = 0
+    assert await manager.archive_expired(datetime(2030, 1, 1)) == []
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.values = {}
+        self.fail = fail
+
+    async def set(self, key, value, nx=False, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+class _LookupSession:
+    def __init__(self, created_at):
+        self.created_at = created_at
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(scalar=self.created_at)
+
+
+@pytest.mark.unit
+async def test_partition_key_is_server_time_and_stable_per_order():
+    redis = _FakeRedis()
+    order_id = uuid.uuid4()
+    first = datetime(2026, 10, 31, 23, 59, 59)
+
+    assert await assign_partition_key(order_id, redis, now=first) == first
+    # 재요청 (다음 달로 넘어간 뒤) 도 같은 파티션 키 → 같은 (id, created_at)
+    retried = await assign_partition_key(
+        order_id, redis, now=datetime(2026, 11, 1, 0, 0, 5)
+    )
+    assert retried == first
+
+    other = datetime(2026, 11, 1, 0, 0, 5)
+    assert await assign_partition_key(uuid.uuid4(), redis, now=other) == other
+
+    # timezone 있는 서버 시각은 UTC 로 변환
+    kst = datetime(2026, 11, 1, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    assert await assign_partition_key(uuid.uuid4(), redis, now=kst) == datetime(
+        2026, 11, 1, 0, 0
+    )
+
+
+@pytest.mark.unit
+async def test_partition_key_falls_back_to_stored_transaction():
+    stored = datetime(2026, 10, 2, 8, 0)
+    session = _LookupSession(stored)
+    order_id = uuid.uuid4()
+
+    now = datetime(2026, 10, 18)
+    assert (
+        await assign_partition_key(order_id, _FakeRedis(fail=True), session, now)
+        == stored
+    )
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "WHERE transactions.order_id = " in sql
+
+    # 저장된 거래가 없으면 서버 시각
+    assert (
+        await assign_partition_key(
+            order_id, _FakeRedis(fail=True), _LookupSession(None), now
+        )
+        == now
+    )
+
+
+@pytest.mark.unit
+def test_order_id_is_unique_with_partition_key():
+    unique = [
+        [column.name for column in index.columns]
+        for index in Transaction.__table__.indexes
+        if index.unique
+    ]
+    assert ["order_id", "created_at"] in unique
+    assert [c.name for c in Transaction.__table__.primary_key] == ["id", "created_at"]
@@ -0,0 +1,217 @@
+"""
+외부 검증 캐시 유닛 테스트
+
+- 정규화 키 기준 캐싱 (재방문 고객 재검증 없음)
+- single-flight: 동시 조회는 한 번만 호출 (워커 간에는 Redis 잠금)
+- 실패 결과 negative caching, 부분 실패 결과는 캐싱하지 않음
+- 공유 GCRA 속도 제한 (워커 수와 무관하게 제공자별 한도 유지)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.external_verification_service import ExternalVerificationService
+from src.services.verification_cache import (
+    PROVIDER_POLICIES,
+    ProviderGate,
+    ProviderUnavailableError,
+    VerificationCache,
+    normalize_phone,
+)
+from src.utils.rate_limiter import GCRARateLimiter, gcra
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.locks = {}
+
+    async def get_json(self, key):
+        return self.data.get(key)
+
+    async def set_json(self, key, value, ttl=None):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def acquire_lock(self, key, token, ttl):
+        if key in self.locks:
+            return False
+        self.locks[key] = token
+        return True
+
+    async def release_lock(self, key, token):
+        if self.locks.get(key) != token:
+            return False
+        del self.locks[key]
+        return True
+
+    async def exists(self, key):
+        return key in self.locks
+
+
+class _FakeScriptRedis:
+    """GCRA_SCRIPT 를 gcra() 로 실행하는 가짜 Redis (워커 간 공유 TAT)"""
+
+    def __init__(self):
+        self.tat = {}
+
+    def register_script(self, script):
+        async def run(keys, args):
+            now_ms, interval_ms, tolerance_ms, cost = args
+            allowed, new_tat, retry_after_ms, reset_after_ms = gcra(
+                self.tat.get(keys[0]), now_ms, interval_ms, tolerance_ms, cost
+            )
+            if allowed:
+                self.tat[keys[0]] = new_tat
+            return [int(allowed), retry_after_ms, reset_after_ms]
+
+        return run
+
+
+@pytest.mark.unit
+async def test_concurrent_lookups_share_one_fetch():
+    cache = VerificationCache(cache=_FakeRedis())
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"reputation": "high"}
+
+    results = await asyncio.gather(
+        *[cache.get_or_fetch("emailrep", "user@example.com", fetch) for _ in range(10)]
+    )
+    again = await cache.get_or_fetch("emailrep", "user@example.com", fetch)
+
+    assert calls == 1
+    assert all(r == {"reputation": "high"} for r in results)
+    assert again == {"reputation": "high"}
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 9, 1)
+
+
+@pytest.mark.unit
+async def test_failures_are_negatively_cached_with_short_ttl():
+    redis = _FakeRedis()
+    cache = VerificationCache(cache=redis)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("provider down")
+
+    with pytest.raises(ConnectionError):
+        await cache.get_or_fetch("numverify", "KR:01012345678", fetch)
+    with pytest.raises(ProviderUnavailableError):
+        await cache.get_or_fetch("numverify", "KR:01012345678", fetch)
+
+    assert calls == 1
+    (ttl,) = redis.ttls.values()
+    assert ttl == 300
+
+
+@pytest.mark.unit
+async def test_repeat_customer_is_not_reverified():
+    service = ExternalVerificationService(
+        max_retries=1, verification_cache=VerificationCache(cache=_FakeRedis())
+    )
+    calls = {"emailrep": 0, "hibp": 0}
+
+    async def check_email_reputation(email):
+        calls["emailrep"] += 1
+        return {
+            "email": email,
+            "reputation": "high",
+            "suspicious": False,
+            "details": {},
+        }
+
+    async def check_breached_account(email):
+        calls["hibp"] += 1
+        return {"email": email, "breached": False, "breach_count": 0, "paste_count": 0}
+
+    service.emailrep.check_email_reputation = check_email_reputation
+    service.hibp.check_breached_account = check_breached_account
+
+    first = await service.verify_email_comprehensive("Buyer@Example.com")
+    second = await service.verify_email_comprehensive(" buyer@example.com ")
+
+    assert calls == {"emailrep": 1, "hibp": 1}
+    assert first["overall_risk_score"] == second["overall_risk_score"]
+    assert second["emailrep"]["available"] is True
+
+
+@pytest.mark.unit
+async def test_lookup_is_shared_across_workers():
+    redis = _FakeRedis()
+    workers = [VerificationCache(cache=redis, poll_interval=0.01) for _ in range(2)]
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"valid": True}
+
+    results = await asyncio.gather(
+        *[w.get_or_fetch("numverify", "KR:+821012345678", fetch) for w in workers]
+    )
+
+    assert calls == 1
+    assert results == [{"valid": True}, {"valid": True}]
+    assert workers[1].get_stats()["remote_coalesced"] == 1
+    assert redis.locks == {}
+
+
+@pytest.mark.unit
+async def test_partial_results_are_not_cached():
+    redis = _FakeRedis()
+    cache = VerificationCache(cache=redis)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"breached": True, "paste_count": 0, "partial": True}
+
+    await cache.get_or_fetch("hibp", "user@example.com", fetch)
+    await cache.get_or_fetch("hibp", "user@example.com", fetch)
+
+    assert calls == 2
+    assert redis.data == {}
+    assert cache.get_stats()["uncached"] == 2
+
+
+@pytest.mark.unit
+async def test_rate_limit_is_shared_across_workers():
+    redis = _FakeScriptRedis()
+    policy = PROVIDER_POLICIES["hibp"]  # 10/s, burst 10
+    gates = [
+        ProviderGate("hibp", policy, GCRARateLimiter(redis, prefix="provider_rate"))
+        for _ in range(2)
+    ]
+
+    async def call(gate):
+        async with gate:
+            pass
+
+    start = time.monotonic()
+    await asyncio.gather(*[call(gates[i % 2]) for i in range(12)])
+    elapsed = time.monotonic() - start
+
+    # 두 워커 합계로 버스트 이후 나머지 요청은 10/s 로 대기
+    assert elapsed >= 0.1
+    assert sum(gate.throttled for gate in gates) > 0
+    assert list(redis.tat) == ["provider_rate:hibp"]
+
+
+@pytest.mark.unit
+def test_phone_normalization():
+    assert normalize_phone("+82 10-1234-5678", "kr") == "KR:+821012345678"
+    assert normalize_phone("010 1234 5678") == normalize_phone("010-1234-5678")
@@ -0,0 +1,386 @@
+"""
+Write-Behind 영속화 파이프라인 유닛 테스트
+
+- 배치 플러시 (FK 순서, 멱등 INSERT)
+- DB 장애 시 스필 파일(JSON) 기록 후 재생, 손상된 줄은 격리
+- 제약 위반 행은 행 단위 재기록 후 데드레터로 분리
+- 세션 재전송(behavior_patterns)은 upsert
+- 평가 API: 위험 요인/룰 실행 기록이 거래와 같은 배치로 기록
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+import src.api.evaluation as evaluation_api
+import src.engines.evaluation_engine as evaluation_engine
+import src.utils.redis_client as redis_client
+from src.models import ReviewQueue, ReviewStatus, Transaction
+from src.models.behavior_pattern import BehaviorPattern
+from src.models.schemas import (
+    DecisionEnum,
+    EvaluationMetadata,
+    FDSEvaluationRequest,
+    FDSEvaluationResponse,
+    RecommendedAction,
+    RiskFactor,
+    RiskLevelEnum,
+    SeverityEnum,
+)
+from src.models.transaction import (
+    DeviceType,
+    EvaluationStatus,
+    RiskLevel,
+)
+from src.services.write_behind import (
+    UPSERT_TABLES,
+    WriteBehindQueue,
+    decode_record,
+    encode_record,
+    model_to_row,
+)
+
+
+class _Dialect:
+    name = "postgresql"
+
+
+class _Bind:
+    dialect = _Dialect()
+
+
+class _FakeDatabase:
+    """INSERT 문을 테이블 단위로 기록하는 가짜 DB (PK 중복은 무시)"""
+
+    def __init__(self):
+        self.tables = {}
+        self.statement_order = []
+        self.down = False
+        self.rejected_ids = set()
+        self.commits = []
+
+    def session(self):
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    bind = _Bind()
+
+    def __init__(self, database):
+        self.database = database
+        self.pending = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        if self.database.down:
+            raise ConnectionError("db down")
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        if stmt.table.name in UPSERT_TABLES:
+            assert "ON CONFLICT (session_id) DO UPDATE" in sql
+        else:
+            assert "ON CONFLICT DO NOTHING" in sql
+        if any(
+            row.get("id") in self.database.rejected_ids for row in stmt._multi_values[0]
+        ):
+            raise IntegrityError("INSERT", {}, Exception("violates check constraint"))
+        self.pending.append(stmt)
+
+    async def commit(self):
+        self.database.commits.append([stmt.table.name for stmt in self.pending])
+        for stmt in self.pending:
+            name = stmt.table.name
+            self.database.statement_order.append(name)
+            rows = self.database.tables.setdefault(name, {})
+            key = (
+                "id" if "id" in stmt.table.c else stmt.table.primary_key.columns[0].key
+            )
+            for row in stmt._multi_values[0]:
+                if name in UPSERT_TABLES:
+                    rows[row["session_id"]] = row
+                else:
+                    rows.setdefault(row[key], row)
+
+
+def _transaction() -> Transaction:
+    return Transaction(
+        id=uuid4(),
+        user_id=uuid4(),
+        order_id=uuid4(),
+        amount=Decimal("150000.00"),
+        ip_address="211.234.10.1",
+        user_agent="pytest",
+        device_type=DeviceType.DESKTOP,
+        risk_score=90,
+        risk_level=RiskLevel.HIGH,
+        evaluation_status=EvaluationStatus.MANUAL_REVIEW,
+        evaluation_time_ms=12,
+    )
+
+
+@pytest.mark.unit
+def test_model_to_row_applies_python_defaults():
+    review = ReviewQueue(transaction_id=uuid4(), status=ReviewStatus.PENDING)
+
+    table_name, row = model_to_row(review)
+
+    assert table_name == "review_queue"
+    assert row["id"] is not None
+    assert row["status"] == ReviewStatus.PENDING
+
+
+@pytest.mark.unit
+async def test_flush_writes_parents_first_and_is_idempotent(tmp_path):
+    database = _FakeDatabase()
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        batch_size=50,
+        flush_interval_ms=20,
+        spill_path=str(tmp_path / "spill"),
+    )
+
+    transactions = [_transaction() for _ in range(10)]
+    # 자식 레코드를 먼저 넣어도 transactions 가 먼저 기록되어야 함
+    for tx in transactions:
+        await queue.enqueue(ReviewQueue(id=uuid4(), transaction_id=tx.id))
+    await queue.enqueue_many(transactions)
+    # 재전송된 거래는 ON CONFLICT DO NOTHING 으로 무시
+    await queue.enqueue(transactions[0])
+    await queue.stop()
+
+    assert database.statement_order.index("transactions") < (
+        database.statement_order.index("review_queue")
+    )
+    assert len(database.tables["transactions"]) == 10
+    assert len(database.tables["review_queue"]) == 10
+    assert queue.get_stats()["queue_depth"] == 0
+
+
+@pytest.mark.unit
+async def test_failed_batch_is_spilled_and_replayed(tmp_path):
+    database = _FakeDatabase()
+    spill_path = tmp_path / "spill"
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        flush_interval_ms=20,
+        max_retries=2,
+        spill_path=str(spill_path),
+    )
+
+    database.down = True
+    await queue.enqueue_many([_transaction() for _ in range(3)])
+    await queue.stop()
+
+    assert spill_path.exists()
+    assert queue.spilled == 3
+    assert "transactions" not in database.tables
+
+    # DB 복구 후 재시작 시 스필 파일 재생
+    database.down = False
+    await queue.start()
+    await queue.stop()
+
+    assert not spill_path.exists()
+    assert queue.replayed == 3
+    assert len(database.tables["transactions"]) == 3
+
+
+@pytest.mark.unit
+def test_spill_record_roundtrips_as_json():
+    record = model_to_row(_transaction())
+
+    line = encode_record(record)
+
+    # pickle 이 아닌 평문 JSON
+    assert json.loads(line)["table"] == "transactions"
+    assert decode_record(line) == record
+
+
+@pytest.mark.unit
+async def test_corrupt_spill_lines_are_quarantined(tmp_path):
+    database = _FakeDatabase()
+    spill_path = tmp_path / "spill"
+    good = encode_record(model_to_row(_transaction()))
+    spill_path.write_text(f"{good}\nnot json\n" '{"table": "nope", "row": {}}\n')
+
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        flush_interval_ms=20,
+        spill_path=str(spill_path),
+    )
+    await queue.start()
+    await queue.stop()
+
+    assert queue.replayed == 1
+    assert queue.quarantined == 2
+    assert len(database.tables["transactions"]) == 1
+    assert (tmp_path / "spill.corrupt").read_text().splitlines() == [
+        "not json",
+        '{"table": "nope", "row": {}}',
+    ]
+    assert not spill_path.exists()
+
+
+@pytest.mark.unit
+async def test_rejected_row_is_dead_lettered_not_spilled(tmp_path):
+    database = _FakeDatabase()
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        flush_interval_ms=20,
+        spill_path=str(tmp_path / "spill"),
+    )
+    transactions = [_transaction() for _ in range(3)]
+    poisoned = transactions[1]
+    database.rejected_ids.add(poisoned.id)
+
+    await queue.enqueue_many(transactions)
+    await queue.enqueue(ReviewQueue(id=uuid4(), transaction_id=poisoned.id))
+    await queue.stop()
+
+    # 나머지 행은 기록, 거부된 행만 데드레터 (스필 재시도 없음)
+    assert set(database.tables["transactions"]) == {
+        transactions[0].id,
+        transactions[2].id,
+    }
+    assert len(database.tables["review_queue"]) == 1
+    assert queue.spilled == 0
+    assert not (tmp_path / "spill").exists()
+
+    (entry,) = [
+        json.loads(line) for line in (tmp_path / "spill.dead").read_text().splitlines()
+    ]
+    assert entry["table"] == "transactions"
+    assert entry["row"]["id"] == str(poisoned.id)
+    assert "violates check constraint" in entry["error"]
+
+
+@pytest.mark.unit
+async def test_resent_session_is_upserted_with_latest_values(tmp_path):
+    database = _FakeDatabase()
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        flush_interval_ms=20,
+        spill_path=str(tmp_path / "spill"),
+    )
+    session_id = uuid4()
+
+    # 같은 배치 안의 중복 키는 마지막 값만 기록 (DO UPDATE 중복 갱신 오류 방지)
+    await queue.enqueue(BehaviorPattern(session_id=session_id, bot_score=10))
+    await queue.enqueue(BehaviorPattern(session_id=session_id, bot_score=40))
+    await queue.stop()
+    await queue.start()
+    await queue.enqueue(BehaviorPattern(session_id=session_id, bot_score=90))
+    await queue.stop()
+
+    assert database.tables["behavior_patterns"][session_id]["bot_score"] == 90
+    assert database.statement_order.count("behavior_patterns") == 2
+
+
+def _evaluation_request() -> FDSEvaluationRequest:
+    return FDSEvaluationRequest(
+        transaction_id=uuid4(),
+        user_id=uuid4(),
+        order_id=uuid4(),
+        amount=Decimal("1500000"),
+        ip_address="211.234.10.1",
+        user_agent="pytest",
+        device_fingerprint={"device_type": "desktop"},
+        shipping_info={"name": "홍길동", "address": "서울", "phone": "010-0000-0000"},
+        payment_info={"method": "credit_card", "card_last_four": "1234"},
+        timestamp=datetime.utcnow(),
+    )
+
+
+@pytest.mark.unit
+async def test_evaluation_risk_factors_and_rule_executions_reach_db(
+    tmp_path, monkeypatch
+):
+    database = _FakeDatabase()
+    queue = WriteBehindQueue(
+        session_factory=database.session,
+        batch_size=2,
+        flush_interval_ms=20,
+        spill_path=str(tmp_path / "spill"),
+    )
+    request = _evaluation_request()
+    rule_id = uuid4()
+    response = FDSEvaluationResponse(
+        transaction_id=request.transaction_id,
+        risk_score=85,
+        risk_level=RiskLevelEnum.HIGH,
+        decision=DecisionEnum.BLOCKED,
+        risk_factors=[
+            RiskFactor(
+                factor_type="amount_threshold",
+                factor_score=50,
+                description="고액 거래",
+                severity=SeverityEnum.HIGH,
+            ),
+            RiskFactor(
+                factor_type="rule_payment",
+                factor_score=35,
+                description="[RULE] 테스트 카드",
+                severity=SeverityEnum.CRITICAL,
+                rule_id=str(rule_id),
+            ),
+        ],
+        evaluation_metadata=EvaluationMetadata(
+            evaluation_time_ms=12, timestamp=datetime.utcnow()
+        ),
+        recommended_action=RecommendedAction(
+            action=DecisionEnum.BLOCKED,
+            reason="고위험",
+            additional_auth_required=False,
+        ),
+    )
+
+    class _Engine:
+        def __init__(self, db, redis):
+            pass
+
+        async def evaluate(self, evaluation_request):
+            return response
+
+    async def _none(*args, **kwargs):
+        return None
+
+    async def _partition_key(*args, **kwargs):
+        return datetime.utcnow()
+
+    monkeypatch.setattr(evaluation_engine, "EvaluationEngine", _Engine)
+    monkeypatch.setattr(redis_client, "get_redis", _none)
+    monkeypatch.setattr(evaluation_api, "assign_partition_key", _partition_key)
+    monkeypatch.setattr(evaluation_api, "get_review_queue_engine", _none)
+    monkeypatch.setattr(evaluation_api, "get_write_behind_queue", lambda: queue)
+
+    # 재전송된 평가도 같은 행 ID 로 중복 기록되지 않음
+    for _ in range(2):
+        await evaluation_api.evaluate_transaction(request, db=None, token_valid=True)
+    await queue.stop()
+
+    # batch_size 보다 큰 묶음도 나뉘지 않고 한 커밋에 FK 순서대로 기록
+    assert database.commits[0] == [
+        "transactions",
+        "review_queue",
+        "risk_factors",
+        "rule_executions",
+    ]
+    factors = database.tables["risk_factors"].values()
+    assert {row["transaction_id"] for row in factors} == {request.transaction_id}
+    assert sorted(row["factor_type"] for row in factors) == [
+        "amount_threshold",
+        "rule_payment",
+    ]
+    (execution,) = database.tables["rule_executions"].values()
+    assert execution["transaction_id"] == request.transaction_id
+    assert execution["rule_id"] == rule_id
+    assert execution["matched"] is True
@@ -0,0 +1,171 @@
+"""
+XAIService 유닛 테스트
+
+- 상주 워커 풀 + (모델 버전, feature 해시) 캐시
+- 배치 SHAP 결과가 단건 결과와 일치
+- 비동기 작업 모드 (상태/결과는 워커 간 공유 저장소)
+- 타임아웃된 계산이 워커 슬롯을 점유하는 동안 새 계산은 거절
+"""
+
+import asyncio
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from src.services.xai_service import XAIJobStore, XAIService
+
+pytest.importorskip("shap")
+
+FEATURES = ["amount", "velocity_1h", "bot_score"]
+
+
+class _FakeRedis:
+    """작업 저장소가 쓰는 명령만 흉내 내는 가짜 Redis (TTL 은 기록만)"""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append(
+            lambda r: (r.values.__setitem__(key, value), r.ttls.__setitem__(key, ex))
+        )
+
+    def rpush(self, key, *values):
+        self.commands.append(lambda r: r.lists.setdefault(key, []).extend(values))
+
+    def expire(self, key, seconds):
+        self.commands.append(lambda r: r.ttls.__setitem__(key, seconds))
+
+    async def execute(self):
+        for command in self.commands:
+            command(self.redis)
+
+
+@pytest.fixture
+def redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def xai_service(redis):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((200, 3)), columns=FEATURES)
+    y = (X["bot_score"] > 0.7).astype(int)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+
+    service = XAIService(enable_lime=False, batch_size=8, job_store=XAIJobStore(redis))
+    service.initialize_explainers(
+        tree_model=model, feature_names=FEATURES, model_version="rf-1.0.0"
+    )
+    yield service
+    service.shutdown()
+
+
+def _rows(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(rng.random((n, 3)), columns=FEATURES)
+
+
+@pytest.mark.unit
+async def test_explanation_is_cached_by_model_version_and_features(xai_service):
+    features = _rows(1)
+
+    first = await xai_service.explain_prediction(uuid.uuid4(), features, model=None)
+    tx_id = uuid.uuid4()
+    second = await xai_service.explain_prediction(tx_id, features.copy(), model=None)
+
+    assert first["shap_values"] is not None
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert second["transaction_id"] == str(tx_id)
+    assert second["shap_values"] == first["shap_values"]
+    assert xai_service.get_stats()["cache_hits"] == 1
+
+
+@pytest.mark.unit
+async def test_batch_matches_single_explanations(xai_service):
+    features = _rows(20)
+    tx_ids = [uuid.uuid4() for _ in range(20)]
+
+    batch = await xai_service.explain_batch(tx_ids, features)
+    # 배치에서 계산된 결과가 캐시되어 단건 조회에 재사용
+    cached = await xai_service.explain_prediction(
+        tx_ids[3], features.iloc[[3]], model=None
+    )
+    xai_service._cache.clear()
+    single = await xai_service.explain_prediction(
+        tx_ids[3], features.iloc[[3]], model=None
+    )
+
+    assert [r["transaction_id"] for r in batch] == [str(t) for t in tx_ids]
+    assert cached["cached"] is True
+    assert "cached" not in single
+    for got, expected in zip(batch[3]["shap_values"], single["shap_values"]):
+        assert got["feature"] == expected["feature"]
+        assert np.isclose(got["shap_value"], expected["shap_value"])
+
+
+@pytest.mark.unit
+async def test_job_mode_processes_all_rows(xai_service, redis):
+    features = _rows(20)
+    tx_ids = [uuid.uuid4() for _ in range(20)]
+
+    job = await xai_service.submit_job(tx_ids, features)
+    for _ in range(100):
+        if (await xai_service.get_job(job.job_id)).finished_at is not None:
+            break
+        await asyncio.sleep(0.05)
+
+    # 다른 API 워커(별도 서비스 인스턴스)에서도 같은 작업이 조회됨
+    other_worker = XAIService(enable_lime=False, job_store=XAIJobStore(redis))
+    job = await other_worker.get_job(job.job_id)
+    other_worker.shutdown()
+
+    assert job.status == "completed"
+    assert job.completed == 20
+    assert [r["transaction_id"] for r in job.results] == [str(t) for t in tx_ids]
+    assert all(r["shap_values"] for r in job.results)
+    assert all(ttl == 24 * 3600 for ttl in redis.ttls.values())
+
+    summary = await other_worker.get_job(job.job_id, include_results=False)
+    assert summary.results == []
+    assert await xai_service.get_job("missing") is None
+
+
+@pytest.mark.unit
+async def test_timed_out_work_holds_its_slot_until_it_finishes():
+    service = XAIService(enable_lime=False, max_workers=1)
+    release = threading.Event()
+
+    # 타임아웃된 계산은 스레드에서 계속 실행되며 슬롯을 점유
+    assert await service._run_in_pool(release.wait, 0.05, "stuck") is None
+    # 슬롯이 막혀 있으므로 새 계산은 실행기에 쌓이지 않고 거절
+    assert await service._run_in_pool(lambda: 42, 0.05, "next") is None
+    assert service.get_stats()["pool_timeouts"] == 1
+    assert service.get_stats()["pool_rejections"] == 1
+
+    # 막힌 계산이 끝나면 슬롯 반환
+    release.set()
+    assert await service._run_in_pool(lambda: 42, 1.0, "after") == 42
+    service.shutdown()
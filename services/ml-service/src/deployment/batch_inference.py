@@ -2,15 +2,20 @@
 배치 추론 파이프라인 모듈
 
 동시 요청 50개 이상 시 배치 추론을 활성화하여 처리량 향상
-- 요청 큐 관리
-- 동적 배치 구성
-- 배치 크기 자동 조정
-- 추론 결과 매핑
+- 이벤트 기반 배치 구성 (요청 도착 또는 마감 시각에 기상)
+- 우선순위 레인 (체크아웃 > 배치 재평가)
+- 실행기(Executor) 기반 추론 (이벤트 루프 비차단)
+- 사전 할당 입력 버퍼 재사용
+- 체크아웃 배치 추론 시간 기반 적응형 배치 크기 조정
+- 큐 깊이 / 배치 크기 히스토그램
 """
 
 import asyncio
+import bisect
 import time
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import IntEnum
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 import logging
@@ -19,6 +24,23 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+# 히스토그램 버킷 상한 (이하 포함)
+BATCH_SIZE_BUCKETS: Tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+QUEUE_DEPTH_BUCKETS: Tuple[int, ...] = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class InferencePriority(IntEnum):
+    """
+    추론 요청 우선순위 레인 (값이 작을수록 먼저 처리)
+
+    - CHECKOUT: 실시간 결제 평가 (응답 지연에 민감)
+    - RESCORING: 배치 재평가 (처리량 우선, 지연 허용)
+    """
+
+    CHECKOUT = 0
+    RESCORING = 1
+
+
 @dataclass
 class InferenceRequest:
     """
@@ -27,14 +49,45 @@ class InferenceRequest:
     Attributes:
         request_id: 요청 고유 ID
         input_data: 입력 데이터
-        timestamp: 요청 시각
         future: 비동기 결과 Future
+        priority: 우선순위 레인
+        timestamp: 요청 시각 (time.monotonic 기준)
     """
 
     request_id: str
     input_data: Any
-    timestamp: float = field(default_factory=time.time)
-    future: asyncio.Future = field(default_factory=asyncio.Future)
+    future: asyncio.Future
+    priority: InferencePriority = InferencePriority.CHECKOUT
+    timestamp: float = field(default_factory=time.monotonic)
+
+
+class _Histogram:
+    """
+    고정 버킷 누적 히스토그램 (Prometheus histogram 형식)
+    """
+
+    def __init__(self, buckets: Tuple[int, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        누적(cumulative) 버킷 카운트 반환
+        """
+        result = {}
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            result[str(bound)] = cumulative
+        result["+Inf"] = self.total
+        return result
 
 
 class BatchInferencePipeline:
@@ -42,11 +95,14 @@ class BatchInferencePipeline:
     배치 추론 파이프라인
 
     Features:
-    - 동시 요청 수집 및 배치 구성
-    - 배치 크기 50 기본, 최대 100
-    - 최대 배치 지연 50ms
-    - 동적 배치 크기 조정 (처리량 기반)
-    - 요청별 결과 매핑
+    - 요청 도착 이벤트 또는 가장 오래된 요청의 마감 시각에 배치 구성
+    - 우선순위 레인: 체크아웃 요청을 배치 재평가 요청보다 먼저 채움
+    - 추론은 전용 실행기에서 수행하여 이벤트 루프를 막지 않음
+    - 입력은 사전 할당된 버퍼에 복사 (배치마다 np.array 생성 없음)
+    - 체크아웃 레인 배치의 추론(서비스) 시간과 SLA 목표를 비교해 배치 크기 자동 조정 (AIMD)
+      (마감 시각까지의 대기 시간은 제외: 저부하 시 배치가 줄어드는 것을 방지)
+    - 풀 버퍼를 참조하는 추론 결과는 복사 후 반환 (버퍼 재사용 시 결과 덮어쓰기 방지)
+    - 큐 깊이 / 배치 크기 히스토그램 노출
 
     Performance:
     - 1,000 TPS 부하 처리
@@ -61,37 +117,82 @@ class BatchInferencePipeline:
         max_batch_size: int = 100,
         max_batch_delay_ms: int = 50,
         min_batch_size: int = 10,
+        sla_target_ms: float = 50.0,
+        rescoring_batch_delay_ms: Optional[int] = None,
+        max_concurrent_batches: int = 2,
+        adaptive: bool = True,
+        executor: Optional[Executor] = None,
     ):
         """
         Args:
             inference_func: 배치 추론 함수 (입력: (batch_size, ...), 출력: (batch_size, ...))
-            batch_size: 목표 배치 크기
+            batch_size: 초기 목표 배치 크기 (adaptive=True면 자동 조정)
             max_batch_size: 최대 배치 크기
-            max_batch_delay_ms: 최대 배치 대기 시간 (ms)
-            min_batch_size: 최소 배치 크기 (이하 시 즉시 처리)
+            max_batch_delay_ms: 체크아웃 레인 최대 배치 대기 시간 (ms)
+            min_batch_size: 적응형 조정 시 목표 배치 크기 하한
+            sla_target_ms: 체크아웃 배치 추론(서비스) 시간 목표 (ms)
+            rescoring_batch_delay_ms: 재평가 레인 최대 대기 시간 (기본: max_batch_delay_ms * 4)
+            max_concurrent_batches: 동시에 실행 가능한 배치 수 (= 입력 버퍼 수)
+            adaptive: SLA 기반 배치 크기 자동 조정 여부
+            executor: 추론 실행기 (None이면 전용 ThreadPoolExecutor 생성)
         """
         self.inference_func = inference_func
         self.batch_size = batch_size
+        self.configured_batch_size = batch_size
         self.max_batch_size = max_batch_size
         self.max_batch_delay_ms = max_batch_delay_ms
         self.min_batch_size = min_batch_size
+        self.sla_target_ms = sla_target_ms
+        self.adaptive = adaptive
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self.lane_delays: Dict[InferencePriority, float] = {
+            InferencePriority.CHECKOUT: max_batch_delay_ms / 1000.0,
+            InferencePriority.RESCORING: (
+                rescoring_batch_delay_ms
+                if rescoring_batch_delay_ms is not None
+                else max_batch_delay_ms * 4
+            )
+            / 1000.0,
+        }
+
+        # 우선순위별 요청 큐
+        self.lanes: Dict[InferencePriority, deque] = {
+            priority: deque() for priority in InferencePriority
+        }
+        self._wakeup: Optional[asyncio.Event] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._inflight: set = set()
+
+        # 추론 실행기
+        self._owns_executor = executor is None
+        self._executor = executor
 
-        # 요청 큐
-        self.request_queue: deque[InferenceRequest] = deque()
-        self.queue_lock = asyncio.Lock()
+        # 사전 할당 입력 버퍼 풀 (첫 요청의 shape/dtype 으로 지연 할당)
+        self._buffer_pool: List[np.ndarray] = []
+        self._buffer_shape: Optional[Tuple[int, ...]] = None
+        self._buffer_dtype: Optional[np.dtype] = None
 
         # 통계
         self.total_requests = 0
         self.total_batches = 0
         self.total_latency = 0.0
+        self.latency_ewma_ms: Optional[float] = None
+        self.batch_size_histogram = _Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_depth_histogram = _Histogram(QUEUE_DEPTH_BUCKETS)
 
         # 백그라운드 배치 처리 태스크
         self.batch_task: Optional[asyncio.Task] = None
         self.running = False
 
         logger.info("[BATCH PIPELINE] Initialized")
-        logger.info(f"  Target batch size: {batch_size}")
+        logger.info(f"  Target batch size: {batch_size} (adaptive={adaptive})")
         logger.info(f"  Max batch delay: {max_batch_delay_ms}ms")
+        logger.info(f"  SLA target: {sla_target_ms}ms")
+
+    @property
+    def queue_size(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values())
 
     async def start(self):
         """
@@ -101,13 +202,21 @@ class BatchInferencePipeline:
             logger.warning("[WARNING] Pipeline already running")
             return
 
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_batches,
+                thread_name_prefix="batch-inference",
+            )
+
+        self._wakeup = asyncio.Event()
+        self._batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
         self.running = True
         self.batch_task = asyncio.create_task(self._batch_processing_loop())
         logger.info("[START] Batch inference pipeline started")
 
     async def stop(self):
         """
-        배치 추론 파이프라인 중지
+        배치 추론 파이프라인 중지 (남은 요청은 모두 처리)
         """
         if not self.running:
             return
@@ -120,24 +229,35 @@ class BatchInferencePipeline:
             except asyncio.CancelledError:
                 pass
 
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
         # 남은 요청 처리
-        if len(self.request_queue) > 0:
-            logger.info(
-                f"[STOP] Processing remaining {len(self.request_queue)} requests..."
-            )
-            await self._process_batch(list(self.request_queue))
-            self.request_queue.clear()
+        if self.queue_size > 0:
+            logger.info(f"[STOP] Processing remaining {self.queue_size} requests...")
+            while self.queue_size > 0:
+                await self._process_batch(self._take_batch(self.max_batch_size))
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
         logger.info("[STOP] Batch inference pipeline stopped")
         self._log_statistics()
 
-    async def infer(self, request_id: str, input_data: Any) -> Any:
+    async def infer(
+        self,
+        request_id: str,
+        input_data: Any,
+        priority: InferencePriority = InferencePriority.CHECKOUT,
+    ) -> Any:
         """
         비동기 배치 추론 실행
 
         Args:
             request_id: 요청 고유 ID
             input_data: 입력 데이터
+            priority: 우선순위 레인 (기본: 체크아웃)
 
         Returns:
             추론 결과
@@ -146,39 +266,54 @@ class BatchInferencePipeline:
             >>> pipeline = BatchInferencePipeline(model_inference_func)
             >>> await pipeline.start()
             >>> result = await pipeline.infer("req-123", input_data)
+            >>> await pipeline.infer("rescore-1", x, InferencePriority.RESCORING)
         """
-        request = InferenceRequest(request_id=request_id, input_data=input_data)
-
-        async with self.queue_lock:
-            self.request_queue.append(request)
-            queue_size = len(self.request_queue)
+        if not self.running:
+            raise RuntimeError("Batch inference pipeline is not running")
 
-        logger.debug(f"[QUEUE] Request {request_id} added (queue size: {queue_size})")
+        request = InferenceRequest(
+            request_id=request_id,
+            input_data=input_data,
+            future=asyncio.get_running_loop().create_future(),
+            priority=priority,
+        )
+        self.lanes[priority].append(request)
 
-        # 큐 크기가 배치 크기 이상이면 즉시 처리 트리거
-        if queue_size >= self.batch_size:
-            asyncio.create_task(self._trigger_batch_processing())
+        # 배치 크기 도달 시 즉시 기상, 아니면 레인의 첫 요청이 마감 시각을 설정
+        if self.queue_size >= self.batch_size or len(self.lanes[priority]) == 1:
+            self._wakeup.set()
 
-        # 결과 대기
-        result = await request.future
-        return result
+        return await request.future
 
     async def _batch_processing_loop(self):
         """
         백그라운드 배치 처리 루프
 
-        주기적으로 큐를 확인하고 배치 처리 실행
+        요청 도착 이벤트 또는 가장 이른 마감 시각까지 대기 후 배치 구성.
+        고정 주기 폴링을 하지 않으므로 유휴 시 CPU를 쓰지 않고,
+        배치 크기 도달 시 지연 없이 즉시 처리한다.
         """
         logger.info("[LOOP] Batch processing loop started")
 
         while self.running:
             try:
-                # 최대 배치 지연 시간만큼 대기
-                await asyncio.sleep(self.max_batch_delay_ms / 1000.0)
-
-                # 큐에 요청이 있으면 처리
-                if len(self.request_queue) > 0:
-                    await self._trigger_batch_processing()
+                timeout = self._time_until_deadline()
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wakeup.clear()
+
+                while self._batch_ready():
+                    await self._batch_slots.acquire()
+                    batch = self._take_batch(self.batch_size)
+                    if not batch:
+                        self._batch_slots.release()
+                        break
+                    task = asyncio.create_task(self._run_batch(batch))
+                    self._inflight.add(task)
+                    task.add_done_callback(self._inflight.discard)
 
             except asyncio.CancelledError:
                 break
@@ -187,30 +322,77 @@ class BatchInferencePipeline:
 
         logger.info("[LOOP] Batch processing loop stopped")
 
-    async def _trigger_batch_processing(self):
+    def _time_until_deadline(self) -> Optional[float]:
         """
-        배치 처리 트리거 (큐에서 배치 추출 및 추론)
+        가장 이른 레인 마감까지 남은 시간 (초). 큐가 비었으면 None.
         """
-        async with self.queue_lock:
-            if len(self.request_queue) == 0:
-                return
-
-            # 배치 크기 결정
-            current_batch_size = min(len(self.request_queue), self.max_batch_size)
-
-            # 최소 배치 크기 미만이면 대기 (단, 타임아웃 초과 시 처리)
-            if current_batch_size < self.min_batch_size:
-                oldest_request_age = time.time() - self.request_queue[0].timestamp
-                if oldest_request_age < (self.max_batch_delay_ms / 1000.0):
-                    return  # 더 대기
+        now = time.monotonic()
+        remaining = None
+        for priority, lane in self.lanes.items():
+            if lane:
+                left = lane[0].timestamp + self.lane_delays[priority] - now
+                remaining = left if remaining is None else min(remaining, left)
+        return remaining
+
+    def _batch_ready(self) -> bool:
+        """
+        목표 배치 크기 도달 또는 마감 초과 여부
+        """
+        if self.queue_size == 0:
+            return False
+        if self.queue_size >= self.batch_size:
+            return True
+        remaining = self._time_until_deadline()
+        return remaining is not None and remaining <= 0
+
+    def _take_batch(self, size: int) -> List[InferenceRequest]:
+        """
+        우선순위 순으로 레인에서 최대 size개 요청 추출
+        """
+        self.queue_depth_histogram.observe(self.queue_size)
 
-            # 배치 추출
-            batch_requests = [
-                self.request_queue.popleft() for _ in range(current_batch_size)
-            ]
+        batch: List[InferenceRequest] = []
+        for priority in InferencePriority:
+            lane = self.lanes[priority]
+            while lane and len(batch) < size:
+                batch.append(lane.popleft())
+        return batch
 
-        # 배치 추론 실행 (락 해제 후)
-        await self._process_batch(batch_requests)
+    async def _run_batch(self, batch_requests: List[InferenceRequest]):
+        try:
+            await self._process_batch(batch_requests)
+        finally:
+            self._batch_slots.release()
+            # 처리 중 쌓인 요청이 있으면 다음 배치 구성
+            if self.queue_size > 0:
+                self._wakeup.set()
+
+    def _acquire_buffer(
+        self, sample: np.ndarray, batch_size: int
+    ) -> Optional[np.ndarray]:
+        """
+        사전 할당 입력 버퍼 획득 (shape/dtype 불일치 시 None)
+        """
+        if self._buffer_shape is None:
+            self._buffer_shape = sample.shape
+            self._buffer_dtype = sample.dtype
+
+        if (
+            sample.shape != self._buffer_shape
+            or sample.dtype != self._buffer_dtype
+            or batch_size > self.max_batch_size
+        ):
+            return None
+
+        if self._buffer_pool:
+            return self._buffer_pool.pop()
+        return np.empty(
+            (self.max_batch_size,) + self._buffer_shape, dtype=self._buffer_dtype
+        )
+
+    def _release_buffer(self, buffer: Optional[np.ndarray]):
+        if buffer is not None and len(self._buffer_pool) < self.max_concurrent_batches:
+            self._buffer_pool.append(buffer)
 
     async def _process_batch(self, batch_requests: List[InferenceRequest]):
         """
@@ -223,34 +405,58 @@ class BatchInferencePipeline:
             return
 
         batch_size = len(batch_requests)
-        start_time = time.time()
+        start_time = time.monotonic()
+        buffer = None
 
         logger.debug(f"[BATCH] Processing batch of {batch_size} requests...")
 
         try:
-            # 입력 데이터 배치 구성
-            batch_input = np.array([req.input_data for req in batch_requests])
-
-            # 배치 추론 실행
-            batch_output = self.inference_func(batch_input)
+            # 입력 데이터 배치 구성 (사전 할당 버퍼에 복사)
+            sample = np.asarray(batch_requests[0].input_data)
+            buffer = self._acquire_buffer(sample, batch_size)
+            if buffer is not None:
+                for i, request in enumerate(batch_requests):
+                    buffer[i] = request.input_data
+                batch_input = buffer[:batch_size]
+            else:
+                batch_input = np.stack([req.input_data for req in batch_requests])
+
+            # 배치 추론 실행 (실행기에서 수행)
+            if self._executor is not None:
+                loop = asyncio.get_running_loop()
+                batch_output = await loop.run_in_executor(
+                    self._executor, self.inference_func, batch_input
+                )
+            else:
+                batch_output = self.inference_func(batch_input)
+
+            # 풀 버퍼를 참조하는 결과는 버퍼 반환 전에 복사
+            if buffer is not None:
+                batch_output = self._detach_output(batch_output, buffer)
 
             # 결과를 각 요청에 매핑
             for i, request in enumerate(batch_requests):
-                result = batch_output[i]
                 if not request.future.done():
-                    request.future.set_result(result)
+                    request.future.set_result(batch_output[i])
 
             # 통계 업데이트
-            batch_latency = (time.time() - start_time) * 1000  # ms
+            end_time = time.monotonic()
+            batch_latency = (end_time - start_time) * 1000  # ms
             self.total_requests += batch_size
             self.total_batches += 1
             self.total_latency += batch_latency
+            self.batch_size_histogram.observe(batch_size)
 
-            avg_latency_per_request = batch_latency / batch_size
+            # 체크아웃 요청이 포함된 배치의 추론 시간으로만 배치 크기 조정
+            # (재평가 레인 배치와 마감 시각까지의 대기 시간은 제외)
+            if any(
+                req.priority == InferencePriority.CHECKOUT for req in batch_requests
+            ):
+                self._adapt_batch_size(batch_latency, batch_size)
 
             logger.debug(
                 f"[BATCH] Processed {batch_size} requests in {batch_latency:.2f}ms "
-                f"(avg: {avg_latency_per_request:.2f}ms/request)"
+                f"(avg: {batch_latency / batch_size:.2f}ms/request)"
             )
 
         except Exception as e:
@@ -261,6 +467,70 @@ class BatchInferencePipeline:
                 if not request.future.done():
                     request.future.set_exception(e)
 
+        finally:
+            self._release_buffer(buffer)
+
+    @staticmethod
+    def _detach_output(batch_output: Any, buffer: np.ndarray) -> Any:
+        """
+        입력 버퍼와 메모리를 공유하는 추론 결과 복사
+
+        항등/슬라이싱 모델은 입력 버퍼의 뷰를 반환하므로, 복사하지 않으면
+        버퍼가 다음 배치에 재사용될 때 이미 반환한 결과가 덮어써진다.
+        """
+        if isinstance(batch_output, np.ndarray):
+            if np.may_share_memory(batch_output, buffer):
+                return batch_output.copy()
+            return batch_output
+        return [
+            (
+                item.copy()
+                if isinstance(item, np.ndarray) and np.may_share_memory(item, buffer)
+                else item
+            )
+            for item in batch_output
+        ]
+
+    def _adapt_batch_size(self, service_latency_ms: float, observed_batch_size: int):
+        """
+        SLA 기반 배치 크기 조정 (AIMD)
+
+        체크아웃 배치의 추론(서비스) 시간만 반영한다. 대기 시간은 배치 크기와
+        무관하게 마감 시각까지 늘어나므로, 포함하면 저부하 시 배치가 최소
+        크기로 줄어든다.
+
+        - 지연 EWMA가 SLA 초과: 배치 크기 25% 감소
+        - 지연 EWMA가 SLA의 80% 미만이고 배치가 가득 찼음: 배치 크기 +10%
+        """
+        alpha = 0.2
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = service_latency_ms
+        else:
+            self.latency_ewma_ms = (
+                alpha * service_latency_ms + (1 - alpha) * self.latency_ewma_ms
+            )
+
+        if not self.adaptive:
+            return
+
+        previous = self.batch_size
+        if self.latency_ewma_ms > self.sla_target_ms:
+            self.batch_size = max(self.min_batch_size, int(self.batch_size * 0.75))
+        elif (
+            self.latency_ewma_ms < self.sla_target_ms * 0.8
+            and observed_batch_size >= self.batch_size
+        ):
+            self.batch_size = min(
+                self.max_batch_size,
+                self.batch_size + max(1, self.batch_size // 10),
+            )
+
+        if self.batch_size != previous:
+            logger.debug(
+                f"[ADAPT] Batch size {previous} -> {self.batch_size} "
+                f"(latency EWMA: {self.latency_ewma_ms:.2f}ms)"
+            )
+
     def _log_statistics(self):
         """
         배치 추론 통계 로깅
@@ -279,9 +549,10 @@ class BatchInferencePipeline:
         logger.info(f"  Avg batch size: {avg_batch_size:.2f}")
         logger.info(f"  Avg batch latency: {avg_batch_latency:.2f}ms")
         logger.info(f"  Avg request latency: {avg_request_latency:.2f}ms")
+        logger.info(f"  Final target batch size: {self.batch_size}")
 
-        batch_efficiency = (avg_batch_size / self.batch_size) * 100
-        logger.info(f"  Batch efficiency: {batch_efficiency:.1f}%%")
+        batch_efficiency = (avg_batch_size / self.configured_batch_size) * 100
+        logger.info(f"  Batch efficiency: {batch_efficiency:.1f}%")
 
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -290,31 +561,185 @@ class BatchInferencePipeline:
         Returns:
             통계 딕셔너리
         """
-        async with self.queue_lock:
-            queue_size = len(self.request_queue)
+        stats: Dict[str, Any] = {
+            "queue_size": self.queue_size,
+            "queue_size_by_lane": {
+                priority.name.lower(): len(lane)
+                for priority, lane in self.lanes.items()
+            },
+            "target_batch_size": self.batch_size,
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "batch_size_histogram": self.batch_size_histogram.to_dict(),
+            "queue_depth_histogram": self.queue_depth_histogram.to_dict(),
+        }
 
         if self.total_batches == 0:
-            return {
-                "queue_size": queue_size,
-                "total_requests": 0,
-                "total_batches": 0,
-            }
+            return stats
 
         avg_batch_size = self.total_requests / self.total_batches
         avg_batch_latency = self.total_latency / self.total_batches
         avg_request_latency = self.total_latency / self.total_requests
-        batch_efficiency = (avg_batch_size / self.batch_size) * 100
+        batch_efficiency = (avg_batch_size / self.configured_batch_size) * 100
+
+        stats.update(
+            {
+                "avg_batch_size": round(avg_batch_size, 2),
+                "avg_batch_latency_ms": round(avg_batch_latency, 2),
+                "avg_request_latency_ms": round(avg_request_latency, 2),
+                "latency_ewma_ms": round(self.latency_ewma_ms or 0.0, 2),
+                "batch_efficiency_pct": round(batch_efficiency, 1),
+            }
+        )
+        return stats
+
+    def get_prometheus_metrics(self, pipeline_name: str = "default") -> str:
+        """
+        Prometheus 메트릭 형식으로 출력 (큐 깊이 / 배치 크기 히스토그램)
+
+        Returns:
+            Prometheus 메트릭 문자열
+        """
+        lines = [
+            "# HELP batch_inference_queue_size Current number of queued requests",
+            "# TYPE batch_inference_queue_size gauge",
+        ]
+        for priority, lane in self.lanes.items():
+            lines.append(
+                f'batch_inference_queue_size{{pipeline="{pipeline_name}",'
+                f'lane="{priority.name.lower()}"}} {len(lane)}'
+            )
+
+        lines += [
+            "# HELP batch_inference_target_batch_size Adaptive target batch size",
+            "# TYPE batch_inference_target_batch_size gauge",
+            f'batch_inference_target_batch_size{{pipeline="{pipeline_name}"}} '
+            f"{self.batch_size}",
+        ]
+
+        for metric, histogram, help_text in (
+            (
+                "batch_inference_batch_size",
+                self.batch_size_histogram,
+                "Number of requests per executed batch",
+            ),
+            (
+                "batch_inference_queue_depth",
+                self.queue_depth_histogram,
+                "Queue depth observed when a batch is formed",
+            ),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram.to_dict().items():
+                lines.append(
+                    f'{metric}_bucket{{pipeline="{pipeline_name}",le="{bound}"}} {count}'
+                )
+            lines.append(f'{metric}_sum{{pipeline="{pipeline_name}"}} {histogram.sum}')
+            lines.append(
+                f'{metric}_count{{pipeline="{pipeline_name}"}} {histogram.total}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+class _PollingBaseline:
+    """
+    벤치마크 비교용 기존 방식 (고정 주기 폴링 + 이벤트 루프 위 동기 추론)
+    """
+
+    def __init__(self, inference_func, batch_size=50, max_batch_delay_ms=50):
+        self.inference_func = inference_func
+        self.batch_size = batch_size
+        self.max_batch_delay_ms = max_batch_delay_ms
+        self.queue: deque = deque()
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self.running = True
+        self.task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def infer(self, request_id: str, input_data: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.append((input_data, future))
+        return await future
+
+    async def _loop(self):
+        while self.running:
+            await asyncio.sleep(self.max_batch_delay_ms / 1000.0)
+            while self.queue:
+                batch = [
+                    self.queue.popleft()
+                    for _ in range(min(len(self.queue), self.batch_size))
+                ]
+                output = self.inference_func(np.array([item[0] for item in batch]))
+                for i, (_, future) in enumerate(batch):
+                    future.set_result(output[i])
+
+
+async def benchmark_against_polling(
+    num_requests: int = 2000,
+    arrival_rate_per_sec: float = 1000.0,
+    feature_dim: int = 100,
+    inference_ms_per_batch: float = 5.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    이벤트 기반 파이프라인과 기존 폴링 루프 비교 벤치마크
+
+    포아송 도착 과정으로 요청을 보내고 요청별 end-to-end 지연을 측정한다.
+
+    Returns:
+        {"polling": {...}, "event_driven": {...}} 형태의 지연/처리량 통계
+    """
+
+    def model_inference(batch_input: np.ndarray) -> np.ndarray:
+        time.sleep(inference_ms_per_batch / 1000.0)  # GIL 해제 추론 시뮬레이션
+        return batch_input[:, :2].sum(axis=1)
+
+    rng = np.random.default_rng(42)
+    inputs = rng.random((num_requests, feature_dim), dtype=np.float32)
+    gaps = rng.exponential(1.0 / arrival_rate_per_sec, size=num_requests)
+
+    async def run(pipeline) -> Dict[str, float]:
+        await pipeline.start()
+        latencies: List[float] = []
+
+        async def send(i: int):
+            started = time.monotonic()
+            await pipeline.infer(f"req-{i}", inputs[i])
+            latencies.append((time.monotonic() - started) * 1000)
+
+        bench_start = time.monotonic()
+        tasks = []
+        for i in range(num_requests):
+            tasks.append(asyncio.create_task(send(i)))
+            await asyncio.sleep(gaps[i])
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - bench_start
+        await pipeline.stop()
 
         return {
-            "queue_size": queue_size,
-            "total_requests": self.total_requests,
-            "total_batches": self.total_batches,
-            "avg_batch_size": round(avg_batch_size, 2),
-            "avg_batch_latency_ms": round(avg_batch_latency, 2),
-            "avg_request_latency_ms": round(avg_request_latency, 2),
-            "batch_efficiency_pct": round(batch_efficiency, 1),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 2),
+            "throughput_rps": round(num_requests / elapsed, 1),
         }
 
+    return {
+        "polling": await run(_PollingBaseline(model_inference)),
+        "event_driven": await run(BatchInferencePipeline(model_inference)),
+    }
+
 
 # 사용 예시
 async def example_usage():
@@ -347,10 +772,15 @@ async def example_usage():
     # 파이프라인 시작
     await pipeline.start()
 
-    # 동시 요청 시뮬레이션
+    # 동시 요청 시뮬레이션 (체크아웃 + 배치 재평가 혼합)
     async def send_request(i):
         input_data = np.random.rand(100)  # 100차원 특징
-        result = await pipeline.infer(request_id=f"req-{i}", input_data=input_data)
+        priority = (
+            InferencePriority.RESCORING if i % 4 == 0 else InferencePriority.CHECKOUT
+        )
+        result = await pipeline.infer(
+            request_id=f"req-{i}", input_data=input_data, priority=priority
+        )
         return result
 
     # 1,000개 요청 동시 전송
@@ -367,6 +797,11 @@ async def example_usage():
     # 파이프라인 종료
     await pipeline.stop()
 
+    # 기존 폴링 루프 대비 벤치마크
+    comparison = await benchmark_against_polling()
+    for name, result in comparison.items():
+        logger.info(f"[BENCHMARK] {name}: {result}")
+
 
 if __name__ == "__main__":
     logging.basicConfig(
@@ -6,18 +6,38 @@
 - 점진적 트래픽 증가 (10% → 25% → 50% → 100%)
 - 실시간 성능 모니터링 및 자동 롤백
 - A/B 테스트와 통합 가능
+- 메모리 라우팅 테이블: 배포 상태 변경 시에만 재구성 (예측당 DB I/O 없음)
+- 카나리 설정/카운터는 model_routing_config 에 저장 (모든 API 워커가 공유)
+- 평가 결과 카운터는 워커 메모리에 누적 후 주기적으로 반영 (예측당 DB 쓰기 없음)
 """
 
-import hashlib
+import asyncio
+import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from src.deployment.model_routing import (
+    STATS_COLUMNS,
+    ModelRoutingTable,
+    RoutedModel,
+    flush_routing_stats,
+    publish_routing_change,
+    record_routing_result,
+    routing_state,
+    routing_stats_flush_due,
+    sync_routing_state,
+    traffic_bucket,
+)
+from src.deployment.version_manager import load_model_artifact
 from src.models.ml_model import MLModel, DeploymentStatus
 
+logger = logging.getLogger(__name__)
+
 
 class CanaryDeployment:
     """카나리 배포 관리자"""
@@ -28,8 +48,30 @@ class CanaryDeployment:
             db_session: 데이터베이스 세션
         """
         self.db_session = db_session
-        # 카나리 배포 상태 (메모리 캐시)
-        self._canary_config: Optional[Dict[str, Any]] = None
+
+    @property
+    def _canary_config(self) -> Optional[Dict[str, Any]]:
+        """이 워커가 마지막으로 동기화한 카나리 배포 설정"""
+        return routing_state.canary_config
+
+    async def _current_canary(self) -> Optional[Dict[str, Any]]:
+        """
+        공유 설정에서 읽은 최신 카나리 설정 + 모니터링 카운터
+
+        Returns:
+            진행 중인 카나리 배포가 없으면 None
+        """
+        # 이 워커가 누적한 카운터를 먼저 반영 (다른 워커 값은 최대
+        # STATS_FLUSH_SECONDS 지연)
+        if await flush_routing_stats(self.db_session):
+            await self.db_session.commit()
+        row = await sync_routing_state(self.db_session, force=True)
+        if not self._canary_config:
+            return None
+        return {
+            **self._canary_config,
+            **{column: getattr(row, column, 0) or 0 for column in STATS_COLUMNS},
+        }
 
     async def start_canary_deployment(
         self,
@@ -60,8 +102,8 @@ class CanaryDeployment:
         if not production_model:
             raise ValueError("프로덕션 모델이 없습니다")
 
-        # 카나리 배포 설정
-        self._canary_config = {
+        # 카나리 배포 설정 (모든 워커가 다음 동기화 시 반영)
+        config = {
             "canary_model_id": str(canary_model_id),
             "production_model_id": str(production_model.id),
             "traffic_percentage": initial_traffic_percentage,
@@ -69,11 +111,11 @@ class CanaryDeployment:
             "monitoring_window_minutes": monitoring_window_minutes,
             "start_time": datetime.utcnow().isoformat(),
             "status": "active",
-            "canary_requests": 0,
-            "canary_successes": 0,
-            "production_requests": 0,
-            "production_successes": 0,
         }
+        await publish_routing_change(
+            self.db_session, canary_config=config, reset_stats=True
+        )
+        await self.db_session.commit()
 
         return {
             "message": f"카나리 배포 시작: {initial_traffic_percentage}% 트래픽",
@@ -87,7 +129,7 @@ class CanaryDeployment:
                 "name": production_model.name,
                 "version": production_model.version,
             },
-            "config": self._canary_config,
+            "config": {**config, **{column: 0 for column in STATS_COLUMNS}},
         }
 
     async def route_traffic(self, transaction_id: str) -> Tuple[str, MLModel]:
@@ -100,28 +142,118 @@ class CanaryDeployment:
         Returns:
             Tuple[모델 타입 ("canary" 또는 "production"), MLModel 객체]
         """
-        if not self._canary_config or self._canary_config["status"] != "active":
-            # 카나리 배포가 없으면 프로덕션 모델 사용
-            production_model = await self._get_production_model()
-            return "production", production_model
-
-        # 거래 ID 해시 기반 트래픽 분할 (일관된 라우팅)
-        hash_value = int(hashlib.sha256(transaction_id.encode()).hexdigest(), 16)
-        traffic_percentage = self._canary_config["traffic_percentage"]
-        is_canary = (hash_value % 100) < traffic_percentage
-
-        if is_canary:
-            # 카나리 모델 사용
-            canary_model = await self._get_model(
-                UUID(self._canary_config["canary_model_id"])
+        route, routed = await self.resolve_model(transaction_id)
+        return route, routed.ml_model if routed else None
+
+    async def resolve_model(
+        self, transaction_id: str
+    ) -> Tuple[str, Optional[RoutedModel]]:
+        """
+        라우팅 테이블에서 모델 선택 (로드/워밍업된 모델 객체 포함)
+
+        라우팅 버전이 바뀌지 않았다면 DB 조회 없이 메모리에서만 처리한다
+        (공유 버전 확인은 ROUTING_SYNC_SECONDS 마다 한 번).
+
+        Args:
+            transaction_id: 거래 ID (해시 기반 일관된 라우팅)
+
+        Returns:
+            Tuple[모델 타입 ("canary" 또는 "production"), RoutedModel]
+        """
+        await sync_routing_state(self.db_session)
+        table = await self._get_routing_table()
+
+        if (
+            table.canary is not None
+            and traffic_bucket(transaction_id) < table.canary_traffic_percentage
+        ):
+            return "canary", table.canary
+        return "production", table.production
+
+    async def _get_routing_table(self) -> ModelRoutingTable:
+        """현재 라우팅 버전의 테이블 반환 (버전이 바뀌었으면 재구성)"""
+        table = routing_state.table
+        if table is not None and table.version == routing_state.version:
+            return table
+
+        async with routing_state.lock:
+            table = routing_state.table
+            if table is not None and table.version == routing_state.version:
+                return table
+
+            # 재구성 중 버전이 다시 바뀌면 다음 호출에서 재구성
+            version = routing_state.version
+            loaded = table.models_by_id() if table else {}
+            config = self._canary_config
+
+            if config and config["status"] == "active":
+                production = await self._load_routed_model(
+                    await self._get_model(UUID(config["production_model_id"])), loaded
+                )
+                canary = await self._load_routed_model(
+                    await self._get_model(UUID(config["canary_model_id"])), loaded
+                )
+                traffic_percentage = config["traffic_percentage"]
+            else:
+                production_model = await self._get_production_model()
+                production = (
+                    await self._load_routed_model(production_model, loaded)
+                    if production_model
+                    else None
+                )
+                canary = None
+                traffic_percentage = 0
+
+            table = ModelRoutingTable(
+                version=version,
+                production=production,
+                canary=canary,
+                canary_traffic_percentage=traffic_percentage,
             )
-            return "canary", canary_model
-        else:
-            # 프로덕션 모델 사용
-            production_model = await self._get_model(
-                UUID(self._canary_config["production_model_id"])
+            routing_state.table = table
+            logger.info(
+                f"[CANARY] Routing table v{version} built "
+                f"(canary traffic: {traffic_percentage}%)"
             )
-            return "production", production_model
+            return table
+
+    async def _load_routed_model(
+        self, ml_model: MLModel, loaded: Dict[str, RoutedModel]
+    ) -> RoutedModel:
+        """
+        모델 객체 로드 및 워밍업 (이전 테이블에 로드된 모델은 재사용)
+        """
+        # 라우팅 테이블은 요청 세션보다 오래 살아남으므로 세션에서 분리
+        if ml_model in self.db_session:
+            self.db_session.expunge(ml_model)
+
+        previous = loaded.get(str(ml_model.id))
+        if previous is not None and previous.instance is not None:
+            return RoutedModel(ml_model=ml_model, instance=previous.instance)
+
+        loop = asyncio.get_running_loop()
+        try:
+            instance = await loop.run_in_executor(
+                None, self._load_and_warm_up, ml_model
+            )
+        except Exception as e:
+            logger.warning(f"[CANARY] Failed to load model {ml_model.id}: {e}")
+            instance = None
+
+        return RoutedModel(ml_model=ml_model, instance=instance)
+
+    @staticmethod
+    def _load_and_warm_up(ml_model: MLModel) -> Any:
+        """모델 로드 후 1건 추론으로 첫 예측 지연 제거"""
+        instance = load_model_artifact(ml_model)
+
+        n_features = getattr(instance, "n_features_in_", None)
+        if n_features:
+            dummy = np.zeros((1, n_features))
+            predict = getattr(instance, "predict_proba", None) or instance.predict
+            predict(dummy)
+
+        return instance
 
     async def record_result(
         self,
@@ -131,21 +263,21 @@ class CanaryDeployment:
         """
         모델 평가 결과 기록
 
+        카운터는 워커 메모리에 누적하고 STATS_FLUSH_SECONDS 마다 한 번만
+        공유 행에 반영한다.
+
         Args:
             model_type: 모델 타입 ("canary" 또는 "production")
             success: 평가 성공 여부
         """
-        if not self._canary_config:
+        await sync_routing_state(self.db_session)
+        if not self._canary_config or model_type not in ("canary", "production"):
             return
 
-        if model_type == "canary":
-            self._canary_config["canary_requests"] += 1
-            if success:
-                self._canary_config["canary_successes"] += 1
-        elif model_type == "production":
-            self._canary_config["production_requests"] += 1
-            if success:
-                self._canary_config["production_successes"] += 1
+        record_routing_result(model_type, success)
+        if routing_stats_flush_due():
+            await flush_routing_stats(self.db_session)
+            await self.db_session.commit()
 
     async def get_canary_status(self) -> Dict[str, Any]:
         """
@@ -154,45 +286,43 @@ class CanaryDeployment:
         Returns:
             Dict[str, Any]: 카나리 배포 상태 및 통계
         """
-        if not self._canary_config:
+        config = await self._current_canary()
+        if not config:
             return {"status": "inactive", "message": "카나리 배포가 없습니다"}
 
         # 성공률 계산
         canary_success_rate = (
-            self._canary_config["canary_successes"]
-            / self._canary_config["canary_requests"]
-            if self._canary_config["canary_requests"] > 0
+            config["canary_successes"] / config["canary_requests"]
+            if config["canary_requests"] > 0
             else 0.0
         )
         production_success_rate = (
-            self._canary_config["production_successes"]
-            / self._canary_config["production_requests"]
-            if self._canary_config["production_requests"] > 0
+            config["production_successes"] / config["production_requests"]
+            if config["production_requests"] > 0
             else 0.0
         )
 
         # 모니터링 시간 경과 확인
-        start_time = datetime.fromisoformat(self._canary_config["start_time"])
+        start_time = datetime.fromisoformat(config["start_time"])
         elapsed_minutes = (datetime.utcnow() - start_time).total_seconds() / 60
 
         return {
-            "status": self._canary_config["status"],
-            "traffic_percentage": self._canary_config["traffic_percentage"],
+            "status": config["status"],
+            "traffic_percentage": config["traffic_percentage"],
             "elapsed_minutes": round(elapsed_minutes, 2),
-            "monitoring_window_minutes": self._canary_config[
-                "monitoring_window_minutes"
-            ],
+            "monitoring_window_minutes": config["monitoring_window_minutes"],
             "canary": {
-                "requests": self._canary_config["canary_requests"],
-                "successes": self._canary_config["canary_successes"],
+                "requests": config["canary_requests"],
+                "successes": config["canary_successes"],
                 "success_rate": round(canary_success_rate, 4),
             },
             "production": {
-                "requests": self._canary_config["production_requests"],
-                "successes": self._canary_config["production_successes"],
+                "requests": config["production_requests"],
+                "successes": config["production_successes"],
                 "success_rate": round(production_success_rate, 4),
             },
             "recommendation": self._generate_recommendation(
+                config,
                 canary_success_rate,
                 production_success_rate,
                 elapsed_minutes,
@@ -209,25 +339,28 @@ class CanaryDeployment:
         Returns:
             Dict[str, Any]: 업데이트된 카나리 상태
         """
-        if not self._canary_config:
+        if not await self._current_canary():
             raise ValueError("카나리 배포가 활성화되어 있지 않습니다")
 
         if new_percentage < 0 or new_percentage > 100:
             raise ValueError("트래픽 비율은 0-100 사이여야 합니다")
 
         old_percentage = self._canary_config["traffic_percentage"]
-        self._canary_config["traffic_percentage"] = new_percentage
+        config = {
+            **self._canary_config,
+            "traffic_percentage": new_percentage,
+            "start_time": datetime.utcnow().isoformat(),
+        }
 
         # 통계 초기화 (새로운 비율로 모니터링 재시작)
-        self._canary_config["canary_requests"] = 0
-        self._canary_config["canary_successes"] = 0
-        self._canary_config["production_requests"] = 0
-        self._canary_config["production_successes"] = 0
-        self._canary_config["start_time"] = datetime.utcnow().isoformat()
+        await publish_routing_change(
+            self.db_session, canary_config=config, reset_stats=True
+        )
+        await self.db_session.commit()
 
         return {
             "message": f"트래픽 비율 증가: {old_percentage}% → {new_percentage}%",
-            "config": self._canary_config,
+            "config": {**config, **{column: 0 for column in STATS_COLUMNS}},
         }
 
     async def complete_canary_deployment(self) -> Dict[str, Any]:
@@ -237,11 +370,12 @@ class CanaryDeployment:
         Returns:
             Dict[str, Any]: 완료 결과
         """
-        if not self._canary_config:
+        completed_config = await self._current_canary()
+        if not completed_config:
             raise ValueError("카나리 배포가 활성화되어 있지 않습니다")
 
-        canary_model_id = UUID(self._canary_config["canary_model_id"])
-        production_model_id = UUID(self._canary_config["production_model_id"])
+        canary_model_id = UUID(completed_config["canary_model_id"])
+        production_model_id = UUID(completed_config["production_model_id"])
 
         # 기존 프로덕션 모델을 은퇴 상태로 변경
         await self.db_session.execute(
@@ -255,12 +389,10 @@ class CanaryDeployment:
         canary_model.deployment_status = DeploymentStatus.PRODUCTION
         canary_model.deployed_at = datetime.utcnow()
 
+        # 카나리 설정 초기화 (승격과 같은 트랜잭션)
+        await publish_routing_change(self.db_session, canary_config=None)
         await self.db_session.commit()
 
-        # 카나리 설정 초기화
-        completed_config = self._canary_config.copy()
-        self._canary_config = None
-
         return {
             "message": "카나리 배포 완료: 새 모델이 프로덕션으로 승격되었습니다",
             "new_production_model": {
@@ -286,16 +418,17 @@ class CanaryDeployment:
         Returns:
             Dict[str, Any]: 중단 결과
         """
-        if not self._canary_config:
+        aborted_config = await self._current_canary()
+        if not aborted_config:
             raise ValueError("카나리 배포가 활성화되어 있지 않습니다")
 
         # 카나리 설정 저장 후 초기화
-        aborted_config = self._canary_config.copy()
         aborted_config["status"] = "aborted"
         aborted_config["abort_reason"] = reason
         aborted_config["abort_time"] = datetime.utcnow().isoformat()
 
-        self._canary_config = None
+        await publish_routing_change(self.db_session, canary_config=None)
+        await self.db_session.commit()
 
         return {
             "message": f"카나리 배포 중단: {reason}",
@@ -304,6 +437,7 @@ class CanaryDeployment:
 
     def _generate_recommendation(
         self,
+        config: Dict[str, Any],
         canary_success_rate: float,
         production_success_rate: float,
         elapsed_minutes: float,
@@ -312,6 +446,7 @@ class CanaryDeployment:
         카나리 배포 권장 사항 생성
 
         Args:
+            config: 카나리 설정 + 모니터링 카운터
             canary_success_rate: 카나리 성공률
             production_success_rate: 프로덕션 성공률
             elapsed_minutes: 경과 시간 (분)
@@ -319,17 +454,14 @@ class CanaryDeployment:
         Returns:
             str: 권장 사항 메시지
         """
-        if not self._canary_config:
-            return "카나리 배포가 없습니다"
-
-        monitoring_window = self._canary_config["monitoring_window_minutes"]
-        success_threshold = self._canary_config["success_threshold"]
-        current_percentage = self._canary_config["traffic_percentage"]
+        monitoring_window = config["monitoring_window_minutes"]
+        success_threshold = config["success_threshold"]
+        current_percentage = config["traffic_percentage"]
 
         # 최소 요청 수 확인 (통계적 신뢰도)
         min_requests = 100
-        if self._canary_config["canary_requests"] < min_requests:
-            return f"통계적 신뢰도를 위해 최소 {min_requests}개의 요청이 필요합니다 (현재: {self._canary_config['canary_requests']}개)"
+        if config["canary_requests"] < min_requests:
+            return f"통계적 신뢰도를 위해 최소 {min_requests}개의 요청이 필요합니다 (현재: {config['canary_requests']}개)"
 
         # 성공률 비교
         if canary_success_rate < success_threshold:
@@ -0,0 +1,245 @@
+"""
+모델 라우팅 테이블 (워커 간 공유 설정 + 프로세스 메모리 테이블)
+
+카나리/프로덕션 모델 라우팅을 예측 요청마다 DB 조회 없이 처리하기 위한
+메모리 라우팅 테이블.
+- 카나리 설정과 라우팅 버전의 원본은 model_routing_config 단일 행
+  (API 워커 여러 개가 같은 설정으로 라우팅)
+- 배포 상태가 바뀔 때마다 공유 버전 증가 (publish_routing_change)
+- 각 워커는 최대 ROUTING_SYNC_SECONDS 마다 버전만 확인하고, 바뀌었을 때만
+  설정을 다시 읽어 다음 라우팅 시 테이블 재구성 (sync_routing_state)
+- crc32 정수 해시 기반 버킷 (프로세스 간에도 동일한 거래는 동일한 모델로)
+- 카나리 모니터링 카운터는 워커 메모리에 누적하고 최대 STATS_FLUSH_SECONDS
+  마다 한 번의 UPDATE 로 공유 행에 더함 (예측마다 같은 행을 잠그지 않음)
+"""
+
+import asyncio
+import os
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.ml_model import MLModel
+from src.models.model_routing_config import ROUTING_CONFIG_ID, ModelRoutingConfig
+
+# 트래픽 분할 버킷 수 (traffic_percentage 단위)
+TRAFFIC_BUCKETS = 100
+
+# 공유 라우팅 버전 확인 주기 (다른 워커의 배포 변경이 반영되기까지의 최대 지연)
+ROUTING_SYNC_SECONDS = float(os.getenv("ML_ROUTING_SYNC_SECONDS", "2"))
+
+# 워커 메모리 카나리 카운터를 공유 행에 반영하는 주기
+STATS_FLUSH_SECONDS = float(os.getenv("ML_ROUTING_STATS_FLUSH_SECONDS", "2"))
+
+# 카나리 모니터링 카운터 컬럼
+STATS_COLUMNS = (
+    "canary_requests",
+    "canary_successes",
+    "production_requests",
+    "production_successes",
+)
+
+_KEEP = object()
+
+
+def traffic_bucket(transaction_id: str) -> int:
+    """거래 ID → 0~99 버킷 (일관된 라우팅)"""
+    return zlib.crc32(transaction_id.encode()) % TRAFFIC_BUCKETS
+
+
+@dataclass
+class RoutedModel:
+    """라우팅 대상 모델 (메타데이터 + 로드/워밍업된 모델 객체)"""
+
+    ml_model: MLModel
+    instance: Any
+
+
+@dataclass
+class ModelRoutingTable:
+    """특정 라우팅 버전에서 구성된 라우팅 테이블"""
+
+    version: int
+    production: Optional[RoutedModel]
+    canary: Optional[RoutedModel] = None
+    canary_traffic_percentage: int = 0
+
+    def models_by_id(self) -> Dict[str, RoutedModel]:
+        """모델 ID → RoutedModel (재구성 시 로드된 모델 재사용용)"""
+        routed = {}
+        for entry in (self.production, self.canary):
+            if entry is not None:
+                routed[str(entry.ml_model.id)] = entry
+        return routed
+
+
+@dataclass
+class _RoutingState:
+    version: int = 0
+    canary_config: Optional[Dict[str, Any]] = None
+    table: Optional[ModelRoutingTable] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    synced_at: Optional[float] = None  # 마지막 공유 설정 확인 (monotonic)
+    # 아직 공유 행에 반영하지 않은 카운터 (누적을 시작한 라우팅 버전 기준)
+    pending_stats: Dict[str, int] = field(default_factory=dict)
+    pending_version: Optional[int] = None
+    stats_flushed_at: float = field(default_factory=time.monotonic)
+
+    def apply(self, version: int, canary_config: Optional[Dict[str, Any]]):
+        """공유 설정 반영 (버전이 바뀌면 다음 라우팅 시 테이블 재구성)"""
+        self.version = version
+        self.canary_config = canary_config
+        self.synced_at = time.monotonic()
+
+
+routing_state = _RoutingState()
+
+
+async def load_routing_config(
+    db_session: AsyncSession,
+) -> Optional[ModelRoutingConfig]:
+    """공유 라우팅 설정 행 조회 (아직 배포 변경이 없었으면 None)"""
+    result = await db_session.execute(
+        select(ModelRoutingConfig).where(ModelRoutingConfig.id == ROUTING_CONFIG_ID)
+    )
+    return result.scalars().first()
+
+
+async def sync_routing_state(
+    db_session: AsyncSession, force: bool = False
+) -> Optional[ModelRoutingConfig]:
+    """
+    다른 워커의 배포 변경을 이 프로세스에 반영
+
+    마지막 확인 후 ROUTING_SYNC_SECONDS 가 지나지 않았으면 조회하지 않는다.
+
+    Args:
+        db_session: 데이터베이스 세션
+        force: 확인 주기와 무관하게 조회
+
+    Returns:
+        조회한 설정 행 (조회하지 않았거나 행이 없으면 None)
+    """
+    if (
+        not force
+        and routing_state.synced_at is not None
+        and time.monotonic() - routing_state.synced_at < ROUTING_SYNC_SECONDS
+    ):
+        return None
+
+    config = await load_routing_config(db_session)
+    if config is None:
+        routing_state.apply(0, None)
+    else:
+        routing_state.apply(config.version, config.canary_config)
+    return config
+
+
+async def publish_routing_change(
+    db_session: AsyncSession,
+    canary_config: Any = _KEEP,
+    reset_stats: bool = False,
+) -> int:
+    """
+    배포 상태 변경 기록 (공유 라우팅 버전 증가)
+
+    호출자의 트랜잭션에 포함되므로 배포 상태 변경과 함께 커밋해야 한다.
+
+    Args:
+        db_session: 데이터베이스 세션
+        canary_config: 새 카나리 설정 (None 이면 카나리 종료, 생략 시 유지)
+        reset_stats: 카나리 모니터링 카운터 초기화 여부
+
+    Returns:
+        int: 새 라우팅 버전
+    """
+    now = datetime.utcnow()
+    changes: Dict[str, Any] = {
+        "version": ModelRoutingConfig.version + 1,
+        "updated_at": now,
+    }
+    if canary_config is not _KEEP:
+        changes["canary_config"] = canary_config
+    if reset_stats:
+        changes.update({column: 0 for column in STATS_COLUMNS})
+
+    stmt = pg_insert(ModelRoutingConfig).values(
+        id=ROUTING_CONFIG_ID,
+        version=1,
+        canary_config=None if canary_config is _KEEP else canary_config,
+        updated_at=now,
+        **{column: 0 for column in STATS_COLUMNS},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ModelRoutingConfig.id], set_=changes
+    ).returning(ModelRoutingConfig.version, ModelRoutingConfig.canary_config)
+
+    version, config = (await db_session.execute(stmt)).one()
+    routing_state.apply(version, config)
+    return version
+
+
+def record_routing_result(model_type: str, success: bool):
+    """
+    카나리 모니터링 카운터 증가 (워커 메모리, DB I/O 없음)
+
+    라우팅 버전이 바뀌면 (카운터 초기화, 카나리 종료 등) 이전 버전에서 누적한
+    값은 버린다.
+    """
+    if routing_state.pending_version != routing_state.version:
+        routing_state.pending_stats = {}
+        routing_state.pending_version = routing_state.version
+
+    stats = routing_state.pending_stats
+    requests = f"{model_type}_requests"
+    stats[requests] = stats.get(requests, 0) + 1
+    if success:
+        successes = f"{model_type}_successes"
+        stats[successes] = stats.get(successes, 0) + 1
+
+
+def routing_stats_flush_due() -> bool:
+    """누적 카운터가 있고 마지막 반영 후 STATS_FLUSH_SECONDS 가 지났는지"""
+    return (
+        bool(routing_state.pending_stats)
+        and time.monotonic() - routing_state.stats_flushed_at >= STATS_FLUSH_SECONDS
+    )
+
+
+async def flush_routing_stats(db_session: AsyncSession) -> bool:
+    """
+    누적 카운터를 공유 행에 더함 (UPDATE 1회)
+
+    누적을 시작한 라우팅 버전이 아직 공유 행의 버전일 때만 반영한다 (그 사이
+    다른 워커가 카운터를 초기화했으면 이전 구간의 값이므로 버림).
+    호출자가 커밋해야 한다.
+
+    Returns:
+        bool: UPDATE 실행 여부
+    """
+    stats, version = routing_state.pending_stats, routing_state.pending_version
+    routing_state.pending_stats = {}
+    routing_state.stats_flushed_at = time.monotonic()
+    if not stats:
+        return False
+
+    await db_session.execute(
+        update(ModelRoutingConfig)
+        .where(
+            ModelRoutingConfig.id == ROUTING_CONFIG_ID,
+            ModelRoutingConfig.version == version,
+        )
+        .values(
+            **{
+                column: getattr(ModelRoutingConfig, column) + count
+                for column, count in stats.items()
+            }
+        )
+    )
+    return True
@@ -15,6 +15,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, desc
 
+from src.deployment.model_routing import publish_routing_change
 from src.models.ml_model import MLModel, DeploymentStatus
 
 
@@ -97,6 +98,7 @@ class ModelRollback:
             previous_model.deployment_status = DeploymentStatus.PRODUCTION
             previous_model.deployed_at = datetime.utcnow()
 
+            await publish_routing_change(self.db_session)
             await self.db_session.commit()
             await self.db_session.refresh(current_production)
             await self.db_session.refresh(previous_model)
@@ -178,6 +180,7 @@ class ModelRollback:
             target_model.deployment_status = DeploymentStatus.PRODUCTION
             target_model.deployed_at = datetime.utcnow()
 
+            await publish_routing_change(self.db_session)
             await self.db_session.commit()
             await self.db_session.refresh(current_production)
             await self.db_session.refresh(target_model)
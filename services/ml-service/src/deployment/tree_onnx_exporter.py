@@ -0,0 +1,305 @@
+"""
+트리 모델 ONNX 변환 모듈
+
+sklearn / LightGBM / XGBoost 트리 모델을 ONNX 형식으로 변환하여
+FDS 서비스가 ONNX Runtime 세션 풀로 서빙할 수 있도록 한다.
+- IsolationForest (skl2onnx): decision_function 점수 출력
+- RandomForestClassifier (skl2onnx): 클래스 확률 출력
+- LightGBM Booster / LGBMClassifier (onnxmltools)
+- XGBoost Booster / XGBClassifier (onnxmltools)
+- 변환 직후 원본 모델 대비 정확도 동등성 검증
+"""
+
+import json
+import logging
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import onnx
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType as SklFloatTensorType
+
+    ONNX_EXPORT_AVAILABLE = True
+except ImportError:
+    ONNX_EXPORT_AVAILABLE = False
+    logging.warning(
+        "[ONNX] skl2onnx/onnxruntime not installed. "
+        "Install with: pip install skl2onnx onnxruntime"
+    )
+
+try:
+    import onnxmltools
+    from onnxmltools.convert.common.data_types import (
+        FloatTensorType as MLFloatTensorType,
+    )
+
+    ONNXMLTOOLS_AVAILABLE = True
+except ImportError:
+    ONNXMLTOOLS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ONNX 모델 metadata_props 키 (FDS ONNXModelPool 과 공유하는 계약)
+METADATA_MODEL_KIND = "shopfds.model_kind"
+METADATA_FEATURE_NAMES = "shopfds.feature_names"
+METADATA_SOURCE_TYPE = "shopfds.source_type"
+
+# model_kind 값
+MODEL_KIND_ANOMALY = "anomaly"  # 출력: label(-1/1), scores(decision_function)
+MODEL_KIND_CLASSIFIER = "classifier"  # 출력: label, probabilities(N, 2)
+
+INPUT_NAME = "input"
+TARGET_OPSET = {"": 17, "ai.onnx.ml": 3}
+
+
+@dataclass
+class ONNXExportReport:
+    """
+    ONNX 변환 결과 및 동등성 검증 리포트
+    """
+
+    onnx_path: str
+    source_type: str
+    model_kind: str
+    n_features: int
+    samples_checked: int
+    max_abs_diff: float
+    label_agreement: float
+    parity_passed: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class TreeModelONNXExporter:
+    """
+    트리 기반 사기 탐지 모델 ONNX 변환기
+
+    Example:
+        >>> exporter = TreeModelONNXExporter()
+        >>> report = exporter.export(
+        ...     trainer.model, Path("models/if-v1.onnx"),
+        ...     feature_names=trainer.feature_columns,
+        ...     validation_data=X_test.values,
+        ... )
+        >>> report.parity_passed
+        True
+    """
+
+    def __init__(
+        self,
+        score_tolerance: float = 1e-4,
+        min_label_agreement: float = 0.999,
+        strict: bool = True,
+    ):
+        """
+        Args:
+            score_tolerance: 점수/확률 최대 허용 절대 오차
+            min_label_agreement: 최소 레이블 일치율
+            strict: True면 동등성 검증 실패 시 ValueError 발생 (ONNX 파일 삭제)
+        """
+        if not ONNX_EXPORT_AVAILABLE:
+            raise ImportError("skl2onnx and onnxruntime are required for ONNX export")
+
+        self.score_tolerance = score_tolerance
+        self.min_label_agreement = min_label_agreement
+        self.strict = strict
+
+    def export(
+        self,
+        model: Any,
+        onnx_path: Path,
+        feature_names: Optional[List[str]] = None,
+        n_features: Optional[int] = None,
+        validation_data: Optional[np.ndarray] = None,
+    ) -> ONNXExportReport:
+        """
+        트리 모델을 ONNX로 변환하고 원본 모델과 출력 동등성 검증
+
+        Args:
+            model: 학습된 트리 모델
+            onnx_path: ONNX 저장 경로
+            feature_names: 특성 이름 목록 (ONNX 메타데이터로 저장)
+            n_features: 특성 수 (feature_names 없을 때 필수)
+            validation_data: 동등성 검증 입력 (None이면 난수 1,000건)
+
+        Returns:
+            ONNXExportReport
+        """
+        if n_features is None:
+            if feature_names is None:
+                raise ValueError("feature_names 또는 n_features 가 필요합니다")
+            n_features = len(feature_names)
+
+        source_type = type(model).__name__
+        logger.info(
+            f"[CONVERT] Converting {source_type} to ONNX ({n_features} features)..."
+        )
+
+        onnx_model, model_kind = self._convert(model, n_features)
+
+        metadata = {
+            METADATA_MODEL_KIND: model_kind,
+            METADATA_SOURCE_TYPE: source_type,
+            METADATA_FEATURE_NAMES: json.dumps(feature_names or []),
+        }
+        for key, value in metadata.items():
+            entry = onnx_model.metadata_props.add()
+            entry.key = key
+            entry.value = value
+
+        onnx.checker.check_model(onnx_model)
+        onnx_path.parent.mkdir(parents=True, exist_ok=True)
+        onnx.save(onnx_model, str(onnx_path))
+
+        model_size_mb = onnx_path.stat().st_size / (1024 * 1024)
+        logger.info(f"[OK] ONNX model saved to {onnx_path} ({model_size_mb:.2f}MB)")
+
+        if validation_data is None:
+            rng = np.random.default_rng(42)
+            validation_data = rng.standard_normal((1000, n_features))
+        validation_data = np.asarray(validation_data, dtype=np.float32)
+
+        report = self._verify_parity(
+            model, model_kind, onnx_path, validation_data, source_type
+        )
+
+        if not report.parity_passed and self.strict:
+            onnx_path.unlink(missing_ok=True)
+            raise ValueError(
+                f"ONNX 변환 정확도 검증 실패: max_abs_diff={report.max_abs_diff:.6f}, "
+                f"label_agreement={report.label_agreement:.4f}"
+            )
+
+        return report
+
+    def _convert(self, model: Any, n_features: int):
+        """
+        모델 타입별 ONNX 변환
+
+        Returns:
+            (onnx ModelProto, model_kind)
+        """
+        module = type(model).__module__
+        name = type(model).__name__
+
+        if module.startswith("sklearn"):
+            initial_types = [(INPUT_NAME, SklFloatTensorType([None, n_features]))]
+            if name == "IsolationForest":
+                onnx_model = convert_sklearn(
+                    model, initial_types=initial_types, target_opset=TARGET_OPSET
+                )
+                return onnx_model, MODEL_KIND_ANOMALY
+            if hasattr(model, "predict_proba"):
+                onnx_model = convert_sklearn(
+                    model,
+                    initial_types=initial_types,
+                    target_opset=TARGET_OPSET,
+                    options={id(model): {"zipmap": False}},
+                )
+                return onnx_model, MODEL_KIND_CLASSIFIER
+
+        if module.startswith(("lightgbm", "xgboost")):
+            if not ONNXMLTOOLS_AVAILABLE:
+                raise ImportError(
+                    "onnxmltools is required for LightGBM/XGBoost ONNX export"
+                )
+            initial_types = [(INPUT_NAME, MLFloatTensorType([None, n_features]))]
+            if module.startswith("lightgbm"):
+                onnx_model = onnxmltools.convert_lightgbm(
+                    model, initial_types=initial_types, zipmap=False
+                )
+            else:
+                if name == "Booster" and model.feature_names:
+                    # onnxmltools 는 'f%d' 형식 특성 이름만 해석 가능
+                    model = model.copy()
+                    model.feature_names = None
+                onnx_model = onnxmltools.convert_xgboost(
+                    model, initial_types=initial_types
+                )
+            return onnx_model, MODEL_KIND_CLASSIFIER
+
+        raise ValueError(f"ONNX 변환을 지원하지 않는 모델 타입: {module}.{name}")
+
+    def _reference_outputs(self, model: Any, model_kind: str, X: np.ndarray):
+        """
+        원본 모델의 (점수, 레이블) 계산
+        """
+        module = type(model).__module__
+        name = type(model).__name__
+
+        if model_kind == MODEL_KIND_ANOMALY:
+            return model.decision_function(X), model.predict(X)
+
+        if name == "Booster" and module.startswith("lightgbm"):
+            proba = model.predict(X)
+        elif name == "Booster" and module.startswith("xgboost"):
+            import xgboost as xgb
+
+            proba = model.predict(xgb.DMatrix(X, feature_names=model.feature_names))
+        else:
+            proba = model.predict_proba(X)[:, 1]
+
+        return proba, (proba > 0.5).astype(np.int64)
+
+    def _verify_parity(
+        self,
+        model: Any,
+        model_kind: str,
+        onnx_path: Path,
+        X: np.ndarray,
+        source_type: str,
+    ) -> ONNXExportReport:
+        """
+        원본 모델과 ONNX Runtime 출력 비교
+        """
+        logger.info(f"[VERIFY] Verifying ONNX parity on {len(X)} samples...")
+
+        session = ort.InferenceSession(
+            str(onnx_path), providers=["CPUExecutionProvider"]
+        )
+        label_out, score_out = session.run(None, {INPUT_NAME: X})[:2]
+
+        expected_scores, expected_labels = self._reference_outputs(model, model_kind, X)
+
+        if model_kind == MODEL_KIND_ANOMALY:
+            onnx_scores = np.asarray(score_out).ravel()
+        else:
+            onnx_scores = np.asarray(score_out)[:, 1]
+            label_out = (onnx_scores > 0.5).astype(np.int64)
+
+        max_abs_diff = float(
+            np.max(np.abs(np.asarray(expected_scores, dtype=np.float64) - onnx_scores))
+        )
+        label_agreement = float(
+            np.mean(
+                np.asarray(label_out).ravel() == np.asarray(expected_labels).ravel()
+            )
+        )
+        parity_passed = (
+            max_abs_diff <= self.score_tolerance
+            and label_agreement >= self.min_label_agreement
+        )
+
+        logger.info(f"[VERIFY] Max difference: {max_abs_diff:.6f}")
+        logger.info(f"[VERIFY] Label agreement: {label_agreement:.4%}")
+        if parity_passed:
+            logger.info("[PASS] ONNX conversion verified (outputs match)")
+        else:
+            logger.warning("[WARNING] ONNX outputs differ from original model")
+
+        return ONNXExportReport(
+            onnx_path=str(onnx_path),
+            source_type=source_type,
+            model_kind=model_kind,
+            n_features=X.shape[1],
+            samples_checked=len(X),
+            max_abs_diff=max_abs_diff,
+            label_agreement=label_agreement,
+            parity_passed=parity_passed,
+        )
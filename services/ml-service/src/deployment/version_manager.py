@@ -20,9 +20,36 @@ import mlflow.sklearn
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, and_
 
+from src.deployment.model_routing import publish_routing_change
 from src.models.ml_model import MLModel, DeploymentStatus
 
 
+def load_model_artifact(ml_model: MLModel) -> Any:
+    """
+    MLModel 메타데이터의 model_path 에서 모델 객체 로드
+
+    Args:
+        ml_model: 모델 메타데이터
+
+    Returns:
+        로드된 모델 객체
+    """
+    model_path = ml_model.model_path
+
+    if model_path.startswith("runs:/"):
+        # MLflow 모델 레지스트리에서 로드
+        if ml_model.model_type in ["isolation_forest", "random_forest"]:
+            return mlflow.sklearn.load_model(model_path)
+        elif ml_model.model_type == "lightgbm":
+            return mlflow.lightgbm.load_model(model_path)
+        else:
+            raise ValueError(f"지원하지 않는 모델 타입: {ml_model.model_type}")
+
+    # 로컬 파일에서 로드
+    with open(model_path, "rb") as f:
+        return pickle.load(f)
+
+
 class ModelVersionManager:
     """MLflow 기반 모델 버전 관리자"""
 
@@ -200,23 +227,7 @@ class ModelVersionManager:
         if not ml_model:
             raise ValueError("모델을 찾을 수 없습니다")
 
-        # MLflow에서 모델 로드
-        model_path = ml_model.model_path
-
-        if model_path.startswith("runs:/"):
-            # MLflow 모델 레지스트리에서 로드
-            if ml_model.model_type in ["isolation_forest", "random_forest"]:
-                model = mlflow.sklearn.load_model(model_path)
-            elif ml_model.model_type == "lightgbm":
-                model = mlflow.lightgbm.load_model(model_path)
-            else:
-                raise ValueError(f"지원하지 않는 모델 타입: {ml_model.model_type}")
-        else:
-            # 로컬 파일에서 로드
-            with open(model_path, "rb") as f:
-                model = pickle.load(f)
-
-        return model, ml_model
+        return load_model_artifact(ml_model), ml_model
 
     async def promote_to_staging(self, model_id: UUID) -> MLModel:
         """
@@ -277,6 +288,7 @@ class ModelVersionManager:
             )
         )
 
+        await publish_routing_change(self.db_session)
         await self.db_session.commit()
 
         # 업데이트된 모델 조회
@@ -301,6 +313,7 @@ class ModelVersionManager:
             .values(deployment_status=DeploymentStatus.RETIRED)
         )
 
+        await publish_routing_change(self.db_session)
         await self.db_session.commit()
 
         result = await self.db_session.execute(
@@ -10,6 +10,8 @@ from .ml_model_version import MLModelVersion, ModelName
 from .ensemble_prediction import EnsemblePrediction, PredictionDecision
 from .feature_importance import FeatureImportance
 from .data_drift_log import DataDriftLog
+from .feature_sketch_bucket import FeatureSketchBucket
+from .model_routing_config import ModelRoutingConfig
 from .retraining_job import RetrainingJob, RetrainTriggerType, RetrainStatus
 
 __all__ = [
@@ -22,6 +24,8 @@ __all__ = [
     "PredictionDecision",
     "FeatureImportance",
     "DataDriftLog",
+    "FeatureSketchBucket",
+    "ModelRoutingConfig",
     "RetrainingJob",
     "RetrainTriggerType",
     "RetrainStatus",
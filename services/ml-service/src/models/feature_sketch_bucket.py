@@ -0,0 +1,66 @@
+"""
+FeatureSketchBucket 모델
+
+피처별 시간 단위(1시간) 분포 스케치를 저장한다.
+드리프트 탐지는 원시 거래 값 대신 이 스케치들을 병합해 KS/PSI를 계산한다.
+"""
+
+from datetime import datetime
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    BigInteger,
+    DateTime,
+    LargeBinary,
+    Index,
+    UniqueConstraint,
+    Uuid,
+)
+
+from .base import Base
+
+
+class FeatureSketchBucket(Base):
+    """피처 분포 스케치 (시간 버킷) 모델"""
+
+    __tablename__ = "feature_sketch_buckets"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    feature_name = Column(String(255), nullable=False, comment="피처 이름")
+    bucket_start = Column(DateTime, nullable=False, comment="버킷 시작 시각 (정시, UTC)")
+    sample_count = Column(BigInteger, nullable=False, default=0, comment="누적 샘플 수")
+    sketch = Column(
+        LargeBinary,
+        nullable=False,
+        comment="직렬화된 FeatureSketch (KLL + 고정 구간 히스토그램 + 모멘트)",
+    )
+    last_observed_at = Column(
+        DateTime,
+        nullable=True,
+        comment="반영된 마지막 거래 ingested_at (수집 워터마크, 수집 전 빈 버킷은 NULL)",
+    )
+    last_observed_id = Column(
+        Uuid,
+        nullable=True,
+        comment="반영된 마지막 거래 id (같은 ingested_at 내 워터마크 순서)",
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="수정 일시",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "feature_name",
+            "bucket_start",
+            name="uq_feature_sketch_buckets_feature_hour",
+        ),
+        Index("idx_feature_sketch_buckets_bucket_start", "bucket_start"),
+    )
+
+    def __repr__(self):
+        return f"<FeatureSketchBucket(feature={self.feature_name}, bucket={self.bucket_start}, n={self.sample_count})>"
@@ -11,7 +11,6 @@ from sqlalchemy import (
     String,
     Text,
     DateTime,
-    ForeignKey,
     Boolean,
     Index,
     Uuid,
@@ -30,7 +29,6 @@ class FraudFeedback(Base):
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     transaction_id = Column(
         Uuid,
-        ForeignKey("transactions.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
@@ -13,7 +13,6 @@ from sqlalchemy import (
     Text,
     Float,
     DateTime,
-    ForeignKey,
     Boolean,
     Index,
     Uuid,
@@ -42,7 +41,6 @@ class FraudLabel(Base):
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     transaction_id = Column(
         Uuid,
-        ForeignKey("transactions.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
         index=True,
@@ -0,0 +1,40 @@
+"""
+Labeling Checkpoint Model
+
+Tracks keyset progress of bulk labeling jobs so an interrupted run
+(e.g. a chargeback backfill) resumes after the last committed chunk.
+"""
+
+from datetime import datetime
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    BigInteger,
+    DateTime,
+    Uuid,
+)
+
+from .base import Base
+
+
+class LabelingCheckpoint(Base):
+    """Keyset checkpoint for a bulk labeling job"""
+
+    __tablename__ = "labeling_checkpoints"
+
+    job_name = Column(String(100), primary_key=True)
+    last_key = Column(Uuid, nullable=True)  # Last committed keyset key (None = start)
+    rows_processed = Column(BigInteger, nullable=False, default=0)
+    chunks_processed = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)  # None while a run is in progress
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self):
+        return (
+            f"<LabelingCheckpoint(job={self.job_name}, last_key={self.last_key}, "
+            f"rows={self.rows_processed}, completed={self.completed_at is not None})>"
+        )
@@ -0,0 +1,42 @@
+"""
+ModelRoutingConfig 모델
+
+카나리/프로덕션 라우팅 설정의 공유 원본 (단일 행).
+각 API 워커는 version 이 바뀌었을 때만 메모리 라우팅 테이블을 재구성한다.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, DateTime, JSON
+
+from .base import Base
+
+# 단일 설정 행 ID
+ROUTING_CONFIG_ID = 1
+
+
+class ModelRoutingConfig(Base):
+    """모델 라우팅 설정 (버전 + 카나리 설정 + 카나리 모니터링 카운터)"""
+
+    __tablename__ = "model_routing_config"
+
+    id = Column(Integer, primary_key=True, default=ROUTING_CONFIG_ID)
+    version = Column(BigInteger, nullable=False, default=0, comment="라우팅 버전 (변경마다 증가)")
+    canary_config = Column(
+        JSON(none_as_null=True),
+        nullable=True,
+        comment="진행 중인 카나리 배포 설정 (없으면 NULL)",
+    )
+    canary_requests = Column(BigInteger, nullable=False, default=0)
+    canary_successes = Column(BigInteger, nullable=False, default=0)
+    production_requests = Column(BigInteger, nullable=False, default=0)
+    production_successes = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="수정 일시",
+    )
+
+    def __repr__(self):
+        return f"<ModelRoutingConfig(version={self.version}, canary={self.canary_config is not None})>"
@@ -290,6 +290,38 @@ class RandomForestFraudModel:
             "cv_results": grid_search.cv_results_,
         }
 
+    def export_onnx(
+        self, onnx_path: str, validation_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
+        """
+        ONNX 형식으로 변환 (FDS ONNX Runtime 서빙용, 동등성 검증 포함)
+
+        Args:
+            onnx_path: ONNX 저장 경로
+            validation_data: 동등성 검증 데이터
+
+        Returns:
+            변환/검증 리포트
+        """
+        if not self.is_trained:
+            raise ValueError("Model is not trained yet. Call train() first.")
+
+        from src.deployment.tree_onnx_exporter import TreeModelONNXExporter
+
+        report = TreeModelONNXExporter().export(
+            self.model,
+            Path(onnx_path),
+            feature_names=self.feature_names,
+            validation_data=(
+                validation_data[self.feature_names].values
+                if validation_data is not None
+                else None
+            ),
+        )
+        logger.info(f"[Random Forest] Model exported to ONNX: {onnx_path}")
+
+        return report.to_dict()
+
     def save(self, filepath: str) -> None:
         """
         모델 저장
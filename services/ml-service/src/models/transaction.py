@@ -19,6 +19,7 @@ from sqlalchemy import (
     Index,
     Uuid,
     JSON,
+    func,
 )
 from sqlalchemy.orm import relationship
 import uuid
@@ -40,6 +41,9 @@ class Transaction(Base):
     ip_address = Column(String(45), nullable=True)
     device_fingerprint = Column(String(64), nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    # DB write time (write-behind / spill replay rows land after created_at);
+    # streaming drift ingestion watermark
+    ingested_at = Column(DateTime, nullable=False, server_default=func.now())
 
     # Fraud indicators
     is_chargeback = Column(Boolean, nullable=False, default=False, index=True)
@@ -60,7 +64,8 @@ class Transaction(Base):
     )
 
     # Additional metadata
-    metadata = Column(JSON, nullable=True)
+    # ("metadata" is reserved on declarative classes)
+    transaction_metadata = Column("metadata", JSON, nullable=True)
     updated_at = Column(
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
@@ -71,6 +76,7 @@ class Transaction(Base):
     __table_args__ = (
         Index("idx_transactions_user_id", "user_id"),
         Index("idx_transactions_created_at", "created_at"),
+        Index("ix_transactions_ingested_at_id", "ingested_at", "id"),
         Index("idx_transactions_is_chargeback", "is_chargeback"),
         Index("idx_transactions_fraud_reported", "fraud_reported"),
         Index("idx_transactions_fraud_label_id", "fraud_label_id"),
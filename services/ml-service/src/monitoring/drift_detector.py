@@ -8,6 +8,10 @@ Statistical Method:
 - Kolmogorov-Smirnov (KS) test for continuous features
 - Chi-square test for categorical features
 - Population Stability Index (PSI) for overall drift
+
+Features with hourly sketches (see streaming_drift.StreamingDriftMonitor)
+are evaluated from the merged sketches; raw values are only queried for
+features without sketch coverage.
 """
 
 import logging
@@ -21,6 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.transaction import Transaction
 from src.models.data_drift_log import DataDriftLog
+from src.monitoring.streaming_drift import BASE_FEATURES, StreamingDriftMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,7 @@ class DriftDetector:
         psi_threshold: float = 0.1,
         reference_period_days: int = 90,
         detection_period_days: int = 7,
+        streaming_monitor: Optional[StreamingDriftMonitor] = None,
     ):
         """
         Initialize DriftDetector
@@ -45,12 +51,14 @@ class DriftDetector:
             psi_threshold: PSI threshold for drift alert (default: 0.1)
             reference_period_days: Days for reference distribution (default: 90)
             detection_period_days: Days for current distribution (default: 7)
+            streaming_monitor: Sketch store (default: StreamingDriftMonitor on db_session)
         """
         self.db_session = db_session
         self.ks_threshold = ks_threshold
         self.psi_threshold = psi_threshold
         self.reference_period_days = reference_period_days
         self.detection_period_days = detection_period_days
+        self.streaming_monitor = streaming_monitor or StreamingDriftMonitor(db_session)
 
     async def get_feature_distribution(
         self,
@@ -189,7 +197,27 @@ class DriftDetector:
         current_start = now - timedelta(days=self.detection_period_days)
         current_end = now
 
-        # Get distributions
+        # Sketch-based statistics (no raw value scan)
+        sketch_result = await self.streaming_monitor.detect_feature_drift(
+            feature_name, reference_start, reference_end, current_start, current_end
+        )
+        if (
+            sketch_result["reference_sample_size"] >= 100
+            and sketch_result["current_sample_size"] >= 100
+        ):
+            return self._build_drift_result(
+                feature_name,
+                ks_statistic=sketch_result["ks_statistic"],
+                p_value=sketch_result["ks_p_value"],
+                psi=sketch_result["psi"],
+                reference_stats=sketch_result["reference_stats"],
+                current_stats=sketch_result["current_stats"],
+                reference_sample_size=sketch_result["reference_sample_size"],
+                current_sample_size=sketch_result["current_sample_size"],
+                source="sketch",
+            )
+
+        # Fallback: raw distributions (features without sketch coverage)
         reference_data = await self.get_feature_distribution(
             feature_name, reference_start, reference_end
         )
@@ -216,12 +244,6 @@ class DriftDetector:
         # Calculate PSI
         psi = self.calculate_psi(reference_data, current_data)
 
-        # Determine if drift is detected
-        ks_drift = p_value < self.ks_threshold
-        psi_drift = psi >= self.psi_threshold
-
-        drift_detected = ks_drift or psi_drift
-
         # Calculate distribution statistics
         reference_stats = {
             "mean": float(np.mean(reference_data)),
@@ -237,10 +259,41 @@ class DriftDetector:
             "max": float(np.max(current_data)),
         }
 
+        return self._build_drift_result(
+            feature_name,
+            ks_statistic=ks_statistic,
+            p_value=p_value,
+            psi=psi,
+            reference_stats=reference_stats,
+            current_stats=current_stats,
+            reference_sample_size=len(reference_data),
+            current_sample_size=len(current_data),
+            source="raw",
+        )
+
+    def _build_drift_result(
+        self,
+        feature_name: str,
+        ks_statistic: float,
+        p_value: float,
+        psi: float,
+        reference_stats: Dict[str, float],
+        current_stats: Dict[str, float],
+        reference_sample_size: int,
+        current_sample_size: int,
+        source: str,
+    ) -> Dict[str, any]:
+        """Apply thresholds and assemble a feature drift result"""
+        # Determine if drift is detected
+        ks_drift = p_value < self.ks_threshold
+        psi_drift = psi >= self.psi_threshold
+
+        drift_detected = ks_drift or psi_drift
+
         logger.info(
             f"[DRIFT] Feature: {feature_name}, "
             f"Drift detected: {drift_detected} "
-            f"(KS: {ks_drift}, PSI: {psi_drift})"
+            f"(KS: {ks_drift}, PSI: {psi_drift}, source: {source})"
         )
 
         return {
@@ -253,8 +306,9 @@ class DriftDetector:
             "psi_drift": psi_drift,
             "reference_stats": reference_stats,
             "current_stats": current_stats,
-            "reference_sample_size": len(reference_data),
-            "current_sample_size": len(current_data),
+            "reference_sample_size": reference_sample_size,
+            "current_sample_size": current_sample_size,
+            "source": source,
         }
 
     async def detect_all_features_drift(
@@ -264,16 +318,17 @@ class DriftDetector:
         Detect drift across all monitored features
 
         Args:
-            features: List of features to monitor (default: all critical features)
+            features: List of features to monitor (default: every feature with
+                sketches in the detection window, else amount/fds_risk_score)
 
         Returns:
             dict: Overall drift detection result
         """
         if features is None:
-            features = [
-                "amount",
-                "fds_risk_score",
-            ]
+            since = datetime.utcnow() - timedelta(days=self.detection_period_days)
+            features = await self.streaming_monitor.get_monitored_features(since)
+            if not features:
+                features = list(BASE_FEATURES)
 
         logger.info(f"[DRIFT] Starting drift detection for features: {features}")
 
@@ -0,0 +1,401 @@
+"""
+Mergeable Feature Sketches for Streaming Drift Detection
+
+Compact, mergeable summaries of a feature's distribution so drift can be
+measured without pulling raw values back out of the database.
+
+Components:
+- KLLSketch: KLL quantile sketch (Karnin, Lang, Liberty 2016); rank error
+  ~1.65/k with k=200, mergeable across hours and processes
+- FeatureSketch: KLL sketch + fixed-bin histogram + moments (count, sum,
+  sum of squares, min, max), serialized to a few KB with zlib
+- ks_statistic_from_sketches / psi_from_sketches: drift statistics computed
+  directly from sketches
+"""
+
+import math
+import random
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats
+
+SKETCH_FORMAT_VERSION = 1
+
+# Normalized rank error of a compacted KLL sketch is about KLL_RANK_ERROR / k
+KLL_RANK_ERROR = 1.65
+
+# Fixed histogram bin edges for features with a known range. Features not
+# listed here fall back to PSI computed from the KLL sketch.
+DEFAULT_BIN_EDGES: Dict[str, Tuple[float, ...]] = {
+    "amount": (0.0, 1e4, 3e4, 5e4, 1e5, 2e5, 5e5, 1e6, 2e6, 5e6),
+    "fds_risk_score": tuple(float(edge) for edge in range(0, 101, 10)),
+}
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch
+
+    Keeps a stack of compactors; level h holds items of weight 2**h. When the
+    sketch is full the lowest overfull level is sorted and every other item is
+    promoted to the next level.
+    """
+
+    def __init__(self, k: int = 200, c: float = 2.0 / 3.0, seed: Optional[int] = None):
+        """
+        Args:
+            k: Accuracy parameter (top compactor capacity)
+            c: Capacity decay factor between levels
+            seed: Seed for compaction coin flips (deterministic tests)
+        """
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.compactors: List[List[float]] = []
+        self._rng = random.Random(seed)
+        self._grow()
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * self.c**depth)) + 1
+
+    @property
+    def size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error bound (0 while every item is still retained)"""
+        if not any(self.compactors[1:]):
+            return 0.0
+        return KLL_RANK_ERROR / self.k
+
+    def update(self, value: float):
+        self.compactors[0].append(float(value))
+        self.n += 1
+        if self.size >= self.max_size:
+            self._compress()
+
+    def update_many(self, values: Iterable[float]):
+        """Bulk update; compaction is amortized over the batch"""
+        array = np.asarray(values, dtype=np.float64).ravel()
+        array = array[np.isfinite(array)]
+        if len(array) == 0:
+            return
+        self.compactors[0].extend(array.tolist())
+        self.n += len(array)
+        self._compress()
+
+    def _compact_level(self, level: int):
+        if level + 1 >= len(self.compactors):
+            self._grow()
+        items = np.sort(np.asarray(self.compactors[level], dtype=np.float64))
+        leftover: List[float] = []
+        if len(items) % 2 == 1:
+            leftover = [float(items[-1])]
+            items = items[:-1]
+        offset = self._rng.randint(0, 1)
+        self.compactors[level + 1].extend(items[offset::2].tolist())
+        self.compactors[level] = leftover
+
+    def _compress(self):
+        while self.size >= self.max_size:
+            for level in range(len(self.compactors)):
+                if len(self.compactors[level]) >= self._capacity(level):
+                    self._compact_level(level)
+                    break
+            else:
+                break
+
+    def merge(self, other: "KLLSketch"):
+        """Merge another sketch into this one (in place)"""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.n += other.n
+        self._compress()
+
+    def weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retained items (sorted) with their weights
+
+        Returns:
+            tuple: (values, weights)
+        """
+        values = []
+        weights = []
+        for level, compactor in enumerate(self.compactors):
+            values.extend(compactor)
+            weights.extend([2**level] * len(compactor))
+        if not values:
+            return np.empty(0), np.empty(0)
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        order = np.argsort(values, kind="mergesort")
+        return values[order], weights[order]
+
+    def cdf(self, points: Sequence[float]) -> np.ndarray:
+        """Estimated P(X <= point) for each point"""
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return np.zeros(len(points))
+        cumulative = np.cumsum(weights)
+        idx = np.searchsorted(
+            values, np.asarray(points, dtype=np.float64), side="right"
+        )
+        ranks = np.where(idx > 0, cumulative[np.maximum(idx - 1, 0)], 0.0)
+        return ranks / cumulative[-1]
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Estimated values at the given quantiles (0-1)"""
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return np.full(len(qs), np.nan)
+        cumulative = np.cumsum(weights) / np.sum(weights)
+        idx = np.searchsorted(cumulative, np.asarray(qs, dtype=np.float64), side="left")
+        return values[np.minimum(idx, len(values) - 1)]
+
+    def to_bytes(self) -> bytes:
+        header = struct.pack("<HQH", self.k, self.n, len(self.compactors))
+        body = b"".join(
+            struct.pack("<I", len(compactor))
+            + np.asarray(compactor, dtype=np.float64).tobytes()
+            for compactor in self.compactors
+        )
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple["KLLSketch", int]:
+        k, n, levels = struct.unpack_from("<HQH", data, offset)
+        offset += struct.calcsize("<HQH")
+        sketch = cls(k=k)
+        sketch.n = n
+        sketch.compactors = []
+        for _ in range(levels):
+            (count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            sketch.compactors.append(
+                np.frombuffer(
+                    data, dtype=np.float64, count=count, offset=offset
+                ).tolist()
+            )
+            offset += 8 * count
+        sketch.max_size = sum(sketch._capacity(h) for h in range(levels))
+        return sketch, offset
+
+
+class FeatureSketch:
+    """
+    Distribution summary of one feature over one time bucket
+
+    Example:
+        >>> sketch = FeatureSketch("amount")
+        >>> sketch.update_many([1200.0, 35000.0, 89000.0])
+        >>> restored = FeatureSketch.from_bytes(sketch.to_bytes())
+        >>> restored.count
+        3
+    """
+
+    def __init__(
+        self,
+        feature_name: str,
+        bin_edges: Optional[Sequence[float]] = None,
+        k: int = 200,
+    ):
+        self.feature_name = feature_name
+        if bin_edges is None:
+            bin_edges = DEFAULT_BIN_EDGES.get(feature_name)
+        self.bin_edges = np.asarray(bin_edges, dtype=np.float64) if bin_edges else None
+        # len(edges) + 1 bins: (-inf, e0), [e0, e1), ..., [e_last, +inf)
+        self.bin_counts = (
+            np.zeros(len(self.bin_edges) + 1, dtype=np.int64)
+            if self.bin_edges is not None
+            else None
+        )
+        self.kll = KLLSketch(k=k)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update_many(self, values: Iterable[float]):
+        array = np.asarray(values, dtype=np.float64).ravel()
+        array = array[np.isfinite(array)]
+        if len(array) == 0:
+            return
+        self.kll.update_many(array)
+        if self.bin_counts is not None:
+            self.bin_counts += np.bincount(
+                np.searchsorted(self.bin_edges, array, side="right"),
+                minlength=len(self.bin_counts),
+            )
+        self.count += len(array)
+        self.total += float(array.sum())
+        self.total_sq += float(np.square(array).sum())
+        self.min = min(self.min, float(array.min()))
+        self.max = max(self.max, float(array.max()))
+
+    def update(self, value: float):
+        self.update_many([value])
+
+    def merge(self, other: "FeatureSketch"):
+        """Merge another sketch of the same feature (in place)"""
+        self.kll.merge(other.kll)
+        if self.bin_counts is not None and other.bin_counts is not None:
+            if np.array_equal(self.bin_edges, other.bin_edges):
+                self.bin_counts += other.bin_counts
+            else:
+                self.bin_edges = None
+                self.bin_counts = None
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> Dict[str, float]:
+        if self.count == 0:
+            return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0}
+        mean = self.total / self.count
+        variance = max(self.total_sq / self.count - mean * mean, 0.0)
+        return {
+            "mean": mean,
+            "std": math.sqrt(variance),
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def to_bytes(self) -> bytes:
+        name = self.feature_name.encode()
+        edges = self.bin_edges if self.bin_edges is not None else np.empty(0)
+        counts = (
+            self.bin_counts if self.bin_counts is not None else np.empty(0, np.int64)
+        )
+        payload = (
+            struct.pack("<BH", SKETCH_FORMAT_VERSION, len(name))
+            + name
+            + struct.pack(
+                "<Qdddd", self.count, self.total, self.total_sq, self.min, self.max
+            )
+            + struct.pack("<I", len(edges))
+            + edges.astype(np.float64).tobytes()
+            + counts.astype(np.int64).tobytes()
+            + self.kll.to_bytes()
+        )
+        return zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FeatureSketch":
+        payload = zlib.decompress(data)
+        version, name_len = struct.unpack_from("<BH", payload, 0)
+        if version != SKETCH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sketch format version: {version}")
+        offset = struct.calcsize("<BH")
+        name = payload[offset : offset + name_len].decode()
+        offset += name_len
+
+        count, total, total_sq, min_value, max_value = struct.unpack_from(
+            "<Qdddd", payload, offset
+        )
+        offset += struct.calcsize("<Qdddd")
+        (n_edges,) = struct.unpack_from("<I", payload, offset)
+        offset += 4
+
+        sketch = cls(name, bin_edges=[])
+        if n_edges:
+            sketch.bin_edges = np.frombuffer(
+                payload, dtype=np.float64, count=n_edges, offset=offset
+            ).copy()
+            offset += 8 * n_edges
+            sketch.bin_counts = np.frombuffer(
+                payload, dtype=np.int64, count=n_edges + 1, offset=offset
+            ).copy()
+            offset += 8 * (n_edges + 1)
+
+        sketch.kll, offset = KLLSketch.from_bytes(payload, offset)
+        sketch.count = count
+        sketch.total = total
+        sketch.total_sq = total_sq
+        sketch.min = min_value
+        sketch.max = max_value
+        return sketch
+
+
+def ks_statistic_from_sketches(
+    reference: FeatureSketch, current: FeatureSketch
+) -> Tuple[float, float]:
+    """
+    Two-sample KS statistic from quantile sketches
+
+    The empirical CDFs are evaluated at every retained item of both sketches.
+    Each sketch CDF can be off by its rank error, so the sketch statistic may
+    exceed the true one by up to the sum of both bounds; the p-value uses the
+    asymptotic Kolmogorov distribution (as in ks_2samp(method="asymp")) on
+    the statistic minus that bound. Without the correction the approximation
+    error alone reads as significant drift once sample counts are large.
+
+    Returns:
+        tuple: (KS statistic, p-value)
+    """
+    if reference.count == 0 or current.count == 0:
+        return 0.0, 1.0
+
+    points = np.union1d(
+        reference.kll.weighted_items()[0], current.kll.weighted_items()[0]
+    )
+    ks_statistic = float(
+        np.max(np.abs(reference.kll.cdf(points) - current.kll.cdf(points)))
+    )
+    rank_error = reference.kll.rank_error + current.kll.rank_error
+    effective_n = reference.count * current.count / (reference.count + current.count)
+    p_value = float(
+        stats.kstwo.sf(max(ks_statistic - rank_error, 0.0), np.round(effective_n))
+    )
+    return ks_statistic, p_value
+
+
+def psi_from_sketches(
+    reference: FeatureSketch, current: FeatureSketch, bins: int = 10
+) -> float:
+    """
+    Population Stability Index from sketches
+
+    Uses the shared fixed-bin histogram when both sketches have one;
+    otherwise bins are the reference quantiles (equal reference mass per bin,
+    which keeps sketch rank error from dominating sparse tail bins) and bin
+    masses come from the KLL CDFs.
+    """
+    if reference.count == 0 or current.count == 0:
+        return 0.0
+
+    if (
+        reference.bin_counts is not None
+        and current.bin_counts is not None
+        and np.array_equal(reference.bin_edges, current.bin_edges)
+    ):
+        reference_counts = reference.bin_counts.astype(np.float64)
+        current_counts = current.bin_counts.astype(np.float64)
+    else:
+        edges = np.unique(reference.kll.quantiles(np.linspace(0, 1, bins + 1)[1:-1]))
+        reference_cdf = np.concatenate(([0.0], reference.kll.cdf(edges), [1.0]))
+        current_cdf = np.concatenate(([0.0], current.kll.cdf(edges), [1.0]))
+        reference_counts = np.diff(reference_cdf) * reference.count
+        current_counts = np.diff(current_cdf) * current.count
+
+    n_bins = len(reference_counts)
+    epsilon = 1e-10
+    reference_pct = (reference_counts + epsilon) / (reference.count + epsilon * n_bins)
+    current_pct = (current_counts + epsilon) / (current.count + epsilon * n_bins)
+
+    return float(
+        np.sum((current_pct - reference_pct) * np.log(current_pct / reference_pct))
+    )
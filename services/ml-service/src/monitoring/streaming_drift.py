@@ -0,0 +1,386 @@
+"""
+Streaming Drift Monitoring with Hourly Feature Sketches
+
+Maintains one mergeable FeatureSketch per feature per hour so that drift
+statistics for any window are computed by merging a few hundred compact
+sketches instead of re-reading every raw transaction value.
+
+Flow:
+1. observe()/observe_batch() fold scored transactions into in-memory
+   hourly sketches
+2. flush() merges the in-memory sketches into feature_sketch_buckets rows
+   under row locks (concurrent flushers never overwrite each other)
+3. ingest_new_transactions() streams transactions written since the last
+   watermark (keyset over (ingested_at, id)) and observes them - run
+   periodically. The watermark follows the DB write time, not created_at:
+   write-behind batches and spill replays land rows long after their
+   created_at, and those rows must still be picked up.
+4. detect_feature_drift() merges reference/current buckets and computes
+   KS/PSI from the sketches
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.feature_sketch_bucket import FeatureSketchBucket
+from src.models.transaction import Transaction
+from src.monitoring.feature_sketch import (
+    FeatureSketch,
+    ks_statistic_from_sketches,
+    psi_from_sketches,
+)
+
+logger = logging.getLogger(__name__)
+
+# Transaction columns sketched as-is (also available to the raw fallback)
+BASE_FEATURES = ("amount", "fds_risk_score")
+
+# Serializes ingest pages across workers (pg_advisory_xact_lock key)
+INGEST_LOCK_KEY = 0x6D6C5F6472696674  # "ml_drift"
+
+Watermark = Tuple[datetime, Optional[UUID]]
+
+
+def _hour_floor(timestamp: datetime) -> datetime:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def _after(position: Watermark, other: Watermark) -> bool:
+    """(ingested_at, id) ordering; a missing id sorts before any id"""
+    if other[0] is None:
+        return position[0] is not None
+    if position[0] is None:
+        return False
+    if position[0] != other[0]:
+        return position[0] > other[0]
+    return position[1] is not None and (
+        other[1] is None or str(position[1]) > str(other[1])
+    )
+
+
+class StreamingDriftMonitor:
+    """Hourly feature sketch maintenance and sketch-based drift detection"""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        ingest_chunk_size: int = 5000,
+        ingest_lag_seconds: int = 60,
+        max_backfill_hours: int = 24 * 7,
+    ):
+        """
+        Args:
+            db_session: Database session
+            ingest_chunk_size: Transactions fetched per keyset page
+            ingest_lag_seconds: Ignore transactions written (ingested_at) less
+                than lag ago (gives in-flight commits time to land before the
+                watermark moves past them; ingested_at is set by the insert
+                statement itself, so this only has to cover one DB transaction)
+            max_backfill_hours: First-run backfill horizon when no sketches exist
+        """
+        self.db_session = db_session
+        self.ingest_chunk_size = ingest_chunk_size
+        self.ingest_lag_seconds = ingest_lag_seconds
+        self.max_backfill_hours = max_backfill_hours
+
+        # (feature_name, bucket_start) -> pending values
+        self._pending: Dict[Tuple[str, datetime], List[float]] = defaultdict(list)
+        self._pending_watermark: Optional[Watermark] = None
+
+    def observe(
+        self,
+        features: Dict[str, Any],
+        scored_at: datetime,
+        position: Optional[Watermark] = None,
+    ):
+        """
+        Record one scored transaction's feature values
+
+        Args:
+            features: Feature name -> numeric value (non-numeric values ignored)
+            scored_at: Transaction timestamp (UTC), selects the hourly bucket
+            position: (ingested_at, id) of the row, advances the ingest
+                watermark (None for values not read from transactions)
+        """
+        bucket = _hour_floor(scored_at)
+        for name, value in features.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            self._pending[(name, bucket)].append(float(value))
+
+        if position is not None and (
+            self._pending_watermark is None or _after(position, self._pending_watermark)
+        ):
+            self._pending_watermark = position
+
+    def observe_batch(self, rows: Iterable[Tuple[Dict[str, Any], datetime]]):
+        for features, scored_at in rows:
+            self.observe(features, scored_at)
+
+    async def flush(self) -> int:
+        """
+        Merge pending observations into persisted hourly sketches
+
+        Missing bucket rows are created empty (INSERT ... ON CONFLICT DO
+        NOTHING), then every touched row is read with SELECT ... FOR UPDATE
+        in key order and merged, so concurrent flushers serialize per bucket
+        instead of overwriting each other's sketches.
+
+        Returns:
+            int: Number of bucket rows written
+        """
+        if not self._pending:
+            return 0
+
+        keys = sorted(self._pending.keys())
+        features = {name for name, _ in keys}
+        buckets = {bucket for _, bucket in keys}
+
+        insert = (
+            sqlite_insert
+            if self.db_session.get_bind().dialect.name == "sqlite"
+            else pg_insert
+        )
+        await self.db_session.execute(
+            insert(FeatureSketchBucket)
+            .values(
+                [
+                    {
+                        "feature_name": feature_name,
+                        "bucket_start": bucket_start,
+                        "sample_count": 0,
+                        "sketch": FeatureSketch(feature_name).to_bytes(),
+                        "updated_at": datetime.utcnow(),
+                    }
+                    for feature_name, bucket_start in keys
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    FeatureSketchBucket.feature_name,
+                    FeatureSketchBucket.bucket_start,
+                ]
+            )
+        )
+
+        result = await self.db_session.execute(
+            select(FeatureSketchBucket)
+            .where(
+                and_(
+                    FeatureSketchBucket.feature_name.in_(features),
+                    FeatureSketchBucket.bucket_start.in_(buckets),
+                )
+            )
+            .order_by(
+                FeatureSketchBucket.feature_name, FeatureSketchBucket.bucket_start
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        rows = {
+            (row.feature_name, row.bucket_start): row for row in result.scalars().all()
+        }
+
+        watermark = self._pending_watermark
+        for key in keys:
+            row = rows[key]
+            sketch = FeatureSketch.from_bytes(row.sketch)
+            sketch.update_many(self._pending[key])
+            row.sample_count = sketch.count
+            row.sketch = sketch.to_bytes()
+            if watermark is not None and _after(
+                watermark, (row.last_observed_at, row.last_observed_id)
+            ):
+                row.last_observed_at, row.last_observed_id = watermark
+
+        await self.db_session.commit()
+
+        written = len(self._pending)
+        self._pending.clear()
+        self._pending_watermark = None
+        logger.info(f"[DRIFT] Flushed {written} feature sketch buckets")
+        return written
+
+    async def get_watermark(self) -> Optional[Watermark]:
+        """Latest (ingested_at, id) already folded into sketches"""
+        result = await self.db_session.execute(
+            select(
+                FeatureSketchBucket.last_observed_at,
+                FeatureSketchBucket.last_observed_id,
+            )
+            .where(FeatureSketchBucket.last_observed_at.isnot(None))
+            .order_by(
+                FeatureSketchBucket.last_observed_at.desc(),
+                FeatureSketchBucket.last_observed_id.desc().nulls_last(),
+            )
+            .limit(1)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row is not None else None
+
+    async def ingest_new_transactions(self) -> Dict[str, Any]:
+        """
+        Fold transactions written since the last watermark into the sketches
+
+        Pages through transactions by (ingested_at, id) keyset, flushing after
+        every page so memory stays bounded and progress is durable. The id
+        tie-breaker keeps rows sharing a timestamp from being skipped or
+        counted twice across pages. Each page re-reads the watermark under a
+        transaction-level advisory lock, so concurrent ingesters never fold
+        the same rows twice.
+
+        Returns:
+            dict: Ingestion summary
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ingest_lag_seconds)
+        ingested = 0
+        while True:
+            await self._lock_ingest()
+            watermark = await self.get_watermark()
+            if watermark is None:
+                watermark = (cutoff - timedelta(hours=self.max_backfill_hours), None)
+
+            query = (
+                select(
+                    Transaction.id,
+                    Transaction.created_at,
+                    Transaction.ingested_at,
+                    Transaction.amount,
+                    Transaction.fds_risk_score,
+                )
+                .where(
+                    and_(
+                        self._after_watermark(watermark),
+                        Transaction.ingested_at <= cutoff,
+                    )
+                )
+                .order_by(Transaction.ingested_at, Transaction.id)
+                .limit(self.ingest_chunk_size)
+            )
+            rows = (await self.db_session.execute(query)).all()
+            if not rows:
+                await self.db_session.rollback()
+                break
+
+            for row in rows:
+                self.observe(
+                    self._row_features(row), row.created_at, (row.ingested_at, row.id)
+                )
+
+            await self.flush()
+            ingested += len(rows)
+            watermark = (rows[-1].ingested_at, rows[-1].id)
+
+            if len(rows) < self.ingest_chunk_size:
+                break
+
+        logger.info(f"[DRIFT] Ingested {ingested} transactions into feature sketches")
+        return {
+            "transactions_ingested": ingested,
+            "watermark": watermark[0].isoformat(),
+        }
+
+    async def _lock_ingest(self):
+        """Serialize ingest pages across workers until the page commits"""
+        if self.db_session.get_bind().dialect.name != "postgresql":
+            return
+        await self.db_session.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": INGEST_LOCK_KEY}
+        )
+
+    @staticmethod
+    def _after_watermark(watermark: Watermark):
+        watermark_at, watermark_id = watermark
+        if watermark_id is None:
+            return Transaction.ingested_at > watermark_at
+        return tuple_(Transaction.ingested_at, Transaction.id) > tuple_(
+            watermark_at, watermark_id
+        )
+
+    @staticmethod
+    def _row_features(row) -> Dict[str, Any]:
+        """
+        Sketched features of one transaction row
+
+        Columns plus the per-row temporal features of data.feature_engineering;
+        window/aggregate features need other rows and are not sketched.
+        """
+        features: Dict[str, Any] = {
+            "hour_of_day": row.created_at.hour,
+            "day_of_week": row.created_at.weekday(),
+        }
+        if row.amount is not None:
+            features["amount"] = float(row.amount)
+        if row.fds_risk_score is not None:
+            features["fds_risk_score"] = float(row.fds_risk_score)
+        return features
+
+    async def get_monitored_features(
+        self, since: Optional[datetime] = None
+    ) -> List[str]:
+        """Features that have at least one persisted sketch"""
+        query = select(FeatureSketchBucket.feature_name).distinct()
+        if since is not None:
+            query = query.where(FeatureSketchBucket.bucket_start >= since)
+        result = await self.db_session.execute(query)
+        return sorted(row[0] for row in result.all())
+
+    async def get_merged_sketch(
+        self, feature_name: str, start_date: datetime, end_date: datetime
+    ) -> FeatureSketch:
+        """
+        Merge all hourly sketches of a feature within [start_date, end_date)
+        """
+        result = await self.db_session.execute(
+            select(FeatureSketchBucket.sketch).where(
+                and_(
+                    FeatureSketchBucket.feature_name == feature_name,
+                    FeatureSketchBucket.bucket_start >= _hour_floor(start_date),
+                    FeatureSketchBucket.bucket_start < end_date,
+                )
+            )
+        )
+        merged = FeatureSketch(feature_name)
+        for (blob,) in result.all():
+            merged.merge(FeatureSketch.from_bytes(blob))
+        return merged
+
+    async def detect_feature_drift(
+        self,
+        feature_name: str,
+        reference_start: datetime,
+        reference_end: datetime,
+        current_start: datetime,
+        current_end: datetime,
+    ) -> Dict[str, Any]:
+        """
+        Sketch-based drift statistics for one feature
+
+        Returns:
+            dict: KS/PSI statistics plus reference/current summaries
+        """
+        reference = await self.get_merged_sketch(
+            feature_name, reference_start, reference_end
+        )
+        current = await self.get_merged_sketch(feature_name, current_start, current_end)
+
+        ks_statistic, p_value = ks_statistic_from_sketches(reference, current)
+        psi = psi_from_sketches(reference, current)
+
+        return {
+            "ks_statistic": ks_statistic,
+            "ks_p_value": p_value,
+            "psi": psi,
+            "reference_stats": reference.summary(),
+            "current_stats": current.summary(),
+            "reference_sample_size": reference.count,
+            "current_sample_size": current.count,
+        }
@@ -9,17 +9,30 @@ Business Logic:
 - Manual fraud reports are labeled as fraud with confidence score
 - Transactions older than 90 days with no chargeback are labeled as legitimate
 - Minimum 100 chargebacks required to trigger auto-labeling
+
+Labels are written set-based (INSERT ... SELECT ... ON CONFLICT DO NOTHING
+RETURNING, then an UPDATE ... FROM join linking transactions to their
+labels) in keyset-paginated chunks. Each chunk commits together with its
+checkpoint, so an interrupted backfill resumes where it stopped and reruns
+never duplicate labels.
 """
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Any, Dict
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Boolean, DateTime, Float, String, Text
+from sqlalchemy import and_, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.transaction import Transaction
-from src.models.fraud_label import FraudLabel
+from src.models.fraud_label import FraudLabel, LabelSource
+from src.training.bulk_labeling import (
+    LabelingCheckpointStore,
+    LabelingThroughput,
+    next_keyset_bound,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +45,7 @@ class AutoLabeler:
         db_session: AsyncSession,
         min_chargeback_count: int = 100,
         safe_period_days: int = 90,
+        chunk_size: int = 5000,
     ):
         """
         Initialize AutoLabeler
@@ -40,10 +54,16 @@ class AutoLabeler:
             db_session: Database session
             min_chargeback_count: Minimum chargebacks to trigger auto-labeling
             safe_period_days: Days to wait before labeling as legitimate
+            chunk_size: Transactions labeled per chunk (one commit per chunk)
         """
         self.db_session = db_session
         self.min_chargeback_count = min_chargeback_count
         self.safe_period_days = safe_period_days
+        self.chunk_size = chunk_size
+        self.checkpoints = LabelingCheckpointStore(db_session)
+
+        # Throughput of the latest run per labeling job
+        self.throughput_report: Dict[str, Dict[str, Any]] = {}
 
     async def check_chargeback_threshold(self) -> Dict[str, any]:
         """
@@ -83,6 +103,115 @@ class AutoLabeler:
             "threshold_met": threshold_met,
         }
 
+    async def _bulk_label(
+        self,
+        job_name: str,
+        condition,
+        is_fraud: bool,
+        label_source: str,
+        confidence_score: float,
+        notes: str,
+    ) -> int:
+        """
+        Label all transactions matching condition in keyset chunks
+
+        Per chunk:
+        1. INSERT INTO fraud_labels ... SELECT ... FROM transactions
+           ON CONFLICT (transaction_id) DO NOTHING RETURNING transaction_id
+        2. UPDATE transactions SET fraud_label_id = fraud_labels.id
+           FROM fraud_labels (also repairs labels left unlinked)
+        3. Advance the checkpoint and commit
+
+        Args:
+            job_name: Checkpoint / throughput key
+            condition: Transactions to label
+            is_fraud: Label value
+            label_source: LabelSource value
+            confidence_score: Label confidence
+            notes: Label notes
+
+        Returns:
+            int: Number of labels created
+        """
+        last_id = await self.checkpoints.resume_point(job_name)
+        throughput = LabelingThroughput(job_name, resumed=last_id is not None)
+
+        label_columns = [
+            FraudLabel.id,
+            FraudLabel.transaction_id,
+            FraudLabel.is_fraud,
+            FraudLabel.label_source,
+            FraudLabel.confidence_score,
+            FraudLabel.labeled_by,
+            FraudLabel.labeled_at,
+            FraudLabel.notes,
+            FraudLabel.created_at,
+            FraudLabel.updated_at,
+        ]
+
+        while True:
+            upper_id = await next_keyset_bound(
+                self.db_session, Transaction.id, condition, last_id, self.chunk_size
+            )
+            if upper_id is None:
+                break
+
+            in_chunk = and_(condition, Transaction.id <= upper_id)
+            if last_id is not None:
+                in_chunk = and_(in_chunk, Transaction.id > last_id)
+
+            now = datetime.utcnow()
+            label_rows = select(
+                func.gen_random_uuid(),
+                Transaction.id,
+                literal(is_fraud, Boolean),
+                literal(label_source, String),
+                literal(confidence_score, Float),
+                literal("system", String),
+                literal(now, DateTime),
+                literal(notes, Text),
+                literal(now, DateTime),
+                literal(now, DateTime),
+            ).where(in_chunk)
+
+            insert_stmt = (
+                pg_insert(FraudLabel)
+                .from_select(label_columns, label_rows)
+                .on_conflict_do_nothing(index_elements=[FraudLabel.transaction_id])
+                .returning(FraudLabel.transaction_id)
+            )
+            inserted = len((await self.db_session.execute(insert_stmt)).all())
+
+            link_stmt = (
+                update(Transaction)
+                .where(
+                    and_(
+                        in_chunk,
+                        Transaction.id == FraudLabel.transaction_id,
+                    )
+                )
+                .values(fraud_label_id=FraudLabel.id, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            linked = (await self.db_session.execute(link_stmt)).rowcount
+
+            await self.checkpoints.advance(job_name, upper_id, inserted)
+            await self.db_session.commit()
+
+            throughput.record_chunk(inserted, linked)
+            last_id = upper_id
+
+        await self.checkpoints.complete(job_name)
+
+        report = throughput.to_dict()
+        self.throughput_report[job_name] = report
+        logger.info(
+            f"[AUTO-LABELER] {job_name}: {report['rows_labeled']} labeled in "
+            f"{report['chunks']} chunks ({report['rows_per_second']} rows/s)"
+        )
+
+        return throughput.rows_labeled
+
     async def label_chargebacks(self) -> int:
         """
         Automatically label all chargeback transactions as fraud
@@ -90,33 +219,17 @@ class AutoLabeler:
         Returns:
             int: Number of transactions labeled
         """
-        # Find unlabeled chargebacks
-        query = select(Transaction).where(
+        labeled_count = await self._bulk_label(
+            "chargebacks",
             and_(
                 Transaction.is_chargeback.is_(True),
                 Transaction.fraud_label_id.is_(None),
-            )
+            ),
+            is_fraud=True,
+            label_source=LabelSource.CHARGEBACK.value,
+            confidence_score=1.0,
+            notes="Automatically labeled from chargeback data",
         )
-        result = await self.db_session.execute(query)
-        transactions = result.scalars().all()
-
-        labeled_count = 0
-        for transaction in transactions:
-            # Create fraud label
-            fraud_label = FraudLabel(
-                transaction_id=transaction.id,
-                is_fraud=True,
-                label_source="chargeback",
-                confidence_score=1.0,
-                labeled_by="system",
-                labeled_at=datetime.utcnow(),
-                notes="Automatically labeled from chargeback data",
-            )
-            self.db_session.add(fraud_label)
-            transaction.fraud_label_id = fraud_label.id
-            labeled_count += 1
-
-        await self.db_session.commit()
 
         logger.info(f"[AUTO-LABELER] Labeled {labeled_count} chargebacks as fraud")
 
@@ -129,33 +242,18 @@ class AutoLabeler:
         Returns:
             int: Number of transactions labeled
         """
-        # Find transactions with fraud reports but no label
-        query = select(Transaction).where(
+        # Slightly lower confidence than chargebacks
+        labeled_count = await self._bulk_label(
+            "manual_reports",
             and_(
                 Transaction.fraud_reported.is_(True),
                 Transaction.fraud_label_id.is_(None),
-            )
+            ),
+            is_fraud=True,
+            label_source=LabelSource.USER_REPORT.value,
+            confidence_score=0.95,
+            notes="Automatically labeled from user fraud report",
         )
-        result = await self.db_session.execute(query)
-        transactions = result.scalars().all()
-
-        labeled_count = 0
-        for transaction in transactions:
-            # Create fraud label with slightly lower confidence
-            fraud_label = FraudLabel(
-                transaction_id=transaction.id,
-                is_fraud=True,
-                label_source="user_report",
-                confidence_score=0.95,
-                labeled_by="system",
-                labeled_at=datetime.utcnow(),
-                notes="Automatically labeled from user fraud report",
-            )
-            self.db_session.add(fraud_label)
-            transaction.fraud_label_id = fraud_label.id
-            labeled_count += 1
-
-        await self.db_session.commit()
 
         logger.info(f"[AUTO-LABELER] Labeled {labeled_count} fraud reports as fraud")
 
@@ -170,35 +268,19 @@ class AutoLabeler:
         """
         safe_date = datetime.utcnow() - timedelta(days=self.safe_period_days)
 
-        # Find old transactions with no chargeback or fraud report
-        query = select(Transaction).where(
+        labeled_count = await self._bulk_label(
+            "safe_transactions",
             and_(
                 Transaction.created_at < safe_date,
                 Transaction.is_chargeback.is_(False),
                 Transaction.fraud_reported.is_(False),
                 Transaction.fraud_label_id.is_(None),
-            )
+            ),
+            is_fraud=False,
+            label_source=LabelSource.AUTO_SAFE_PERIOD.value,
+            confidence_score=0.9,
+            notes=f"Automatically labeled as legitimate after {self.safe_period_days} days with no chargeback",
         )
-        result = await self.db_session.execute(query)
-        transactions = result.scalars().all()
-
-        labeled_count = 0
-        for transaction in transactions:
-            # Create legitimate label
-            fraud_label = FraudLabel(
-                transaction_id=transaction.id,
-                is_fraud=False,
-                label_source="auto_safe_period",
-                confidence_score=0.9,
-                labeled_by="system",
-                labeled_at=datetime.utcnow(),
-                notes=f"Automatically labeled as legitimate after {self.safe_period_days} days with no chargeback",
-            )
-            self.db_session.add(fraud_label)
-            transaction.fraud_label_id = fraud_label.id
-            labeled_count += 1
-
-        await self.db_session.commit()
 
         logger.info(
             f"[AUTO-LABELER] Labeled {labeled_count} old transactions as legitimate"
@@ -260,6 +342,27 @@ class AutoLabeler:
                 "safe_transactions": safe_count,
                 "total": total_labeled,
             },
+            "throughput": self.get_throughput_report(),
+        }
+
+    def get_throughput_report(self) -> Dict[str, Any]:
+        """
+        Rows labeled per second for the latest run of each labeling job
+
+        Returns:
+            dict: Per-job throughput plus overall rows/s
+        """
+        jobs = dict(self.throughput_report)
+        total_rows = sum(job["rows_labeled"] for job in jobs.values())
+        total_seconds = sum(job["elapsed_seconds"] for job in jobs.values())
+
+        return {
+            "jobs": jobs,
+            "total_rows_labeled": total_rows,
+            "total_elapsed_seconds": round(total_seconds, 3),
+            "rows_per_second": round(total_rows / total_seconds, 1)
+            if total_seconds > 0
+            else 0.0,
         }
 
     async def get_labeling_statistics(self) -> Dict[str, any]:
@@ -0,0 +1,155 @@
+"""
+Set-Based Bulk Labeling Helpers
+
+Shared building blocks for AutoLabeler and FeedbackCollector:
+- Keyset chunk boundaries (bounded memory: only one key is read per chunk)
+- Per-job checkpoints committed together with each chunk, so an
+  interrupted run resumes after the last committed chunk
+- Throughput tracking (rows labeled per second)
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.labeling_checkpoint import LabelingCheckpoint
+
+logger = logging.getLogger(__name__)
+
+
+async def next_keyset_bound(
+    db_session: AsyncSession,
+    key_column,
+    condition,
+    after: Optional[UUID],
+    chunk_size: int,
+) -> Optional[UUID]:
+    """
+    Upper key of the next chunk of rows matching condition
+
+    Args:
+        db_session: Database session
+        key_column: Keyset column (primary key)
+        condition: Row filter
+        after: Exclusive lower bound (None = from the start)
+        chunk_size: Rows per chunk
+
+    Returns:
+        Inclusive upper bound, or None when no rows remain
+    """
+    page = select(key_column.label("key")).where(condition)
+    if after is not None:
+        page = page.where(key_column > after)
+    page = page.order_by(key_column).limit(chunk_size).subquery()
+
+    result = await db_session.execute(select(func.max(page.c.key)))
+    return result.scalar()
+
+
+class LabelingCheckpointStore:
+    """Reads and advances labeling_checkpoints rows"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def resume_point(self, job_name: str) -> Optional[UUID]:
+        """
+        Last committed key of an unfinished run (None = start a fresh run)
+        """
+        result = await self.db_session.execute(
+            select(LabelingCheckpoint).where(LabelingCheckpoint.job_name == job_name)
+        )
+        checkpoint = result.scalar_one_or_none()
+        if checkpoint is None or checkpoint.completed_at is not None:
+            return None
+
+        logger.info(
+            f"[LABELING] Resuming {job_name} after {checkpoint.last_key} "
+            f"({checkpoint.rows_processed} rows already processed)"
+        )
+        return checkpoint.last_key
+
+    async def advance(self, job_name: str, last_key: UUID, rows: int):
+        """
+        Record a processed chunk (caller commits it with the chunk's writes)
+        """
+        now = datetime.utcnow()
+        stmt = pg_insert(LabelingCheckpoint).values(
+            job_name=job_name,
+            last_key=last_key,
+            rows_processed=rows,
+            chunks_processed=1,
+            started_at=now,
+            completed_at=None,
+            updated_at=now,
+        )
+        # A completed checkpoint starts a new run; an unfinished one accumulates
+        restart = LabelingCheckpoint.completed_at.isnot(None)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LabelingCheckpoint.job_name],
+            set_={
+                "last_key": stmt.excluded.last_key,
+                "rows_processed": case(
+                    (restart, 0), else_=LabelingCheckpoint.rows_processed
+                )
+                + stmt.excluded.rows_processed,
+                "chunks_processed": case(
+                    (restart, 0), else_=LabelingCheckpoint.chunks_processed
+                )
+                + 1,
+                "started_at": case(
+                    (restart, stmt.excluded.started_at),
+                    else_=LabelingCheckpoint.started_at,
+                ),
+                "completed_at": None,
+                "updated_at": now,
+            },
+        )
+        await self.db_session.execute(stmt)
+
+    async def complete(self, job_name: str):
+        """Mark the current run finished so the next run starts from the beginning"""
+        result = await self.db_session.execute(
+            select(LabelingCheckpoint).where(LabelingCheckpoint.job_name == job_name)
+        )
+        checkpoint = result.scalar_one_or_none()
+        if checkpoint is not None:
+            checkpoint.completed_at = datetime.utcnow()
+        await self.db_session.commit()
+
+
+class LabelingThroughput:
+    """Rows labeled per second for one labeling job"""
+
+    def __init__(self, job_name: str, resumed: bool = False):
+        self.job_name = job_name
+        self.resumed = resumed
+        self.rows_labeled = 0
+        self.rows_linked = 0
+        self.chunks = 0
+        self._started = time.perf_counter()
+
+    def record_chunk(self, rows_labeled: int, rows_linked: int = 0):
+        self.rows_labeled += rows_labeled
+        self.rows_linked += rows_linked
+        self.chunks += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._started
+        return {
+            "job": self.job_name,
+            "rows_labeled": self.rows_labeled,
+            "rows_linked": self.rows_linked,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.rows_labeled / elapsed, 1)
+            if elapsed > 0
+            else 0.0,
+            "resumed_from_checkpoint": self.resumed,
+        }
@@ -8,6 +8,7 @@ Tasks:
 - evaluate_model_task: Evaluate model performance
 - deploy_model_task: Deploy model to production
 - auto_retrain_check_task: Periodic retraining check
+- update_feature_sketches_task: Fold newly scored transactions into drift sketches
 """
 
 import logging
@@ -230,6 +231,35 @@ async def _evaluate_drift_async() -> Dict:
         return result
 
 
+@celery_app.task(bind=True, name="ml_service.update_feature_sketches")
+def update_feature_sketches_task(self) -> Dict:
+    """
+    Update hourly feature sketches used for drift detection
+
+    Returns:
+        dict: Ingestion summary
+    """
+    import asyncio
+
+    result = asyncio.run(_update_feature_sketches_async())
+
+    logger.info(
+        f"[CELERY] Feature sketches updated: "
+        f"transactions_ingested={result.get('transactions_ingested')}"
+    )
+
+    return result
+
+
+async def _update_feature_sketches_async() -> Dict:
+    """Async feature sketch ingestion logic"""
+    from src.monitoring.streaming_drift import StreamingDriftMonitor
+
+    async with AsyncSessionLocal() as session:
+        monitor = StreamingDriftMonitor(session)
+        return await monitor.ingest_new_transactions()
+
+
 @celery_app.task(bind=True, name="ml_service.evaluate_performance")
 def evaluate_performance_task(self) -> Dict:
     """
@@ -271,6 +301,10 @@ celery_app.conf.beat_schedule = {
         "task": "ml_service.evaluate_drift",
         "schedule": 86400.0,  # Every 24 hours
     },
+    "update-feature-sketches": {
+        "task": "ml_service.update_feature_sketches",
+        "schedule": 300.0,  # Every 5 minutes
+    },
     "evaluate-performance-daily": {
         "task": "ml_service.evaluate_performance",
         "schedule": 86400.0,  # Every 24 hours
@@ -9,6 +9,10 @@ Business Logic:
 - Validates and enriches feedback data
 - Stores feedback for model retraining
 - Provides analytics on feedback trends
+
+Feedback is turned into labels set-based (aggregated per transaction,
+INSERT ... SELECT for new labels, UPDATE ... FROM for existing ones) in
+keyset-paginated chunks, each committed together with its checkpoint.
 """
 
 import logging
@@ -16,12 +20,20 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Boolean, DateTime, Float, String
+from sqlalchemy import and_, cast, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.transaction import Transaction
 from src.models.fraud_label import FraudLabel, LabelSource
 from src.models.fraud_feedback import FraudFeedback
+from src.training.bulk_labeling import (
+    LabelingCheckpointStore,
+    LabelingThroughput,
+    next_keyset_bound,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +46,7 @@ class FeedbackCollector:
         db_session: AsyncSession,
         min_feedback_count: int = 50,
         feedback_confidence: float = 0.9,
+        chunk_size: int = 5000,
     ):
         """
         Initialize FeedbackCollector
@@ -42,10 +55,13 @@ class FeedbackCollector:
             db_session: Database session
             min_feedback_count: Minimum feedback count to trigger retraining
             feedback_confidence: Confidence score for user feedback labels
+            chunk_size: Feedback records processed per chunk (one commit per chunk)
         """
         self.db_session = db_session
         self.min_feedback_count = min_feedback_count
         self.feedback_confidence = feedback_confidence
+        self.chunk_size = chunk_size
+        self.checkpoints = LabelingCheckpointStore(db_session)
 
     async def submit_fraud_report(
         self,
@@ -134,67 +150,182 @@ class FeedbackCollector:
         """
         Process fraud feedback and create labels for ML training
 
+        Per chunk of unprocessed feedback (keyset on feedback id), grouped
+        by transaction:
+        1. Existing user-report labels: +0.05 confidence per report and the
+           report reasons appended to the notes
+        2. Unlabeled transactions: one new user-report label
+        3. Transactions linked to their labels
+        4. Feedback on user-report labeled transactions marked processed
+           (feedback on transactions labeled from other sources stays
+           unprocessed)
+
         Returns:
             dict: Processing results
         """
-        # Find unprocessed feedback
-        feedback_query = select(FraudFeedback).where(FraudFeedback.processed.is_(False))
-        feedback_result = await self.db_session.execute(feedback_query)
-        feedbacks = feedback_result.scalars().all()
-
-        labeled_count = 0
-        for feedback in feedbacks:
-            # Check if transaction already has a label
-            label_query = select(FraudLabel).where(
-                FraudLabel.transaction_id == feedback.transaction_id
+        job_name = "feedback"
+        unprocessed = FraudFeedback.processed.is_(False)
+
+        last_id = await self.checkpoints.resume_point(job_name)
+        throughput = LabelingThroughput(job_name, resumed=last_id is not None)
+        processed_count = 0
+
+        while True:
+            upper_id = await next_keyset_bound(
+                self.db_session, FraudFeedback.id, unprocessed, last_id, self.chunk_size
             )
-            label_result = await self.db_session.execute(label_query)
-            existing_label = label_result.scalar_one_or_none()
-
-            if existing_label:
-                # Update existing label if from user report
-                if existing_label.label_source == LabelSource.USER_REPORT:
-                    existing_label.confidence_score = min(
-                        1.0, existing_label.confidence_score + 0.05
-                    )
-                    existing_label.notes = (
-                        f"{existing_label.notes}; Additional report: {feedback.reason}"
+            if upper_id is None:
+                break
+
+            in_chunk = and_(unprocessed, FraudFeedback.id <= upper_id)
+            if last_id is not None:
+                in_chunk = and_(in_chunk, FraudFeedback.id > last_id)
+
+            now = datetime.utcnow()
+            reports = (
+                select(
+                    FraudFeedback.transaction_id.label("transaction_id"),
+                    func.count(FraudFeedback.id).label("report_count"),
+                    func.string_agg(
+                        FraudFeedback.reason,
+                        aggregate_order_by(
+                            literal("; Additional report: "), FraudFeedback.reported_at
+                        ),
+                    ).label("reasons"),
+                    array_agg(
+                        aggregate_order_by(
+                            cast(FraudFeedback.user_id, String),
+                            FraudFeedback.reported_at,
+                        )
+                    )[1].label("first_reporter"),
+                )
+                .where(in_chunk)
+                .group_by(FraudFeedback.transaction_id)
+                .subquery()
+            )
+
+            # 1. Strengthen existing user-report labels
+            reinforce_stmt = (
+                update(FraudLabel)
+                .where(
+                    and_(
+                        FraudLabel.transaction_id == reports.c.transaction_id,
+                        FraudLabel.label_source == LabelSource.USER_REPORT.value,
                     )
-                    feedback.processed = True
-                    labeled_count += 1
-            else:
-                # Create new label
-                fraud_label = FraudLabel(
-                    transaction_id=feedback.transaction_id,
-                    is_fraud=True,
-                    label_source=LabelSource.USER_REPORT,
-                    confidence_score=self.feedback_confidence,
-                    labeled_by=str(feedback.user_id),
-                    labeled_at=datetime.utcnow(),
-                    notes=f"User fraud report: {feedback.reason}",
                 )
-                self.db_session.add(fraud_label)
+                .values(
+                    confidence_score=func.least(
+                        1.0, FraudLabel.confidence_score + 0.05 * reports.c.report_count
+                    ),
+                    notes=func.coalesce(FraudLabel.notes, "")
+                    + "; Additional report: "
+                    + reports.c.reasons,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db_session.execute(reinforce_stmt)
 
-                # Update transaction
-                transaction_query = select(Transaction).where(
-                    Transaction.id == feedback.transaction_id
+            # 2. New labels for unlabeled transactions
+            has_label = exists().where(
+                FraudLabel.transaction_id == reports.c.transaction_id
+            )
+            label_rows = select(
+                func.gen_random_uuid(),
+                reports.c.transaction_id,
+                literal(True, Boolean),
+                literal(LabelSource.USER_REPORT.value, String),
+                func.least(
+                    1.0,
+                    literal(self.feedback_confidence, Float)
+                    + 0.05 * (reports.c.report_count - 1),
+                ),
+                reports.c.first_reporter,
+                literal(now, DateTime),
+                "User fraud report: " + reports.c.reasons,
+                literal(now, DateTime),
+                literal(now, DateTime),
+            ).where(~has_label)
+
+            insert_stmt = (
+                pg_insert(FraudLabel)
+                .from_select(
+                    [
+                        FraudLabel.id,
+                        FraudLabel.transaction_id,
+                        FraudLabel.is_fraud,
+                        FraudLabel.label_source,
+                        FraudLabel.confidence_score,
+                        FraudLabel.labeled_by,
+                        FraudLabel.labeled_at,
+                        FraudLabel.notes,
+                        FraudLabel.created_at,
+                        FraudLabel.updated_at,
+                    ],
+                    label_rows,
+                )
+                .on_conflict_do_nothing(index_elements=[FraudLabel.transaction_id])
+                .returning(FraudLabel.transaction_id)
+            )
+            inserted = len((await self.db_session.execute(insert_stmt)).all())
+
+            # 3. Link transactions to their labels
+            link_stmt = (
+                update(Transaction)
+                .where(
+                    and_(
+                        Transaction.id == FraudLabel.transaction_id,
+                        Transaction.fraud_label_id.is_(None),
+                        Transaction.id.in_(
+                            select(FraudFeedback.transaction_id).where(in_chunk)
+                        ),
+                    )
+                )
+                .values(fraud_label_id=FraudLabel.id, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            linked = (await self.db_session.execute(link_stmt)).rowcount
+
+            # 4. Mark feedback processed
+            processed_stmt = (
+                update(FraudFeedback)
+                .where(
+                    and_(
+                        in_chunk,
+                        exists().where(
+                            and_(
+                                FraudLabel.transaction_id
+                                == FraudFeedback.transaction_id,
+                                FraudLabel.label_source
+                                == LabelSource.USER_REPORT.value,
+                            )
+                        ),
+                    )
                 )
-                transaction_result = await self.db_session.execute(transaction_query)
-                transaction = transaction_result.scalar_one()
-                transaction.fraud_label_id = fraud_label.id
+                .values(processed=True, processed_at=now, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            chunk_processed = (await self.db_session.execute(processed_stmt)).rowcount
 
-                feedback.processed = True
-                labeled_count += 1
+            await self.checkpoints.advance(job_name, upper_id, chunk_processed)
+            await self.db_session.commit()
 
-        await self.db_session.commit()
+            processed_count += chunk_processed
+            throughput.record_chunk(inserted, linked)
+            last_id = upper_id
+
+        await self.checkpoints.complete(job_name)
 
+        report = throughput.to_dict()
         logger.info(
-            f"[FEEDBACK] Processed {labeled_count} feedback records for labeling"
+            f"[FEEDBACK] Processed {processed_count} feedback records for labeling "
+            f"({report['rows_labeled']} new labels, {report['rows_per_second']} rows/s)"
         )
 
         return {
             "success": True,
-            "processed_count": labeled_count,
+            "processed_count": processed_count,
+            "throughput": report,
         }
 
     async def get_feedback_statistics(self, days: int = 30) -> Dict[str, any]:
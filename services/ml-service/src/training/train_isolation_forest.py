@@ -214,6 +214,37 @@ class IsolationForestTrainer:
 
         logger.info(f"모델 저장 완료: {model_path}")
 
+    def export_onnx(
+        self, onnx_path: Path, validation_data: Optional[pd.DataFrame] = None
+    ) -> Dict[str, float]:
+        """
+        ONNX 형식으로 변환 (FDS ONNX Runtime 서빙용)
+
+        원본 모델과의 출력 동등성 검증을 함께 수행하며, 실패 시 ValueError
+
+        Args:
+            onnx_path: ONNX 저장 경로
+            validation_data: 동등성 검증 데이터 (전처리된 특성)
+
+        Returns:
+            변환/검증 리포트
+        """
+        from deployment.tree_onnx_exporter import TreeModelONNXExporter
+
+        report = TreeModelONNXExporter().export(
+            self.model,
+            onnx_path,
+            feature_names=self.feature_columns,
+            validation_data=(
+                validation_data[self.feature_columns].values
+                if validation_data is not None
+                else None
+            ),
+        )
+        logger.info(f"ONNX 변환 완료: {onnx_path}")
+
+        return report.to_dict()
+
     @classmethod
     def load_model(cls, model_path: Path) -> "IsolationForestTrainer":
         """
@@ -252,6 +283,7 @@ def train_isolation_forest(
     contamination: float = 0.1,
     n_estimators: int = 100,
     output_dir: str = "models/isolation_forest",
+    export_onnx: bool = False,
 ) -> Tuple[IsolationForestTrainer, MLModel, Dict[str, float]]:
     """
     Isolation Forest 모델 학습 메인 함수
@@ -265,6 +297,8 @@ def train_isolation_forest(
         contamination: 이상치 비율
         n_estimators: 트리 개수
         output_dir: 모델 저장 디렉토리
+        export_onnx: ONNX 변환 및 동등성 검증 수행 여부
+            (실패해도 학습은 유지, pickle 모델만 배포 대상)
 
     Returns:
         (학습된 모델, MLModel 메타데이터, 평가 메트릭)
@@ -308,6 +342,13 @@ def train_isolation_forest(
     # 7. 모델 저장
     output_path = Path(output_dir) / f"{model_name}-v{version}.pkl"
     trainer.save_model(output_path)
+    if export_onnx:
+        try:
+            trainer.export_onnx(
+                output_path.with_suffix(".onnx"), validation_data=X_test
+            )
+        except Exception as e:
+            logger.warning(f"ONNX 변환 건너뜀 (pickle 모델 사용): {e}")
 
     # 8. MLModel 메타데이터 생성
     ml_model = MLModel(
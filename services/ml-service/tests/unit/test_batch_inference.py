@@ -0,0 +1,156 @@
+"""
+BatchInferencePipeline 유닛 테스트
+
+- 배치 결과 매핑
+- 우선순위 레인 순서
+- SLA 기반 배치 크기 조정 (체크아웃 배치 추론 시간만 반영)
+- 입력 버퍼 뷰를 반환하는 모델의 결과가 버퍼 재사용 후에도 유지
+- 히스토그램 통계
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.deployment.batch_inference import (
+    BatchInferencePipeline,
+    InferencePriority,
+)
+
+
+def _sum_model(batch_input: np.ndarray) -> np.ndarray:
+    return batch_input.sum(axis=1)
+
+
+@pytest.mark.unit
+async def test_results_are_mapped_to_requests():
+    pipeline = BatchInferencePipeline(_sum_model, batch_size=8, max_batch_delay_ms=5)
+    await pipeline.start()
+
+    inputs = [np.full(4, i, dtype=np.float32) for i in range(20)]
+    results = await asyncio.gather(
+        *(pipeline.infer(f"req-{i}", x) for i, x in enumerate(inputs))
+    )
+    await pipeline.stop()
+
+    assert [float(r) for r in results] == [4.0 * i for i in range(20)]
+    stats = await pipeline.get_stats()
+    assert stats["total_requests"] == 20
+    assert stats["batch_size_histogram"]["+Inf"] == stats["total_batches"]
+
+
+@pytest.mark.unit
+async def test_checkout_lane_is_batched_before_rescoring():
+    seen = []
+
+    def recording_model(batch_input: np.ndarray) -> np.ndarray:
+        seen.extend(batch_input[:, 0].tolist())
+        return batch_input[:, 0]
+
+    pipeline = BatchInferencePipeline(
+        recording_model, batch_size=4, max_batch_size=4, max_batch_delay_ms=20
+    )
+    await pipeline.start()
+
+    rescoring = [
+        pipeline.infer(f"r-{i}", np.array([100.0 + i]), InferencePriority.RESCORING)
+        for i in range(2)
+    ]
+    checkout = [pipeline.infer(f"c-{i}", np.array([float(i)])) for i in range(2)]
+    await asyncio.gather(*rescoring, *checkout)
+    await pipeline.stop()
+
+    assert seen[:2] == [0.0, 1.0]
+
+
+@pytest.mark.unit
+def test_batch_size_shrinks_when_sla_is_exceeded_and_grows_when_under():
+    pipeline = BatchInferencePipeline(
+        _sum_model,
+        batch_size=40,
+        min_batch_size=10,
+        max_batch_size=100,
+        sla_target_ms=50.0,
+    )
+
+    pipeline._adapt_batch_size(200.0, 40)
+    assert pipeline.batch_size == 30
+
+    pipeline.latency_ewma_ms = None
+    pipeline._adapt_batch_size(5.0, 30)
+    assert pipeline.batch_size == 33
+
+
+@pytest.mark.unit
+async def test_light_load_does_not_shrink_batch_size():
+    # 대기 시간 (마감 시각까지) 이 SLA 를 넘어도 추론이 빠르면 배치 크기 유지
+    pipeline = BatchInferencePipeline(
+        _sum_model,
+        batch_size=40,
+        min_batch_size=10,
+        max_batch_delay_ms=60,
+        sla_target_ms=50.0,
+    )
+    await pipeline.start()
+
+    for i in range(3):
+        await pipeline.infer(f"c-{i}", np.ones(4))
+        await pipeline.infer(f"r-{i}", np.ones(4), InferencePriority.RESCORING)
+    await pipeline.stop()
+
+    assert pipeline.batch_size == 40
+    assert pipeline.latency_ewma_ms < 50.0
+
+
+@pytest.mark.unit
+async def test_rescoring_batches_do_not_adapt_batch_size():
+    pipeline = BatchInferencePipeline(_sum_model, batch_size=4, max_batch_delay_ms=1)
+    await pipeline.start()
+
+    await asyncio.gather(
+        *(
+            pipeline.infer(f"r-{i}", np.ones(4), InferencePriority.RESCORING)
+            for i in range(8)
+        )
+    )
+    await pipeline.stop()
+
+    assert pipeline.latency_ewma_ms is None
+
+
+@pytest.mark.unit
+async def test_view_outputs_survive_buffer_reuse():
+    # 입력 버퍼의 뷰를 반환하는 슬라이싱 모델
+    def slicing_model(batch_input: np.ndarray) -> np.ndarray:
+        return batch_input[:, :2]
+
+    pipeline = BatchInferencePipeline(
+        slicing_model,
+        batch_size=4,
+        max_batch_size=4,
+        max_batch_delay_ms=1,
+        max_concurrent_batches=1,
+    )
+    await pipeline.start()
+
+    first = await asyncio.gather(
+        *(pipeline.infer(f"a-{i}", np.full(3, i, dtype=np.float32)) for i in range(4))
+    )
+    await asyncio.gather(
+        *(pipeline.infer(f"b-{i}", np.full(3, -1, dtype=np.float32)) for i in range(4))
+    )
+    await pipeline.stop()
+
+    assert [r.tolist() for r in first] == [[float(i), float(i)] for i in range(4)]
+
+
+@pytest.mark.unit
+def test_prometheus_metrics_expose_histograms():
+    pipeline = BatchInferencePipeline(_sum_model)
+    pipeline.batch_size_histogram.observe(10)
+
+    metrics = pipeline.get_prometheus_metrics("fraud")
+
+    assert 'batch_inference_batch_size_bucket{pipeline="fraud",le="16"} 1' in metrics
+    assert "# TYPE batch_inference_queue_depth histogram" in metrics
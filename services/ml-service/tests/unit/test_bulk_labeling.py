@@ -0,0 +1,129 @@
+"""
+Bulk labeling 헬퍼 유닛 테스트
+
+- 체크포인트: 미완료 실행은 마지막 키부터 재개, 완료된 실행은 처음부터
+- keyset 청크 경계 쿼리 (마지막 키 이후, 키 순서, 청크 크기 제한)
+- 청크 단위 처리량 집계
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Boolean, Column, MetaData, Table, Uuid
+from sqlalchemy.dialects import postgresql
+
+from src.models.labeling_checkpoint import LabelingCheckpoint
+from src.training.bulk_labeling import (
+    LabelingCheckpointStore,
+    LabelingThroughput,
+    next_keyset_bound,
+)
+
+transactions = Table(
+    "transactions",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("is_chargeback", Boolean),
+)
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _FakeSession:
+    """실행한 문장을 기록하고 미리 정한 결과를 돌려주는 가짜 세션"""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self.value)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.unit
+async def test_checkpoint_resumes_unfinished_run_only():
+    last_key = uuid.uuid4()
+    unfinished = LabelingCheckpoint(job_name="chargebacks", last_key=last_key)
+    assert (
+        await LabelingCheckpointStore(_FakeSession(unfinished)).resume_point(
+            "chargebacks"
+        )
+        == last_key
+    )
+
+    finished = LabelingCheckpoint(
+        job_name="chargebacks", last_key=last_key, completed_at=datetime.utcnow()
+    )
+    store = LabelingCheckpointStore(_FakeSession(finished))
+    assert await store.resume_point("chargebacks") is None
+    assert await LabelingCheckpointStore(_FakeSession()).resume_point("x") is None
+
+    # 완료 처리 → 다음 실행은 처음부터
+    running = LabelingCheckpoint(job_name="chargebacks", last_key=last_key)
+    session = _FakeSession(running)
+    await LabelingCheckpointStore(session).complete("chargebacks")
+    assert running.completed_at is not None
+    assert session.commits == 1
+
+
+@pytest.mark.unit
+async def test_next_keyset_bound_reads_one_key_per_chunk():
+    after = uuid.uuid4()
+    upper = uuid.uuid4()
+    session = _FakeSession(upper)
+
+    bound = await next_keyset_bound(
+        session,
+        transactions.c.id,
+        transactions.c.is_chargeback.is_(True),
+        after,
+        chunk_size=500,
+    )
+
+    assert bound == upper
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("SELECT max(anon_1.key)")
+    assert "transactions.id > %(id_1)s" in sql
+    assert "ORDER BY transactions.id LIMIT %(param_1)s" in sql
+    assert compiled.params["id_1"] == after
+    assert compiled.params["param_1"] == 500
+
+    # 처음 실행은 하한 조건 없음
+    session = _FakeSession(None)
+    assert (
+        await next_keyset_bound(
+            session, transactions.c.id, transactions.c.is_chargeback, None, 500
+        )
+        is None
+    )
+    assert "transactions.id >" not in str(session.statements[0])
+
+
+@pytest.mark.unit
+def test_throughput_counts_rows_and_chunks():
+    throughput = LabelingThroughput("manual_reports", resumed=True)
+    throughput.record_chunk(5000, 5000)
+    throughput.record_chunk(1200, 1250)
+
+    report = throughput.to_dict()
+    assert report["rows_labeled"] == 6200
+    assert report["rows_linked"] == 6250
+    assert report["chunks"] == 2
+    assert report["resumed_from_checkpoint"] is True
+    assert report["rows_per_second"] > 0
@@ -0,0 +1,225 @@
+"""
+CanaryDeployment 라우팅 테이블 유닛 테스트
+
+- 라우팅 버전이 같으면 예측당 DB 조회 없음
+- 트래픽 비율 변경 시 테이블 재구성 (로드된 모델 재사용)
+- 다른 워커가 바꾼 공유 설정은 다음 동기화에서 반영
+- 평가 결과 카운터는 메모리에 누적 후 주기적으로 UPDATE 1회로 반영
+"""
+
+import pickle
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sklearn.ensemble import IsolationForest
+
+pytest.importorskip("mlflow")
+
+from src.deployment.canary_deploy import CanaryDeployment  # noqa: E402
+from src.deployment.model_routing import STATS_COLUMNS, routing_state  # noqa: E402
+from src.models.ml_model import DeploymentStatus, MLModel, ModelType  # noqa: E402
+from src.models.model_routing_config import ModelRoutingConfig  # noqa: E402
+
+
+class _Result:
+    def __init__(self, model):
+        self._model = model
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self._model
+
+
+class _FakeSession:
+    """MLModel 조회와 공유 라우팅 설정 행만 흉내내는 세션 (조회 횟수 기록)"""
+
+    def __init__(self, models, routing=None):
+        self.models = models
+        self.routing = routing
+        self.queries = 0
+        self.routing_queries = 0
+        self.stats_updates = 0
+
+    async def execute(self, query):
+        if query.is_insert:
+            return self._publish(query)
+        if query.is_update:
+            return self._add_stats(query.compile().params)
+        if query.column_descriptions[0]["entity"] is ModelRoutingConfig:
+            self.routing_queries += 1
+            return _Result(self.routing)
+        self.queries += 1
+        model_id = query.whereclause.right.value
+        return _Result(self.models[model_id])
+
+    def _publish(self, stmt):
+        changes = dict(stmt._post_values_clause.update_values_to_set)
+        if self.routing is None:
+            self.routing = SimpleNamespace(version=0, canary_config=None)
+        self.routing.version += 1
+        if "canary_config" in changes:
+            self.routing.canary_config = changes["canary_config"]
+        return SimpleNamespace(
+            one=lambda: (self.routing.version, self.routing.canary_config)
+        )
+
+    def _add_stats(self, params):
+        self.stats_updates += 1
+        if params["version_1"] != self.routing.version:
+            return
+        for column in STATS_COLUMNS:
+            count = getattr(self.routing, column, 0) + params.get(f"{column}_1", 0)
+            setattr(self.routing, column, count)
+
+    def __contains__(self, instance):
+        return True
+
+    def expunge(self, instance):
+        pass
+
+    async def commit(self):
+        pass
+
+
+def _ml_model(tmp_path, status: DeploymentStatus) -> MLModel:
+    model_path = tmp_path / f"{status.value}.pkl"
+    estimator = IsolationForest(n_estimators=5, random_state=0).fit(
+        np.random.default_rng(0).random((50, 3))
+    )
+    model_path.write_bytes(pickle.dumps(estimator))
+    return MLModel(
+        id=uuid4(),
+        name="IsolationForest",
+        version="1.0.0",
+        model_type=ModelType.ISOLATION_FOREST,
+        deployment_status=status,
+        model_path=str(model_path),
+    )
+
+
+@pytest.fixture
+def canary(tmp_path):
+    production = _ml_model(tmp_path, DeploymentStatus.PRODUCTION)
+    candidate = _ml_model(tmp_path, DeploymentStatus.STAGING)
+    routing = SimpleNamespace(
+        version=routing_state.version + 1,
+        canary_config={
+            "canary_model_id": str(candidate.id),
+            "production_model_id": str(production.id),
+            "traffic_percentage": 10,
+            "status": "active",
+            "start_time": "2025-01-01T00:00:00",
+            "monitoring_window_minutes": 60,
+            "success_threshold": 0.95,
+        },
+    )
+    session = _FakeSession(
+        {production.id: production, candidate.id: candidate}, routing
+    )
+
+    deployment = CanaryDeployment(session)
+    yield deployment, session, production, candidate
+
+    routing_state.apply(0, None)
+    routing_state.synced_at = None
+    routing_state.table = None
+    routing_state.pending_stats = {}
+    routing_state.pending_version = None
+
+
+@pytest.mark.unit
+async def test_routing_does_no_io_once_table_is_built(canary):
+    deployment, session, production, candidate = canary
+
+    routes = [await deployment.route_traffic(f"tx-{i}") for i in range(1000)]
+
+    assert session.queries == 2  # 테이블 구성 시 1회씩
+    assert session.routing_queries == 1  # 확인 주기 안에서는 한 번만
+    canary_share = sum(route == "canary" for route, _ in routes) / len(routes)
+    assert 0.05 < canary_share < 0.15
+    assert {model.id for _, model in routes} == {production.id, candidate.id}
+
+    # 같은 거래는 항상 같은 모델로
+    assert await deployment.route_traffic("tx-7") == routes[7]
+
+
+@pytest.mark.unit
+async def test_traffic_change_rebuilds_table_and_reuses_loaded_models(canary):
+    deployment, session, _, _ = canary
+
+    _, routed = await deployment.resolve_model("tx-1")
+    await deployment.increase_traffic(100)
+    route, rerouted = await deployment.resolve_model("tx-1")
+
+    assert route == "canary"
+    assert session.queries == 4
+    table = routing_state.table
+    assert table.canary_traffic_percentage == 100
+    assert table.production.instance is not None
+    assert rerouted.instance is table.canary.instance
+
+
+@pytest.mark.unit
+async def test_change_published_by_another_worker_is_picked_up(canary):
+    deployment, session, production, _ = canary
+
+    route, _ = await deployment.resolve_model("tx-1")
+    assert route == "production"
+
+    # 다른 워커가 카나리를 중단 (공유 행만 바뀜)
+    session.routing.version += 1
+    session.routing.canary_config = None
+
+    # 확인 주기 안에서는 기존 테이블 유지, 이후 새 버전으로 재구성
+    assert routing_state.table.canary is not None
+    routing_state.synced_at -= 60
+    session.models[DeploymentStatus.PRODUCTION] = production
+    _, routed = await deployment.resolve_model("tx-1")
+
+    assert routing_state.version == session.routing.version
+    assert routing_state.table.canary is None
+    assert routed.ml_model.id == production.id
+
+
+@pytest.mark.unit
+async def test_results_are_counted_in_memory_and_flushed_periodically(canary):
+    deployment, session, _, _ = canary
+    await deployment.resolve_model("tx-1")
+
+    for i in range(100):
+        await deployment.record_result("canary", i % 4 != 0)
+    assert session.stats_updates == 0
+
+    routing_state.stats_flushed_at -= 60
+    await deployment.record_result("production", True)
+    assert session.stats_updates == 1
+    assert session.routing.canary_requests == 100
+    assert session.routing.canary_successes == 75
+    assert session.routing.production_requests == 1
+
+    # 상태 조회는 이 워커의 미반영 카운터를 먼저 반영
+    await deployment.record_result("canary", False)
+    status = await deployment.get_canary_status()
+    assert session.stats_updates == 2
+    assert status["canary"]["requests"] == 101
+
+
+@pytest.mark.unit
+async def test_counts_from_before_a_stats_reset_are_dropped(canary):
+    deployment, session, _, _ = canary
+    await deployment.resolve_model("tx-1")
+
+    for _ in range(10):
+        await deployment.record_result("canary", True)
+
+    # 다른 워커가 트래픽 비율 변경 (카운터 초기화, 버전 증가)
+    session.routing.version += 1
+    routing_state.stats_flushed_at -= 60
+    await deployment.record_result("canary", True)
+
+    assert session.stats_updates == 1
+    assert getattr(session.routing, "canary_requests", 0) == 0
@@ -0,0 +1,73 @@
+"""
+FeatureSketch 유닛 테스트
+
+- 시간 버킷 병합 및 직렬화 왕복
+- 스케치 기반 KS/PSI 가 원시 데이터 계산값과 근사
+- 스케치 순위 오차만으로는 드리프트로 판정하지 않음
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from src.monitoring.feature_sketch import (
+    FeatureSketch,
+    ks_statistic_from_sketches,
+    psi_from_sketches,
+)
+
+
+def _sketch(values: np.ndarray, name: str = "amount") -> FeatureSketch:
+    sketch = FeatureSketch(name)
+    sketch.update_many(values)
+    return sketch
+
+
+@pytest.mark.unit
+def test_merged_hourly_sketches_survive_serialization():
+    rng = np.random.default_rng(1)
+    hours = [rng.lognormal(10, 1, 5000) for _ in range(6)]
+
+    merged = FeatureSketch("amount")
+    for values in hours:
+        merged.merge(FeatureSketch.from_bytes(_sketch(values).to_bytes()))
+
+    all_values = np.concatenate(hours)
+    restored = FeatureSketch.from_bytes(merged.to_bytes())
+    assert restored.count == len(all_values)
+    assert restored.summary()["mean"] == pytest.approx(np.mean(all_values), rel=1e-9)
+    median = restored.kll.quantiles([0.5])[0]
+    assert median == pytest.approx(np.median(all_values), rel=0.05)
+
+
+@pytest.mark.unit
+def test_sketch_ks_and_psi_track_exact_values():
+    rng = np.random.default_rng(2)
+    reference = rng.lognormal(10, 1, 50000)
+    current = rng.lognormal(10.3, 1, 20000)
+
+    ks_statistic, p_value = ks_statistic_from_sketches(
+        _sketch(reference), _sketch(current)
+    )
+    exact = stats.ks_2samp(reference, current)
+
+    assert ks_statistic == pytest.approx(exact.statistic, abs=0.02)
+    assert p_value < 0.01
+    assert psi_from_sketches(_sketch(reference), _sketch(current)) > 0.05
+    assert psi_from_sketches(_sketch(reference), _sketch(reference[:20000])) < 0.02
+
+
+@pytest.mark.unit
+def test_sketch_rank_error_is_not_reported_as_drift():
+    rng = np.random.default_rng(3)
+    reference = _sketch(rng.normal(0, 1, 400000))
+    current = _sketch(rng.normal(0, 1, 400000))
+
+    ks_statistic, p_value = ks_statistic_from_sketches(reference, current)
+
+    assert reference.kll.rank_error > 0
+    assert ks_statistic < reference.kll.rank_error + current.kll.rank_error
+    assert p_value > 0.05
+
+    # 보유 항목이 모두 남아 있는 작은 스케치는 정확한 값 (오차 0)
+    assert _sketch(rng.normal(0, 1, 100)).kll.rank_error == 0.0
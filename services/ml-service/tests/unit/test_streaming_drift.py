@@ -0,0 +1,108 @@
+"""
+StreamingDriftMonitor 유닛 테스트 (SQLite)
+
+- 워터마크는 ingested_at 기준: created_at 보다 늦게 기록된 거래도 수집
+- 동시 flush 는 같은 버킷을 덮어쓰지 않고 병합
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.feature_sketch_bucket import FeatureSketchBucket
+from src.models.fraud_label import FraudLabel
+from src.models.transaction import Transaction
+from src.monitoring.feature_sketch import FeatureSketch
+from src.monitoring.streaming_drift import StreamingDriftMonitor
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'drift.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                Transaction.__table__,
+                FraudLabel.__table__,
+                FeatureSketchBucket.__table__,
+            ],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _add_transaction(session, created_at, ingested_at, amount):
+    session.add(
+        Transaction(
+            id=uuid4(),
+            user_id=uuid4(),
+            amount=Decimal(amount),
+            payment_method="card",
+            fds_risk_score=10,
+            created_at=created_at,
+            ingested_at=ingested_at,
+        )
+    )
+    await session.commit()
+
+
+async def _amount_count(session) -> int:
+    result = await session.execute(
+        select(FeatureSketchBucket.sketch).where(
+            FeatureSketchBucket.feature_name == "amount"
+        )
+    )
+    return sum(FeatureSketch.from_bytes(blob).count for (blob,) in result.all())
+
+
+@pytest.mark.unit
+async def test_rows_written_after_their_created_at_are_ingested(session_factory):
+    now = datetime.utcnow()
+    async with session_factory() as session:
+        monitor = StreamingDriftMonitor(session, ingest_lag_seconds=60)
+        await _add_transaction(
+            session, now - timedelta(minutes=30), now - timedelta(minutes=20), 100
+        )
+        assert (await monitor.ingest_new_transactions())["transactions_ingested"] == 1
+
+        # 스필 재생 등으로 한참 뒤에 기록된 과거 거래 (created_at < 워터마크)
+        await _add_transaction(
+            session, now - timedelta(hours=3), now - timedelta(minutes=5), 200
+        )
+        # 아직 지연 구간 안에 있는 거래는 다음 실행에서 수집
+        await _add_transaction(session, now, now, 300)
+
+        summary = await monitor.ingest_new_transactions()
+        assert summary["transactions_ingested"] == 1
+        assert await _amount_count(session) == 2
+        assert (await monitor.get_watermark())[0] == now - timedelta(minutes=5)
+
+        # 재실행해도 중복 수집 없음
+        assert (await monitor.ingest_new_transactions())["transactions_ingested"] == 0
+
+
+@pytest.mark.unit
+async def test_concurrent_flushes_merge_into_same_bucket(session_factory):
+    scored_at = datetime(2026, 10, 18, 9, 15)
+
+    async def flush(values):
+        async with session_factory() as session:
+            monitor = StreamingDriftMonitor(session)
+            for value in values:
+                monitor.observe({"amount": value}, scored_at)
+            await monitor.flush()
+
+    await asyncio.gather(flush([1.0, 2.0, 3.0]), flush([4.0, 5.0]))
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(FeatureSketchBucket))).scalars().all()
+        assert len(rows) == 1
+        assert rows[0].sample_count == 5
+        assert FeatureSketch.from_bytes(rows[0].sketch).count == 5
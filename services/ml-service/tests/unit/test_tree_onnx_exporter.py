@@ -0,0 +1,90 @@
+"""
+TreeModelONNXExporter 유닛 테스트
+
+- 트리 모델별 ONNX 변환 및 동등성 검증
+- 메타데이터(model_kind) 기록
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("skl2onnx")
+ort = pytest.importorskip("onnxruntime")
+
+from sklearn.ensemble import IsolationForest, RandomForestClassifier  # noqa: E402
+
+from src.deployment.tree_onnx_exporter import (  # noqa: E402
+    METADATA_MODEL_KIND,
+    MODEL_KIND_ANOMALY,
+    MODEL_KIND_CLASSIFIER,
+    TreeModelONNXExporter,
+)
+
+
+@pytest.fixture
+def training_data():
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 6)).astype(np.float32)
+    y = (X[:, 0] > 0.7).astype(int)
+    return X, y
+
+
+@pytest.mark.unit
+def test_isolation_forest_export_matches_decision_function(tmp_path, training_data):
+    X, _ = training_data
+    model = IsolationForest(n_estimators=20, random_state=0).fit(X)
+
+    report = TreeModelONNXExporter().export(
+        model, tmp_path / "iforest.onnx", n_features=6, validation_data=X
+    )
+
+    assert report.parity_passed
+    assert report.model_kind == MODEL_KIND_ANOMALY
+    session = ort.InferenceSession(str(tmp_path / "iforest.onnx"))
+    metadata = session.get_modelmeta().custom_metadata_map
+    assert metadata[METADATA_MODEL_KIND] == MODEL_KIND_ANOMALY
+
+
+@pytest.mark.unit
+def test_random_forest_export_matches_predict_proba(tmp_path, training_data):
+    X, y = training_data
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+
+    report = TreeModelONNXExporter().export(
+        model,
+        tmp_path / "rf.onnx",
+        feature_names=[f"f{i}" for i in range(6)],
+        validation_data=X,
+    )
+
+    assert report.parity_passed
+    assert report.model_kind == MODEL_KIND_CLASSIFIER
+    assert report.max_abs_diff < 1e-4
+
+
+@pytest.mark.unit
+def test_lightgbm_booster_export(tmp_path, training_data):
+    lgb = pytest.importorskip("lightgbm")
+    pytest.importorskip("onnxmltools")
+    X, y = training_data
+    booster = lgb.train(
+        {"objective": "binary", "verbose": -1}, lgb.Dataset(X, y), num_boost_round=10
+    )
+
+    report = TreeModelONNXExporter().export(
+        booster, tmp_path / "lgb.onnx", n_features=6, validation_data=X
+    )
+
+    assert report.parity_passed
+
+
+@pytest.mark.unit
+def test_parity_failure_removes_artifact(tmp_path, training_data):
+    X, y = training_data
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+    exporter = TreeModelONNXExporter(score_tolerance=-1.0)
+
+    with pytest.raises(ValueError):
+        exporter.export(model, tmp_path / "rf.onnx", n_features=6, validation_data=X)
+
+    assert not (tmp_path / "rf.onnx").exists()